@@ -1,9 +1,9 @@
-from typing import Tuple
-from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QComboBox, QLineEdit, QCheckBox, QTableWidget, QTableWidgetItem, QAbstractScrollArea 
-from PyQt5.QtGui import QIntValidator
-from PyQt5.QtCore import QThread, pyqtSignal, QTimer, QFile, QTextStream
+from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QComboBox, QLineEdit, QCheckBox, QTableWidget, QTableWidgetItem, QAbstractScrollArea, QAction, QDialog, QTabWidget 
+from PyQt5.QtGui import QIntValidator, QDoubleValidator
+from PyQt5.QtCore import QThread, QThreadPool, pyqtSignal, QTimer
 import sys
 from src.PhidgetHandler import PhidgetHandler
+from src.DarkTheme import load_dark_stylesheet
 from src.SerialHandler import SerialHandler
 import numpy as np
 from datetime import datetime
@@ -12,66 +12,136 @@ import matplotlib.pyplot as plt
 import os
 import logging
 import time
-from src.AggregateRawData import descrete_dist_to_corresponding_force
-from src.ISO_11088 import ISO11088
-from src.ISO_13992 import ISO13992
-try:
-    import breeze_resources
-    darkmode = True
-except:
-    print("Will not be using the darkmode rendering")
-    darkmode = False
+import functools
+from src.LogSetup import setup_logging, ArraySummary
+from src.StageProfiler import profiler_from_env
+from src.CaptureTelemetry import CaptureTelemetry, save_telemetry
+from src.CaptureResult import CaptureResult
+from src.CaptureProcessor import CaptureProcessor, ProcessorSignals
+from src.ExportWriter import ExportWriter, remove_stale_temp_files
+from src.RunCatalog import RunCatalog, CATALOG_FILE
+from src.CurveStore import CurveStore, STORE_DIR
+from src.AcquisitionProcess import AcquisitionClient, ACQUISITION_PROCESS_ENV
+from src.BenchConfig import default_bench, load_benches, DEFAULT_BENCH_NAME
+from src.LivePublisher import LivePublisher, TORQUE
+from src.CaptureJournal import CaptureJournal, new_journal_path, commit_journal, list_journals, JOURNAL_SUFFIX, CROSS_SUFFIX, FRAME, BRIDGE, RAW, CROSS_FRAME
+from src.StandardsRegistry import STANDARDS, z_of_peak
+from src.Calibration import TareDrift, TARE_SAMPLES, estimate_tare, tared_calibration
+from src.PeakDetector import PeakDetector, ReleaseCompletion, sample_torque_div_BSL
+from src.SpeedGauge import SpeedGauge, SpeedTracker
+from src.ReleaseWindow import ReleaseWindows, LiveJudge, judge_peak, Z_GRID, NO_TARGET, IN_PROGRESS, PASS
+
+
+LOGGER_NAME = "AlpenFlowDinApp"  # not __name__, which is "__main__" when the app is run as a script
 
 
 class AlpenFlowApp(QMainWindow):
-    def __init__(self):
+    def __init__(self, bench=None):
+        """Window that runs the pulls of one bench
+
+        Args:
+            bench (Bench, optional): devices, calibration and data folder of the bench. Defaults to the single default bench.
+        """
         
-        # Setup the internal logger
-        self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.INFO)
-        console_handler  = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        # Setup the internal logger. Records are written by a background thread
+        setup_logging()
+        self.logger = logging.getLogger(LOGGER_NAME)
+        self.bench = bench if bench is not None else default_bench()
         
         # kick off the UI
         super().__init__()
-        self.setWindowTitle("AlpenFlow Din Measurement App")
+        if self.bench.name == DEFAULT_BENCH_NAME:
+            self.setWindowTitle("AlpenFlow Din Measurement App")
+        else:
+            self.setWindowTitle(f"AlpenFlow Din Measurement App - {self.bench.name}")
         self.setGeometry(100, 100, 1500, 775)
         
-        self.log_dir = os.path.join(os.path.normpath(os.getcwd() + os.sep), "Data")
+        self.log_dir = os.path.join(os.path.normpath(os.getcwd() + os.sep), self.bench.data_dir)
             
         # setup log file paths
         if not os.path.exists(self.log_dir):
             os.makedirs(self.log_dir)
+        if remove_stale_temp_files(self.log_dir):
+            self.logger.warning("Removed partial files from an export that didn't finish")
+        
+        # every capture is journaled to disk as it runs. Saving links the journal under the chosen name
+        self.journal_dir = os.path.join(self.log_dir, "journal")
+        if not os.path.exists(self.journal_dir):
+            os.makedirs(self.journal_dir)
+        unsaved_journals = list_journals(self.journal_dir)
+        if len(unsaved_journals) > 0:
+            self.logger.info("%d unsaved captures in %s. Recover them with python -m src.CaptureJournal", len(unsaved_journals), self.journal_dir)
+        self.journal = None
+        
+        self.profiler = profiler_from_env()  # the bench's own, so pulls on other benches don't end its runs
+        
+        # csvs are written by a background thread so saving never blocks the GUI
+        self.export_writer = ExportWriter(self, self.profiler)
+        self.export_writer.saved.connect(self.export_saved)
+        self.export_writer.failed.connect(self.export_failed)
+        self.export_writer.start()
         
-        # import Steven's ISO DIN standard converters
-        self.iso13 = ISO13992()
-        self.iso11 = ISO11088()
+        # pulls are processed off the GUI thread. One thread keeps results in the order they were queued
+        self.processor_pool = QThreadPool(self)
+        self.processor_pool.setMaxThreadCount(1)
+        self.processor_signals = ProcessorSignals()
+        self.processor_signals.processed.connect(self.render_capture)
+        self.processor_signals.failed.connect(self.processing_failed)
         
-        self.phidget = PhidgetHandler()  # TODO UNCOMMNET THIS
-        # self.phidget = None
-        try:
-            self.serial = SerialHandler() # 1/timeout is the frequency at which the port is read
-        except:
-            self.logger.error("Did not find Arduino on a USB port")
-            self.serial = None
+        # load Steven's ISO DIN standard converters once for the whole process
+        for standard in STANDARDS.names():
+            STANDARDS.get(standard)
+        # pass/fail torque windows of every target z and BSL, so judging a pull is a lookup
+        self.release_windows = ReleaseWindows(STANDARDS.model("iso11088").df_table_B1)
+        
+        # index of every saved run. Runs saved before the catalog existed are added in the background
+        self.catalog = RunCatalog(os.path.join(self.log_dir, CATALOG_FILE))
+        self.curve_store = CurveStore(os.path.join(self.log_dir, STORE_DIR))
+        self.catalog.start_backfill(self.log_dir, z_of_peak)
+        
+        # optionally poll the sensors in a child process so GUI work can't delay their timestamps
+        self.acquisition = None
+        if os.environ.get(ACQUISITION_PROCESS_ENV) == "1" or self.bench.acquisition_process:
+            try:
+                self.acquisition = AcquisitionClient(self.bench)
+            except RuntimeError as e:
+                self.logger.error("%s. Acquiring in the app instead", e)
+        
+        if self.acquisition is not None:
+            # the child process owns the devices. The client handles calibration and axis switching
+            self.phidget = self.serial = self.acquisition
+        else:
+            self.phidget = PhidgetHandler(self.bench.phidget_serial, self.bench.phidget_channel, self.bench.calibration_file)  # TODO UNCOMMNET THIS
+            # self.phidget = None
+            try:
+                self.serial = SerialHandler(self.bench.serial_port) # 1/timeout is the frequency at which the port is read
+            except:
+                self.logger.error("Did not find Arduino on a USB port")
+                self.serial = None
+
+        # optionally stream each pull's samples and live metrics to local consumers
+        self.publisher = None
+        if self.bench.stream:
+            try:
+                self.publisher = LivePublisher(self.bench.stream)
+            except (OSError, ValueError) as e:
+                self.logger.error("Live stream not started: %s", e)
 
         # Various shared variables
         self.max_index = 1200  # max data collection of 2 mins
         self.max_raw_torques_index = 50000
+        self.max_bridge_index = 5000  # phidget reports every 10ms so 12s is 1200 samples
         self.curr_data_i = 0
         self.max_data_count = 0
         self.numb_mm_to_measure = 30
-        # use preinitalized arrays for increased speed
-        self.boot_torques = np.zeros(self.max_index)
-        self.torque_times = np.zeros(self.max_index)
-        self.raw_torques = np.zeros(self.max_raw_torques_index)
-        self.raw_torque_times = np.zeros(self.max_raw_torques_index)
-        self.distances = np.zeros(self.max_index, dtype=np.uint8)  # maybe specify data type
-        self.aggregate_dist = np.zeros(self.numb_mm_to_measure)
-        self.aggregate_boot_torques_div_BSL = np.zeros(self.numb_mm_to_measure)
+        self.tare_drift = TareDrift()  # zero of each axis across the session's pulls
+        self.target_speed_band = (.02, .06)  # [m/s] boot speed the live gauge shows as on target
+        self.release_hold_time = .3  # [s] a capture ends once torque has been back at baseline this long after the peak
+        self.capture = None  # CaptureResult of the most recent pull
+        self.processing = False  # the most recent pull is on the processing thread. Its settings can't change until it's back
+        self.processing_error = None  # why the most recent pull couldn't be processed. It can't be saved until it's reprocessed
+        self.capture_curve = None  # plotted release curve and scatter of self.capture
+        self.capture_scatter = None
         self.max_strain_dist = 0
         self.max_strain = 0
         self.sample_rate = .01
@@ -83,10 +153,13 @@ class AlpenFlowApp(QMainWindow):
         self.estimated_speed_str = "Estimated Speed: \t"
         self.estimated_angular_speed_str = "Estimated Angle Speed \t"
         self.max_force_at_str = "Max Force at: \t\t"
+        self.verdict_str = "Target: \t\t"
+        self.verdict_colors = {NO_TARGET: "", IN_PROGRESS: "background-color: yellow", PASS: "background-color: green"}  # anything else is a fail
         
         # logic flags to determine branches
         self.graph_numb = 0
         self.saved_the_data = False
+        self.safe_for_processing = True
         self.testing_My = True # Starts out as testing My
         
         self.initUI()
@@ -103,6 +176,16 @@ class AlpenFlowApp(QMainWindow):
         main_widget = QWidget()
         self.setCentralWidget(main_widget)
         
+        # opt-in timing of every stage of a pull. Also enabled by ALPENFLOW_PROFILE=1
+        tools_menu = self.menuBar().addMenu("Tools")
+        self.profile_action = QAction("Profile Stages", self, checkable=True)
+        self.profile_action.setChecked(self.profiler.enabled)
+        self.profile_action.toggled.connect(self.profiler.set_enabled)
+        tools_menu.addAction(self.profile_action)
+        timing_action = QAction("Timing Summary", self)
+        timing_action.triggered.connect(self.show_timing_summary)
+        tools_menu.addAction(timing_action)
+        
         main_layout = QVBoxLayout(main_widget)
 
         top_buttons = QHBoxLayout(main_widget)
@@ -115,6 +198,11 @@ class AlpenFlowApp(QMainWindow):
         self.combo_box.currentIndexChanged.connect(self.on_option_change)
         top_buttons.addWidget(self.combo_box)
         
+        # stream the other axis' distance sensor too, for fixtures that load both axes in one pull
+        self.dual_stream_checkbox = QCheckBox(" Both Sensors")
+        self.dual_stream_checkbox.toggled.connect(self.on_dual_stream_change)
+        top_buttons.addWidget(self.dual_stream_checkbox)
+        
         # allow for bsl input
         self.bsl_label = QLabel("BSL:")
         top_buttons.addWidget(self.bsl_label)
@@ -126,6 +214,16 @@ class AlpenFlowApp(QMainWindow):
         self.bsl_input_box.setValidator(only_int_validator)
         top_buttons.addWidget(self.bsl_input_box)
         
+        # optional z the binding is set to. Pulls are judged against it live
+        top_buttons.addWidget(QLabel("Target z:"))
+        target_z_validator = QDoubleValidator(float(Z_GRID[0]), float(Z_GRID[-1]), 2)
+        target_z_validator.setNotation(QDoubleValidator.StandardNotation)
+        self.target_z_input = QLineEdit("")
+        self.target_z_input.setMaximumWidth(100)
+        self.target_z_input.setPlaceholderText("none")
+        self.target_z_input.setValidator(target_z_validator)
+        top_buttons.addWidget(self.target_z_input)
+        
         # Add the input box and ability to save current data to a file
         file_name_label = QLabel("\t\t\tFile Name:")
         top_buttons.addWidget(file_name_label)
@@ -148,6 +246,7 @@ class AlpenFlowApp(QMainWindow):
         plot_layout.addWidget(self.plot_widget)
         plot_and_buttons.addLayout(plot_layout)
         
+        self.plot_widget.draw = self.profiler.timed(self.plot_widget.draw, "matplotlib draw")  # draw_idle ends up here
         self.ax = self.plot_widget.figure.subplots()  # global ax variable
         self.plot_widget.setFixedSize(1300, 600) 
         # self.plot_widget.figure.tight_layout(pad=1.25)
@@ -161,6 +260,17 @@ class AlpenFlowApp(QMainWindow):
         self.begin_data_button.clicked.connect(self.initalize_data_collection)
         button_layout.addWidget(self.begin_data_button)
         self.original_begin_data_style = self.begin_data_button.styleSheet()
+        
+        # re-interpret the last pull after fixing the BSL, axis or calibration file
+        self.reprocess_button = QPushButton("Reprocess Last Pull")
+        self.reprocess_button.setToolTip("Apply the current BSL, axis and calibration file to the last pull")
+        self.reprocess_button.clicked.connect(self.reprocess_last_pull)
+        self.reprocess_button.setEnabled(False)
+        button_layout.addWidget(self.reprocess_button)
+        
+        # pass/fail of the pull against the target z. Updates while the pull is captured
+        self.verdict_label = QLabel(self.verdict_str + NO_TARGET)
+        button_layout.addWidget(self.verdict_label)
 
         # A series of labels to display relavent measurements
         self.peak_my_label = QLabel(self.peak_torque_div_BSL_str + "0N")
@@ -181,12 +291,28 @@ class AlpenFlowApp(QMainWindow):
         self.estimated_angular_speed_lbl = QLabel(self.estimated_angular_speed_str + "0deg/s")
         button_layout.addWidget(self.estimated_angular_speed_lbl)
         
+        # live boot speed during the pull, against the target band. Refreshed at display rate
+        self.speed_gauge = SpeedGauge(self.target_speed_band)
+        self.speed_gauge.setToolTip(f"Boot speed. Aim for {self.target_speed_band[0]} to {self.target_speed_band[1]}m/s")
+        button_layout.addWidget(self.speed_gauge)
+        self.speed_timer = QTimer(self)
+        self.speed_timer.setInterval(50)
+        self.speed_timer.timeout.connect(self.refresh_speed_gauge)
+        
         plot_and_buttons.addLayout(button_layout)
         
         # Add ability to keep graphs visible or to ignore them
         self.save_graph_checkbox = QCheckBox()
         self.save_graph_checkbox.setText(" Keep Graphs Visible")
         button_layout.addWidget(self.save_graph_checkbox)
+        
+        # zero the load cell on the first 200ms of each pull instead of the calibration file's offset
+        self.auto_tare_checkbox = QCheckBox()
+        self.auto_tare_checkbox.setText(" Auto Tare")
+        self.auto_tare_checkbox.setChecked(True)
+        button_layout.addWidget(self.auto_tare_checkbox)
+        self.tare_drift_label = QLabel("Tare drift: \t\t-")
+        button_layout.addWidget(self.tare_drift_label)
                         
         self.table_of_counts = QTableWidget()
         self.table_of_counts.setSizeAdjustPolicy(QAbstractScrollArea.AdjustToContents)
@@ -198,9 +324,13 @@ class AlpenFlowApp(QMainWindow):
         self.table_of_counts.setHorizontalHeaderLabels(distance_labels)
         for i in range(self.numb_mm_to_measure):
             self.table_of_counts.setColumnWidth(i, 90)
-        self.populate_distance_times_table(self.distances)
+        self.populate_distance_times_table(np.zeros(self.numb_mm_to_measure))
         main_layout.addWidget(self.table_of_counts)
         
+        # acquisition health of the last pull. Turns red when its timing was degraded
+        self.telemetry_label = QLabel("Acquisition: -")
+        self.statusBar().addPermanentWidget(self.telemetry_label, 1)
+        
         self.original_style = self.din_value_13.styleSheet()
 
     def reset_data(self) -> None: 
@@ -209,11 +339,9 @@ class AlpenFlowApp(QMainWindow):
         self.curr_data_i = 0
         self.max_strain_dist = 0
         self.max_strain = 0
-        self.boot_torques = np.zeros(self.max_index)
-        self.distances = np.zeros(self.max_index, dtype='uint8')  # maybe specify data type
-        if not self.saved_the_data:
-            self.logger.info("Data that was previously collected is no longer in memory")
-            self.saved_the_data = False
+        if not self.saved_the_data and self.journal is not None:
+            self.logger.info("Data that was previously collected is no longer in memory. It is still in %s", self.journal.path)
+        self.saved_the_data = False
     
     def initalize_data_collection(self):
         """Disables buttons durring data collection and begins Worker
@@ -222,163 +350,343 @@ class AlpenFlowApp(QMainWindow):
         """
         # Disable data and output message
         self.combo_box.setEnabled(False)
+        self.dual_stream_checkbox.setEnabled(False)
         self.save_data_button.setEnabled(False)
+        self.reprocess_button.setEnabled(False)
         self.begin_data_button.setText("Collecting Data for 12s...")
         self.begin_data_button.setEnabled(False)
         self.begin_data_button.setStyleSheet("background-color: yellow")
         self.reset_data()
         self.safe_for_processing = False
+        self.capture_started = datetime.now()
+        metadata = {
+            'bench': self.bench.name,
+            'testing_My': self.testing_My,
+            'bsl': int(self.bsl_input_box.text()),
+            'calibration': {'My': self.phidget.my_cal, 'Mz': self.phidget.mz_cal},
+            'numb_mm_to_measure': self.numb_mm_to_measure,
+            'target_z': self.target_z(),
+            'auto_tare': self.auto_tare_checkbox.isChecked(),
+            'dual_stream': self.dual_stream_checkbox.isChecked(),
+            'started': self.capture_started.isoformat(),  # keys the pull's CAPTURE_END on the live stream
+        }
+        self.journal = CaptureJournal(new_journal_path(self.journal_dir), metadata)
+        if self.publisher is not None:
+            self.publisher.start_capture(metadata)
+        self.profiler.start_run()
         self.worker = self.Worker(self)
+        self.show_verdict(IN_PROGRESS if self.worker.judge is not None else NO_TARGET)
+        self.worker.verdict.connect(self.show_verdict)
+        self.worker.peak.connect(self.show_live_peak)
         self.worker.result.connect(self.handle_result)
         self.worker.finished.connect(self.task_finished)
         self.worker.start()
+        self.speed_timer.start()
         
-    def handle_result(self, result: tuple) -> None:
-        """Takes result from data collection, processes it, and displays it
+    def handle_result(self, capture: CaptureResult) -> None:
+        """Takes result from data collection and queues it for processing
         
         This is the callback function for when the QThread worker function 
-        completes. Output of function
-        is visual feedback to the user and data that can be saved to csvs
+        completes. The numeric work runs on the processing thread, which calls
+        render_capture when the pull is ready to display
 
         Args:
-            result (tuple): tuple of three consisting of dist, force, and speed
+            capture (CaptureResult): everything measured during the pull
         """
         # clear the scatter plot data and plot old processed data before new graphs
         if self.save_graph_checkbox.isChecked() and self.graph_numb == 1:
             self.ax.clear()
-            self.ax.plot(self.aggregate_dist, self.aggregate_boot_torques_div_BSL, label="Run 0")
+            self.capture_curve, = self.ax.plot(*self.capture.aggregated, label="Run 0")
 
-        # unpack the worker results and analyze them
-        self.distances, self.boot_torques, self.torque_times, self.raw_torques, self.raw_torque_times = result
-        
-        if np.any(self.distances) and np.any(self.boot_torques):
+        self.show_telemetry(capture.telemetry)
+        self.logger.debug("Pull captured. Distances %s, bridge samples %s, polled ratios %s", ArraySummary(capture.relative_distances),
+                          ArraySummary(capture.bridge_ratios), ArraySummary(capture.raw_ratios))
+        if capture.has_data:
             # only process data if there is data. No data is all 0s
-            mask = (self.distances < self.numb_mm_to_measure) & (self.distances >= 0)
-            self.distances = self.distances[mask]
-            self.boot_torques = self.boot_torques[mask]
-            estimated_speed, estimated_angular_speed = self.derive_speed_from_distances(self.distances)
-
-            # pick out key metrics here
-            self.boot_torques = self.phidget.interpret_voltage_data(self.boot_torques, self.testing_My)
-            self.raw_torques = self.phidget.interpret_voltage_data(self.raw_torques, self.testing_My)
-            BSL = int(self.bsl_input_box.text()) # [mm] Get BSL that the user inputted into the input box. 
-            self.boot_torques_div_BSL = self.boot_torques/(BSL/1000) # [N] Normalized boot torque. Note how BSL is coverted to meters
-            self.raw_torques_div_BSL = self.raw_torques / (BSL/1000)
-           
-            # max_boot_torque_div_BSL = self.boot_torques_div_BSL.max()  
-            max_boot_torque_div_BSL =  self.raw_torques_div_BSL.max()
-            
-            self.max_strain_dist = self.distances[self.boot_torques.argmax()]
-            self.aggregate_dist, self.aggregate_boot_torques_div_BSL = descrete_dist_to_corresponding_force(self.distances, self.boot_torques_div_BSL)
-            dist_print_msg = [int(i) for i in self.aggregate_dist]
-            force_print_msg = [float(i) for i in self.aggregate_boot_torques_div_BSL]
-            self.logger.info(f"aggregate_dist:\t{dist_print_msg}")
-            self.logger.info(f"aggregate_force:\t{force_print_msg}")
-
-            
-            # calculate the din values depending on test state
-            # force_per_bsl = round(max_force / int(self.bsl_input_box.text()), 2)
-            if self.testing_My:
-                iso13_din = self.iso13.calc_z_of_My_div_BSL(max_boot_torque_div_BSL, round_bool=False)
-                iso11_din = self.iso11.calc_z_of_My_div_BSL(max_boot_torque_div_BSL, round_bool=False)
-            else:
-                iso13_din = self.iso13.calc_z_of_Mz_div_BSL(max_boot_torque_div_BSL, round_bool=False)
-                iso11_din = self.iso11.calc_z_of_Mz_div_BSL(max_boot_torque_div_BSL, round_bool=False)
-            self.logger.info(f"ISO13 {iso13_din}, ISO11: {iso11_din}")
-            
-            # add data to GUI labels for user to read
-            self.peak_my_label.setText(self.peak_torque_div_BSL_str + str(round(max_boot_torque_div_BSL, 2)) + "N")
-            self.max_force_at.setText(self.max_force_at_str + str(self.max_strain_dist) + "mm")
-            self.din_value_13.setText(self.din_13_str + "<b>" + str(round(iso13_din, 2)) + "</b>") 
-            self.din_value_11.setText(self.din_11_str + "<b>" + str(round(iso11_din, 2)) + "</b>")  
-            self.estimated_speed_lbl.setText(self.estimated_speed_str + str(estimated_speed) + "m/s")
-            self.estimated_angular_speed_lbl.setText(self.estimated_angular_speed_str + str(estimated_angular_speed) + "deg/s")
-            
-            self.populate_distance_times_table(self.distances)  # update speeds table
-            
-            # create the release curve plot for viewing
-            if not self.save_graph_checkbox.isChecked():
-                self.ax.clear()
-                self.graph_numb = 0
-                self.ax.scatter(self.distances, self.boot_torques_div_BSL, alpha=.3, linewidths=.3)
-            self.ax.plot(self.aggregate_dist, self.aggregate_boot_torques_div_BSL, label="Run " + str(self.graph_numb))
-            self.ax.set_title("Force vs. Distance Curve")
-            self.ax.set_xlabel("Distance (mm)")
-            self.ax.set_ylabel("Boot Torque/BSL (N)")
-            self.graph_numb += 1
-            if self.save_graph_checkbox.isChecked():
-                self.ax.legend()
-
-            self.plot_widget.draw()
-            
+            self.capture = capture
+            self.processing = True
+            self.processing_error = None
+            self.reprocess_button.setEnabled(False)
+            self.processor_pool.start(CaptureProcessor(capture, self.processor_signals))
         else:
             self.logger.error("Data collection failed")
+            self.end_stream(capture, {'error': "Data collection failed"})
+
+    def render_capture(self, capture: CaptureResult, pull_lag: float, new_pull: bool) -> None:
+        """Displays a pull once the processing thread has computed everything
+
+        Only widgets and plot artists are touched here. Every value is already
+        cached on the capture, and the canvas is redrawn when Qt is idle.
+
+        Args:
+            capture (CaptureResult): processed pull
+            pull_lag (float): sensor lag estimated from the pull. None if it couldn't be
+            new_pull (bool): False if the displayed pull was reprocessed with new settings
+        """
+        if new_pull:
+            self.end_stream(capture, capture.summary())  # even if a newer pull is already streaming
+        if capture is not self.capture:
+            return  # a newer pull arrived while this one was being processed
+        self.processing = False
+        self.processing_error = None
+        self.reprocess_button.setEnabled(self.safe_for_processing)
+        self.save_data_button.setEnabled(self.can_save())
+        if pull_lag is not None:
+            self.logger.info("Sensor lag estimated from this pull: %ss (using %ss)", pull_lag, capture.calibration.get('sensor_lag', 0.0))
+        self.logger.info("Sampling rate of tof was %.4f samples/sec", capture.frame_period)
+        self.display_capture(capture)
+        if new_pull:
+            self.record_tare(capture)
         
+        if not new_pull:
+            # move the pull's curve rather than drawing another run
+            self.capture_curve.set_data(*capture.aggregated)
+            if self.capture_scatter is not None:
+                self.capture_scatter.set_offsets(np.column_stack((capture.distances, capture.torques_div_BSL)))
+            self.ax.relim()
+            if self.capture_scatter is not None:
+                self.ax.update_datalim(self.capture_scatter.get_offsets())
+            self.ax.autoscale_view()
+            self.plot_widget.draw_idle()
+            return
+        
+        # create the release curve plot for viewing
+        self.capture_scatter = None
+        if not self.save_graph_checkbox.isChecked():
+            self.ax.clear()
+            self.graph_numb = 0
+            self.capture_scatter = self.ax.scatter(capture.distances, capture.torques_div_BSL, alpha=.3, linewidths=.3)
+        self.capture_curve, = self.ax.plot(*capture.aggregated, label="Run " + str(self.graph_numb))
+        self.ax.set_title("Force vs. Distance Curve")
+        self.ax.set_xlabel("Distance (mm)")
+        self.ax.set_ylabel("Boot Torque/BSL (N)")
+        self.graph_numb += 1
+        if self.save_graph_checkbox.isChecked():
+            self.ax.legend()
+
+        self.plot_widget.draw_idle()
+
+    def record_tare(self, capture: CaptureResult) -> None:
+        """Adds the tare of a new pull to the session's drift statistics"""
+        if not capture.auto_tare:
+            return
+        axis = "My" if capture.testing_My else "Mz"
+        if capture.tare is None:
+            self.logger.warning("The start of the pull wasn't quiet enough to tare. Used the calibration file's offset")
+            return
+        self.tare_drift.add(axis, capture.captured_at, capture.tare)
+        drift = self.tare_drift.summary(axis, capture.calibrations[axis])
+        self.logger.info("Tare %.6g (%.3fNm from the calibration file). %s drift over %d pulls: std %.3fNm, range %.3fNm, %.3fNm/hour",
+                         capture.tare, drift['shift'], axis, drift['count'], drift['std'], drift['range'], drift['rate_per_hour'])
+        self.tare_drift_label.setText(f"Tare drift ({axis}): \t{round(drift['range'], 2)}Nm over {drift['count']} pulls")
+
+    def show_telemetry(self, telemetry: CaptureTelemetry) -> None:
+        """Shows how healthy the acquisition of the last pull was and warns if it degraded"""
+        if telemetry is None:
+            return
+        self.telemetry_label.setText("Acquisition: " + telemetry.status())
+        problems = telemetry.problems()
+        self.telemetry_label.setToolTip("\n".join(problems))
+        self.telemetry_label.setStyleSheet("color: red" if len(problems) > 0 else "")
+        if len(problems) > 0:
+            self.logger.warning("Acquisition timing degraded: %s", "; ".join(problems))
+
+    def show_timing_summary(self) -> None:
+        """Shows how long each stage took over the recent pulls"""
+        summary = self.profiler.summary()
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Stage Timings")
+        layout = QVBoxLayout(dialog)
+        if len(summary) == 0:
+            layout.addWidget(QLabel("No timings yet. Enable Tools > Profile Stages and pull."))
+        else:
+            columns = ['runs', 'last_ms', 'median_ms', 'p95_ms']
+            table = QTableWidget(len(summary), len(columns))
+            table.setHorizontalHeaderLabels(["Runs", "Last [ms]", "Median [ms]", "95% [ms]"])
+            table.setVerticalHeaderLabels(list(summary))
+            for row, timings in enumerate(summary.values()):
+                for column, key in enumerate(columns):
+                    table.setItem(row, column, QTableWidgetItem(str(round(timings[key], 2))))
+            table.setSizeAdjustPolicy(QAbstractScrollArea.AdjustToContents)
+            table.resizeColumnsToContents()
+            layout.addWidget(table)
+        dialog.show()
+
+    def processing_failed(self, capture: CaptureResult, error: str, new_pull: bool) -> None:
+        """Callback from the processing thread when a pull couldn't be processed
+
+        Args:
+            capture (CaptureResult): pull that failed
+            error (str): description of the failure
+            new_pull (bool): False if the pull was being reprocessed with new settings
+        """
+        self.logger.error("Could not process the pull: " + error)
+        if new_pull:
+            self.end_stream(capture, {'error': error})
+        if capture is not self.capture:
+            return  # a newer pull is queued. Its own result decides the buttons
+        self.processing = False
+        self.processing_error = error
+        self.reprocess_button.setEnabled(self.capture is not None and self.safe_for_processing)
+        self.save_data_button.setEnabled(self.can_save())
+
+    def end_stream(self, capture: CaptureResult, summary: dict) -> None:
+        """Ends a pull on the live stream. Its 'started' matches the pull's CAPTURE_START
+
+        Args:
+            capture (CaptureResult): pull that ended
+            summary (dict): results of the pull, or the error that stopped it
+        """
+        if self.publisher is not None:
+            self.publisher.end_capture(dict(summary, started=capture.captured_at.isoformat()))
+
+    def can_save(self) -> bool:
+        """True when no pull is being captured and the last one is fully processed
+
+        Saving reads the capture's derived values. While the processing thread
+        is still computing them, or after it failed to, they'd be computed on
+        the GUI thread instead.
+        """
+        return self.safe_for_processing and not self.processing and self.processing_error is None
+
+    def display_capture(self, capture: CaptureResult) -> None:
+        """Shows the results of a pull in the labels and the dwell time table
+
+        Args:
+            capture (CaptureResult): pull to display
+        """
+        # calculate the din values depending on test state
+        iso13_din, iso11_din = capture.z_values
+        self.logger.info("ISO13 %s, ISO11: %s", iso13_din, iso11_din)
+        if capture.peak.spikes > 0:
+            self.logger.info("Rejected %d spikes. Peak at %.3fs, %dmm", capture.peak.spikes, capture.peak.time, capture.peak_displacement)
+        estimated_speed, estimated_angular_speed = capture.speed
+        
+        # add data to GUI labels for user to read
+        self.max_strain_dist = capture.max_force_dist
+        self.peak_my_label.setText(self.peak_torque_div_BSL_str + str(round(capture.peak_torque_div_BSL, 2)) + "N")
+        self.max_force_at.setText(self.max_force_at_str + str(self.max_strain_dist) + "mm")
+        (iso13_low, iso13_high), (iso11_low, iso11_high) = capture.z_intervals
+        self.din_value_13.setText(self.din_13_str + "<b>" + str(round(iso13_din, 2)) + "</b>" + f" ({iso13_low:.2f} to {iso13_high:.2f})") 
+        self.din_value_11.setText(self.din_11_str + "<b>" + str(round(iso11_din, 2)) + "</b>" + f" ({iso11_low:.2f} to {iso11_high:.2f})")  
+        self.estimated_speed_lbl.setText(self.estimated_speed_str + str(estimated_speed) + "m/s")
+        self.estimated_angular_speed_lbl.setText(self.estimated_angular_speed_str + str(estimated_angular_speed) + "deg/s")
+        
+        with self.profiler.stage("table population"):
+            self.populate_distance_times_table(capture.dwell_table)  # update speeds table
+        
+        # final verdict from the processed peak. Follows the pull's settings if it is reprocessed
+        target_z = self.target_z()
+        if target_z is None:
+            self.show_verdict(NO_TARGET)
+        else:
+            window = self.release_windows.window_div_BSL(target_z, capture.bsl, capture.testing_My)
+            self.show_verdict(judge_peak(capture.peak_torque_div_BSL, window))
+
+    def target_z(self) -> float:
+        """Target z typed in by the user, None if blank or invalid"""
+        if not self.target_z_input.hasAcceptableInput():
+            return None
+        return float(self.target_z_input.text())
+
+    def live_judge(self, testing_My: bool, bsl: int) -> LiveJudge:
+        """Judge for the pull about to be captured
+
+        Args:
+            testing_My (bool): axis of the pull
+            bsl (int): boot sole length [mm]
+
+        Returns:
+            LiveJudge: None without a target or if Table B1 doesn't cover it at this BSL
+        """
+        target_z = self.target_z()
+        if target_z is None:
+            return None
+        window = self.release_windows.window(target_z, bsl, testing_My)
+        if np.isnan(window).any():
+            self.logger.warning("ISO 11088 Table B1 has no z %s for a %dmm BSL. The pull won't be judged", target_z, bsl)
+            return None
+        self.logger.info("Target z %s: release between %.1fNm and %.1fNm", target_z, window[0], window[1])
+        return LiveJudge(self.release_windows.window_div_BSL(target_z, bsl, testing_My))
+
+    def show_live_peak(self, peak: float) -> None:
+        self.peak_my_label.setText(self.peak_torque_div_BSL_str + str(round(peak, 2)) + "N")
+        if self.publisher is not None:
+            self.publisher.update_metrics(peak=peak)
+
+    def show_verdict(self, verdict: str) -> None:
+        self.verdict_label.setText(self.verdict_str + verdict)
+        self.verdict_label.setStyleSheet(self.verdict_colors.get(verdict, "background-color: red"))
+        if self.publisher is not None:
+            self.publisher.update_metrics(verdict=verdict)
+
+    def reprocess_last_pull(self) -> None:
+        """Re-interprets the last pull with the current BSL, axis and calibration file
+
+        Only the stages of the pull that depend on a changed setting are
+        recomputed (on the processing thread), then the labels, table and the
+        pull's curve are updated in place. Fixes a mistyped BSL or a wrong axis without pulling again.
+        """
+        if self.capture is None or not self.safe_for_processing or self.processing:
+            return  # the processing thread may still be writing stages of the pull
+        if not self.bsl_input_box.hasAcceptableInput():
+            self.logger.error("BSL must be between 200mm and 400mm")
+            return
+        changed = self.capture.update_settings(bsl=int(self.bsl_input_box.text()), testing_My=self.testing_My,
+                                               calibrations=self.phidget.reload_calibration(),
+                                               auto_tare=self.auto_tare_checkbox.isChecked())
+        if len(changed) == 0:
+            self.logger.info("Settings match the last pull. Nothing to reprocess")
+            return
+        self.logger.info("Reprocessing the last pull for new %s", ', '.join(changed))
+        self.processing = True
+        self.processing_error = None
+        self.reprocess_button.setEnabled(False)
+        self.save_data_button.setEnabled(False)
+        self.processor_pool.start(CaptureProcessor(self.capture, self.processor_signals, new_pull=False))
+        self.csv_name_input.setText(f"Din_data_{self.capture.bsl}_My_{self.capture.testing_My}" + self.capture.captured_at.strftime("%Y%m%d_%H%M"))
+
+    def refresh_speed_gauge(self) -> None:
+        """Shows the worker's current boot speed. Reading one float is safe across threads"""
+        self.speed_gauge.set_speed(self.worker.speed_tracker.speed)
+        if self.publisher is not None:
+            self.publisher.update_metrics(speed=self.worker.speed_tracker.speed)
+
     def task_finished(self):
         """Renables all of the other functions of the GUI after data collection"""
+        self.speed_timer.stop()
+        self.refresh_speed_gauge()
         self.safe_for_processing = True
         self.begin_data_button.setText("Collect Data")  # replace label with original
         self.begin_data_button.setEnabled(True)
         self.begin_data_button.setStyleSheet(self.original_style)
         self.combo_box.setEnabled(True)
-        self.save_data_button.setEnabled(True)
+        self.dual_stream_checkbox.setEnabled(True)
+        self.save_data_button.setEnabled(self.can_save())
+        self.reprocess_button.setEnabled(self.capture is not None and not self.processing)
         
-    def populate_distance_times_table(self, distances: np.array) -> None:
-        """Takes the counts of nonzero distance values and determines durration
+    def populate_distance_times_table(self, dwell_times: np.array) -> None:
+        """Shows how long the boot spent at each displacement
         
         Helps the user know if they had a fairly consistent velocity on the
         din release by identifying how long they spent in each distance. Could
         be considered equivalent to speed per mm of release
 
         Args:
-            distances (np.array): distances collected durring the sampling
+            dwell_times (np.array): seconds spent at 1mm through 30mm
         """
-        unique_dist = np.unique(distances)
-        unique_dist = np.sort(unique_dist)
-        sample_rate = np.average(np.diff(self.torque_times))
-
-        for i in range(1, 31):
-            mask = distances == i
-            number_samples = np.sum(mask)
-            durration = sample_rate * number_samples
-            durration = round(durration, 2)
+        for i, durration in enumerate(dwell_times):
             if durration == 0:
-                self.table_of_counts.setItem(0, i-1, QTableWidgetItem(""))
+                self.table_of_counts.setItem(0, i, QTableWidgetItem(""))
             else:
-                self.table_of_counts.setItem(0, i-1, QTableWidgetItem(str(durration) + "s"))
+                self.table_of_counts.setItem(0, i, QTableWidgetItem(str(durration) + "s"))
 
         
-    def derive_speed_from_distances(self, dists: np.array) -> Tuple[float, float]:
-        """Calculates the speed of the boot release based on sample rate + distance
-        
-        Over the distance of 2mm to 10mm we travel .08 meters. Each sample is 
-        taken at the same sample rate. Thus, we can derive speed
-
-        Args:
-            dists (np.array): distances returned durring data collection
-
-        Returns:
-            float, float: speed in meters per second and angular speed in deg/s
-        """
-        start_dist = 2  #mm
-        end_dist = 10  #mm
-        covered_distance = end_dist - start_dist
-        try:
-            sample_rate = np.average(np.diff(self.torque_times))
-            self.logger.info(f"Sampling rate of tof was {round(sample_rate, 4)} samples/sec")
-            numb_distances = np.sum((dists >= start_dist) & (dists < end_dist))
-            durration = numb_distances * sample_rate  # seconds
-            speed = (covered_distance * .001) / durration  # meters per second
-            angular_speed = np.rad2deg(np.arcsin(covered_distance / int(self.bsl_input_box.text()))) / durration
-            return round(speed, 2), round(angular_speed, 4)
-        except ZeroDivisionError:
-            self.logger.error("Could not derive speed from distance measurements: \n", dists)
-            return 0
-    
-        
     class Worker(QThread):
         finished = pyqtSignal()
-        result = pyqtSignal(tuple)
+        result = pyqtSignal(object)
+        verdict = pyqtSignal(str)  # emitted only when the live pass/fail changes
+        peak = pyqtSignal(float)  # running spike rejected peak torque/BSL [N], emitted when it rises
 
         def __init__(self, parent):
             """QThread that manages data collection from the phidget and arduino
@@ -388,23 +696,117 @@ class AlpenFlowApp(QMainWindow):
             """
             super().__init__(parent)
             self.self = parent
-            self.distances = np.zeros(parent.max_index)
-            self.boot_torques = np.zeros(parent.max_index)
-            self.torque_times = np.zeros(parent.max_index)
-            self.raw_torques = np.zeros(parent.max_raw_torques_index)
-            self.raw_torque_times = np.zeros(parent.max_raw_torques_index)
+            self.distances = np.zeros(parent.max_index, dtype=np.uint8)  # distance reported by the arduino
+            self.boot_torques = np.zeros(parent.max_index, dtype=np.float32)
+            self.torque_times = np.zeros(parent.max_index, dtype=np.float32)
+            self.raw_torques = np.zeros(parent.max_raw_torques_index, dtype=np.float32)
+            self.raw_torque_times = np.zeros(parent.max_raw_torques_index, dtype=np.float32)
+            self.dual_stream = parent.dual_stream_checkbox.isChecked()
+            self.cross_distances = np.zeros(parent.max_index if self.dual_stream else 0, dtype=np.uint8)  # other axis' sensor
+            self.cross_times = np.zeros(parent.max_index if self.dual_stream else 0, dtype=np.float32)
+            self.cross_index = 0
+            self.bridge_torques = np.zeros(parent.max_bridge_index, dtype=np.float32)
+            self.bridge_times = np.zeros(parent.max_bridge_index, dtype=np.float32)
+            self.journal = parent.journal
+            self.publisher = parent.publisher
+            
+            # settings of this capture. Read here since widgets can't be touched from the thread
+            self.testing_My = parent.testing_My
+            self.bsl = int(parent.bsl_input_box.text())
+            self.calibrations = {'My': parent.phidget.my_cal, 'Mz': parent.phidget.mz_cal}
+            self.calibration = self.calibrations['My' if self.testing_My else 'Mz']  # tared once the first samples are in
+            self.tare_pending = parent.auto_tare_checkbox.isChecked()
+            self.auto_tare = self.tare_pending
+            self.speed_tracker = SpeedTracker()  # read by the GUI's speed gauge timer
+            self.peak_detector = PeakDetector()  # same detector CaptureResult runs afterwards, so the peaks match
+            self.release = ReleaseCompletion(parent.release_hold_time)
+            self.judge = parent.live_judge(self.testing_My, self.bsl)
+            self.telemetry = None  # filled in by the capture loop
             
             # Setup the internal logger
-            self.logger = logging.getLogger(__name__)
-            self.logger.setLevel(logging.INFO)
-            console_handler  = logging.StreamHandler()
-            console_handler.setLevel(logging.INFO)
-            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-            console_handler.setFormatter(formatter)
+            self.logger = logging.getLogger(LOGGER_NAME)
+
+        def run(self) -> None:
+            """Collects one pull and emits it as a CaptureResult"""
+            with self.self.profiler.stage("device read"):
+                if self.self.acquisition is not None:
+                    index, raw_torque_index, bridge_index, first_dist = self.read_acquisition_process()
+                else:
+                    index, raw_torque_index, bridge_index, first_dist = self.poll_devices()
+            if self.tare_pending:
+                self.settle_tare(bridge_index)  # pull too short to tare. Catch the detector up untared
+            if self.peak_detector.finish():
+                self.report_peak()
+            if self.judge is not None and self.judge.finish():
+                self.verdict.emit(self.judge.verdict)
             
-            # self.logger.addHandler(console_handler)
+            self.journal.close()
+            self.result.emit(CaptureResult(
+                self.distances[:index], first_dist, self.torque_times[:index], self.boot_torques[:index],
+                self.raw_torque_times[:raw_torque_index], self.raw_torques[:raw_torque_index],
+                self.bridge_times[:bridge_index], self.bridge_torques[:bridge_index],
+                self.testing_My, self.bsl, self.calibrations,
+                self.self.numb_mm_to_measure, self.self.capture_started, self.auto_tare, self.telemetry,
+                self.cross_times[:self.cross_index], self.cross_distances[:self.cross_index], self.self.profiler))
+            self.finished.emit()
+
+        def track_peak(self, bridge_index: int) -> None:
+            """Feeds a stored bridge sample to the live peak detector
+
+            With auto tare the first samples are held until the tare is known,
+            then fed at once. Same tare and samples as CaptureResult uses, so
+            the live peak matches the processed one.
+            """
+            if self.tare_pending:
+                if bridge_index + 1 >= TARE_SAMPLES:
+                    self.settle_tare(bridge_index + 1)
+                return
+            value = sample_torque_div_BSL(self.bridge_torques, bridge_index, self.calibration, self.bsl)
+            time_s = float(self.bridge_times[bridge_index])
+            if self.publisher is not None:
+                self.publisher.add(TORQUE, time_s, value)
+            if self.peak_detector.update(time_s, value):
+                self.report_peak()
+            if self.release.update(time_s, value, self.peak_detector.value):
+                self.logger.info("Release complete at %.2fs. Ending the capture", time_s)
+
+        def settle_tare(self, sample_count: int) -> None:
+            """Zeros the live conversion on the first samples and feeds them to the detector
 
-        def run(self) -> tuple:
+            Args:
+                sample_count (int): bridge samples stored so far
+            """
+            self.tare_pending = False
+            self.calibration = tared_calibration(self.calibration, estimate_tare(self.bridge_torques[:sample_count], self.calibration))
+            for i in range(sample_count):
+                self.track_peak(i)
+
+        def store_cross_frame(self, frame_time: float, distance: int) -> None:
+            """Keeps a frame of the other axis' distance sensor
+
+            Args:
+                frame_time (float): seconds since the capture started
+                distance (int): distance [mm] reported by the sensor
+            """
+            if self.cross_index >= len(self.cross_distances):
+                return
+            self.cross_distances[self.cross_index] = distance
+            self.cross_times[self.cross_index] = frame_time
+            self.record(CROSS_FRAME, frame_time, distance - int(self.cross_distances[0]))
+            self.cross_index += 1
+
+        def record(self, kind: int, sample_time: float, value: float) -> None:
+            """Journals a sample and streams it to live consumers"""
+            self.journal.append(kind, sample_time, value)
+            if self.publisher is not None:
+                self.publisher.add(kind, sample_time, value)
+
+        def report_peak(self) -> None:
+            self.peak.emit(self.peak_detector.value)
+            if self.judge is not None and self.judge.update(self.peak_detector.value):
+                self.verdict.emit(self.judge.verdict)
+
+        def poll_devices(self) -> tuple:
             """Continiously collects data from sensors until boot moves too far away
             
             Function runs as a thread. It samples at the same frequency as the 
@@ -414,21 +816,41 @@ class AlpenFlowApp(QMainWindow):
             log distance/force measurement based on that timing.
 
             Returns:
-                tuple: distances, forces
+                int, int, int, int: frames, polled ratios and bridge samples
+                    collected, and the distance of the first frame
             """
             index = 0  # tracks location in numpy arrays for dist/force
             raw_torque_index = 1
+            bridge_index = 0  # tracks every new phidget sample with its own timestamp
+            last_bridge_time = self.self.phidget.recent_sample[0]
             dist_counter = 0  # force function end after 10 instances of boot gone
             first_dist = False
+            telemetry = self.telemetry = CaptureTelemetry("thread")
             self.self.serial.reset_buffer()
+            bytes_read, callbacks = self.self.serial.bytes_read, self.self.phidget.callback_count
             start_time = time.time()
             
             # Collect data for 30s or until we have 200ms of too far of dists 
-            while (index < self.self.max_index) and dist_counter < 20 and (time.time() - start_time) < 12:
+            while (index < self.self.max_index) and dist_counter < 20 and (time.time() - start_time) < 12 and not self.release.complete:
+                telemetry.loops += 1
                 # get the arduino distance measurement to log or synchronize
                 distance_measurement = self.self.serial.get_arduino_data()
+                if self.dual_stream and len(self.self.serial.cross_frames) > 0:
+                    for frame_time, distance in self.self.serial.take_cross_frames():
+                        self.store_cross_frame(frame_time - start_time, distance)
                 
-                current_torque = self.self.phidget.recent_measurement
+                bridge_time, current_torque = self.self.phidget.recent_sample
+                if bridge_time != last_bridge_time:
+                    telemetry.bridge.add(bridge_time)
+                    last_bridge_time = bridge_time
+                    if bridge_index < self.self.max_bridge_index:
+                        self.bridge_torques[bridge_index] = current_torque
+                        self.bridge_times[bridge_index] = bridge_time - start_time
+                        self.record(BRIDGE, bridge_time - start_time, current_torque)
+                        self.track_peak(bridge_index)
+                        bridge_index += 1
+                    else:
+                        telemetry.bridge_overflow += 1
                     
                 # now handle the tof + force if tof measurement made
                 if distance_measurement != None:
@@ -437,8 +859,11 @@ class AlpenFlowApp(QMainWindow):
                         first_dist = distance_measurement
                     # since arduino reported data, we get phidget data and log it
                     self.boot_torques[index] = current_torque
-                    self.distances[index] = distance_measurement - first_dist
+                    self.distances[index] = distance_measurement
                     self.torque_times[index] = time.time() - start_time
+                    telemetry.frames.add(float(self.torque_times[index]))
+                    self.record(FRAME, float(self.torque_times[index]), distance_measurement - first_dist)
+                    self.speed_tracker.update(float(self.torque_times[index]), distance_measurement - first_dist)
                     index += 1
                     if (distance_measurement - first_dist) > self.self.numb_mm_to_measure + 1:
                         dist_counter += 1
@@ -446,24 +871,96 @@ class AlpenFlowApp(QMainWindow):
                     # distance is constrained by byte of range
                     if first_dist > 240:
                         self.logger.warning("The Boot is too far away from the sensor. 240mm is the maximum distance.")
-                        self.distances = np.zeros(self.self.max_index)
-                        self.boot_torques = np.zeros(self.self.max_index)
-                        self.torque_times = np.zeros(self.self.max_index)
-                        self.raw_torques = np.zeros(self.self.max_raw_torques_index)
-                        self.raw_torque_times = np.zeros(self.self.max_raw_torques_index)
+                        index = raw_torque_index = bridge_index = 0  # discard everything collected
                         break
                     
                 # log the torques constantly. Don't correlate them with phidget measurement
                 if raw_torque_index < self.self.max_raw_torques_index - 2 and (time.time() - start_time) - self.raw_torque_times[raw_torque_index - 1] > .0001:
                     self.raw_torques[raw_torque_index] = current_torque
                     self.raw_torque_times[raw_torque_index] = time.time() - start_time
+                    self.journal.append(RAW, self.raw_torque_times[raw_torque_index], current_torque)  # not streamed. Repeats the bridge samples at the loop's rate
                     raw_torque_index += 1
+                    telemetry.raw_samples += 1
                 elif raw_torque_index == self.self.max_raw_torques_index - 2:
-                    print(f"max torque index {self.self.max_raw_torques_index} is too small for sample rate. Considering increasing.")
+                    self.logger.warning("max torque index %d is too small for sample rate. Considering increasing.", self.self.max_raw_torques_index)
                     raw_torque_index += 1
+            telemetry.finish(time.time() - start_time, self.self.serial.bytes_read - bytes_read,
+                             self.self.serial.bytes_waiting(), self.self.phidget.callback_count - callbacks)
+            return index, raw_torque_index, bridge_index, first_dist
+
+        def read_acquisition_process(self) -> tuple:
+            """Collects a pull from the acquisition process until boot moves too far away
+
+            The child process timestamps every sample as it polls the devices,
+            so this thread only has to keep up with the ring, not with the
+            sensors. Same stopping rules and outputs as poll_devices.
+
+            Returns:
+                int, int, int, int: frames, polled ratios and bridge samples
+                    collected, and the distance of the first frame
+            """
+            acquisition = self.self.acquisition
+            index = raw_torque_index = bridge_index = 0
+            dist_counter = 0  # force function end after 20 instances of boot gone
+            first_dist = False
+            current_torque = 0.0  # most recent bridge sample, paired with each frame
+            telemetry = self.telemetry = CaptureTelemetry("process")
+            start_time = time.time()
+            acquisition.start_capture()
             
-            self.result.emit((self.distances[:index], self.boot_torques[:index], self.torque_times[:index], self.raw_torques[:raw_torque_index], self.raw_torque_times[:raw_torque_index]))
-            self.finished.emit()
+            while (index < self.self.max_index) and dist_counter < 20 and (time.time() - start_time) < 12 and not self.release.complete:
+                self.msleep(2)
+                for kind, sample_time, value in acquisition.read().tolist():
+                    sample_time -= start_time
+                    if kind == BRIDGE:
+                        current_torque = value
+                        telemetry.bridge.add(sample_time)
+                        if bridge_index < self.self.max_bridge_index:
+                            self.bridge_torques[bridge_index] = value
+                            self.bridge_times[bridge_index] = sample_time
+                            self.record(BRIDGE, sample_time, value)
+                            self.track_peak(bridge_index)
+                            bridge_index += 1
+                        else:
+                            telemetry.bridge_overflow += 1
+                    elif kind == RAW:
+                        telemetry.raw_samples += 1
+                        if raw_torque_index < self.self.max_raw_torques_index:
+                            self.raw_torques[raw_torque_index] = value
+                            self.raw_torque_times[raw_torque_index] = sample_time
+                            self.journal.append(RAW, sample_time, value)  # not streamed. Repeats the bridge samples at the loop's rate
+                            raw_torque_index += 1
+                        else:
+                            telemetry.raw_overflow += 1
+                    elif kind == CROSS_FRAME:
+                        self.store_cross_frame(sample_time, int(value))
+                    elif index < self.self.max_index:
+                        if not first_dist:
+                            first_dist = int(value)
+                        self.boot_torques[index] = current_torque
+                        self.distances[index] = value
+                        self.torque_times[index] = sample_time
+                        telemetry.frames.add(sample_time)
+                        self.record(FRAME, sample_time, value - first_dist)
+                        self.speed_tracker.update(sample_time, value - first_dist)
+                        index += 1
+                        if (value - first_dist) > self.self.numb_mm_to_measure + 1:
+                            dist_counter += 1
+                
+                # distance is constrained by byte of range
+                if first_dist > 240:
+                    self.logger.warning("The Boot is too far away from the sensor. 240mm is the maximum distance.")
+                    index = raw_torque_index = bridge_index = 0  # discard everything collected
+                    break
+            
+            acquisition.stop_capture()
+            counters = acquisition.capture_counters()
+            if counters is not None:
+                telemetry.finish(counters['duration'], counters['bytes_read'], counters['bytes_waiting'],
+                                 counters['callbacks'], counters['loops'])
+            else:
+                telemetry.finish(time.time() - start_time, 0, 0, 0)
+            return index, raw_torque_index, bridge_index, first_dist
 
     def on_option_change(self):
         """Changes the state of the Arduino based on the selected option
@@ -475,23 +972,36 @@ class AlpenFlowApp(QMainWindow):
             self.serial.set_mz_state()
             self.testing_My = False
             self.combo_box.setStyleSheet(self.original_style)
-            self.logger.info(f"Option changed to {self.combo_box.currentText()}")
+            self.logger.info("Option changed to %s", self.combo_box.currentText())
 
         if "My" in self.combo_box.currentText():
             self.serial.set_my_state()
             self.testing_My = True
             self.combo_box.setStyleSheet(self.original_style)
-            self.logger.info(f"Option changed to {self.combo_box.currentText()}")
+            self.logger.info("Option changed to %s", self.combo_box.currentText())
             
         
+    def on_dual_stream_change(self, dual: bool) -> None:
+        """Switches the arduino between streaming the tested axis' sensor and both sensors"""
+        if self.serial is None:
+            return
+        self.serial.set_dual_state(dual)
+        self.logger.info("Streaming %s", "both distance sensors" if dual else "the tested axis' distance sensor")
+
     def save_data(self):
         """Saves the dist/force data in memory to two csvs. Processed and raw"""
+        if self.capture is None:
+            self.logger.error("No data has been collected yet")
+            return
+        if not self.can_save():
+            return  # the pull isn't processed yet, or it couldn't be
         f_name = self.csv_name_input.text() + ".csv"
         f_name_raw_torque_div_BSL = self.csv_name_input.text() + "_raw_torque_div_bsl.csv"
         f_graphed_name = self.csv_name_input.text() + "_graphed" + ".csv"
         csv_fname = os.path.join(self.log_dir, f_name)
         csv_fname_raw = os.path.join(self.log_dir, f_name_raw_torque_div_BSL)
         csv_graphed_name = os.path.join(self.log_dir, f_graphed_name)
+        csv_cross_name = os.path.join(self.log_dir, self.csv_name_input.text() + CROSS_SUFFIX)
 
         # Check if log exists and should therefore be rolled
         file_exits = os.path.isfile(csv_fname)
@@ -504,43 +1014,133 @@ class AlpenFlowApp(QMainWindow):
             QTimer.singleShot(1500, self.revert_color)
             return
         else:
-            # Stack the arrays column-wise
-            data = np.column_stack((self.distances, self.boot_torques_div_BSL))
-            raw_bsl_data = np.column_stack((self.raw_torque_times, self.raw_torques_div_BSL))
-            graphed_data = np.column_stack((self.aggregate_dist, self.aggregate_boot_torques_div_BSL))
-
-            # Save to CSV
-            np.savetxt(csv_fname, data, delimiter=',', header='Distance[mm],Torque_div_BSL[N]', fmt='%.4f')
-            np.savetxt(csv_fname_raw, raw_bsl_data, delimiter=',', header='Time[s],Torque_div_BSL[N]', fmt='%.4f')
-            np.savetxt(csv_graphed_name, graphed_data, delimiter=',', header='Distance[mm],Torque_div_BSL[N]', fmt='%.4f')
-            
-            self.logger.info("Saved data to:\n\t" + csv_fname + f"\n\t{csv_fname_raw}" + "\n\t" + csv_graphed_name)
-            
-            # Change the button color
-            self.save_data_button.setStyleSheet("background-color: green")
-            self.save_data_button.setText("Saved!")
+            # the journal already holds every sample so saving it is just a link
+            if self.journal is not None:
+                journal_name = os.path.join(self.log_dir, self.csv_name_input.text() + JOURNAL_SUFFIX)
+                try:
+                    self.journal.path = commit_journal(self.journal.path, journal_name, self.journal_dir)
+                except OSError as e:
+                    self.export_failed(f"could not save the journal as {journal_name}: {e}")
+                    return
+            # hand the arrays to the export thread. It writes temp files and renames them into place
+            files = [
+                (csv_fname, (self.capture.distances, self.capture.torques_div_BSL), 'Distance[mm],Torque_div_BSL[N]'),
+                (csv_fname_raw, (self.capture.raw_times, self.capture.raw_torques_div_BSL), 'Time[s],Torque_div_BSL[N]'),
+                (csv_graphed_name, self.capture.aggregated, 'Distance[mm],Torque_div_BSL[N]'),
+            ]
+            if len(self.capture.cross_frame_times) > 0:
+                cross_axis = 'Mz' if self.capture.testing_My else 'My'
+                files.append((csv_cross_name, (self.capture.cross_frame_times, self.capture.cross_displacements),
+                              f'Time[s],Displacement_{cross_axis}[mm]'))
+            curve_dist, curve_values = self.capture.aggregated
+            catalog_entry = dict(self.capture.summary(), path=csv_fname, name=self.csv_name_input.text(),
+                                 curve_dist=curve_dist, curve_values=curve_values, telemetry=self.capture.telemetry)
+            timings = self.profiler.snapshot()  # of this pull. Another may have started by the time the export is written
+            self.export_writer.submit(files, functools.partial(self.record_saved_run, catalog_entry, timings))
+            self.save_data_button.setEnabled(False)
+            self.save_data_button.setText("Saving...")
 
-            # Set a timer to revert the color after 2 seconds (2000 milliseconds)
-            QTimer.singleShot(1500, self.revert_color)
-            
+    def record_saved_run(self, catalog_entry: dict, timings: dict, paths: list) -> None:
+        """Indexes a saved run and writes its side files. Runs on the export thread
+
+        Args:
+            catalog_entry (dict): summary of the run as stored in the catalog and curve store
+            timings (dict): profiler snapshot of the run when it was saved. None if profiling is off
+            paths (list): csvs that were written
+        """
+        timing_reports = self.profiler.write_report(timings, paths[0])
+        if len(timing_reports) > 0:
+            self.logger.info("Stage timings written to %s", ", ".join(timing_reports))
+        if catalog_entry['telemetry'] is not None:
+            self.logger.info("Acquisition telemetry written to %s", save_telemetry(catalog_entry['telemetry'], paths[0]))
+        catalog_entry['saved_at'] = datetime.now().isoformat(timespec="seconds")
+        self.catalog.record_run(catalog_entry)
+        self.curve_store.append_run(catalog_entry)
+
+    def export_saved(self, paths: list) -> None:
+        """Callback from the export thread once a run's csvs are on disk
+
+        Args:
+            paths (list): files that were written
+        """
+        self.logger.info("Saved data to:\n\t%s", "\n\t".join(paths))
         self.saved_the_data = True
+        
+        # Change the button color
+        self.save_data_button.setStyleSheet("background-color: green")
+        self.save_data_button.setText("Saved!")
+
+        # Set a timer to revert the color after 2 seconds (2000 milliseconds)
+        QTimer.singleShot(1500, self.revert_color)
+
+    def export_failed(self, error: str) -> None:
+        """Callback from the export thread when a run's csvs couldn't be written
+
+        Args:
+            error (str): description of the failure
+        """
+        self.logger.error("Could not save data: " + error)
+        self.save_data_button.setStyleSheet("background-color: red")
+        self.save_data_button.setText("Error!")
+        QTimer.singleShot(1500, self.revert_color)
 
     def revert_color(self):
         """Revert the button color to the original style"""
+        self.save_data_button.setEnabled(self.can_save())
         self.save_data_button.setStyleSheet(self.original_style)
         self.save_data_button.setText("Save Data")
         self.csv_name_input.setText(f"Din_data_{self.bsl_input_box.text()}_My_{self.testing_My}" + datetime.now().strftime("%Y%m%d_%H%M"))
+
+    def closeEvent(self, event) -> None:
+        """Lets queued exports finish writing before the app exits"""
+        self.processor_pool.waitForDone()
+        self.export_writer.stop()
+        self.catalog.close()
+        if self.acquisition is not None:
+            self.acquisition.close()
+        if self.publisher is not None:
+            self.publisher.close()
+        super().closeEvent(event)
+
+
+class BenchTabs(QMainWindow):
+
+    def __init__(self, benches: list):
+        """One window driving several benches at once, a tab per bench
+
+        Each tab is a full AlpenFlowApp with its own devices, capture worker,
+        processing and export threads and data folder, so a pull on one bench
+        never waits on another.
+
+        Args:
+            benches (list): Bench of each bench to drive
+        """
+        super().__init__()
+        self.setWindowTitle("AlpenFlow Din Measurement App")
+        self.setGeometry(100, 100, 1500, 800)
+        self.tabs = QTabWidget()
+        self.bench_apps = []
+        for bench in benches:
+            bench_app = AlpenFlowApp(bench)
+            self.bench_apps.append(bench_app)
+            self.tabs.addTab(bench_app, bench.name)
+        self.setCentralWidget(self.tabs)
+
+    def closeEvent(self, event) -> None:
+        """Closes every bench so each finishes its exports and releases its devices"""
+        for bench_app in self.bench_apps:
+            bench_app.close()
+        super().closeEvent(event)
         
 # entry point of application
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     
-    if darkmode:
-        file = QFile(":/dark/stylesheet.qss")
-        file.open(QFile.ReadOnly | QFile.Text)
-        stream = QTextStream(file)
-        app.setStyleSheet(stream.readAll())
+    dark_stylesheet = load_dark_stylesheet()
+    if dark_stylesheet is not None:
+        app.setStyleSheet(dark_stylesheet)
         
-    mainWin = AlpenFlowApp()
+    benches = load_benches()
+    mainWin = AlpenFlowApp(benches[0]) if len(benches) == 1 else BenchTabs(benches)
     mainWin.show()
     sys.exit(app.exec_())
\ No newline at end of file
@@ -1,9 +1,10 @@
 from typing import Tuple
 from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QComboBox, QLineEdit, QCheckBox, QTableWidget, QTableWidgetItem, QAbstractScrollArea 
 from PyQt5.QtGui import QIntValidator
-from PyQt5.QtCore import QThread, pyqtSignal, QTimer, QFile, QTextStream
+from PyQt5.QtCore import QThread, pyqtSignal, QTimer
 import sys
 from src.PhidgetHandler import PhidgetHandler
+from src.DarkTheme import load_dark_stylesheet
 import numpy as np
 from datetime import datetime
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
@@ -11,14 +12,7 @@ import matplotlib.pyplot as plt
 import os
 import logging
 import time
-from src.ISO_11088 import ISO11088
-from src.ISO_13992 import ISO13992
-try:
-    import breeze_resources
-    darkmode = True
-except:
-    print("Will not be using the darkmode rendering")
-    darkmode = False
+from src.StandardsRegistry import STANDARDS
 
 
 class AlpenFlowApp(QMainWindow):
@@ -45,8 +39,8 @@ class AlpenFlowApp(QMainWindow):
             os.makedirs(self.log_dir)
         
         # import Steven's ISO DIN standard converters
-        self.iso13 = ISO13992()
-        self.iso11 = ISO11088()
+        self.iso13 = STANDARDS.model("iso13992")
+        self.iso11 = STANDARDS.model("iso11088")
         self.timeout = 5  # time in seconds for the tof sensor to timeout
 
         self.phidget = PhidgetHandler()  # TODO UNCOMMNET THIS
@@ -380,11 +374,9 @@ class AlpenFlowApp(QMainWindow):
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     
-    if darkmode:
-        file = QFile(":/dark/stylesheet.qss")
-        file.open(QFile.ReadOnly | QFile.Text)
-        stream = QTextStream(file)
-        app.setStyleSheet(stream.readAll())
+    dark_stylesheet = load_dark_stylesheet()
+    if dark_stylesheet is not None:
+        app.setStyleSheet(dark_stylesheet)
         
     mainWin = AlpenFlowApp()
     mainWin.show()
@@ -10,57 +10,74 @@
 
 #define DEV_I2C Wire
 
-// Components.
-VL53L4CD dist_sensor(&DEV_I2C, A1);
+// Components. Both sensors share the bus, so each gets its own address at boot
 int My_Pin = 8;
 int Mz_Pin = 7;
 int LED_PIN = 13;
+VL53L4CD sensors[2] = {VL53L4CD(&DEV_I2C, My_Pin), VL53L4CD(&DEV_I2C, Mz_Pin)};
+const uint8_t sensor_addresses[2] = {0x54, 0x56};  // the default 0x52 is left free
+const int MY = 0;
+const int MZ = 1;
+
+// Dual stream frames are FRAME_SYNC, the sensor's tag (MY or MZ) and its distance.
+// Distances are capped at 254 so FRAME_SYNC never appears in them
+const byte FRAME_SYNC = 0xFF;
 
 bool testing_my = false;
+bool dual_stream = false;  // stream both sensors as tagged frames
 
 const int numb_samples = 2;
-int samples[numb_samples] = {0, 0};
-volatile int indexer = 0;
+int samples[2][numb_samples] = {{0, 0}, {0, 0}};
+int indexer[2] = {0, 0};
 
-byte average() {
+byte average(int sensor) {
   int res=0;
   for (int i=0; i<numb_samples; i++) {
-    res += samples[i];
+    res += samples[sensor][i];
   }
   return res/numb_samples;
 }
 
 /* Setup ---------------------------------------------------------------------*/
+void InitSensors() {
+  /* Powers the sensors up one at a time and moves each to its own I2C address
+   *  so both can range at once. Only called at boot
+   */
+  digitalWrite(My_Pin, LOW);
+  digitalWrite(Mz_Pin, LOW);
+  delay(10);
+
+  for (int sensor = MY; sensor <= MZ; sensor++) {
+    // Configure VL53L4CD satellite component and power it up through its xShut pin
+    sensors[sensor].begin();
+    sensors[sensor].VL53L4CD_On();
+    delay(10);  // Allow sensor to power up
+    sensors[sensor].InitSensor(sensor_addresses[sensor]);
+
+    // Program the highest possible TimingBudget, without enabling the
+    // low power mode. This should give the best accuracy
+    sensors[sensor].VL53L4CD_SetRangeTiming(10, 0);
+  }
+}
+
 void SetupMy(bool My) {
-  /* Function to use xShut pin to decide which dist sensor to use
+  /* Function to decide which dist sensor to stream. Both are already
+   *  initialized, so this only starts and stops ranging
    *  input:
    *    My (bool): True if you're setting up My. False if setting up Mz
    */
+  testing_my = My;
+  dual_stream = false;
+  sensors[My ? MZ : MY].VL53L4CD_StopRanging();
+  sensors[My ? MY : MZ].VL53L4CD_StartRanging();
+}
 
-  if (My) {
-    digitalWrite(My_Pin, HIGH);
-    digitalWrite(Mz_Pin, LOW);
-    testing_my = true;
+void SetupDual() {
+  /* Ranges with both sensors. Their readings are sent as tagged frames */
+  if (!dual_stream) {
+    sensors[testing_my ? MZ : MY].VL53L4CD_StartRanging();
   }
-  else {
-    digitalWrite(My_Pin, LOW);
-    digitalWrite(Mz_Pin, HIGH);
-    testing_my = false;
-  }
-  delay(10);  // Allow sensor to power up
-  
-  // Configure VL53L4CD satellite component.
-  dist_sensor.begin();
-
-  // Program the highest possible TimingBudget, without enabling the
-  // low power mode. This should give the best accuracy
-  dist_sensor.VL53L4CD_SetRangeTiming(10, 0);
-
-  // Start Measurements
-  dist_sensor.InitSensor();
-
-  dist_sensor.VL53L4CD_StartRanging();
-
+  dual_stream = true;
 }
 
 void set_sensor_state() {
@@ -71,7 +88,13 @@ void set_sensor_state() {
   if (Serial.available() > 0) { // Check if there is data in the serial buffer
     int input = Serial.parseInt(); // Read the integer from the serial buffer
     
-    if ((input == 1) and !(testing_my)) {
+    if ((input == 1 or input == 2) and dual_stream) {
+      // back to streaming one sensor
+      Serial.println(input == 1 ? "my" : "mz");
+      SetupMy(input == 1);
+      digitalWrite(LED_PIN, input == 1 ? HIGH : LOW);
+    }
+    else if ((input == 1) and !(testing_my)) {
       delay(5);
       Serial.println("my");  
       SetupMy(true);
@@ -91,6 +114,13 @@ void set_sensor_state() {
     else if (input == 3) {
       Serial.println("AlpenFlow");
     }
+    else if ((input == 4) and !dual_stream) {
+      Serial.println("dual");
+      SetupDual();
+    }
+    else if (input == 4) {
+      Serial.println("laud");  // confirmation that we are already streaming both
+    }
   }
 }
 
@@ -106,6 +136,7 @@ void setup()
 
   // Initialize I2C bus.
   DEV_I2C.begin();
+  InitSensors();
 
   // Default to the My axis test
   SetupMy(true);
@@ -115,43 +146,64 @@ void setup()
   unsigned long StartTime = millis();
 }
 
-void loop()
-{
+bool read_sensor(int sensor) {
+  /* Takes a finished measurement of a sensor into its running average
+   *  input:
+   *    sensor (int): MY or MZ
+   *  returns:
+   *    bool: True if a new measurement was ready
+   */
   uint8_t NewDataReady = 0;
   VL53L4CD_Result_t results;
   uint8_t status;
-  char report[64];
   byte measurement;
-  
+
+  status = sensors[sensor].VL53L4CD_CheckForDataReady(&NewDataReady);
+  if ((status) || (NewDataReady == 0)) {
+    return false;
+  }
+  // (Mandatory) Clear HW interrupt to restart measurements
+  sensors[sensor].VL53L4CD_ClearInterrupt();
+
+  // Read measured distance. RangeStatus = 0 means valid data
+  sensors[sensor].VL53L4CD_GetResult(&results);
+  if (results.distance_mm > 254) {
+    measurement = 254;  // 255 is FRAME_SYNC
+  }
+  else {
+    measurement = results.distance_mm;
+  }
+  if (measurement == 0) {
+    // handle bad measurement (0) with last measurement
+    measurement = samples[sensor][indexer[sensor]];
+  }
+  samples[sensor][indexer[sensor]] = measurement;
+  indexer[sensor] += 1;
+  if (indexer[sensor] == numb_samples) {
+    indexer[sensor] = 0;
+  }
+  return true;
+}
+
+void loop()
+{
   // Check Serial input to see if user requests changing test axis
   set_sensor_state();
-  
-  // Wait for sensor to make measurement
-  do {
-    status = dist_sensor.VL53L4CD_CheckForDataReady(&NewDataReady);
-  } while (!NewDataReady);
-
-  if ((!status) && (NewDataReady != 0)) {
-    // (Mandatory) Clear HW interrupt to restart measurements
-    dist_sensor.VL53L4CD_ClearInterrupt();
-
-    // Read measured distance. RangeStatus = 0 means valid data
-    dist_sensor.VL53L4CD_GetResult(&results);
-    if (results.distance_mm > 255) {
-      measurement = 254;
-    }
-    else {
-      measurement = results.distance_mm;
-    }
-    if (measurement == 0) {
-      // handle bad measurement (0) with last measurement
-      measurement = samples[indexer];
-    }
-    samples[indexer] = measurement;
-    indexer += 1;
-    if (indexer == numb_samples) {
-      indexer = 0;
+
+  if (dual_stream) {
+    // poll both sensors and send whichever finished, tagged with its axis
+    for (int sensor = MY; sensor <= MZ; sensor++) {
+      if (read_sensor(sensor)) {
+        byte frame[3] = {FRAME_SYNC, (byte)sensor, average(sensor)};
+        Serial.write(frame, 3);
+      }
     }
-    Serial.write(average());
+    return;
+  }
+
+  // Wait for sensor to make measurement
+  int sensor = testing_my ? MY : MZ;
+  while (!read_sensor(sensor)) {
   }
+  Serial.write(average(sensor));
 }
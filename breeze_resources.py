@@ -1,7224 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x02\x0e\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\
-\x39\x32\x2c\x30\x2e\x39\x31\x37\x36\x39\x37\x31\x38\x20\x34\x2e\
-\x35\x2c\x34\x2e\x32\x32\x38\x30\x31\x38\x32\x20\x37\x2e\x38\x31\
-\x30\x35\x34\x30\x38\x2c\x30\x2e\x39\x31\x36\x32\x37\x36\x34\x38\
-\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\
-\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\
-\x31\x37\x34\x39\x2c\x30\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\
-\x2c\x30\x2e\x31\x35\x37\x37\x30\x32\x30\x32\x20\x30\x2e\x31\x35\
-\x37\x37\x31\x32\x34\x2c\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x32\
-\x20\x30\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x32\x20\x6c\x20\
-\x2d\x33\x2e\x35\x39\x36\x31\x32\x38\x33\x2c\x33\x2e\x35\x39\x37\
-\x33\x31\x30\x32\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\
-\x30\x31\x39\x20\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\
-\x2e\x31\x35\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x38\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\
-\x33\x2c\x31\x2e\x34\x38\x37\x34\x31\x33\x34\x20\x63\x20\x2d\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x20\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\
-\x2e\x34\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\x2e\x35\x37\
-\x31\x31\x33\x36\x39\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\
-\x2c\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x31\x20\x30\x2e\x34\
-\x31\x33\x34\x36\x32\x34\x2c\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\
-\x33\x31\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x2c\x30\x2e\x30\
-\x30\x31\x34\x32\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\
-\x61\x62\x39\x62\x38\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\
-\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\
-\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x11\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x35\x2e\x30\x38\x32\x33\x30\
-\x32\x38\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x2d\x33\x2e\
-\x33\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\
-\x20\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\
-\x35\x34\x30\x38\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\
-\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x2d\x30\x2e\
-\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x33\x20\x2d\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\
-\x20\x2d\x33\x2e\x35\x39\x37\x33\x31\x30\x31\x37\x2c\x2d\x33\x2e\
-\x35\x39\x36\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\
-\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x31\x2c\x2d\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x31\x39\x31\x2c\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\
-\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\x38\x20\x4c\x20\x34\
-\x2e\x35\x31\x32\x35\x38\x36\x36\x2c\x30\x2e\x36\x31\x38\x32\x38\
-\x34\x33\x37\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x34\x31\x33\x34\
-\x33\x34\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x30\
-\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x30\x2e\x31\x35\x36\
-\x32\x38\x31\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x30\
-\x2e\x31\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\
-\x32\x34\x33\x20\x2d\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\
-\x37\x31\x31\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x62\x61\x62\x39\x62\x38\x22\x20\x66\x69\x6c\x6c\x2d\x6f\
-\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\
-\x00\x00\x00\xb2\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\
-\x33\x62\x22\x20\x64\x3d\x22\x4d\x31\x39\x2c\x36\x2e\x34\x31\x4c\
-\x31\x37\x2e\x35\x39\x2c\x35\x4c\x31\x32\x2c\x31\x30\x2e\x35\x39\
-\x4c\x36\x2e\x34\x31\x2c\x35\x4c\x35\x2c\x36\x2e\x34\x31\x4c\x31\
-\x30\x2e\x35\x39\x2c\x31\x32\x4c\x35\x2c\x31\x37\x2e\x35\x39\x4c\
-\x36\x2e\x34\x31\x2c\x31\x39\x4c\x31\x32\x2c\x31\x33\x2e\x34\x31\
-\x4c\x31\x37\x2e\x35\x39\x2c\x31\x39\x4c\x31\x39\x2c\x31\x37\x2e\
-\x35\x39\x4c\x31\x33\x2e\x34\x31\x2c\x31\x32\x4c\x31\x39\x2c\x36\
-\x2e\x34\x31\x5a\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\
-\x0a\
-\x00\x00\x02\xa1\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\
-\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\
-\x31\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x67\
-\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\
-\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\
-\x64\x64\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\
-\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x2d\x34\x32\x32\x2e\x30\x30\
-\x30\x30\x30\x30\x2c\x20\x2d\x32\x35\x34\x2e\x30\x30\x30\x30\x30\
-\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\
-\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\
-\x61\x74\x65\x28\x34\x32\x32\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\
-\x32\x35\x34\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0d\x0a\x20\
-\x20\x20\x20\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
-\x4d\x31\x30\x2c\x30\x20\x43\x34\x2e\x35\x2c\x30\x20\x30\x2c\x34\
-\x2e\x35\x20\x30\x2c\x31\x30\x20\x43\x30\x2c\x31\x35\x2e\x35\x20\
-\x34\x2e\x35\x2c\x32\x30\x20\x31\x30\x2c\x32\x30\x20\x43\x31\x35\
-\x2e\x35\x2c\x32\x30\x20\x32\x30\x2c\x31\x35\x2e\x35\x20\x32\x30\
-\x2c\x31\x30\x20\x43\x32\x30\x2c\x34\x2e\x35\x20\x31\x35\x2e\x35\
-\x2c\x30\x20\x31\x30\x2c\x30\x20\x4c\x31\x30\x2c\x30\x20\x5a\x20\
-\x4d\x31\x31\x2c\x31\x37\x20\x4c\x39\x2c\x31\x37\x20\x4c\x39\x2c\
-\x31\x35\x20\x4c\x31\x31\x2c\x31\x35\x20\x4c\x31\x31\x2c\x31\x37\
-\x20\x4c\x31\x31\x2c\x31\x37\x20\x5a\x20\x4d\x31\x33\x2e\x31\x2c\
-\x39\x2e\x33\x20\x4c\x31\x32\x2e\x32\x2c\x31\x30\x2e\x32\x20\x43\
-\x31\x31\x2e\x34\x2c\x31\x30\x2e\x39\x20\x31\x31\x2c\x31\x31\x2e\
-\x35\x20\x31\x31\x2c\x31\x33\x20\x4c\x39\x2c\x31\x33\x20\x4c\x39\
-\x2c\x31\x32\x2e\x35\x20\x43\x39\x2c\x31\x31\x2e\x34\x20\x39\x2e\
-\x34\x2c\x31\x30\x2e\x34\x20\x31\x30\x2e\x32\x2c\x39\x2e\x37\x20\
-\x4c\x31\x31\x2e\x34\x2c\x38\x2e\x34\x20\x43\x31\x31\x2e\x38\x2c\
-\x38\x2e\x31\x20\x31\x32\x2c\x37\x2e\x36\x20\x31\x32\x2c\x37\x20\
-\x43\x31\x32\x2c\x35\x2e\x39\x20\x31\x31\x2e\x31\x2c\x35\x20\x31\
-\x30\x2c\x35\x20\x43\x38\x2e\x39\x2c\x35\x20\x38\x2c\x35\x2e\x39\
-\x20\x38\x2c\x37\x20\x4c\x36\x2c\x37\x20\x43\x36\x2c\x34\x2e\x38\
-\x20\x37\x2e\x38\x2c\x33\x20\x31\x30\x2c\x33\x20\x43\x31\x32\x2e\
-\x32\x2c\x33\x20\x31\x34\x2c\x34\x2e\x38\x20\x31\x34\x2c\x37\x20\
-\x43\x31\x34\x2c\x37\x2e\x39\x20\x31\x33\x2e\x36\x2c\x38\x2e\x37\
-\x20\x31\x33\x2e\x31\x2c\x39\x2e\x33\x20\x4c\x31\x33\x2e\x31\x2c\
-\x39\x2e\x33\x20\x5a\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\
-\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\
-\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\
-\x00\x00\x03\xe3\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\
-\x61\x74\x72\x69\x78\x28\x30\x2e\x36\x32\x31\x36\x34\x32\x38\x34\
-\x2c\x30\x2c\x30\x2c\x30\x2e\x36\x32\x33\x35\x37\x31\x31\x2c\x2d\
-\x30\x2e\x36\x33\x35\x33\x30\x34\x33\x34\x2c\x33\x2e\x36\x38\x31\
-\x36\x33\x31\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\
-\x65\x6e\x6f\x64\x64\x22\x20\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\
-\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\x64\x3d\x22\x4d\x20\
-\x37\x39\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\x30\x20\x41\x20\x37\
-\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x31\x30\x2c\x38\x30\
-\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x38\x30\x2c\
-\x31\x35\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\
-\x31\x35\x30\x2c\x38\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\
-\x20\x30\x20\x38\x30\x2c\x31\x30\x20\x37\x30\x2c\x37\x30\x20\x30\
-\x20\x30\x20\x30\x20\x37\x39\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\
-\x30\x20\x5a\x20\x6d\x20\x33\x31\x2e\x31\x33\x36\x37\x31\x35\x2c\
-\x32\x38\x2e\x35\x20\x63\x20\x33\x2e\x31\x38\x36\x33\x32\x2c\x2d\
-\x30\x2e\x30\x30\x38\x37\x20\x36\x2e\x33\x37\x36\x33\x36\x2c\x31\
-\x2e\x32\x31\x31\x32\x30\x36\x20\x38\x2e\x38\x31\x34\x34\x36\x2c\
-\x33\x2e\x36\x36\x30\x31\x35\x36\x20\x34\x2e\x38\x37\x32\x37\x2c\
-\x34\x2e\x38\x39\x36\x35\x20\x34\x2e\x38\x39\x32\x39\x37\x2c\x31\
-\x32\x2e\x38\x35\x37\x37\x34\x34\x20\x30\x2e\x30\x34\x36\x39\x2c\
-\x31\x37\x2e\x37\x37\x37\x33\x34\x34\x20\x4c\x20\x39\x38\x2e\x35\
-\x31\x39\x35\x33\x31\x2c\x38\x31\x2e\x35\x31\x35\x36\x32\x35\x20\
-\x31\x31\x39\x2e\x38\x31\x38\x33\x36\x2c\x31\x30\x33\x2e\x31\x31\
-\x35\x32\x33\x20\x63\x20\x34\x2e\x38\x30\x36\x32\x2c\x34\x2e\x38\
-\x38\x34\x36\x20\x34\x2e\x37\x34\x30\x32\x32\x2c\x31\x32\x2e\x37\
-\x39\x34\x39\x38\x20\x2d\x30\x2e\x31\x34\x36\x34\x38\x2c\x31\x37\
-\x2e\x36\x37\x31\x38\x38\x20\x2d\x34\x2e\x38\x38\x38\x31\x2c\x34\
-\x2e\x38\x37\x34\x38\x20\x2d\x31\x32\x2e\x37\x34\x35\x39\x39\x2c\
-\x34\x2e\x38\x36\x32\x34\x31\x20\x2d\x31\x37\x2e\x35\x35\x30\x37\
-\x39\x2c\x2d\x30\x2e\x30\x32\x31\x35\x20\x4c\x20\x38\x30\x2e\x39\
-\x36\x38\x37\x35\x2c\x39\x39\x2e\x33\x31\x36\x34\x30\x36\x20\x35\
-\x39\x2e\x37\x37\x37\x33\x34\x34\x2c\x31\x32\x30\x2e\x38\x30\x36\
-\x36\x34\x20\x63\x20\x2d\x34\x2e\x38\x34\x38\x39\x2c\x34\x2e\x39\
-\x32\x33\x38\x20\x2d\x31\x32\x2e\x37\x33\x33\x31\x37\x35\x2c\x34\
-\x2e\x39\x34\x34\x37\x38\x20\x2d\x31\x37\x2e\x36\x30\x39\x33\x37\
-\x35\x2c\x30\x2e\x30\x34\x36\x39\x20\x2d\x34\x2e\x38\x37\x32\x37\
-\x2c\x2d\x34\x2e\x38\x39\x36\x35\x20\x2d\x34\x2e\x38\x39\x33\x36\
-\x37\x35\x2c\x2d\x31\x32\x2e\x38\x35\x37\x37\x35\x20\x2d\x30\x2e\
-\x30\x34\x36\x38\x37\x2c\x2d\x31\x37\x2e\x37\x37\x37\x33\x35\x20\
-\x4c\x20\x36\x33\x2e\x33\x39\x36\x34\x38\x34\x2c\x38\x31\x2e\x34\
-\x39\x36\x30\x39\x34\x20\x34\x32\x2e\x30\x39\x39\x36\x30\x39\x2c\
-\x35\x39\x2e\x38\x39\x38\x34\x33\x38\x20\x63\x20\x2d\x34\x2e\x38\
-\x30\x36\x39\x2c\x2d\x34\x2e\x38\x38\x34\x36\x20\x2d\x34\x2e\x37\
-\x34\x32\x31\x36\x38\x2c\x2d\x31\x32\x2e\x37\x39\x36\x39\x32\x39\
-\x20\x30\x2e\x31\x34\x34\x35\x33\x32\x2c\x2d\x31\x37\x2e\x36\x37\
-\x33\x38\x32\x39\x20\x34\x2e\x38\x38\x38\x31\x2c\x2d\x34\x2e\x38\
-\x37\x34\x31\x20\x31\x32\x2e\x37\x34\x37\x39\x33\x34\x2c\x2d\x34\
-\x2e\x38\x36\x32\x34\x31\x35\x20\x31\x37\x2e\x35\x35\x32\x37\x33\
-\x34\x2c\x30\x2e\x30\x32\x31\x34\x38\x20\x4c\x20\x38\x30\x2e\x39\
-\x34\x39\x32\x31\x39\x2c\x36\x33\x2e\x36\x39\x37\x32\x36\x36\x20\
-\x31\x30\x32\x2e\x31\x34\x30\x36\x32\x2c\x34\x32\x2e\x32\x30\x37\
-\x30\x33\x31\x20\x63\x20\x32\x2e\x34\x32\x34\x34\x36\x2c\x2d\x32\
-\x2e\x34\x36\x31\x39\x20\x35\x2e\x36\x30\x36\x36\x36\x2c\x2d\x33\
-\x2e\x36\x39\x38\x33\x36\x39\x20\x38\x2e\x37\x39\x32\x39\x37\x2c\
-\x2d\x33\x2e\x37\x30\x37\x30\x33\x31\x20\x7a\x22\x20\x66\x69\x6c\
-\x6c\x3d\x22\x23\x36\x61\x36\x39\x36\x39\x22\x20\x66\x69\x6c\x6c\
-\x2d\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x30\x2e\x37\x22\x2f\x3e\
-\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0d\x0a\
-\x00\x00\x01\x54\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x20\x3e\x0d\x0a\
-\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\
-\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x39\x2c\x30\x2c\x30\x2c\x30\
-\x2e\x39\x2c\x2d\x31\x36\x2e\x35\x33\x32\x32\x37\x36\x2c\x2d\x31\
-\x33\x2e\x39\x39\x38\x36\x35\x38\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x37\x34\x2e\x38\x33\
-\x38\x36\x33\x33\x2c\x32\x36\x2e\x33\x39\x39\x39\x36\x38\x20\x61\
-\x20\x34\x38\x2e\x36\x2c\x34\x38\x2e\x36\x20\x30\x20\x30\x20\x30\
-\x20\x2d\x34\x38\x2e\x34\x33\x38\x36\x33\x33\x2c\x34\x38\x2e\x36\
-\x20\x34\x38\x2e\x36\x2c\x34\x38\x2e\x36\x20\x30\x20\x30\x20\x30\
-\x20\x39\x37\x2e\x32\x2c\x30\x20\x34\x38\x2e\x36\x2c\x34\x38\x2e\
-\x36\x20\x30\x20\x30\x20\x30\x20\x2d\x34\x38\x2e\x37\x36\x31\x33\
-\x36\x37\x2c\x2d\x34\x38\x2e\x36\x20\x7a\x20\x6d\x20\x2d\x30\x2e\
-\x36\x34\x38\x36\x33\x33\x2c\x31\x31\x2e\x33\x34\x20\x33\x36\x2e\
-\x34\x35\x2c\x33\x36\x2e\x34\x35\x20\x4c\x20\x37\x34\x2e\x31\x39\
-\x2c\x31\x31\x30\x2e\x36\x33\x39\x39\x37\x20\x33\x37\x2e\x37\x34\
-\x2c\x37\x34\x2e\x31\x38\x39\x39\x36\x38\x20\x5a\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x32\x64\x39\x33\x63\x38\x22\x20\x66\x69\x6c\
-\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x30\x2e\x35\x22\x20\
-\x2f\x3e\x0d\x0a\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\
-\x3e\x0d\x0a\
-\x00\x00\x00\xcb\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x30\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\
-\x63\x61\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x34\x62\x34\x62\
-\x34\x62\x22\x20\x78\x3d\x22\x33\x36\x22\x20\x77\x69\x64\x74\x68\
-\x3d\x22\x33\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x2e\
-\x37\x35\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x72\x65\x63\x74\
-\x20\x66\x69\x6c\x6c\x3d\x22\x23\x34\x62\x34\x62\x34\x62\x22\x20\
-\x78\x3d\x22\x33\x36\x22\x20\x79\x3d\x22\x32\x39\x2e\x37\x35\x22\
-\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x22\x20\x77\x69\x64\x74\
-\x68\x3d\x22\x34\x35\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\x7c\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x30\x22\
-\x20\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\x33\x35\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x36\x61\x36\x65\x37\x31\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x30\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x2f\
-\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x0e\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\x39\
-\x37\x32\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\x33\
-\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\
-\x2d\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\
-\x35\x34\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\
-\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\x37\
-\x37\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\x2e\
-\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x33\x20\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\
-\x33\x2e\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\x36\
-\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x30\
-\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\
-\x31\x32\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\
-\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\x37\
-\x31\x31\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\x33\
-\x34\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\x2d\
-\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\x37\
-\x31\x32\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\x31\
-\x31\x33\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\
-\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\
-\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\
-\x33\x20\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\
-\x61\x62\x39\x62\x38\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\
-\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\
-\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xcd\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\
-\x33\x62\x22\x20\x64\x3d\x22\x4d\x31\x39\x2c\x32\x30\x48\x34\x43\
-\x32\x2e\x38\x39\x2c\x32\x30\x20\x32\x2c\x31\x39\x2e\x31\x20\x32\
-\x2c\x31\x38\x56\x36\x43\x32\x2c\x34\x2e\x38\x39\x20\x32\x2e\x38\
-\x39\x2c\x34\x20\x34\x2c\x34\x48\x31\x30\x4c\x31\x32\x2c\x36\x48\
-\x31\x39\x41\x32\x2c\x32\x20\x30\x20\x30\x2c\x31\x20\x32\x31\x2c\
-\x38\x48\x32\x31\x4c\x34\x2c\x38\x56\x31\x38\x4c\x36\x2e\x31\x34\
-\x2c\x31\x30\x48\x32\x33\x2e\x32\x31\x4c\x32\x30\x2e\x39\x33\x2c\
-\x31\x38\x2e\x35\x43\x32\x30\x2e\x37\x2c\x31\x39\x2e\x33\x37\x20\
-\x31\x39\x2e\x39\x32\x2c\x32\x30\x20\x31\x39\x2c\x32\x30\x5a\x22\
-\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xa3\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x33\x32\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x61\
-\x62\x39\x62\x38\x22\x20\x78\x3d\x22\x36\x22\x20\x79\x3d\x22\x34\
-\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x22\x20\x68\x65\x69\x67\
-\x68\x74\x3d\x22\x32\x34\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x61\x62\x39\
-\x62\x38\x22\x20\x78\x3d\x22\x31\x34\x22\x20\x79\x3d\x22\x34\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x22\x20\x68\x65\x69\x67\x68\
-\x74\x3d\x22\x32\x34\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0d\x0a\
-\x00\x00\x00\xbe\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\
-\x33\x62\x22\x20\x64\x3d\x22\x4d\x32\x31\x2c\x31\x34\x48\x33\x56\
-\x34\x48\x32\x31\x4d\x32\x31\x2c\x32\x48\x33\x43\x31\x2e\x38\x39\
-\x2c\x32\x20\x31\x2c\x32\x2e\x38\x39\x20\x31\x2c\x34\x56\x31\x36\
-\x41\x32\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x33\x2c\x31\x38\x48\
-\x31\x30\x4c\x38\x2c\x32\x31\x56\x32\x32\x48\x31\x36\x56\x32\x31\
-\x4c\x31\x34\x2c\x31\x38\x48\x32\x31\x41\x32\x2c\x32\x20\x30\x20\
-\x30\x2c\x30\x20\x32\x33\x2c\x31\x36\x56\x34\x43\x32\x33\x2c\x32\
-\x2e\x38\x39\x20\x32\x32\x2e\x31\x2c\x32\x20\x32\x31\x2c\x32\x5a\
-\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xb0\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x30\x22\
-\x20\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\x33\x35\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x36\x61\x36\x65\x37\x31\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x30\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x2f\
-\x3e\x0d\x0a\x20\x20\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\
-\x22\x35\x30\x22\x20\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\
-\x31\x37\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x36\x61\x36\x65\x37\
-\x31\x22\x20\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xef\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\
-\x33\x62\x22\x20\x64\x3d\x22\x4d\x35\x2c\x33\x41\x32\x2c\x32\x20\
-\x30\x20\x30\x2c\x30\x20\x33\x2c\x35\x56\x31\x39\x41\x32\x2c\x32\
-\x20\x30\x20\x30\x2c\x30\x20\x35\x2c\x32\x31\x48\x31\x39\x41\x32\
-\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x32\x31\x2c\x31\x39\x56\x35\
-\x2e\x35\x4c\x31\x38\x2e\x35\x2c\x33\x48\x31\x37\x56\x39\x41\x31\
-\x2c\x31\x20\x30\x20\x30\x2c\x31\x20\x31\x36\x2c\x31\x30\x48\x38\
-\x41\x31\x2c\x31\x20\x30\x20\x30\x2c\x31\x20\x37\x2c\x39\x56\x33\
-\x48\x35\x4d\x31\x32\x2c\x34\x56\x39\x48\x31\x35\x56\x34\x48\x31\
-\x32\x4d\x37\x2c\x31\x32\x48\x31\x37\x41\x31\x2c\x31\x20\x30\x20\
-\x30\x2c\x31\x20\x31\x38\x2c\x31\x33\x56\x31\x39\x48\x36\x56\x31\
-\x33\x41\x31\x2c\x31\x20\x30\x20\x30\x2c\x31\x20\x37\x2c\x31\x32\
-\x5a\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\x1f\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x34\x22\x2f\x3e\x0d\x0a\
-\x00\x00\x01\xe2\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\
-\x33\x62\x22\x20\x64\x3d\x22\x4d\x31\x34\x2c\x32\x48\x36\x41\x32\
-\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x34\x2c\x34\x56\x32\x30\x41\
-\x32\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x36\x2c\x32\x32\x48\x31\
-\x38\x41\x32\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x32\x30\x2c\x32\
-\x30\x56\x38\x4c\x31\x34\x2c\x32\x4d\x31\x38\x2c\x32\x30\x48\x36\
-\x56\x34\x48\x31\x33\x56\x39\x48\x31\x38\x56\x32\x30\x5a\x22\x2f\
-\x3e\x0d\x0a\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\
-\x6d\x3d\x22\x73\x63\x61\x6c\x65\x28\x30\x2e\x35\x29\x20\x74\x72\
-\x61\x6e\x73\x6c\x61\x74\x65\x28\x31\x32\x2c\x20\x32\x30\x29\x22\
-\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\
-\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x64\x3d\x22\x4d\
-\x33\x2e\x39\x2c\x31\x32\x43\x33\x2e\x39\x2c\x31\x30\x2e\x32\x39\
-\x20\x35\x2e\x32\x39\x2c\x38\x2e\x39\x20\x37\x2c\x38\x2e\x39\x48\
-\x31\x31\x56\x37\x48\x37\x41\x35\x2c\x35\x20\x30\x20\x30\x2c\x30\
-\x20\x32\x2c\x31\x32\x41\x35\x2c\x35\x20\x30\x20\x30\x2c\x30\x20\
-\x37\x2c\x31\x37\x48\x31\x31\x56\x31\x35\x2e\x31\x48\x37\x43\x35\
-\x2e\x32\x39\x2c\x31\x35\x2e\x31\x20\x33\x2e\x39\x2c\x31\x33\x2e\
-\x37\x31\x20\x33\x2e\x39\x2c\x31\x32\x4d\x38\x2c\x31\x33\x48\x31\
-\x36\x56\x31\x31\x48\x38\x56\x31\x33\x4d\x31\x37\x2c\x37\x48\x31\
-\x33\x56\x38\x2e\x39\x48\x31\x37\x43\x31\x38\x2e\x37\x31\x2c\x38\
-\x2e\x39\x20\x32\x30\x2e\x31\x2c\x31\x30\x2e\x32\x39\x20\x32\x30\
-\x2e\x31\x2c\x31\x32\x43\x32\x30\x2e\x31\x2c\x31\x33\x2e\x37\x31\
-\x20\x31\x38\x2e\x37\x31\x2c\x31\x35\x2e\x31\x20\x31\x37\x2c\x31\
-\x35\x2e\x31\x48\x31\x33\x56\x31\x37\x48\x31\x37\x41\x35\x2c\x35\
-\x20\x30\x20\x30\x2c\x30\x20\x32\x32\x2c\x31\x32\x41\x35\x2c\x35\
-\x20\x30\x20\x30\x2c\x30\x20\x31\x37\x2c\x37\x5a\x22\x2f\x3e\x0d\
-\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\
-\x0a\
-\x00\x00\x02\x21\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x33\x36\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\
-\x63\x61\x6c\x65\x28\x32\x30\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\
-\x74\x65\x28\x33\x20\x35\x2e\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\
-\x36\x36\x39\x37\x32\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\
-\x33\x2e\x33\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\
-\x30\x38\x20\x2d\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\
-\x33\x31\x30\x35\x34\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\
-\x37\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\
-\x2e\x31\x35\x37\x37\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\
-\x34\x20\x30\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\
-\x20\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\
-\x37\x31\x32\x33\x20\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\
-\x20\x6c\x20\x33\x2e\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\
-\x35\x39\x36\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\
-\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\
-\x2c\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\
-\x2e\x35\x37\x31\x31\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\
-\x34\x31\x33\x34\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\
-\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\
-\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\
-\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\
-\x32\x38\x31\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\
-\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\
-\x36\x32\x34\x33\x20\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\
-\x37\x31\x31\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x33\x33\x61\x34\x64\x66\x22\x20\x66\x69\x6c\x6c\x2d\x6f\
-\x70\x61\x63\x69\x74\x79\x3d\x22\x30\x2e\x35\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\
-\x00\x00\x00\x7c\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x30\x22\
-\x20\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\x33\x35\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x32\x37\x32\x62\x32\x66\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x30\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x2f\
-\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x32\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\
-\x20\x78\x3d\x22\x32\x22\x20\x79\x3d\x22\x32\x22\x20\x77\x69\x64\
-\x74\x68\x3d\x22\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x38\
-\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x33\x31\x33\x36\x33\
-\x62\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\
-\x22\x31\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x72\x65\x63\x74\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x78\x3d\
-\x22\x32\x22\x20\x79\x3d\x22\x31\x34\x22\x20\x77\x69\x64\x74\x68\
-\x3d\x22\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x38\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\
-\x22\x31\x31\x22\x20\x79\x31\x3d\x22\x34\x2e\x35\x22\x20\x78\x32\
-\x3d\x22\x32\x32\x22\x20\x79\x32\x3d\x22\x34\x2e\x35\x22\x20\x73\
-\x74\x79\x6c\x65\x3d\x22\x73\x74\x72\x6f\x6b\x65\x3a\x23\x33\x31\
-\x33\x36\x33\x62\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\
-\x68\x3a\x31\x22\x20\x2f\x3e\x0d\x0a\x20\x20\x3c\x6c\x69\x6e\x65\
-\x20\x78\x31\x3d\x22\x31\x31\x22\x20\x79\x31\x3d\x22\x37\x2e\x35\
-\x22\x20\x78\x32\x3d\x22\x32\x32\x22\x20\x79\x32\x3d\x22\x37\x2e\
-\x35\x22\x20\x73\x74\x79\x6c\x65\x3d\x22\x73\x74\x72\x6f\x6b\x65\
-\x3a\x23\x33\x31\x33\x36\x33\x62\x3b\x73\x74\x72\x6f\x6b\x65\x2d\
-\x77\x69\x64\x74\x68\x3a\x31\x22\x20\x2f\x3e\x0d\x0a\x20\x20\x3c\
-\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x31\x31\x22\x20\x79\x31\x3d\
-\x22\x31\x36\x2e\x35\x22\x20\x78\x32\x3d\x22\x31\x38\x22\x20\x79\
-\x32\x3d\x22\x31\x36\x2e\x35\x22\x20\x73\x74\x79\x6c\x65\x3d\x22\
-\x73\x74\x72\x6f\x6b\x65\x3a\x23\x33\x31\x33\x36\x33\x62\x3b\x73\
-\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x31\x22\x20\x2f\
-\x3e\x0d\x0a\x20\x20\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x31\
-\x31\x22\x20\x79\x31\x3d\x22\x31\x39\x2e\x35\x22\x20\x78\x32\x3d\
-\x22\x31\x38\x22\x20\x79\x32\x3d\x22\x31\x39\x2e\x35\x22\x20\x73\
-\x74\x79\x6c\x65\x3d\x22\x73\x74\x72\x6f\x6b\x65\x3a\x23\x33\x31\
-\x33\x36\x33\x62\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\
-\x68\x3a\x31\x22\x20\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\
-\x0a\
-\x00\x00\x01\x54\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x20\x3e\x0d\x0a\
-\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\
-\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x39\x2c\x30\x2c\x30\x2c\x30\
-\x2e\x39\x2c\x2d\x31\x36\x2e\x35\x33\x32\x32\x37\x36\x2c\x2d\x31\
-\x33\x2e\x39\x39\x38\x36\x35\x38\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x37\x34\x2e\x38\x33\
-\x38\x36\x33\x33\x2c\x32\x36\x2e\x33\x39\x39\x39\x36\x38\x20\x61\
-\x20\x34\x38\x2e\x36\x2c\x34\x38\x2e\x36\x20\x30\x20\x30\x20\x30\
-\x20\x2d\x34\x38\x2e\x34\x33\x38\x36\x33\x33\x2c\x34\x38\x2e\x36\
-\x20\x34\x38\x2e\x36\x2c\x34\x38\x2e\x36\x20\x30\x20\x30\x20\x30\
-\x20\x39\x37\x2e\x32\x2c\x30\x20\x34\x38\x2e\x36\x2c\x34\x38\x2e\
-\x36\x20\x30\x20\x30\x20\x30\x20\x2d\x34\x38\x2e\x37\x36\x31\x33\
-\x36\x37\x2c\x2d\x34\x38\x2e\x36\x20\x7a\x20\x6d\x20\x2d\x30\x2e\
-\x36\x34\x38\x36\x33\x33\x2c\x31\x31\x2e\x33\x34\x20\x33\x36\x2e\
-\x34\x35\x2c\x33\x36\x2e\x34\x35\x20\x4c\x20\x37\x34\x2e\x31\x39\
-\x2c\x31\x31\x30\x2e\x36\x33\x39\x39\x37\x20\x33\x37\x2e\x37\x34\
-\x2c\x37\x34\x2e\x31\x38\x39\x39\x36\x38\x20\x5a\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x66\x69\x6c\
-\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x20\
-\x2f\x3e\x0d\x0a\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\
-\x3e\x0d\x0a\
-\x00\x00\x01\xc2\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\
-\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\
-\x31\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x67\
-\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\
-\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\
-\x64\x64\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\
-\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x2d\x34\x34\x2e\x30\x30\x30\
-\x30\x30\x30\x2c\x20\x2d\x38\x36\x2e\x30\x30\x30\x30\x30\x30\x29\
-\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\
-\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\
-\x65\x28\x34\x34\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x38\x36\x2e\
-\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x30\x2c\
-\x30\x20\x43\x34\x2e\x35\x2c\x30\x20\x30\x2c\x34\x2e\x35\x20\x30\
-\x2c\x31\x30\x20\x43\x30\x2c\x31\x35\x2e\x35\x20\x34\x2e\x35\x2c\
-\x32\x30\x20\x31\x30\x2c\x32\x30\x20\x43\x31\x35\x2e\x35\x2c\x32\
-\x30\x20\x32\x30\x2c\x31\x35\x2e\x35\x20\x32\x30\x2c\x31\x30\x20\
-\x43\x32\x30\x2c\x34\x2e\x35\x20\x31\x35\x2e\x35\x2c\x30\x20\x31\
-\x30\x2c\x30\x20\x4c\x31\x30\x2c\x30\x20\x5a\x20\x4d\x38\x2c\x31\
-\x35\x20\x4c\x33\x2c\x31\x30\x20\x4c\x34\x2e\x34\x2c\x38\x2e\x36\
-\x20\x4c\x38\x2c\x31\x32\x2e\x32\x20\x4c\x31\x35\x2e\x36\x2c\x34\
-\x2e\x36\x20\x4c\x31\x37\x2c\x36\x20\x4c\x38\x2c\x31\x35\x20\x4c\
-\x38\x2c\x31\x35\x20\x5a\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x20\
-\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\
-\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\
-\x0a\
-\x00\x00\x00\xd1\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\
-\x31\x34\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\
-\x68\x2d\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\
-\x23\x36\x61\x36\x65\x37\x31\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\
-\x68\x2d\x31\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\
-\x31\x33\x2e\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x36\x61\x36\x65\x37\x31\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\
-\x00\x00\x00\x85\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x30\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\
-\x63\x61\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x34\x62\x34\x62\
-\x34\x62\x22\x20\x78\x3d\x22\x33\x36\x22\x20\x77\x69\x64\x74\x68\
-\x3d\x22\x33\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\x38\x22\
-\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\
-\x67\x3e\x0d\x0a\
-\x00\x00\x01\x32\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\
-\x33\x62\x22\x20\x64\x3d\x22\x4d\x31\x30\x2c\x31\x39\x48\x31\x33\
-\x56\x32\x32\x48\x31\x30\x56\x31\x39\x4d\x31\x32\x2c\x32\x43\x31\
-\x37\x2e\x33\x35\x2c\x32\x2e\x32\x32\x20\x31\x39\x2e\x36\x38\x2c\
-\x37\x2e\x36\x32\x20\x31\x36\x2e\x35\x2c\x31\x31\x2e\x36\x37\x43\
-\x31\x35\x2e\x36\x37\x2c\x31\x32\x2e\x36\x37\x20\x31\x34\x2e\x33\
-\x33\x2c\x31\x33\x2e\x33\x33\x20\x31\x33\x2e\x36\x37\x2c\x31\x34\
-\x2e\x31\x37\x43\x31\x33\x2c\x31\x35\x20\x31\x33\x2c\x31\x36\x20\
-\x31\x33\x2c\x31\x37\x48\x31\x30\x43\x31\x30\x2c\x31\x35\x2e\x33\
-\x33\x20\x31\x30\x2c\x31\x33\x2e\x39\x32\x20\x31\x30\x2e\x36\x37\
-\x2c\x31\x32\x2e\x39\x32\x43\x31\x31\x2e\x33\x33\x2c\x31\x31\x2e\
-\x39\x32\x20\x31\x32\x2e\x36\x37\x2c\x31\x31\x2e\x33\x33\x20\x31\
-\x33\x2e\x35\x2c\x31\x30\x2e\x36\x37\x43\x31\x35\x2e\x39\x32\x2c\
-\x38\x2e\x34\x33\x20\x31\x35\x2e\x33\x32\x2c\x35\x2e\x32\x36\x20\
-\x31\x32\x2c\x35\x41\x33\x2c\x33\x20\x30\x20\x30\x2c\x30\x20\x39\
-\x2c\x38\x48\x36\x41\x36\x2c\x36\x20\x30\x20\x30\x2c\x31\x20\x31\
-\x32\x2c\x32\x5a\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\
-\x0a\
-\x00\x00\x00\x9c\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\
-\x33\x62\x22\x20\x64\x3d\x22\x4d\x31\x34\x2c\x32\x48\x36\x41\x32\
-\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x34\x2c\x34\x56\x32\x30\x41\
-\x32\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x36\x2c\x32\x32\x48\x31\
-\x38\x41\x32\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x32\x30\x2c\x32\
-\x30\x56\x38\x4c\x31\x34\x2c\x32\x4d\x31\x38\x2c\x32\x30\x48\x36\
-\x56\x34\x48\x31\x33\x56\x39\x48\x31\x38\x56\x32\x30\x5a\x22\x2f\
-\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x01\x1d\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\
-\x63\x61\x6c\x65\x28\x30\x2e\x31\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x61\
-\x62\x39\x62\x38\x22\x20\x64\x3d\x22\x4d\x32\x32\x2e\x31\x2c\x31\
-\x30\x32\x32\x2e\x31\x4c\x2d\x32\x32\x2e\x31\x2c\x39\x37\x37\x2e\
-\x39\x6c\x31\x30\x30\x30\x2d\x31\x30\x30\x30\x4c\x31\x30\x32\x32\
-\x2e\x31\x2c\x32\x32\x2e\x31\x5a\x6d\x32\x32\x30\x2c\x33\x30\x4c\
-\x31\x39\x37\x2e\x39\x2c\x31\x30\x30\x37\x2e\x39\x6c\x31\x30\x30\
-\x30\x2d\x31\x30\x30\x30\x4c\x31\x32\x34\x32\x2e\x31\x2c\x35\x32\
-\x2e\x31\x5a\x6d\x32\x35\x30\x2c\x30\x4c\x34\x34\x37\x2e\x39\x2c\
-\x31\x30\x30\x37\x2e\x39\x6c\x31\x30\x30\x30\x2d\x31\x30\x30\x30\
-\x4c\x31\x34\x39\x32\x2e\x31\x2c\x35\x32\x2e\x31\x5a\x6d\x32\x35\
-\x30\x2c\x30\x4c\x36\x39\x37\x2e\x39\x2c\x31\x30\x30\x37\x2e\x39\
-\x6c\x31\x30\x33\x30\x2d\x31\x30\x33\x30\x4c\x31\x37\x37\x32\x2e\
-\x31\x2c\x32\x32\x2e\x31\x5a\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\
-\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xb9\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\
-\x33\x62\x22\x20\x64\x3d\x22\x4d\x34\x2c\x36\x56\x31\x39\x48\x32\
-\x30\x56\x36\x48\x34\x4d\x31\x38\x2c\x31\x37\x48\x36\x56\x38\x48\
-\x31\x38\x56\x31\x37\x5a\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x6c\x69\
-\x6e\x65\x20\x78\x31\x3d\x22\x37\x22\x20\x79\x31\x3d\x22\x31\x35\
-\x2e\x35\x22\x20\x78\x32\x3d\x22\x31\x37\x22\x20\x79\x32\x3d\x22\
-\x31\x35\x2e\x35\x22\x20\x73\x74\x79\x6c\x65\x3d\x22\x73\x74\x72\
-\x6f\x6b\x65\x3a\x23\x33\x31\x33\x36\x33\x62\x3b\x73\x74\x72\x6f\
-\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x31\x22\x20\x2f\x3e\x0d\x0a\
-\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xc8\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x30\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\
-\x63\x61\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x34\x62\x34\x62\
-\x34\x62\x22\x20\x78\x3d\x22\x33\x36\x22\x20\x77\x69\x64\x74\x68\
-\x3d\x22\x33\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\x38\x22\
-\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x72\x65\x63\x74\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x34\x62\x34\x62\x34\x62\x22\x20\x78\x3d\x22\
-\x33\x36\x22\x20\x79\x3d\x22\x32\x39\x2e\x37\x35\x22\x20\x68\x65\
-\x69\x67\x68\x74\x3d\x22\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
-\x34\x35\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\
-\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\x98\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\
-\x33\x62\x22\x20\x64\x3d\x22\x4d\x31\x32\x20\x35\x2e\x36\x39\x4c\
-\x31\x37\x20\x31\x30\x2e\x31\x39\x56\x31\x38\x48\x31\x35\x56\x31\
-\x32\x48\x39\x56\x31\x38\x48\x37\x56\x31\x30\x2e\x31\x39\x4c\x31\
-\x32\x20\x35\x2e\x36\x39\x4d\x31\x32\x20\x33\x4c\x32\x20\x31\x32\
-\x48\x35\x56\x32\x30\x48\x31\x31\x56\x31\x34\x48\x31\x33\x56\x32\
-\x30\x48\x31\x39\x56\x31\x32\x48\x32\x32\x22\x2f\x3e\x0d\x0a\x3c\
-\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xc8\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x30\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\
-\x63\x61\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x34\x62\x34\x62\
-\x34\x62\x22\x20\x78\x3d\x22\x33\x36\x22\x20\x77\x69\x64\x74\x68\
-\x3d\x22\x33\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x37\x22\
-\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x72\x65\x63\x74\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x34\x62\x34\x62\x34\x62\x22\x20\x78\x3d\x22\
-\x36\x36\x22\x20\x79\x3d\x22\x32\x39\x2e\x37\x35\x22\x20\x68\x65\
-\x69\x67\x68\x74\x3d\x22\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
-\x31\x35\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\
-\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x0e\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\
-\x39\x32\x2c\x30\x2e\x39\x31\x37\x36\x39\x37\x31\x38\x20\x34\x2e\
-\x35\x2c\x34\x2e\x32\x32\x38\x30\x31\x38\x32\x20\x37\x2e\x38\x31\
-\x30\x35\x34\x30\x38\x2c\x30\x2e\x39\x31\x36\x32\x37\x36\x34\x38\
-\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\
-\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\
-\x31\x37\x34\x39\x2c\x30\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\
-\x2c\x30\x2e\x31\x35\x37\x37\x30\x32\x30\x32\x20\x30\x2e\x31\x35\
-\x37\x37\x31\x32\x34\x2c\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x32\
-\x20\x30\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x32\x20\x6c\x20\
-\x2d\x33\x2e\x35\x39\x36\x31\x32\x38\x33\x2c\x33\x2e\x35\x39\x37\
-\x33\x31\x30\x32\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\
-\x30\x31\x39\x20\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\
-\x2e\x31\x35\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x38\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\
-\x33\x2c\x31\x2e\x34\x38\x37\x34\x31\x33\x34\x20\x63\x20\x2d\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x20\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\
-\x2e\x34\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\x2e\x35\x37\
-\x31\x31\x33\x36\x39\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\
-\x2c\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x31\x20\x30\x2e\x34\
-\x31\x33\x34\x36\x32\x34\x2c\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\
-\x33\x31\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x2c\x30\x2e\x30\
-\x30\x31\x34\x32\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\
-\x31\x33\x36\x33\x62\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\
-\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\
-\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x11\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x35\x2e\x30\x38\x32\x33\x30\
-\x32\x38\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x2d\x33\x2e\
-\x33\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\
-\x20\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\
-\x35\x34\x30\x38\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\
-\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x2d\x30\x2e\
-\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x33\x20\x2d\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\
-\x20\x2d\x33\x2e\x35\x39\x37\x33\x31\x30\x31\x37\x2c\x2d\x33\x2e\
-\x35\x39\x36\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\
-\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x31\x2c\x2d\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x31\x39\x31\x2c\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\
-\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\x38\x20\x4c\x20\x34\
-\x2e\x35\x31\x32\x35\x38\x36\x36\x2c\x30\x2e\x36\x31\x38\x32\x38\
-\x34\x33\x37\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x34\x31\x33\x34\
-\x33\x34\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x30\
-\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x30\x2e\x31\x35\x36\
-\x32\x38\x31\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x30\
-\x2e\x31\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\
-\x32\x34\x33\x20\x2d\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\
-\x37\x31\x31\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x66\x69\x6c\x6c\x2d\x6f\
-\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\
-\x00\x00\x00\xa8\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\
-\x33\x62\x22\x20\x64\x3d\x22\x4d\x36\x2c\x31\x39\x41\x32\x2c\x32\
-\x20\x30\x20\x30\x2c\x30\x20\x38\x2c\x32\x31\x48\x31\x36\x41\x32\
-\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x31\x38\x2c\x31\x39\x56\x37\
-\x48\x36\x56\x31\x39\x4d\x38\x2c\x39\x48\x31\x36\x56\x31\x39\x48\
-\x38\x56\x39\x4d\x31\x35\x2e\x35\x2c\x34\x4c\x31\x34\x2e\x35\x2c\
-\x33\x48\x39\x2e\x35\x4c\x38\x2e\x35\x2c\x34\x48\x35\x56\x36\x48\
-\x31\x39\x56\x34\x48\x31\x35\x2e\x35\x5a\x22\x2f\x3e\x0d\x0a\x3c\
-\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xaf\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\
-\x33\x62\x22\x20\x64\x3d\x22\x4d\x32\x30\x2c\x31\x38\x48\x34\x56\
-\x38\x48\x32\x30\x4d\x32\x30\x2c\x36\x48\x31\x32\x4c\x31\x30\x2c\
-\x34\x48\x34\x43\x32\x2e\x38\x39\x2c\x34\x20\x32\x2c\x34\x2e\x38\
-\x39\x20\x32\x2c\x36\x56\x31\x38\x41\x32\x2c\x32\x20\x30\x20\x30\
-\x2c\x30\x20\x34\x2c\x32\x30\x48\x32\x30\x41\x32\x2c\x32\x20\x30\
-\x20\x30\x2c\x30\x20\x32\x32\x2c\x31\x38\x56\x38\x43\x32\x32\x2c\
-\x36\x2e\x38\x39\x20\x32\x31\x2e\x31\x2c\x36\x20\x32\x30\x2c\x36\
-\x5a\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x01\x1a\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\
-\x31\x34\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\
-\x68\x2d\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\
-\x23\x32\x37\x32\x62\x32\x66\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\
-\x68\x2d\x31\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\
-\x31\x33\x2e\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x32\x37\x32\x62\x32\x66\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x2c\
-\x35\x20\x68\x38\x20\x76\x38\x20\x68\x2d\x38\x20\x76\x2d\x38\x20\
-\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x32\x37\x32\x62\x32\x66\
-\x22\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\
-\x6e\x6f\x64\x64\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x01\xff\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\
-\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\
-\x31\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x67\
-\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\
-\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\
-\x64\x64\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\
-\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x2d\x33\x38\x30\x2e\x30\x30\
-\x30\x30\x30\x30\x2c\x20\x2d\x34\x34\x2e\x30\x30\x30\x30\x30\x30\
-\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\
-\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\
-\x74\x65\x28\x33\x38\x30\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x34\
-\x34\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\
-\x30\x2c\x30\x20\x43\x34\x2e\x35\x2c\x30\x20\x30\x2c\x34\x2e\x35\
-\x20\x30\x2c\x31\x30\x20\x43\x30\x2c\x31\x35\x2e\x35\x20\x34\x2e\
-\x35\x2c\x32\x30\x20\x31\x30\x2c\x32\x30\x20\x43\x31\x35\x2e\x35\
-\x2c\x32\x30\x20\x32\x30\x2c\x31\x35\x2e\x35\x20\x32\x30\x2c\x31\
-\x30\x20\x43\x32\x30\x2c\x34\x2e\x35\x20\x31\x35\x2e\x35\x2c\x30\
-\x20\x31\x30\x2c\x30\x20\x4c\x31\x30\x2c\x30\x20\x5a\x20\x4d\x31\
-\x35\x2c\x31\x33\x2e\x36\x20\x4c\x31\x33\x2e\x36\x2c\x31\x35\x20\
-\x4c\x31\x30\x2c\x31\x31\x2e\x34\x20\x4c\x36\x2e\x34\x2c\x31\x35\
-\x20\x4c\x35\x2c\x31\x33\x2e\x36\x20\x4c\x38\x2e\x36\x2c\x31\x30\
-\x20\x4c\x35\x2c\x36\x2e\x34\x20\x4c\x36\x2e\x34\x2c\x35\x20\x4c\
-\x31\x30\x2c\x38\x2e\x36\x20\x4c\x31\x33\x2e\x36\x2c\x35\x20\x4c\
-\x31\x35\x2c\x36\x2e\x34\x20\x4c\x31\x31\x2e\x34\x2c\x31\x30\x20\
-\x4c\x31\x35\x2c\x31\x33\x2e\x36\x20\x4c\x31\x35\x2c\x31\x33\x2e\
-\x36\x20\x5a\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\
-\x67\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\
-\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\x62\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\
-\x33\x62\x22\x20\x64\x3d\x22\x4d\x34\x2c\x34\x48\x32\x30\x56\x32\
-\x30\x48\x34\x56\x34\x4d\x36\x2c\x38\x56\x31\x38\x48\x31\x38\x56\
-\x38\x48\x36\x5a\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\
-\x0a\
-\x00\x00\x01\xd4\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x38\x30\x22\x3e\x0d\x0a\x20\x20\
-\x3c\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x67\x20\
-\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x66\
-\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\
-\x64\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\
-\x61\x6e\x73\x6c\x61\x74\x65\x28\x2d\x34\x32\x34\x2e\x30\x30\x30\
-\x30\x30\x30\x2c\x20\x2d\x34\x36\x33\x2e\x30\x30\x30\x30\x30\x30\
-\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\
-\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\
-\x74\x65\x28\x34\x32\x34\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x34\
-\x36\x34\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0d\x0a\x20\x20\
-\x20\x20\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
-\x38\x2c\x33\x20\x4c\x38\x2c\x2d\x30\x2e\x35\x20\x4c\x33\x2c\x34\
-\x2e\x35\x20\x4c\x38\x2c\x39\x2e\x35\x20\x4c\x38\x2c\x35\x20\x43\
-\x31\x31\x2e\x33\x2c\x35\x20\x31\x34\x2c\x37\x2e\x37\x20\x31\x34\
-\x2c\x31\x31\x20\x43\x31\x34\x2c\x31\x34\x2e\x33\x20\x31\x31\x2e\
-\x33\x2c\x31\x37\x20\x38\x2c\x31\x37\x20\x43\x34\x2e\x37\x2c\x31\
-\x37\x20\x32\x2c\x31\x34\x2e\x33\x20\x32\x2c\x31\x31\x20\x4c\x30\
-\x2c\x31\x31\x20\x43\x30\x2c\x31\x35\x2e\x34\x20\x33\x2e\x36\x2c\
-\x31\x39\x20\x38\x2c\x31\x39\x20\x43\x31\x32\x2e\x34\x2c\x31\x39\
-\x20\x31\x36\x2c\x31\x35\x2e\x34\x20\x31\x36\x2c\x31\x31\x20\x43\
-\x31\x36\x2c\x36\x2e\x36\x20\x31\x32\x2e\x34\x2c\x33\x20\x38\x2c\
-\x33\x20\x4c\x38\x2c\x33\x20\x5a\x22\x2f\x3e\x0d\x0a\x20\x20\x20\
-\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x2f\x67\
-\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\
-\x3e\x0d\x0a\
-\x00\x00\x02\x21\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x33\x36\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\
-\x63\x61\x6c\x65\x28\x32\x30\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\
-\x74\x65\x28\x33\x20\x35\x2e\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\
-\x36\x36\x39\x37\x32\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\
-\x33\x2e\x33\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\
-\x30\x38\x20\x2d\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\
-\x33\x31\x30\x35\x34\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\
-\x37\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\
-\x2e\x31\x35\x37\x37\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\
-\x34\x20\x30\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\
-\x20\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\
-\x37\x31\x32\x33\x20\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\
-\x20\x6c\x20\x33\x2e\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\
-\x35\x39\x36\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\
-\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\
-\x2c\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\
-\x2e\x35\x37\x31\x31\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\
-\x34\x31\x33\x34\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\
-\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\
-\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\
-\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\
-\x32\x38\x31\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\
-\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\
-\x36\x32\x34\x33\x20\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\
-\x37\x31\x31\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x34\x62\x34\x62\x34\x62\x22\x20\x66\x69\x6c\x6c\x2d\x6f\
-\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\
-\x00\x00\x02\x2d\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x33\x36\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\
-\x63\x61\x6c\x65\x28\x32\x30\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\
-\x74\x65\x28\x31\x30\x20\x37\x2e\x35\x29\x20\x72\x6f\x74\x61\x74\
-\x65\x28\x39\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\x39\x37\
-\x32\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\x33\x31\
-\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\x2d\
-\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\x35\
-\x34\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x37\
-\x37\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\
-\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\x2e\x34\
-\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\
-\x20\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\x33\
-\x2e\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\x36\x31\
-\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x30\x2e\
-\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\
-\x32\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\
-\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\x37\x31\
-\x31\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\x33\x34\
-\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\x2d\x30\
-\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\
-\x32\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x2d\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\x31\x31\
-\x33\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\
-\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\
-\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x33\
-\x20\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\x31\x37\
-\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x33\
-\x61\x34\x64\x66\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\
-\x74\x79\x3d\x22\x30\x2e\x35\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\
-\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x03\xe3\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\
-\x61\x74\x72\x69\x78\x28\x30\x2e\x36\x32\x31\x36\x34\x32\x38\x34\
-\x2c\x30\x2c\x30\x2c\x30\x2e\x36\x32\x33\x35\x37\x31\x31\x2c\x2d\
-\x30\x2e\x36\x33\x35\x33\x30\x34\x33\x34\x2c\x33\x2e\x36\x38\x31\
-\x36\x33\x31\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\
-\x65\x6e\x6f\x64\x64\x22\x20\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\
-\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\x64\x3d\x22\x4d\x20\
-\x37\x39\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\x30\x20\x41\x20\x37\
-\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x31\x30\x2c\x38\x30\
-\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x38\x30\x2c\
-\x31\x35\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\
-\x31\x35\x30\x2c\x38\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\
-\x20\x30\x20\x38\x30\x2c\x31\x30\x20\x37\x30\x2c\x37\x30\x20\x30\
-\x20\x30\x20\x30\x20\x37\x39\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\
-\x30\x20\x5a\x20\x6d\x20\x33\x31\x2e\x31\x33\x36\x37\x31\x35\x2c\
-\x32\x38\x2e\x35\x20\x63\x20\x33\x2e\x31\x38\x36\x33\x32\x2c\x2d\
-\x30\x2e\x30\x30\x38\x37\x20\x36\x2e\x33\x37\x36\x33\x36\x2c\x31\
-\x2e\x32\x31\x31\x32\x30\x36\x20\x38\x2e\x38\x31\x34\x34\x36\x2c\
-\x33\x2e\x36\x36\x30\x31\x35\x36\x20\x34\x2e\x38\x37\x32\x37\x2c\
-\x34\x2e\x38\x39\x36\x35\x20\x34\x2e\x38\x39\x32\x39\x37\x2c\x31\
-\x32\x2e\x38\x35\x37\x37\x34\x34\x20\x30\x2e\x30\x34\x36\x39\x2c\
-\x31\x37\x2e\x37\x37\x37\x33\x34\x34\x20\x4c\x20\x39\x38\x2e\x35\
-\x31\x39\x35\x33\x31\x2c\x38\x31\x2e\x35\x31\x35\x36\x32\x35\x20\
-\x31\x31\x39\x2e\x38\x31\x38\x33\x36\x2c\x31\x30\x33\x2e\x31\x31\
-\x35\x32\x33\x20\x63\x20\x34\x2e\x38\x30\x36\x32\x2c\x34\x2e\x38\
-\x38\x34\x36\x20\x34\x2e\x37\x34\x30\x32\x32\x2c\x31\x32\x2e\x37\
-\x39\x34\x39\x38\x20\x2d\x30\x2e\x31\x34\x36\x34\x38\x2c\x31\x37\
-\x2e\x36\x37\x31\x38\x38\x20\x2d\x34\x2e\x38\x38\x38\x31\x2c\x34\
-\x2e\x38\x37\x34\x38\x20\x2d\x31\x32\x2e\x37\x34\x35\x39\x39\x2c\
-\x34\x2e\x38\x36\x32\x34\x31\x20\x2d\x31\x37\x2e\x35\x35\x30\x37\
-\x39\x2c\x2d\x30\x2e\x30\x32\x31\x35\x20\x4c\x20\x38\x30\x2e\x39\
-\x36\x38\x37\x35\x2c\x39\x39\x2e\x33\x31\x36\x34\x30\x36\x20\x35\
-\x39\x2e\x37\x37\x37\x33\x34\x34\x2c\x31\x32\x30\x2e\x38\x30\x36\
-\x36\x34\x20\x63\x20\x2d\x34\x2e\x38\x34\x38\x39\x2c\x34\x2e\x39\
-\x32\x33\x38\x20\x2d\x31\x32\x2e\x37\x33\x33\x31\x37\x35\x2c\x34\
-\x2e\x39\x34\x34\x37\x38\x20\x2d\x31\x37\x2e\x36\x30\x39\x33\x37\
-\x35\x2c\x30\x2e\x30\x34\x36\x39\x20\x2d\x34\x2e\x38\x37\x32\x37\
-\x2c\x2d\x34\x2e\x38\x39\x36\x35\x20\x2d\x34\x2e\x38\x39\x33\x36\
-\x37\x35\x2c\x2d\x31\x32\x2e\x38\x35\x37\x37\x35\x20\x2d\x30\x2e\
-\x30\x34\x36\x38\x37\x2c\x2d\x31\x37\x2e\x37\x37\x37\x33\x35\x20\
-\x4c\x20\x36\x33\x2e\x33\x39\x36\x34\x38\x34\x2c\x38\x31\x2e\x34\
-\x39\x36\x30\x39\x34\x20\x34\x32\x2e\x30\x39\x39\x36\x30\x39\x2c\
-\x35\x39\x2e\x38\x39\x38\x34\x33\x38\x20\x63\x20\x2d\x34\x2e\x38\
-\x30\x36\x39\x2c\x2d\x34\x2e\x38\x38\x34\x36\x20\x2d\x34\x2e\x37\
-\x34\x32\x31\x36\x38\x2c\x2d\x31\x32\x2e\x37\x39\x36\x39\x32\x39\
-\x20\x30\x2e\x31\x34\x34\x35\x33\x32\x2c\x2d\x31\x37\x2e\x36\x37\
-\x33\x38\x32\x39\x20\x34\x2e\x38\x38\x38\x31\x2c\x2d\x34\x2e\x38\
-\x37\x34\x31\x20\x31\x32\x2e\x37\x34\x37\x39\x33\x34\x2c\x2d\x34\
-\x2e\x38\x36\x32\x34\x31\x35\x20\x31\x37\x2e\x35\x35\x32\x37\x33\
-\x34\x2c\x30\x2e\x30\x32\x31\x34\x38\x20\x4c\x20\x38\x30\x2e\x39\
-\x34\x39\x32\x31\x39\x2c\x36\x33\x2e\x36\x39\x37\x32\x36\x36\x20\
-\x31\x30\x32\x2e\x31\x34\x30\x36\x32\x2c\x34\x32\x2e\x32\x30\x37\
-\x30\x33\x31\x20\x63\x20\x32\x2e\x34\x32\x34\x34\x36\x2c\x2d\x32\
-\x2e\x34\x36\x31\x39\x20\x35\x2e\x36\x30\x36\x36\x36\x2c\x2d\x33\
-\x2e\x36\x39\x38\x33\x36\x39\x20\x38\x2e\x37\x39\x32\x39\x37\x2c\
-\x2d\x33\x2e\x37\x30\x37\x30\x33\x31\x20\x7a\x22\x20\x66\x69\x6c\
-\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x66\x69\x6c\x6c\
-\x2d\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\
-\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0d\x0a\
-\x00\x00\x00\x64\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x33\x32\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x61\
-\x62\x39\x62\x38\x22\x20\x78\x3d\x22\x34\x22\x20\x79\x3d\x22\x38\
-\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\x65\x69\
-\x67\x68\x74\x3d\x22\x31\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\
-\x3e\x0d\x0a\
-\x00\x00\x01\xf6\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x30\x2e\x39\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\x74\
-\x65\x28\x30\x2c\x20\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\
-\x33\x62\x22\x20\x64\x3d\x22\x4d\x31\x39\x2c\x32\x30\x48\x34\x43\
-\x32\x2e\x38\x39\x2c\x32\x30\x20\x32\x2c\x31\x39\x2e\x31\x20\x32\
-\x2c\x31\x38\x56\x36\x43\x32\x2c\x34\x2e\x38\x39\x20\x32\x2e\x38\
-\x39\x2c\x34\x20\x34\x2c\x34\x48\x31\x30\x4c\x31\x32\x2c\x36\x48\
-\x31\x39\x41\x32\x2c\x32\x20\x30\x20\x30\x2c\x31\x20\x32\x31\x2c\
-\x38\x48\x32\x31\x4c\x34\x2c\x38\x56\x31\x38\x4c\x36\x2e\x31\x34\
-\x2c\x31\x30\x48\x32\x33\x2e\x32\x31\x4c\x32\x30\x2e\x39\x33\x2c\
-\x31\x38\x2e\x35\x43\x32\x30\x2e\x37\x2c\x31\x39\x2e\x33\x37\x20\
-\x31\x39\x2e\x39\x32\x2c\x32\x30\x20\x31\x39\x2c\x32\x30\x5a\x22\
-\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x30\x2e\x37\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\
-\x28\x38\x2c\x20\x33\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x61\x62\x39\x62\
-\x38\x22\x20\x64\x3d\x22\x4d\x31\x33\x2c\x39\x56\x33\x2e\x35\x4c\
-\x31\x38\x2e\x35\x2c\x39\x4d\x36\x2c\x32\x43\x34\x2e\x38\x39\x2c\
-\x32\x20\x34\x2c\x32\x2e\x38\x39\x20\x34\x2c\x34\x56\x32\x30\x41\
-\x32\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x36\x2c\x32\x32\x48\x31\
-\x38\x41\x32\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x32\x30\x2c\x32\
-\x30\x56\x38\x4c\x31\x34\x2c\x32\x48\x36\x5a\x22\x20\x2f\x3e\x0d\
-\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x3c\x70\x6f\x6c\x79\
-\x67\x6f\x6e\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\
-\x62\x22\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x35\x2c\x31\x33\x2e\
-\x35\x20\x32\x30\x2c\x31\x33\x2e\x35\x20\x31\x39\x2e\x35\x2c\x31\
-\x38\x2e\x35\x20\x34\x2c\x32\x30\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\
-\x76\x67\x3e\x0d\x0a\
-\x00\x00\x01\xa7\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x38\x30\x22\x20\
-\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\x20\
-\x3c\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x67\x20\
-\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x66\
-\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\
-\x64\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\
-\x61\x6e\x73\x6c\x61\x74\x65\x28\x2d\x34\x34\x2e\x30\x30\x30\x30\
-\x30\x30\x2c\x20\x2d\x32\x35\x36\x2e\x30\x30\x30\x30\x30\x30\x29\
-\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\
-\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\
-\x65\x28\x34\x34\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x32\x35\x36\
-\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\
-\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x38\x2c\
-\x30\x20\x4c\x32\x2c\x30\x20\x43\x30\x2e\x39\x2c\x30\x20\x30\x2c\
-\x30\x2e\x39\x20\x30\x2c\x32\x20\x4c\x30\x2c\x31\x34\x20\x43\x30\
-\x2c\x31\x35\x2e\x31\x20\x30\x2e\x39\x2c\x31\x36\x20\x32\x2c\x31\
-\x36\x20\x4c\x31\x38\x2c\x31\x36\x20\x43\x31\x39\x2e\x31\x2c\x31\
-\x36\x20\x32\x30\x2c\x31\x35\x2e\x31\x20\x32\x30\x2c\x31\x34\x20\
-\x4c\x32\x30\x2c\x34\x20\x43\x32\x30\x2c\x32\x2e\x39\x20\x31\x39\
-\x2e\x31\x2c\x32\x20\x31\x38\x2c\x32\x20\x4c\x31\x30\x2c\x32\x20\
-\x4c\x38\x2c\x30\x20\x4c\x38\x2c\x30\x20\x5a\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x20\x20\
-\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\
-\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xe3\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x20\x3e\x0d\x0a\
-\x20\x20\x3c\x67\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x64\x3d\x22\x4d\x20\x31\x32\x2e\x39\x31\x39\x30\x38\x33\x2c\
-\x35\x33\x2e\x31\x36\x34\x30\x33\x37\x20\x34\x39\x2e\x33\x36\x39\
-\x30\x38\x31\x2c\x38\x39\x2e\x36\x31\x34\x30\x33\x35\x20\x38\x35\
-\x2e\x38\x31\x39\x30\x38\x37\x2c\x35\x33\x2e\x31\x36\x34\x30\x33\
-\x37\x20\x34\x39\x2e\x33\x36\x39\x30\x38\x31\x2c\x31\x36\x2e\x37\
-\x31\x34\x30\x34\x20\x5a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\
-\x6e\x65\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x61\x32\x61\
-\x32\x61\x32\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\
-\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x20\x73\x74\x72\x6f\x6b\x65\
-\x2d\x77\x69\x64\x74\x68\x3d\x22\x37\x2e\x32\x39\x22\x20\x2f\x3e\
-\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0d\x0a\
-\x00\x00\x02\x06\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\
-\x39\x32\x2c\x35\x2e\x30\x38\x33\x33\x30\x32\x38\x20\x34\x2e\x35\
-\x2c\x31\x2e\x37\x37\x32\x39\x38\x31\x38\x20\x37\x2e\x38\x31\x30\
-\x35\x34\x30\x38\x2c\x35\x2e\x30\x38\x34\x37\x32\x33\x35\x20\x63\
-\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\x37\
-\x37\x30\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\
-\x2c\x30\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\
-\x2c\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\
-\x2e\x35\x37\x31\x31\x33\x36\x39\x20\x6c\x20\x2d\x33\x2e\x35\x39\
-\x36\x31\x32\x38\x33\x2c\x2d\x33\x2e\x35\x39\x37\x33\x31\x30\x31\
-\x39\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\
-\x39\x20\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\x37\
-\x34\x38\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\x33\
-\x2c\x34\x2e\x35\x31\x33\x35\x38\x36\x36\x20\x63\x20\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x20\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x34\x31\
-\x33\x34\x33\x34\x39\x20\x30\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\
-\x39\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\
-\x36\x32\x38\x31\x33\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\
-\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x20\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x39\x2c\x2d\x30\x2e\x30\x30\x31\x34\x32\x20\x7a\x22\x20\
-\x66\x69\x6c\x6c\x3d\x22\x23\x62\x61\x62\x39\x62\x38\x22\x20\x66\
-\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\
-\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\
-\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x06\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\
-\x39\x32\x2c\x35\x2e\x30\x38\x33\x33\x30\x32\x38\x20\x34\x2e\x35\
-\x2c\x31\x2e\x37\x37\x32\x39\x38\x31\x38\x20\x37\x2e\x38\x31\x30\
-\x35\x34\x30\x38\x2c\x35\x2e\x30\x38\x34\x37\x32\x33\x35\x20\x63\
-\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\x37\
-\x37\x30\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\
-\x2c\x30\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\
-\x2c\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\
-\x2e\x35\x37\x31\x31\x33\x36\x39\x20\x6c\x20\x2d\x33\x2e\x35\x39\
-\x36\x31\x32\x38\x33\x2c\x2d\x33\x2e\x35\x39\x37\x33\x31\x30\x31\
-\x39\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\
-\x39\x20\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\x37\
-\x34\x38\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\x33\
-\x2c\x34\x2e\x35\x31\x33\x35\x38\x36\x36\x20\x63\x20\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x20\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x34\x31\
-\x33\x34\x33\x34\x39\x20\x30\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\
-\x39\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\
-\x36\x32\x38\x31\x33\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\
-\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x20\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x39\x2c\x2d\x30\x2e\x30\x30\x31\x34\x32\x20\x7a\x22\x20\
-\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x66\
-\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\
-\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\
-\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x0e\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\
-\x39\x32\x2c\x30\x2e\x39\x31\x37\x36\x39\x37\x31\x38\x20\x34\x2e\
-\x35\x2c\x34\x2e\x32\x32\x38\x30\x31\x38\x32\x20\x37\x2e\x38\x31\
-\x30\x35\x34\x30\x38\x2c\x30\x2e\x39\x31\x36\x32\x37\x36\x34\x38\
-\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\
-\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\
-\x31\x37\x34\x39\x2c\x30\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\
-\x2c\x30\x2e\x31\x35\x37\x37\x30\x32\x30\x32\x20\x30\x2e\x31\x35\
-\x37\x37\x31\x32\x34\x2c\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x32\
-\x20\x30\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x32\x20\x6c\x20\
-\x2d\x33\x2e\x35\x39\x36\x31\x32\x38\x33\x2c\x33\x2e\x35\x39\x37\
-\x33\x31\x30\x32\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\
-\x30\x31\x39\x20\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\
-\x2e\x31\x35\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x38\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\
-\x33\x2c\x31\x2e\x34\x38\x37\x34\x31\x33\x34\x20\x63\x20\x2d\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x20\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\
-\x2e\x34\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\x2e\x35\x37\
-\x31\x31\x33\x36\x39\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\
-\x2c\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x31\x20\x30\x2e\x34\
-\x31\x33\x34\x36\x32\x34\x2c\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\
-\x33\x31\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x2c\x30\x2e\x30\
-\x30\x31\x34\x32\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\
-\x33\x61\x34\x64\x66\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\
-\x69\x74\x79\x3d\x22\x30\x2e\x35\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\
-\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xb0\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x30\x22\
-\x20\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\x33\x35\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x32\x37\x32\x62\x32\x66\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x30\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x2f\
-\x3e\x0d\x0a\x20\x20\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\
-\x22\x35\x30\x22\x20\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\
-\x31\x37\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x32\x37\x32\x62\x32\
-\x66\x22\x20\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\xbf\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x32\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\
-\x61\x74\x72\x69\x78\x28\x30\x2e\x38\x31\x2c\x30\x2c\x30\x2c\x30\
-\x2e\x39\x2c\x2d\x32\x31\x2e\x36\x37\x39\x36\x39\x39\x2c\x2d\x31\
-\x30\x31\x2e\x35\x33\x38\x39\x33\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x66\x66\
-\x38\x63\x39\x66\x22\x20\x64\x3d\x22\x4d\x20\x35\x32\x2e\x30\x31\
-\x31\x39\x37\x34\x2c\x31\x31\x35\x2e\x35\x39\x38\x38\x31\x20\x48\
-\x20\x31\x35\x36\x2e\x30\x36\x35\x38\x35\x20\x63\x20\x31\x31\x2e\
-\x30\x38\x2c\x30\x20\x32\x30\x2c\x38\x2e\x39\x32\x20\x32\x30\x2c\
-\x32\x30\x20\x76\x20\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\
-\x30\x2c\x31\x31\x2e\x30\x38\x20\x2d\x38\x2e\x39\x32\x2c\x32\x30\
-\x20\x2d\x32\x30\x2c\x32\x30\x20\x68\x20\x2d\x31\x33\x2e\x30\x30\
-\x36\x37\x33\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\x34\x20\x6c\x20\
-\x2d\x30\x2e\x34\x30\x30\x34\x33\x2c\x32\x31\x2e\x30\x34\x39\x32\
-\x37\x20\x2d\x32\x35\x2e\x36\x31\x33\x30\x34\x2c\x2d\x32\x31\x2e\
-\x30\x34\x39\x32\x37\x20\x48\x20\x39\x31\x2e\x30\x33\x32\x31\x37\
-\x38\x20\x37\x38\x2e\x30\x32\x35\x34\x34\x33\x20\x36\x35\x2e\x30\
-\x31\x38\x37\x30\x39\x20\x35\x32\x2e\x30\x31\x31\x39\x37\x34\x20\
-\x63\x20\x2d\x31\x31\x2e\x30\x38\x2c\x30\x20\x2d\x32\x30\x2c\x2d\
-\x38\x2e\x39\x32\x20\x2d\x32\x30\x2c\x2d\x32\x30\x20\x76\x20\x2d\
-\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\x2d\x31\x31\
-\x2e\x30\x38\x20\x38\x2e\x39\x32\x2c\x2d\x32\x30\x20\x32\x30\x2c\
-\x2d\x32\x30\x20\x7a\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0d\x0a\x20\x20\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\
-\x23\x33\x31\x33\x36\x33\x62\x22\x20\x66\x69\x6c\x6c\x2d\x72\x75\
-\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\x64\x3d\x22\
-\x4d\x20\x39\x30\x2e\x37\x30\x38\x36\x36\x35\x2c\x31\x37\x2e\x33\
-\x38\x35\x38\x32\x36\x20\x38\x35\x2e\x30\x33\x39\x33\x37\x35\x2c\
-\x31\x31\x2e\x37\x31\x36\x35\x33\x35\x20\x36\x32\x2e\x33\x36\x32\
-\x32\x30\x33\x2c\x33\x34\x2e\x33\x39\x33\x37\x20\x33\x39\x2e\x36\
-\x38\x35\x30\x33\x39\x2c\x31\x31\x2e\x37\x31\x36\x35\x33\x35\x20\
-\x6c\x20\x2d\x35\x2e\x36\x36\x39\x32\x39\x31\x2c\x35\x2e\x36\x36\
-\x39\x32\x39\x31\x20\x32\x32\x2e\x36\x37\x37\x31\x36\x34\x2c\x32\
-\x32\x2e\x36\x37\x37\x31\x36\x36\x20\x2d\x32\x32\x2e\x36\x37\x37\
-\x31\x36\x34\x2c\x32\x32\x2e\x36\x37\x37\x31\x36\x35\x20\x35\x2e\
-\x36\x36\x39\x32\x39\x31\x2c\x35\x2e\x36\x36\x39\x32\x39\x31\x20\
-\x32\x32\x2e\x36\x37\x37\x31\x36\x34\x2c\x2d\x32\x32\x2e\x36\x37\
-\x37\x31\x36\x35\x20\x32\x32\x2e\x36\x37\x37\x31\x37\x32\x2c\x32\
-\x32\x2e\x36\x37\x37\x31\x36\x35\x20\x35\x2e\x36\x36\x39\x32\x39\
-\x2c\x2d\x35\x2e\x36\x36\x39\x32\x39\x31\x20\x2d\x32\x32\x2e\x36\
-\x37\x37\x31\x37\x2c\x2d\x32\x32\x2e\x36\x37\x37\x31\x36\x35\x20\
-\x7a\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x0e\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\x39\
-\x37\x32\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\x33\
-\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\
-\x2d\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\
-\x35\x34\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\
-\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\x37\
-\x37\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\x2e\
-\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x33\x20\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\
-\x33\x2e\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\x36\
-\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x30\
-\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\
-\x31\x32\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\
-\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\x37\
-\x31\x31\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\x33\
-\x34\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\x2d\
-\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\x37\
-\x31\x32\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\x31\
-\x31\x33\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\
-\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\
-\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\
-\x33\x20\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\
-\x31\x33\x36\x33\x62\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\
-\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\
-\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x45\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\
-\x76\x65\x6e\x6f\x64\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\
-\x6e\x6f\x6e\x65\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\
-\x74\x68\x3d\x22\x31\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\
-\x3d\x22\x73\x63\x61\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\
-\x20\x20\x3c\x67\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\
-\x33\x62\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\
-\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x2d\x31\x37\x30\x2e\x30\x30\
-\x30\x30\x30\x30\x2c\x20\x2d\x34\x34\x2e\x30\x30\x30\x30\x30\x30\
-\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\
-\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\
-\x74\x65\x28\x31\x37\x30\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x34\
-\x34\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\
-\x30\x2c\x30\x20\x43\x34\x2e\x35\x2c\x30\x20\x30\x2c\x34\x2e\x35\
-\x20\x30\x2c\x31\x30\x20\x43\x30\x2c\x31\x35\x2e\x35\x20\x34\x2e\
-\x35\x2c\x32\x30\x20\x31\x30\x2c\x32\x30\x20\x43\x31\x35\x2e\x35\
-\x2c\x32\x30\x20\x32\x30\x2c\x31\x35\x2e\x35\x20\x32\x30\x2c\x31\
-\x30\x20\x43\x32\x30\x2c\x34\x2e\x35\x20\x31\x35\x2e\x35\x2c\x30\
-\x20\x31\x30\x2c\x30\x20\x4c\x31\x30\x2c\x30\x20\x5a\x20\x4d\x32\
-\x2c\x31\x30\x20\x43\x32\x2c\x35\x2e\x36\x20\x35\x2e\x36\x2c\x32\
-\x20\x31\x30\x2c\x32\x20\x43\x31\x31\x2e\x38\x2c\x32\x20\x31\x33\
-\x2e\x35\x2c\x32\x2e\x36\x20\x31\x34\x2e\x39\x2c\x33\x2e\x37\x20\
-\x4c\x33\x2e\x37\x2c\x31\x34\x2e\x39\x20\x43\x32\x2e\x36\x2c\x31\
-\x33\x2e\x35\x20\x32\x2c\x31\x31\x2e\x38\x20\x32\x2c\x31\x30\x20\
-\x4c\x32\x2c\x31\x30\x20\x5a\x20\x4d\x31\x30\x2c\x31\x38\x20\x43\
-\x38\x2e\x32\x2c\x31\x38\x20\x36\x2e\x35\x2c\x31\x37\x2e\x34\x20\
-\x35\x2e\x31\x2c\x31\x36\x2e\x33\x20\x4c\x31\x36\x2e\x33\x2c\x35\
-\x2e\x31\x20\x43\x31\x37\x2e\x34\x2c\x36\x2e\x35\x20\x31\x38\x2c\
-\x38\x2e\x32\x20\x31\x38\x2c\x31\x30\x20\x43\x31\x38\x2c\x31\x34\
-\x2e\x34\x20\x31\x34\x2e\x34\x2c\x31\x38\x20\x31\x30\x2c\x31\x38\
-\x20\x4c\x31\x30\x2c\x31\x38\x20\x5a\x22\x2f\x3e\x0d\x0a\x20\x20\
-\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x2f\
-\x67\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\
-\x67\x3e\x0d\x0a\
-\x00\x00\x01\xa1\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x30\x2e\x39\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\x74\
-\x65\x28\x32\x2c\x20\x32\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\
-\x33\x62\x22\x20\x64\x3d\x22\x4d\x36\x2c\x32\x41\x32\x2c\x32\x20\
-\x30\x20\x30\x2c\x30\x20\x34\x2c\x34\x56\x32\x30\x41\x32\x2c\x32\
-\x20\x30\x20\x30\x2c\x30\x20\x36\x2c\x32\x32\x48\x31\x38\x41\x32\
-\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x32\x30\x2c\x32\x30\x56\x38\
-\x4c\x31\x34\x2c\x32\x48\x36\x4d\x36\x2c\x34\x48\x31\x33\x56\x39\
-\x48\x31\x38\x56\x32\x30\x48\x36\x56\x34\x4d\x38\x2c\x31\x32\x56\
-\x31\x34\x48\x31\x36\x56\x31\x32\x48\x38\x4d\x38\x2c\x31\x36\x56\
-\x31\x38\x48\x31\x33\x56\x31\x36\x48\x38\x5a\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x3c\x6c\x69\x6e\x65\x20\
-\x78\x31\x3d\x22\x37\x22\x20\x79\x31\x3d\x22\x31\x30\x22\x20\x78\
-\x32\x3d\x22\x31\x22\x20\x79\x32\x3d\x22\x31\x33\x22\x20\x73\x74\
-\x72\x6f\x6b\x65\x3d\x22\x23\x62\x61\x62\x39\x62\x38\x22\x20\x73\
-\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x2f\
-\x3e\x0d\x0a\x20\x20\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\
-\x22\x39\x22\x20\x63\x79\x3d\x22\x31\x30\x22\x20\x72\x3d\x22\x35\
-\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x62\x61\x62\x39\x62\
-\x38\x22\x20\x66\x69\x6c\x6c\x3d\x22\x72\x67\x62\x61\x28\x37\x31\
-\x2c\x20\x31\x38\x34\x2c\x20\x32\x34\x33\x2c\x20\x30\x2e\x36\x29\
-\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\
-\x30\x2e\x35\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\
-\x00\x00\x02\x6b\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x32\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\
-\x61\x74\x72\x69\x78\x28\x30\x2e\x38\x31\x2c\x30\x2c\x30\x2c\x30\
-\x2e\x39\x2c\x2d\x32\x31\x2e\x36\x37\x39\x36\x39\x39\x2c\x2d\x31\
-\x30\x31\x2e\x35\x33\x38\x39\x33\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x38\x63\
-\x64\x35\x66\x66\x22\x20\x64\x3d\x22\x4d\x20\x35\x32\x2e\x30\x31\
-\x31\x39\x37\x34\x2c\x31\x31\x35\x2e\x35\x39\x38\x38\x31\x20\x48\
-\x20\x31\x35\x36\x2e\x30\x36\x35\x38\x35\x20\x63\x20\x31\x31\x2e\
-\x30\x38\x2c\x30\x20\x32\x30\x2c\x38\x2e\x39\x32\x20\x32\x30\x2c\
-\x32\x30\x20\x76\x20\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\
-\x30\x2c\x31\x31\x2e\x30\x38\x20\x2d\x38\x2e\x39\x32\x2c\x32\x30\
-\x20\x2d\x32\x30\x2c\x32\x30\x20\x68\x20\x2d\x31\x33\x2e\x30\x30\
-\x36\x37\x33\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\x34\x20\x6c\x20\
-\x2d\x30\x2e\x34\x30\x30\x34\x33\x2c\x32\x31\x2e\x30\x34\x39\x32\
-\x37\x20\x2d\x32\x35\x2e\x36\x31\x33\x30\x34\x2c\x2d\x32\x31\x2e\
-\x30\x34\x39\x32\x37\x20\x48\x20\x39\x31\x2e\x30\x33\x32\x31\x37\
-\x38\x20\x37\x38\x2e\x30\x32\x35\x34\x34\x33\x20\x36\x35\x2e\x30\
-\x31\x38\x37\x30\x39\x20\x35\x32\x2e\x30\x31\x31\x39\x37\x34\x20\
-\x63\x20\x2d\x31\x31\x2e\x30\x38\x2c\x30\x20\x2d\x32\x30\x2c\x2d\
-\x38\x2e\x39\x32\x20\x2d\x32\x30\x2c\x2d\x32\x30\x20\x76\x20\x2d\
-\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\x2d\x31\x31\
-\x2e\x30\x38\x20\x38\x2e\x39\x32\x2c\x2d\x32\x30\x20\x32\x30\x2c\
-\x2d\x32\x30\x20\x7a\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0d\x0a\x20\x20\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\
-\x36\x32\x2e\x35\x22\x20\x63\x79\x3d\x22\x34\x30\x22\x20\x72\x3d\
-\x22\x32\x35\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x33\x31\
-\x33\x36\x33\x62\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\
-\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\
-\x35\x22\x20\x2f\x3e\x0d\x0a\x20\x20\x3c\x72\x65\x63\x74\x20\x77\
-\x69\x64\x74\x68\x3d\x22\x35\x22\x20\x68\x65\x69\x67\x68\x74\x3d\
-\x22\x35\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\
-\x62\x22\x20\x78\x3d\x22\x36\x30\x22\x20\x79\x3d\x22\x32\x35\x22\
-\x2f\x3e\x0d\x0a\x20\x20\x3c\x72\x65\x63\x74\x20\x77\x69\x64\x74\
-\x68\x3d\x22\x35\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x30\
-\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\
-\x20\x78\x3d\x22\x36\x30\x22\x20\x79\x3d\x22\x33\x35\x22\x2f\x3e\
-\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x01\x08\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x30\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\
-\x63\x61\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x34\x62\x34\x62\
-\x34\x62\x22\x20\x78\x3d\x22\x33\x36\x22\x20\x77\x69\x64\x74\x68\
-\x3d\x22\x33\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x37\x22\
-\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x72\x65\x63\x74\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x34\x62\x34\x62\x34\x62\x22\x20\x78\x3d\x22\
-\x33\x36\x22\x20\x79\x3d\x22\x34\x37\x22\x20\x77\x69\x64\x74\x68\
-\x3d\x22\x33\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x31\x22\
-\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x72\x65\x63\x74\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x34\x62\x34\x62\x34\x62\x22\x20\x78\x3d\x22\
-\x36\x36\x22\x20\x79\x3d\x22\x32\x39\x2e\x37\x35\x22\x20\x68\x65\
-\x69\x67\x68\x74\x3d\x22\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
-\x31\x35\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\
-\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x06\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\
-\x39\x32\x2c\x35\x2e\x30\x38\x33\x33\x30\x32\x38\x20\x34\x2e\x35\
-\x2c\x31\x2e\x37\x37\x32\x39\x38\x31\x38\x20\x37\x2e\x38\x31\x30\
-\x35\x34\x30\x38\x2c\x35\x2e\x30\x38\x34\x37\x32\x33\x35\x20\x63\
-\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\x37\
-\x37\x30\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\
-\x2c\x30\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\
-\x2c\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\
-\x2e\x35\x37\x31\x31\x33\x36\x39\x20\x6c\x20\x2d\x33\x2e\x35\x39\
-\x36\x31\x32\x38\x33\x2c\x2d\x33\x2e\x35\x39\x37\x33\x31\x30\x31\
-\x39\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\
-\x39\x20\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\x37\
-\x34\x38\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\x33\
-\x2c\x34\x2e\x35\x31\x33\x35\x38\x36\x36\x20\x63\x20\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x20\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x34\x31\
-\x33\x34\x33\x34\x39\x20\x30\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\
-\x39\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\
-\x36\x32\x38\x31\x33\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\
-\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x20\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x39\x2c\x2d\x30\x2e\x30\x30\x31\x34\x32\x20\x7a\x22\x20\
-\x66\x69\x6c\x6c\x3d\x22\x23\x33\x33\x61\x34\x64\x66\x22\x20\x66\
-\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x30\x2e\x35\
-\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\
-\x76\x67\x3e\x0d\x0a\
-\x00\x00\x01\xbb\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x20\
-\x77\x69\x64\x74\x68\x3d\x22\x37\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\
-\x6e\x6f\x64\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\
-\x6e\x65\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\
-\x3d\x22\x31\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\
-\x73\x63\x61\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\
-\x3c\x67\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\
-\x6e\x73\x6c\x61\x74\x65\x28\x2d\x32\x39\x39\x2e\x30\x30\x30\x30\
-\x30\x30\x2c\x20\x2d\x31\x32\x39\x2e\x30\x30\x30\x30\x30\x30\x29\
-\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\
-\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\
-\x65\x28\x32\x39\x39\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x31\x32\
-\x39\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\
-\x2c\x31\x36\x20\x43\x31\x2c\x31\x37\x2e\x31\x20\x31\x2e\x39\x2c\
-\x31\x38\x20\x33\x2c\x31\x38\x20\x4c\x31\x31\x2c\x31\x38\x20\x43\
-\x31\x32\x2e\x31\x2c\x31\x38\x20\x31\x33\x2c\x31\x37\x2e\x31\x20\
-\x31\x33\x2c\x31\x36\x20\x4c\x31\x33\x2c\x34\x20\x4c\x31\x2c\x34\
-\x20\x4c\x31\x2c\x31\x36\x20\x4c\x31\x2c\x31\x36\x20\x5a\x20\x4d\
-\x31\x34\x2c\x31\x20\x4c\x31\x30\x2e\x35\x2c\x31\x20\x4c\x39\x2e\
-\x35\x2c\x30\x20\x4c\x34\x2e\x35\x2c\x30\x20\x4c\x33\x2e\x35\x2c\
-\x31\x20\x4c\x30\x2c\x31\x20\x4c\x30\x2c\x33\x20\x4c\x31\x34\x2c\
-\x33\x20\x4c\x31\x34\x2c\x31\x20\x4c\x31\x34\x2c\x31\x20\x5a\x22\
-\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\
-\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x0e\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\x39\
-\x37\x32\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\x33\
-\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\
-\x2d\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\
-\x35\x34\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\
-\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\x37\
-\x37\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\x2e\
-\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x33\x20\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\
-\x33\x2e\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\x36\
-\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x30\
-\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\
-\x31\x32\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\
-\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\x37\
-\x31\x31\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\x33\
-\x34\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\x2d\
-\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\x37\
-\x31\x32\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\x31\
-\x31\x33\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\
-\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\
-\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\
-\x33\x20\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\
-\x33\x61\x34\x64\x66\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\
-\x69\x74\x79\x3d\x22\x30\x2e\x35\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\
-\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x18\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x20\
-\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x22\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x67\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x66\x69\
-\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\
-\x6e\x73\x6c\x61\x74\x65\x28\x2d\x32\x35\x35\x2e\x30\x30\x30\x30\
-\x30\x30\x2c\x20\x2d\x33\x38\x31\x2e\x30\x30\x30\x30\x30\x30\x29\
-\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\
-\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\
-\x65\x28\x32\x35\x35\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x33\x38\
-\x31\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\
-\x34\x2c\x30\x20\x4c\x32\x2c\x30\x20\x43\x30\x2e\x39\x2c\x30\x20\
-\x30\x2c\x30\x2e\x39\x20\x30\x2c\x32\x20\x4c\x30\x2c\x31\x36\x20\
-\x43\x30\x2c\x31\x37\x2e\x31\x20\x30\x2e\x39\x2c\x31\x38\x20\x32\
-\x2c\x31\x38\x20\x4c\x31\x36\x2c\x31\x38\x20\x43\x31\x37\x2e\x31\
-\x2c\x31\x38\x20\x31\x38\x2c\x31\x37\x2e\x31\x20\x31\x38\x2c\x31\
-\x36\x20\x4c\x31\x38\x2c\x34\x20\x4c\x31\x34\x2c\x30\x20\x4c\x31\
-\x34\x2c\x30\x20\x5a\x20\x4d\x39\x2c\x31\x36\x20\x43\x37\x2e\x33\
-\x2c\x31\x36\x20\x36\x2c\x31\x34\x2e\x37\x20\x36\x2c\x31\x33\x20\
-\x43\x36\x2c\x31\x31\x2e\x33\x20\x37\x2e\x33\x2c\x31\x30\x20\x39\
-\x2c\x31\x30\x20\x43\x31\x30\x2e\x37\x2c\x31\x30\x20\x31\x32\x2c\
-\x31\x31\x2e\x33\x20\x31\x32\x2c\x31\x33\x20\x43\x31\x32\x2c\x31\
-\x34\x2e\x37\x20\x31\x30\x2e\x37\x2c\x31\x36\x20\x39\x2c\x31\x36\
-\x20\x4c\x39\x2c\x31\x36\x20\x5a\x20\x4d\x31\x32\x2c\x36\x20\x4c\
-\x32\x2c\x36\x20\x4c\x32\x2c\x32\x20\x4c\x31\x32\x2c\x32\x20\x4c\
-\x31\x32\x2c\x36\x20\x4c\x31\x32\x2c\x36\x20\x5a\x22\x2f\x3e\x0d\
-\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\
-\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x01\xf5\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\
-\x33\x62\x22\x20\x64\x3d\x22\x4d\x32\x30\x2c\x31\x38\x48\x34\x56\
-\x38\x48\x32\x30\x4d\x32\x30\x2c\x36\x48\x31\x32\x4c\x31\x30\x2c\
-\x34\x48\x34\x43\x32\x2e\x38\x39\x2c\x34\x20\x32\x2c\x34\x2e\x38\
-\x39\x20\x32\x2c\x36\x56\x31\x38\x41\x32\x2c\x32\x20\x30\x20\x30\
-\x2c\x30\x20\x34\x2c\x32\x30\x48\x32\x30\x41\x32\x2c\x32\x20\x30\
-\x20\x30\x2c\x30\x20\x32\x32\x2c\x31\x38\x56\x38\x43\x32\x32\x2c\
-\x36\x2e\x38\x39\x20\x32\x31\x2e\x31\x2c\x36\x20\x32\x30\x2c\x36\
-\x5a\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\
-\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\x65\x28\x30\x2e\x35\x29\
-\x20\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x31\x32\x2c\x20\x31\
-\x36\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\
-\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x64\
-\x3d\x22\x4d\x33\x2e\x39\x2c\x31\x32\x43\x33\x2e\x39\x2c\x31\x30\
-\x2e\x32\x39\x20\x35\x2e\x32\x39\x2c\x38\x2e\x39\x20\x37\x2c\x38\
-\x2e\x39\x48\x31\x31\x56\x37\x48\x37\x41\x35\x2c\x35\x20\x30\x20\
-\x30\x2c\x30\x20\x32\x2c\x31\x32\x41\x35\x2c\x35\x20\x30\x20\x30\
-\x2c\x30\x20\x37\x2c\x31\x37\x48\x31\x31\x56\x31\x35\x2e\x31\x48\
-\x37\x43\x35\x2e\x32\x39\x2c\x31\x35\x2e\x31\x20\x33\x2e\x39\x2c\
-\x31\x33\x2e\x37\x31\x20\x33\x2e\x39\x2c\x31\x32\x4d\x38\x2c\x31\
-\x33\x48\x31\x36\x56\x31\x31\x48\x38\x56\x31\x33\x4d\x31\x37\x2c\
-\x37\x48\x31\x33\x56\x38\x2e\x39\x48\x31\x37\x43\x31\x38\x2e\x37\
-\x31\x2c\x38\x2e\x39\x20\x32\x30\x2e\x31\x2c\x31\x30\x2e\x32\x39\
-\x20\x32\x30\x2e\x31\x2c\x31\x32\x43\x32\x30\x2e\x31\x2c\x31\x33\
-\x2e\x37\x31\x20\x31\x38\x2e\x37\x31\x2c\x31\x35\x2e\x31\x20\x31\
-\x37\x2c\x31\x35\x2e\x31\x48\x31\x33\x56\x31\x37\x48\x31\x37\x41\
-\x35\x2c\x35\x20\x30\x20\x30\x2c\x30\x20\x32\x32\x2c\x31\x32\x41\
-\x35\x2c\x35\x20\x30\x20\x30\x2c\x30\x20\x31\x37\x2c\x37\x5a\x22\
-\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\
-\x67\x3e\x0d\x0a\
-\x00\x00\x01\x1a\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\
-\x31\x34\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\
-\x68\x2d\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\
-\x23\x36\x61\x36\x65\x37\x31\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\
-\x68\x2d\x31\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\
-\x31\x33\x2e\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x36\x61\x36\x65\x37\x31\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x2c\
-\x35\x20\x68\x38\x20\x76\x38\x20\x68\x2d\x38\x20\x76\x2d\x38\x20\
-\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x36\x61\x36\x65\x37\x31\
-\x22\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\
-\x6e\x6f\x64\x64\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x52\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\
-\x20\x78\x3d\x22\x34\x2e\x35\x22\x20\x79\x3d\x22\x32\x22\x20\x77\
-\x69\x64\x74\x68\x3d\x22\x31\x35\x22\x20\x68\x65\x69\x67\x68\x74\
-\x3d\x22\x32\x30\x22\x20\x72\x78\x3d\x22\x31\x22\x20\x72\x79\x3d\
-\x22\x31\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x33\x31\x33\
-\x36\x33\x62\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\
-\x68\x3d\x22\x31\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x6c\x69\x6e\x65\
-\x20\x78\x31\x3d\x22\x36\x2e\x35\x22\x20\x79\x31\x3d\x22\x32\x30\
-\x22\x20\x78\x32\x3d\x22\x31\x37\x2e\x35\x22\x20\x79\x32\x3d\x22\
-\x32\x30\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x33\x31\x33\
-\x36\x33\x62\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\
-\x68\x3d\x22\x31\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x67\x20\x74\x72\
-\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\
-\x74\x65\x28\x30\x2c\x20\x31\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\
-\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x31\x32\x22\x20\
-\x63\x79\x3d\x22\x38\x22\x20\x72\x3d\x22\x34\x22\x20\x73\x74\x72\
-\x6f\x6b\x65\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\x72\x6f\x6b\x65\
-\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x2e\x35\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\
-\x3d\x22\x72\x6f\x74\x61\x74\x65\x28\x31\x33\x30\x29\x20\x74\x72\
-\x61\x6e\x73\x6c\x61\x74\x65\x28\x2d\x31\x32\x2e\x32\x2c\x20\x2d\
-\x32\x32\x2e\x38\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\
-\x20\x78\x3d\x22\x31\x32\x22\x20\x79\x3d\x22\x37\x2e\x35\x22\x20\
-\x77\x69\x64\x74\x68\x3d\x22\x36\x22\x20\x68\x65\x69\x67\x68\x74\
-\x3d\x22\x30\x2e\x35\x22\x20\x72\x78\x3d\x22\x30\x2e\x32\x35\x22\
-\x20\x72\x79\x3d\x22\x30\x2e\x32\x35\x22\x20\x73\x74\x72\x6f\x6b\
-\x65\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x73\x74\x72\x6f\
-\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x30\x2e\x35\x22\x2f\x3e\
-\x0d\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x20\x20\
-\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x38\x22\x20\x63\
-\x79\x3d\x22\x31\x34\x22\x20\x72\x3d\x22\x31\x2e\x35\x22\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x2f\x3e\x0d\
-\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\
-\x0a\
-\x00\x00\x00\x5b\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\
-\x31\x33\x36\x33\x62\x22\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x30\
-\x2c\x36\x20\x32\x34\x2c\x36\x20\x31\x32\x2c\x31\x38\x22\x2f\x3e\
-\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x01\xfe\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x35\x2e\x30\x38\x32\x33\x30\
-\x32\x38\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x2d\x33\x2e\
-\x33\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\
-\x20\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\
-\x35\x34\x30\x38\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\
-\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x2d\x30\x2e\
-\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x33\x20\x2d\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\
-\x20\x2d\x33\x2e\x35\x39\x37\x33\x31\x30\x31\x37\x2c\x2d\x33\x2e\
-\x35\x39\x36\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\
-\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x31\x2c\x2d\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x31\x39\x31\x2c\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\
-\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\x38\x20\x4c\x20\x34\
-\x2e\x35\x31\x32\x35\x38\x36\x36\x2c\x30\x2e\x36\x31\x38\x32\x38\
-\x34\x33\x37\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x34\x31\x33\x34\
-\x33\x34\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x30\
-\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x30\x2e\x31\x35\x36\
-\x32\x38\x31\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x30\
-\x2e\x31\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\
-\x32\x34\x33\x20\x2d\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\
-\x37\x31\x31\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x33\x31\x33\x36\x33\x62\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\
-\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xa3\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x33\x32\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x61\
-\x62\x39\x62\x38\x22\x20\x78\x3d\x22\x34\x22\x20\x79\x3d\x22\x36\
-\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\x65\x69\
-\x67\x68\x74\x3d\x22\x31\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x61\x62\x39\
-\x62\x38\x22\x20\x78\x3d\x22\x34\x22\x20\x79\x3d\x22\x31\x34\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\x65\x69\x67\
-\x68\x74\x3d\x22\x31\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0d\x0a\
-\x00\x00\x01\x8d\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x39\x38\x22\x20\
-\x77\x69\x64\x74\x68\x3d\x22\x39\x38\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x22\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x37\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x67\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x66\x69\
-\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\
-\x6e\x73\x6c\x61\x74\x65\x28\x2d\x33\x34\x31\x2e\x30\x30\x30\x30\
-\x30\x30\x2c\x20\x2d\x38\x39\x2e\x30\x30\x30\x30\x30\x30\x29\x22\
-\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\
-\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\
-\x28\x33\x34\x31\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x38\x39\x2e\
-\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x34\x2c\
-\x31\x2e\x34\x20\x4c\x31\x32\x2e\x36\x2c\x30\x20\x4c\x37\x2c\x35\
-\x2e\x36\x20\x4c\x31\x2e\x34\x2c\x30\x20\x4c\x30\x2c\x31\x2e\x34\
-\x20\x4c\x35\x2e\x36\x2c\x37\x20\x4c\x30\x2c\x31\x32\x2e\x36\x20\
-\x4c\x31\x2e\x34\x2c\x31\x34\x20\x4c\x37\x2c\x38\x2e\x34\x20\x4c\
-\x31\x32\x2e\x36\x2c\x31\x34\x20\x4c\x31\x34\x2c\x31\x32\x2e\x36\
-\x20\x4c\x38\x2e\x34\x2c\x37\x20\x4c\x31\x34\x2c\x31\x2e\x34\x20\
-\x5a\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\x67\x3e\
-\x0d\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x3c\x2f\
-\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x01\xf8\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x30\x2e\x39\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\x74\
-\x65\x28\x30\x2c\x20\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\
-\x33\x62\x22\x20\x64\x3d\x22\x4d\x31\x39\x2c\x32\x30\x48\x34\x43\
-\x32\x2e\x38\x39\x2c\x32\x30\x20\x32\x2c\x31\x39\x2e\x31\x20\x32\
-\x2c\x31\x38\x56\x36\x43\x32\x2c\x34\x2e\x38\x39\x20\x32\x2e\x38\
-\x39\x2c\x34\x20\x34\x2c\x34\x48\x31\x30\x4c\x31\x32\x2c\x36\x48\
-\x31\x39\x41\x32\x2c\x32\x20\x30\x20\x30\x2c\x31\x20\x32\x31\x2c\
-\x38\x48\x32\x31\x4c\x34\x2c\x38\x56\x31\x38\x4c\x36\x2e\x31\x34\
-\x2c\x31\x30\x48\x32\x33\x2e\x32\x31\x4c\x32\x30\x2e\x39\x33\x2c\
-\x31\x38\x2e\x35\x43\x32\x30\x2e\x37\x2c\x31\x39\x2e\x33\x37\x20\
-\x31\x39\x2e\x39\x32\x2c\x32\x30\x20\x31\x39\x2c\x32\x30\x5a\x22\
-\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x30\x2e\x37\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\
-\x28\x32\x2c\x20\x33\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x61\x62\x39\x62\
-\x38\x22\x20\x64\x3d\x22\x4d\x31\x33\x2c\x39\x56\x33\x2e\x35\x4c\
-\x31\x38\x2e\x35\x2c\x39\x4d\x36\x2c\x32\x43\x34\x2e\x38\x39\x2c\
-\x32\x20\x34\x2c\x32\x2e\x38\x39\x20\x34\x2c\x34\x56\x32\x30\x41\
-\x32\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x36\x2c\x32\x32\x48\x31\
-\x38\x41\x32\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x32\x30\x2c\x32\
-\x30\x56\x38\x4c\x31\x34\x2c\x32\x48\x36\x5a\x22\x20\x2f\x3e\x0d\
-\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x3c\x70\x6f\x6c\x79\
-\x67\x6f\x6e\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\
-\x62\x22\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x35\x2c\x31\x33\x2e\
-\x35\x20\x31\x38\x2e\x35\x2c\x31\x33\x2e\x35\x20\x31\x38\x2e\x35\
-\x2c\x31\x38\x2e\x35\x20\x34\x2c\x32\x30\x22\x2f\x3e\x0d\x0a\x3c\
-\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x2d\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x33\x36\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\
-\x63\x61\x6c\x65\x28\x32\x30\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\
-\x74\x65\x28\x31\x30\x20\x37\x2e\x35\x29\x20\x72\x6f\x74\x61\x74\
-\x65\x28\x39\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\x39\x37\
-\x32\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\x33\x31\
-\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\x2d\
-\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\x35\
-\x34\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x37\
-\x37\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\
-\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\x2e\x34\
-\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\
-\x20\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\x33\
-\x2e\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\x36\x31\
-\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x30\x2e\
-\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\
-\x32\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\
-\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\x37\x31\
-\x31\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\x33\x34\
-\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\x2d\x30\
-\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\
-\x32\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x2d\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\x31\x31\
-\x33\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\
-\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\
-\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x33\
-\x20\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\x31\x37\
-\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x34\x62\
-\x34\x62\x34\x62\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\
-\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\
-\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\x53\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\
-\x33\x62\x22\x20\x64\x3d\x22\x4d\x32\x30\x2c\x31\x34\x48\x34\x56\
-\x31\x30\x48\x32\x30\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0d\x0a\
-\x00\x00\x01\xfb\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\x39\
-\x37\x32\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\x33\
-\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\
-\x2d\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\
-\x35\x34\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\
-\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\x37\
-\x37\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\x2e\
-\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x33\x20\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\
-\x33\x2e\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\x36\
-\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x30\
-\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\
-\x31\x32\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\
-\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\x37\
-\x31\x31\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\x33\
-\x34\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\x2d\
-\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\x37\
-\x31\x32\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\x31\
-\x31\x33\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\
-\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\
-\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\
-\x33\x20\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\
-\x31\x33\x36\x33\x62\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x07\x82\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x32\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\
-\x61\x74\x72\x69\x78\x28\x30\x2e\x38\x31\x2c\x30\x2c\x30\x2c\x30\
-\x2e\x39\x2c\x2d\x32\x31\x2e\x36\x37\x39\x36\x39\x39\x2c\x2d\x31\
-\x30\x31\x2e\x35\x33\x38\x39\x33\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x63\x30\
-\x38\x63\x66\x66\x22\x20\x64\x3d\x22\x4d\x20\x35\x32\x2e\x30\x31\
-\x31\x39\x37\x34\x2c\x31\x31\x35\x2e\x35\x39\x38\x38\x31\x20\x48\
-\x20\x31\x35\x36\x2e\x30\x36\x35\x38\x35\x20\x63\x20\x31\x31\x2e\
-\x30\x38\x2c\x30\x20\x32\x30\x2c\x38\x2e\x39\x32\x20\x32\x30\x2c\
-\x32\x30\x20\x76\x20\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\
-\x30\x2c\x31\x31\x2e\x30\x38\x20\x2d\x38\x2e\x39\x32\x2c\x32\x30\
-\x20\x2d\x32\x30\x2c\x32\x30\x20\x68\x20\x2d\x31\x33\x2e\x30\x30\
-\x36\x37\x33\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\x34\x20\x6c\x20\
-\x2d\x30\x2e\x34\x30\x30\x34\x33\x2c\x32\x31\x2e\x30\x34\x39\x32\
-\x37\x20\x2d\x32\x35\x2e\x36\x31\x33\x30\x34\x2c\x2d\x32\x31\x2e\
-\x30\x34\x39\x32\x37\x20\x48\x20\x39\x31\x2e\x30\x33\x32\x31\x37\
-\x38\x20\x37\x38\x2e\x30\x32\x35\x34\x34\x33\x20\x36\x35\x2e\x30\
-\x31\x38\x37\x30\x39\x20\x35\x32\x2e\x30\x31\x31\x39\x37\x34\x20\
-\x63\x20\x2d\x31\x31\x2e\x30\x38\x2c\x30\x20\x2d\x32\x30\x2c\x2d\
-\x38\x2e\x39\x32\x20\x2d\x32\x30\x2c\x2d\x32\x30\x20\x76\x20\x2d\
-\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\x2d\x31\x31\
-\x2e\x30\x38\x20\x38\x2e\x39\x32\x2c\x2d\x32\x30\x20\x32\x30\x2c\
-\x2d\x32\x30\x20\x7a\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0d\x0a\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\
-\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x38\x2c\x30\x2c\x30\
-\x2c\x30\x2e\x38\x2c\x34\x37\x2e\x39\x36\x30\x30\x32\x33\x2c\x39\
-\x2e\x36\x33\x39\x39\x37\x35\x38\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\
-\x33\x36\x33\x62\x22\x20\x64\x3d\x22\x4d\x20\x36\x2e\x35\x2c\x31\
-\x35\x2e\x37\x20\x30\x2c\x31\x30\x2e\x35\x20\x41\x20\x33\x34\x2e\
-\x33\x39\x36\x2c\x33\x34\x2e\x33\x39\x36\x20\x30\x20\x30\x20\x31\
-\x20\x35\x2e\x32\x30\x39\x2c\x35\x2e\x33\x30\x38\x20\x32\x39\x2e\
-\x31\x33\x33\x2c\x32\x39\x2e\x31\x33\x33\x20\x30\x20\x30\x20\x31\
-\x20\x38\x2e\x39\x2c\x32\x2e\x38\x20\x32\x30\x2e\x36\x38\x38\x2c\
-\x32\x30\x2e\x36\x38\x38\x20\x30\x20\x30\x20\x31\x20\x31\x35\x2e\
-\x33\x37\x36\x2c\x30\x2e\x34\x37\x31\x20\x32\x38\x2e\x36\x37\x2c\
-\x32\x38\x2e\x36\x37\x20\x30\x20\x30\x20\x31\x20\x32\x30\x2e\x37\
-\x2c\x30\x20\x32\x33\x2e\x35\x38\x38\x2c\x32\x33\x2e\x35\x38\x38\
-\x20\x30\x20\x30\x20\x31\x20\x32\x35\x2e\x31\x38\x38\x2c\x30\x2e\
-\x34\x31\x32\x20\x31\x39\x2e\x34\x31\x32\x2c\x31\x39\x2e\x34\x31\
-\x32\x20\x30\x20\x30\x20\x31\x20\x32\x38\x2e\x33\x35\x2c\x31\x2e\
-\x33\x20\x32\x30\x2e\x32\x32\x31\x2c\x32\x30\x2e\x32\x32\x31\x20\
-\x30\x20\x30\x20\x31\x20\x33\x32\x2e\x33\x38\x2c\x33\x2e\x33\x33\
-\x35\x20\x31\x37\x2e\x34\x39\x35\x2c\x31\x37\x2e\x34\x39\x35\x20\
-\x30\x20\x30\x20\x31\x20\x33\x34\x2e\x33\x2c\x34\x2e\x38\x20\x71\
-\x20\x32\x2e\x35\x2c\x32\x2e\x32\x20\x33\x2e\x39\x2c\x35\x2e\x31\
-\x35\x20\x31\x2e\x34\x2c\x32\x2e\x39\x35\x20\x31\x2e\x34\x2c\x36\
-\x2e\x33\x35\x20\x61\x20\x32\x31\x2e\x32\x36\x39\x2c\x32\x31\x2e\
-\x32\x36\x39\x20\x30\x20\x30\x20\x31\x20\x2d\x30\x2e\x32\x33\x39\
-\x2c\x33\x2e\x32\x38\x20\x71\x20\x2d\x30\x2e\x33\x35\x2c\x32\x2e\
-\x32\x33\x39\x20\x2d\x31\x2e\x32\x31\x31\x2c\x34\x2e\x30\x32\x20\
-\x2d\x31\x2e\x34\x35\x2c\x33\x20\x2d\x33\x2e\x36\x35\x2c\x35\x2e\
-\x33\x35\x20\x2d\x32\x2e\x32\x2c\x32\x2e\x33\x35\x20\x2d\x34\x2e\
-\x37\x35\x2c\x34\x2e\x33\x35\x20\x2d\x32\x2e\x35\x35\x2c\x32\x20\
-\x2d\x34\x2e\x37\x35\x2c\x34\x2e\x32\x20\x2d\x32\x2e\x32\x2c\x32\
-\x2e\x32\x20\x2d\x33\x2e\x36\x35\x2c\x34\x2e\x39\x20\x2d\x31\x2e\
-\x34\x35\x2c\x32\x2e\x37\x20\x2d\x31\x2e\x34\x35\x2c\x36\x2e\x35\
-\x20\x76\x20\x35\x2e\x36\x20\x68\x20\x2d\x37\x2e\x38\x20\x71\x20\
-\x2d\x30\x2e\x35\x2c\x2d\x31\x2e\x37\x20\x2d\x30\x2e\x37\x35\x2c\
-\x2d\x33\x2e\x37\x20\x2d\x30\x2e\x32\x35\x2c\x2d\x32\x20\x2d\x30\
-\x2e\x32\x35\x2c\x2d\x33\x2e\x37\x20\x61\x20\x32\x31\x2e\x33\x32\
-\x32\x2c\x32\x31\x2e\x33\x32\x32\x20\x30\x20\x30\x20\x31\x20\x30\
-\x2e\x32\x36\x38\x2c\x2d\x33\x2e\x34\x36\x34\x20\x51\x20\x31\x31\
-\x2e\x37\x31\x33\x2c\x34\x31\x2e\x35\x34\x34\x20\x31\x32\x2e\x35\
-\x2c\x33\x39\x2e\x38\x20\x31\x33\x2e\x39\x2c\x33\x36\x2e\x37\x20\
-\x31\x36\x2c\x33\x34\x2e\x33\x35\x20\x31\x38\x2e\x31\x2c\x33\x32\
-\x20\x32\x30\x2e\x35\x2c\x33\x30\x2e\x31\x20\x32\x32\x2e\x39\x2c\
-\x32\x38\x2e\x32\x20\x32\x35\x2c\x32\x36\x2e\x32\x35\x20\x41\x20\
-\x32\x32\x2e\x32\x31\x35\x2c\x32\x32\x2e\x32\x31\x35\x20\x30\x20\
-\x30\x20\x30\x20\x32\x37\x2e\x35\x35\x37\x2c\x32\x33\x2e\x34\x35\
-\x31\x20\x31\x39\x2e\x33\x38\x38\x2c\x31\x39\x2e\x33\x38\x38\x20\
-\x30\x20\x30\x20\x30\x20\x32\x38\x2e\x35\x2c\x32\x32\x2e\x31\x20\
-\x38\x2e\x39\x37\x37\x2c\x38\x2e\x39\x37\x37\x20\x30\x20\x30\x20\
-\x30\x20\x32\x39\x2e\x38\x34\x39\x2c\x31\x38\x2e\x30\x38\x35\x20\
-\x31\x31\x2e\x32\x34\x34\x2c\x31\x31\x2e\x32\x34\x34\x20\x30\x20\
-\x30\x20\x30\x20\x32\x39\x2e\x39\x2c\x31\x37\x20\x38\x2e\x32\x34\
-\x31\x2c\x38\x2e\x32\x34\x31\x20\x30\x20\x30\x20\x30\x20\x32\x37\
-\x2e\x36\x30\x35\x2c\x31\x31\x2e\x32\x37\x20\x31\x31\x2e\x30\x30\
-\x36\x2c\x31\x31\x2e\x30\x30\x36\x20\x30\x20\x30\x20\x30\x20\x32\
-\x37\x2e\x32\x2c\x31\x30\x2e\x38\x35\x20\x39\x2e\x30\x31\x32\x2c\
-\x39\x2e\x30\x31\x32\x20\x30\x20\x30\x20\x30\x20\x32\x32\x2e\x36\
-\x35\x32\x2c\x38\x2e\x34\x37\x32\x20\x31\x33\x2e\x32\x32\x31\x2c\
-\x31\x33\x2e\x32\x32\x31\x20\x30\x20\x30\x20\x30\x20\x31\x39\x2e\
-\x39\x2c\x38\x2e\x32\x20\x31\x35\x2e\x30\x30\x35\x2c\x31\x35\x2e\
-\x30\x30\x35\x20\x30\x20\x30\x20\x30\x20\x31\x35\x2e\x34\x37\x36\
-\x2c\x38\x2e\x38\x33\x33\x20\x31\x33\x2e\x30\x36\x31\x2c\x31\x33\
-\x2e\x30\x36\x31\x20\x30\x20\x30\x20\x30\x20\x31\x32\x2e\x34\x35\
-\x2c\x31\x30\x2e\x32\x20\x32\x30\x2e\x37\x32\x38\x2c\x32\x30\x2e\
-\x37\x32\x38\x20\x30\x20\x30\x20\x30\x20\x38\x2e\x34\x36\x36\x2c\
-\x31\x33\x2e\x34\x32\x35\x20\x32\x36\x2e\x32\x30\x39\x2c\x32\x36\
-\x2e\x32\x30\x39\x20\x30\x20\x30\x20\x30\x20\x36\x2e\x35\x2c\x31\
-\x35\x2e\x37\x20\x5a\x20\x6d\x20\x33\x2e\x35\x32\x36\x2c\x35\x31\
-\x2e\x39\x34\x20\x41\x20\x38\x2e\x38\x36\x2c\x38\x2e\x38\x36\x20\
-\x30\x20\x30\x20\x30\x20\x39\x2e\x38\x2c\x36\x39\x2e\x37\x20\x71\
-\x20\x30\x2c\x32\x2e\x37\x20\x32\x2c\x34\x2e\x37\x20\x41\x20\x38\
-\x2e\x33\x31\x37\x2c\x38\x2e\x33\x31\x37\x20\x30\x20\x30\x20\x30\
-\x20\x31\x31\x2e\x38\x36\x33\x2c\x37\x34\x2e\x34\x36\x32\x20\x36\
-\x2e\x34\x31\x38\x2c\x36\x2e\x34\x31\x38\x20\x30\x20\x30\x20\x30\
-\x20\x31\x36\x2e\x35\x2c\x37\x36\x2e\x34\x20\x38\x2e\x36\x30\x35\
-\x2c\x38\x2e\x36\x30\x35\x20\x30\x20\x30\x20\x30\x20\x31\x37\x2e\
-\x31\x32\x32\x2c\x37\x36\x2e\x33\x37\x38\x20\x36\x2e\x34\x36\x31\
-\x2c\x36\x2e\x34\x36\x31\x20\x30\x20\x30\x20\x30\x20\x32\x31\x2e\
-\x33\x2c\x37\x34\x2e\x35\x35\x20\x51\x20\x32\x33\x2e\x32\x2c\x37\
-\x32\x2e\x37\x20\x32\x33\x2e\x32\x2c\x36\x39\x2e\x37\x20\x41\x20\
-\x36\x2e\x32\x32\x35\x2c\x36\x2e\x32\x32\x35\x20\x30\x20\x30\x20\
-\x30\x20\x32\x32\x2e\x36\x32\x31\x2c\x36\x37\x2e\x30\x32\x39\x20\
-\x36\x2e\x39\x35\x35\x2c\x36\x2e\x39\x35\x35\x20\x30\x20\x30\x20\
-\x30\x20\x32\x31\x2e\x31\x35\x2c\x36\x35\x20\x38\x2e\x34\x37\x38\
-\x2c\x38\x2e\x34\x37\x38\x20\x30\x20\x30\x20\x30\x20\x32\x30\x2e\
-\x36\x32\x39\x2c\x36\x34\x2e\x35\x33\x32\x20\x36\x2e\x33\x32\x35\
-\x2c\x36\x2e\x33\x32\x35\x20\x30\x20\x30\x20\x30\x20\x31\x36\x2e\
-\x35\x2c\x36\x33\x20\x71\x20\x2d\x31\x2e\x32\x32\x35\x2c\x30\x20\
-\x2d\x32\x2e\x32\x33\x38\x2c\x30\x2e\x32\x36\x34\x20\x41\x20\x35\
-\x2e\x36\x39\x38\x2c\x35\x2e\x36\x39\x38\x20\x30\x20\x30\x20\x30\
-\x20\x31\x31\x2e\x35\x35\x2c\x36\x34\x2e\x38\x20\x35\x2e\x39\x37\
-\x36\x2c\x35\x2e\x39\x37\x36\x20\x30\x20\x30\x20\x30\x20\x31\x30\
-\x2e\x30\x32\x36\x2c\x36\x37\x2e\x36\x34\x20\x5a\x22\x2f\x3e\x0d\
-\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\
-\x0a\
-\x00\x00\x00\x83\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\
-\x33\x62\x22\x20\x64\x3d\x22\x4d\x34\x2c\x38\x48\x38\x56\x34\x48\
-\x32\x30\x56\x31\x36\x48\x31\x36\x56\x32\x30\x48\x34\x56\x38\x4d\
-\x31\x36\x2c\x38\x56\x31\x34\x48\x31\x38\x56\x36\x48\x31\x30\x56\
-\x38\x48\x31\x36\x4d\x36\x2c\x31\x32\x56\x31\x38\x48\x31\x34\x56\
-\x31\x32\x48\x36\x5a\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0d\x0a\
-\x00\x00\x03\x3c\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x32\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\
-\x61\x74\x72\x69\x78\x28\x30\x2e\x38\x31\x2c\x30\x2c\x30\x2c\x30\
-\x2e\x39\x2c\x2d\x32\x31\x2e\x36\x37\x39\x36\x39\x39\x2c\x2d\x31\
-\x30\x31\x2e\x35\x33\x38\x39\x33\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x66\x66\
-\x66\x66\x38\x63\x22\x20\x64\x3d\x22\x4d\x20\x35\x32\x2e\x30\x31\
-\x31\x39\x37\x34\x2c\x31\x31\x35\x2e\x35\x39\x38\x38\x31\x20\x48\
-\x20\x31\x35\x36\x2e\x30\x36\x35\x38\x35\x20\x63\x20\x31\x31\x2e\
-\x30\x38\x2c\x30\x20\x32\x30\x2c\x38\x2e\x39\x32\x20\x32\x30\x2c\
-\x32\x30\x20\x76\x20\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\
-\x30\x2c\x31\x31\x2e\x30\x38\x20\x2d\x38\x2e\x39\x32\x2c\x32\x30\
-\x20\x2d\x32\x30\x2c\x32\x30\x20\x68\x20\x2d\x31\x33\x2e\x30\x30\
-\x36\x37\x33\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\x34\x20\x6c\x20\
-\x2d\x30\x2e\x34\x30\x30\x34\x33\x2c\x32\x31\x2e\x30\x34\x39\x32\
-\x37\x20\x2d\x32\x35\x2e\x36\x31\x33\x30\x34\x2c\x2d\x32\x31\x2e\
-\x30\x34\x39\x32\x37\x20\x48\x20\x39\x31\x2e\x30\x33\x32\x31\x37\
-\x38\x20\x37\x38\x2e\x30\x32\x35\x34\x34\x33\x20\x36\x35\x2e\x30\
-\x31\x38\x37\x30\x39\x20\x35\x32\x2e\x30\x31\x31\x39\x37\x34\x20\
-\x63\x20\x2d\x31\x31\x2e\x30\x38\x2c\x30\x20\x2d\x32\x30\x2c\x2d\
-\x38\x2e\x39\x32\x20\x2d\x32\x30\x2c\x2d\x32\x30\x20\x76\x20\x2d\
-\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\x2d\x31\x31\
-\x2e\x30\x38\x20\x38\x2e\x39\x32\x2c\x2d\x32\x30\x20\x32\x30\x2c\
-\x2d\x32\x30\x20\x7a\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0d\x0a\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\
-\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x2d\x31\x2e\x33\x2c\x30\x2c\
-\x30\x2c\x2d\x31\x2e\x33\x2c\x2d\x33\x31\x2e\x32\x39\x32\x39\x38\
-\x37\x2c\x35\x2e\x32\x34\x33\x31\x35\x32\x39\x29\x22\x3e\x0d\x0a\
-\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x73\x74\x72\x6f\x6b\x65\
-\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x73\x74\x72\x6f\x6b\
-\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x34\x22\x20\x66\x69\x6c\x6c\
-\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x64\x3d\x22\x6d\x20\x2d\x35\x30\
-\x2e\x30\x30\x30\x30\x30\x32\x2c\x2d\x34\x35\x2e\x35\x36\x35\x37\
-\x35\x20\x2d\x31\x31\x2e\x36\x30\x34\x37\x32\x32\x2c\x32\x30\x2e\
-\x31\x35\x35\x36\x34\x37\x20\x2d\x31\x31\x2e\x36\x30\x34\x37\x32\
-\x32\x2c\x32\x30\x2e\x31\x35\x35\x36\x34\x37\x33\x20\x2d\x31\x31\
-\x2e\x36\x35\x32\x39\x34\x32\x2c\x2d\x32\x30\x2e\x31\x32\x37\x38\
-\x30\x37\x33\x20\x2d\x31\x31\x2e\x36\x35\x32\x39\x34\x31\x2c\x2d\
-\x32\x30\x2e\x31\x32\x37\x38\x30\x38\x20\x32\x33\x2e\x32\x35\x37\
-\x36\x36\x34\x2c\x2d\x30\x2e\x30\x32\x37\x38\x34\x20\x7a\x22\x20\
-\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x3c\x72\
-\x65\x63\x74\x20\x77\x69\x64\x74\x68\x3d\x22\x35\x22\x20\x68\x65\
-\x69\x67\x68\x74\x3d\x22\x35\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\
-\x33\x31\x33\x36\x33\x62\x22\x20\x78\x3d\x22\x36\x31\x2e\x34\x35\
-\x36\x37\x38\x37\x22\x20\x79\x3d\x22\x35\x31\x2e\x39\x36\x31\x30\
-\x37\x31\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x72\x65\x63\x74\x20\x77\
-\x69\x64\x74\x68\x3d\x22\x35\x22\x20\x68\x65\x69\x67\x68\x74\x3d\
-\x22\x31\x35\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\
-\x33\x62\x22\x20\x78\x3d\x22\x36\x31\x2e\x34\x35\x36\x37\x38\x37\
-\x22\x20\x79\x3d\x22\x33\x30\x2e\x39\x36\x31\x30\x37\x31\x22\x2f\
-\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xd1\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\
-\x31\x34\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\
-\x68\x2d\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\
-\x23\x32\x37\x32\x62\x32\x66\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\
-\x68\x2d\x31\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\
-\x31\x33\x2e\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x32\x37\x32\x62\x32\x66\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\
-\x00\x00\x01\xc2\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\
-\x31\x34\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\
-\x68\x2d\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\
-\x23\x36\x61\x36\x65\x37\x31\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\
-\x68\x2d\x31\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\
-\x31\x33\x2e\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x36\x61\x36\x65\x37\x31\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x2c\
-\x35\x20\x68\x38\x20\x76\x38\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\
-\x37\x2e\x31\x20\x68\x2d\x37\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\
-\x6c\x3d\x22\x23\x36\x61\x36\x65\x37\x31\x22\x20\x66\x69\x6c\x6c\
-\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x2f\
-\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
-\x4d\x31\x33\x2c\x31\x33\x20\x68\x2d\x38\x20\x76\x2d\x38\x20\x68\
-\x30\x2e\x39\x20\x76\x37\x2e\x31\x20\x68\x37\x2e\x31\x20\x7a\x22\
-\x20\x66\x69\x6c\x6c\x3d\x22\x23\x36\x61\x36\x65\x37\x31\x22\x20\
-\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\
-\x64\x64\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x64\x3d\x22\x4d\x31\x33\x2c\x35\x20\x4c\x20\x35\x2c\x31\x33\
-\x20\x76\x2d\x38\x20\x68\x38\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x36\x61\x36\x65\x37\x31\x22\x20\x66\x69\x6c\x6c\x2d\x72\
-\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x2f\x3e\x0d\
-\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\
-\x0a\
-\x00\x00\x03\xe3\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\
-\x61\x74\x72\x69\x78\x28\x30\x2e\x36\x32\x31\x36\x34\x32\x38\x34\
-\x2c\x30\x2c\x30\x2c\x30\x2e\x36\x32\x33\x35\x37\x31\x31\x2c\x2d\
-\x30\x2e\x36\x33\x35\x33\x30\x34\x33\x34\x2c\x33\x2e\x36\x38\x31\
-\x36\x33\x31\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\
-\x65\x6e\x6f\x64\x64\x22\x20\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\
-\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\x64\x3d\x22\x4d\x20\
-\x37\x39\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\x30\x20\x41\x20\x37\
-\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x31\x30\x2c\x38\x30\
-\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x38\x30\x2c\
-\x31\x35\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\
-\x31\x35\x30\x2c\x38\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\
-\x20\x30\x20\x38\x30\x2c\x31\x30\x20\x37\x30\x2c\x37\x30\x20\x30\
-\x20\x30\x20\x30\x20\x37\x39\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\
-\x30\x20\x5a\x20\x6d\x20\x33\x31\x2e\x31\x33\x36\x37\x31\x35\x2c\
-\x32\x38\x2e\x35\x20\x63\x20\x33\x2e\x31\x38\x36\x33\x32\x2c\x2d\
-\x30\x2e\x30\x30\x38\x37\x20\x36\x2e\x33\x37\x36\x33\x36\x2c\x31\
-\x2e\x32\x31\x31\x32\x30\x36\x20\x38\x2e\x38\x31\x34\x34\x36\x2c\
-\x33\x2e\x36\x36\x30\x31\x35\x36\x20\x34\x2e\x38\x37\x32\x37\x2c\
-\x34\x2e\x38\x39\x36\x35\x20\x34\x2e\x38\x39\x32\x39\x37\x2c\x31\
-\x32\x2e\x38\x35\x37\x37\x34\x34\x20\x30\x2e\x30\x34\x36\x39\x2c\
-\x31\x37\x2e\x37\x37\x37\x33\x34\x34\x20\x4c\x20\x39\x38\x2e\x35\
-\x31\x39\x35\x33\x31\x2c\x38\x31\x2e\x35\x31\x35\x36\x32\x35\x20\
-\x31\x31\x39\x2e\x38\x31\x38\x33\x36\x2c\x31\x30\x33\x2e\x31\x31\
-\x35\x32\x33\x20\x63\x20\x34\x2e\x38\x30\x36\x32\x2c\x34\x2e\x38\
-\x38\x34\x36\x20\x34\x2e\x37\x34\x30\x32\x32\x2c\x31\x32\x2e\x37\
-\x39\x34\x39\x38\x20\x2d\x30\x2e\x31\x34\x36\x34\x38\x2c\x31\x37\
-\x2e\x36\x37\x31\x38\x38\x20\x2d\x34\x2e\x38\x38\x38\x31\x2c\x34\
-\x2e\x38\x37\x34\x38\x20\x2d\x31\x32\x2e\x37\x34\x35\x39\x39\x2c\
-\x34\x2e\x38\x36\x32\x34\x31\x20\x2d\x31\x37\x2e\x35\x35\x30\x37\
-\x39\x2c\x2d\x30\x2e\x30\x32\x31\x35\x20\x4c\x20\x38\x30\x2e\x39\
-\x36\x38\x37\x35\x2c\x39\x39\x2e\x33\x31\x36\x34\x30\x36\x20\x35\
-\x39\x2e\x37\x37\x37\x33\x34\x34\x2c\x31\x32\x30\x2e\x38\x30\x36\
-\x36\x34\x20\x63\x20\x2d\x34\x2e\x38\x34\x38\x39\x2c\x34\x2e\x39\
-\x32\x33\x38\x20\x2d\x31\x32\x2e\x37\x33\x33\x31\x37\x35\x2c\x34\
-\x2e\x39\x34\x34\x37\x38\x20\x2d\x31\x37\x2e\x36\x30\x39\x33\x37\
-\x35\x2c\x30\x2e\x30\x34\x36\x39\x20\x2d\x34\x2e\x38\x37\x32\x37\
-\x2c\x2d\x34\x2e\x38\x39\x36\x35\x20\x2d\x34\x2e\x38\x39\x33\x36\
-\x37\x35\x2c\x2d\x31\x32\x2e\x38\x35\x37\x37\x35\x20\x2d\x30\x2e\
-\x30\x34\x36\x38\x37\x2c\x2d\x31\x37\x2e\x37\x37\x37\x33\x35\x20\
-\x4c\x20\x36\x33\x2e\x33\x39\x36\x34\x38\x34\x2c\x38\x31\x2e\x34\
-\x39\x36\x30\x39\x34\x20\x34\x32\x2e\x30\x39\x39\x36\x30\x39\x2c\
-\x35\x39\x2e\x38\x39\x38\x34\x33\x38\x20\x63\x20\x2d\x34\x2e\x38\
-\x30\x36\x39\x2c\x2d\x34\x2e\x38\x38\x34\x36\x20\x2d\x34\x2e\x37\
-\x34\x32\x31\x36\x38\x2c\x2d\x31\x32\x2e\x37\x39\x36\x39\x32\x39\
-\x20\x30\x2e\x31\x34\x34\x35\x33\x32\x2c\x2d\x31\x37\x2e\x36\x37\
-\x33\x38\x32\x39\x20\x34\x2e\x38\x38\x38\x31\x2c\x2d\x34\x2e\x38\
-\x37\x34\x31\x20\x31\x32\x2e\x37\x34\x37\x39\x33\x34\x2c\x2d\x34\
-\x2e\x38\x36\x32\x34\x31\x35\x20\x31\x37\x2e\x35\x35\x32\x37\x33\
-\x34\x2c\x30\x2e\x30\x32\x31\x34\x38\x20\x4c\x20\x38\x30\x2e\x39\
-\x34\x39\x32\x31\x39\x2c\x36\x33\x2e\x36\x39\x37\x32\x36\x36\x20\
-\x31\x30\x32\x2e\x31\x34\x30\x36\x32\x2c\x34\x32\x2e\x32\x30\x37\
-\x30\x33\x31\x20\x63\x20\x32\x2e\x34\x32\x34\x34\x36\x2c\x2d\x32\
-\x2e\x34\x36\x31\x39\x20\x35\x2e\x36\x30\x36\x36\x36\x2c\x2d\x33\
-\x2e\x36\x39\x38\x33\x36\x39\x20\x38\x2e\x37\x39\x32\x39\x37\x2c\
-\x2d\x33\x2e\x37\x30\x37\x30\x33\x31\x20\x7a\x22\x20\x66\x69\x6c\
-\x6c\x3d\x22\x23\x32\x64\x39\x33\x63\x38\x22\x20\x66\x69\x6c\x6c\
-\x2d\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x30\x2e\x35\x22\x2f\x3e\
-\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0d\x0a\
-\x00\x00\x01\xc2\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\
-\x31\x34\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\
-\x68\x2d\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\
-\x23\x32\x37\x32\x62\x32\x66\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\
-\x68\x2d\x31\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\
-\x31\x33\x2e\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x32\x37\x32\x62\x32\x66\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x2c\
-\x35\x20\x68\x38\x20\x76\x38\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\
-\x37\x2e\x31\x20\x68\x2d\x37\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\
-\x6c\x3d\x22\x23\x32\x37\x32\x62\x32\x66\x22\x20\x66\x69\x6c\x6c\
-\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x2f\
-\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
-\x4d\x31\x33\x2c\x31\x33\x20\x68\x2d\x38\x20\x76\x2d\x38\x20\x68\
-\x30\x2e\x39\x20\x76\x37\x2e\x31\x20\x68\x37\x2e\x31\x20\x7a\x22\
-\x20\x66\x69\x6c\x6c\x3d\x22\x23\x32\x37\x32\x62\x32\x66\x22\x20\
-\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\
-\x64\x64\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x64\x3d\x22\x4d\x31\x33\x2c\x35\x20\x4c\x20\x35\x2c\x31\x33\
-\x20\x76\x2d\x38\x20\x68\x38\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x32\x37\x32\x62\x32\x66\x22\x20\x66\x69\x6c\x6c\x2d\x72\
-\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x2f\x3e\x0d\
-\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\
-\x0a\
-\x00\x00\x00\x64\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x33\x32\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x61\
-\x62\x39\x62\x38\x22\x20\x78\x3d\x22\x38\x22\x20\x79\x3d\x22\x34\
-\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x22\x20\x68\x65\x69\x67\
-\x68\x74\x3d\x22\x32\x34\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\
-\x3e\x0d\x0a\
-\x00\x00\x00\x74\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\
-\x33\x62\x22\x20\x64\x3d\x22\x4d\x33\x2c\x36\x48\x32\x31\x56\x38\
-\x48\x33\x56\x36\x4d\x33\x2c\x31\x31\x48\x32\x31\x56\x31\x33\x48\
-\x33\x56\x31\x31\x4d\x33\x2c\x31\x36\x48\x32\x31\x56\x31\x38\x48\
-\x33\x56\x31\x36\x5a\x22\x20\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\
-\x3e\x0d\x0a\
-\x00\x00\x00\xe6\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\
-\x33\x62\x22\x20\x64\x3d\x22\x4d\x31\x32\x2c\x31\x34\x43\x31\x30\
-\x2e\x38\x39\x2c\x31\x34\x20\x31\x30\x2c\x31\x33\x2e\x31\x20\x31\
-\x30\x2c\x31\x32\x43\x31\x30\x2c\x31\x30\x2e\x38\x39\x20\x31\x30\
-\x2e\x38\x39\x2c\x31\x30\x20\x31\x32\x2c\x31\x30\x43\x31\x33\x2e\
-\x31\x31\x2c\x31\x30\x20\x31\x34\x2c\x31\x30\x2e\x38\x39\x20\x31\
-\x34\x2c\x31\x32\x41\x32\x2c\x32\x20\x30\x20\x30\x2c\x31\x20\x31\
-\x32\x2c\x31\x34\x4d\x31\x32\x2c\x34\x41\x38\x2c\x38\x20\x30\x20\
-\x30\x2c\x30\x20\x34\x2c\x31\x32\x41\x38\x2c\x38\x20\x30\x20\x30\
-\x2c\x30\x20\x31\x32\x2c\x32\x30\x41\x38\x2c\x38\x20\x30\x20\x30\
-\x2c\x30\x20\x32\x30\x2c\x31\x32\x41\x38\x2c\x38\x20\x30\x20\x30\
-\x2c\x30\x20\x31\x32\x2c\x34\x5a\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\
-\x76\x67\x3e\x0d\x0a\
-\x00\x00\x2d\x58\
-\x00\
-\x00\xeb\x27\x78\x9c\xed\x7d\x6b\x73\xdc\x36\xb2\xe8\xf7\xad\xf2\
-\x7f\x40\xec\x0f\x89\xb3\xa3\x91\x46\x4f\x67\x72\xb2\x55\xb2\x24\
-\xc7\xaa\xb5\x25\x59\x92\xd7\x37\xe5\x4a\x59\x9c\x19\x8c\x86\x2b\
-\x0e\x39\x21\x48\x3d\x72\xeb\xfe\xf7\xdb\xdd\x78\x10\x24\x01\x92\
-\x33\x92\xf3\xa8\x7b\xb5\x39\x3e\x12\x01\x34\x1a\x8d\x46\xa3\xd1\
-\xe8\x6e\xac\x7f\xff\xec\x1f\xec\x7b\xc6\x5e\xa7\x9c\xff\xce\x0f\
-\x83\xf4\x86\x89\xec\x21\xe2\x62\xc6\x79\xd6\xc7\x32\x59\x3e\x0c\
-\xf2\x6c\x96\xa4\x43\x76\x90\x44\x61\xcc\x0e\xf3\xdf\x72\x2e\xe2\
-\xe4\x41\x95\xf2\x49\x98\x61\xe9\x7e\xc4\xef\xd9\xdb\x5c\xfc\x1e\
-\x5c\xcf\x54\x51\x14\x8e\x79\x2c\xf8\x90\xbd\x3f\xbe\xec\x31\xc1\
-\x39\x7b\x77\x7c\x70\x74\x72\x71\xd4\x9f\x4f\x0a\xf8\x97\xb3\x50\
-\x30\xf8\x2f\x49\xc3\xeb\x30\x0e\xa2\xe8\x81\x05\x6c\x9a\x00\x3a\
-\xc9\x94\x7d\x40\xbc\x2e\x10\xad\x0b\x44\xab\xc7\x82\x78\x82\x95\
-\x47\x81\xe0\x13\x96\xc4\x0a\xfb\xf5\xda\x50\xc6\x49\x94\xa4\x4c\
-\x8c\x67\x7c\xce\x7b\x6c\x94\x67\xd8\x0a\xd0\x8f\x13\x76\x17\x40\
-\x0f\xd3\x69\x18\x85\x41\x06\x40\xee\xc2\x6c\xc6\xfe\x7d\x78\x54\
-\x0c\x79\xed\x29\x7e\xf4\xe0\x38\x8e\x9e\xbd\x93\xa4\x60\xdf\xc1\
-\x1f\x2f\x4d\x47\x07\xc9\xe2\x01\x46\x3d\xcb\xd8\x77\xe3\x97\xec\
-\x7f\x36\x37\x06\x5b\x6b\xf0\xcf\xf6\xbf\xd8\xff\x54\x88\xfd\x2f\
-\x4f\xfd\x1d\xa8\xbf\x39\x80\xfa\x36\xf9\xff\x65\x3a\x38\xe3\xe9\
-\x3c\x14\x22\x04\x42\xc1\xf0\x67\x3c\xe5\xa3\x07\x76\x9d\x06\x31\
-\x0c\xbc\xc7\xa6\x40\x2e\x24\xf2\x78\x16\xa4\xd7\x40\xa5\x2c\x01\
-\xf2\x3e\xb0\x05\x4f\x05\x34\x48\x46\x59\x10\xc6\x61\x7c\x4d\x90\
-\x02\xa0\xe8\xe2\x01\x6b\x67\x38\x5f\x22\x99\x66\x77\x41\xca\x69\
-\x3e\x02\x21\x92\xb1\x24\xe6\x24\x19\xe7\x73\x1e\x67\x41\x86\x7d\
-\x02\x8d\xb9\x60\xdf\x65\x33\x4e\x30\x9e\x5f\xa8\x56\xcf\x5f\x52\
-\x67\x13\x1e\x44\x38\x27\x50\xce\x74\x11\x4d\x47\x02\xd3\x95\x72\
-\x91\xa5\xe1\x18\xe1\xf4\xa0\xd2\x38\xca\x27\x1a\x17\x5d\x25\x0a\
-\xe7\xa1\xea\x09\x41\x10\x65\x04\x02\xce\x05\x8c\x06\xf1\xed\xb1\
-\x79\x32\x09\xa7\xf8\xff\x39\x0d\x71\x91\x8f\xa2\x50\xcc\x7a\x04\
-\x67\x12\x62\x17\xc0\x1b\x50\x20\xb0\x80\xe6\x88\x78\x6c\x1d\x99\
-\x87\x47\x11\x42\x09\x61\x0c\x34\xee\x02\x4b\xc9\x87\x59\x42\x60\
-\x16\x48\xe4\x4c\x91\x8d\xfa\xbf\x9b\x25\xf3\xf2\xa8\x80\x64\xd3\
-\x3c\x8d\xa1\x6b\x3e\xa1\xa1\x27\x40\x42\xea\xf5\xbf\x7c\x9c\x69\
-\x48\xd8\x64\x9a\x44\x51\x72\x07\x43\x85\xae\x63\x58\x5b\x30\x3a\
-\x31\x34\x13\x8a\xfc\x14\x8c\x92\x5b\x4e\xc3\x93\xbc\x10\x27\x19\
-\x60\x2e\x31\xc2\xb9\x59\x14\x93\xae\x8a\xc4\x0c\x96\x15\x1b\x71\
-\x45\x47\x40\x21\x8c\xe5\xac\x5a\x23\x4c\x11\x1b\x91\x01\x6f\x84\
-\x30\x2d\x8b\x24\xa5\xae\xab\x23\x2f\x56\xc9\xe5\xdb\x23\x76\x71\
-\xfa\xe6\xf2\xd3\xfe\xf9\x11\x3b\xbe\x60\x67\xe7\xa7\xff\x39\x3e\
-\x3c\x3a\x64\xcf\xf7\x2f\xe0\xef\xe7\x3d\xf6\xe9\xf8\xf2\xed\xe9\
-\xc7\x4b\x06\x35\xce\xf7\x4f\x2e\x7f\x61\xa7\x6f\xd8\xfe\xc9\x2f\
-\xec\xdf\xc7\x27\x87\x3d\x76\xf4\xbf\xce\xce\x8f\x2e\x2e\x08\xd6\
-\xe9\x39\x3b\x7e\x7f\xf6\xee\xf8\x08\xbe\x1f\x9f\x1c\xbc\xfb\x78\
-\x78\x7c\xf2\x33\x7b\x0d\x6d\x4f\x4e\x61\xf1\x1c\xc3\xaa\x01\xc0\
-\x97\xa7\xd4\xa9\x02\x77\x7c\x74\x01\x00\xa9\xf9\xfb\xa3\xf3\x83\
-\xb7\xf0\x69\xff\xf5\xf1\xbb\xe3\xcb\x5f\x7a\xec\xcd\xf1\xe5\x09\
-\xc0\x66\x6f\x00\xf0\x3e\x3b\xdb\x3f\xbf\x3c\x3e\xf8\xf8\x6e\xff\
-\x9c\x9d\x7d\x3c\x3f\x3b\xbd\x38\x02\x34\x0e\x01\xf4\xc9\xf1\xc9\
-\x9b\x73\xe8\xe9\xe8\xfd\xd1\xc9\x25\x8d\x0c\x7a\x87\xef\xec\xe8\
-\x3f\xf0\x81\x5d\xbc\xdd\x7f\xf7\x8e\xba\xdc\xff\x08\x23\x39\xbf\
-\x40\x3c\x0f\x4e\xcf\x7e\x39\x3f\xfe\xf9\xed\x25\x7b\x7b\xfa\xee\
-\xf0\x08\x3e\xbe\x3e\x02\x0c\xf7\x5f\xbf\x3b\x92\xdd\x9d\xfc\x22\
-\xd7\xea\xbb\xfd\xe3\xf7\x3d\x76\xb8\xff\x7e\xff\xe7\x23\x6a\x79\
-\x0a\x90\xce\xa9\xaa\xc2\xf2\xd3\xdb\x23\xfa\x04\x7d\xee\xc3\x7f\
-\x07\x97\xc7\xa7\x27\x48\xa3\x83\xd3\x93\xcb\x73\xf8\x53\x72\xe9\
-\xe5\xe9\xf9\xa5\x69\xfe\xe9\xf8\xe2\xa8\xc7\xf6\xcf\x8f\x2f\x90\
-\x40\x6f\xce\x4f\xa1\x0b\x24\x31\xb4\x3a\x25\x40\xd0\xf6\xe4\x48\
-\x42\x42\xf2\x23\xf6\x04\xc5\xcc\x14\x54\xc3\x11\x7d\xbc\x38\x2a\
-\x70\x3a\x3c\xda\x7f\x07\xf0\x2e\x10\x80\x3d\xad\xfd\xa7\x15\x87\
-\x20\xa5\x9f\xfd\x63\xfd\x7b\x25\xf7\xdf\xef\x43\x6f\x17\x97\xbf\
-\xbc\x3b\xba\x78\x7b\x74\x74\x29\x3f\xfa\x5a\x7d\xb8\x4c\x92\xe8\
-\x32\x5c\x3c\xfb\xc7\xff\x86\x6f\xf0\xb3\xfe\x3d\xdb\xe8\x6f\x82\
-\xcc\x03\x86\x47\xfe\x14\x73\xe0\x65\x10\x19\xec\x36\x88\x72\x0e\
-\x9f\x82\xec\x5b\x81\xfc\xcf\xc2\xeb\x38\x49\xe5\x66\xf1\x29\x8c\
-\x27\xc9\x9d\xe8\x13\x50\x84\x32\x4a\xd2\x09\x87\xcd\x6b\xa3\xbf\
-\xb1\xcd\xe7\xb0\x24\xa3\x70\xc2\x5e\x6c\x0d\xb6\x76\xb7\x46\x3f\
-\xaa\x2a\xc1\xf8\xe6\x3a\x4d\xf2\x78\xb2\x16\xce\x83\x6b\xd8\xcd\
-\xe2\x24\xe6\xf5\x42\xda\x70\x86\xec\x05\x9f\x4e\x37\xa6\x03\x55\
-\x1e\x44\x19\x4f\x63\x90\x8c\x6b\xae\x9a\x01\x1f\xf1\xb1\xaa\xa9\
-\x3f\x96\xfa\x5e\x04\x13\x14\x7a\x88\xdf\x80\xcf\xd5\xc7\x64\x11\
-\x8c\xc3\xec\x61\xc8\x36\x37\x36\xe0\xd3\xff\x21\xf2\x7c\x0a\x27\
-\xd7\x3c\x33\xd4\x71\x42\x6b\x43\x16\xe4\x1d\x27\x79\xeb\x40\x36\
-\xbd\x1e\x05\xdf\xed\x0c\x7a\x6c\xb0\xbb\xdd\x63\x9b\x9b\x5b\x3d\
-\xc0\x69\xe7\x65\xad\x65\x6b\xc7\x51\xb8\x18\x2a\xb2\xff\x68\xcf\
-\x41\x85\xb8\x66\x92\x3f\x1c\x82\x34\x4a\xae\x5f\xe7\x59\x96\xc4\
-\xaf\x13\x98\xef\x31\x4a\x25\x3d\x81\x13\x2a\x5d\x1b\x07\xf1\x98\
-\x47\x6b\x58\x36\x64\x79\x1a\x7d\x37\x5c\x8f\x50\x36\xae\xcb\xf2\
-\x2f\xb2\xbc\x2f\x6e\xaf\x35\xca\xba\x61\x94\x08\xde\xd0\x0e\x8b\
-\x1d\xcd\x92\x1b\x7f\x9b\xe4\xc6\xd5\x60\xc1\xe3\x86\x26\x50\xea\
-\x68\x04\x5b\x20\xcf\xfc\xad\xa8\xd8\xd1\x4c\x04\xb7\x0d\x43\xc2\
-\x52\x47\xa3\x07\x2e\x96\x1c\xd2\x8c\x47\x0b\x7f\x13\x2c\x75\x34\
-\x8a\x13\x7f\x93\x38\x71\x34\x08\x16\x8b\xe8\x61\x49\xcc\x60\x5f\
-\x1f\x07\xe9\xc4\xdf\x4a\x55\xd0\x4d\x0d\xb3\xbd\x01\x7d\xa5\xc2\
-\x60\xa8\xc2\x28\xb0\xc8\xc6\x77\x6e\xb8\x11\x9f\x66\x5f\x82\x34\
-\x4d\xee\x6c\x74\xac\xb6\xd0\x22\x03\xb5\x48\xdc\x86\xfc\xce\xd1\
-\x1e\x6b\x7e\xd1\x3c\xa7\xaa\x7a\x20\x4d\x38\xa8\x65\xf0\x57\x07\
-\x48\xba\xaa\x07\x12\x8f\x5d\x43\xb1\x01\x40\x0d\x4f\xdb\x30\x9e\
-\x26\x1d\x30\xc0\x6a\x1e\x08\xa0\x86\x65\x1d\x20\x60\x35\x0f\x84\
-\x18\x1a\x4f\xc2\x14\x24\x4f\x92\xba\x58\x04\x34\x29\x10\x2c\x9e\
-\xc6\x0b\xd0\x65\xe2\xac\xb1\x7d\xbe\x68\x9c\x52\x50\x95\x52\xd7\
-\xea\xb4\xb1\xa7\x3a\x65\x0e\xd5\xfd\x91\x68\x71\x4e\x40\x0d\xed\
-\xe5\x06\x59\xd4\x86\x13\x84\x4b\x4e\xc9\x26\x5f\xb0\xd4\xdd\xce\
-\x23\xac\x54\xbb\xaa\xb0\xc2\xf1\x7a\xc8\x50\xab\xe6\xc3\x08\x49\
-\x56\xc5\x07\x74\x68\x17\x5c\xfc\xfc\xc5\xe0\x5a\x5b\xc2\x1f\xde\
-\x73\x21\x60\x27\xa9\x6f\x15\x73\x59\x30\x4a\xee\xd7\xc6\x29\xe8\
-\xd5\xe3\xc0\xb5\x61\xa8\x5a\x5f\x74\x15\x1b\x23\x0b\x02\x32\x76\
-\x3a\xa7\xb3\x47\x03\x10\xab\x96\x07\x0e\x1e\xef\x5a\x80\xe8\x2a\
-\x1e\x08\x20\x91\xf0\x90\xd6\x00\x40\xd5\xa8\x91\xea\x20\x99\x2f\
-\xe0\xec\x93\x56\xe8\x34\x56\x9f\x1d\x10\x75\x51\x89\x6d\xb8\xb8\
-\xc9\x12\xe7\x4e\x20\x4b\xec\xca\x63\xb7\x50\x16\xe3\x2f\x93\x34\
-\xac\xec\x4b\xb7\xdd\xeb\x4e\xa3\x64\xb1\x70\xae\x0e\x2a\xa8\x37\
-\x80\x03\x2f\x68\x56\xc2\xc5\x8b\x58\x54\x6f\x10\xf3\xec\x2e\x49\
-\x5d\xf5\x55\x49\xbd\x49\x96\x06\x62\xe6\x68\x40\xdf\x6b\x93\xb1\
-\x8f\x92\xa6\x32\x13\xf9\x82\xe4\x4f\x47\xd1\x04\x9a\x6d\xec\xab\
-\x8f\x65\xf5\x16\xb8\x6b\xf9\x5a\xb8\x77\x34\x3a\x70\xfa\x9a\x50\
-\x61\xbd\xcd\xf2\xdb\x66\x92\x7a\xea\x3b\x7a\x30\x04\xbc\x0c\xb3\
-\x88\x8f\x82\x2a\x37\x67\xea\xb3\x57\xd3\xbb\xa3\x33\x41\x5d\xd3\
-\x2b\x1a\xe2\x7e\x7c\x9f\x79\xd4\x9d\xaa\x9e\x63\x9a\xcd\x83\xfb\
-\x70\x1e\xfe\xee\xea\x52\x17\xb9\xdb\xf1\x38\x77\x2e\xe6\x38\x77\
-\xd7\x0f\x63\x6f\x3f\xaa\xc8\xd9\x2e\x46\xc9\xe4\x92\x80\x68\x78\
-\x81\x03\x93\xb3\x91\x98\x05\x13\x57\x4f\xf4\xdd\xd9\x22\x8f\x7d\
-\x6d\x54\x49\x6d\x22\x4f\x81\xd4\xd5\x59\x9c\x24\xc0\x43\x74\xc4\
-\xf1\xce\x63\x6d\x02\xe5\x41\x13\x7f\xe0\x5c\x79\x1a\xa3\x59\xf1\
-\x16\xd4\xa1\x60\x84\x3a\x5e\xcc\x3e\x64\xbb\xd2\x8a\x33\x0e\x72\
-\x81\xf6\x0f\xd9\xad\x10\x20\x6e\xfb\xec\x82\x73\xf6\x62\x77\xb3\
-\x5f\x40\x80\xed\x89\xa3\xad\x13\x10\xe0\x30\xae\x11\x1d\x48\x9c\
-\x78\x40\xf1\x17\xe4\x18\x1b\x19\x1a\x89\x7d\x54\x1b\x82\xf8\x41\
-\x54\x26\xb5\x33\xdb\x68\x1b\xff\xd7\xe1\xcc\x26\xc1\x1d\xcc\xf8\
-\xf8\x06\x76\x3b\x03\x47\xe0\xf9\x50\x1e\x1a\x37\xb7\x8a\x53\x63\
-\x9e\xe1\x08\x4a\xa7\x57\xe7\x61\x6d\x1e\xa4\xd7\x21\x1c\x01\x13\
-\x18\xdf\x9c\x4e\xc6\x3f\x34\x1f\x3d\x35\x02\x0d\x23\x0a\x46\x3f\
-\x8c\x5e\x99\x06\x3f\xc3\x78\x16\x36\xc6\x30\xe9\x27\x5c\xda\xc5\
-\xe6\xc1\x0d\x9c\xe5\xf3\x94\xd3\xa1\x1e\x47\xbe\x80\x4d\x0e\xe6\
-\x9f\x8b\xf8\xdb\x8c\xf6\x26\xe0\x4f\xc1\x46\x3c\x02\x71\x89\x75\
-\x88\xd3\x8a\x13\x3d\xf0\x3c\x9c\x4c\x70\x26\x86\x6c\xd0\xdf\x34\
-\xa8\xbb\x4f\xfa\x06\xb3\xa2\xca\x5a\x1a\x4c\xc2\x5c\x54\x46\x6e\
-\x33\x13\x19\xac\xaf\x41\xda\x0b\x96\x0b\xc6\xe3\x24\xbf\x9e\x11\
-\xd5\x39\x0b\x32\x89\x53\xb2\xc0\xc1\xf0\x98\x46\x72\xc7\x81\xc7\
-\x62\x36\x47\xab\x9d\x34\x85\x4a\x38\x84\x39\xd6\x23\xc3\x9c\x08\
-\x27\x6a\xd0\x39\xfc\x86\x73\x25\x94\x95\x11\xbe\x29\x43\x80\x05\
-\xdf\x40\x91\x9d\x08\xec\x65\x06\x47\x3b\x85\x48\x95\x3e\x16\x17\
-\x5a\x93\x0c\x70\x70\x9c\x3b\x66\x98\xaa\x1f\x59\x20\x4d\x0e\xe5\
-\x39\x1b\x4e\x93\x71\x2e\xcc\xcc\x3d\x82\xaa\x15\xb8\x43\xc2\xd3\
-\x66\x89\x4f\x9c\xc5\x9a\x2b\x90\x74\x1b\xfd\x5d\xe8\x22\x5f\xd4\
-\x29\xa6\x88\xf5\x4f\x40\x18\x37\x0f\x3d\x8a\x82\x29\x68\x38\x6b\
-\x03\x04\xa0\x2d\x16\xf9\x08\xe5\x7a\x9a\x44\x6b\xf2\xde\x61\xc8\
-\xd4\xb9\xab\x5e\x61\x91\x08\x32\xc3\x0e\x69\x5e\xc7\x50\xa7\xb0\
-\x5d\x98\xe5\x59\x35\xa6\x68\x4a\xe2\x16\x47\x4b\xb1\x46\xe3\x54\
-\x32\xa9\x2e\xaa\xd2\x39\x0a\xb2\x0a\x99\xf5\x74\x59\xa4\x26\xb3\
-\xcc\x60\x03\x24\xd9\x60\x63\x47\xfd\xb3\xd1\xdf\x7b\x59\xa6\xbd\
-\xc6\x81\x1a\x82\xfa\x11\x0b\x79\xfa\xf1\xcc\x94\xc6\xab\x5b\x75\
-\x4b\x50\xf8\xeb\x57\x24\xc5\x10\xf6\x5c\x50\xae\x61\x9b\xe9\xa1\
-\x69\x2f\xe5\xfc\x3f\x70\x12\xac\x7c\x2e\x58\xc3\x7c\x36\x04\x81\
-\xbd\x20\x9b\x69\x0e\x25\x85\x4e\x2f\x79\x27\x6f\x19\x00\xc3\x3c\
-\x1e\x23\x12\x7c\xe2\xe9\xa1\xa8\x20\x39\xbd\xe7\x46\xbb\x0c\xa7\
-\xb1\x42\x01\xc7\x31\xce\x32\x9c\xc6\x0a\xce\x95\xa7\xad\x66\xa5\
-\x0d\x08\xeb\x83\xd0\xfc\x62\x9a\x7e\xd1\x92\x59\xef\x48\x1d\xe9\
-\xd3\x3c\xae\x19\x2c\xca\xb4\xbd\x1a\xc9\xeb\x2e\xe3\x33\xf0\x9a\
-\xab\x59\xf0\x9a\xe7\xcf\xc0\x6b\xae\xa6\xe0\xd5\x44\x9a\x6d\xe5\
-\x5d\x82\xd6\x65\x12\xbb\x48\xd3\x32\xe1\x2d\xfc\xa9\x8a\x97\xe1\
-\x83\x65\x31\x6b\x9e\xd9\x4e\xcb\xa3\xe3\xe4\x77\x9a\xfa\x4e\xeb\
-\xa8\x23\x77\x74\xe2\x8d\x5a\x87\x4d\x95\x9e\x86\x7d\x3a\x4f\x11\
-\xfc\xc6\x33\xbc\xdf\xc3\x4b\x05\x1f\x31\x4a\x95\x96\xe1\x94\x52\
-\xc3\x25\x91\x69\x66\x88\x72\xd5\x46\x06\x2b\x57\x6d\xe1\x20\x0f\
-\x0a\xed\x55\x1b\x59\xce\x89\xc2\x1f\x46\x48\x2d\xad\xbb\x61\x57\
-\xd3\xba\x97\x45\xcf\xb3\x3b\x34\x2d\xeb\x36\x0c\x5d\xf5\x9a\x16\
-\xd1\x2a\x63\x68\xde\xdb\x9a\xf7\xa4\x36\xfc\xdd\x35\x9b\xf7\x91\
-\x55\xc6\xd0\xb6\x43\x9f\x83\xd2\x9c\xc8\xab\xaf\xaf\x7d\xbc\xab\
-\x75\xd8\xf9\x38\x67\xb7\x59\x55\x55\x73\xc3\x28\x6b\x23\x6d\x75\
-\x3a\x2b\x48\x78\x14\x49\x96\xa1\x7d\x8b\x7e\xd1\x5a\xb3\xc3\x1e\
-\xe1\x9a\xbf\xce\x23\xe8\x84\xb8\x5b\x71\x78\x34\x12\x2b\xa0\xd0\
-\x4a\xb9\xda\x06\xdc\x52\xef\x2b\xd1\x77\x95\xa1\xd5\x16\xcd\x23\
-\x3a\x5e\x95\x31\x97\x90\x44\xdd\x96\xc2\x7b\x1e\xe7\xaf\x83\x62\
-\x49\xb7\x39\x12\xd4\x04\x4f\x09\x0c\x20\x9d\xf1\xb9\x03\xd8\xd0\
-\x3e\x3c\xba\x5b\x0d\xa5\xa7\x81\x3d\x36\x6f\x73\xaf\x7d\xc2\xef\
-\xcb\xe0\xea\xb1\xab\x18\x2c\xb7\xaa\xb1\xe4\x92\x1e\x15\x5d\x64\
-\xf7\x5a\xc9\x42\xa5\xcd\x0a\x1e\xc9\x8e\xe8\x35\xbb\x87\x48\xe8\
-\xce\x86\x30\xa8\xb1\xb5\x05\x15\x35\xd5\x0e\x54\xaa\x69\x4f\x2e\
-\x5e\x6c\x4c\x26\x8c\xdf\xc3\xd4\x18\x23\x96\xed\xae\x47\xf6\x1a\
-\xfc\x8b\x5a\x33\x32\xed\x1b\xb3\x8d\xe5\xfe\x82\x1d\xb1\x01\x5a\
-\xaa\x8a\x3f\xb6\x5c\xc6\xbd\x1f\xcc\x34\x3b\xb8\xa1\x03\xab\xf9\
-\xf8\xac\xa3\x47\x4d\x17\xde\xaa\x74\xe1\x58\xaf\xad\x46\x5f\x0b\
-\xcc\x32\xfc\xd9\xb0\x3f\x6f\xf4\x5f\xd5\x76\x68\xfb\x1b\xde\xb0\
-\x24\x2c\x00\xb1\x11\x4b\x8f\x59\x8b\x31\x7a\xec\x6e\x16\x8e\x67\
-\x6c\x16\x08\x16\xe8\xf9\x91\x4c\xd2\xaf\x9a\x1c\xb5\x2d\x6a\xcb\
-\x65\x8a\x2b\x2c\x6d\xd2\xca\x46\x37\x54\xbe\x11\x0c\x41\xa2\xae\
-\xf1\xfb\x71\x94\x8b\xf0\x96\x17\xf2\xef\x29\x15\xb0\x8e\x5d\x3a\
-\xc4\xd2\xd7\xee\xfb\xa9\xec\x00\x9d\x7a\x59\x69\x7c\x9d\xba\x5b\
-\x6d\xfe\xba\x6f\x5b\x2d\x7d\x2d\x33\xb0\xc7\x76\xba\xec\xf0\x96\
-\xa4\xdf\xca\x23\x6a\xe8\x87\x44\xf4\x1a\x09\x65\xbf\xf0\x6f\xe9\
-\xc3\x7d\x29\x6c\xa4\xce\x8e\x57\xea\x78\x10\x59\x4a\xbd\x29\x3a\
-\xf7\x4c\xd7\xfe\x48\xc0\x4e\x30\xce\x8e\x41\x94\xe2\x29\xd0\x00\
-\x6d\xf6\xdc\x6c\xd4\x76\xbc\x3b\xd2\x32\x17\x23\x97\xc1\x48\x5d\
-\x14\xd6\xed\x2a\x4e\xbd\xd8\x7c\xbc\x80\xae\xa0\x6b\xf7\x45\x8d\
-\xd2\x42\x65\x1f\xef\x40\x31\x3d\x9a\x84\x59\x67\xc5\xae\xb2\x21\
-\x97\x07\x42\xc1\x23\x43\x39\xd4\x26\xf5\xab\xfb\xa5\x9b\x47\x8f\
-\xd4\x73\x76\x31\x86\x3d\x23\xda\x4f\x79\x50\x65\x05\x27\xb4\x2e\
-\x53\x52\x1b\xbf\x43\x4d\x30\x0e\xcc\x3a\x70\x05\xd5\x97\xa2\xa5\
-\xd1\x68\xf0\xde\x52\x05\x37\x48\x9d\x4c\xde\xac\xc0\xa8\xd2\x98\
-\xa7\x12\xc4\xdd\x8c\xc7\x54\x3c\x63\x82\x46\x33\x0a\x52\xd8\x43\
-\x31\xae\x62\x9c\xa1\x3f\xc9\x33\xe9\x00\xed\x18\xf3\x70\xa8\x01\
-\x39\x34\xe1\x8a\xbe\x60\x50\x3e\x08\xf0\x16\x75\x92\x10\x56\xff\
-\x3e\x3c\x92\x11\x3f\xe8\xe3\x7f\x87\xc1\x21\xd2\x93\x5a\x23\x02\
-\xfb\x79\x3c\x89\x64\xe8\x06\x1b\xf1\x71\x32\xe7\x82\xd1\xc2\xd2\
-\x2a\x9c\x3c\xc8\xd1\x2d\x65\x82\x17\xec\x38\x1c\x59\x60\xb5\xc4\
-\xc0\x13\xac\x47\xd1\x21\x00\x21\xcc\x14\x30\xea\x3c\xfc\x1d\x96\
-\xa4\x21\x25\x14\xe0\x6d\xbc\xea\x12\xc9\x52\x40\x33\x97\xa1\x16\
-\xad\xf9\x2d\x7a\x4a\x12\xc1\x32\xa0\x09\x89\x3d\x6c\x9a\x25\xb0\
-\x72\x60\x44\x86\x7e\x92\x6e\xa8\x9f\xcf\x92\x34\xfc\x1d\xf4\x8d\
-\x20\xea\xcc\xf6\x85\x64\xda\x2d\xc4\x55\x21\x07\x07\x5b\xa4\x95\
-\xee\x4a\xe5\xd4\xfa\xcb\xbd\x0a\x4a\x37\x64\xa5\x7e\x6a\xdc\x3b\
-\xd8\xb3\x24\x82\x6b\x08\xf2\x28\xdd\x34\x90\xf1\x1e\xfc\x6f\xd7\
-\x01\x64\x28\xa9\xda\x8d\x1e\x4e\xb5\xf6\xd5\xcb\xa6\x65\xde\xdc\
-\x04\xaf\xe9\x1d\x7b\x40\x57\x0a\xd4\x91\x6f\xa5\xc4\x93\x0e\xa1\
-\x86\x0f\x08\xc6\x35\x3a\xe7\x3b\xc8\x69\x38\xc5\xe2\x0f\xf3\x6b\
-\xeb\x06\x6a\xb1\x8b\x73\x03\xdd\xae\x5b\xd6\x4a\x1f\x9d\xea\x35\
-\x49\xa2\x7a\x05\x7d\x15\x2e\x31\x76\x8d\x13\x2a\xff\x9d\xc6\xa9\
-\xce\x0f\x4b\x0f\xd3\x31\x9d\x85\xd5\xaa\xa5\x9e\x75\x50\xfe\x1b\
-\xcf\xaa\x73\xb8\xae\x7a\x7f\xde\x70\x57\x9d\xdc\x7c\xa1\x34\xc9\
-\x62\x14\x95\x71\xa2\xbb\x64\xad\x8e\x73\xa3\x2d\xe9\x53\x15\xc6\
-\x58\x20\x19\xbc\x7d\x20\x2d\x2b\x35\x96\xe9\x01\x26\x87\xfc\x93\
-\x3b\x6f\x62\x86\xd6\xce\x3d\xac\xbe\x79\xb9\xd6\xed\x13\xee\x61\
-\x1a\xff\x27\xd8\xc1\x3a\x90\xe2\xab\xec\x5f\x05\xa7\xae\xbe\x81\
-\x75\x26\xc3\xd7\xdd\xbe\xcc\xc2\xae\xd1\xb2\xaa\xe6\x94\x64\xfb\
-\xaa\x42\xdd\xb9\xc6\x5d\xc2\xc0\xe7\x85\xf5\x28\x99\xfe\x77\x18\
-\xa3\x3c\x31\x3c\x4a\x96\x97\x59\xcb\x27\xc9\x4d\xad\xc7\xc8\xf1\
-\xbf\xc6\x7c\x36\xef\xd0\x7f\x81\x81\xae\x3e\xa9\x66\xcb\xd2\xa3\
-\xf0\x6f\x58\x0d\xd2\xb0\xc3\x76\xe5\x81\x6f\x36\xab\xee\xd0\x2f\
-\xf9\x7d\xb6\x94\x71\xa1\xcd\x8e\xe2\xb2\x20\xc8\xae\xce\xa2\x20\
-\x8c\x9f\xb2\xbf\x56\x03\x82\x1f\x97\x0b\x38\xd0\xfe\x9c\x5a\x81\
-\xca\x7e\x1e\x13\x50\xf5\x1a\xaa\x76\xb6\x8b\xed\x14\x5b\x89\x39\
-\xd1\x5f\x70\xe9\x12\x2c\x38\x70\x2b\x9a\x04\x95\x7b\xac\xc5\xc0\
-\x3d\x26\xc2\x78\x2c\x0f\xf7\xe8\x48\xaf\xec\xf4\x12\x31\x19\xe2\
-\xcd\x4e\x63\x76\xf6\x40\x2e\xf1\x31\x0f\xc9\x13\x5e\xda\x2d\xb0\
-\x0a\xcc\x6b\x5a\x3d\x78\x0b\x8e\x5a\x00\xf5\x94\x72\xb1\x20\x8b\
-\xa3\x39\x6c\xbf\x87\xe9\x90\xa1\xd6\xc0\x39\x1a\x2f\x97\xcf\xf0\
-\x0f\xcd\x0e\xa6\x9d\xae\x6b\xea\x1d\x14\x04\xb3\x27\xaf\xce\x0d\
-\xa5\xce\xfc\xfe\xba\x65\x5f\xe9\xda\xf7\xe2\xbe\xad\x56\xa4\x61\
-\x59\x72\x41\x95\xa4\x15\x31\x22\x07\xf4\x26\x0d\xe6\xfc\xf3\x14\
-\xff\xbd\x98\x05\x0b\xfe\xd3\xf3\xcd\xe7\xbf\xf6\x28\xaa\x8d\x8a\
-\x86\xc3\xb3\x20\xe6\x11\xfb\xe9\x27\xb6\x71\xbf\xb1\xb1\xb1\x25\
-\xc9\x5d\x6f\xb6\x55\x69\x06\x93\xd1\xb1\xe5\x76\xa5\xe5\x5b\xb4\
-\x11\x9a\x66\xdb\xbe\x66\x3b\x95\x66\xff\x29\x35\xdb\xf1\x35\xdb\
-\x7d\xfe\x2b\xb3\x9b\x51\xa2\x97\x49\x19\xd5\x5d\x6a\x5c\x5e\x4c\
-\x66\x95\xe0\x42\x2c\x4f\xa0\x73\xcd\xfa\x6d\x93\x6e\xd1\xd0\xc6\
-\x2c\x35\x29\x61\xdf\x83\xc2\x78\xce\xd2\xe4\x16\x9d\xd3\x67\x30\
-\xcd\xb4\xd6\xf1\xda\x13\xed\x82\x34\x78\x96\x50\xd2\x0f\x95\x86\
-\xc0\x3d\xeb\xc5\x5e\xe6\x9c\xdd\xa6\xe2\xed\xe6\xe2\x9d\xe6\xe2\
-\x5d\x5d\xdc\xec\xe3\xdf\x72\xcf\x09\x34\x38\x4c\xd0\xd4\xb8\x50\
-\x94\x08\x62\xed\x09\xc1\xc2\xa9\x89\x55\x08\x98\x0c\xea\xa1\x74\
-\x0d\x2c\x0b\x6e\x30\xa4\x62\x21\xe5\x19\x86\x31\x78\x28\xf4\x2b\
-\xab\xd9\xed\x7d\x38\x1b\x84\x47\x11\xcc\x69\x4d\x7a\x9e\x24\x19\
-\xb0\xc5\x31\xc6\x67\x7c\x8b\x29\x67\x28\xfb\xd0\x18\x74\xf3\x6b\
-\x5e\x95\x78\x2a\x0f\x4a\x96\x24\x64\xa4\x55\xb6\xcd\x78\xc2\x17\
-\x1c\xfe\x89\xb3\xe8\x41\xcb\x59\xb4\xab\xca\x4c\x44\x24\x69\x27\
-\xe1\x74\xca\x49\xbc\x11\x2f\x09\x6d\x20\x56\x16\x60\x92\x93\x0c\
-\xcd\xad\xda\xbe\x89\x01\x58\xba\xbb\x8f\xc7\x7d\xca\xf9\x22\x23\
-\x4a\xa8\x6b\xcc\x6e\xa3\xba\xc7\x1a\x0a\x00\x71\x78\xaf\x0c\x03\
-\x2a\xd2\x1f\x18\x43\x8f\xf7\x45\x98\x11\x46\xd6\xd3\xd6\x67\xbc\
-\xb5\x95\xe1\x29\x64\x16\x36\x12\x1c\xb3\x6d\xd8\x1e\x1f\x53\xd0\
-\x54\xd6\xee\x94\x5c\x1d\x25\xd1\xa4\xd8\xe6\x65\xcd\xb6\x53\x6c\
-\xd9\xe8\x5e\xb9\xcd\xd6\x30\x1a\x95\x8b\x4e\x10\x9a\x8c\x9a\xde\
-\x7d\x78\x86\xe1\x25\x8a\xb8\xe5\xdb\xa1\x2a\xd8\x3a\x82\x5e\xa0\
-\xb7\xed\x40\xcd\xce\xb5\x24\xba\xd0\xae\x2b\xe0\x65\x10\x6e\x01\
-\xcb\xe4\x2f\x65\x67\x44\x17\x5f\x38\x64\x86\xbd\xc7\xeb\x85\xd8\
-\xbc\xe9\xd6\x82\x64\x6c\x47\x13\x07\x46\x4f\x20\xb3\x9c\x60\x7d\
-\xae\x65\x1d\x01\x63\x93\x75\x99\xb5\x49\x7b\xbf\xe8\x50\xb6\x30\
-\x06\x2d\x2b\xcc\x60\x4b\x48\xe6\xec\xca\xd5\xf9\x15\x08\x94\x84\
-\x45\x1c\x25\x65\x88\x0d\xfa\x55\xcf\x98\x25\x09\x57\x28\x8d\xa0\
-\xb0\x61\x92\xa7\x34\xc7\xfc\x5c\x28\x8f\x02\xd8\x83\xc3\x88\xcb\
-\x64\x2b\x56\xf2\xb7\xc3\x9c\x22\xd4\xa4\xa0\x41\x51\x2d\x7a\x28\
-\x30\x50\x66\xa7\xa1\x11\x8a\xf3\x10\x04\x0b\x68\xb3\x94\xfc\x2a\
-\x88\x54\xe8\xd9\x5c\x09\xa9\x04\x90\x02\xad\x93\x02\x34\x53\x73\
-\x35\x23\x65\x55\x11\x22\x47\x1b\x82\x0a\xa6\xd3\xb4\x9a\x26\x69\
-\x21\xe8\x26\x69\xb2\x58\xc3\x83\x0e\xc3\x58\x58\x7d\xb5\xb6\x48\
-\x16\xf9\xc2\xc8\x2d\x89\x3f\x73\x51\xf3\x33\xd5\x7c\x9f\x4c\x60\
-\x93\xdb\x00\x75\xa5\x7b\xed\xc1\xf3\x5f\xcd\xfc\x57\x09\x3f\xf0\
-\x13\xde\xd6\xec\x3a\xf6\xb4\xb9\x5a\x4f\xb6\x89\xe9\x2c\x17\xb3\
-\xca\x22\xed\x9c\x0c\xc8\xce\x47\xd4\xe1\xea\xb6\xf1\x36\xd8\x79\
-\x82\x72\x39\x43\x96\x03\x36\x07\xce\xa1\x50\x34\x5c\xaf\xfe\xa9\
-\x79\xd5\x37\x86\xa2\x25\xf3\x51\x82\x77\xe9\x98\xcd\xa2\x02\x19\
-\x3f\x75\xd1\x38\x2b\x1a\xa4\xaf\x07\x99\xe8\xa3\xd2\x87\xfc\xf8\
-\xf8\x5e\x2c\x90\x4b\xb9\x91\xad\xd8\x69\xb3\x4a\x5d\x8a\x1e\x2d\
-\x31\x45\xdd\x39\xd1\x51\x28\x39\x7d\xc0\xef\xdd\x7c\x5e\x14\xd4\
-\x59\xac\xc0\xbc\x16\x45\x5d\xe7\xa5\x92\x63\x84\xc7\xc7\xc0\xaa\
-\xdf\xee\xca\xf9\x62\xc4\x27\x53\xb3\x72\x4a\x54\x58\x2b\xd9\xdb\
-\xab\x64\x80\xd2\xbd\x3a\xea\x15\x54\x34\x23\x3d\x45\xd0\xad\x7f\
-\xd9\x5a\x17\xb2\x9b\xb6\xa1\xa1\xe0\x63\x0c\x7e\x47\x06\x5b\xc2\
-\x4d\xd1\x66\xf8\xaa\xf7\x53\x83\xa1\xbf\xe3\x20\xdb\xa7\xae\xf5\
-\x6e\xa1\x5d\xe4\x2d\xe9\xa6\xeb\x1b\xf7\x12\xd7\x1c\x4f\x8b\x8a\
-\x99\xbe\x22\xe6\x4a\x7f\x31\x1e\x43\xc6\xb9\x64\x11\xc6\xa5\xaa\
-\xd5\x02\xd3\x42\x7b\x0e\x15\x55\xcd\x97\x22\x06\x4b\x19\xe4\xac\
-\x50\x2b\xfd\xc5\xd4\x29\x59\xee\x8a\x8a\xe5\xcf\x35\x3c\x8b\x03\
-\x5f\x29\x80\xa7\xfe\xa5\x43\xb0\xfa\x13\x10\x55\x4b\x88\xe1\x37\
-\x7a\x89\xf4\x1c\x6c\x68\x47\xb2\x39\x09\x6e\x57\x28\xd3\xb7\x14\
-\x04\x57\x22\x96\x5d\xe2\xa0\xa5\xab\xcf\x82\x54\xce\xd8\xba\x52\
-\xc9\x12\x4b\xfd\x20\x89\xf2\x79\x5c\x72\xa1\xeb\x74\x67\x58\x6d\
-\xbd\xa2\xed\x54\x5b\x1d\x8e\x02\x38\xd1\x8e\x09\x9a\xd6\x10\x31\
-\xc9\x18\xfa\x16\x05\x75\xab\x81\xb2\x2f\x14\xbd\xd7\xab\x74\x19\
-\x4d\xab\x31\x44\x29\xd3\xc7\x31\x93\x06\x55\x50\x89\x05\x47\x7b\
-\x40\x2c\x42\x91\xf1\x78\xfc\xc0\x46\x3c\xbb\xe3\x1c\xd3\x92\xec\
-\x90\x62\x4c\xb6\xd8\x3b\x99\x02\xc1\xe8\xd1\x4a\x5b\x26\x6b\xc9\
-\x1d\xd7\x7e\x5c\x45\xc6\x58\x80\xb5\x90\xc9\x62\x19\xfd\x0c\xfa\
-\x64\x1f\x0e\x8a\x9e\x32\x76\x35\x0f\xee\x95\xc2\x75\xa5\x49\x84\
-\x8e\xe4\x7d\xb6\x1f\x3f\x64\x33\x9d\x63\x57\xff\xc8\x44\x12\x57\
-\xe4\x94\x79\x05\x67\x00\x4c\x18\x8b\x2e\x5a\x0c\x33\x39\x02\xfb\
-\x5e\xd3\x21\x45\x68\x1b\x0e\x65\xdf\x2c\x01\xb0\xd1\x96\xc9\xf5\
-\x60\x32\xf0\x00\x14\x61\xd2\x61\x6d\x7f\xc6\x9f\x4d\x89\xad\x56\
-\xfe\x2b\x0d\x01\x45\x9c\xc5\x05\x9c\x02\x78\x1a\x3d\x50\x35\x65\
-\x73\x96\xcd\xb7\x64\xf3\x2b\x3a\x0d\x5d\x29\x4b\xab\xd0\xae\x6a\
-\x68\x40\x41\xba\xca\xad\x57\x1f\x5c\xe8\xca\x44\xf4\x4a\x08\x63\
-\xad\x2b\xd2\xb7\xaf\x74\x63\xd4\x4c\xe8\xbb\xf4\xe0\x2b\x63\x26\
-\x61\x94\x41\x40\x51\x05\x51\x6a\x4e\x67\x1c\xb2\x6e\xa1\x19\x10\
-\x79\xd8\x3a\x6a\xe1\x21\x11\x3f\x95\xd8\x42\xba\xd5\x25\xe9\x8d\
-\x40\xbb\x99\xf1\x88\xbb\x92\xce\xff\x57\xd6\x2d\x92\x04\x52\x9a\
-\x5d\x6d\x0c\x82\xda\xdf\xcb\xdb\x21\xbb\x01\xd6\x45\x12\x5d\x21\
-\x59\x85\x4a\xf9\xdd\xb6\x1c\x2a\xf1\x1d\x1e\x5d\x02\x70\x70\x5c\
-\x64\x14\xa8\x55\x9d\x7c\x9b\x7b\x74\x79\x21\x77\xf7\x34\xb6\xfc\
-\x95\xe5\xbd\xae\x0c\x21\xd1\xbf\x2f\x8f\x83\xf1\xb0\xee\x2d\xd5\
-\xaa\xac\x00\xb4\x38\x2b\x53\xe5\x4a\x44\x6b\x63\x4f\xc8\xa1\xed\
-\x24\x72\xe7\xdb\x7a\x1a\x0a\x15\x18\x2c\x41\x20\xab\x51\x2b\x7d\
-\x0a\xe4\xdd\xe4\x71\x6e\xc9\x2b\x28\xad\x1a\x52\xc3\x5e\xb0\xae\
-\x92\x00\xcd\x82\x05\x9c\x15\x8d\x45\xb7\x6a\xa2\x08\xa2\xbb\xe0\
-\x01\x0d\x26\x33\xb2\x78\x30\x8d\x0c\xe6\xda\x8e\x93\xac\x6f\xb2\
-\x10\x3f\x36\x31\xef\x36\xe6\x7e\xd9\xde\xeb\x61\x5e\xa6\x92\xfe\
-\xa2\x0e\xdc\xba\x72\xcd\x9d\xc1\xe3\x7c\x6e\x88\x39\x34\x23\x2a\
-\xe2\x8f\xeb\xf7\xd6\x4a\x0a\xfc\x58\xab\x50\xce\x9c\x63\xbb\xa7\
-\x55\xbd\x91\x4a\x58\x11\x57\xe8\x1a\x55\x94\xa9\xd0\x7f\x9f\x83\
-\xa9\x08\xe5\xb2\xb3\x7c\x70\x6a\xd6\x09\xdb\x21\xbb\x5e\xb1\x46\
-\x04\x73\xbb\xde\x41\x33\x29\x52\xed\xd5\x42\x0e\x4a\x03\x77\x85\
-\x5b\x55\x3d\xb3\x3c\xf7\x84\x2e\xcc\x86\x49\xdc\xf3\x15\xd5\x55\
-\x7f\xbb\xb4\x6b\xd8\xb4\x3b\x87\xe0\x53\x8c\xa7\xa2\x0e\xb7\xec\
-\x2e\x2b\xf9\xf1\x3f\xf2\xea\xdf\x3a\x1d\x97\x8f\xcc\xae\x60\x76\
-\xa7\x76\xef\xbb\xfe\xee\x66\x9a\xae\x82\xcc\x17\x2a\x01\x9d\xeb\
-\x34\x61\x0a\x5b\x0f\x9d\xf5\x10\xc9\xd5\x56\xb7\x8a\xd6\xb3\x17\
-\xb8\xc7\x1c\xda\x91\x65\xdc\xa3\x26\xa6\xf5\x8f\xdb\x2a\xfe\xa3\
-\x47\x6e\xb9\xa2\xfa\xed\xb6\x5d\xc7\x6d\xce\x0b\xaf\xf3\x6b\x36\
-\x0d\xef\x95\x89\x1e\x14\xf1\xf8\x9a\x1e\xd9\x40\x15\x8c\x1e\x33\
-\xf9\xa0\x86\xce\x85\xd2\x83\x5f\x3f\xb0\x09\x9f\x06\x79\x94\xf5\
-\x8c\xd6\x2c\xc3\x23\x46\x38\x7a\x68\x3b\x7a\x60\x57\x16\xa1\xae\
-\x64\x3b\xd2\x79\x0d\xdf\xc8\x8b\x07\x7a\x4b\x42\xdf\x56\x00\x99\
-\x73\xf9\x34\xcb\x74\x4a\x0f\x56\xcc\x54\xf8\x46\x7c\x5d\x52\x61\
-\x55\x13\x36\x4b\xee\x38\xcc\x80\xae\x2e\x30\xdc\x03\xc4\x0c\xaa\
-\xde\xaa\x19\xcb\x85\x39\x6b\x7c\xa0\x8b\xff\xfe\xc1\xc1\x17\x2d\
-\xa1\x74\x48\xa9\x6c\x2f\xf0\x1d\x98\x8c\x4e\xc4\x2a\x56\x64\x1c\
-\xc4\xb0\x83\x3e\x53\xa1\x29\x4c\x6b\x1c\x12\x68\x51\x5b\x5f\xc9\
-\x86\x74\x19\x8a\x67\xc0\xeb\x28\x19\x05\x91\xbc\x06\xed\x5b\x58\
-\x0b\xa4\x0f\x3e\x18\x10\x0b\xd8\xd1\xc9\x05\x4a\x47\xa3\x30\x0b\
-\x2f\x75\x76\x09\x98\x00\xca\x63\x88\x8f\x3a\x3b\xe0\x03\x33\xd9\
-\x2c\xa5\xdb\x8b\x2c\xc5\xbb\x15\xba\xdd\x00\x69\x99\xf6\x24\x25\
-\xe5\xf3\x33\xd3\x40\x11\x6f\x1c\x08\x5b\xf9\xdf\x57\xe3\x7c\xb1\
-\xbd\x51\x8f\xf9\x51\xfc\x6d\xbc\xc0\x5c\xcc\x5f\xb8\x88\xd9\x29\
-\x4b\xfc\xb5\x92\xe9\xb4\xb9\xc2\x37\x50\x63\xf8\x8d\x06\xe6\xb7\
-\x09\x59\x5b\x49\x4b\x71\x33\x66\xf6\x56\xe6\xc1\xcd\xaa\xe2\xc2\
-\xce\xb3\x87\x59\x77\x0d\x2b\x4b\x1e\x43\x96\x26\x05\xb5\x9a\x94\
-\xb7\x05\x54\xf7\x89\xea\xd2\x69\x4b\x7c\x63\x1d\x6e\xab\xbe\x6d\
-\x20\x3b\xb4\xed\x86\xa9\x69\x02\x59\x57\x21\x5a\xc1\x2d\xc3\x34\
-\xdd\xba\xee\x4a\xa9\xae\xdc\xd6\xdc\x99\x83\x78\x87\x49\x0e\x60\
-\xaa\xca\x8e\xa5\x62\x6c\x3b\xf6\x82\xab\x0f\x07\x41\xc4\xe3\x49\
-\x90\xca\xb0\x50\xc7\x69\x8a\xc7\x84\xde\x15\x1e\xe6\x65\x54\x22\
-\x6d\x76\x3d\x6b\xfb\x93\xb0\xd4\xe7\x80\xfc\xf8\xd4\xd1\x42\x3d\
-\x98\x45\x77\xc1\x14\x7a\xc8\x26\x20\x43\x85\x6d\x44\xeb\x3f\x02\
-\x13\x4d\x3b\x09\xb5\x30\x35\x74\x84\xd4\x7c\x97\xd9\xf2\xfc\xc8\
-\x6a\xef\x9a\x68\x8b\xe2\x27\xf2\x63\x42\xdf\x24\x19\xc6\xa8\x62\
-\x0e\x95\xe9\xf0\x2c\xe5\xb7\x27\xfc\x3e\x83\x81\x54\x6e\x5d\x4b\
-\x11\x6e\xaf\xdc\x4a\xa3\x75\x6f\xff\x9b\xb4\x17\x65\x32\x8b\x39\
-\x7a\x91\x42\xbb\xc5\x3d\xfe\x5f\x71\xad\x50\xed\xec\xc5\x6f\xd9\
-\x97\xb1\x22\xe1\x97\x18\x4a\xe6\xa0\xa0\xcc\x9a\x38\xb3\x54\xbb\
-\xcc\x96\xcd\xd0\xe1\x40\x7d\xdb\x1d\x3a\xd6\x0e\x93\x5c\x54\xcc\
-\xb3\x85\xcf\xaa\xf1\x88\x23\xf7\x01\x84\x4b\xec\xf8\xc0\x83\x14\
-\x79\x65\x11\xc1\xc1\x99\xbe\x54\x8e\xd4\x25\xdf\x29\xd9\x4e\x4e\
-\x6f\x1f\xf3\xc5\xca\x68\x56\xf9\x40\x99\xf4\x81\xe1\xd1\x83\xd9\
-\xc6\xef\xe0\xbf\x20\xc6\xcd\xdb\x3a\xd5\x2a\x2f\x2e\x19\x4e\x5f\
-\x8e\xd7\x95\xfa\x6c\x8f\xe5\x71\x14\xde\x48\xbb\x9d\x4c\x9a\x6d\
-\x5f\xdf\x7b\x59\xd9\xe1\x2d\xd3\x45\x0d\x7d\xe4\xe5\x9e\x33\x3a\
-\xdf\x7d\x8e\xaa\xdc\xd6\x7a\xfd\x0b\x6c\x2e\xf5\x5f\xd6\xfb\x87\
-\xff\x14\xae\x39\x0d\xd0\xed\x7c\xa5\xfe\x5a\x8f\xcd\xc7\xd3\x4c\
-\xc2\x56\x4a\xf9\x13\xb5\x55\x43\xca\x39\xab\x0e\x03\x59\x9e\x14\
-\xda\xcb\x70\x4e\x4a\x2d\x39\x5f\x93\xab\x4d\x38\xd7\x56\x66\xd9\
-\x5c\xf3\x3f\x97\x0b\xc9\x22\x40\x29\x45\x4b\xac\x3c\x50\x59\x1c\
-\xcc\xd5\x52\xba\x82\xb5\x8e\xa2\x39\x83\x3e\xa0\x0b\xb3\xee\xe5\
-\x51\xa0\xf0\xd2\x91\x3d\x00\x0e\x01\x66\x9c\x8e\xa2\x0e\xec\x3f\
-\x1c\xca\x94\xf6\x56\x6e\xdf\x17\x9e\xde\x6a\x63\x6f\x00\xd3\xae\
-\xed\x3d\xb5\x0d\x43\x5f\xe8\xef\x19\x47\x04\x79\xc6\x73\xe7\x61\
-\x52\x3c\xb1\x06\xcb\xc4\x19\x16\xb2\x44\xda\x69\x5b\x1c\x75\x59\
-\x12\x92\x52\x5a\x25\x7f\x04\xb1\x9b\x6c\x5e\x5f\x91\xd0\x35\xdb\
-\x81\x45\xde\xa7\xa3\xa0\x77\x3b\xa2\xb5\x23\x4f\xc2\x7d\xf6\x5a\
-\x5f\xb9\xd8\x9b\x8d\xb9\x59\xc1\xaa\x6a\xe9\xa9\x02\x58\x26\x16\
-\x1d\x55\x0a\x77\xba\xb7\xa1\xac\x0e\x79\x96\x80\xe0\x0e\x85\x4c\
-\x7a\x60\x03\x90\x1d\x9a\x83\x33\x2e\x54\xe3\xdf\x86\xaf\x58\x72\
-\x79\xc9\x96\xb0\xab\x43\x0e\xbb\x23\x9f\x9c\x61\xc9\x55\x87\x05\
-\xf8\x19\x7b\x3d\xc7\x4e\x7f\x7a\x9e\xa5\x39\x7f\xfe\x6b\xc5\x17\
-\xae\xc1\xe0\xe6\xe6\xb5\x9a\xee\x6a\xdd\xec\x0c\x6c\xab\x9f\x65\
-\x36\xab\x19\x03\x6d\xdb\xae\x2f\xc6\xa2\x40\xa8\x2e\x40\x37\x6a\
-\xfc\xa2\x4d\x2e\xf6\x49\xee\x5d\x30\xe2\x55\xf7\xd7\x06\xbf\x70\
-\xf6\xfa\xf4\x9c\x1e\x75\x94\x6e\xd0\x26\x09\xcb\x70\x11\xc4\xbc\
-\xc5\x30\x69\x25\x50\xb3\x34\xf8\x2a\x90\x21\x25\xef\x6f\xda\x0c\
-\xcb\xbb\xbd\x96\x3a\x8d\x30\x25\x7f\x2f\xe7\x21\x54\x24\x91\x6b\
-\x82\x8c\x34\x5d\x06\x6e\x21\x12\x9b\xa0\xd2\x42\x5c\x06\xac\x96\
-\xa6\x75\xb8\xb6\x9b\x7a\xa1\x44\x4f\xd2\xe0\xee\x75\x80\x6f\x0f\
-\x6f\x94\x10\x6b\x76\x55\xb4\x2e\x0a\x4a\xaf\x87\xc8\x30\x81\xcc\
-\xca\xf7\x82\xc6\xb4\x94\xc2\x19\xc8\x34\x87\x5e\x07\x59\x30\xd2\
-\x8f\x51\x1c\xab\xb7\x27\x0b\x08\xfa\x5d\x5c\x7c\x76\xd7\x3c\xd4\
-\x9a\x25\xc9\x0d\xb6\xa7\x05\x8f\x5e\xb6\x29\xfa\xc9\xa2\xe8\xec\
-\xb3\xfd\x0c\x3d\x7f\x85\x05\x62\xb0\x01\xc2\x21\x4f\x85\xbc\x45\
-\x1e\xa1\xb3\xc0\x1d\x54\xc0\x17\x12\xd2\x07\x75\x61\x9e\xe5\x29\
-\x6c\xee\x53\xf5\x48\x2f\xe2\xd7\xb3\x71\xa0\xf7\x30\x27\x20\xa9\
-\xa8\x15\xd9\xd1\x92\x39\xa2\x55\x7d\x1f\xa2\x76\xa2\x72\xc5\x5f\
-\x49\xe2\xfb\x9c\x6c\x3c\x6e\xdf\xa5\xa6\xd2\x0d\x52\x59\x1d\xed\
-\xdb\xb5\x43\x65\x76\xa4\x30\x33\x10\xe3\x22\x1c\xc9\xa7\x32\x40\
-\x8d\xc3\x2b\x72\x98\x02\x50\xe8\x65\xbb\xe2\x95\x98\xa5\xc3\x39\
-\x5d\x47\x98\xea\x33\x32\x6d\x51\x68\xae\xa1\xb4\x5b\x08\xa8\xb6\
-\xcb\x38\xe0\x04\x57\xd5\x5e\xbd\x00\x55\xc5\xaa\x57\xcc\xe5\xe9\
-\x19\xbb\xdc\x7f\x5d\x48\x35\xea\x02\x18\x16\x85\x51\xaf\xfe\x69\
-\x18\x01\x63\xb9\xbe\xa3\x3b\xc2\x5a\x62\x49\xc2\x2e\x41\x9b\x3e\
-\xef\x7f\xd7\xeb\x14\x4d\xe7\x1d\xa3\x0d\xb4\x54\xd4\xcf\x64\x74\
-\xb9\x5e\x29\xcf\xf0\x32\x59\xaf\xac\xbd\x6d\x47\x1e\xd2\x9d\x22\
-\xa5\x1e\x8b\xa6\xee\x1e\xe9\x1e\xd3\xd4\xeb\x76\x41\x59\x93\x7c\
-\xc5\xcc\x7c\xb3\x6a\xc6\xca\x17\x93\x1f\x26\xaf\x26\x7b\x2b\x4d\
-\x5d\xe7\x29\xa9\x3c\x12\xb2\xec\xa9\xf6\xab\x52\x0e\x2d\x21\x6b\
-\xbe\xac\x79\x0d\x8f\xa1\x38\xe8\xf6\xb5\xe7\xb6\x5b\x96\x88\x5d\
-\x64\xf4\x3d\xe0\xf1\xcd\xad\x4d\x64\xf4\xcd\x97\x7f\x36\x89\x8b\
-\x01\x4c\xc3\x54\xd4\xdc\xf6\xff\xa2\xc3\x20\x6d\xf0\xf2\xf2\xf4\
-\xbd\x47\x76\xca\xf6\x55\x31\xa9\x58\xdd\x25\x41\x55\xd1\xdf\x42\
-\x88\x96\xd3\x08\xff\x15\xe5\x28\x7a\x7a\x34\x4f\xb0\xc3\x17\xc4\
-\xc3\xa4\x6a\xb4\x7f\x8a\x10\xad\xbf\xea\xf4\xb8\x99\xfb\x83\x69\
-\xf6\x94\xe2\xf3\x6b\x4e\xe9\xd7\x17\x3a\x5f\x15\xfb\x3f\x48\x70\
-\x3e\x72\x0c\x20\x32\xdf\x1d\xbd\xb9\xf4\x08\x4c\x04\x5c\x95\x89\
-\x24\xb8\x5c\xc2\x92\x0a\xbe\x86\xa8\x5c\x5a\x3d\x5c\x56\x85\x69\
-\x97\xc5\x2b\x0b\x4a\x6d\x64\x59\x5e\x52\xba\xa6\x6c\xd5\x2d\x9d\
-\x06\xf8\xff\x84\xac\x7c\x72\xaa\xe9\x8b\x31\xaf\xc4\xb4\x47\xd8\
-\x49\x5e\x7e\xbd\x89\xfd\x63\xa4\xcd\x57\xc4\xff\x0f\x94\x99\x8f\
-\x1c\x05\xc8\xcd\xf3\xe3\x9f\xdf\xfa\x04\xa7\xbc\x88\x74\x7d\x74\
-\x8a\x4e\x59\xf2\xb7\x94\x9d\x1d\x56\xee\x9f\x20\x3c\x3b\x9d\x23\
-\x1c\x95\xea\x1c\x2a\xc7\xf7\x57\x96\x9d\x9d\x4f\x12\x7f\x30\xcd\
-\x9e\x5e\x72\x7e\xb5\x59\xfd\x2b\xa8\x69\x8f\x41\xff\x2f\xa3\x6b\
-\xb6\x0c\xa2\x96\xcf\x82\x6e\xa7\x55\x38\x46\x1a\x06\xf1\x75\x1e\
-\xd1\x35\xb8\xbe\x7d\x10\xc6\xe3\x13\xcd\xc7\xe1\x75\x9c\xa8\x18\
-\x2e\xd9\x1f\x0b\x32\x68\x36\xca\x33\xfb\xe9\x65\x5d\xa4\x9d\xa7\
-\xf0\x65\x6f\xe5\x2c\x65\xee\xe1\x47\xf2\x72\xee\x36\x0c\x64\xbc\
-\x95\x4d\xdd\x2b\x59\x59\x36\xd6\xf7\x13\xca\x8b\x15\x01\x80\xac\
-\xc2\x9c\x43\xe4\xcf\x8a\x80\x64\xf6\xa1\x49\x25\x30\x2c\x55\xee\
-\xbb\x02\xf3\x1f\x49\x8f\xde\x8d\xb5\xad\x02\x4b\x6b\xb8\x20\xf2\
-\x65\x85\xed\xb5\xbd\x0a\x14\x85\x97\x49\xc5\xa4\xbd\x7b\x55\x0a\
-\x37\x0c\x77\x2b\x31\xc6\x33\x13\xd4\x66\x27\x04\x28\xbe\x96\xc2\
-\x4b\x9e\xfd\xc3\xde\xb8\x3e\x8b\x22\x1b\x15\xc2\xea\xd5\x4a\x76\
-\xbc\x25\xbb\xde\x92\x3d\x6f\x89\xee\xa7\xb2\x21\x56\x3b\xf3\x14\
-\xef\x36\x17\xef\x35\x17\x9b\xbe\xf5\x96\xdb\xd0\xbf\xbf\xca\x6e\
-\x7b\x95\xbd\x6a\x15\xfb\xce\x84\x9e\x50\x0f\xd8\x24\x48\x6f\x14\
-\x7f\xe2\x3b\x3d\x30\x45\x2c\x88\x16\xb3\x80\x18\x0b\x13\xab\x19\
-\x8f\x68\xed\x5b\x4d\xfc\x83\xee\x60\xe6\x22\xc5\xec\x46\x93\x80\
-\x4f\xb7\x56\xde\x78\x6d\x49\xf3\x18\x7e\x78\xdc\xdc\xae\x32\x3b\
-\x2e\x2f\xbe\x1d\xdb\x15\xef\xf1\x0c\xfb\x38\x96\x7b\x14\xb3\x38\
-\x94\xa1\xa6\xa9\x2a\x76\x86\x06\xca\x35\xd4\xd9\xed\x50\x67\xaf\
-\x56\x67\x75\xd5\xa8\x1a\x74\x3d\x4e\x79\x20\x8a\x04\x4c\x2a\xa6\
-\x37\x59\x90\x7b\x08\xc6\xdc\x4e\xb8\x8e\x07\xa6\xf0\x64\xcc\x61\
-\x74\x9b\xe0\x0b\x62\x24\xea\x55\x9c\xb3\x25\x4a\x5f\x7f\xfc\x79\
-\x58\xca\xe9\x24\x03\x74\x71\xdb\x39\x49\xd2\x6c\xd6\x63\x9f\x38\
-\x4c\x1a\x09\xe7\x23\x98\x3e\x0a\xd5\xc8\x76\x7a\xec\x02\x56\xe3\
-\x4c\x06\x48\x98\xe8\x05\x6c\xdb\x67\xfb\x51\x44\x17\xc8\xda\x65\
-\x45\xd0\xf7\xea\x4e\x06\x35\x64\xdc\x47\xb6\xdb\xf7\x8a\xdb\xcf\
-\x58\xeb\x20\x4a\xc8\xe1\x56\x7b\x7c\xf8\xd7\x9c\xbf\xba\x37\x15\
-\xd1\x8e\x77\x75\xef\x2e\x05\xaf\x38\x16\xf8\x21\xee\x2d\x05\x51\
-\xe9\x80\xd5\x60\x1a\xdc\xae\x3e\xc6\x2a\x5c\xde\x4a\x2e\x25\x45\
-\x5f\x30\x02\x62\xaa\x5a\x47\x71\x3e\xe7\x29\x45\xd9\x50\x28\xbb\
-\xdc\x49\xd5\xac\xd2\xf4\xe9\xc9\xd5\x13\x4b\x61\xef\xb4\x3b\xf6\
-\x24\x08\x4a\xe8\x25\xf7\x5e\x05\xf4\xe4\xf4\xf2\x68\x88\xe1\xf5\
-\x94\x10\x12\x94\x09\xc3\x37\x14\x4e\x0f\x0c\x66\x98\x0f\x1b\x79\
-\x36\x51\xfb\x46\xd8\xb3\x10\x9d\xd7\xe9\xe5\xd9\x5b\xdb\xe8\x0f\
-\x36\x9b\xe6\xaf\x05\x8a\xe5\x37\x32\x78\xd5\x34\x6b\x2d\x70\xb4\
-\x5b\x4b\x09\xc8\x61\x32\xbe\x91\x9a\x9a\x33\x05\x60\x39\x5d\x4b\
-\xc9\x43\xe3\x38\x33\xca\x4c\xcd\x67\xc0\xce\xe7\x28\x95\x39\xb9\
-\xda\x8b\xd6\x56\xc7\x66\xd3\xa4\x56\xe4\x56\x41\x8e\xf4\xe4\x62\
-\xa6\x93\x0a\x54\xdd\x25\x4a\xa8\xe8\xb7\x6c\x02\x36\x92\xf1\x5b\
-\xe8\x41\x29\x93\x2c\xea\x97\x6c\xd4\xbb\x39\x3a\xff\x86\x7c\x40\
-\x47\x86\x08\x4b\xe7\xf2\x02\xda\x39\xa7\xe4\x91\x63\x3e\x64\xb3\
-\x2c\x5b\x88\xe1\xfa\xba\xc8\x80\x26\x08\x61\x1a\x25\x77\xfd\x71\
-\x32\x5f\xff\x0d\x18\x95\xa4\xc6\xfa\xd6\xe6\x60\x7b\x67\xe3\xd5\
-\xc6\xfa\x6f\x98\xe9\x57\xa6\x6c\x5b\x83\x7a\x41\xb6\x66\x4f\xc7\
-\x1a\x61\x20\x3d\x25\x44\x65\x30\xe4\xc3\x32\x0a\x52\xd5\x00\xb9\
-\xb2\x93\x33\x85\x69\x27\x9d\xa4\xbb\x35\x2c\xcb\x6a\x99\x33\xb4\
-\xf0\x62\x25\x90\x56\x0c\xd7\x75\x78\x4b\x41\x5c\x77\x3c\x4c\x81\
-\x6c\xf3\x50\x50\xb8\x97\x9c\x55\x09\x22\x90\xd9\x3a\xab\x79\x34\
-\x29\xef\xb1\x24\x87\x76\x85\x95\x55\xe6\x41\x18\x57\x61\x14\xca\
-\x38\x94\x03\xa1\x2a\xca\x38\x08\x04\x33\xbd\x20\x00\xf0\xc5\x3c\
-\x95\xee\x53\x9e\x3f\x7a\xd6\x63\x4a\x48\x04\x29\x43\x04\xd0\x24\
-\x42\xd7\x20\x26\x01\x69\x76\x55\xdc\x29\xb3\xa2\xa2\x9b\xfa\x15\
-\xcd\x0a\xe6\xe6\x10\x19\x0f\x28\xc7\xde\x95\xed\xd9\x72\xd5\xa3\
-\x84\xcc\xd0\x40\x6d\x20\xaa\x59\x39\x82\x00\x6a\xf1\x6c\x2c\x9d\
-\x0c\x69\x57\xb3\x32\x36\xcf\x82\x48\x52\x05\x7d\x69\x24\x10\xe8\
-\x24\xc9\x53\x36\xe1\x22\x4c\x8d\xec\x2b\xd2\xea\x99\xe5\x51\x17\
-\x43\x76\x99\x64\xb4\xca\x8a\x77\x7a\x77\xf9\x1c\xdf\x3d\x07\xc6\
-\xc6\x47\x5e\x41\xf7\x7d\x1f\xdc\x87\xf3\x7c\xae\x46\x8a\x1e\x42\
-\x28\xdd\xab\xfe\x41\x58\xba\x26\x28\xb4\x62\xb0\x6d\xa9\x3d\x1d\
-\x87\xf0\x38\xc7\x22\x40\x1e\xba\xa9\x46\x02\xb9\x3b\xee\x10\x9c\
-\x45\xd0\x1c\x0e\x44\x2a\xdb\xa4\x76\x19\xd2\x2f\x64\x4d\x12\x79\
-\xce\xbb\xc6\xc4\x22\x20\x7a\xec\xa3\x6b\x00\xfa\x04\x32\x73\xbf\
-\x3e\xd9\x25\xa4\x3a\x78\x21\x79\xd1\xf2\xb2\xd0\x93\xd2\xb8\xe4\
-\xbc\xd5\xdc\xef\xea\x2e\x5a\x4f\x4b\xe1\xa7\xf3\xf3\x32\x39\x9c\
-\x64\x02\x29\x91\x95\xd3\x17\x75\x4a\x06\xe8\xf5\x8c\x2d\x12\x44\
-\x95\x74\x78\xfd\xb1\xa4\xd9\xeb\xbe\x87\xce\x8f\x75\x05\xbf\x73\
-\xd7\xc3\x11\x70\xc2\x78\x36\x9c\x05\x62\x0d\x77\x77\x90\xdb\x5d\
-\x12\x17\xdc\xa2\x8d\xc2\xc1\x39\xe5\x08\x0c\x65\x14\x92\x5d\x14\
-\x21\x41\x7a\x62\x05\xba\xcd\x2b\x8d\xbb\x8a\xcf\x37\x1d\x10\xaa\
-\xbb\xcb\x97\x5f\x4b\x68\x1a\xe3\x30\x98\xfc\x37\x81\xed\x60\xad\
-\xfc\x70\xb6\x77\xc0\x12\xc4\x97\x79\x92\x72\x37\x87\x94\x31\x1f\
-\xcf\xc2\x68\x02\xab\xab\x3c\x8e\x15\x3b\xe5\xb1\x87\x2b\x4b\x23\
-\xf3\x74\x59\xa4\xca\xac\xb5\x92\x45\xe5\xc6\x4e\xb2\xfb\x51\x93\
-\x20\x1e\x8b\x9d\x23\xcd\x5c\x57\x1c\xdb\x65\x4e\x09\x53\xa7\x7b\
-\xe8\xd3\x50\x13\x53\x9c\x36\x34\x5d\x6a\xba\x5d\x01\xbd\x4b\x93\
-\xa6\x23\x96\xab\x21\x89\x0b\xa1\x13\x96\x2d\x64\x79\x0c\x92\x7e\
-\xec\x10\xc0\xe3\xf0\x6a\x60\xc9\x66\xec\x3a\x33\x24\x82\x71\xb1\
-\x63\x6d\x9b\x01\x39\xfa\x33\x06\x0f\x53\xfa\x7e\x95\xb6\x82\xcf\
-\xe5\x23\x9d\xf8\x76\x38\xec\x97\x94\x4c\x2d\x51\xd9\x42\x6a\x29\
-\xad\x8b\xf8\x0f\x73\xae\x8c\x78\x91\x79\xac\xb4\x95\x98\x2f\xc5\
-\xb0\x7d\xd9\xc9\x2c\xcf\x7e\x4f\x4e\x47\x0f\x8c\x72\x1c\x00\x9a\
-\x58\x33\x9d\xee\xae\xf4\x3c\x80\xb4\xb8\x4a\xdb\x4c\x8f\xd1\xb8\
-\x85\x75\xc2\xa4\x27\xee\x75\x17\xf6\xee\xa2\x73\xf4\xcb\x43\x8f\
-\x4a\xde\x21\x2c\xaf\xfd\x00\xd3\x7e\xc8\x27\xd7\xf5\xab\xb2\x18\
-\x0d\x14\xe9\x63\x0c\xe8\xb4\xd3\x28\x44\x3b\x2e\xd5\x01\x2d\xbe\
-\xd4\xeb\x9c\xb3\xef\xf8\xfd\x98\x2f\xe4\xc9\x56\x1e\x3d\xd7\xc9\
-\x67\x7f\xdd\x64\xcd\x58\x08\x9e\x4f\x12\x38\x57\x66\x5c\xbc\x34\
-\x87\xcf\x02\x8e\xce\x4e\x01\xe7\xad\x9c\xb3\x17\x3b\x83\xea\x01\
-\xb8\x4d\xbb\x28\x82\x76\x7c\x13\x5b\xbd\x3d\xab\x4f\xb4\xab\x46\
-\x79\xd2\x9e\xec\x06\xae\x84\xae\x93\x67\xdc\xec\x55\xce\x24\x50\
-\xce\x99\xc7\x1c\xcf\x2d\xb7\xc4\x4a\x48\xfe\xb3\x2d\x0b\x94\xc7\
-\x70\x5d\x45\xb3\x69\x2b\x12\x45\x37\x4b\x33\xbe\xc9\x30\xa6\xdf\
-\xd5\x48\x90\x3f\xc6\x3c\x88\xa4\x85\xbf\x80\xa5\x8d\x09\xd7\xc0\
-\x14\xf9\x88\xac\x08\xfb\x11\xbf\x9f\xe5\xe2\xf7\xe0\x7a\xb6\x2e\
-\x0f\xb4\x94\x96\xe5\x62\xc6\x79\x26\xd6\x69\xee\xc5\xfa\xee\x0f\
-\x95\xa9\xaf\x84\x68\x49\x12\xa8\x37\xa8\xeb\xcf\x31\xf4\xea\x85\
-\x8d\xaf\x3e\x78\x94\xd4\x5a\xec\xf0\x60\x03\x56\xdd\x60\x63\x47\
-\xfd\xb3\xd1\xdf\xab\xc5\x1c\xee\x39\x62\x0e\xf7\xaa\x37\x8e\xc5\
-\xf1\x73\x6b\xa7\x3e\x1e\xc7\x3b\x0d\x1a\xd6\x66\xbd\x76\x6d\x60\
-\x3a\xbf\x72\x17\x42\x59\xb1\x75\x32\xaa\x6c\x4d\x5e\xab\x58\x2b\
-\xa8\x8d\x8e\x26\x1e\x4d\xb7\xad\xb5\x04\x2a\xc3\x3a\xf1\x4c\x8f\
-\x2a\x6c\x9e\x1e\xb7\x3f\x82\xe3\x9d\x0e\x27\x8d\x07\x3f\x74\x41\
-\xaa\x46\xeb\x8d\xfe\xb6\xbf\x9d\x8f\xea\xee\x46\x9e\x77\x84\x1d\
-\x6c\x6a\x55\xa9\x3e\xb5\xee\x7e\xcc\xb1\xa9\x42\x87\xc4\xc4\xc5\
-\xe5\x5b\x1b\xc6\xdf\x10\x34\x50\x09\xda\x7a\x2d\x55\xec\x10\x90\
-\xef\x5e\x54\x65\x74\x1c\xcf\x98\xda\x28\xd4\x1e\x96\x73\xb3\x51\
-\xf9\xa2\xb1\x13\x9b\xf8\x5e\x58\xad\xe2\xd5\xd8\x71\x8b\xec\x68\
-\xc4\x04\xdf\xad\x2a\x82\x6c\x49\x1e\x1a\x43\xa6\x55\xf0\xad\x90\
-\x57\x04\xea\xc1\xa3\x45\x2e\x66\x3a\xd6\x37\x56\xea\xc4\x48\x6d\
-\xff\x93\xe2\xad\xa0\xe8\x41\x25\x96\x92\xef\x0b\xa9\x7b\x2b\x9d\
-\x48\x32\x23\xfb\xa2\x7e\x26\x1e\x4d\x5c\xdf\x05\x94\x1f\xe3\x25\
-\x0b\x84\x48\xc6\x21\x5d\x60\xd0\x7e\x1f\x66\x76\x96\x2b\xf4\x39\
-\x00\x2d\x2c\x88\x64\x26\x30\x2b\x13\x86\x4c\x63\xab\x2f\xc7\x64\
-\x9e\x5b\x65\x3b\xb5\x50\x56\xb0\x3e\xc6\xa0\xd9\x65\x79\x4c\xf9\
-\x35\x7a\x12\x1d\x8a\x78\x64\xd7\x49\x32\x31\x5e\x0e\x38\xb6\x09\
-\xcf\x78\x3a\x47\x67\x03\x8c\x37\x94\xf6\x48\x5d\x6e\xec\x97\x44\
-\x08\xc0\xed\xea\x83\x36\x8b\xa8\x71\x5d\xf5\x74\x40\x74\x0f\x46\
-\xf2\x2d\x5a\x5d\xe7\x40\x82\x44\xa6\xd3\x45\x23\x6d\x50\x71\xac\
-\xc0\x50\x4d\xf5\x9c\x94\xe3\xcd\x10\xba\x77\x2b\x93\x20\x7e\x28\
-\xae\x03\xbe\x67\x45\x32\x65\xcb\xf9\xc1\x44\x4b\x0f\xa9\x3a\xfc\
-\xb9\xa6\x63\xb2\xf5\x5d\x9e\x9d\x17\x4d\x12\x4f\xd2\xd3\xce\x33\
-\x86\x3f\xf4\xf5\xf2\x61\x01\xa0\x28\xb5\x6f\xca\x17\xb0\xd9\xab\
-\xdd\x5b\x5d\x00\xe9\xba\x99\xe1\xa1\x0b\x99\xee\x52\x07\xa0\x06\
-\xd1\x1c\x94\x35\x95\x5e\x54\x87\x85\x93\xe9\x13\x61\xf6\xc8\x22\
-\xa5\x34\x46\xb5\xe9\x6b\x88\xf0\xe7\x50\x5d\x44\x10\x37\x56\xe8\
-\x23\x35\xc8\xc2\x71\xc0\x34\x7f\xa6\x5f\xcb\x02\xe5\xe2\xc1\xe4\
-\xa5\xb6\x12\x21\x53\x36\x6a\x7a\xf0\x2b\x98\xd8\xaf\xc5\xe8\x8c\
-\x2a\x86\xac\xda\xc2\x0e\x1a\x4b\x39\x51\xf5\xf1\x54\x29\xc9\xc5\
-\x92\xc2\xa1\x5a\x01\xf3\x45\x75\xfc\x21\x7e\x06\x21\x20\x28\x16\
-\x57\x9a\xad\xb5\x46\x14\xc6\x57\xd6\x73\x36\x57\x7d\x65\xdb\x51\
-\x38\x95\xe1\xc8\x9c\xcc\x30\x50\x45\x37\x1c\xf9\xf5\x0c\x79\x99\
-\xae\x7f\xa1\x93\xdb\x90\xae\x92\xfa\x66\x09\xe1\x7c\x1b\x86\xd1\
-\x3f\x26\xef\x9e\x48\xf0\xaa\xe2\x8e\xa8\xa1\xb8\x82\xa6\x4b\x84\
-\x59\x4e\x6f\x70\x09\x6b\x24\x9b\xce\x81\x1b\xae\x32\xc8\x55\x06\
-\x7f\x42\x57\x2c\xb4\xf6\x30\xfc\x22\xe2\x42\x18\x6b\xb7\x0a\xf3\
-\x55\x33\x8c\xf3\x5a\x84\x1c\x97\xa1\xc0\x50\x52\xfe\x5b\x4e\xa4\
-\xc3\xa3\xda\x0b\x4c\x21\x5b\xbc\x15\xa9\xa9\x69\xfb\x89\x08\x7a\
-\x13\xb4\x0c\x06\xdf\x24\x93\xf7\x1c\xa1\xf1\x1f\x32\x69\xfa\x48\
-\x35\x9d\x07\xff\xc5\xc3\x11\x69\x90\x8a\x23\xca\x20\x3e\x1e\x13\
-\xdd\x54\x96\xa8\x52\xef\x23\x93\xd2\xb0\xe2\xcc\x54\xa8\xbf\xb1\
-\xbd\xfa\x68\x3d\xe1\x89\x13\x97\xb5\xba\x7e\x31\xd7\x6b\x94\xdf\
-\xdc\xbc\xdd\x46\x37\xff\xe6\x51\x37\x69\x82\x05\xc6\x0e\x54\x56\
-\x22\xcc\x80\xa1\x24\x35\x0e\xac\x60\x28\x25\x9a\xe9\x62\x30\xa2\
-\xea\xc4\x29\x32\xb5\x39\xde\x4a\x11\x0e\x13\xa6\xb7\x1e\x9c\xa7\
-\x79\x70\x43\x9c\x99\x51\x07\x3a\x61\x4b\x18\x45\xfc\x9a\x98\xab\
-\x18\xdb\x27\x6e\x5e\xcd\x13\x75\xbf\xb6\x40\xa5\x51\xec\xb1\xc9\
-\x43\x1c\xcc\xc3\xb1\x2d\x6d\xd5\x5d\x0e\xf4\x9b\xea\xa1\x99\x67\
-\xa7\x00\x92\x90\x8e\x05\x95\x45\x2e\x79\x44\xef\x12\x09\xf6\x32\
-\x36\xc9\x1d\x31\xcf\x4b\x38\x55\x1b\x4e\x28\x0c\x43\xe9\x13\xf0\
-\xd5\x2c\x10\xf8\x0e\xe7\x55\x45\xa8\x53\x34\x7b\xce\xfb\x26\xb9\
-\x46\x51\x11\x8a\xa6\x41\x44\xcb\x31\x52\x43\xab\xf6\x02\x8b\xcf\
-\xc2\xe9\x97\x24\xa7\x49\xa6\x5b\x2e\xb3\x43\x00\x06\x67\xaa\xcb\
-\xab\xe2\x4c\x6e\x32\xc4\x03\x3d\x14\x81\x90\xfe\x15\xd6\x91\xec\
-\x42\x7b\x8e\xd0\x77\xfc\x2f\x36\xe1\x0c\xf8\x62\xf3\x55\x0f\x97\
-\x81\xb5\xdc\x56\x3d\x28\x6d\x6e\x3e\x01\x8c\x57\x8f\x87\xb1\xbd\
-\xa7\x6e\xf1\x2c\xf5\xe4\xa3\x90\x2f\x32\xde\x52\x82\x7a\xe2\xb2\
-\x29\x70\x92\x3c\x3d\x03\x6b\xc8\xeb\x4b\x23\xdc\x71\x3a\xe4\xc5\
-\xb7\xe2\x7c\x95\x28\x8e\x76\x58\xb9\x36\x4b\x29\xb1\x90\x85\xe7\
-\xc0\xa5\x52\x06\x5d\x59\xe9\x47\x68\xe2\x9f\xdb\x49\x47\x71\xe9\
-\xd0\xfc\x51\x5d\xc5\xad\x24\x0c\xfe\x8b\x10\xe0\x6f\xe0\x39\xcd\
-\x3c\x06\x80\xe1\xf5\xbc\xea\xd5\xa1\x3d\x32\x28\xbf\x26\xdb\x8f\
-\x00\x10\xc2\xd0\x43\x13\x2a\x9d\x12\xad\x63\xb5\x06\xa7\x8a\xab\
-\x91\xf3\xf8\x3d\x3e\x95\x18\x82\xfe\x85\x15\x47\xe1\x64\xc2\x8b\
-\x14\x5f\x56\x3a\xa5\xd2\x5f\x9f\x2b\xe8\xfd\xfa\xb9\x36\xe4\x5f\
-\x3f\xe3\x40\x5b\x5f\x1d\xab\x01\x5a\xee\xd1\xb2\xa6\xe6\x83\xc7\
-\x35\xb7\x9f\x26\xab\xe7\x6f\x71\x1a\x01\xdc\x19\x68\x14\xec\xe5\
-\x2f\xa6\x96\xf7\x48\x6f\x42\x43\x7a\x11\x3d\x0e\x0b\x47\x3a\x08\
-\x38\x14\xec\xd7\xd8\x8d\xb6\x77\x45\x78\x1f\xb7\xe1\x46\xcc\x31\
-\x9b\x47\xbf\xca\x6b\xc5\xb4\x48\x9c\x7b\x6d\xa4\x5d\x92\xd5\x9c\
-\x29\x81\x1e\xd1\x7a\x19\x46\xab\xb7\x76\xf2\xd9\xd3\x27\xb3\xab\
-\xb2\xc6\x93\xbd\x1f\x59\x4b\x4a\xf7\xb4\x8f\x49\x2e\x9d\xc1\xb2\
-\x94\xd4\xcb\x7a\x8f\xa2\x82\x9a\xf5\x12\x43\xb5\xc4\xce\x3a\x6c\
-\x7f\x77\xa4\x7c\x2d\x19\xcb\x0f\xa5\x1e\xaa\x35\x05\x79\x1e\x22\
-\x63\xcc\xba\x34\xe4\xd0\x36\x43\x1e\x31\x52\x4d\x2c\x9a\x92\xaf\
-\x8c\xa5\x53\xa2\x49\x9d\x92\x41\xea\x6c\xd4\xb5\x24\xd4\x45\x5b\
-\xe9\x6b\xa9\x12\x77\x45\x98\x61\x07\x54\x21\xd0\xa1\xb4\xba\x33\
-\x0f\x62\x99\xc9\x5a\x6d\x7b\xe8\x54\x8f\x4f\x57\xd6\x52\xe0\xac\
-\x94\x68\x4c\xe6\x03\xff\x71\x45\x39\x59\x7e\x31\xa4\x9a\xfb\xb4\
-\xdb\x9b\x27\x75\x98\xd6\x23\x1b\x1d\x40\xd6\xdf\x08\xa9\x43\x34\
-\x49\x84\x3b\xc0\x73\x67\x45\x76\x33\x52\x17\x78\xbe\x1c\xc2\x3e\
-\x2a\xd6\x9e\x45\x6c\x79\x7a\xc5\x9d\x1d\xd8\x43\xcf\x2e\xc0\xad\
-\x77\x4b\xda\x61\xd7\x92\x43\x3f\x22\xf7\xb3\x87\xc6\x5d\x20\xb7\
-\x66\x4b\xfe\x2b\xe5\x65\x74\x65\x61\x84\x7d\x78\x8d\x64\x3d\xfb\
-\xa7\x8e\x57\xac\xbe\x9d\xeb\x4c\xd0\x58\x92\x60\xd6\x5b\x5c\xca\
-\x32\xa7\x4e\x29\x75\xe1\xa0\xde\x50\x92\x7a\xa9\x6a\x6e\xa9\xc7\
-\x3d\xb6\xff\xef\xfd\x9e\xee\xba\x38\x15\x85\x99\x7e\x5d\x57\xc9\
-\x16\xeb\xe2\xcf\xbc\xce\x1d\x4c\x48\x15\xb6\xb5\xdc\x2c\xa1\x13\
-\x25\x9e\xa6\x33\xd0\x81\x43\xd0\x32\xe6\xfa\x09\xb1\x02\x02\xa6\
-\x1d\x7c\x1a\xb1\xe6\x49\x9c\x68\x3d\x23\xec\x78\x03\xa7\x94\x56\
-\xb7\xfe\xc0\x30\x9d\x74\x29\x21\xaf\xcc\xe6\x25\x0d\xa1\x78\x57\
-\x8f\x59\xc9\x16\xc1\x18\xa8\x36\xe3\xda\x18\x41\x5b\x42\xe1\x3a\
-\xbd\xec\x8b\xbf\x9b\xe8\x90\xec\x61\xd4\x2a\x43\x94\x1f\xd4\xfd\
-\x9b\x25\xc5\xf4\xcc\x59\x7d\x18\x6e\xf7\x3b\xd7\xf3\x39\x3b\xd5\
-\x4b\x32\xcf\xeb\x39\x3b\xf6\xea\x1b\xf0\x7b\x39\x32\x5a\x80\xdb\
-\xf0\x17\x79\x64\x4a\xff\xeb\x7f\x1a\xf3\xda\x4f\x6c\x13\x8a\xf0\
-\xc9\xe8\x31\xd9\xac\x83\x11\xe8\x61\x86\x59\x15\x69\xec\xfc\xb9\
-\x6e\xf5\xcf\x99\x55\xd7\x37\x66\xe7\x3c\xba\x84\xc8\xea\x64\x5d\
-\xf2\xfd\x91\x66\x58\xed\xb9\x8b\xeb\x3e\xb1\x4b\x91\x49\xdf\xc4\
-\x77\xf0\xc8\xc3\xd2\xeb\x34\x9c\xd8\xaf\x4a\x75\x8f\xcf\xae\xde\
-\xfc\x57\x03\x82\xa2\xb2\x8b\x61\x77\x0f\x41\xcf\x08\x9c\x91\xaf\
-\x2d\x4f\xda\x79\xdc\x43\xdc\xad\x1a\xe6\xa6\xed\x69\xae\xe5\xfa\
-\x31\x8e\x0d\xdf\xc8\xec\xfc\xfe\x0e\x9d\x4e\x0d\xfa\x6c\x8a\x86\
-\x1f\xcb\x69\x85\x4c\x81\xbf\xe1\x5c\x82\xa6\x8a\xb4\x42\xb3\xa9\
-\x09\x7f\xca\x31\x30\x55\x47\x4c\xc4\xca\x7a\xde\x2f\xbf\x4d\xe2\
-\x43\xb3\x01\xcb\x4a\x7f\xdf\xa9\x0d\x0a\x7e\xee\x07\x24\x46\x7a\
-\xec\x41\xfe\x62\x95\x6c\xea\x12\xf8\x65\xd0\x2b\x0a\x84\x3c\xf0\
-\xf9\x68\x5d\xab\x39\xf0\xd5\x94\x15\x1f\x39\x39\xbe\x55\xff\x35\
-\x07\xbd\x87\xf3\xfd\x0a\x8f\x7e\xdb\x74\xf4\xdb\xf5\x0e\xba\x5e\
-\xb3\xd3\xa0\xdf\xf2\x00\x38\x60\x35\x67\xe2\x5a\x34\xbe\xc7\x62\
-\xd3\x90\x1a\xd8\x79\x64\x2a\x70\x42\x43\x30\xdd\x15\x3e\xa5\x41\
-\xa9\xd3\xfb\x60\x4e\x0c\x99\xf6\xd2\x30\xbf\xaa\x4a\x74\x4f\x43\
-\x2e\x70\xd6\x21\xd1\x3b\x98\x61\x71\x69\x2f\xa3\xf1\x7b\xed\xf5\
-\x6a\x61\x9e\x1d\xf2\x3e\x74\x40\xc0\x09\xce\xb5\x7d\x39\xa1\x58\
-\x6e\x0a\x2d\x03\xb1\x6b\xfa\x86\xd2\x98\x9b\xa2\x13\x16\x6e\x88\
-\xcd\xc3\xf9\x2c\x66\xc9\xdd\x45\x92\x66\xc7\x5a\x75\x2c\x82\x10\
-\x9b\xba\x00\x79\x7b\x81\xef\xbc\xaa\x4c\xde\x52\x1b\xb2\x1f\x9e\
-\xb5\x14\x0c\x21\x1f\xda\xad\xb9\x43\x16\xea\xde\xab\x66\xf6\xaf\
-\x3d\xb0\xae\x79\x78\x73\x6f\x73\xb4\x39\xf5\x6f\xce\xa3\x1f\x26\
-\x01\xb7\xc2\x66\x99\x7d\x83\x6e\xbd\x00\x66\xe2\x51\x0b\x37\xc6\
-\x3c\xa6\x8b\x47\x1c\xcf\x8c\x30\xc2\x53\xd0\x38\x0a\xc7\x37\x74\
-\x8b\x47\x1b\x85\x0b\x55\xe3\xa8\xd2\x8d\x65\x96\xa8\xaf\x19\xa7\
-\xa5\x49\x65\x71\x75\xae\x5d\x06\xff\x38\x6b\x61\x37\xfe\x5a\xf5\
-\x5d\x25\xc9\x7f\xff\xff\x2c\xdb\xed\xb1\xc2\x8e\x47\x30\x2f\x41\
-\xe9\xee\xca\xf8\xee\x90\xc1\x51\x18\xef\x19\x1d\x76\x5e\x89\x39\
-\xad\x49\x80\xa1\x7a\xbc\xee\xca\x0e\xd8\xbd\xaa\x3c\xfb\x5d\x9e\
-\x11\x29\x52\x42\x72\x81\x48\x30\x17\x39\x3d\x16\x58\xef\xd5\xc4\
-\xaf\x8e\x1e\x2c\x04\x62\x06\x7b\x52\x1a\x98\xc7\xbd\xb5\xa5\x15\
-\xdf\xb2\xab\x58\x5a\xd1\xa2\x5a\x21\x7e\xd3\x79\xb4\x16\x72\xec\
-\x16\x5e\x4d\x8c\xbf\xca\x83\x6b\x7f\x06\x4f\xac\x4c\x06\x73\x66\
-\x61\xf2\xd7\x83\x24\x8d\x79\xaa\xcf\x7f\x8f\x54\x6a\x4a\xf9\x8f\
-\x9a\x72\x64\x3f\x75\x32\xa8\x92\x7b\xdc\x49\x62\x3f\x99\x65\xd2\
-\x15\xf8\x87\xdd\x28\x56\xdd\x63\x5a\x82\x98\x4f\x72\xff\xe2\x3f\
-\x57\xd2\xf1\x7d\xd9\xd7\x6b\x1b\x52\xe4\x4b\x70\xe5\x3c\x07\x4d\
-\xc9\x79\xcb\x13\xa3\x5e\xd4\x90\x13\x38\x28\x27\x58\xb0\x20\x97\
-\xc3\xf9\xec\x02\xe7\x93\x8a\x4b\x66\x05\x56\x1e\x9b\x8b\x28\xcc\
-\xb2\xc2\x21\xd5\x45\x7f\x6b\x18\x65\x97\x62\xeb\x0c\xb5\x46\xeb\
-\xce\x59\xcd\x7e\x71\xde\x3a\x4b\x58\xef\xcd\x3b\xb2\x46\xe9\x57\
-\x1a\x4a\xc9\x02\xd0\x6b\x5e\x04\x59\x28\xf0\xa5\xce\x24\x7d\x30\
-\x99\x97\x24\xb2\x42\x5e\x5a\x29\x00\x53\xf6\x90\xe4\x45\x34\x88\
-\x3c\x2a\x4b\x3b\x66\xcc\xaf\x03\x3c\x02\x53\x98\x46\xa4\x37\x3e\
-\x95\x4f\x40\x36\x27\x84\x45\x8f\x60\x60\xb7\xe8\xc7\x24\x1e\xe6\
-\x73\x9e\xa5\xa8\x6e\xb0\x71\x9e\xc2\xb6\x22\xb7\xce\x45\x9a\x4c\
-\x72\xf4\x13\x0c\xd4\x9b\x65\x79\x8c\x6f\x8f\x07\x51\x11\xbb\x6e\
-\x4c\xa2\x67\x69\x72\x8d\x9c\x8e\x69\x9c\xca\xce\xb1\x76\x49\x83\
-\x5f\x6c\xe9\x6a\xb1\xcd\x3b\x16\xa7\xef\x87\xce\x0e\xdf\x2e\x43\
-\x9e\xc5\x9a\x6e\xd4\x1d\x0e\xe0\xe5\x87\xb6\xd4\xd4\xef\x3a\x4f\
-\x5b\xae\x57\x89\x0b\x6b\x9f\xf7\x31\xaf\x72\xa1\xef\x81\x1a\xf5\
-\xbd\x58\x17\xb5\x22\x73\xf1\xbc\xe5\x19\xa7\xdf\x61\xdd\xfd\x9a\
-\x98\x7b\x94\x12\x83\xca\x50\xcc\xdb\x31\xf5\x51\xda\xef\xbf\xd4\
-\x86\x69\xde\x4a\xf1\x0c\xa6\x91\x02\xa5\xa7\xbd\xed\x81\xc2\x11\
-\x25\x8f\x6f\x1a\x58\x52\x55\xe8\xc0\x99\x2e\x87\x71\xcd\x88\x5d\
-\x52\x0b\xd8\x1b\xf1\x05\xb9\x34\xee\xa7\x3c\xe8\x95\xfe\xb2\xdc\
-\xfc\x8b\x6f\x9e\x1d\xca\xfb\x9c\xd0\xf1\xc1\xe9\xc9\x45\xc5\x37\
-\x1c\xc5\xce\x28\x0f\xa3\x6c\x0d\x75\x6d\xba\xe4\x46\xf7\x36\xba\
-\xab\x86\x2d\x2a\xcb\x1e\x60\xc4\x13\xa3\x9e\x3f\x08\x8c\x1e\xa2\
-\x50\x2e\x09\x80\xdc\xf0\x0a\x6d\x53\x46\x9e\x81\x72\x28\x3d\x6d\
-\x41\x6a\xd0\x67\xd0\x07\xfb\xec\x0d\x06\xa2\xdd\x07\xf3\x45\x44\
-\x82\x88\x6b\xe1\x41\x8a\xa6\xca\x15\x46\x90\x7b\xd2\x16\x18\x30\
-\xd2\xac\xc8\x1f\x93\xdc\xfb\x4e\x6f\xae\xb4\xb7\x3a\x74\x0b\x33\
-\xf5\xc0\x55\x1e\x3c\xbc\x4b\x27\x87\xc4\x18\x8d\xf6\xa8\x32\x16\
-\x57\x3b\x6a\xa0\xf2\x6e\x46\xee\xc2\xf8\x76\x32\x39\xfc\x81\xd8\
-\x92\xce\x55\x68\xf5\x67\x22\x0b\xf0\x61\xa9\x89\xf1\x5e\xc5\xab\
-\x22\xeb\xbb\x91\x94\xe8\xb8\xdb\x03\xe5\x0d\xdf\x84\x16\xec\xc3\
-\x7b\x60\x19\xd0\x07\xe9\xa5\x68\xca\x73\xf1\x56\xbb\x89\x93\x27\
-\xb2\x71\x4f\xd6\xbe\x90\xcf\xd4\xfb\x78\xaa\x37\x49\x75\x0c\xd1\
-\xbb\x33\xf2\xfc\x59\x91\x6c\xcf\x4a\x1c\x22\x6b\xe2\xf9\x84\xe1\
-\x2e\x16\x61\xa6\xbf\x58\xde\x56\x85\x48\x56\xf4\x34\xb5\x1c\x99\
-\x3f\xa8\x87\xa6\x63\x12\xfe\x80\x38\x28\xe6\x77\xe8\x7c\x99\xa4\
-\x35\xdf\x5f\xa8\x1b\x2b\x3f\xde\x52\xa3\x29\xee\x17\x92\x9a\x42\
-\x47\xf9\x11\x73\xc4\xe1\x58\x89\x79\x09\xe0\x3d\x87\x5a\xcc\x58\
-\x10\xd0\x8b\x31\xc7\x8c\x04\x40\x43\xf5\xd6\xb6\x21\x9c\x7a\x4d\
-\x1b\x38\x83\x12\xac\x48\x32\x54\x2e\xd1\xcc\x44\x19\xfe\x96\x48\
-\xc8\xa9\x19\x25\xf7\xea\x42\x42\xac\xe1\x79\x87\xb2\x8c\x88\x21\
-\xb9\x79\xfe\x88\xdc\x5e\x34\x58\x03\x76\x1e\x73\x57\x06\x18\x59\
-\xfe\x45\x96\xdb\x6a\xbb\x6e\xe8\x49\x39\xa3\xdb\x55\x1f\xe7\x51\
-\xcd\x92\x1b\x7f\x9b\xe4\xc6\xd5\x60\xc1\xe3\x86\x26\x56\x44\xae\
-\xd5\x08\xd8\x82\x67\xfe\x56\x54\xec\x68\x26\x34\xb1\x9c\xad\xb0\
-\xd4\x7b\x68\x07\x05\x5a\xe4\x8b\x05\x9c\x90\xd8\x83\x7a\x09\x52\
-\x31\x34\xae\x5f\x6c\x1a\xc8\x27\x18\x55\x7d\xab\x47\x28\x68\xee\
-\x14\x5b\x5a\xfd\x9a\x73\x9d\x82\xf1\xc0\xc5\x92\x34\x9d\xf1\x68\
-\xe1\x6f\x82\xa5\x8e\x46\x71\xe2\x6f\x12\x27\x8e\x06\x24\x3e\x96\
-\xc4\x6c\x12\x8a\x31\xb0\xbb\xbf\x95\xaa\x50\x4d\xf3\x71\xc1\xd5\
-\xcb\xf5\x76\x5e\x51\xba\xab\x56\xcb\x4b\x36\x2f\xe5\x99\xa9\x09\
-\xbd\x0f\x67\xb9\x98\x15\x5e\xa3\x85\xe0\xb2\x4b\x9c\xa9\xf9\x06\
-\x96\x1b\x9b\x9d\x87\xb0\x21\x01\x2a\xde\xc4\x4b\x3c\x31\xe9\x5d\
-\x26\xa5\xbc\x42\x56\xe7\x67\x32\xae\xf9\x32\x5c\x84\x0c\x7b\x4a\
-\xcc\xc2\x06\x81\xda\xac\x56\x53\x51\x42\x19\x6f\xea\xab\x50\x5c\
-\x2a\x08\x64\x94\xb8\xc2\x85\x5f\x3c\x3f\x28\xdd\xb2\x3f\x17\x95\
-\x6c\x77\x45\x6f\x21\x4a\x5d\xff\x26\xef\xc9\xe8\xd7\x38\x58\x9d\
-\xae\x55\x5e\x70\x05\x4c\x26\x99\xbd\xe5\x11\x9b\xa6\x68\x8c\x4d\
-\xd0\xff\x52\x8a\xe5\x3e\xd3\x22\xbf\x4a\x8e\x56\x4a\x7c\x22\x00\
-\x55\x3a\xa0\x47\xc3\xb7\x20\xc0\x8d\x8b\x19\x2f\xb2\xc9\x29\xbc\
-\xa4\xce\x2f\x73\xc4\x0d\xd6\x76\x94\xd5\x57\x13\xf1\x0d\xa2\xf8\
-\x59\x83\xb7\x29\x28\x4b\x68\x08\x17\x98\x62\xed\xd7\x5a\xad\xba\
-\x52\xb2\xb8\xf7\xe4\x41\x96\x7a\x8f\xbb\xb3\xcf\x92\x36\x54\x68\
-\x7c\x39\xdb\x7b\xaf\x35\xab\xa1\x33\x58\xdc\xbb\x4f\x78\x65\xe5\
-\x6c\xcb\xca\xcb\xd4\x05\xc3\xcd\xd5\x30\xdc\x74\x60\xb8\xf9\x75\
-\x30\xdc\x5a\x0d\xc3\x2d\x07\x86\x5b\x5f\x07\xc3\xed\xd5\x30\xdc\
-\x76\x60\xb8\xfd\x75\x30\xdc\x59\x0d\xc3\x1d\x07\x86\x3b\x4b\x62\
-\xf8\x7f\x01\x2f\x99\x0d\x6a\
-\x00\x00\x02\x1b\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x38\x22\x20\
-\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x3e\x0d\x0a\x20\x20\
-\x3c\x67\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x66\
-\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\
-\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x67\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x74\x72\x61\x6e\x73\x66\
-\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x2d\
-\x38\x34\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x2d\x34\x35\x2e\x30\
-\x30\x30\x30\x30\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\
-\x61\x6e\x73\x6c\x61\x74\x65\x28\x38\x34\x2e\x30\x30\x30\x30\x30\
-\x30\x2c\x20\x34\x35\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0d\
-\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\
-\x3d\x22\x4d\x32\x32\x2c\x30\x20\x4c\x37\x2c\x30\x20\x43\x36\x2e\
-\x33\x2c\x30\x20\x35\x2e\x38\x2c\x30\x2e\x33\x20\x35\x2e\x34\x2c\
-\x30\x2e\x39\x20\x4c\x30\x2c\x39\x20\x4c\x35\x2e\x34\x2c\x31\x37\
-\x2e\x31\x20\x43\x35\x2e\x38\x2c\x31\x37\x2e\x36\x20\x36\x2e\x33\
-\x2c\x31\x38\x20\x37\x2c\x31\x38\x20\x4c\x32\x32\x2c\x31\x38\x20\
-\x43\x32\x33\x2e\x31\x2c\x31\x38\x20\x32\x34\x2c\x31\x37\x2e\x31\
-\x20\x32\x34\x2c\x31\x36\x20\x4c\x32\x34\x2c\x32\x20\x43\x32\x34\
-\x2c\x30\x2e\x39\x20\x32\x33\x2e\x31\x2c\x30\x20\x32\x32\x2c\x30\
-\x20\x4c\x32\x32\x2c\x30\x20\x5a\x20\x4d\x31\x39\x2c\x31\x32\x2e\
-\x36\x20\x4c\x31\x37\x2e\x36\x2c\x31\x34\x20\x4c\x31\x34\x2c\x31\
-\x30\x2e\x34\x20\x4c\x31\x30\x2e\x34\x2c\x31\x34\x20\x4c\x39\x2c\
-\x31\x32\x2e\x36\x20\x4c\x31\x32\x2e\x36\x2c\x39\x20\x4c\x39\x2c\
-\x35\x2e\x34\x20\x4c\x31\x30\x2e\x34\x2c\x34\x20\x4c\x31\x34\x2c\
-\x37\x2e\x36\x20\x4c\x31\x37\x2e\x36\x2c\x34\x20\x4c\x31\x39\x2c\
-\x35\x2e\x34\x20\x4c\x31\x35\x2e\x34\x2c\x39\x20\x4c\x31\x39\x2c\
-\x31\x32\x2e\x36\x20\x4c\x31\x39\x2c\x31\x32\x2e\x36\x20\x5a\x22\
-\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\
-\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\x5c\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\
-\x31\x33\x36\x33\x62\x22\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x30\
-\x2c\x31\x38\x20\x32\x34\x2c\x31\x38\x20\x31\x32\x2c\x36\x22\x2f\
-\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x11\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x35\x2e\x30\x38\x32\x33\x30\
-\x32\x38\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x2d\x33\x2e\
-\x33\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\
-\x20\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\
-\x35\x34\x30\x38\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\
-\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x2d\x30\x2e\
-\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x33\x20\x2d\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\
-\x20\x2d\x33\x2e\x35\x39\x37\x33\x31\x30\x31\x37\x2c\x2d\x33\x2e\
-\x35\x39\x36\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\
-\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x31\x2c\x2d\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x31\x39\x31\x2c\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\
-\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\x38\x20\x4c\x20\x34\
-\x2e\x35\x31\x32\x35\x38\x36\x36\x2c\x30\x2e\x36\x31\x38\x32\x38\
-\x34\x33\x37\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x34\x31\x33\x34\
-\x33\x34\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x30\
-\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x30\x2e\x31\x35\x36\
-\x32\x38\x31\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x30\
-\x2e\x31\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\
-\x32\x34\x33\x20\x2d\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\
-\x37\x31\x31\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x33\x33\x61\x34\x64\x66\x22\x20\x66\x69\x6c\x6c\x2d\x6f\
-\x70\x61\x63\x69\x74\x79\x3d\x22\x30\x2e\x35\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\
-\x00\x00\x00\xf4\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x35\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x33\x32\x2e\x35\x22\
-\x20\x63\x79\x3d\x22\x33\x30\x22\x20\x72\x3d\x22\x32\x35\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\
-\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\x72\
-\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x35\x22\x20\x2f\x3e\
-\x0d\x0a\x20\x20\x3c\x72\x65\x63\x74\x20\x77\x69\x64\x74\x68\x3d\
-\x22\x35\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\x22\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x78\x3d\
-\x22\x33\x30\x22\x20\x79\x3d\x22\x31\x35\x22\x2f\x3e\x0d\x0a\x20\
-\x20\x3c\x72\x65\x63\x74\x20\x77\x69\x64\x74\x68\x3d\x22\x35\x22\
-\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x30\x22\x20\x66\x69\x6c\
-\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x78\x3d\x22\x33\
-\x30\x22\x20\x79\x3d\x22\x32\x35\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\
-\x76\x67\x3e\
-\x00\x00\x01\x98\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\
-\x20\x78\x3d\x22\x32\x22\x20\x79\x3d\x22\x32\x22\x20\x77\x69\x64\
-\x74\x68\x3d\x22\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x38\
-\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x33\x31\x33\x36\x33\
-\x62\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\
-\x22\x31\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x72\x65\x63\x74\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x78\x3d\
-\x22\x32\x22\x20\x79\x3d\x22\x31\x34\x22\x20\x77\x69\x64\x74\x68\
-\x3d\x22\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x38\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\
-\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x78\x3d\x22\x31\
-\x34\x22\x20\x79\x3d\x22\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
-\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x38\x22\x20\x73\x74\
-\x72\x6f\x6b\x65\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x73\
-\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x22\x2f\
-\x3e\x0d\x0a\x20\x20\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\
-\x22\x6e\x6f\x6e\x65\x22\x20\x78\x3d\x22\x31\x34\x22\x20\x79\x3d\
-\x22\x31\x34\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x38\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x38\x22\x20\x73\x74\x72\x6f\x6b\x65\
-\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x73\x74\x72\x6f\x6b\
-\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x22\x2f\x3e\x0d\x0a\x3c\
-\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x04\x7d\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\
-\x20\x78\x3d\x22\x34\x2e\x35\x22\x20\x79\x3d\x22\x32\x22\x20\x77\
-\x69\x64\x74\x68\x3d\x22\x31\x35\x22\x20\x68\x65\x69\x67\x68\x74\
-\x3d\x22\x32\x30\x22\x20\x72\x78\x3d\x22\x31\x22\x20\x72\x79\x3d\
-\x22\x31\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x33\x31\x33\
-\x36\x33\x62\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\
-\x68\x3d\x22\x31\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x67\x20\x74\x72\
-\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\x65\x28\x30\
-\x2e\x36\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x38\x2c\
-\x20\x38\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\
-\x64\x3d\x22\x4d\x31\x36\x2e\x33\x36\x2c\x31\x34\x43\x31\x36\x2e\
-\x34\x34\x2c\x31\x33\x2e\x33\x34\x20\x31\x36\x2e\x35\x2c\x31\x32\
-\x2e\x36\x38\x20\x31\x36\x2e\x35\x2c\x31\x32\x43\x31\x36\x2e\x35\
-\x2c\x31\x31\x2e\x33\x32\x20\x31\x36\x2e\x34\x34\x2c\x31\x30\x2e\
-\x36\x36\x20\x31\x36\x2e\x33\x36\x2c\x31\x30\x48\x31\x39\x2e\x37\
-\x34\x43\x31\x39\x2e\x39\x2c\x31\x30\x2e\x36\x34\x20\x32\x30\x2c\
-\x31\x31\x2e\x33\x31\x20\x32\x30\x2c\x31\x32\x43\x32\x30\x2c\x31\
-\x32\x2e\x36\x39\x20\x31\x39\x2e\x39\x2c\x31\x33\x2e\x33\x36\x20\
-\x31\x39\x2e\x37\x34\x2c\x31\x34\x4d\x31\x34\x2e\x35\x39\x2c\x31\
-\x39\x2e\x35\x36\x43\x31\x35\x2e\x31\x39\x2c\x31\x38\x2e\x34\x35\
-\x20\x31\x35\x2e\x36\x35\x2c\x31\x37\x2e\x32\x35\x20\x31\x35\x2e\
-\x39\x37\x2c\x31\x36\x48\x31\x38\x2e\x39\x32\x43\x31\x37\x2e\x39\
-\x36\x2c\x31\x37\x2e\x36\x35\x20\x31\x36\x2e\x34\x33\x2c\x31\x38\
-\x2e\x39\x33\x20\x31\x34\x2e\x35\x39\x2c\x31\x39\x2e\x35\x36\x4d\
-\x31\x34\x2e\x33\x34\x2c\x31\x34\x48\x39\x2e\x36\x36\x43\x39\x2e\
-\x35\x36\x2c\x31\x33\x2e\x33\x34\x20\x39\x2e\x35\x2c\x31\x32\x2e\
-\x36\x38\x20\x39\x2e\x35\x2c\x31\x32\x43\x39\x2e\x35\x2c\x31\x31\
-\x2e\x33\x32\x20\x39\x2e\x35\x36\x2c\x31\x30\x2e\x36\x35\x20\x39\
-\x2e\x36\x36\x2c\x31\x30\x48\x31\x34\x2e\x33\x34\x43\x31\x34\x2e\
-\x34\x33\x2c\x31\x30\x2e\x36\x35\x20\x31\x34\x2e\x35\x2c\x31\x31\
-\x2e\x33\x32\x20\x31\x34\x2e\x35\x2c\x31\x32\x43\x31\x34\x2e\x35\
-\x2c\x31\x32\x2e\x36\x38\x20\x31\x34\x2e\x34\x33\x2c\x31\x33\x2e\
-\x33\x34\x20\x31\x34\x2e\x33\x34\x2c\x31\x34\x4d\x31\x32\x2c\x31\
-\x39\x2e\x39\x36\x43\x31\x31\x2e\x31\x37\x2c\x31\x38\x2e\x37\x36\
-\x20\x31\x30\x2e\x35\x2c\x31\x37\x2e\x34\x33\x20\x31\x30\x2e\x30\
-\x39\x2c\x31\x36\x48\x31\x33\x2e\x39\x31\x43\x31\x33\x2e\x35\x2c\
-\x31\x37\x2e\x34\x33\x20\x31\x32\x2e\x38\x33\x2c\x31\x38\x2e\x37\
-\x36\x20\x31\x32\x2c\x31\x39\x2e\x39\x36\x4d\x38\x2c\x38\x48\x35\
-\x2e\x30\x38\x43\x36\x2e\x30\x33\x2c\x36\x2e\x33\x34\x20\x37\x2e\
-\x35\x37\x2c\x35\x2e\x30\x36\x20\x39\x2e\x34\x2c\x34\x2e\x34\x34\
-\x43\x38\x2e\x38\x2c\x35\x2e\x35\x35\x20\x38\x2e\x33\x35\x2c\x36\
-\x2e\x37\x35\x20\x38\x2c\x38\x4d\x35\x2e\x30\x38\x2c\x31\x36\x48\
-\x38\x43\x38\x2e\x33\x35\x2c\x31\x37\x2e\x32\x35\x20\x38\x2e\x38\
-\x2c\x31\x38\x2e\x34\x35\x20\x39\x2e\x34\x2c\x31\x39\x2e\x35\x36\
-\x43\x37\x2e\x35\x37\x2c\x31\x38\x2e\x39\x33\x20\x36\x2e\x30\x33\
-\x2c\x31\x37\x2e\x36\x35\x20\x35\x2e\x30\x38\x2c\x31\x36\x4d\x34\
-\x2e\x32\x36\x2c\x31\x34\x43\x34\x2e\x31\x2c\x31\x33\x2e\x33\x36\
-\x20\x34\x2c\x31\x32\x2e\x36\x39\x20\x34\x2c\x31\x32\x43\x34\x2c\
-\x31\x31\x2e\x33\x31\x20\x34\x2e\x31\x2c\x31\x30\x2e\x36\x34\x20\
-\x34\x2e\x32\x36\x2c\x31\x30\x48\x37\x2e\x36\x34\x43\x37\x2e\x35\
-\x36\x2c\x31\x30\x2e\x36\x36\x20\x37\x2e\x35\x2c\x31\x31\x2e\x33\
-\x32\x20\x37\x2e\x35\x2c\x31\x32\x43\x37\x2e\x35\x2c\x31\x32\x2e\
-\x36\x38\x20\x37\x2e\x35\x36\x2c\x31\x33\x2e\x33\x34\x20\x37\x2e\
-\x36\x34\x2c\x31\x34\x4d\x31\x32\x2c\x34\x2e\x30\x33\x43\x31\x32\
-\x2e\x38\x33\x2c\x35\x2e\x32\x33\x20\x31\x33\x2e\x35\x2c\x36\x2e\
-\x35\x37\x20\x31\x33\x2e\x39\x31\x2c\x38\x48\x31\x30\x2e\x30\x39\
-\x43\x31\x30\x2e\x35\x2c\x36\x2e\x35\x37\x20\x31\x31\x2e\x31\x37\
-\x2c\x35\x2e\x32\x33\x20\x31\x32\x2c\x34\x2e\x30\x33\x4d\x31\x38\
-\x2e\x39\x32\x2c\x38\x48\x31\x35\x2e\x39\x37\x43\x31\x35\x2e\x36\
-\x35\x2c\x36\x2e\x37\x35\x20\x31\x35\x2e\x31\x39\x2c\x35\x2e\x35\
-\x35\x20\x31\x34\x2e\x35\x39\x2c\x34\x2e\x34\x34\x43\x31\x36\x2e\
-\x34\x33\x2c\x35\x2e\x30\x37\x20\x31\x37\x2e\x39\x36\x2c\x36\x2e\
-\x33\x34\x20\x31\x38\x2e\x39\x32\x2c\x38\x4d\x31\x32\x2c\x32\x43\
-\x36\x2e\x34\x37\x2c\x32\x20\x32\x2c\x36\x2e\x35\x20\x32\x2c\x31\
-\x32\x41\x31\x30\x2c\x31\x30\x20\x30\x20\x30\x2c\x30\x20\x31\x32\
-\x2c\x32\x32\x41\x31\x30\x2c\x31\x30\x20\x30\x20\x30\x2c\x30\x20\
-\x32\x32\x2c\x31\x32\x41\x31\x30\x2c\x31\x30\x20\x30\x20\x30\x2c\
-\x30\x20\x31\x32\x2c\x32\x5a\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\
-\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x0e\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\
-\x39\x32\x2c\x30\x2e\x39\x31\x37\x36\x39\x37\x31\x38\x20\x34\x2e\
-\x35\x2c\x34\x2e\x32\x32\x38\x30\x31\x38\x32\x20\x37\x2e\x38\x31\
-\x30\x35\x34\x30\x38\x2c\x30\x2e\x39\x31\x36\x32\x37\x36\x34\x38\
-\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\
-\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\
-\x31\x37\x34\x39\x2c\x30\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\
-\x2c\x30\x2e\x31\x35\x37\x37\x30\x32\x30\x32\x20\x30\x2e\x31\x35\
-\x37\x37\x31\x32\x34\x2c\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x32\
-\x20\x30\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x32\x20\x6c\x20\
-\x2d\x33\x2e\x35\x39\x36\x31\x32\x38\x33\x2c\x33\x2e\x35\x39\x37\
-\x33\x31\x30\x32\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\
-\x30\x31\x39\x20\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\
-\x2e\x31\x35\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x38\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\
-\x33\x2c\x31\x2e\x34\x38\x37\x34\x31\x33\x34\x20\x63\x20\x2d\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x20\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\
-\x2e\x34\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\x2e\x35\x37\
-\x31\x31\x33\x36\x39\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\
-\x2c\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x31\x20\x30\x2e\x34\
-\x31\x33\x34\x36\x32\x34\x2c\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\
-\x33\x31\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x2c\x30\x2e\x30\
-\x30\x31\x34\x32\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\
-\x30\x62\x30\x62\x30\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\
-\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\
-\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x11\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x35\x2e\x30\x38\x32\x33\x30\
-\x32\x38\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x2d\x33\x2e\
-\x33\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\
-\x20\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\
-\x35\x34\x30\x38\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\
-\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x2d\x30\x2e\
-\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x33\x20\x2d\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\
-\x20\x2d\x33\x2e\x35\x39\x37\x33\x31\x30\x31\x37\x2c\x2d\x33\x2e\
-\x35\x39\x36\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\
-\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x31\x2c\x2d\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x31\x39\x31\x2c\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\
-\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\x38\x20\x4c\x20\x34\
-\x2e\x35\x31\x32\x35\x38\x36\x36\x2c\x30\x2e\x36\x31\x38\x32\x38\
-\x34\x33\x37\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x34\x31\x33\x34\
-\x33\x34\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x30\
-\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x30\x2e\x31\x35\x36\
-\x32\x38\x31\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x30\
-\x2e\x31\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\
-\x32\x34\x33\x20\x2d\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\
-\x37\x31\x31\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x62\x30\x62\x30\x62\x30\x22\x20\x66\x69\x6c\x6c\x2d\x6f\
-\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\
-\x00\x00\x00\xb2\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\
-\x66\x31\x22\x20\x64\x3d\x22\x4d\x31\x39\x2c\x36\x2e\x34\x31\x4c\
-\x31\x37\x2e\x35\x39\x2c\x35\x4c\x31\x32\x2c\x31\x30\x2e\x35\x39\
-\x4c\x36\x2e\x34\x31\x2c\x35\x4c\x35\x2c\x36\x2e\x34\x31\x4c\x31\
-\x30\x2e\x35\x39\x2c\x31\x32\x4c\x35\x2c\x31\x37\x2e\x35\x39\x4c\
-\x36\x2e\x34\x31\x2c\x31\x39\x4c\x31\x32\x2c\x31\x33\x2e\x34\x31\
-\x4c\x31\x37\x2e\x35\x39\x2c\x31\x39\x4c\x31\x39\x2c\x31\x37\x2e\
-\x35\x39\x4c\x31\x33\x2e\x34\x31\x2c\x31\x32\x4c\x31\x39\x2c\x36\
-\x2e\x34\x31\x5a\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\
-\x0a\
-\x00\x00\x02\xa1\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\
-\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\
-\x31\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x67\
-\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\
-\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\
-\x64\x64\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\
-\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x2d\x34\x32\x32\x2e\x30\x30\
-\x30\x30\x30\x30\x2c\x20\x2d\x32\x35\x34\x2e\x30\x30\x30\x30\x30\
-\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\
-\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\
-\x61\x74\x65\x28\x34\x32\x32\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\
-\x32\x35\x34\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0d\x0a\x20\
-\x20\x20\x20\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
-\x4d\x31\x30\x2c\x30\x20\x43\x34\x2e\x35\x2c\x30\x20\x30\x2c\x34\
-\x2e\x35\x20\x30\x2c\x31\x30\x20\x43\x30\x2c\x31\x35\x2e\x35\x20\
-\x34\x2e\x35\x2c\x32\x30\x20\x31\x30\x2c\x32\x30\x20\x43\x31\x35\
-\x2e\x35\x2c\x32\x30\x20\x32\x30\x2c\x31\x35\x2e\x35\x20\x32\x30\
-\x2c\x31\x30\x20\x43\x32\x30\x2c\x34\x2e\x35\x20\x31\x35\x2e\x35\
-\x2c\x30\x20\x31\x30\x2c\x30\x20\x4c\x31\x30\x2c\x30\x20\x5a\x20\
-\x4d\x31\x31\x2c\x31\x37\x20\x4c\x39\x2c\x31\x37\x20\x4c\x39\x2c\
-\x31\x35\x20\x4c\x31\x31\x2c\x31\x35\x20\x4c\x31\x31\x2c\x31\x37\
-\x20\x4c\x31\x31\x2c\x31\x37\x20\x5a\x20\x4d\x31\x33\x2e\x31\x2c\
-\x39\x2e\x33\x20\x4c\x31\x32\x2e\x32\x2c\x31\x30\x2e\x32\x20\x43\
-\x31\x31\x2e\x34\x2c\x31\x30\x2e\x39\x20\x31\x31\x2c\x31\x31\x2e\
-\x35\x20\x31\x31\x2c\x31\x33\x20\x4c\x39\x2c\x31\x33\x20\x4c\x39\
-\x2c\x31\x32\x2e\x35\x20\x43\x39\x2c\x31\x31\x2e\x34\x20\x39\x2e\
-\x34\x2c\x31\x30\x2e\x34\x20\x31\x30\x2e\x32\x2c\x39\x2e\x37\x20\
-\x4c\x31\x31\x2e\x34\x2c\x38\x2e\x34\x20\x43\x31\x31\x2e\x38\x2c\
-\x38\x2e\x31\x20\x31\x32\x2c\x37\x2e\x36\x20\x31\x32\x2c\x37\x20\
-\x43\x31\x32\x2c\x35\x2e\x39\x20\x31\x31\x2e\x31\x2c\x35\x20\x31\
-\x30\x2c\x35\x20\x43\x38\x2e\x39\x2c\x35\x20\x38\x2c\x35\x2e\x39\
-\x20\x38\x2c\x37\x20\x4c\x36\x2c\x37\x20\x43\x36\x2c\x34\x2e\x38\
-\x20\x37\x2e\x38\x2c\x33\x20\x31\x30\x2c\x33\x20\x43\x31\x32\x2e\
-\x32\x2c\x33\x20\x31\x34\x2c\x34\x2e\x38\x20\x31\x34\x2c\x37\x20\
-\x43\x31\x34\x2c\x37\x2e\x39\x20\x31\x33\x2e\x36\x2c\x38\x2e\x37\
-\x20\x31\x33\x2e\x31\x2c\x39\x2e\x33\x20\x4c\x31\x33\x2e\x31\x2c\
-\x39\x2e\x33\x20\x5a\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\
-\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\
-\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\
-\x00\x00\x03\xe3\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\
-\x61\x74\x72\x69\x78\x28\x30\x2e\x36\x32\x31\x36\x34\x32\x38\x34\
-\x2c\x30\x2c\x30\x2c\x30\x2e\x36\x32\x33\x35\x37\x31\x31\x2c\x2d\
-\x30\x2e\x36\x33\x35\x33\x30\x34\x33\x34\x2c\x33\x2e\x36\x38\x31\
-\x36\x33\x31\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\
-\x65\x6e\x6f\x64\x64\x22\x20\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\
-\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\x64\x3d\x22\x4d\x20\
-\x37\x39\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\x30\x20\x41\x20\x37\
-\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x31\x30\x2c\x38\x30\
-\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x38\x30\x2c\
-\x31\x35\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\
-\x31\x35\x30\x2c\x38\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\
-\x20\x30\x20\x38\x30\x2c\x31\x30\x20\x37\x30\x2c\x37\x30\x20\x30\
-\x20\x30\x20\x30\x20\x37\x39\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\
-\x30\x20\x5a\x20\x6d\x20\x33\x31\x2e\x31\x33\x36\x37\x31\x35\x2c\
-\x32\x38\x2e\x35\x20\x63\x20\x33\x2e\x31\x38\x36\x33\x32\x2c\x2d\
-\x30\x2e\x30\x30\x38\x37\x20\x36\x2e\x33\x37\x36\x33\x36\x2c\x31\
-\x2e\x32\x31\x31\x32\x30\x36\x20\x38\x2e\x38\x31\x34\x34\x36\x2c\
-\x33\x2e\x36\x36\x30\x31\x35\x36\x20\x34\x2e\x38\x37\x32\x37\x2c\
-\x34\x2e\x38\x39\x36\x35\x20\x34\x2e\x38\x39\x32\x39\x37\x2c\x31\
-\x32\x2e\x38\x35\x37\x37\x34\x34\x20\x30\x2e\x30\x34\x36\x39\x2c\
-\x31\x37\x2e\x37\x37\x37\x33\x34\x34\x20\x4c\x20\x39\x38\x2e\x35\
-\x31\x39\x35\x33\x31\x2c\x38\x31\x2e\x35\x31\x35\x36\x32\x35\x20\
-\x31\x31\x39\x2e\x38\x31\x38\x33\x36\x2c\x31\x30\x33\x2e\x31\x31\
-\x35\x32\x33\x20\x63\x20\x34\x2e\x38\x30\x36\x32\x2c\x34\x2e\x38\
-\x38\x34\x36\x20\x34\x2e\x37\x34\x30\x32\x32\x2c\x31\x32\x2e\x37\
-\x39\x34\x39\x38\x20\x2d\x30\x2e\x31\x34\x36\x34\x38\x2c\x31\x37\
-\x2e\x36\x37\x31\x38\x38\x20\x2d\x34\x2e\x38\x38\x38\x31\x2c\x34\
-\x2e\x38\x37\x34\x38\x20\x2d\x31\x32\x2e\x37\x34\x35\x39\x39\x2c\
-\x34\x2e\x38\x36\x32\x34\x31\x20\x2d\x31\x37\x2e\x35\x35\x30\x37\
-\x39\x2c\x2d\x30\x2e\x30\x32\x31\x35\x20\x4c\x20\x38\x30\x2e\x39\
-\x36\x38\x37\x35\x2c\x39\x39\x2e\x33\x31\x36\x34\x30\x36\x20\x35\
-\x39\x2e\x37\x37\x37\x33\x34\x34\x2c\x31\x32\x30\x2e\x38\x30\x36\
-\x36\x34\x20\x63\x20\x2d\x34\x2e\x38\x34\x38\x39\x2c\x34\x2e\x39\
-\x32\x33\x38\x20\x2d\x31\x32\x2e\x37\x33\x33\x31\x37\x35\x2c\x34\
-\x2e\x39\x34\x34\x37\x38\x20\x2d\x31\x37\x2e\x36\x30\x39\x33\x37\
-\x35\x2c\x30\x2e\x30\x34\x36\x39\x20\x2d\x34\x2e\x38\x37\x32\x37\
-\x2c\x2d\x34\x2e\x38\x39\x36\x35\x20\x2d\x34\x2e\x38\x39\x33\x36\
-\x37\x35\x2c\x2d\x31\x32\x2e\x38\x35\x37\x37\x35\x20\x2d\x30\x2e\
-\x30\x34\x36\x38\x37\x2c\x2d\x31\x37\x2e\x37\x37\x37\x33\x35\x20\
-\x4c\x20\x36\x33\x2e\x33\x39\x36\x34\x38\x34\x2c\x38\x31\x2e\x34\
-\x39\x36\x30\x39\x34\x20\x34\x32\x2e\x30\x39\x39\x36\x30\x39\x2c\
-\x35\x39\x2e\x38\x39\x38\x34\x33\x38\x20\x63\x20\x2d\x34\x2e\x38\
-\x30\x36\x39\x2c\x2d\x34\x2e\x38\x38\x34\x36\x20\x2d\x34\x2e\x37\
-\x34\x32\x31\x36\x38\x2c\x2d\x31\x32\x2e\x37\x39\x36\x39\x32\x39\
-\x20\x30\x2e\x31\x34\x34\x35\x33\x32\x2c\x2d\x31\x37\x2e\x36\x37\
-\x33\x38\x32\x39\x20\x34\x2e\x38\x38\x38\x31\x2c\x2d\x34\x2e\x38\
-\x37\x34\x31\x20\x31\x32\x2e\x37\x34\x37\x39\x33\x34\x2c\x2d\x34\
-\x2e\x38\x36\x32\x34\x31\x35\x20\x31\x37\x2e\x35\x35\x32\x37\x33\
-\x34\x2c\x30\x2e\x30\x32\x31\x34\x38\x20\x4c\x20\x38\x30\x2e\x39\
-\x34\x39\x32\x31\x39\x2c\x36\x33\x2e\x36\x39\x37\x32\x36\x36\x20\
-\x31\x30\x32\x2e\x31\x34\x30\x36\x32\x2c\x34\x32\x2e\x32\x30\x37\
-\x30\x33\x31\x20\x63\x20\x32\x2e\x34\x32\x34\x34\x36\x2c\x2d\x32\
-\x2e\x34\x36\x31\x39\x20\x35\x2e\x36\x30\x36\x36\x36\x2c\x2d\x33\
-\x2e\x36\x39\x38\x33\x36\x39\x20\x38\x2e\x37\x39\x32\x39\x37\x2c\
-\x2d\x33\x2e\x37\x30\x37\x30\x33\x31\x20\x7a\x22\x20\x66\x69\x6c\
-\x6c\x3d\x22\x23\x36\x32\x36\x35\x36\x38\x22\x20\x66\x69\x6c\x6c\
-\x2d\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\
-\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0d\x0a\
-\x00\x00\x01\x54\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x20\x3e\x0d\x0a\
-\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\
-\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x39\x2c\x30\x2c\x30\x2c\x30\
-\x2e\x39\x2c\x2d\x31\x36\x2e\x35\x33\x32\x32\x37\x36\x2c\x2d\x31\
-\x33\x2e\x39\x39\x38\x36\x35\x38\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x37\x34\x2e\x38\x33\
-\x38\x36\x33\x33\x2c\x32\x36\x2e\x33\x39\x39\x39\x36\x38\x20\x61\
-\x20\x34\x38\x2e\x36\x2c\x34\x38\x2e\x36\x20\x30\x20\x30\x20\x30\
-\x20\x2d\x34\x38\x2e\x34\x33\x38\x36\x33\x33\x2c\x34\x38\x2e\x36\
-\x20\x34\x38\x2e\x36\x2c\x34\x38\x2e\x36\x20\x30\x20\x30\x20\x30\
-\x20\x39\x37\x2e\x32\x2c\x30\x20\x34\x38\x2e\x36\x2c\x34\x38\x2e\
-\x36\x20\x30\x20\x30\x20\x30\x20\x2d\x34\x38\x2e\x37\x36\x31\x33\
-\x36\x37\x2c\x2d\x34\x38\x2e\x36\x20\x7a\x20\x6d\x20\x2d\x30\x2e\
-\x36\x34\x38\x36\x33\x33\x2c\x31\x31\x2e\x33\x34\x20\x33\x36\x2e\
-\x34\x35\x2c\x33\x36\x2e\x34\x35\x20\x4c\x20\x37\x34\x2e\x31\x39\
-\x2c\x31\x31\x30\x2e\x36\x33\x39\x39\x37\x20\x33\x37\x2e\x37\x34\
-\x2c\x37\x34\x2e\x31\x38\x39\x39\x36\x38\x20\x5a\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x32\x61\x37\x39\x61\x33\x22\x20\x66\x69\x6c\
-\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x20\
-\x2f\x3e\x0d\x0a\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\
-\x3e\x0d\x0a\
-\x00\x00\x00\xcb\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x30\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\
-\x63\x61\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x61\x66\x61\x66\
-\x61\x66\x22\x20\x78\x3d\x22\x33\x36\x22\x20\x77\x69\x64\x74\x68\
-\x3d\x22\x33\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x2e\
-\x37\x35\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x72\x65\x63\x74\
-\x20\x66\x69\x6c\x6c\x3d\x22\x23\x61\x66\x61\x66\x61\x66\x22\x20\
-\x78\x3d\x22\x33\x36\x22\x20\x79\x3d\x22\x32\x39\x2e\x37\x35\x22\
-\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x22\x20\x77\x69\x64\x74\
-\x68\x3d\x22\x34\x35\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\x7c\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x30\x22\
-\x20\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\x33\x35\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x63\x38\x63\x39\x63\x61\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x30\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x2f\
-\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x0e\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\x39\
-\x37\x32\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\x33\
-\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\
-\x2d\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\
-\x35\x34\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\
-\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\x37\
-\x37\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\x2e\
-\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x33\x20\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\
-\x33\x2e\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\x36\
-\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x30\
-\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\
-\x31\x32\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\
-\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\x37\
-\x31\x31\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\x33\
-\x34\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\x2d\
-\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\x37\
-\x31\x32\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\x31\
-\x31\x33\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\
-\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\
-\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\
-\x33\x20\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\
-\x30\x62\x30\x62\x30\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\
-\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\
-\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xcd\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\
-\x66\x31\x22\x20\x64\x3d\x22\x4d\x31\x39\x2c\x32\x30\x48\x34\x43\
-\x32\x2e\x38\x39\x2c\x32\x30\x20\x32\x2c\x31\x39\x2e\x31\x20\x32\
-\x2c\x31\x38\x56\x36\x43\x32\x2c\x34\x2e\x38\x39\x20\x32\x2e\x38\
-\x39\x2c\x34\x20\x34\x2c\x34\x48\x31\x30\x4c\x31\x32\x2c\x36\x48\
-\x31\x39\x41\x32\x2c\x32\x20\x30\x20\x30\x2c\x31\x20\x32\x31\x2c\
-\x38\x48\x32\x31\x4c\x34\x2c\x38\x56\x31\x38\x4c\x36\x2e\x31\x34\
-\x2c\x31\x30\x48\x32\x33\x2e\x32\x31\x4c\x32\x30\x2e\x39\x33\x2c\
-\x31\x38\x2e\x35\x43\x32\x30\x2e\x37\x2c\x31\x39\x2e\x33\x37\x20\
-\x31\x39\x2e\x39\x32\x2c\x32\x30\x20\x31\x39\x2c\x32\x30\x5a\x22\
-\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xa3\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x33\x32\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x30\
-\x62\x30\x62\x30\x22\x20\x78\x3d\x22\x36\x22\x20\x79\x3d\x22\x34\
-\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x22\x20\x68\x65\x69\x67\
-\x68\x74\x3d\x22\x32\x34\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x30\x62\x30\
-\x62\x30\x22\x20\x78\x3d\x22\x31\x34\x22\x20\x79\x3d\x22\x34\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x22\x20\x68\x65\x69\x67\x68\
-\x74\x3d\x22\x32\x34\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0d\x0a\
-\x00\x00\x00\xbe\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\
-\x66\x31\x22\x20\x64\x3d\x22\x4d\x32\x31\x2c\x31\x34\x48\x33\x56\
-\x34\x48\x32\x31\x4d\x32\x31\x2c\x32\x48\x33\x43\x31\x2e\x38\x39\
-\x2c\x32\x20\x31\x2c\x32\x2e\x38\x39\x20\x31\x2c\x34\x56\x31\x36\
-\x41\x32\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x33\x2c\x31\x38\x48\
-\x31\x30\x4c\x38\x2c\x32\x31\x56\x32\x32\x48\x31\x36\x56\x32\x31\
-\x4c\x31\x34\x2c\x31\x38\x48\x32\x31\x41\x32\x2c\x32\x20\x30\x20\
-\x30\x2c\x30\x20\x32\x33\x2c\x31\x36\x56\x34\x43\x32\x33\x2c\x32\
-\x2e\x38\x39\x20\x32\x32\x2e\x31\x2c\x32\x20\x32\x31\x2c\x32\x5a\
-\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xb0\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x30\x22\
-\x20\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\x33\x35\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x63\x38\x63\x39\x63\x61\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x30\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x2f\
-\x3e\x0d\x0a\x20\x20\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\
-\x22\x35\x30\x22\x20\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\
-\x31\x37\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x63\x38\x63\x39\x63\
-\x61\x22\x20\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xef\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\
-\x66\x31\x22\x20\x64\x3d\x22\x4d\x35\x2c\x33\x41\x32\x2c\x32\x20\
-\x30\x20\x30\x2c\x30\x20\x33\x2c\x35\x56\x31\x39\x41\x32\x2c\x32\
-\x20\x30\x20\x30\x2c\x30\x20\x35\x2c\x32\x31\x48\x31\x39\x41\x32\
-\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x32\x31\x2c\x31\x39\x56\x35\
-\x2e\x35\x4c\x31\x38\x2e\x35\x2c\x33\x48\x31\x37\x56\x39\x41\x31\
-\x2c\x31\x20\x30\x20\x30\x2c\x31\x20\x31\x36\x2c\x31\x30\x48\x38\
-\x41\x31\x2c\x31\x20\x30\x20\x30\x2c\x31\x20\x37\x2c\x39\x56\x33\
-\x48\x35\x4d\x31\x32\x2c\x34\x56\x39\x48\x31\x35\x56\x34\x48\x31\
-\x32\x4d\x37\x2c\x31\x32\x48\x31\x37\x41\x31\x2c\x31\x20\x30\x20\
-\x30\x2c\x31\x20\x31\x38\x2c\x31\x33\x56\x31\x39\x48\x36\x56\x31\
-\x33\x41\x31\x2c\x31\x20\x30\x20\x30\x2c\x31\x20\x37\x2c\x31\x32\
-\x5a\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\x1f\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x34\x22\x2f\x3e\x0d\x0a\
-\x00\x00\x01\xe2\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\
-\x66\x31\x22\x20\x64\x3d\x22\x4d\x31\x34\x2c\x32\x48\x36\x41\x32\
-\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x34\x2c\x34\x56\x32\x30\x41\
-\x32\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x36\x2c\x32\x32\x48\x31\
-\x38\x41\x32\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x32\x30\x2c\x32\
-\x30\x56\x38\x4c\x31\x34\x2c\x32\x4d\x31\x38\x2c\x32\x30\x48\x36\
-\x56\x34\x48\x31\x33\x56\x39\x48\x31\x38\x56\x32\x30\x5a\x22\x2f\
-\x3e\x0d\x0a\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\
-\x6d\x3d\x22\x73\x63\x61\x6c\x65\x28\x30\x2e\x35\x29\x20\x74\x72\
-\x61\x6e\x73\x6c\x61\x74\x65\x28\x31\x32\x2c\x20\x32\x30\x29\x22\
-\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\
-\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x64\x3d\x22\x4d\
-\x33\x2e\x39\x2c\x31\x32\x43\x33\x2e\x39\x2c\x31\x30\x2e\x32\x39\
-\x20\x35\x2e\x32\x39\x2c\x38\x2e\x39\x20\x37\x2c\x38\x2e\x39\x48\
-\x31\x31\x56\x37\x48\x37\x41\x35\x2c\x35\x20\x30\x20\x30\x2c\x30\
-\x20\x32\x2c\x31\x32\x41\x35\x2c\x35\x20\x30\x20\x30\x2c\x30\x20\
-\x37\x2c\x31\x37\x48\x31\x31\x56\x31\x35\x2e\x31\x48\x37\x43\x35\
-\x2e\x32\x39\x2c\x31\x35\x2e\x31\x20\x33\x2e\x39\x2c\x31\x33\x2e\
-\x37\x31\x20\x33\x2e\x39\x2c\x31\x32\x4d\x38\x2c\x31\x33\x48\x31\
-\x36\x56\x31\x31\x48\x38\x56\x31\x33\x4d\x31\x37\x2c\x37\x48\x31\
-\x33\x56\x38\x2e\x39\x48\x31\x37\x43\x31\x38\x2e\x37\x31\x2c\x38\
-\x2e\x39\x20\x32\x30\x2e\x31\x2c\x31\x30\x2e\x32\x39\x20\x32\x30\
-\x2e\x31\x2c\x31\x32\x43\x32\x30\x2e\x31\x2c\x31\x33\x2e\x37\x31\
-\x20\x31\x38\x2e\x37\x31\x2c\x31\x35\x2e\x31\x20\x31\x37\x2c\x31\
-\x35\x2e\x31\x48\x31\x33\x56\x31\x37\x48\x31\x37\x41\x35\x2c\x35\
-\x20\x30\x20\x30\x2c\x30\x20\x32\x32\x2c\x31\x32\x41\x35\x2c\x35\
-\x20\x30\x20\x30\x2c\x30\x20\x31\x37\x2c\x37\x5a\x22\x2f\x3e\x0d\
-\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\
-\x0a\
-\x00\x00\x02\x21\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x33\x36\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\
-\x63\x61\x6c\x65\x28\x32\x30\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\
-\x74\x65\x28\x33\x20\x35\x2e\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\
-\x36\x36\x39\x37\x32\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\
-\x33\x2e\x33\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\
-\x30\x38\x20\x2d\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\
-\x33\x31\x30\x35\x34\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\
-\x37\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\
-\x2e\x31\x35\x37\x37\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\
-\x34\x20\x30\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\
-\x20\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\
-\x37\x31\x32\x33\x20\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\
-\x20\x6c\x20\x33\x2e\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\
-\x35\x39\x36\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\
-\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\
-\x2c\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\
-\x2e\x35\x37\x31\x31\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\
-\x34\x31\x33\x34\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\
-\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\
-\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\
-\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\
-\x32\x38\x31\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\
-\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\
-\x36\x32\x34\x33\x20\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\
-\x37\x31\x31\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x33\x64\x61\x65\x65\x39\x22\x20\x66\x69\x6c\x6c\x2d\x6f\
-\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\
-\x00\x00\x00\x7c\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x30\x22\
-\x20\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\x33\x35\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x35\x38\x64\x33\x66\x66\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x30\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x2f\
-\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x32\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\
-\x20\x78\x3d\x22\x32\x22\x20\x79\x3d\x22\x32\x22\x20\x77\x69\x64\
-\x74\x68\x3d\x22\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x38\
-\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x65\x66\x66\x30\x66\
-\x31\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\
-\x22\x31\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x72\x65\x63\x74\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x78\x3d\
-\x22\x32\x22\x20\x79\x3d\x22\x31\x34\x22\x20\x77\x69\x64\x74\x68\
-\x3d\x22\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x38\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\
-\x22\x31\x31\x22\x20\x79\x31\x3d\x22\x34\x2e\x35\x22\x20\x78\x32\
-\x3d\x22\x32\x32\x22\x20\x79\x32\x3d\x22\x34\x2e\x35\x22\x20\x73\
-\x74\x79\x6c\x65\x3d\x22\x73\x74\x72\x6f\x6b\x65\x3a\x23\x65\x66\
-\x66\x30\x66\x31\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\
-\x68\x3a\x31\x22\x20\x2f\x3e\x0d\x0a\x20\x20\x3c\x6c\x69\x6e\x65\
-\x20\x78\x31\x3d\x22\x31\x31\x22\x20\x79\x31\x3d\x22\x37\x2e\x35\
-\x22\x20\x78\x32\x3d\x22\x32\x32\x22\x20\x79\x32\x3d\x22\x37\x2e\
-\x35\x22\x20\x73\x74\x79\x6c\x65\x3d\x22\x73\x74\x72\x6f\x6b\x65\
-\x3a\x23\x65\x66\x66\x30\x66\x31\x3b\x73\x74\x72\x6f\x6b\x65\x2d\
-\x77\x69\x64\x74\x68\x3a\x31\x22\x20\x2f\x3e\x0d\x0a\x20\x20\x3c\
-\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x31\x31\x22\x20\x79\x31\x3d\
-\x22\x31\x36\x2e\x35\x22\x20\x78\x32\x3d\x22\x31\x38\x22\x20\x79\
-\x32\x3d\x22\x31\x36\x2e\x35\x22\x20\x73\x74\x79\x6c\x65\x3d\x22\
-\x73\x74\x72\x6f\x6b\x65\x3a\x23\x65\x66\x66\x30\x66\x31\x3b\x73\
-\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x31\x22\x20\x2f\
-\x3e\x0d\x0a\x20\x20\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x31\
-\x31\x22\x20\x79\x31\x3d\x22\x31\x39\x2e\x35\x22\x20\x78\x32\x3d\
-\x22\x31\x38\x22\x20\x79\x32\x3d\x22\x31\x39\x2e\x35\x22\x20\x73\
-\x74\x79\x6c\x65\x3d\x22\x73\x74\x72\x6f\x6b\x65\x3a\x23\x65\x66\
-\x66\x30\x66\x31\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\
-\x68\x3a\x31\x22\x20\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\
-\x0a\
-\x00\x00\x01\x54\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x20\x3e\x0d\x0a\
-\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\
-\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x39\x2c\x30\x2c\x30\x2c\x30\
-\x2e\x39\x2c\x2d\x31\x36\x2e\x35\x33\x32\x32\x37\x36\x2c\x2d\x31\
-\x33\x2e\x39\x39\x38\x36\x35\x38\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x37\x34\x2e\x38\x33\
-\x38\x36\x33\x33\x2c\x32\x36\x2e\x33\x39\x39\x39\x36\x38\x20\x61\
-\x20\x34\x38\x2e\x36\x2c\x34\x38\x2e\x36\x20\x30\x20\x30\x20\x30\
-\x20\x2d\x34\x38\x2e\x34\x33\x38\x36\x33\x33\x2c\x34\x38\x2e\x36\
-\x20\x34\x38\x2e\x36\x2c\x34\x38\x2e\x36\x20\x30\x20\x30\x20\x30\
-\x20\x39\x37\x2e\x32\x2c\x30\x20\x34\x38\x2e\x36\x2c\x34\x38\x2e\
-\x36\x20\x30\x20\x30\x20\x30\x20\x2d\x34\x38\x2e\x37\x36\x31\x33\
-\x36\x37\x2c\x2d\x34\x38\x2e\x36\x20\x7a\x20\x6d\x20\x2d\x30\x2e\
-\x36\x34\x38\x36\x33\x33\x2c\x31\x31\x2e\x33\x34\x20\x33\x36\x2e\
-\x34\x35\x2c\x33\x36\x2e\x34\x35\x20\x4c\x20\x37\x34\x2e\x31\x39\
-\x2c\x31\x31\x30\x2e\x36\x33\x39\x39\x37\x20\x33\x37\x2e\x37\x34\
-\x2c\x37\x34\x2e\x31\x38\x39\x39\x36\x38\x20\x5a\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x66\x69\x6c\
-\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x20\
-\x2f\x3e\x0d\x0a\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\
-\x3e\x0d\x0a\
-\x00\x00\x01\xc2\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\
-\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\
-\x31\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x67\
-\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\
-\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\
-\x64\x64\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\
-\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x2d\x34\x34\x2e\x30\x30\x30\
-\x30\x30\x30\x2c\x20\x2d\x38\x36\x2e\x30\x30\x30\x30\x30\x30\x29\
-\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\
-\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\
-\x65\x28\x34\x34\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x38\x36\x2e\
-\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x30\x2c\
-\x30\x20\x43\x34\x2e\x35\x2c\x30\x20\x30\x2c\x34\x2e\x35\x20\x30\
-\x2c\x31\x30\x20\x43\x30\x2c\x31\x35\x2e\x35\x20\x34\x2e\x35\x2c\
-\x32\x30\x20\x31\x30\x2c\x32\x30\x20\x43\x31\x35\x2e\x35\x2c\x32\
-\x30\x20\x32\x30\x2c\x31\x35\x2e\x35\x20\x32\x30\x2c\x31\x30\x20\
-\x43\x32\x30\x2c\x34\x2e\x35\x20\x31\x35\x2e\x35\x2c\x30\x20\x31\
-\x30\x2c\x30\x20\x4c\x31\x30\x2c\x30\x20\x5a\x20\x4d\x38\x2c\x31\
-\x35\x20\x4c\x33\x2c\x31\x30\x20\x4c\x34\x2e\x34\x2c\x38\x2e\x36\
-\x20\x4c\x38\x2c\x31\x32\x2e\x32\x20\x4c\x31\x35\x2e\x36\x2c\x34\
-\x2e\x36\x20\x4c\x31\x37\x2c\x36\x20\x4c\x38\x2c\x31\x35\x20\x4c\
-\x38\x2c\x31\x35\x20\x5a\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x20\
-\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\
-\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\
-\x0a\
-\x00\x00\x00\xd1\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\
-\x31\x34\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\
-\x68\x2d\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\
-\x23\x63\x38\x63\x39\x63\x61\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\
-\x68\x2d\x31\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\
-\x31\x33\x2e\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x63\x38\x63\x39\x63\x61\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\
-\x00\x00\x00\x85\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x30\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\
-\x63\x61\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x61\x66\x61\x66\
-\x61\x66\x22\x20\x78\x3d\x22\x33\x36\x22\x20\x77\x69\x64\x74\x68\
-\x3d\x22\x33\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\x38\x22\
-\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\
-\x67\x3e\x0d\x0a\
-\x00\x00\x01\x32\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\
-\x66\x31\x22\x20\x64\x3d\x22\x4d\x31\x30\x2c\x31\x39\x48\x31\x33\
-\x56\x32\x32\x48\x31\x30\x56\x31\x39\x4d\x31\x32\x2c\x32\x43\x31\
-\x37\x2e\x33\x35\x2c\x32\x2e\x32\x32\x20\x31\x39\x2e\x36\x38\x2c\
-\x37\x2e\x36\x32\x20\x31\x36\x2e\x35\x2c\x31\x31\x2e\x36\x37\x43\
-\x31\x35\x2e\x36\x37\x2c\x31\x32\x2e\x36\x37\x20\x31\x34\x2e\x33\
-\x33\x2c\x31\x33\x2e\x33\x33\x20\x31\x33\x2e\x36\x37\x2c\x31\x34\
-\x2e\x31\x37\x43\x31\x33\x2c\x31\x35\x20\x31\x33\x2c\x31\x36\x20\
-\x31\x33\x2c\x31\x37\x48\x31\x30\x43\x31\x30\x2c\x31\x35\x2e\x33\
-\x33\x20\x31\x30\x2c\x31\x33\x2e\x39\x32\x20\x31\x30\x2e\x36\x37\
-\x2c\x31\x32\x2e\x39\x32\x43\x31\x31\x2e\x33\x33\x2c\x31\x31\x2e\
-\x39\x32\x20\x31\x32\x2e\x36\x37\x2c\x31\x31\x2e\x33\x33\x20\x31\
-\x33\x2e\x35\x2c\x31\x30\x2e\x36\x37\x43\x31\x35\x2e\x39\x32\x2c\
-\x38\x2e\x34\x33\x20\x31\x35\x2e\x33\x32\x2c\x35\x2e\x32\x36\x20\
-\x31\x32\x2c\x35\x41\x33\x2c\x33\x20\x30\x20\x30\x2c\x30\x20\x39\
-\x2c\x38\x48\x36\x41\x36\x2c\x36\x20\x30\x20\x30\x2c\x31\x20\x31\
-\x32\x2c\x32\x5a\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\
-\x0a\
-\x00\x00\x00\x9c\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\
-\x66\x31\x22\x20\x64\x3d\x22\x4d\x31\x34\x2c\x32\x48\x36\x41\x32\
-\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x34\x2c\x34\x56\x32\x30\x41\
-\x32\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x36\x2c\x32\x32\x48\x31\
-\x38\x41\x32\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x32\x30\x2c\x32\
-\x30\x56\x38\x4c\x31\x34\x2c\x32\x4d\x31\x38\x2c\x32\x30\x48\x36\
-\x56\x34\x48\x31\x33\x56\x39\x48\x31\x38\x56\x32\x30\x5a\x22\x2f\
-\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x01\x1d\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\
-\x63\x61\x6c\x65\x28\x30\x2e\x31\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x30\
-\x62\x30\x62\x30\x22\x20\x64\x3d\x22\x4d\x32\x32\x2e\x31\x2c\x31\
-\x30\x32\x32\x2e\x31\x4c\x2d\x32\x32\x2e\x31\x2c\x39\x37\x37\x2e\
-\x39\x6c\x31\x30\x30\x30\x2d\x31\x30\x30\x30\x4c\x31\x30\x32\x32\
-\x2e\x31\x2c\x32\x32\x2e\x31\x5a\x6d\x32\x32\x30\x2c\x33\x30\x4c\
-\x31\x39\x37\x2e\x39\x2c\x31\x30\x30\x37\x2e\x39\x6c\x31\x30\x30\
-\x30\x2d\x31\x30\x30\x30\x4c\x31\x32\x34\x32\x2e\x31\x2c\x35\x32\
-\x2e\x31\x5a\x6d\x32\x35\x30\x2c\x30\x4c\x34\x34\x37\x2e\x39\x2c\
-\x31\x30\x30\x37\x2e\x39\x6c\x31\x30\x30\x30\x2d\x31\x30\x30\x30\
-\x4c\x31\x34\x39\x32\x2e\x31\x2c\x35\x32\x2e\x31\x5a\x6d\x32\x35\
-\x30\x2c\x30\x4c\x36\x39\x37\x2e\x39\x2c\x31\x30\x30\x37\x2e\x39\
-\x6c\x31\x30\x33\x30\x2d\x31\x30\x33\x30\x4c\x31\x37\x37\x32\x2e\
-\x31\x2c\x32\x32\x2e\x31\x5a\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\
-\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xb9\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\
-\x66\x31\x22\x20\x64\x3d\x22\x4d\x34\x2c\x36\x56\x31\x39\x48\x32\
-\x30\x56\x36\x48\x34\x4d\x31\x38\x2c\x31\x37\x48\x36\x56\x38\x48\
-\x31\x38\x56\x31\x37\x5a\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x6c\x69\
-\x6e\x65\x20\x78\x31\x3d\x22\x37\x22\x20\x79\x31\x3d\x22\x31\x35\
-\x2e\x35\x22\x20\x78\x32\x3d\x22\x31\x37\x22\x20\x79\x32\x3d\x22\
-\x31\x35\x2e\x35\x22\x20\x73\x74\x79\x6c\x65\x3d\x22\x73\x74\x72\
-\x6f\x6b\x65\x3a\x23\x65\x66\x66\x30\x66\x31\x3b\x73\x74\x72\x6f\
-\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x31\x22\x20\x2f\x3e\x0d\x0a\
-\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xc8\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x30\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\
-\x63\x61\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x61\x66\x61\x66\
-\x61\x66\x22\x20\x78\x3d\x22\x33\x36\x22\x20\x77\x69\x64\x74\x68\
-\x3d\x22\x33\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\x38\x22\
-\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x72\x65\x63\x74\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x61\x66\x61\x66\x61\x66\x22\x20\x78\x3d\x22\
-\x33\x36\x22\x20\x79\x3d\x22\x32\x39\x2e\x37\x35\x22\x20\x68\x65\
-\x69\x67\x68\x74\x3d\x22\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
-\x34\x35\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\
-\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\x98\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\
-\x66\x31\x22\x20\x64\x3d\x22\x4d\x31\x32\x20\x35\x2e\x36\x39\x4c\
-\x31\x37\x20\x31\x30\x2e\x31\x39\x56\x31\x38\x48\x31\x35\x56\x31\
-\x32\x48\x39\x56\x31\x38\x48\x37\x56\x31\x30\x2e\x31\x39\x4c\x31\
-\x32\x20\x35\x2e\x36\x39\x4d\x31\x32\x20\x33\x4c\x32\x20\x31\x32\
-\x48\x35\x56\x32\x30\x48\x31\x31\x56\x31\x34\x48\x31\x33\x56\x32\
-\x30\x48\x31\x39\x56\x31\x32\x48\x32\x32\x22\x2f\x3e\x0d\x0a\x3c\
-\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xc8\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x30\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\
-\x63\x61\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x61\x66\x61\x66\
-\x61\x66\x22\x20\x78\x3d\x22\x33\x36\x22\x20\x77\x69\x64\x74\x68\
-\x3d\x22\x33\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x37\x22\
-\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x72\x65\x63\x74\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x61\x66\x61\x66\x61\x66\x22\x20\x78\x3d\x22\
-\x36\x36\x22\x20\x79\x3d\x22\x32\x39\x2e\x37\x35\x22\x20\x68\x65\
-\x69\x67\x68\x74\x3d\x22\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
-\x31\x35\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\
-\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x0e\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\
-\x39\x32\x2c\x30\x2e\x39\x31\x37\x36\x39\x37\x31\x38\x20\x34\x2e\
-\x35\x2c\x34\x2e\x32\x32\x38\x30\x31\x38\x32\x20\x37\x2e\x38\x31\
-\x30\x35\x34\x30\x38\x2c\x30\x2e\x39\x31\x36\x32\x37\x36\x34\x38\
-\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\
-\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\
-\x31\x37\x34\x39\x2c\x30\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\
-\x2c\x30\x2e\x31\x35\x37\x37\x30\x32\x30\x32\x20\x30\x2e\x31\x35\
-\x37\x37\x31\x32\x34\x2c\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x32\
-\x20\x30\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x32\x20\x6c\x20\
-\x2d\x33\x2e\x35\x39\x36\x31\x32\x38\x33\x2c\x33\x2e\x35\x39\x37\
-\x33\x31\x30\x32\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\
-\x30\x31\x39\x20\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\
-\x2e\x31\x35\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x38\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\
-\x33\x2c\x31\x2e\x34\x38\x37\x34\x31\x33\x34\x20\x63\x20\x2d\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x20\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\
-\x2e\x34\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\x2e\x35\x37\
-\x31\x31\x33\x36\x39\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\
-\x2c\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x31\x20\x30\x2e\x34\
-\x31\x33\x34\x36\x32\x34\x2c\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\
-\x33\x31\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x2c\x30\x2e\x30\
-\x30\x31\x34\x32\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\
-\x66\x66\x30\x66\x31\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\
-\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\
-\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x11\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x35\x2e\x30\x38\x32\x33\x30\
-\x32\x38\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x2d\x33\x2e\
-\x33\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\
-\x20\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\
-\x35\x34\x30\x38\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\
-\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x2d\x30\x2e\
-\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x33\x20\x2d\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\
-\x20\x2d\x33\x2e\x35\x39\x37\x33\x31\x30\x31\x37\x2c\x2d\x33\x2e\
-\x35\x39\x36\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\
-\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x31\x2c\x2d\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x31\x39\x31\x2c\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\
-\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\x38\x20\x4c\x20\x34\
-\x2e\x35\x31\x32\x35\x38\x36\x36\x2c\x30\x2e\x36\x31\x38\x32\x38\
-\x34\x33\x37\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x34\x31\x33\x34\
-\x33\x34\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x30\
-\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x30\x2e\x31\x35\x36\
-\x32\x38\x31\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x30\
-\x2e\x31\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\
-\x32\x34\x33\x20\x2d\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\
-\x37\x31\x31\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x66\x69\x6c\x6c\x2d\x6f\
-\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\
-\x00\x00\x00\xa8\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\
-\x66\x31\x22\x20\x64\x3d\x22\x4d\x36\x2c\x31\x39\x41\x32\x2c\x32\
-\x20\x30\x20\x30\x2c\x30\x20\x38\x2c\x32\x31\x48\x31\x36\x41\x32\
-\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x31\x38\x2c\x31\x39\x56\x37\
-\x48\x36\x56\x31\x39\x4d\x38\x2c\x39\x48\x31\x36\x56\x31\x39\x48\
-\x38\x56\x39\x4d\x31\x35\x2e\x35\x2c\x34\x4c\x31\x34\x2e\x35\x2c\
-\x33\x48\x39\x2e\x35\x4c\x38\x2e\x35\x2c\x34\x48\x35\x56\x36\x48\
-\x31\x39\x56\x34\x48\x31\x35\x2e\x35\x5a\x22\x2f\x3e\x0d\x0a\x3c\
-\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xaf\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\
-\x66\x31\x22\x20\x64\x3d\x22\x4d\x32\x30\x2c\x31\x38\x48\x34\x56\
-\x38\x48\x32\x30\x4d\x32\x30\x2c\x36\x48\x31\x32\x4c\x31\x30\x2c\
-\x34\x48\x34\x43\x32\x2e\x38\x39\x2c\x34\x20\x32\x2c\x34\x2e\x38\
-\x39\x20\x32\x2c\x36\x56\x31\x38\x41\x32\x2c\x32\x20\x30\x20\x30\
-\x2c\x30\x20\x34\x2c\x32\x30\x48\x32\x30\x41\x32\x2c\x32\x20\x30\
-\x20\x30\x2c\x30\x20\x32\x32\x2c\x31\x38\x56\x38\x43\x32\x32\x2c\
-\x36\x2e\x38\x39\x20\x32\x31\x2e\x31\x2c\x36\x20\x32\x30\x2c\x36\
-\x5a\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x01\x1a\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\
-\x31\x34\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\
-\x68\x2d\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\
-\x23\x35\x38\x64\x33\x66\x66\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\
-\x68\x2d\x31\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\
-\x31\x33\x2e\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x35\x38\x64\x33\x66\x66\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x2c\
-\x35\x20\x68\x38\x20\x76\x38\x20\x68\x2d\x38\x20\x76\x2d\x38\x20\
-\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x35\x38\x64\x33\x66\x66\
-\x22\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\
-\x6e\x6f\x64\x64\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x01\xff\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\
-\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\
-\x31\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x67\
-\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\
-\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\
-\x64\x64\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\
-\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x2d\x33\x38\x30\x2e\x30\x30\
-\x30\x30\x30\x30\x2c\x20\x2d\x34\x34\x2e\x30\x30\x30\x30\x30\x30\
-\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\
-\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\
-\x74\x65\x28\x33\x38\x30\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x34\
-\x34\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\
-\x30\x2c\x30\x20\x43\x34\x2e\x35\x2c\x30\x20\x30\x2c\x34\x2e\x35\
-\x20\x30\x2c\x31\x30\x20\x43\x30\x2c\x31\x35\x2e\x35\x20\x34\x2e\
-\x35\x2c\x32\x30\x20\x31\x30\x2c\x32\x30\x20\x43\x31\x35\x2e\x35\
-\x2c\x32\x30\x20\x32\x30\x2c\x31\x35\x2e\x35\x20\x32\x30\x2c\x31\
-\x30\x20\x43\x32\x30\x2c\x34\x2e\x35\x20\x31\x35\x2e\x35\x2c\x30\
-\x20\x31\x30\x2c\x30\x20\x4c\x31\x30\x2c\x30\x20\x5a\x20\x4d\x31\
-\x35\x2c\x31\x33\x2e\x36\x20\x4c\x31\x33\x2e\x36\x2c\x31\x35\x20\
-\x4c\x31\x30\x2c\x31\x31\x2e\x34\x20\x4c\x36\x2e\x34\x2c\x31\x35\
-\x20\x4c\x35\x2c\x31\x33\x2e\x36\x20\x4c\x38\x2e\x36\x2c\x31\x30\
-\x20\x4c\x35\x2c\x36\x2e\x34\x20\x4c\x36\x2e\x34\x2c\x35\x20\x4c\
-\x31\x30\x2c\x38\x2e\x36\x20\x4c\x31\x33\x2e\x36\x2c\x35\x20\x4c\
-\x31\x35\x2c\x36\x2e\x34\x20\x4c\x31\x31\x2e\x34\x2c\x31\x30\x20\
-\x4c\x31\x35\x2c\x31\x33\x2e\x36\x20\x4c\x31\x35\x2c\x31\x33\x2e\
-\x36\x20\x5a\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\
-\x67\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\
-\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\x62\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\
-\x66\x31\x22\x20\x64\x3d\x22\x4d\x34\x2c\x34\x48\x32\x30\x56\x32\
-\x30\x48\x34\x56\x34\x4d\x36\x2c\x38\x56\x31\x38\x48\x31\x38\x56\
-\x38\x48\x36\x5a\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\
-\x0a\
-\x00\x00\x01\xd4\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x38\x30\x22\x3e\x0d\x0a\x20\x20\
-\x3c\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x67\x20\
-\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x66\
-\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\
-\x64\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\
-\x61\x6e\x73\x6c\x61\x74\x65\x28\x2d\x34\x32\x34\x2e\x30\x30\x30\
-\x30\x30\x30\x2c\x20\x2d\x34\x36\x33\x2e\x30\x30\x30\x30\x30\x30\
-\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\
-\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\
-\x74\x65\x28\x34\x32\x34\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x34\
-\x36\x34\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0d\x0a\x20\x20\
-\x20\x20\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
-\x38\x2c\x33\x20\x4c\x38\x2c\x2d\x30\x2e\x35\x20\x4c\x33\x2c\x34\
-\x2e\x35\x20\x4c\x38\x2c\x39\x2e\x35\x20\x4c\x38\x2c\x35\x20\x43\
-\x31\x31\x2e\x33\x2c\x35\x20\x31\x34\x2c\x37\x2e\x37\x20\x31\x34\
-\x2c\x31\x31\x20\x43\x31\x34\x2c\x31\x34\x2e\x33\x20\x31\x31\x2e\
-\x33\x2c\x31\x37\x20\x38\x2c\x31\x37\x20\x43\x34\x2e\x37\x2c\x31\
-\x37\x20\x32\x2c\x31\x34\x2e\x33\x20\x32\x2c\x31\x31\x20\x4c\x30\
-\x2c\x31\x31\x20\x43\x30\x2c\x31\x35\x2e\x34\x20\x33\x2e\x36\x2c\
-\x31\x39\x20\x38\x2c\x31\x39\x20\x43\x31\x32\x2e\x34\x2c\x31\x39\
-\x20\x31\x36\x2c\x31\x35\x2e\x34\x20\x31\x36\x2c\x31\x31\x20\x43\
-\x31\x36\x2c\x36\x2e\x36\x20\x31\x32\x2e\x34\x2c\x33\x20\x38\x2c\
-\x33\x20\x4c\x38\x2c\x33\x20\x5a\x22\x2f\x3e\x0d\x0a\x20\x20\x20\
-\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x2f\x67\
-\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\
-\x3e\x0d\x0a\
-\x00\x00\x02\x21\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x33\x36\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\
-\x63\x61\x6c\x65\x28\x32\x30\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\
-\x74\x65\x28\x33\x20\x35\x2e\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\
-\x36\x36\x39\x37\x32\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\
-\x33\x2e\x33\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\
-\x30\x38\x20\x2d\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\
-\x33\x31\x30\x35\x34\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\
-\x37\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\
-\x2e\x31\x35\x37\x37\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\
-\x34\x20\x30\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\
-\x20\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\
-\x37\x31\x32\x33\x20\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\
-\x20\x6c\x20\x33\x2e\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\
-\x35\x39\x36\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\
-\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\
-\x2c\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\
-\x2e\x35\x37\x31\x31\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\
-\x34\x31\x33\x34\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\
-\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\
-\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\
-\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\
-\x32\x38\x31\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\
-\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\
-\x36\x32\x34\x33\x20\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\
-\x37\x31\x31\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x61\x66\x61\x66\x61\x66\x22\x20\x66\x69\x6c\x6c\x2d\x6f\
-\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\
-\x00\x00\x02\x2d\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x33\x36\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\
-\x63\x61\x6c\x65\x28\x32\x30\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\
-\x74\x65\x28\x31\x30\x20\x37\x2e\x35\x29\x20\x72\x6f\x74\x61\x74\
-\x65\x28\x39\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\x39\x37\
-\x32\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\x33\x31\
-\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\x2d\
-\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\x35\
-\x34\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x37\
-\x37\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\
-\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\x2e\x34\
-\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\
-\x20\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\x33\
-\x2e\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\x36\x31\
-\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x30\x2e\
-\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\
-\x32\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\
-\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\x37\x31\
-\x31\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\x33\x34\
-\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\x2d\x30\
-\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\
-\x32\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x2d\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\x31\x31\
-\x33\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\
-\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\
-\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x33\
-\x20\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\x31\x37\
-\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x64\
-\x61\x65\x65\x39\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\
-\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\
-\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x03\xe3\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\
-\x61\x74\x72\x69\x78\x28\x30\x2e\x36\x32\x31\x36\x34\x32\x38\x34\
-\x2c\x30\x2c\x30\x2c\x30\x2e\x36\x32\x33\x35\x37\x31\x31\x2c\x2d\
-\x30\x2e\x36\x33\x35\x33\x30\x34\x33\x34\x2c\x33\x2e\x36\x38\x31\
-\x36\x33\x31\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\
-\x65\x6e\x6f\x64\x64\x22\x20\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\
-\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\x64\x3d\x22\x4d\x20\
-\x37\x39\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\x30\x20\x41\x20\x37\
-\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x31\x30\x2c\x38\x30\
-\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x38\x30\x2c\
-\x31\x35\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\
-\x31\x35\x30\x2c\x38\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\
-\x20\x30\x20\x38\x30\x2c\x31\x30\x20\x37\x30\x2c\x37\x30\x20\x30\
-\x20\x30\x20\x30\x20\x37\x39\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\
-\x30\x20\x5a\x20\x6d\x20\x33\x31\x2e\x31\x33\x36\x37\x31\x35\x2c\
-\x32\x38\x2e\x35\x20\x63\x20\x33\x2e\x31\x38\x36\x33\x32\x2c\x2d\
-\x30\x2e\x30\x30\x38\x37\x20\x36\x2e\x33\x37\x36\x33\x36\x2c\x31\
-\x2e\x32\x31\x31\x32\x30\x36\x20\x38\x2e\x38\x31\x34\x34\x36\x2c\
-\x33\x2e\x36\x36\x30\x31\x35\x36\x20\x34\x2e\x38\x37\x32\x37\x2c\
-\x34\x2e\x38\x39\x36\x35\x20\x34\x2e\x38\x39\x32\x39\x37\x2c\x31\
-\x32\x2e\x38\x35\x37\x37\x34\x34\x20\x30\x2e\x30\x34\x36\x39\x2c\
-\x31\x37\x2e\x37\x37\x37\x33\x34\x34\x20\x4c\x20\x39\x38\x2e\x35\
-\x31\x39\x35\x33\x31\x2c\x38\x31\x2e\x35\x31\x35\x36\x32\x35\x20\
-\x31\x31\x39\x2e\x38\x31\x38\x33\x36\x2c\x31\x30\x33\x2e\x31\x31\
-\x35\x32\x33\x20\x63\x20\x34\x2e\x38\x30\x36\x32\x2c\x34\x2e\x38\
-\x38\x34\x36\x20\x34\x2e\x37\x34\x30\x32\x32\x2c\x31\x32\x2e\x37\
-\x39\x34\x39\x38\x20\x2d\x30\x2e\x31\x34\x36\x34\x38\x2c\x31\x37\
-\x2e\x36\x37\x31\x38\x38\x20\x2d\x34\x2e\x38\x38\x38\x31\x2c\x34\
-\x2e\x38\x37\x34\x38\x20\x2d\x31\x32\x2e\x37\x34\x35\x39\x39\x2c\
-\x34\x2e\x38\x36\x32\x34\x31\x20\x2d\x31\x37\x2e\x35\x35\x30\x37\
-\x39\x2c\x2d\x30\x2e\x30\x32\x31\x35\x20\x4c\x20\x38\x30\x2e\x39\
-\x36\x38\x37\x35\x2c\x39\x39\x2e\x33\x31\x36\x34\x30\x36\x20\x35\
-\x39\x2e\x37\x37\x37\x33\x34\x34\x2c\x31\x32\x30\x2e\x38\x30\x36\
-\x36\x34\x20\x63\x20\x2d\x34\x2e\x38\x34\x38\x39\x2c\x34\x2e\x39\
-\x32\x33\x38\x20\x2d\x31\x32\x2e\x37\x33\x33\x31\x37\x35\x2c\x34\
-\x2e\x39\x34\x34\x37\x38\x20\x2d\x31\x37\x2e\x36\x30\x39\x33\x37\
-\x35\x2c\x30\x2e\x30\x34\x36\x39\x20\x2d\x34\x2e\x38\x37\x32\x37\
-\x2c\x2d\x34\x2e\x38\x39\x36\x35\x20\x2d\x34\x2e\x38\x39\x33\x36\
-\x37\x35\x2c\x2d\x31\x32\x2e\x38\x35\x37\x37\x35\x20\x2d\x30\x2e\
-\x30\x34\x36\x38\x37\x2c\x2d\x31\x37\x2e\x37\x37\x37\x33\x35\x20\
-\x4c\x20\x36\x33\x2e\x33\x39\x36\x34\x38\x34\x2c\x38\x31\x2e\x34\
-\x39\x36\x30\x39\x34\x20\x34\x32\x2e\x30\x39\x39\x36\x30\x39\x2c\
-\x35\x39\x2e\x38\x39\x38\x34\x33\x38\x20\x63\x20\x2d\x34\x2e\x38\
-\x30\x36\x39\x2c\x2d\x34\x2e\x38\x38\x34\x36\x20\x2d\x34\x2e\x37\
-\x34\x32\x31\x36\x38\x2c\x2d\x31\x32\x2e\x37\x39\x36\x39\x32\x39\
-\x20\x30\x2e\x31\x34\x34\x35\x33\x32\x2c\x2d\x31\x37\x2e\x36\x37\
-\x33\x38\x32\x39\x20\x34\x2e\x38\x38\x38\x31\x2c\x2d\x34\x2e\x38\
-\x37\x34\x31\x20\x31\x32\x2e\x37\x34\x37\x39\x33\x34\x2c\x2d\x34\
-\x2e\x38\x36\x32\x34\x31\x35\x20\x31\x37\x2e\x35\x35\x32\x37\x33\
-\x34\x2c\x30\x2e\x30\x32\x31\x34\x38\x20\x4c\x20\x38\x30\x2e\x39\
-\x34\x39\x32\x31\x39\x2c\x36\x33\x2e\x36\x39\x37\x32\x36\x36\x20\
-\x31\x30\x32\x2e\x31\x34\x30\x36\x32\x2c\x34\x32\x2e\x32\x30\x37\
-\x30\x33\x31\x20\x63\x20\x32\x2e\x34\x32\x34\x34\x36\x2c\x2d\x32\
-\x2e\x34\x36\x31\x39\x20\x35\x2e\x36\x30\x36\x36\x36\x2c\x2d\x33\
-\x2e\x36\x39\x38\x33\x36\x39\x20\x38\x2e\x37\x39\x32\x39\x37\x2c\
-\x2d\x33\x2e\x37\x30\x37\x30\x33\x31\x20\x7a\x22\x20\x66\x69\x6c\
-\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x66\x69\x6c\x6c\
-\x2d\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\
-\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0d\x0a\
-\x00\x00\x00\x64\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x33\x32\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x30\
-\x62\x30\x62\x30\x22\x20\x78\x3d\x22\x34\x22\x20\x79\x3d\x22\x38\
-\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\x65\x69\
-\x67\x68\x74\x3d\x22\x31\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\
-\x3e\x0d\x0a\
-\x00\x00\x01\xf6\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x30\x2e\x39\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\x74\
-\x65\x28\x30\x2c\x20\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\
-\x66\x31\x22\x20\x64\x3d\x22\x4d\x31\x39\x2c\x32\x30\x48\x34\x43\
-\x32\x2e\x38\x39\x2c\x32\x30\x20\x32\x2c\x31\x39\x2e\x31\x20\x32\
-\x2c\x31\x38\x56\x36\x43\x32\x2c\x34\x2e\x38\x39\x20\x32\x2e\x38\
-\x39\x2c\x34\x20\x34\x2c\x34\x48\x31\x30\x4c\x31\x32\x2c\x36\x48\
-\x31\x39\x41\x32\x2c\x32\x20\x30\x20\x30\x2c\x31\x20\x32\x31\x2c\
-\x38\x48\x32\x31\x4c\x34\x2c\x38\x56\x31\x38\x4c\x36\x2e\x31\x34\
-\x2c\x31\x30\x48\x32\x33\x2e\x32\x31\x4c\x32\x30\x2e\x39\x33\x2c\
-\x31\x38\x2e\x35\x43\x32\x30\x2e\x37\x2c\x31\x39\x2e\x33\x37\x20\
-\x31\x39\x2e\x39\x32\x2c\x32\x30\x20\x31\x39\x2c\x32\x30\x5a\x22\
-\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x30\x2e\x37\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\
-\x28\x38\x2c\x20\x33\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x30\x62\x30\x62\
-\x30\x22\x20\x64\x3d\x22\x4d\x31\x33\x2c\x39\x56\x33\x2e\x35\x4c\
-\x31\x38\x2e\x35\x2c\x39\x4d\x36\x2c\x32\x43\x34\x2e\x38\x39\x2c\
-\x32\x20\x34\x2c\x32\x2e\x38\x39\x20\x34\x2c\x34\x56\x32\x30\x41\
-\x32\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x36\x2c\x32\x32\x48\x31\
-\x38\x41\x32\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x32\x30\x2c\x32\
-\x30\x56\x38\x4c\x31\x34\x2c\x32\x48\x36\x5a\x22\x20\x2f\x3e\x0d\
-\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x3c\x70\x6f\x6c\x79\
-\x67\x6f\x6e\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\
-\x31\x22\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x35\x2c\x31\x33\x2e\
-\x35\x20\x32\x30\x2c\x31\x33\x2e\x35\x20\x31\x39\x2e\x35\x2c\x31\
-\x38\x2e\x35\x20\x34\x2c\x32\x30\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\
-\x76\x67\x3e\x0d\x0a\
-\x00\x00\x01\xa7\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x38\x30\x22\x20\
-\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\x20\
-\x3c\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x67\x20\
-\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x66\
-\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\
-\x64\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\
-\x61\x6e\x73\x6c\x61\x74\x65\x28\x2d\x34\x34\x2e\x30\x30\x30\x30\
-\x30\x30\x2c\x20\x2d\x32\x35\x36\x2e\x30\x30\x30\x30\x30\x30\x29\
-\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\
-\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\
-\x65\x28\x34\x34\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x32\x35\x36\
-\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\
-\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x38\x2c\
-\x30\x20\x4c\x32\x2c\x30\x20\x43\x30\x2e\x39\x2c\x30\x20\x30\x2c\
-\x30\x2e\x39\x20\x30\x2c\x32\x20\x4c\x30\x2c\x31\x34\x20\x43\x30\
-\x2c\x31\x35\x2e\x31\x20\x30\x2e\x39\x2c\x31\x36\x20\x32\x2c\x31\
-\x36\x20\x4c\x31\x38\x2c\x31\x36\x20\x43\x31\x39\x2e\x31\x2c\x31\
-\x36\x20\x32\x30\x2c\x31\x35\x2e\x31\x20\x32\x30\x2c\x31\x34\x20\
-\x4c\x32\x30\x2c\x34\x20\x43\x32\x30\x2c\x32\x2e\x39\x20\x31\x39\
-\x2e\x31\x2c\x32\x20\x31\x38\x2c\x32\x20\x4c\x31\x30\x2c\x32\x20\
-\x4c\x38\x2c\x30\x20\x4c\x38\x2c\x30\x20\x5a\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x20\x20\
-\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\
-\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xe3\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x20\x3e\x0d\x0a\
-\x20\x20\x3c\x67\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x64\x3d\x22\x4d\x20\x31\x32\x2e\x39\x31\x39\x30\x38\x33\x2c\
-\x35\x33\x2e\x31\x36\x34\x30\x33\x37\x20\x34\x39\x2e\x33\x36\x39\
-\x30\x38\x31\x2c\x38\x39\x2e\x36\x31\x34\x30\x33\x35\x20\x38\x35\
-\x2e\x38\x31\x39\x30\x38\x37\x2c\x35\x33\x2e\x31\x36\x34\x30\x33\
-\x37\x20\x34\x39\x2e\x33\x36\x39\x30\x38\x31\x2c\x31\x36\x2e\x37\
-\x31\x34\x30\x34\x20\x5a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\
-\x6e\x65\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x61\x32\x61\
-\x32\x61\x32\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\
-\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x20\x73\x74\x72\x6f\x6b\x65\
-\x2d\x77\x69\x64\x74\x68\x3d\x22\x37\x2e\x32\x39\x22\x20\x2f\x3e\
-\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0d\x0a\
-\x00\x00\x02\x06\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\
-\x39\x32\x2c\x35\x2e\x30\x38\x33\x33\x30\x32\x38\x20\x34\x2e\x35\
-\x2c\x31\x2e\x37\x37\x32\x39\x38\x31\x38\x20\x37\x2e\x38\x31\x30\
-\x35\x34\x30\x38\x2c\x35\x2e\x30\x38\x34\x37\x32\x33\x35\x20\x63\
-\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\x37\
-\x37\x30\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\
-\x2c\x30\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\
-\x2c\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\
-\x2e\x35\x37\x31\x31\x33\x36\x39\x20\x6c\x20\x2d\x33\x2e\x35\x39\
-\x36\x31\x32\x38\x33\x2c\x2d\x33\x2e\x35\x39\x37\x33\x31\x30\x31\
-\x39\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\
-\x39\x20\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\x37\
-\x34\x38\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\x33\
-\x2c\x34\x2e\x35\x31\x33\x35\x38\x36\x36\x20\x63\x20\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x20\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x34\x31\
-\x33\x34\x33\x34\x39\x20\x30\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\
-\x39\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\
-\x36\x32\x38\x31\x33\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\
-\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x20\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x39\x2c\x2d\x30\x2e\x30\x30\x31\x34\x32\x20\x7a\x22\x20\
-\x66\x69\x6c\x6c\x3d\x22\x23\x62\x30\x62\x30\x62\x30\x22\x20\x66\
-\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\
-\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\
-\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x06\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\
-\x39\x32\x2c\x35\x2e\x30\x38\x33\x33\x30\x32\x38\x20\x34\x2e\x35\
-\x2c\x31\x2e\x37\x37\x32\x39\x38\x31\x38\x20\x37\x2e\x38\x31\x30\
-\x35\x34\x30\x38\x2c\x35\x2e\x30\x38\x34\x37\x32\x33\x35\x20\x63\
-\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\x37\
-\x37\x30\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\
-\x2c\x30\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\
-\x2c\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\
-\x2e\x35\x37\x31\x31\x33\x36\x39\x20\x6c\x20\x2d\x33\x2e\x35\x39\
-\x36\x31\x32\x38\x33\x2c\x2d\x33\x2e\x35\x39\x37\x33\x31\x30\x31\
-\x39\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\
-\x39\x20\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\x37\
-\x34\x38\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\x33\
-\x2c\x34\x2e\x35\x31\x33\x35\x38\x36\x36\x20\x63\x20\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x20\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x34\x31\
-\x33\x34\x33\x34\x39\x20\x30\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\
-\x39\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\
-\x36\x32\x38\x31\x33\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\
-\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x20\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x39\x2c\x2d\x30\x2e\x30\x30\x31\x34\x32\x20\x7a\x22\x20\
-\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x66\
-\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\
-\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\
-\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x0e\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\
-\x39\x32\x2c\x30\x2e\x39\x31\x37\x36\x39\x37\x31\x38\x20\x34\x2e\
-\x35\x2c\x34\x2e\x32\x32\x38\x30\x31\x38\x32\x20\x37\x2e\x38\x31\
-\x30\x35\x34\x30\x38\x2c\x30\x2e\x39\x31\x36\x32\x37\x36\x34\x38\
-\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\
-\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\
-\x31\x37\x34\x39\x2c\x30\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\
-\x2c\x30\x2e\x31\x35\x37\x37\x30\x32\x30\x32\x20\x30\x2e\x31\x35\
-\x37\x37\x31\x32\x34\x2c\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x32\
-\x20\x30\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x32\x20\x6c\x20\
-\x2d\x33\x2e\x35\x39\x36\x31\x32\x38\x33\x2c\x33\x2e\x35\x39\x37\
-\x33\x31\x30\x32\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\
-\x30\x31\x39\x20\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\
-\x2e\x31\x35\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x38\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\
-\x33\x2c\x31\x2e\x34\x38\x37\x34\x31\x33\x34\x20\x63\x20\x2d\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x20\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\
-\x2e\x34\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\x2e\x35\x37\
-\x31\x31\x33\x36\x39\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\
-\x2c\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x31\x20\x30\x2e\x34\
-\x31\x33\x34\x36\x32\x34\x2c\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\
-\x33\x31\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x2c\x30\x2e\x30\
-\x30\x31\x34\x32\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\
-\x64\x61\x65\x65\x39\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\
-\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\
-\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xb0\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x30\x22\
-\x20\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\x33\x35\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x35\x38\x64\x33\x66\x66\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x30\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x2f\
-\x3e\x0d\x0a\x20\x20\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\
-\x22\x35\x30\x22\x20\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\
-\x31\x37\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x35\x38\x64\x33\x66\
-\x66\x22\x20\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\xbf\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x32\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\
-\x61\x74\x72\x69\x78\x28\x30\x2e\x38\x31\x2c\x30\x2c\x30\x2c\x30\
-\x2e\x39\x2c\x2d\x32\x31\x2e\x36\x37\x39\x36\x39\x39\x2c\x2d\x31\
-\x30\x31\x2e\x35\x33\x38\x39\x33\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x38\x30\
-\x34\x30\x34\x61\x22\x20\x64\x3d\x22\x4d\x20\x35\x32\x2e\x30\x31\
-\x31\x39\x37\x34\x2c\x31\x31\x35\x2e\x35\x39\x38\x38\x31\x20\x48\
-\x20\x31\x35\x36\x2e\x30\x36\x35\x38\x35\x20\x63\x20\x31\x31\x2e\
-\x30\x38\x2c\x30\x20\x32\x30\x2c\x38\x2e\x39\x32\x20\x32\x30\x2c\
-\x32\x30\x20\x76\x20\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\
-\x30\x2c\x31\x31\x2e\x30\x38\x20\x2d\x38\x2e\x39\x32\x2c\x32\x30\
-\x20\x2d\x32\x30\x2c\x32\x30\x20\x68\x20\x2d\x31\x33\x2e\x30\x30\
-\x36\x37\x33\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\x34\x20\x6c\x20\
-\x2d\x30\x2e\x34\x30\x30\x34\x33\x2c\x32\x31\x2e\x30\x34\x39\x32\
-\x37\x20\x2d\x32\x35\x2e\x36\x31\x33\x30\x34\x2c\x2d\x32\x31\x2e\
-\x30\x34\x39\x32\x37\x20\x48\x20\x39\x31\x2e\x30\x33\x32\x31\x37\
-\x38\x20\x37\x38\x2e\x30\x32\x35\x34\x34\x33\x20\x36\x35\x2e\x30\
-\x31\x38\x37\x30\x39\x20\x35\x32\x2e\x30\x31\x31\x39\x37\x34\x20\
-\x63\x20\x2d\x31\x31\x2e\x30\x38\x2c\x30\x20\x2d\x32\x30\x2c\x2d\
-\x38\x2e\x39\x32\x20\x2d\x32\x30\x2c\x2d\x32\x30\x20\x76\x20\x2d\
-\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\x2d\x31\x31\
-\x2e\x30\x38\x20\x38\x2e\x39\x32\x2c\x2d\x32\x30\x20\x32\x30\x2c\
-\x2d\x32\x30\x20\x7a\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0d\x0a\x20\x20\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\
-\x23\x65\x66\x66\x30\x66\x31\x22\x20\x66\x69\x6c\x6c\x2d\x72\x75\
-\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\x64\x3d\x22\
-\x4d\x20\x39\x30\x2e\x37\x30\x38\x36\x36\x35\x2c\x31\x37\x2e\x33\
-\x38\x35\x38\x32\x36\x20\x38\x35\x2e\x30\x33\x39\x33\x37\x35\x2c\
-\x31\x31\x2e\x37\x31\x36\x35\x33\x35\x20\x36\x32\x2e\x33\x36\x32\
-\x32\x30\x33\x2c\x33\x34\x2e\x33\x39\x33\x37\x20\x33\x39\x2e\x36\
-\x38\x35\x30\x33\x39\x2c\x31\x31\x2e\x37\x31\x36\x35\x33\x35\x20\
-\x6c\x20\x2d\x35\x2e\x36\x36\x39\x32\x39\x31\x2c\x35\x2e\x36\x36\
-\x39\x32\x39\x31\x20\x32\x32\x2e\x36\x37\x37\x31\x36\x34\x2c\x32\
-\x32\x2e\x36\x37\x37\x31\x36\x36\x20\x2d\x32\x32\x2e\x36\x37\x37\
-\x31\x36\x34\x2c\x32\x32\x2e\x36\x37\x37\x31\x36\x35\x20\x35\x2e\
-\x36\x36\x39\x32\x39\x31\x2c\x35\x2e\x36\x36\x39\x32\x39\x31\x20\
-\x32\x32\x2e\x36\x37\x37\x31\x36\x34\x2c\x2d\x32\x32\x2e\x36\x37\
-\x37\x31\x36\x35\x20\x32\x32\x2e\x36\x37\x37\x31\x37\x32\x2c\x32\
-\x32\x2e\x36\x37\x37\x31\x36\x35\x20\x35\x2e\x36\x36\x39\x32\x39\
-\x2c\x2d\x35\x2e\x36\x36\x39\x32\x39\x31\x20\x2d\x32\x32\x2e\x36\
-\x37\x37\x31\x37\x2c\x2d\x32\x32\x2e\x36\x37\x37\x31\x36\x35\x20\
-\x7a\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x0e\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\x39\
-\x37\x32\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\x33\
-\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\
-\x2d\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\
-\x35\x34\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\
-\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\x37\
-\x37\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\x2e\
-\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x33\x20\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\
-\x33\x2e\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\x36\
-\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x30\
-\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\
-\x31\x32\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\
-\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\x37\
-\x31\x31\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\x33\
-\x34\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\x2d\
-\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\x37\
-\x31\x32\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\x31\
-\x31\x33\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\
-\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\
-\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\
-\x33\x20\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\
-\x66\x66\x30\x66\x31\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\
-\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\
-\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x45\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\
-\x76\x65\x6e\x6f\x64\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\
-\x6e\x6f\x6e\x65\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\
-\x74\x68\x3d\x22\x31\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\
-\x3d\x22\x73\x63\x61\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\
-\x20\x20\x3c\x67\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\
-\x66\x31\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\
-\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x2d\x31\x37\x30\x2e\x30\x30\
-\x30\x30\x30\x30\x2c\x20\x2d\x34\x34\x2e\x30\x30\x30\x30\x30\x30\
-\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\
-\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\
-\x74\x65\x28\x31\x37\x30\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x34\
-\x34\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\
-\x30\x2c\x30\x20\x43\x34\x2e\x35\x2c\x30\x20\x30\x2c\x34\x2e\x35\
-\x20\x30\x2c\x31\x30\x20\x43\x30\x2c\x31\x35\x2e\x35\x20\x34\x2e\
-\x35\x2c\x32\x30\x20\x31\x30\x2c\x32\x30\x20\x43\x31\x35\x2e\x35\
-\x2c\x32\x30\x20\x32\x30\x2c\x31\x35\x2e\x35\x20\x32\x30\x2c\x31\
-\x30\x20\x43\x32\x30\x2c\x34\x2e\x35\x20\x31\x35\x2e\x35\x2c\x30\
-\x20\x31\x30\x2c\x30\x20\x4c\x31\x30\x2c\x30\x20\x5a\x20\x4d\x32\
-\x2c\x31\x30\x20\x43\x32\x2c\x35\x2e\x36\x20\x35\x2e\x36\x2c\x32\
-\x20\x31\x30\x2c\x32\x20\x43\x31\x31\x2e\x38\x2c\x32\x20\x31\x33\
-\x2e\x35\x2c\x32\x2e\x36\x20\x31\x34\x2e\x39\x2c\x33\x2e\x37\x20\
-\x4c\x33\x2e\x37\x2c\x31\x34\x2e\x39\x20\x43\x32\x2e\x36\x2c\x31\
-\x33\x2e\x35\x20\x32\x2c\x31\x31\x2e\x38\x20\x32\x2c\x31\x30\x20\
-\x4c\x32\x2c\x31\x30\x20\x5a\x20\x4d\x31\x30\x2c\x31\x38\x20\x43\
-\x38\x2e\x32\x2c\x31\x38\x20\x36\x2e\x35\x2c\x31\x37\x2e\x34\x20\
-\x35\x2e\x31\x2c\x31\x36\x2e\x33\x20\x4c\x31\x36\x2e\x33\x2c\x35\
-\x2e\x31\x20\x43\x31\x37\x2e\x34\x2c\x36\x2e\x35\x20\x31\x38\x2c\
-\x38\x2e\x32\x20\x31\x38\x2c\x31\x30\x20\x43\x31\x38\x2c\x31\x34\
-\x2e\x34\x20\x31\x34\x2e\x34\x2c\x31\x38\x20\x31\x30\x2c\x31\x38\
-\x20\x4c\x31\x30\x2c\x31\x38\x20\x5a\x22\x2f\x3e\x0d\x0a\x20\x20\
-\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x2f\
-\x67\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\
-\x67\x3e\x0d\x0a\
-\x00\x00\x01\x91\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x30\x2e\x39\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\x74\
-\x65\x28\x32\x2c\x20\x32\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\
-\x66\x31\x22\x20\x64\x3d\x22\x4d\x36\x2c\x32\x41\x32\x2c\x32\x20\
-\x30\x20\x30\x2c\x30\x20\x34\x2c\x34\x56\x32\x30\x41\x32\x2c\x32\
-\x20\x30\x20\x30\x2c\x30\x20\x36\x2c\x32\x32\x48\x31\x38\x41\x32\
-\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x32\x30\x2c\x32\x30\x56\x38\
-\x4c\x31\x34\x2c\x32\x48\x36\x4d\x36\x2c\x34\x48\x31\x33\x56\x39\
-\x48\x31\x38\x56\x32\x30\x48\x36\x56\x34\x4d\x38\x2c\x31\x32\x56\
-\x31\x34\x48\x31\x36\x56\x31\x32\x48\x38\x4d\x38\x2c\x31\x36\x56\
-\x31\x38\x48\x31\x33\x56\x31\x36\x48\x38\x5a\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x3c\x6c\x69\x6e\x65\x20\
-\x78\x31\x3d\x22\x37\x22\x20\x79\x31\x3d\x22\x31\x30\x22\x20\x78\
-\x32\x3d\x22\x31\x22\x20\x79\x32\x3d\x22\x31\x33\x22\x20\x73\x74\
-\x72\x6f\x6b\x65\x3d\x22\x23\x37\x36\x37\x39\x37\x63\x22\x20\x73\
-\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x2f\
-\x3e\x0d\x0a\x20\x20\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\
-\x22\x39\x22\x20\x63\x79\x3d\x22\x31\x30\x22\x20\x72\x3d\x22\x35\
-\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x37\x36\x37\x39\x37\
-\x63\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x32\x66\x38\x38\x62\x37\
-\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\
-\x30\x2e\x35\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\
-\x00\x00\x02\x6b\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x32\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\
-\x61\x74\x72\x69\x78\x28\x30\x2e\x38\x31\x2c\x30\x2c\x30\x2c\x30\
-\x2e\x39\x2c\x2d\x32\x31\x2e\x36\x37\x39\x36\x39\x39\x2c\x2d\x31\
-\x30\x31\x2e\x35\x33\x38\x39\x33\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x34\x30\
-\x36\x38\x38\x30\x22\x20\x64\x3d\x22\x4d\x20\x35\x32\x2e\x30\x31\
-\x31\x39\x37\x34\x2c\x31\x31\x35\x2e\x35\x39\x38\x38\x31\x20\x48\
-\x20\x31\x35\x36\x2e\x30\x36\x35\x38\x35\x20\x63\x20\x31\x31\x2e\
-\x30\x38\x2c\x30\x20\x32\x30\x2c\x38\x2e\x39\x32\x20\x32\x30\x2c\
-\x32\x30\x20\x76\x20\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\
-\x30\x2c\x31\x31\x2e\x30\x38\x20\x2d\x38\x2e\x39\x32\x2c\x32\x30\
-\x20\x2d\x32\x30\x2c\x32\x30\x20\x68\x20\x2d\x31\x33\x2e\x30\x30\
-\x36\x37\x33\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\x34\x20\x6c\x20\
-\x2d\x30\x2e\x34\x30\x30\x34\x33\x2c\x32\x31\x2e\x30\x34\x39\x32\
-\x37\x20\x2d\x32\x35\x2e\x36\x31\x33\x30\x34\x2c\x2d\x32\x31\x2e\
-\x30\x34\x39\x32\x37\x20\x48\x20\x39\x31\x2e\x30\x33\x32\x31\x37\
-\x38\x20\x37\x38\x2e\x30\x32\x35\x34\x34\x33\x20\x36\x35\x2e\x30\
-\x31\x38\x37\x30\x39\x20\x35\x32\x2e\x30\x31\x31\x39\x37\x34\x20\
-\x63\x20\x2d\x31\x31\x2e\x30\x38\x2c\x30\x20\x2d\x32\x30\x2c\x2d\
-\x38\x2e\x39\x32\x20\x2d\x32\x30\x2c\x2d\x32\x30\x20\x76\x20\x2d\
-\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\x2d\x31\x31\
-\x2e\x30\x38\x20\x38\x2e\x39\x32\x2c\x2d\x32\x30\x20\x32\x30\x2c\
-\x2d\x32\x30\x20\x7a\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0d\x0a\x20\x20\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\
-\x36\x32\x2e\x35\x22\x20\x63\x79\x3d\x22\x34\x30\x22\x20\x72\x3d\
-\x22\x32\x35\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x65\x66\
-\x66\x30\x66\x31\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\
-\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\
-\x35\x22\x20\x2f\x3e\x0d\x0a\x20\x20\x3c\x72\x65\x63\x74\x20\x77\
-\x69\x64\x74\x68\x3d\x22\x35\x22\x20\x68\x65\x69\x67\x68\x74\x3d\
-\x22\x35\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\
-\x31\x22\x20\x78\x3d\x22\x36\x30\x22\x20\x79\x3d\x22\x32\x35\x22\
-\x2f\x3e\x0d\x0a\x20\x20\x3c\x72\x65\x63\x74\x20\x77\x69\x64\x74\
-\x68\x3d\x22\x35\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x30\
-\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\
-\x20\x78\x3d\x22\x36\x30\x22\x20\x79\x3d\x22\x33\x35\x22\x2f\x3e\
-\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x01\x08\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x30\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\
-\x63\x61\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x61\x66\x61\x66\
-\x61\x66\x22\x20\x78\x3d\x22\x33\x36\x22\x20\x77\x69\x64\x74\x68\
-\x3d\x22\x33\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x37\x22\
-\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x72\x65\x63\x74\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x61\x66\x61\x66\x61\x66\x22\x20\x78\x3d\x22\
-\x33\x36\x22\x20\x79\x3d\x22\x34\x37\x22\x20\x77\x69\x64\x74\x68\
-\x3d\x22\x33\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x31\x22\
-\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x72\x65\x63\x74\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x61\x66\x61\x66\x61\x66\x22\x20\x78\x3d\x22\
-\x36\x36\x22\x20\x79\x3d\x22\x32\x39\x2e\x37\x35\x22\x20\x68\x65\
-\x69\x67\x68\x74\x3d\x22\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
-\x31\x35\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\
-\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x06\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\
-\x39\x32\x2c\x35\x2e\x30\x38\x33\x33\x30\x32\x38\x20\x34\x2e\x35\
-\x2c\x31\x2e\x37\x37\x32\x39\x38\x31\x38\x20\x37\x2e\x38\x31\x30\
-\x35\x34\x30\x38\x2c\x35\x2e\x30\x38\x34\x37\x32\x33\x35\x20\x63\
-\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\x37\
-\x37\x30\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\
-\x2c\x30\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\
-\x2c\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\
-\x2e\x35\x37\x31\x31\x33\x36\x39\x20\x6c\x20\x2d\x33\x2e\x35\x39\
-\x36\x31\x32\x38\x33\x2c\x2d\x33\x2e\x35\x39\x37\x33\x31\x30\x31\
-\x39\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\
-\x39\x20\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\x37\
-\x34\x38\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\x33\
-\x2c\x34\x2e\x35\x31\x33\x35\x38\x36\x36\x20\x63\x20\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x20\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x34\x31\
-\x33\x34\x33\x34\x39\x20\x30\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\
-\x39\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\
-\x36\x32\x38\x31\x33\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\
-\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x20\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x39\x2c\x2d\x30\x2e\x30\x30\x31\x34\x32\x20\x7a\x22\x20\
-\x66\x69\x6c\x6c\x3d\x22\x23\x33\x64\x61\x65\x65\x39\x22\x20\x66\
-\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\
-\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\
-\x76\x67\x3e\x0d\x0a\
-\x00\x00\x01\xbb\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x20\
-\x77\x69\x64\x74\x68\x3d\x22\x37\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\
-\x6e\x6f\x64\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\
-\x6e\x65\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\
-\x3d\x22\x31\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\
-\x73\x63\x61\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\
-\x3c\x67\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\
-\x6e\x73\x6c\x61\x74\x65\x28\x2d\x32\x39\x39\x2e\x30\x30\x30\x30\
-\x30\x30\x2c\x20\x2d\x31\x32\x39\x2e\x30\x30\x30\x30\x30\x30\x29\
-\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\
-\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\
-\x65\x28\x32\x39\x39\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x31\x32\
-\x39\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\
-\x2c\x31\x36\x20\x43\x31\x2c\x31\x37\x2e\x31\x20\x31\x2e\x39\x2c\
-\x31\x38\x20\x33\x2c\x31\x38\x20\x4c\x31\x31\x2c\x31\x38\x20\x43\
-\x31\x32\x2e\x31\x2c\x31\x38\x20\x31\x33\x2c\x31\x37\x2e\x31\x20\
-\x31\x33\x2c\x31\x36\x20\x4c\x31\x33\x2c\x34\x20\x4c\x31\x2c\x34\
-\x20\x4c\x31\x2c\x31\x36\x20\x4c\x31\x2c\x31\x36\x20\x5a\x20\x4d\
-\x31\x34\x2c\x31\x20\x4c\x31\x30\x2e\x35\x2c\x31\x20\x4c\x39\x2e\
-\x35\x2c\x30\x20\x4c\x34\x2e\x35\x2c\x30\x20\x4c\x33\x2e\x35\x2c\
-\x31\x20\x4c\x30\x2c\x31\x20\x4c\x30\x2c\x33\x20\x4c\x31\x34\x2c\
-\x33\x20\x4c\x31\x34\x2c\x31\x20\x4c\x31\x34\x2c\x31\x20\x5a\x22\
-\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\
-\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x0e\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\x39\
-\x37\x32\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\x33\
-\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\
-\x2d\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\
-\x35\x34\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\
-\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\x37\
-\x37\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\x2e\
-\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x33\x20\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\
-\x33\x2e\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\x36\
-\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x30\
-\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\
-\x31\x32\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\
-\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\x37\
-\x31\x31\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\x33\
-\x34\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\x2d\
-\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\x37\
-\x31\x32\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\x31\
-\x31\x33\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\
-\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\
-\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\
-\x33\x20\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\
-\x64\x61\x65\x65\x39\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\
-\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\
-\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x18\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x20\
-\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x22\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x67\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x66\x69\
-\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\
-\x6e\x73\x6c\x61\x74\x65\x28\x2d\x32\x35\x35\x2e\x30\x30\x30\x30\
-\x30\x30\x2c\x20\x2d\x33\x38\x31\x2e\x30\x30\x30\x30\x30\x30\x29\
-\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\
-\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\
-\x65\x28\x32\x35\x35\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x33\x38\
-\x31\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\
-\x34\x2c\x30\x20\x4c\x32\x2c\x30\x20\x43\x30\x2e\x39\x2c\x30\x20\
-\x30\x2c\x30\x2e\x39\x20\x30\x2c\x32\x20\x4c\x30\x2c\x31\x36\x20\
-\x43\x30\x2c\x31\x37\x2e\x31\x20\x30\x2e\x39\x2c\x31\x38\x20\x32\
-\x2c\x31\x38\x20\x4c\x31\x36\x2c\x31\x38\x20\x43\x31\x37\x2e\x31\
-\x2c\x31\x38\x20\x31\x38\x2c\x31\x37\x2e\x31\x20\x31\x38\x2c\x31\
-\x36\x20\x4c\x31\x38\x2c\x34\x20\x4c\x31\x34\x2c\x30\x20\x4c\x31\
-\x34\x2c\x30\x20\x5a\x20\x4d\x39\x2c\x31\x36\x20\x43\x37\x2e\x33\
-\x2c\x31\x36\x20\x36\x2c\x31\x34\x2e\x37\x20\x36\x2c\x31\x33\x20\
-\x43\x36\x2c\x31\x31\x2e\x33\x20\x37\x2e\x33\x2c\x31\x30\x20\x39\
-\x2c\x31\x30\x20\x43\x31\x30\x2e\x37\x2c\x31\x30\x20\x31\x32\x2c\
-\x31\x31\x2e\x33\x20\x31\x32\x2c\x31\x33\x20\x43\x31\x32\x2c\x31\
-\x34\x2e\x37\x20\x31\x30\x2e\x37\x2c\x31\x36\x20\x39\x2c\x31\x36\
-\x20\x4c\x39\x2c\x31\x36\x20\x5a\x20\x4d\x31\x32\x2c\x36\x20\x4c\
-\x32\x2c\x36\x20\x4c\x32\x2c\x32\x20\x4c\x31\x32\x2c\x32\x20\x4c\
-\x31\x32\x2c\x36\x20\x4c\x31\x32\x2c\x36\x20\x5a\x22\x2f\x3e\x0d\
-\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\
-\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x01\xf5\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\
-\x66\x31\x22\x20\x64\x3d\x22\x4d\x32\x30\x2c\x31\x38\x48\x34\x56\
-\x38\x48\x32\x30\x4d\x32\x30\x2c\x36\x48\x31\x32\x4c\x31\x30\x2c\
-\x34\x48\x34\x43\x32\x2e\x38\x39\x2c\x34\x20\x32\x2c\x34\x2e\x38\
-\x39\x20\x32\x2c\x36\x56\x31\x38\x41\x32\x2c\x32\x20\x30\x20\x30\
-\x2c\x30\x20\x34\x2c\x32\x30\x48\x32\x30\x41\x32\x2c\x32\x20\x30\
-\x20\x30\x2c\x30\x20\x32\x32\x2c\x31\x38\x56\x38\x43\x32\x32\x2c\
-\x36\x2e\x38\x39\x20\x32\x31\x2e\x31\x2c\x36\x20\x32\x30\x2c\x36\
-\x5a\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\
-\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\x65\x28\x30\x2e\x35\x29\
-\x20\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x31\x32\x2c\x20\x31\
-\x36\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\
-\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x64\
-\x3d\x22\x4d\x33\x2e\x39\x2c\x31\x32\x43\x33\x2e\x39\x2c\x31\x30\
-\x2e\x32\x39\x20\x35\x2e\x32\x39\x2c\x38\x2e\x39\x20\x37\x2c\x38\
-\x2e\x39\x48\x31\x31\x56\x37\x48\x37\x41\x35\x2c\x35\x20\x30\x20\
-\x30\x2c\x30\x20\x32\x2c\x31\x32\x41\x35\x2c\x35\x20\x30\x20\x30\
-\x2c\x30\x20\x37\x2c\x31\x37\x48\x31\x31\x56\x31\x35\x2e\x31\x48\
-\x37\x43\x35\x2e\x32\x39\x2c\x31\x35\x2e\x31\x20\x33\x2e\x39\x2c\
-\x31\x33\x2e\x37\x31\x20\x33\x2e\x39\x2c\x31\x32\x4d\x38\x2c\x31\
-\x33\x48\x31\x36\x56\x31\x31\x48\x38\x56\x31\x33\x4d\x31\x37\x2c\
-\x37\x48\x31\x33\x56\x38\x2e\x39\x48\x31\x37\x43\x31\x38\x2e\x37\
-\x31\x2c\x38\x2e\x39\x20\x32\x30\x2e\x31\x2c\x31\x30\x2e\x32\x39\
-\x20\x32\x30\x2e\x31\x2c\x31\x32\x43\x32\x30\x2e\x31\x2c\x31\x33\
-\x2e\x37\x31\x20\x31\x38\x2e\x37\x31\x2c\x31\x35\x2e\x31\x20\x31\
-\x37\x2c\x31\x35\x2e\x31\x48\x31\x33\x56\x31\x37\x48\x31\x37\x41\
-\x35\x2c\x35\x20\x30\x20\x30\x2c\x30\x20\x32\x32\x2c\x31\x32\x41\
-\x35\x2c\x35\x20\x30\x20\x30\x2c\x30\x20\x31\x37\x2c\x37\x5a\x22\
-\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\
-\x67\x3e\x0d\x0a\
-\x00\x00\x01\x1a\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\
-\x31\x34\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\
-\x68\x2d\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\
-\x23\x63\x38\x63\x39\x63\x61\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\
-\x68\x2d\x31\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\
-\x31\x33\x2e\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x63\x38\x63\x39\x63\x61\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x2c\
-\x35\x20\x68\x38\x20\x76\x38\x20\x68\x2d\x38\x20\x76\x2d\x38\x20\
-\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x63\x38\x63\x39\x63\x61\
-\x22\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\
-\x6e\x6f\x64\x64\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x52\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\
-\x20\x78\x3d\x22\x34\x2e\x35\x22\x20\x79\x3d\x22\x32\x22\x20\x77\
-\x69\x64\x74\x68\x3d\x22\x31\x35\x22\x20\x68\x65\x69\x67\x68\x74\
-\x3d\x22\x32\x30\x22\x20\x72\x78\x3d\x22\x31\x22\x20\x72\x79\x3d\
-\x22\x31\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x65\x66\x66\
-\x30\x66\x31\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\
-\x68\x3d\x22\x31\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x6c\x69\x6e\x65\
-\x20\x78\x31\x3d\x22\x36\x2e\x35\x22\x20\x79\x31\x3d\x22\x32\x30\
-\x22\x20\x78\x32\x3d\x22\x31\x37\x2e\x35\x22\x20\x79\x32\x3d\x22\
-\x32\x30\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x65\x66\x66\
-\x30\x66\x31\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\
-\x68\x3d\x22\x31\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x67\x20\x74\x72\
-\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\
-\x74\x65\x28\x30\x2c\x20\x31\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\
-\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x31\x32\x22\x20\
-\x63\x79\x3d\x22\x38\x22\x20\x72\x3d\x22\x34\x22\x20\x73\x74\x72\
-\x6f\x6b\x65\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\x72\x6f\x6b\x65\
-\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x2e\x35\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\
-\x3d\x22\x72\x6f\x74\x61\x74\x65\x28\x31\x33\x30\x29\x20\x74\x72\
-\x61\x6e\x73\x6c\x61\x74\x65\x28\x2d\x31\x32\x2e\x32\x2c\x20\x2d\
-\x32\x32\x2e\x38\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\
-\x20\x78\x3d\x22\x31\x32\x22\x20\x79\x3d\x22\x37\x2e\x35\x22\x20\
-\x77\x69\x64\x74\x68\x3d\x22\x36\x22\x20\x68\x65\x69\x67\x68\x74\
-\x3d\x22\x30\x2e\x35\x22\x20\x72\x78\x3d\x22\x30\x2e\x32\x35\x22\
-\x20\x72\x79\x3d\x22\x30\x2e\x32\x35\x22\x20\x73\x74\x72\x6f\x6b\
-\x65\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x73\x74\x72\x6f\
-\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x30\x2e\x35\x22\x2f\x3e\
-\x0d\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x20\x20\
-\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x38\x22\x20\x63\
-\x79\x3d\x22\x31\x34\x22\x20\x72\x3d\x22\x31\x2e\x35\x22\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x2f\x3e\x0d\
-\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\
-\x0a\
-\x00\x00\x00\x5b\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\
-\x66\x66\x30\x66\x31\x22\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x30\
-\x2c\x36\x20\x32\x34\x2c\x36\x20\x31\x32\x2c\x31\x38\x22\x2f\x3e\
-\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x01\xfe\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x35\x2e\x30\x38\x32\x33\x30\
-\x32\x38\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x2d\x33\x2e\
-\x33\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\
-\x20\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\
-\x35\x34\x30\x38\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\
-\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x2d\x30\x2e\
-\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x33\x20\x2d\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\
-\x20\x2d\x33\x2e\x35\x39\x37\x33\x31\x30\x31\x37\x2c\x2d\x33\x2e\
-\x35\x39\x36\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\
-\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x31\x2c\x2d\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x31\x39\x31\x2c\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\
-\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\x38\x20\x4c\x20\x34\
-\x2e\x35\x31\x32\x35\x38\x36\x36\x2c\x30\x2e\x36\x31\x38\x32\x38\
-\x34\x33\x37\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x34\x31\x33\x34\
-\x33\x34\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x30\
-\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x30\x2e\x31\x35\x36\
-\x32\x38\x31\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x30\
-\x2e\x31\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\
-\x32\x34\x33\x20\x2d\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\
-\x37\x31\x31\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x65\x66\x66\x30\x66\x31\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\
-\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xa3\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x33\x32\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x30\
-\x62\x30\x62\x30\x22\x20\x78\x3d\x22\x34\x22\x20\x79\x3d\x22\x36\
-\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\x65\x69\
-\x67\x68\x74\x3d\x22\x31\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x30\x62\x30\
-\x62\x30\x22\x20\x78\x3d\x22\x34\x22\x20\x79\x3d\x22\x31\x34\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\x65\x69\x67\
-\x68\x74\x3d\x22\x31\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0d\x0a\
-\x00\x00\x01\x8d\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x39\x38\x22\x20\
-\x77\x69\x64\x74\x68\x3d\x22\x39\x38\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x22\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x37\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x67\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x66\x69\
-\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\
-\x6e\x73\x6c\x61\x74\x65\x28\x2d\x33\x34\x31\x2e\x30\x30\x30\x30\
-\x30\x30\x2c\x20\x2d\x38\x39\x2e\x30\x30\x30\x30\x30\x30\x29\x22\
-\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\
-\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\
-\x28\x33\x34\x31\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x38\x39\x2e\
-\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x34\x2c\
-\x31\x2e\x34\x20\x4c\x31\x32\x2e\x36\x2c\x30\x20\x4c\x37\x2c\x35\
-\x2e\x36\x20\x4c\x31\x2e\x34\x2c\x30\x20\x4c\x30\x2c\x31\x2e\x34\
-\x20\x4c\x35\x2e\x36\x2c\x37\x20\x4c\x30\x2c\x31\x32\x2e\x36\x20\
-\x4c\x31\x2e\x34\x2c\x31\x34\x20\x4c\x37\x2c\x38\x2e\x34\x20\x4c\
-\x31\x32\x2e\x36\x2c\x31\x34\x20\x4c\x31\x34\x2c\x31\x32\x2e\x36\
-\x20\x4c\x38\x2e\x34\x2c\x37\x20\x4c\x31\x34\x2c\x31\x2e\x34\x20\
-\x5a\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\x67\x3e\
-\x0d\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x3c\x2f\
-\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x01\xf8\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x30\x2e\x39\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\x74\
-\x65\x28\x30\x2c\x20\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\
-\x66\x31\x22\x20\x64\x3d\x22\x4d\x31\x39\x2c\x32\x30\x48\x34\x43\
-\x32\x2e\x38\x39\x2c\x32\x30\x20\x32\x2c\x31\x39\x2e\x31\x20\x32\
-\x2c\x31\x38\x56\x36\x43\x32\x2c\x34\x2e\x38\x39\x20\x32\x2e\x38\
-\x39\x2c\x34\x20\x34\x2c\x34\x48\x31\x30\x4c\x31\x32\x2c\x36\x48\
-\x31\x39\x41\x32\x2c\x32\x20\x30\x20\x30\x2c\x31\x20\x32\x31\x2c\
-\x38\x48\x32\x31\x4c\x34\x2c\x38\x56\x31\x38\x4c\x36\x2e\x31\x34\
-\x2c\x31\x30\x48\x32\x33\x2e\x32\x31\x4c\x32\x30\x2e\x39\x33\x2c\
-\x31\x38\x2e\x35\x43\x32\x30\x2e\x37\x2c\x31\x39\x2e\x33\x37\x20\
-\x31\x39\x2e\x39\x32\x2c\x32\x30\x20\x31\x39\x2c\x32\x30\x5a\x22\
-\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x30\x2e\x37\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\
-\x28\x32\x2c\x20\x33\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x30\x62\x30\x62\
-\x30\x22\x20\x64\x3d\x22\x4d\x31\x33\x2c\x39\x56\x33\x2e\x35\x4c\
-\x31\x38\x2e\x35\x2c\x39\x4d\x36\x2c\x32\x43\x34\x2e\x38\x39\x2c\
-\x32\x20\x34\x2c\x32\x2e\x38\x39\x20\x34\x2c\x34\x56\x32\x30\x41\
-\x32\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x36\x2c\x32\x32\x48\x31\
-\x38\x41\x32\x2c\x32\x20\x30\x20\x30\x2c\x30\x20\x32\x30\x2c\x32\
-\x30\x56\x38\x4c\x31\x34\x2c\x32\x48\x36\x5a\x22\x20\x2f\x3e\x0d\
-\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x3c\x70\x6f\x6c\x79\
-\x67\x6f\x6e\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\
-\x31\x22\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x35\x2c\x31\x33\x2e\
-\x35\x20\x31\x38\x2e\x35\x2c\x31\x33\x2e\x35\x20\x31\x38\x2e\x35\
-\x2c\x31\x38\x2e\x35\x20\x34\x2c\x32\x30\x22\x2f\x3e\x0d\x0a\x3c\
-\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x2d\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x33\x36\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\
-\x63\x61\x6c\x65\x28\x32\x30\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\
-\x74\x65\x28\x31\x30\x20\x37\x2e\x35\x29\x20\x72\x6f\x74\x61\x74\
-\x65\x28\x39\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\x39\x37\
-\x32\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\x33\x31\
-\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\x2d\
-\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\x35\
-\x34\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x37\
-\x37\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\
-\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\x2e\x34\
-\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\
-\x20\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\x33\
-\x2e\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\x36\x31\
-\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x30\x2e\
-\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\
-\x32\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\
-\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\x37\x31\
-\x31\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\x33\x34\
-\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\x2d\x30\
-\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\
-\x32\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x2d\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\x31\x31\
-\x33\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\
-\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\
-\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x33\
-\x20\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\x31\x37\
-\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x61\x66\
-\x61\x66\x61\x66\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\
-\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\
-\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\x53\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\
-\x66\x31\x22\x20\x64\x3d\x22\x4d\x32\x30\x2c\x31\x34\x48\x34\x56\
-\x31\x30\x48\x32\x30\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0d\x0a\
-\x00\x00\x01\xfb\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\x39\
-\x37\x32\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\x33\
-\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\
-\x2d\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\
-\x35\x34\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\
-\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\x37\
-\x37\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\x2e\
-\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x33\x20\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\
-\x33\x2e\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\x36\
-\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x30\
-\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\
-\x31\x32\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\
-\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\x37\
-\x31\x31\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\x33\
-\x34\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\x2d\
-\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\x37\
-\x31\x32\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\x31\
-\x31\x33\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\
-\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\
-\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\
-\x33\x20\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\
-\x66\x66\x30\x66\x31\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x07\x82\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x32\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\
-\x61\x74\x72\x69\x78\x28\x30\x2e\x38\x31\x2c\x30\x2c\x30\x2c\x30\
-\x2e\x39\x2c\x2d\x32\x31\x2e\x36\x37\x39\x36\x39\x39\x2c\x2d\x31\
-\x30\x31\x2e\x35\x33\x38\x39\x33\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x36\x33\
-\x34\x64\x38\x30\x22\x20\x64\x3d\x22\x4d\x20\x35\x32\x2e\x30\x31\
-\x31\x39\x37\x34\x2c\x31\x31\x35\x2e\x35\x39\x38\x38\x31\x20\x48\
-\x20\x31\x35\x36\x2e\x30\x36\x35\x38\x35\x20\x63\x20\x31\x31\x2e\
-\x30\x38\x2c\x30\x20\x32\x30\x2c\x38\x2e\x39\x32\x20\x32\x30\x2c\
-\x32\x30\x20\x76\x20\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\
-\x30\x2c\x31\x31\x2e\x30\x38\x20\x2d\x38\x2e\x39\x32\x2c\x32\x30\
-\x20\x2d\x32\x30\x2c\x32\x30\x20\x68\x20\x2d\x31\x33\x2e\x30\x30\
-\x36\x37\x33\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\x34\x20\x6c\x20\
-\x2d\x30\x2e\x34\x30\x30\x34\x33\x2c\x32\x31\x2e\x30\x34\x39\x32\
-\x37\x20\x2d\x32\x35\x2e\x36\x31\x33\x30\x34\x2c\x2d\x32\x31\x2e\
-\x30\x34\x39\x32\x37\x20\x48\x20\x39\x31\x2e\x30\x33\x32\x31\x37\
-\x38\x20\x37\x38\x2e\x30\x32\x35\x34\x34\x33\x20\x36\x35\x2e\x30\
-\x31\x38\x37\x30\x39\x20\x35\x32\x2e\x30\x31\x31\x39\x37\x34\x20\
-\x63\x20\x2d\x31\x31\x2e\x30\x38\x2c\x30\x20\x2d\x32\x30\x2c\x2d\
-\x38\x2e\x39\x32\x20\x2d\x32\x30\x2c\x2d\x32\x30\x20\x76\x20\x2d\
-\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\x2d\x31\x31\
-\x2e\x30\x38\x20\x38\x2e\x39\x32\x2c\x2d\x32\x30\x20\x32\x30\x2c\
-\x2d\x32\x30\x20\x7a\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0d\x0a\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\
-\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x38\x2c\x30\x2c\x30\
-\x2c\x30\x2e\x38\x2c\x34\x37\x2e\x39\x36\x30\x30\x32\x33\x2c\x39\
-\x2e\x36\x33\x39\x39\x37\x35\x38\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\
-\x66\x30\x66\x31\x22\x20\x64\x3d\x22\x4d\x20\x36\x2e\x35\x2c\x31\
-\x35\x2e\x37\x20\x30\x2c\x31\x30\x2e\x35\x20\x41\x20\x33\x34\x2e\
-\x33\x39\x36\x2c\x33\x34\x2e\x33\x39\x36\x20\x30\x20\x30\x20\x31\
-\x20\x35\x2e\x32\x30\x39\x2c\x35\x2e\x33\x30\x38\x20\x32\x39\x2e\
-\x31\x33\x33\x2c\x32\x39\x2e\x31\x33\x33\x20\x30\x20\x30\x20\x31\
-\x20\x38\x2e\x39\x2c\x32\x2e\x38\x20\x32\x30\x2e\x36\x38\x38\x2c\
-\x32\x30\x2e\x36\x38\x38\x20\x30\x20\x30\x20\x31\x20\x31\x35\x2e\
-\x33\x37\x36\x2c\x30\x2e\x34\x37\x31\x20\x32\x38\x2e\x36\x37\x2c\
-\x32\x38\x2e\x36\x37\x20\x30\x20\x30\x20\x31\x20\x32\x30\x2e\x37\
-\x2c\x30\x20\x32\x33\x2e\x35\x38\x38\x2c\x32\x33\x2e\x35\x38\x38\
-\x20\x30\x20\x30\x20\x31\x20\x32\x35\x2e\x31\x38\x38\x2c\x30\x2e\
-\x34\x31\x32\x20\x31\x39\x2e\x34\x31\x32\x2c\x31\x39\x2e\x34\x31\
-\x32\x20\x30\x20\x30\x20\x31\x20\x32\x38\x2e\x33\x35\x2c\x31\x2e\
-\x33\x20\x32\x30\x2e\x32\x32\x31\x2c\x32\x30\x2e\x32\x32\x31\x20\
-\x30\x20\x30\x20\x31\x20\x33\x32\x2e\x33\x38\x2c\x33\x2e\x33\x33\
-\x35\x20\x31\x37\x2e\x34\x39\x35\x2c\x31\x37\x2e\x34\x39\x35\x20\
-\x30\x20\x30\x20\x31\x20\x33\x34\x2e\x33\x2c\x34\x2e\x38\x20\x71\
-\x20\x32\x2e\x35\x2c\x32\x2e\x32\x20\x33\x2e\x39\x2c\x35\x2e\x31\
-\x35\x20\x31\x2e\x34\x2c\x32\x2e\x39\x35\x20\x31\x2e\x34\x2c\x36\
-\x2e\x33\x35\x20\x61\x20\x32\x31\x2e\x32\x36\x39\x2c\x32\x31\x2e\
-\x32\x36\x39\x20\x30\x20\x30\x20\x31\x20\x2d\x30\x2e\x32\x33\x39\
-\x2c\x33\x2e\x32\x38\x20\x71\x20\x2d\x30\x2e\x33\x35\x2c\x32\x2e\
-\x32\x33\x39\x20\x2d\x31\x2e\x32\x31\x31\x2c\x34\x2e\x30\x32\x20\
-\x2d\x31\x2e\x34\x35\x2c\x33\x20\x2d\x33\x2e\x36\x35\x2c\x35\x2e\
-\x33\x35\x20\x2d\x32\x2e\x32\x2c\x32\x2e\x33\x35\x20\x2d\x34\x2e\
-\x37\x35\x2c\x34\x2e\x33\x35\x20\x2d\x32\x2e\x35\x35\x2c\x32\x20\
-\x2d\x34\x2e\x37\x35\x2c\x34\x2e\x32\x20\x2d\x32\x2e\x32\x2c\x32\
-\x2e\x32\x20\x2d\x33\x2e\x36\x35\x2c\x34\x2e\x39\x20\x2d\x31\x2e\
-\x34\x35\x2c\x32\x2e\x37\x20\x2d\x31\x2e\x34\x35\x2c\x36\x2e\x35\
-\x20\x76\x20\x35\x2e\x36\x20\x68\x20\x2d\x37\x2e\x38\x20\x71\x20\
-\x2d\x30\x2e\x35\x2c\x2d\x31\x2e\x37\x20\x2d\x30\x2e\x37\x35\x2c\
-\x2d\x33\x2e\x37\x20\x2d\x30\x2e\x32\x35\x2c\x2d\x32\x20\x2d\x30\
-\x2e\x32\x35\x2c\x2d\x33\x2e\x37\x20\x61\x20\x32\x31\x2e\x33\x32\
-\x32\x2c\x32\x31\x2e\x33\x32\x32\x20\x30\x20\x30\x20\x31\x20\x30\
-\x2e\x32\x36\x38\x2c\x2d\x33\x2e\x34\x36\x34\x20\x51\x20\x31\x31\
-\x2e\x37\x31\x33\x2c\x34\x31\x2e\x35\x34\x34\x20\x31\x32\x2e\x35\
-\x2c\x33\x39\x2e\x38\x20\x31\x33\x2e\x39\x2c\x33\x36\x2e\x37\x20\
-\x31\x36\x2c\x33\x34\x2e\x33\x35\x20\x31\x38\x2e\x31\x2c\x33\x32\
-\x20\x32\x30\x2e\x35\x2c\x33\x30\x2e\x31\x20\x32\x32\x2e\x39\x2c\
-\x32\x38\x2e\x32\x20\x32\x35\x2c\x32\x36\x2e\x32\x35\x20\x41\x20\
-\x32\x32\x2e\x32\x31\x35\x2c\x32\x32\x2e\x32\x31\x35\x20\x30\x20\
-\x30\x20\x30\x20\x32\x37\x2e\x35\x35\x37\x2c\x32\x33\x2e\x34\x35\
-\x31\x20\x31\x39\x2e\x33\x38\x38\x2c\x31\x39\x2e\x33\x38\x38\x20\
-\x30\x20\x30\x20\x30\x20\x32\x38\x2e\x35\x2c\x32\x32\x2e\x31\x20\
-\x38\x2e\x39\x37\x37\x2c\x38\x2e\x39\x37\x37\x20\x30\x20\x30\x20\
-\x30\x20\x32\x39\x2e\x38\x34\x39\x2c\x31\x38\x2e\x30\x38\x35\x20\
-\x31\x31\x2e\x32\x34\x34\x2c\x31\x31\x2e\x32\x34\x34\x20\x30\x20\
-\x30\x20\x30\x20\x32\x39\x2e\x39\x2c\x31\x37\x20\x38\x2e\x32\x34\
-\x31\x2c\x38\x2e\x32\x34\x31\x20\x30\x20\x30\x20\x30\x20\x32\x37\
-\x2e\x36\x30\x35\x2c\x31\x31\x2e\x32\x37\x20\x31\x31\x2e\x30\x30\
-\x36\x2c\x31\x31\x2e\x30\x30\x36\x20\x30\x20\x30\x20\x30\x20\x32\
-\x37\x2e\x32\x2c\x31\x30\x2e\x38\x35\x20\x39\x2e\x30\x31\x32\x2c\
-\x39\x2e\x30\x31\x32\x20\x30\x20\x30\x20\x30\x20\x32\x32\x2e\x36\
-\x35\x32\x2c\x38\x2e\x34\x37\x32\x20\x31\x33\x2e\x32\x32\x31\x2c\
-\x31\x33\x2e\x32\x32\x31\x20\x30\x20\x30\x20\x30\x20\x31\x39\x2e\
-\x39\x2c\x38\x2e\x32\x20\x31\x35\x2e\x30\x30\x35\x2c\x31\x35\x2e\
-\x30\x30\x35\x20\x30\x20\x30\x20\x30\x20\x31\x35\x2e\x34\x37\x36\
-\x2c\x38\x2e\x38\x33\x33\x20\x31\x33\x2e\x30\x36\x31\x2c\x31\x33\
-\x2e\x30\x36\x31\x20\x30\x20\x30\x20\x30\x20\x31\x32\x2e\x34\x35\
-\x2c\x31\x30\x2e\x32\x20\x32\x30\x2e\x37\x32\x38\x2c\x32\x30\x2e\
-\x37\x32\x38\x20\x30\x20\x30\x20\x30\x20\x38\x2e\x34\x36\x36\x2c\
-\x31\x33\x2e\x34\x32\x35\x20\x32\x36\x2e\x32\x30\x39\x2c\x32\x36\
-\x2e\x32\x30\x39\x20\x30\x20\x30\x20\x30\x20\x36\x2e\x35\x2c\x31\
-\x35\x2e\x37\x20\x5a\x20\x6d\x20\x33\x2e\x35\x32\x36\x2c\x35\x31\
-\x2e\x39\x34\x20\x41\x20\x38\x2e\x38\x36\x2c\x38\x2e\x38\x36\x20\
-\x30\x20\x30\x20\x30\x20\x39\x2e\x38\x2c\x36\x39\x2e\x37\x20\x71\
-\x20\x30\x2c\x32\x2e\x37\x20\x32\x2c\x34\x2e\x37\x20\x41\x20\x38\
-\x2e\x33\x31\x37\x2c\x38\x2e\x33\x31\x37\x20\x30\x20\x30\x20\x30\
-\x20\x31\x31\x2e\x38\x36\x33\x2c\x37\x34\x2e\x34\x36\x32\x20\x36\
-\x2e\x34\x31\x38\x2c\x36\x2e\x34\x31\x38\x20\x30\x20\x30\x20\x30\
-\x20\x31\x36\x2e\x35\x2c\x37\x36\x2e\x34\x20\x38\x2e\x36\x30\x35\
-\x2c\x38\x2e\x36\x30\x35\x20\x30\x20\x30\x20\x30\x20\x31\x37\x2e\
-\x31\x32\x32\x2c\x37\x36\x2e\x33\x37\x38\x20\x36\x2e\x34\x36\x31\
-\x2c\x36\x2e\x34\x36\x31\x20\x30\x20\x30\x20\x30\x20\x32\x31\x2e\
-\x33\x2c\x37\x34\x2e\x35\x35\x20\x51\x20\x32\x33\x2e\x32\x2c\x37\
-\x32\x2e\x37\x20\x32\x33\x2e\x32\x2c\x36\x39\x2e\x37\x20\x41\x20\
-\x36\x2e\x32\x32\x35\x2c\x36\x2e\x32\x32\x35\x20\x30\x20\x30\x20\
-\x30\x20\x32\x32\x2e\x36\x32\x31\x2c\x36\x37\x2e\x30\x32\x39\x20\
-\x36\x2e\x39\x35\x35\x2c\x36\x2e\x39\x35\x35\x20\x30\x20\x30\x20\
-\x30\x20\x32\x31\x2e\x31\x35\x2c\x36\x35\x20\x38\x2e\x34\x37\x38\
-\x2c\x38\x2e\x34\x37\x38\x20\x30\x20\x30\x20\x30\x20\x32\x30\x2e\
-\x36\x32\x39\x2c\x36\x34\x2e\x35\x33\x32\x20\x36\x2e\x33\x32\x35\
-\x2c\x36\x2e\x33\x32\x35\x20\x30\x20\x30\x20\x30\x20\x31\x36\x2e\
-\x35\x2c\x36\x33\x20\x71\x20\x2d\x31\x2e\x32\x32\x35\x2c\x30\x20\
-\x2d\x32\x2e\x32\x33\x38\x2c\x30\x2e\x32\x36\x34\x20\x41\x20\x35\
-\x2e\x36\x39\x38\x2c\x35\x2e\x36\x39\x38\x20\x30\x20\x30\x20\x30\
-\x20\x31\x31\x2e\x35\x35\x2c\x36\x34\x2e\x38\x20\x35\x2e\x39\x37\
-\x36\x2c\x35\x2e\x39\x37\x36\x20\x30\x20\x30\x20\x30\x20\x31\x30\
-\x2e\x30\x32\x36\x2c\x36\x37\x2e\x36\x34\x20\x5a\x22\x2f\x3e\x0d\
-\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\
-\x0a\
-\x00\x00\x00\x83\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\
-\x66\x31\x22\x20\x64\x3d\x22\x4d\x34\x2c\x38\x48\x38\x56\x34\x48\
-\x32\x30\x56\x31\x36\x48\x31\x36\x56\x32\x30\x48\x34\x56\x38\x4d\
-\x31\x36\x2c\x38\x56\x31\x34\x48\x31\x38\x56\x36\x48\x31\x30\x56\
-\x38\x48\x31\x36\x4d\x36\x2c\x31\x32\x56\x31\x38\x48\x31\x34\x56\
-\x31\x32\x48\x36\x5a\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0d\x0a\
-\x00\x00\x03\x3c\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x32\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\
-\x61\x74\x72\x69\x78\x28\x30\x2e\x38\x31\x2c\x30\x2c\x30\x2c\x30\
-\x2e\x39\x2c\x2d\x32\x31\x2e\x36\x37\x39\x36\x39\x39\x2c\x2d\x31\
-\x30\x31\x2e\x35\x33\x38\x39\x33\x29\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x39\x39\
-\x39\x39\x35\x43\x22\x20\x64\x3d\x22\x4d\x20\x35\x32\x2e\x30\x31\
-\x31\x39\x37\x34\x2c\x31\x31\x35\x2e\x35\x39\x38\x38\x31\x20\x48\
-\x20\x31\x35\x36\x2e\x30\x36\x35\x38\x35\x20\x63\x20\x31\x31\x2e\
-\x30\x38\x2c\x30\x20\x32\x30\x2c\x38\x2e\x39\x32\x20\x32\x30\x2c\
-\x32\x30\x20\x76\x20\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\
-\x30\x2c\x31\x31\x2e\x30\x38\x20\x2d\x38\x2e\x39\x32\x2c\x32\x30\
-\x20\x2d\x32\x30\x2c\x32\x30\x20\x68\x20\x2d\x31\x33\x2e\x30\x30\
-\x36\x37\x33\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\x34\x20\x6c\x20\
-\x2d\x30\x2e\x34\x30\x30\x34\x33\x2c\x32\x31\x2e\x30\x34\x39\x32\
-\x37\x20\x2d\x32\x35\x2e\x36\x31\x33\x30\x34\x2c\x2d\x32\x31\x2e\
-\x30\x34\x39\x32\x37\x20\x48\x20\x39\x31\x2e\x30\x33\x32\x31\x37\
-\x38\x20\x37\x38\x2e\x30\x32\x35\x34\x34\x33\x20\x36\x35\x2e\x30\
-\x31\x38\x37\x30\x39\x20\x35\x32\x2e\x30\x31\x31\x39\x37\x34\x20\
-\x63\x20\x2d\x31\x31\x2e\x30\x38\x2c\x30\x20\x2d\x32\x30\x2c\x2d\
-\x38\x2e\x39\x32\x20\x2d\x32\x30\x2c\x2d\x32\x30\x20\x76\x20\x2d\
-\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\x2d\x31\x31\
-\x2e\x30\x38\x20\x38\x2e\x39\x32\x2c\x2d\x32\x30\x20\x32\x30\x2c\
-\x2d\x32\x30\x20\x7a\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0d\x0a\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\
-\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x2d\x31\x2e\x33\x2c\x30\x2c\
-\x30\x2c\x2d\x31\x2e\x33\x2c\x2d\x33\x31\x2e\x32\x39\x32\x39\x38\
-\x37\x2c\x35\x2e\x32\x34\x33\x31\x35\x32\x39\x29\x22\x3e\x0d\x0a\
-\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x73\x74\x72\x6f\x6b\x65\
-\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x73\x74\x72\x6f\x6b\
-\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x34\x22\x20\x66\x69\x6c\x6c\
-\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x64\x3d\x22\x6d\x20\x2d\x35\x30\
-\x2e\x30\x30\x30\x30\x30\x32\x2c\x2d\x34\x35\x2e\x35\x36\x35\x37\
-\x35\x20\x2d\x31\x31\x2e\x36\x30\x34\x37\x32\x32\x2c\x32\x30\x2e\
-\x31\x35\x35\x36\x34\x37\x20\x2d\x31\x31\x2e\x36\x30\x34\x37\x32\
-\x32\x2c\x32\x30\x2e\x31\x35\x35\x36\x34\x37\x33\x20\x2d\x31\x31\
-\x2e\x36\x35\x32\x39\x34\x32\x2c\x2d\x32\x30\x2e\x31\x32\x37\x38\
-\x30\x37\x33\x20\x2d\x31\x31\x2e\x36\x35\x32\x39\x34\x31\x2c\x2d\
-\x32\x30\x2e\x31\x32\x37\x38\x30\x38\x20\x32\x33\x2e\x32\x35\x37\
-\x36\x36\x34\x2c\x2d\x30\x2e\x30\x32\x37\x38\x34\x20\x7a\x22\x20\
-\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x3c\x72\
-\x65\x63\x74\x20\x77\x69\x64\x74\x68\x3d\x22\x35\x22\x20\x68\x65\
-\x69\x67\x68\x74\x3d\x22\x35\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\
-\x65\x66\x66\x30\x66\x31\x22\x20\x78\x3d\x22\x36\x31\x2e\x34\x35\
-\x36\x37\x38\x37\x22\x20\x79\x3d\x22\x35\x31\x2e\x39\x36\x31\x30\
-\x37\x31\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x72\x65\x63\x74\x20\x77\
-\x69\x64\x74\x68\x3d\x22\x35\x22\x20\x68\x65\x69\x67\x68\x74\x3d\
-\x22\x31\x35\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\
-\x66\x31\x22\x20\x78\x3d\x22\x36\x31\x2e\x34\x35\x36\x37\x38\x37\
-\x22\x20\x79\x3d\x22\x33\x30\x2e\x39\x36\x31\x30\x37\x31\x22\x2f\
-\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\xd1\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\
-\x31\x34\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\
-\x68\x2d\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\
-\x23\x35\x38\x64\x33\x66\x66\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\
-\x68\x2d\x31\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\
-\x31\x33\x2e\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x35\x38\x64\x33\x66\x66\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\
-\x00\x00\x01\xc2\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\
-\x31\x34\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\
-\x68\x2d\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\
-\x23\x63\x38\x63\x39\x63\x61\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\
-\x68\x2d\x31\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\
-\x31\x33\x2e\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x63\x38\x63\x39\x63\x61\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x2c\
-\x35\x20\x68\x38\x20\x76\x38\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\
-\x37\x2e\x31\x20\x68\x2d\x37\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\
-\x6c\x3d\x22\x23\x63\x38\x63\x39\x63\x61\x22\x20\x66\x69\x6c\x6c\
-\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x2f\
-\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
-\x4d\x31\x33\x2c\x31\x33\x20\x68\x2d\x38\x20\x76\x2d\x38\x20\x68\
-\x30\x2e\x39\x20\x76\x37\x2e\x31\x20\x68\x37\x2e\x31\x20\x7a\x22\
-\x20\x66\x69\x6c\x6c\x3d\x22\x23\x63\x38\x63\x39\x63\x61\x22\x20\
-\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\
-\x64\x64\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x64\x3d\x22\x4d\x31\x33\x2c\x35\x20\x4c\x20\x35\x2c\x31\x33\
-\x20\x76\x2d\x38\x20\x68\x38\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x63\x38\x63\x39\x63\x61\x22\x20\x66\x69\x6c\x6c\x2d\x72\
-\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x2f\x3e\x0d\
-\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\
-\x0a\
-\x00\x00\x03\xe3\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0d\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\
-\x61\x74\x72\x69\x78\x28\x30\x2e\x36\x32\x31\x36\x34\x32\x38\x34\
-\x2c\x30\x2c\x30\x2c\x30\x2e\x36\x32\x33\x35\x37\x31\x31\x2c\x2d\
-\x30\x2e\x36\x33\x35\x33\x30\x34\x33\x34\x2c\x33\x2e\x36\x38\x31\
-\x36\x33\x31\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\
-\x65\x6e\x6f\x64\x64\x22\x20\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\
-\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\x64\x3d\x22\x4d\x20\
-\x37\x39\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\x30\x20\x41\x20\x37\
-\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x31\x30\x2c\x38\x30\
-\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x38\x30\x2c\
-\x31\x35\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\
-\x31\x35\x30\x2c\x38\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\
-\x20\x30\x20\x38\x30\x2c\x31\x30\x20\x37\x30\x2c\x37\x30\x20\x30\
-\x20\x30\x20\x30\x20\x37\x39\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\
-\x30\x20\x5a\x20\x6d\x20\x33\x31\x2e\x31\x33\x36\x37\x31\x35\x2c\
-\x32\x38\x2e\x35\x20\x63\x20\x33\x2e\x31\x38\x36\x33\x32\x2c\x2d\
-\x30\x2e\x30\x30\x38\x37\x20\x36\x2e\x33\x37\x36\x33\x36\x2c\x31\
-\x2e\x32\x31\x31\x32\x30\x36\x20\x38\x2e\x38\x31\x34\x34\x36\x2c\
-\x33\x2e\x36\x36\x30\x31\x35\x36\x20\x34\x2e\x38\x37\x32\x37\x2c\
-\x34\x2e\x38\x39\x36\x35\x20\x34\x2e\x38\x39\x32\x39\x37\x2c\x31\
-\x32\x2e\x38\x35\x37\x37\x34\x34\x20\x30\x2e\x30\x34\x36\x39\x2c\
-\x31\x37\x2e\x37\x37\x37\x33\x34\x34\x20\x4c\x20\x39\x38\x2e\x35\
-\x31\x39\x35\x33\x31\x2c\x38\x31\x2e\x35\x31\x35\x36\x32\x35\x20\
-\x31\x31\x39\x2e\x38\x31\x38\x33\x36\x2c\x31\x30\x33\x2e\x31\x31\
-\x35\x32\x33\x20\x63\x20\x34\x2e\x38\x30\x36\x32\x2c\x34\x2e\x38\
-\x38\x34\x36\x20\x34\x2e\x37\x34\x30\x32\x32\x2c\x31\x32\x2e\x37\
-\x39\x34\x39\x38\x20\x2d\x30\x2e\x31\x34\x36\x34\x38\x2c\x31\x37\
-\x2e\x36\x37\x31\x38\x38\x20\x2d\x34\x2e\x38\x38\x38\x31\x2c\x34\
-\x2e\x38\x37\x34\x38\x20\x2d\x31\x32\x2e\x37\x34\x35\x39\x39\x2c\
-\x34\x2e\x38\x36\x32\x34\x31\x20\x2d\x31\x37\x2e\x35\x35\x30\x37\
-\x39\x2c\x2d\x30\x2e\x30\x32\x31\x35\x20\x4c\x20\x38\x30\x2e\x39\
-\x36\x38\x37\x35\x2c\x39\x39\x2e\x33\x31\x36\x34\x30\x36\x20\x35\
-\x39\x2e\x37\x37\x37\x33\x34\x34\x2c\x31\x32\x30\x2e\x38\x30\x36\
-\x36\x34\x20\x63\x20\x2d\x34\x2e\x38\x34\x38\x39\x2c\x34\x2e\x39\
-\x32\x33\x38\x20\x2d\x31\x32\x2e\x37\x33\x33\x31\x37\x35\x2c\x34\
-\x2e\x39\x34\x34\x37\x38\x20\x2d\x31\x37\x2e\x36\x30\x39\x33\x37\
-\x35\x2c\x30\x2e\x30\x34\x36\x39\x20\x2d\x34\x2e\x38\x37\x32\x37\
-\x2c\x2d\x34\x2e\x38\x39\x36\x35\x20\x2d\x34\x2e\x38\x39\x33\x36\
-\x37\x35\x2c\x2d\x31\x32\x2e\x38\x35\x37\x37\x35\x20\x2d\x30\x2e\
-\x30\x34\x36\x38\x37\x2c\x2d\x31\x37\x2e\x37\x37\x37\x33\x35\x20\
-\x4c\x20\x36\x33\x2e\x33\x39\x36\x34\x38\x34\x2c\x38\x31\x2e\x34\
-\x39\x36\x30\x39\x34\x20\x34\x32\x2e\x30\x39\x39\x36\x30\x39\x2c\
-\x35\x39\x2e\x38\x39\x38\x34\x33\x38\x20\x63\x20\x2d\x34\x2e\x38\
-\x30\x36\x39\x2c\x2d\x34\x2e\x38\x38\x34\x36\x20\x2d\x34\x2e\x37\
-\x34\x32\x31\x36\x38\x2c\x2d\x31\x32\x2e\x37\x39\x36\x39\x32\x39\
-\x20\x30\x2e\x31\x34\x34\x35\x33\x32\x2c\x2d\x31\x37\x2e\x36\x37\
-\x33\x38\x32\x39\x20\x34\x2e\x38\x38\x38\x31\x2c\x2d\x34\x2e\x38\
-\x37\x34\x31\x20\x31\x32\x2e\x37\x34\x37\x39\x33\x34\x2c\x2d\x34\
-\x2e\x38\x36\x32\x34\x31\x35\x20\x31\x37\x2e\x35\x35\x32\x37\x33\
-\x34\x2c\x30\x2e\x30\x32\x31\x34\x38\x20\x4c\x20\x38\x30\x2e\x39\
-\x34\x39\x32\x31\x39\x2c\x36\x33\x2e\x36\x39\x37\x32\x36\x36\x20\
-\x31\x30\x32\x2e\x31\x34\x30\x36\x32\x2c\x34\x32\x2e\x32\x30\x37\
-\x30\x33\x31\x20\x63\x20\x32\x2e\x34\x32\x34\x34\x36\x2c\x2d\x32\
-\x2e\x34\x36\x31\x39\x20\x35\x2e\x36\x30\x36\x36\x36\x2c\x2d\x33\
-\x2e\x36\x39\x38\x33\x36\x39\x20\x38\x2e\x37\x39\x32\x39\x37\x2c\
-\x2d\x33\x2e\x37\x30\x37\x30\x33\x31\x20\x7a\x22\x20\x66\x69\x6c\
-\x6c\x3d\x22\x23\x32\x61\x37\x39\x61\x33\x22\x20\x66\x69\x6c\x6c\
-\x2d\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\
-\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0d\x0a\
-\x00\x00\x01\xc2\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x35\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\
-\x31\x34\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\
-\x68\x2d\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\
-\x23\x35\x38\x64\x33\x66\x66\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\
-\x68\x2d\x31\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\
-\x31\x33\x2e\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x35\x38\x64\x33\x66\x66\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x2c\
-\x35\x20\x68\x38\x20\x76\x38\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\
-\x37\x2e\x31\x20\x68\x2d\x37\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\
-\x6c\x3d\x22\x23\x35\x38\x64\x33\x66\x66\x22\x20\x66\x69\x6c\x6c\
-\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x2f\
-\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
-\x4d\x31\x33\x2c\x31\x33\x20\x68\x2d\x38\x20\x76\x2d\x38\x20\x68\
-\x30\x2e\x39\x20\x76\x37\x2e\x31\x20\x68\x37\x2e\x31\x20\x7a\x22\
-\x20\x66\x69\x6c\x6c\x3d\x22\x23\x35\x38\x64\x33\x66\x66\x22\x20\
-\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\
-\x64\x64\x22\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x64\x3d\x22\x4d\x31\x33\x2c\x35\x20\x4c\x20\x35\x2c\x31\x33\
-\x20\x76\x2d\x38\x20\x68\x38\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x35\x38\x64\x33\x66\x66\x22\x20\x66\x69\x6c\x6c\x2d\x72\
-\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x2f\x3e\x0d\
-\x0a\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\
-\x0a\
-\x00\x00\x00\x64\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x33\x32\x22\x3e\x0d\x0a\x20\x20\x20\
-\x20\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x30\
-\x62\x30\x62\x30\x22\x20\x78\x3d\x22\x38\x22\x20\x79\x3d\x22\x34\
-\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x22\x20\x68\x65\x69\x67\
-\x68\x74\x3d\x22\x32\x34\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\
-\x3e\x0d\x0a\
-\x00\x00\x00\x74\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\
-\x66\x31\x22\x20\x64\x3d\x22\x4d\x33\x2c\x36\x48\x32\x31\x56\x38\
-\x48\x33\x56\x36\x4d\x33\x2c\x31\x31\x48\x32\x31\x56\x31\x33\x48\
-\x33\x56\x31\x31\x4d\x33\x2c\x31\x36\x48\x32\x31\x56\x31\x38\x48\
-\x33\x56\x31\x36\x5a\x22\x20\x2f\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\
-\x3e\x0d\x0a\
-\x00\x00\x00\xe6\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\
-\x66\x31\x22\x20\x64\x3d\x22\x4d\x31\x32\x2c\x31\x34\x43\x31\x30\
-\x2e\x38\x39\x2c\x31\x34\x20\x31\x30\x2c\x31\x33\x2e\x31\x20\x31\
-\x30\x2c\x31\x32\x43\x31\x30\x2c\x31\x30\x2e\x38\x39\x20\x31\x30\
-\x2e\x38\x39\x2c\x31\x30\x20\x31\x32\x2c\x31\x30\x43\x31\x33\x2e\
-\x31\x31\x2c\x31\x30\x20\x31\x34\x2c\x31\x30\x2e\x38\x39\x20\x31\
-\x34\x2c\x31\x32\x41\x32\x2c\x32\x20\x30\x20\x30\x2c\x31\x20\x31\
-\x32\x2c\x31\x34\x4d\x31\x32\x2c\x34\x41\x38\x2c\x38\x20\x30\x20\
-\x30\x2c\x30\x20\x34\x2c\x31\x32\x41\x38\x2c\x38\x20\x30\x20\x30\
-\x2c\x30\x20\x31\x32\x2c\x32\x30\x41\x38\x2c\x38\x20\x30\x20\x30\
-\x2c\x30\x20\x32\x30\x2c\x31\x32\x41\x38\x2c\x38\x20\x30\x20\x30\
-\x2c\x30\x20\x31\x32\x2c\x34\x5a\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\
-\x76\x67\x3e\x0d\x0a\
-\x00\x00\x2d\x10\
-\x00\
-\x00\xe7\xc5\x78\x9c\xed\x7d\xeb\x73\xdc\x36\xf2\xe0\xf7\xad\xf2\
-\xff\x80\xd8\x1f\xf2\xd8\xd1\xfb\x61\x7b\xf2\xcb\x56\xc9\x96\x1c\
-\xab\xd6\x96\x6c\x49\x5e\x5f\xca\x95\xb2\x38\x33\x18\x0d\xd7\x1c\
-\x72\x42\x90\x7a\xe4\xea\xfe\xf7\xeb\x6e\x3c\x08\x90\x00\xc9\x19\
-\xc9\x79\xd4\x9d\x92\xcd\x4a\x04\xd0\x68\x34\x1a\x8d\x46\xa3\xbb\
-\xb1\xf1\xc3\xa3\x7f\xb0\x1f\x18\x7b\x91\x73\xfe\x3b\x3f\x8c\xf2\
-\x2f\x4c\x14\x77\x09\x17\x33\xce\x8b\x75\x2c\x93\xe5\xc3\xa8\x2c\
-\x66\x59\x3e\x64\x2f\xb3\x24\x4e\xd9\x61\xf9\x5b\xc9\x45\x9a\xdd\
-\xa9\x52\x3e\x89\x0b\x2c\x3d\x48\xf8\x2d\x7b\x5d\x8a\xdf\xa3\xab\
-\x99\x2a\x4a\xe2\x31\x4f\x05\x1f\xb2\xb7\xc7\x17\x03\x26\x38\x67\
-\x6f\x8e\x5f\x1e\x9d\x9c\x1f\xad\xcf\x27\x15\xfc\x8b\x59\x2c\x18\
-\xfc\x9b\xe5\xf1\x55\x9c\x46\x49\x72\xc7\x22\x36\xcd\x00\x9d\x6c\
-\xca\xde\x23\x5e\xe7\x88\xd6\x39\xa2\x35\x60\x51\x3a\xc1\xca\xa3\
-\x48\xf0\x09\xcb\x52\x85\xfd\x46\x63\x28\xe3\x2c\xc9\x72\x26\xc6\
-\x33\x3e\xe7\x03\x36\x2a\x0b\x6c\x05\xe8\xa7\x19\xbb\x89\xa0\x87\
-\xe9\x34\x4e\xe2\xa8\x00\x20\x37\x71\x31\x63\xff\x3e\x3c\xaa\x86\
-\xbc\xf6\x10\x3f\x7a\x70\x1c\x47\xcf\xde\x48\x52\xb0\xef\xe0\x8f\
-\xef\x4d\x47\x2f\xb3\xc5\x1d\x8c\x7a\x56\xb0\xef\xc6\xdf\xb3\xff\
-\xd9\xde\xdc\xda\x59\x83\xff\xec\xfe\x8b\xfd\x4f\x8d\xd8\xff\x0a\
-\xd4\xdf\x83\xfa\xdb\x5b\x50\xdf\x26\xff\xbf\x4c\x07\xef\x78\x3e\
-\x8f\x85\x88\x81\x50\x30\xfc\x19\xcf\xf9\xe8\x8e\x5d\xe5\x51\x0a\
-\x03\x1f\xb0\x29\x90\x0b\x89\x3c\x9e\x45\xf9\x15\x50\xa9\xc8\x80\
-\xbc\x77\x6c\xc1\x73\x01\x0d\xb2\x51\x11\xc5\x69\x9c\x5e\x11\xa4\
-\x08\x28\xba\xb8\xc3\xda\x05\xce\x97\xc8\xa6\xc5\x4d\x94\x73\x9a\
-\x8f\x48\x88\x6c\x2c\x89\x39\xc9\xc6\xe5\x9c\xa7\x45\x54\x60\x9f\
-\x40\x63\x2e\xd8\x77\xc5\x8c\x13\x8c\xc7\xe7\xaa\xd5\xe3\xef\xa9\
-\xb3\x09\x8f\x12\x9c\x13\x28\x67\xba\x88\xa6\x23\x83\xe9\xca\xb9\
-\x28\xf2\x78\x8c\x70\x06\x50\x69\x9c\x94\x13\x8d\x8b\xae\x92\xc4\
-\xf3\x58\xf5\x84\x20\x88\x32\x02\x01\x97\x02\x46\x83\xf8\x0e\xd8\
-\x3c\x9b\xc4\x53\xfc\x7f\x4e\x43\x5c\x94\xa3\x24\x16\xb3\x01\xc1\
-\x99\xc4\xd8\x05\xf0\x06\x14\x08\x2c\xa0\x39\x22\x1e\xdb\x40\xe6\
-\xe1\x49\x82\x50\x62\x18\x03\x8d\xbb\xc2\x52\xf2\x61\x91\x11\x98\
-\x05\x12\xb9\x50\x64\xa3\xfe\x6f\x66\xd9\xdc\x1d\x15\x90\x6c\x5a\
-\xe6\x29\x74\xcd\x27\x34\xf4\x0c\x48\x48\xbd\xfe\x97\x8f\x0b\x0d\
-\x09\x9b\x4c\xb3\x24\xc9\x6e\x60\xa8\xd0\x75\x0a\x6b\x0b\x46\x27\
-\x86\x66\x42\x91\x9f\xa2\x51\x76\xcd\x69\x78\x92\x17\xd2\xac\x00\
-\xcc\x25\x46\x38\x37\x8b\x6a\xd2\x55\x91\x98\xc1\xb2\x62\x23\xae\
-\xe8\x08\x28\xc4\xa9\x9c\x55\x6b\x84\x39\x62\x23\x0a\xe0\x8d\x18\
-\xa6\x65\x91\xe5\xd4\x75\x7d\xe4\xd5\x2a\xb9\x78\x7d\xc4\xce\x4f\
-\x5f\x5d\x7c\x3c\x38\x3b\x62\xc7\xe7\xec\xdd\xd9\xe9\x7f\x8e\x0f\
-\x8f\x0e\xd9\xe3\x83\x73\xf8\xfb\xf1\x80\x7d\x3c\xbe\x78\x7d\xfa\
-\xe1\x82\x41\x8d\xb3\x83\x93\x8b\x5f\xd8\xe9\x2b\x76\x70\xf2\x0b\
-\xfb\xf7\xf1\xc9\xe1\x80\x1d\xfd\xaf\x77\x67\x47\xe7\xe7\x04\xeb\
-\xf4\x8c\x1d\xbf\x7d\xf7\xe6\xf8\x08\xbe\x1f\x9f\xbc\x7c\xf3\xe1\
-\xf0\xf8\xe4\x67\xf6\x02\xda\x9e\x9c\xc2\xe2\x39\x86\x55\x03\x80\
-\x2f\x4e\xa9\x53\x05\xee\xf8\xe8\x1c\x00\x52\xf3\xb7\x47\x67\x2f\
-\x5f\xc3\xa7\x83\x17\xc7\x6f\x8e\x2f\x7e\x19\xb0\x57\xc7\x17\x27\
-\x00\x9b\xbd\x02\xc0\x07\xec\xdd\xc1\xd9\xc5\xf1\xcb\x0f\x6f\x0e\
-\xce\xd8\xbb\x0f\x67\xef\x4e\xcf\x8f\x00\x8d\x43\x00\x7d\x72\x7c\
-\xf2\xea\x0c\x7a\x3a\x7a\x7b\x74\x72\x41\x23\x83\xde\xe1\x3b\x3b\
-\xfa\x0f\x7c\x60\xe7\xaf\x0f\xde\xbc\xa1\x2e\x0f\x3e\xc0\x48\xce\
-\xce\x11\xcf\x97\xa7\xef\x7e\x39\x3b\xfe\xf9\xf5\x05\x7b\x7d\xfa\
-\xe6\xf0\x08\x3e\xbe\x38\x02\x0c\x0f\x5e\xbc\x39\x92\xdd\x9d\xfc\
-\x22\xd7\xea\x9b\x83\xe3\xb7\x03\x76\x78\xf0\xf6\xe0\xe7\x23\x6a\
-\x79\x0a\x90\xce\xa8\xaa\xc2\xf2\xe3\xeb\x23\xfa\x04\x7d\x1e\xc0\
-\xbf\x2f\x2f\x8e\x4f\x4f\x90\x46\x2f\x4f\x4f\x2e\xce\xe0\x4f\xc9\
-\xa5\x17\xa7\x67\x17\xa6\xf9\xc7\xe3\xf3\xa3\x01\x3b\x38\x3b\x3e\
-\x47\x02\xbd\x3a\x3b\x85\x2e\x90\xc4\xd0\xea\x94\x00\x41\xdb\x93\
-\x23\x09\x09\xc9\x8f\xd8\x13\x14\x33\x53\x50\x0d\x47\xf4\xe1\xfc\
-\xa8\xc2\xe9\xf0\xe8\xe0\x0d\xc0\x3b\x47\x00\xf6\xb4\xae\x3f\xac\
-\x38\x04\x29\xfd\xe8\x1f\x1b\x3f\x28\xb9\xff\xf6\x00\x7a\x3b\xbf\
-\xf8\xe5\xcd\xd1\xf9\xeb\xa3\xa3\x0b\xf9\x31\xd4\xea\xfd\x45\x96\
-\x25\x17\xf1\xe2\xd1\x3f\xfe\x37\x7c\x83\x9f\x8d\x1f\xd8\xe6\xfa\
-\x36\xc8\x3c\x60\x78\xe4\x4f\x31\x07\x5e\x06\x91\xc1\xae\xa3\xa4\
-\xe4\xf0\x29\x2a\xbe\x15\xc8\xff\x2c\xbe\x4a\xb3\x5c\x6e\x16\x1f\
-\xe3\x74\x92\xdd\x88\x75\x02\x8a\x50\x46\x59\x3e\xe1\xb0\x79\x6d\
-\xae\x6f\xee\xf2\x39\x2c\xc9\x24\x9e\xb0\x27\x7c\x3a\xdd\x9c\x6e\
-\xfd\xa8\xaa\x44\xe3\x2f\x57\x79\x56\xa6\x93\xb5\x78\x1e\x5d\xc1\
-\x6e\x96\x66\x29\x6f\x16\xd2\x86\x33\x64\x4f\x76\xb6\x76\xf6\x77\
-\x46\xaa\x3c\x4a\x0a\x9e\xa7\x20\x19\xd7\xba\x6a\xea\x8f\x4e\xdf\
-\x8b\x68\x82\x42\x0f\xf1\xdb\xe2\x73\xf5\x31\x5b\x44\xe3\xb8\xb8\
-\x1b\xb2\xed\xcd\x4d\xf8\xf4\x7f\x88\x3c\x1f\xe3\xc9\x15\x2f\x0c\
-\x75\xbc\xd0\xba\x50\x00\x79\xc7\x49\xde\x7a\x91\x9d\x44\x9c\x3f\
-\x6f\xd4\xec\xec\x28\x89\x17\x43\x45\xe6\x1f\x6d\x9a\xd7\x88\x69\
-\x26\xf5\xfd\x21\x48\x9f\xec\xea\x45\x59\x14\x59\xfa\x22\x83\xf9\
-\x1d\xa3\x14\xd2\x13\x36\xa1\xd2\xb5\x71\x94\x8e\x79\xb2\x86\x65\
-\x43\x56\xe6\xc9\x77\xc3\x8d\x09\xec\xfa\x1b\xb2\xf8\xb3\x2c\x5e\
-\x17\xd7\x57\xdf\xff\xe8\xb6\x4b\x32\xc1\xc3\xcd\xb0\xd4\xd3\x2a\
-\xfb\x12\x6c\x92\x7d\xf1\xd5\x5f\xf0\x34\xdc\x02\x0a\x3d\x6d\x60\
-\xbb\xe3\x45\xb0\x11\x95\x7a\x5a\x89\xe8\x3a\x3c\x1c\x2c\xf4\xb4\
-\xb9\xe3\x62\xb9\xe1\xcc\x78\xb2\x08\xb6\xc0\x42\x4f\x9b\x34\x0b\
-\xb6\x48\x33\x4f\xfd\x68\xb1\x48\xee\x96\x43\x0b\x76\xef\x71\x94\
-\x4f\x82\x8d\x54\xb9\x6e\x69\x38\xec\x15\x28\x25\x35\xae\x42\x3d\
-\x45\x41\x45\xde\xbd\xf1\x82\x4d\xf8\xb4\xf8\x1c\xe5\x79\x76\x63\
-\x23\x63\x35\x85\x06\x05\xa8\x3e\xe2\x3a\xe6\x37\xcd\xe6\x58\xf1\
-\xb3\x66\x34\x55\x33\x00\x68\xc2\x41\xf3\x82\xbf\xba\x01\xe9\x9a\
-\x01\x40\x3c\xf5\x8c\xc3\x6e\x0f\x15\x02\x4d\xe3\x74\x9a\x75\xf7\
-\x8f\xb5\x02\x00\x40\xcd\x2a\xba\x01\x60\xad\x00\x80\x14\xda\x4e\
-\xe2\x1c\x04\x4d\x96\x7b\x58\x03\xf4\x24\x10\x23\x81\xb6\x0b\xd0\
-\x54\xd2\xa2\xad\x79\xb9\x68\x9d\x4b\xd0\x83\x72\xcf\x72\xb4\x51\
-\xa7\x2a\x2e\x5f\xea\xde\x48\x90\xf8\x48\xdf\xc0\x79\xa9\x01\x56\
-\x95\xe1\x6c\xe0\x91\x49\xb2\xc5\x67\x2c\xf4\x37\xf3\x0b\x26\xd5\
-\xac\x2e\x98\x70\xac\x7e\x0a\x34\x6a\x05\xd0\x41\x62\xd5\x91\x01\
-\xcd\xd8\x03\x15\xbf\x7e\x36\x78\x36\x96\xec\xfb\xb7\x5c\x08\xd8\
-\x2e\x9a\xfb\xc1\x5c\x16\x8c\xb2\xdb\xb5\x71\x0e\xca\xf2\x38\xf2\
-\xec\x0a\xaa\xd2\x67\x5d\xc3\xc6\xc7\x02\x80\xcc\x9c\xcf\xe9\x3c\
-\x11\x86\x61\x55\x0a\x80\xc1\x13\x5b\x3b\x0c\x5d\x23\x00\x00\xc4\
-\x0f\x1e\xbb\xc2\xed\x55\x85\x06\x99\x5e\x66\xf3\x05\x1c\x66\xf2\
-\x1a\x8d\xc6\xea\x73\x13\xa0\x2e\x71\xb8\x85\x8b\x2f\x45\xe6\x13\
-\xf8\xb2\xc0\xae\x3b\xf6\x4a\x5f\x31\xfe\x3c\xc9\xe3\xda\xde\x73\
-\xdd\xbb\xea\x34\xc9\x16\x0b\xdf\x7a\xa0\xef\xcd\xfa\x70\x78\x05\
-\x2d\x49\x78\x18\x10\x4b\x9a\xf5\x53\x5e\xdc\x64\xb9\xa7\xba\x2a\
-\x68\xb6\x28\xf2\x48\xcc\x9a\xf5\xe9\x73\x63\x12\x0e\x50\xaa\xd4\
-\x66\xa0\x5c\x90\xac\xe9\x27\x85\x40\x43\x4d\x03\xd5\xb1\xa8\xd9\
-\x00\x37\xa6\x40\x03\xff\x9e\x45\xc7\xc6\x40\x0b\x2a\x6b\x36\x59\
-\x7a\x5b\xcc\x72\x7f\x75\x0f\x7c\x43\xba\x8b\xb8\x48\xf8\x28\xaa\
-\xf3\x6f\xa1\x3e\x87\xb4\xb7\x1b\xd2\xea\x9b\xda\x5b\xd5\x0e\xb7\
-\xdb\xdb\xc2\xaf\xc7\xd4\x15\x18\xd3\x6a\x1e\xdd\xc6\xf3\xf8\x77\
-\x4f\x87\xba\xc4\xdf\x8c\xa7\xa5\x6f\xe9\xa6\xa5\xbf\x7a\x9c\x86\
-\x7a\x51\x25\xde\x66\x29\x0a\x21\x8f\xa8\x43\xab\x09\x9c\x76\xbc\
-\x6d\xc4\x2c\x9a\x78\xfa\xa1\xcf\xde\x06\x65\x1a\x68\xa2\x0a\x1a\
-\x13\x78\x0a\x34\xae\xcf\xde\x24\x03\xce\xa1\xd3\x49\x68\xfe\x1a\
-\x13\x27\x8f\x88\xf8\x03\x27\xc2\xd3\x14\x0d\x82\xd7\xa0\xe6\x44\
-\x23\x54\xdc\x52\xf6\xbe\xd8\x97\xf6\x97\x71\x54\x0a\xb4\x5c\xc8\
-\x5e\x85\x00\xb1\xba\xce\xce\x39\x67\x4f\xf6\xb7\xd7\x2b\x08\xb0\
-\x05\x71\xb4\x52\x42\xff\x1c\x46\x35\xa2\xa3\x85\x0f\x0d\x28\xfd\
-\x8c\x8c\x62\xe3\x42\xe3\xb0\xcf\x58\x43\x90\x35\x88\xc9\xa4\x71\
-\xd8\xda\xdd\xc3\x7f\x7a\x1c\xb6\x24\xb8\x97\x33\x3e\xfe\x02\x3b\
-\x9a\x81\x23\xf0\x60\x27\x4f\x7b\xdb\x3b\xd5\x71\xaf\x2c\x70\x00\
-\xce\xb1\xd3\x7b\xea\x9a\x47\xf9\x55\x0c\x67\xb7\x0c\x86\x37\xa7\
-\x23\xed\xf3\xf6\x33\xa3\x46\x20\x3c\xa2\xd1\x26\xfe\x63\x1a\xfc\
-\x0c\xe3\x59\xd8\x18\xc3\x94\x9f\x70\x69\xd0\x9a\x47\x5f\xe0\x10\
-\x5e\xe6\x9c\x4e\xe3\x38\xf2\x05\xec\x65\x30\xfb\x5c\xa4\xdf\x16\
-\xb4\x07\x01\x6f\x0a\x36\xe2\x09\x88\x47\xac\x43\x6c\x56\x1d\xc5\
-\x81\xdd\xe1\xa4\x81\xd2\x61\xc8\xb6\xe0\x64\xaf\x51\xf7\x1f\xd1\
-\x9f\xee\x3f\x7d\xfe\x74\xec\x9e\x28\xf3\x68\x12\x97\xa2\x36\x72\
-\x9b\x97\xc8\xd2\x7c\x05\xc2\x5d\xb0\x52\x30\x9e\x66\xe5\xd5\x8c\
-\xa8\xce\x59\x54\x48\x9c\xb2\x05\x0e\x86\xa7\x34\x92\x1b\x0e\x2c\
-\x96\xb2\x39\x9a\xdb\xa4\x0d\x53\xc2\x21\xcc\xb1\x1e\x59\xd4\x44\
-\x3c\x51\x83\x2e\xe1\x37\x9c\x2b\xa1\xcc\x83\xf0\x4d\x9d\xe0\x2d\
-\xf8\x06\x8a\xec\x44\x60\x2f\x33\x38\xa9\x29\x44\xea\xf4\xb1\xb8\
-\xd0\x9a\x64\x80\x83\xe3\xdc\x33\xc3\x54\xfd\xc8\x02\x69\x2b\x70\
-\xe7\x6c\x38\xcd\xc6\xa5\x30\x33\x77\x0f\xaa\xd6\xe0\x0e\x09\x4f\
-\x9b\x25\x3e\x72\x96\x6a\xae\x40\xd2\x6d\xae\xef\x43\x17\xe5\xa2\
-\x49\x31\x45\xac\x7f\x02\xc2\xb8\x63\xe8\x51\x54\x4c\x41\xc3\x59\
-\xdb\x42\x00\xda\xf4\x50\x8e\x50\x9c\xe7\x59\xb2\x26\x2f\x0c\x86\
-\x4c\x9d\xa6\x9a\x15\x16\x99\x20\xfb\xe9\x90\xe6\x75\x0c\x75\x2a\
-\x23\x84\x59\x9e\x75\x2b\x88\xa6\x24\xee\x6b\xb4\x14\x1b\x34\xce\
-\x25\x93\xea\xa2\x3a\x9d\x93\xa8\xa8\x91\x59\x4f\x97\x4d\xea\xfd\
-\xed\xfd\xbd\xfd\x67\x2e\xa9\x75\x97\x54\x0f\xb4\x8b\x54\xc8\x73\
-\x4c\x60\x62\x34\x1a\xfd\xaa\x5b\x72\x21\x5c\xbf\x26\x18\x86\xb0\
-\xb3\x82\xc2\x0c\x3b\xca\x00\x4d\x70\x39\xe7\xff\x81\x13\x5d\xed\
-\x73\xc5\x09\xe6\xb3\x19\x3f\x08\xfe\x62\xa6\x19\x92\x94\x35\xbd\
-\xc2\xbd\xac\x64\x00\x0c\xcb\x74\x8c\x48\xf0\x49\xa0\x87\xaa\x82\
-\x64\xec\x81\x1f\x6d\x17\x4e\x6b\x85\x0a\x8e\x67\x9c\x2e\x9c\xd6\
-\x0a\xde\x85\xa6\xad\x5d\xf6\x76\x83\xd5\x41\x44\x7e\x36\x2d\x3f\
-\x6b\x39\xac\xf7\x9f\x9e\xe4\x69\x1f\xd6\x0c\x96\x60\xde\x5d\x8d\
-\xa4\x73\x9f\xe1\x19\x78\xed\xd5\x2c\x78\xed\xd3\x67\xe0\xb5\x57\
-\x53\xf0\x1a\x02\xcc\x36\xc6\xf6\x27\xb5\x4b\x61\x1f\x65\x3a\xa6\
-\xbb\x83\x3b\x55\xf1\x12\x5c\xb0\x2c\x62\xed\xf3\xda\x6b\x6d\xf4\
-\x9c\xfa\x5e\x13\xdf\x6b\x11\xf5\xe4\x8d\x5e\x9c\xd1\xe8\xb0\xad\
-\xd2\x83\x30\x4f\xef\x19\x82\xdf\x78\x81\x77\x70\x68\xf8\x0f\xd1\
-\xc2\xa9\xb4\x04\x9f\x38\xed\x96\xc4\xa5\x9d\x1d\xdc\xaa\xad\xec\
-\xe5\x56\xed\xe0\x9f\x00\x0a\xdd\x55\x5b\x19\xce\x8b\xc2\x1f\x45\
-\x47\x2d\xa8\xfb\x21\xd7\x50\xaf\x97\xc4\x2e\xb0\x2f\xb4\x2d\xe9\
-\x2e\x04\x7d\xf5\xda\x16\xd0\x0a\x43\x68\xdf\xd4\xda\x37\xa3\x2e\
-\xf4\xfd\x35\xdb\x37\x90\x15\x86\xd0\xb5\x33\x9f\x81\x6a\x9c\xc9\
-\x9b\xaa\xaf\x7d\x88\x6b\x74\x18\x3e\xb4\xd5\x94\x39\xbb\xcd\xaa\
-\x1a\x9a\x1f\x86\xab\x85\x74\xd5\xe9\xab\x17\xe1\x79\x23\x5b\x86\
-\xf4\x1d\x6a\x45\x67\xcd\x1e\x9b\x83\x6f\xfa\xfa\x0e\xa0\x17\xde\
-\x7e\x7d\xe1\xbe\x38\xac\x80\x41\x27\xdd\x1a\xfb\x6e\x47\xbd\xaf\
-\x43\xdd\x55\x46\xd6\x58\x30\xab\xf7\xbb\x2a\x53\xf6\x97\x41\xfd\
-\x56\xc1\x5b\x9e\x96\x2f\xa2\x6a\x31\x2f\xed\x64\xe0\x80\x01\x9c\
-\x0b\x3e\xf7\x00\x1b\xda\xa7\x45\x7f\xab\xa1\x74\x09\xb0\x87\x16\
-\x6c\x1e\xb6\x3f\x18\x27\x03\x5f\x0f\x7d\x05\x9e\xdb\xaa\xc1\x7f\
-\x1d\xae\x0d\x7d\xa4\xf2\x9a\x63\x61\xd2\x66\x81\x80\xcc\x46\x74\
-\xda\xfd\x32\x24\x74\x6f\x43\x18\xc4\xd8\xda\x5c\xaa\x9a\x6a\x6f\
-\x71\x6a\xda\x93\x87\x17\x11\x93\x09\xe3\xb7\x40\x7a\x63\x84\xb2\
-\xfd\xe4\xc8\xde\x82\x7f\x51\x6b\x46\x06\x79\x63\x76\xb1\xfc\x4e\
-\xb0\x23\xb6\x85\x96\xa6\xea\x8f\x1d\x9f\x71\xee\xb9\x99\x46\xcf\
-\x6c\xf7\x60\xa5\x10\x1f\xf5\x76\x65\x69\xf2\x4e\x0d\xa4\x67\xf9\
-\x75\x1a\x69\x2d\x30\xcb\xf0\x5f\xcb\x4e\xbb\xb9\xfe\xac\xb1\xd7\
-\xda\xdf\xf0\x1e\x24\x63\x51\x12\x5f\xa5\xd2\x35\xd5\x62\x84\x01\
-\xbb\x99\xc5\xe3\x19\x9b\x45\x82\x45\x7a\x3e\x24\x53\xac\xd7\x4d\
-\x84\xda\x98\xb4\xe3\x33\x9d\x55\x96\x31\x69\x15\xa3\x3b\xa4\xd0\
-\x08\x86\x20\x1f\xd7\xf8\xed\x38\x29\x45\x7c\xcd\x2b\x71\xf6\x80\
-\x9a\x54\xcf\x1e\x3d\x52\xe6\x2b\x77\xfd\x40\x07\xf9\x5e\x9d\xac\
-\x32\xba\x5e\xbd\xad\x34\x77\xfd\x77\xa0\x8e\xae\x96\x18\xd6\x7d\
-\xfb\x5c\x72\x70\x4b\x12\x6f\xd5\xf1\xb4\x74\x43\xa2\x78\x8d\x84\
-\x6f\x58\xc8\xb7\x77\xe1\xbf\xaf\x35\xc2\x66\x2f\x28\x6c\x02\x78\
-\x2c\xa3\xa4\x54\x7d\x07\xa6\xea\x60\x24\x40\xde\x8f\x8b\x63\x10\
-\xa0\x78\x88\x33\x30\xef\xe9\x18\xe9\xdd\x77\xdc\x76\xed\xd7\x17\
-\x17\xd1\x48\x5d\xe7\x35\x6d\x22\x5e\xd5\xd6\x7c\x3c\x87\xae\xa0\
-\x6b\xff\x75\x8a\xd2\x24\x65\x1f\x6f\x40\xb9\x3c\x9a\xc4\x45\xdb\
-\x76\xb3\x35\xd9\xde\xdc\xde\xf9\xd1\xbb\xed\xba\x03\xa1\xd8\x8c\
-\xa1\x1c\x6a\xab\x12\xd5\xfb\x6a\x2c\xa0\x0d\xea\x39\x3b\x1f\xc3\
-\x4e\x91\x1c\xe4\x3c\xaa\x73\x82\x17\x9a\x7f\x4a\x5c\x64\x1a\xe3\
-\xf7\x28\x03\xc6\x3f\x58\xc7\x85\xa0\x92\x52\xb5\x34\x7a\x0b\xde\
-\x2e\xaa\xd8\x01\xa9\x79\xc9\x0b\x11\x18\x55\x9e\xf2\x5c\x82\xb8\
-\x99\xf1\x94\x8a\x67\x4c\xd0\x68\x46\x51\x0e\x3b\x27\x86\x2d\x8c\
-\x0b\x74\xf2\x78\x24\xfd\x8b\x3d\x63\x1e\x0e\x35\x20\x8f\x3e\x5b\
-\xd3\x12\x0c\xca\x2f\x23\xbc\xeb\x9c\x64\x84\xd5\xbf\x0f\x8f\x64\
-\x40\x0d\xba\xd0\xdf\x60\xec\x85\x74\x54\xd6\x88\xc0\x2e\x9e\x4e\
-\x12\x19\x19\xc1\x46\x7c\x9c\xcd\xb9\x60\x09\x8d\x41\x29\x6a\xf2\
-\x2c\x46\x77\x89\x19\xde\x82\xe3\x70\x64\x81\xd5\x12\xe3\x3a\xb0\
-\x1e\x05\x5f\x00\x84\xb8\x50\xc0\xa8\xf3\xf8\x77\x58\x92\x86\x94\
-\x50\x80\x57\xe6\xaa\x4b\x24\x4b\x05\xcd\x5c\x59\x5a\xb4\xe6\xd7\
-\xe8\xa5\x48\x04\x2b\x80\x26\x24\xf3\xb0\x69\x91\xc1\xca\x81\x11\
-\x19\xfa\x49\xba\xa1\xd6\x3d\xcb\xf2\xf8\x77\xd0\x32\xa2\xa4\x37\
-\xdb\x57\x82\x69\xbf\x92\x56\x95\x14\xdc\xda\x21\xdd\x73\x5f\xaa\
-\xa0\xd6\x5f\xfe\x55\xe0\x5c\x6c\x39\xfd\x34\xb8\x77\xeb\xa9\x25\
-\x11\x7c\x43\x90\xa7\xe1\xb6\x81\xd4\x74\xbf\x0a\xc8\x50\x52\xb5\
-\x27\x3d\x9c\x23\x48\xc7\xd9\x88\xa8\x03\x0a\x9e\x47\xc4\xf7\x1d\
-\x61\x13\xb9\xee\x91\x2e\x83\x62\xa3\x3f\x10\x6c\x6b\x74\xd6\xf6\
-\x90\xc3\xcc\xb4\x35\xbf\xe6\xd7\xae\xed\xcf\x9a\x6d\xef\xf6\xb7\
-\xdb\x34\x6c\x39\x1f\xbd\x3a\x31\x09\x92\x66\x05\x7d\xdf\x2c\x11\
-\xf6\x0d\x13\x2a\xff\x8d\x86\xa9\x74\xfe\xa5\x47\xe9\x99\xcc\xca\
-\x6c\xd4\x51\xcf\x3a\xcc\xfe\x7d\xe7\xd4\x3b\x5a\x5f\xbd\x3f\x6d\
-\xb4\xab\x4e\x6d\xb9\x50\x4a\x60\x35\x88\xda\x30\xd1\x05\xb1\x51\
-\xc7\xbb\x49\x3a\xba\x50\x8d\x2d\x16\x48\x85\x60\x1f\x48\xca\x5a\
-\x8d\x65\x7a\x80\xb9\x21\x37\xdf\xde\x1b\x90\xa1\xb5\x77\xff\x69\
-\x6e\x3c\xbe\x45\xfb\x80\xfb\x8f\xc6\xff\x01\x76\x9f\x3e\xa4\x58\
-\x65\xef\xa9\x38\x71\xf5\xcd\xa7\xff\x30\xef\xb5\xf5\x98\x75\xd9\
-\xa0\x45\x5d\xc5\x70\x04\xf3\x8a\x12\xd9\xbb\x44\x7d\x6b\x39\xe4\
-\xa6\x74\x2f\x81\xfc\x37\x18\xa2\xd4\xd5\xef\x25\x88\x5d\xc6\x09\
-\x89\x61\x53\xeb\x1e\x42\xf8\xaf\x31\x9b\xed\x9b\xeb\x9f\x3f\xce\
-\xd5\xa7\xd4\x6c\x37\x7a\x10\xe1\xcd\xa6\x45\x92\xf5\xd8\x6a\x02\
-\xf0\xcd\x46\xd3\x1f\xfa\x05\xbf\x2d\x96\x3a\xd4\x77\xd9\x2f\x7c\
-\x27\x77\xd9\xd5\xbb\x24\x8a\xd3\x87\xec\xaf\xf3\xe0\x1e\xc6\xe5\
-\x1c\x0e\x92\x3f\xe7\x56\xfc\x6d\x90\xc5\x04\xd4\xbc\x82\x9a\xbd\
-\xad\x51\x7b\xd5\x2e\x61\x0e\xd2\xe7\x5c\xfa\xcb\x0a\x0e\xcc\x8a\
-\x66\x38\xe5\x3b\x6a\xf1\xef\x80\x89\x38\x1d\xcb\x33\x35\xfa\x98\
-\x2b\xa3\xb8\xc4\x4b\x06\x2e\xb3\xd3\x94\xbd\xbb\x23\x77\xf1\x94\
-\xc7\xe4\x25\x2e\xcd\x05\x58\x05\xa6\x35\xaf\x9f\x77\x05\xc7\x0d\
-\x9c\x7a\xca\xb9\x58\x90\x95\xcf\x9c\x71\xdf\xc2\x6c\xc8\x00\x62\
-\x60\x1c\x8d\x97\xcf\xa1\xf6\x79\xbb\x3b\x66\xaf\xbb\x90\x66\x07\
-\x15\xc1\xec\xb9\x6b\xd1\x09\xb0\x3c\xec\xcc\xea\x3a\x12\x37\xbe\
-\x57\x97\x59\x8d\x22\x0d\xcb\x12\x0b\xaa\x24\xaf\x49\x11\x39\xa0\
-\x57\x79\x34\xe7\x9f\xa6\xf8\xdf\xf3\x59\xb4\xe0\x3f\x3d\xde\x7e\
-\xfc\xeb\x80\xc2\xba\xa8\x68\x38\x7c\x17\xa5\x3c\x61\x3f\xfd\xc4\
-\x36\x6f\x37\x37\x37\x77\x24\xb9\x9b\xcd\x76\x6a\xcd\x60\x32\x7a\
-\xb6\xdc\xad\xb5\x7c\x8d\xa6\x39\xd3\x6c\x37\xd4\x6c\xaf\xd6\xec\
-\x3f\x4e\xb3\xbd\x50\xb3\xfd\xc7\xbf\x32\xbb\x19\xa5\x2f\x99\xb8\
-\xa8\xee\x53\x63\x77\x2d\x99\x55\x82\xeb\xd0\x9d\x40\xef\x92\x0d\
-\x9b\x04\xfd\x96\xd4\x2e\x66\x69\x08\x09\xfb\x92\x11\xc6\xf3\x2e\
-\xcf\xae\xd1\x73\x7b\x06\xd3\x4c\x76\x2a\xbc\x53\x44\x73\x1c\x0d\
-\x9e\x65\x94\xca\x42\x05\xd7\xfb\x67\xbd\xda\xc9\xbc\xb3\xdb\x56\
-\xbc\xdb\x5e\xbc\xd7\x5e\xbc\xaf\x8b\x3b\x1c\xe0\x5d\x35\x12\xc6\
-\x7c\x98\xa1\x45\x6f\xa1\x46\x1e\xa5\xda\x69\x80\xc5\x53\xe3\xb8\
-\x1f\x31\x19\xdf\x42\x49\x07\x58\x11\x7d\xc1\xf8\x82\x85\x94\x5f\
-\xe8\xd3\x1f\xa0\xc8\xaf\xac\x61\x1e\x0f\xe1\x68\x10\x1c\x25\x30\
-\x87\x0d\x69\x79\x92\x15\xc0\x06\xc7\x18\xac\xf0\x2d\x26\x4e\xa1\
-\x1c\x3a\x63\x50\xb3\xaf\x78\x5d\xc2\xa9\x6c\x1e\x45\x96\x91\x2d\
-\x54\x99\x10\xd3\x09\x5f\x70\xf8\x4f\x5a\x24\x77\x5a\xae\xa2\xf9\
-\x52\xe6\xd3\x21\xc9\x3a\x89\xa7\x53\x4e\xe2\x8c\x78\x47\x68\x3b\
-\xac\x32\xb4\x92\x5c\x64\x68\xd5\xd4\x66\x44\x8c\x44\xd2\xdd\x7d\
-\x38\x5e\xa7\xcc\x25\x32\xbc\x82\xba\xc6\x1c\x2d\xaa\x7b\xac\xa1\
-\x00\x10\x47\x0f\x5c\x18\x50\x91\xfe\xc0\x10\x71\xbc\x93\xc1\xbc\
-\x26\xb2\x9e\x36\xf2\xe2\x95\xa8\x8c\xd5\x20\xeb\xab\x91\xd8\x98\
-\x33\xc2\x76\x8f\x98\x82\x62\xb2\x76\xa3\xe4\xe8\x28\x4b\x26\xd5\
-\xae\x2e\x6b\x76\x1d\x38\x03\xd7\x0d\x2e\x8c\x56\x5d\xa2\x17\x84\
-\x36\xdb\x61\x68\xdb\x9d\x61\xa8\x85\xa2\xad\x7b\x07\x53\x87\xda\
-\xc4\x2f\x04\xf3\xba\x1b\xa6\xd9\xa7\x96\x43\x16\x9a\xf5\x85\xbb\
-\x04\xba\x1d\x50\x99\xfc\xc5\xf5\xd7\xf3\xf1\x84\x47\x3e\xd8\xfb\
-\xb9\x5e\x84\xed\x1b\x6c\x23\x5a\xc4\xf6\xd8\xf0\x60\xb4\x82\x7c\
-\xf2\x82\x09\x39\x5c\xb5\x9c\xe8\x37\x64\x5e\x21\xed\x26\xa2\x63\
-\xb6\xe2\x14\x34\xa6\xb8\x00\xf1\x9e\xcd\xd9\xa5\xaf\xb3\x4b\x10\
-\x16\x19\x4b\x38\x4a\xc1\x18\x1b\xac\xd7\x5d\x48\x96\x24\x4c\xa5\
-\x00\x82\xf2\x85\x69\x88\xf2\x12\x33\x48\xa1\xac\x89\x60\x3f\x8d\
-\x13\x2e\xd3\x83\x58\xe9\xc9\x0e\x4b\x0a\xc5\x92\x42\x04\xc5\xb0\
-\x18\xa0\x30\x40\x79\x9c\xc7\x46\xe0\xcd\x63\x10\x1a\xa0\x99\x52\
-\x7a\xa6\x28\x51\x31\x56\x73\x25\x80\x32\x40\x0a\x34\x48\x0a\x44\
-\xcc\xcd\xed\x86\x94\x43\x55\x2c\x18\x09\x7b\x15\x35\xa6\x69\x35\
-\xcd\xf2\x4a\x88\x4d\xf2\x6c\xb1\x86\x67\x16\x86\xe1\x9e\xfa\x76\
-\x6a\x91\x2d\xca\x85\x91\x49\x12\x7f\xe6\xa3\xe6\x27\xaa\xf9\x36\
-\x9b\xc0\x86\xb5\x09\xaa\x47\xff\xda\x5b\x8f\x7f\x35\xf3\x5d\x27\
-\xfc\x56\x98\xf0\xb6\x96\xd6\xb3\xa7\xed\xd5\x7a\xb2\x2d\x41\xef\
-\x4a\x31\xab\x2d\xc2\x95\xd2\xd5\xf4\xb8\xfd\x6c\xbd\x50\xf5\x1e\
-\x86\x7c\x3e\x81\x6e\x64\xe2\x96\x77\x28\x14\xf6\x35\x68\x7e\x6a\
-\x5f\xd5\xad\x41\x58\xd9\x7c\x94\xe1\x75\x34\xe6\x65\xa8\x41\xc6\
-\x4f\x7d\xb4\xc7\x9a\x36\x18\xea\x41\xa6\xab\xa8\xf5\x21\x3f\xde\
-\xbf\x17\x0b\xe4\x52\xfe\x57\x2b\x76\xda\xae\x1e\x3b\x61\x92\x0e\
-\x53\x34\xbd\xf8\x3c\x85\x92\xd3\xb7\xf8\xad\x9f\xcf\xab\x82\x26\
-\x8b\x55\x98\x37\xc2\x85\x9b\xbc\xe4\xf8\x16\x04\xae\xe9\xad\xfa\
-\x3d\x7c\x1c\xa1\xab\x68\x77\xea\xa3\xc2\x9a\x63\xf6\xae\x93\x01\
-\x4a\x9f\x36\x51\xaf\xa1\xa2\x19\xe9\x21\xa2\x4b\xc3\xcb\xd6\xba\
-\xf3\xdc\xb6\x8d\x06\x15\x1f\x63\x90\x37\x32\x58\x2f\x5b\x49\x83\
-\x8a\x0d\xe7\xa1\x66\x63\x4f\xd0\x66\xeb\x20\xbb\xa7\xae\xdb\xf6\
-\xdd\x2d\xf2\xda\xfd\x57\x43\xe3\xec\xee\xba\xc7\x68\xfb\x74\x6d\
-\xa6\xa7\x0a\x29\xd2\x5f\x8c\x53\x8d\xf1\xbf\x58\xc4\xa9\x53\xb5\
-\x5e\x60\x5a\x68\xe7\x9a\xaa\xaa\xf9\x52\x85\x18\x29\xdb\x99\x15\
-\x49\xa4\xbf\x98\x3a\x8e\x91\xad\xaa\xe8\x7e\x6e\xe0\x59\x1d\xd6\
-\x9c\x10\x95\xe6\x97\x3e\x51\xd7\xcb\x13\x51\xaf\xf8\xe1\x37\x9a\
-\xe5\x07\x1e\xb6\xb2\x03\xb3\xbc\x04\xb6\x2b\xb8\xf4\x74\x62\xba\
-\x1c\xe2\xd8\x25\x1e\xda\xf9\xfa\xac\x48\xe3\x0d\x15\x73\x4a\x96\
-\x70\xcd\x7d\x99\x25\xe5\x3c\x75\xbc\xca\xda\xb6\xd7\x60\xeb\xd5\
-\xcc\x9a\xda\x40\x70\x14\xc1\xe1\x73\x4c\xc0\xb4\xc2\x87\x59\xaf\
-\xd0\xdb\x26\x6a\x1e\xf0\x95\x29\xa0\xea\xbc\x59\xa5\xdf\x60\x6a\
-\x76\x0a\xa5\x0b\x1f\xa7\x4c\xda\x36\x41\xa3\x15\x1c\x8f\xea\xa9\
-\x88\x45\xc1\xd3\xf1\x1d\x1b\xf1\xe2\x86\x73\xcc\x9e\xb1\x47\x7a\
-\x2d\x99\x45\x6f\x64\xa8\xbe\x51\x83\x95\xb2\x4b\x86\x8c\x1b\xae\
-\x3d\x99\xaa\x94\xa4\x00\x6b\x21\xb3\x91\x32\xfa\xd9\x5a\x27\x53\
-\x6d\x54\xf5\x54\xb0\xcb\x79\x74\xab\xf4\xa5\x4b\x4d\x12\x74\xa0\
-\x5e\x67\x07\xe9\x5d\x31\xd3\x49\x5c\xf5\x8f\x4c\x78\x70\x49\x5e\
-\x89\x97\xa0\xc2\x63\x46\x52\x74\x52\x62\x98\x3a\x10\xb8\xf5\x8a\
-\xce\x18\x42\x9b\x57\x28\xbd\xa3\x03\xc0\x46\x5b\x26\x76\x03\xe2\
-\xe3\xf9\x25\xc1\xac\xb6\xda\x14\x8c\x3f\xdb\x12\x5b\xad\xbb\xd7\
-\x1a\x02\x8a\x38\x6b\x0b\x50\xe2\x79\x9e\xdc\x51\x35\x65\xfe\x95\
-\xcd\x77\x64\xf3\x4b\x3a\xcc\x5c\x2a\xa3\xa7\xd0\xce\x5a\x68\xdb\
-\x40\xba\xca\x9d\x53\x9f\x3b\xe8\xf2\x42\x0c\x1c\x84\xb1\xd6\x25\
-\xa9\xcb\x97\xba\x31\x2a\x16\xf4\x5d\xfa\xb0\xb9\x98\x49\x18\x2e\
-\x08\x28\xaa\x21\x4a\xcd\xe9\x88\x42\x86\x27\xb4\xc8\x21\xcf\x5a\
-\x27\x25\x3c\xe3\xe1\x27\x87\x2d\xa4\x63\x59\x96\x7f\x11\x68\xd2\
-\x32\x3e\x61\x97\xd2\xe9\xfd\xd2\xba\xcf\x91\x40\x9c\xd9\xd5\x76\
-\x1a\xa8\xfd\x83\xbc\xa7\xb1\x1b\x60\x5d\x24\xd1\x25\x92\x55\xa8\
-\x9c\xd2\x5d\xec\x5f\x8b\x63\x08\xa8\x02\x80\x83\xe7\x4e\xa1\x42\
-\xad\xee\xe5\xda\xde\xa3\xcf\x0b\xb7\xb7\xa7\xad\xe5\xae\x2b\x6f\
-\x57\x65\xa4\x84\xfe\x7d\x79\x14\x8c\x7f\xf1\x60\xa9\x56\xee\x76\
-\xde\xee\xac\x4b\x75\x6b\x01\x99\xad\x1d\x21\x7f\x76\x12\xc8\x9f\
-\x09\xea\x61\xe8\x53\x21\xb0\x04\x79\xac\x46\x5d\xd4\xa9\x70\xf7\
-\x13\xc7\xbb\xfb\xae\xa0\x6f\x6a\x48\x2d\x72\x7f\x43\x25\xaa\x99\
-\x45\x0b\x38\xe6\x19\x43\x6b\xdd\xba\x10\x25\x37\xd1\x1d\xda\x3a\
-\x66\x64\xac\x60\x1a\x19\x4c\xe4\x9c\x66\xc5\xba\x49\x71\xdb\x71\
-\x5f\xd8\x9a\xf5\x75\x3b\x7a\xfa\x3c\xd2\x35\xd5\xd9\x58\x17\x36\
-\x3c\x08\x02\xae\xd6\x86\x78\x43\x33\x82\x2a\x5a\xb6\x79\x5b\xac\
-\x56\xfc\x8f\x8d\x0a\x6e\x36\x17\xdb\x9f\xab\xee\xbf\xe3\x60\x45\
-\x4c\xa0\x6b\xd4\x51\xa6\xc2\xf0\x35\x0a\xe6\xc1\x93\x6b\xcc\xf2\
-\x6a\x69\x18\x12\x6c\xf7\xe3\x66\xc5\x06\x11\xcc\x9d\x76\xb7\xd2\
-\x51\xe5\x7b\x6b\xf8\xd7\x3b\xe3\xf6\x45\x14\xd5\x5d\x99\x02\xb7\
-\x73\x3e\xc4\x86\x59\x3a\x08\x15\x35\x95\x78\xbb\xb4\x67\x8c\xaf\
-\x3f\x8f\xdd\x43\x0c\xa7\xa6\xe7\x76\xec\x23\x2b\xf9\xac\xdf\xf3\
-\xba\xdd\x3a\xc6\xba\x67\x5b\x5f\xe0\xb5\x57\x6d\x0f\xdd\x39\xfb\
-\x6d\xc4\x75\x10\xe5\x42\x65\x40\xf3\x1d\x0b\x4c\x61\xe7\xe9\xb0\
-\x19\xe4\xb7\xda\x5a\x56\xf1\x67\xf6\x72\x0e\xd8\x29\x7b\xb2\x88\
-\x7f\xd4\xc4\xa3\xe1\x71\x5b\xc5\x7f\xf4\xc8\x2d\x57\xcd\xb0\x41\
-\xb5\xef\xb8\xcd\x49\xe0\x45\x79\xc5\xa6\xf1\xad\xb2\x9d\x83\x8a\
-\x9d\x5e\xd1\xfb\x0c\xa8\x5c\xd1\x3b\x18\xef\xd5\xd0\xb9\x50\x1a\
-\xee\x8b\x3b\x36\xe1\xd3\xa8\x4c\x8a\x81\xd1\x87\xa5\xeb\xff\x08\
-\x47\x0f\x6d\x47\x77\xec\xd2\x22\xd4\xa5\x6c\x47\xda\xac\xe1\x1b\
-\x79\x23\x40\xcf\x10\xe8\x6b\x04\x20\x73\x29\x5f\xf5\x98\x4e\xe9\
-\xad\x83\x99\x0a\x4d\x48\xaf\x1c\xe5\x54\x35\x61\xb3\xec\x86\xc3\
-\x0c\xe8\xea\x02\x43\x19\x40\xaa\xa0\x52\xad\x9a\xb1\x52\x98\x53\
-\xc4\x7b\xba\x5d\x5f\x7f\xf9\xf2\xb3\x16\x48\x3a\x48\x52\xb6\x17\
-\xf8\x84\x48\x41\x47\x5b\x15\x07\x31\x8e\x52\xd8\x1f\x1f\xa9\xb0\
-\x0b\xa6\xd5\x09\x09\xb4\xaa\xad\xef\x41\x63\xba\x81\xc4\xd3\xdc\
-\x55\x92\x8d\xa2\x44\xde\x3d\xae\x5b\x58\x0b\xa4\x0f\xe6\x9a\x4f\
-\x05\xec\xd7\xe4\x66\xa4\x23\x2d\x98\x85\x97\x3a\x95\x44\x4c\x00\
-\xe5\x31\x7c\x45\x9d\x0a\xf0\x6d\x92\x62\x96\xd3\xb5\x42\x91\xe3\
-\xa5\x07\x5d\x3b\x80\x74\xcc\x07\x92\x92\xf2\xe5\x92\x69\xa4\x88\
-\x37\x8e\x84\xad\xd6\x1f\xa8\x71\x3e\xd9\xdd\x6c\xc6\xb3\x28\xfe\
-\x36\x9e\x56\x3e\xe6\xaf\xdc\xb0\xec\x6c\x1a\xe1\x5a\xd9\x74\xda\
-\x5e\xe1\x1b\xa8\x31\xfc\x46\x03\x0b\x1b\x73\xac\x9d\xa3\xa3\xb8\
-\x1d\x33\x7b\xe7\x0a\xe0\x66\x55\xf1\x61\x17\xd8\xb2\xac\x4b\x80\
-\x95\x25\x8f\x21\x4b\x8b\xf6\x59\x4f\x03\xdb\x01\xa9\xff\x3c\xf5\
-\xe8\xb3\x23\x72\xaf\x09\xb6\x4b\x95\x36\x80\x3d\x8a\x74\xcb\xbc\
-\xb4\x40\x6c\xaa\x0b\x9d\xd0\x96\x61\x98\x5e\x3d\xf7\x25\x53\x5f\
-\x46\x6b\xed\xcb\x43\xb9\xc3\xac\x04\x28\x75\xb5\xc6\x52\x26\x76\
-\x3d\xbb\xc0\xe5\xfb\x97\x51\xc2\x53\x00\x2f\x83\x1d\x3d\x87\x24\
-\x9e\x12\x76\x97\x78\x40\x97\xb1\x76\xb4\xcd\x0d\xac\x8d\x4f\xc2\
-\x52\x9f\x23\x72\x93\x53\x47\x06\xf5\xca\x12\x5d\xcf\x52\x40\x1d\
-\x9b\x80\xf4\x14\xb6\x21\x6c\xfd\x1e\x98\x68\xd2\x49\xa8\x95\xf9\
-\xa0\x27\xa4\xf6\xeb\xc5\x8e\x37\x2c\xfa\x3d\x86\xa1\xad\x80\x1f\
-\xc9\x4d\x08\x5d\x7f\x64\x30\x9e\x8a\x9c\x53\xe6\xbe\x77\x39\xbf\
-\x3e\xe1\xb7\x05\x20\x5e\xbb\xf8\x74\xe2\xb8\x9e\xf9\xd5\x41\xeb\
-\xea\xfc\x37\x69\xf3\x29\x64\x76\x6c\xf4\xc9\x84\x76\x8b\x5b\xfc\
-\x5f\x65\xe9\xaf\x77\xf6\xe4\xb7\xe2\xf3\x58\x91\xec\x73\x0a\x25\
-\x73\x50\x45\x66\x2d\x8c\xe8\x54\x76\xb9\xb0\x1d\x38\x9c\x8b\xaf\
-\x7b\x03\xc7\xca\x71\x56\x8a\x9a\x41\xb5\x72\x00\x35\xee\x65\x74\
-\x7f\x8f\x60\x89\xf9\xee\x78\x94\x23\x67\x2c\x12\x38\xfe\xd2\x97\
-\xda\xc1\xd8\x71\x4c\x92\xed\xe4\x64\xae\x63\x66\x52\x19\x91\x29\
-\xdf\xb0\x92\x3e\x26\x3c\xb9\x33\xdb\xf5\x0d\xfc\x1b\xa5\xb8\x49\
-\x5b\x67\x55\xe5\x22\x25\xe3\xc1\xdd\x98\x53\xa9\xb7\x0e\x58\x99\
-\x26\xf1\x17\x69\x79\x93\x99\x99\xed\xfb\xf3\x20\xe3\x7a\xdc\x51\
-\xfa\xa8\x9b\xf7\xbc\x5d\xf3\xc6\x97\xfb\xcf\x47\xb5\xeb\xd2\xe0\
-\x05\xbf\xcd\xa3\xe1\xdb\xf2\xf0\xf0\x57\xf1\x7d\x69\x81\x66\xe7\
-\xc6\x0c\xd7\x5a\x36\x33\x4c\x3b\x89\x3a\x29\x11\x4e\x06\x56\x0f\
-\x7b\xe6\xac\x8e\x36\xb2\x34\x29\xa6\x17\xf1\x9c\x94\x53\xf2\x54\
-\x26\x5f\x96\x78\xae\xed\xc0\xb2\xb9\xe6\x6f\x2e\x17\x8a\x35\x60\
-\x27\x79\x48\xaa\xdc\x35\x59\x1a\xcd\xd5\x52\xb9\x84\xa5\x8c\x82\
-\xb6\x80\x3e\xa0\x0b\xb3\xac\xa5\x4a\x5f\xb9\xc1\xc8\x1e\x00\x87\
-\x08\x73\x17\x27\x49\x0f\xf6\x1e\x0e\x65\x56\x74\x2b\x6d\xec\x93\
-\x40\x6f\x8d\xb1\xb7\x80\xe9\xd6\xda\x1e\xd8\xf4\xa0\x2f\xcc\x9f\
-\x9a\x8b\x7e\x79\x54\xf3\x27\x04\x52\x2c\xb1\x06\xab\xc0\x1b\x41\
-\xb1\x44\xfe\x62\x5b\xda\xf4\x59\x01\x92\x50\x5a\xb3\xbe\x07\xad\
-\xdb\x0c\x55\x5f\x8f\xce\x0d\x0b\x80\x45\xdd\x87\x23\x60\x70\xb3\
-\xa1\x95\x23\xcf\xb3\xeb\xec\x85\xbe\x12\xb1\xb7\x12\x73\xf3\x81\
-\x55\xd5\xc2\x53\x05\xb0\x48\x2c\x32\xaa\x54\xe0\x74\xaf\x42\x79\
-\x07\xca\x22\x03\xb1\x1c\x0b\x19\x96\x6f\x03\x90\x1d\x9a\xe3\x2f\
-\x2e\x53\xe3\x3e\x86\xcf\x18\x72\x79\x09\x96\xb1\xcb\x43\x0e\x7b\
-\x1f\x9f\xbc\xc3\x92\xcb\x1e\xcb\xef\x13\xf6\x7a\x86\x9d\xfe\xf4\
-\xb8\xc8\x4b\xfe\xf8\xd7\x9a\xab\x59\x8b\x99\xcc\xcf\x6a\x0d\x3d\
-\xd4\xba\x79\xd9\xb2\x6d\x75\x96\xb1\xab\x61\xc2\xb3\xed\xb1\xa1\
-\x70\x84\x0a\xa1\xa6\xf8\xdc\x6c\xf0\x8b\x36\x9c\xd8\xe7\xb1\x37\
-\xd1\x88\xd7\x9d\x47\x5b\x5c\xaa\xd9\x8b\xd3\x33\x7a\xd5\x4f\x7a\
-\x10\x9b\x34\x21\xc3\x45\x94\xf2\x0e\x73\xa2\x95\xc8\xcb\xd2\xc6\
-\xeb\x40\x86\x94\x04\xbe\x75\xab\x73\xf6\x72\x2d\x74\x5a\x61\x4a\
-\xfe\x5e\xce\x01\xa7\x4a\x66\xd6\x06\x19\x69\xba\x0c\xdc\x4a\x22\
-\xb6\x41\xa5\x85\xb8\x0c\x58\x2d\x4c\x9b\x70\x6d\x0f\xef\x4a\x41\
-\x9e\xe4\xd1\xcd\x8b\x08\x1f\x9f\xdd\x74\x10\x6b\xf7\x04\xb4\x8c\
-\xfb\xce\x23\x14\xd2\xc3\xbe\xb0\x32\x92\xa0\x49\x2c\xa7\x48\x00\
-\x32\xb0\xa1\x17\x40\x11\x8d\xf4\xa3\x06\xc7\xea\xf1\xc1\x0a\x82\
-\x7e\x18\x15\xdf\x5d\x35\x2f\x75\x16\x59\xf6\x05\xdb\xd3\x82\x47\
-\x27\xd6\x1c\xdd\x50\x51\x74\xae\xb3\x83\x02\x1d\x6b\x85\x05\x62\
-\x6b\x13\x84\x43\x99\x0b\x79\xcb\x3b\xc2\xcb\xfc\x1b\xa8\x80\x99\
-\xf6\xf3\x3b\x75\xa1\x5d\x94\x39\x6c\xed\x53\xf5\x4a\x2b\xe2\x37\
-\xb0\x71\xa0\x07\x11\x27\x20\xa9\xa8\x15\x59\xc3\xb2\x39\xa2\x55\
-\x7f\x67\xa0\x71\x3a\xf2\x85\x2a\x49\xe2\x87\x7c\x5c\x02\x5e\xd3\
-\x4e\x53\xe9\x65\xa8\x6c\x87\xf6\x0d\xd8\xa1\x32\x1e\x52\x44\x16\
-\x88\x71\x11\x8f\xe4\x93\x0b\xa0\xb4\xe1\x15\x36\x4c\x01\xa8\xeb\
-\xb2\x5d\xf5\xd6\xc8\xb2\x71\x8f\x9e\xe3\x49\xfd\x2d\x92\xae\x70\
-\x2d\xdf\x40\x3a\x8f\xfa\x54\xd9\x77\xca\xf7\x42\xab\x2b\xaa\x21\
-\x78\xaa\x5e\xdd\x43\xe5\xe2\xf4\x1d\xbb\x38\x78\x51\x49\x34\xea\
-\x01\x98\x15\x05\xd1\xa0\xf9\x69\x98\x00\x53\xf9\xbe\xa3\xab\xc0\
-\x5a\x66\x49\xc1\x3e\xa1\x8d\x21\xc7\x79\xdf\x93\x07\x6d\x27\x19\
-\xe7\xb1\x83\x96\x8a\xfa\xa9\x05\xdf\x85\x88\x3b\x9f\x7e\x17\xbb\
-\x4e\xdf\xc3\x3d\x79\xd8\xf6\x8a\x8f\x66\x88\x96\xba\x1b\xa4\x7b\
-\x46\x53\xaf\xdf\x05\x62\x43\xca\x55\x33\xf1\xcd\xca\x59\x12\xb7\
-\xc7\x3b\x9b\x3b\xbb\x2b\x4d\x55\xef\x29\xa8\xbd\x34\xb1\xec\xf9\
-\xf4\xab\x52\x0e\x4d\x1a\x6b\xa1\x04\x6e\x2d\x2f\x6a\x78\xe8\xf6\
-\xb5\xe7\xb6\xf3\x22\x2a\xbf\x1a\x45\xdf\xed\x6f\x0d\xd8\xd6\xd3\
-\x9d\x01\xdb\xde\xd9\x1e\xe0\x0e\xf6\xfd\x9f\x4d\xe2\x6a\x00\xd3\
-\x38\x17\x0d\x0f\xf8\xbf\xe8\x30\x48\xf3\xbb\xb8\x38\x7d\x1b\x90\
-\x95\xb2\x7d\x5d\x2c\x2a\x56\xf7\x49\x4c\x55\xf4\xb7\x10\x9a\x6e\
-\xea\xda\xbf\x82\xdc\x44\xcf\x8b\xf6\x09\xf5\xf8\x66\x04\x98\x52\
-\x8d\xee\x4f\x11\x9a\x9e\x97\x7f\xee\x35\x53\x7f\x30\xcd\x1e\x52\
-\x5c\x7e\xcd\x29\xfd\xfa\x42\xe6\xab\x62\xff\x07\x09\xca\x7b\x8e\
-\x01\x44\xe4\x9b\xa3\x57\x17\x01\x01\x89\x80\xeb\x32\x90\x04\x95\
-\x4f\x38\x52\xc1\xd7\x10\x8d\x9d\xea\xdf\xb2\x2a\x4a\xb7\xac\x5d\
-\x59\x30\x6a\x83\xc9\xf2\x92\xd1\x37\x45\xab\x6e\xd9\x34\xc0\xff\
-\x27\x64\xe3\x83\x53\x4d\x5f\x61\x05\x25\xa4\x3d\xc2\x5e\xf2\xf1\
-\xeb\x4d\xec\x1f\x23\x5d\xbe\x22\xfe\x7f\xa0\x8c\xbc\xe7\x28\x40\
-\x4e\x9e\x1d\xff\xfc\x3a\x24\x28\xe5\x95\xa1\xef\xa3\x57\x54\xca\
-\x92\xbf\x85\xac\xec\xb1\x52\xff\x04\x61\xd9\xeb\x5c\xe0\xa9\xd4\
-\xe4\x48\x39\xbe\xbf\xb2\xac\xec\x7d\x32\xf8\x83\x69\xf6\xf0\x92\
-\xf2\xab\xcd\xea\x5f\x41\x0d\xbb\x0f\xfa\x7f\x19\x5d\xb2\x63\x10\
-\x8d\x54\x0f\x74\xaf\xac\xc2\x1d\xf2\x38\x4a\xaf\xca\x84\x2e\xb0\
-\xf5\xcd\x81\x30\x3e\x97\x68\xfa\x8d\xaf\xd2\x4c\xc5\x47\xc9\xfe\
-\x58\x54\x40\xb3\x51\x59\xd8\xcf\xef\xea\x22\xed\xc4\x84\xaf\x3b\
-\x2b\xa7\x25\x73\x83\x3e\x92\x17\x6b\xd7\x71\x24\x63\x99\x6c\xea\
-\x5e\xca\xca\xb2\xb1\xbe\x5b\x50\x7e\xa4\x08\x00\x64\x15\xa6\xda\
-\x21\x8f\x52\x04\x24\x93\xee\x4c\x6a\x41\x57\xb9\x72\xa0\x15\x98\
-\xf6\x47\xfa\xd4\x6e\xae\xed\x54\x58\x5a\xc3\x05\x11\x2f\x2b\xec\
-\xae\x3d\xad\x41\x51\x78\x99\x0c\x44\xda\xbf\x56\x65\x2a\xc3\x50\
-\x32\x87\x31\x1e\x99\x80\x31\x3b\x56\xbe\xfa\xea\x84\x73\x3c\xfa\
-\x87\xbd\x51\x7d\x12\x55\xd2\x25\x84\x35\x68\x94\xec\x05\x4b\xf6\
-\x83\x25\x4f\x83\x25\xba\x9f\xda\x06\x58\xef\x2c\x50\xbc\xdf\x5e\
-\xfc\xb4\xbd\xd8\xf4\xad\xb7\xd8\x96\xfe\xc3\x55\xf6\xbb\xab\x3c\
-\xad\x57\xb1\xef\x3b\xe8\x19\xed\x88\xa1\x35\x5f\xf1\x27\xbe\xfd\
-\x02\x53\xc4\xa2\x64\x31\x8b\x88\xb1\x30\x7f\x98\xf1\x49\xd6\xde\
-\xcd\xc4\x3f\xe8\xa7\x65\x2e\x41\xfc\x59\x53\x97\xde\x78\x6d\x49\
-\x73\x1f\x7e\xb8\xdf\xdc\xae\x32\x3b\x3e\xef\xba\x3d\xdb\x45\xee\
-\xfe\x0c\x7b\x3f\x96\xbb\x17\xb3\x78\x94\xa1\xb6\xa9\xaa\x76\x86\
-\x16\xca\xb5\xd4\xd9\xef\x51\xe7\x69\xa3\xce\xea\xaa\x51\x3d\xa0\
-\x79\x9c\xf3\x48\x54\xb9\x89\x54\xbc\x6c\xb6\x20\xd7\x0e\x8c\x67\
-\x9d\x70\x1d\x6b\x4b\xa1\xbf\x98\xde\xe7\x3a\xc3\x57\xa8\x48\xd4\
-\xab\x18\x62\x4b\x94\xbe\xf8\xf0\xf3\xd0\x49\x77\x24\x83\x5f\x71\
-\xdb\x39\xc9\xf2\x62\x36\x60\x1f\x39\x4c\x1a\x09\xe7\x23\x98\x3e\
-\x0a\x96\x28\xf6\x06\xec\x1c\x56\xe3\x4c\x86\x28\x98\xf8\x01\x6c\
-\xbb\xce\x0e\x92\x84\x2e\x7f\xb5\xbb\x89\xa0\xef\xf5\x9d\x0c\x6a\
-\xc8\xc8\x8b\x62\x7f\x3d\x28\x6e\x3f\x61\xad\x97\x49\x46\x8e\xaf\
-\xda\x5b\x23\xbc\xe6\xc2\xd5\x83\x59\x7a\xf6\x82\xab\x7b\x7f\x29\
-\x78\xd5\xb1\x20\x0c\xf1\xe9\x52\x10\x9d\x47\xed\x2b\x3e\xc0\xed\
-\xea\x43\xaa\x42\xd1\xad\xbc\x4b\x52\xf4\x45\x23\x20\xa6\xaa\x75\
-\x94\x96\x73\x9e\x53\x9c\x0b\x85\x89\xcb\x9d\x54\xcd\x2a\x4d\x9f\
-\x9e\x5c\x3d\xb1\x14\x52\x4e\xbb\xe3\x40\x82\xa0\x5c\x57\x72\xef\
-\x55\x40\x4f\x4e\x2f\x8e\x86\x18\xba\x4e\x79\x0f\x79\x5e\xf1\x0d\
-\x85\xaa\x03\x83\x19\xe6\xc3\x46\x81\x4d\xd4\xbe\xd0\x0d\x2c\x44\
-\xef\x55\xb8\x3b\x7b\x6b\xa0\xa3\x6d\xb7\xcd\x5f\x07\x14\xcb\xe7\
-\x63\xeb\x59\xdb\xac\x75\xc0\xd1\x2e\x29\x0e\x90\xc3\x6c\xfc\x45\
-\x6a\x6a\xde\xcc\x77\xee\x7e\xe3\x78\x57\x1c\x17\x46\x99\x69\xdc\
-\xf7\xdb\x69\x0c\xa5\x32\x27\x57\x7b\xd5\xda\xea\xd8\x6c\x9a\xd4\
-\x8a\x5c\x22\xc8\xa1\x9d\xdc\xc3\x74\xc0\x7e\xdd\xd5\xc1\x41\x45\
-\xbf\x94\x12\xb1\x91\x8c\xa0\x42\xdf\x47\x99\x5b\x50\xbf\x93\xa2\
-\x5e\x65\xd1\xa9\x2c\xe4\xf3\x2c\x32\x04\x57\x3a\x7d\x57\xd0\xce\
-\x38\xe5\x4c\x1c\xf3\x21\x9b\x15\xc5\x42\x0c\x37\x36\x44\x01\x34\
-\x41\x08\xd3\x24\xbb\x59\x1f\x67\xf3\x8d\xdf\x80\x51\x49\x6a\x6c\
-\xec\x6c\x6f\xed\xee\x6d\x3e\xdb\xdc\xf8\x0d\x13\xda\xca\x6c\x66\
-\x6b\x50\x2f\x2a\xd6\xec\xe9\x58\x23\x0c\xa4\x97\x83\xa8\x0d\x86\
-\xfc\x4f\x46\x51\xae\x1a\x20\x57\xf6\x71\x84\x30\xcd\xa4\xf7\x72\
-\xaf\x76\xae\xa4\x96\x89\x32\x2b\xef\x53\x82\x68\xc5\x50\x5d\xc5\
-\xd7\x14\x44\x75\xc3\xe3\x1c\x88\x36\x8f\x05\x85\x5b\xc9\x39\x95\
-\x20\x22\x99\xa2\xb2\x9e\x3c\x92\x92\xfb\x4a\x62\x68\x17\x56\x59\
-\x65\x1e\xc5\x69\x1d\x46\xa5\x8a\x43\x39\x90\xa9\xa6\x8a\x83\x38\
-\x30\x93\x0b\xcb\x1f\x9f\x61\x53\x39\x2e\xe5\xe9\x63\x60\x3d\xd4\
-\x83\x34\x90\x12\x44\x00\x49\x12\x74\xea\x61\x12\x90\x66\x56\xc5\
-\x9b\x32\x15\x28\xba\x8f\x5f\xd2\x9c\x60\xd6\x0b\x51\xf0\x88\x92\
-\xcf\x5d\xda\x3e\x29\x97\x03\xca\x3a\x0c\x0d\xd4\xf6\xa1\x9a\xb9\
-\x7e\xfd\x50\x8b\x17\x63\xe9\x1e\x48\x7b\x9a\x95\x96\x78\x16\x25\
-\x92\x2a\xe8\x05\x23\x81\x40\x27\x59\x99\xb3\x09\x17\x71\x6e\x24\
-\x5f\x95\x6f\xce\x2c\x8e\xa6\x10\xb2\xcb\x24\x9b\xd5\xd6\xbb\xd7\
-\x2f\x2b\xe4\x90\x1e\x38\x2e\xb6\x3e\x03\x0a\x9a\xef\xdb\xe8\x36\
-\x9e\x97\x73\x35\x52\xf4\xed\x41\xd9\x5e\xf7\xec\xc1\xd2\x35\x41\
-\x01\x0f\x5b\xbb\x96\xd2\xd3\x73\x08\xf7\x71\x09\x02\xd4\xa1\x93\
-\x7a\x34\x8e\xbf\xdb\xee\xe0\x28\x02\xe6\x71\xfd\x51\x39\x18\xb5\
-\xb3\x8f\x7e\x7a\x69\x92\xc9\x23\xde\x15\xe6\xeb\x00\xa9\x63\x9f\
-\x5a\x23\x50\x25\x90\x93\xd7\x9b\x33\xed\xe0\xd4\xed\x3f\x14\xc4\
-\x2a\xc8\x3e\x0f\x48\x5f\xc7\xe5\xaa\xbd\xd7\x95\x1d\xab\x1e\x96\
-\xba\x0f\xe6\x9d\x65\x92\x20\xc9\x0c\x4c\xa2\x70\x13\x00\x75\x84\
-\x9e\x77\xf8\xb2\x56\x19\x96\x1c\xcd\x5d\x7f\x74\xf4\x79\xdd\xf7\
-\xd0\xfb\xb1\xa9\xd6\xf7\xee\x7a\x38\x02\x36\x18\xcf\x86\xb3\x48\
-\xac\xe1\x9e\x0e\xf2\xba\x47\x7e\x80\x6b\x34\x4c\x78\xb8\xc6\x0d\
-\x98\x50\x96\x20\xd9\x43\x15\xa1\xa3\xa7\x55\xa0\x9b\xbb\x52\xb3\
-\xeb\xe8\x7c\xd3\x03\x9f\xa6\x7b\xbb\xfb\x10\x40\xdb\x10\x87\xd1\
-\xe4\xbf\x19\xec\x02\x6b\xee\x8b\xca\xa1\xf1\x4a\x08\x9f\xe7\x59\
-\xce\xfd\xfc\xe1\x22\x3e\x9e\xc5\xc9\x04\x16\x96\x3b\x8c\xd5\xfa\
-\xe4\x69\x80\x25\x9d\x71\x05\x7a\xac\x12\x47\x36\x5a\xc9\x22\xb7\
-\xb1\x97\xe8\x41\xcc\x24\x84\xfb\x22\xe7\xc9\xc9\xd6\x17\xc5\x4e\
-\x69\xe3\x20\xea\x75\xe7\x7c\x18\x5a\x62\xba\xcf\x96\xa6\xcb\xcc\
-\xb5\x2f\x8c\x76\x69\xc2\xf4\x44\x72\x25\x1c\x71\x0d\xf4\x42\xb2\
-\x83\x28\xf7\xc1\x31\x88\x1c\xb6\xbf\x1f\x5a\x2d\xec\xd8\x8e\x5c\
-\x5f\x66\x44\x28\x3e\x56\x6c\xec\x2e\x20\x3f\x7f\xc6\x88\x5d\x4a\
-\x51\xaf\xb2\x44\xf0\xb9\x7c\xef\x11\x1f\x9f\x86\x5d\x92\xb2\x92\
-\x65\x2a\x39\x47\x23\xb5\x73\x15\xa8\x61\x0e\x91\x09\xaf\x52\x78\
-\x39\x3b\x88\xf9\x52\x8d\x3a\x94\xe6\xcb\x72\xc1\x0f\xe4\x42\x0c\
-\xc0\x70\x1d\xf6\xd1\x9e\x5a\xe8\xbc\x71\x4e\x0a\x7c\x69\x5e\x95\
-\x86\x98\x01\xa3\x71\x0b\xeb\x38\x49\x6f\xa2\xeb\x2e\xec\x5d\x45\
-\xe7\xa1\x97\x67\x1c\x95\x2b\x43\x58\xee\xf5\x11\x66\xd9\x90\x6f\
-\x76\xeb\x07\x4a\x31\x6c\x27\xd1\xa7\x16\x50\x61\xa7\x49\x8c\x46\
-\x5b\xaa\x03\x4a\xbb\xd3\xeb\x9c\xb3\xef\xf8\xed\x98\x2f\xe4\x31\
-\x56\x9e\x33\x37\xc8\xb9\x7e\xc3\x24\xa9\x58\x08\x5e\x4e\x32\x38\
-\x44\x16\x5c\x7c\x6f\x4e\x9a\x15\x1c\x9d\x0c\x02\x8e\x57\x25\x67\
-\x4f\xf6\xb6\xea\xa7\xdd\x2e\xa5\xa2\x8a\xae\x09\x4d\x6c\xfd\xaa\
-\xac\x39\xd1\xbe\x1a\xee\xa4\x3d\xd8\x75\x9b\x83\xae\x97\x67\xfc\
-\xec\xe5\x46\xef\xbb\xc9\xe7\x98\xe7\xe5\xde\x8e\xa0\x06\xc9\x7f\
-\xb6\x19\x81\x12\x02\x6e\xa8\xb0\x33\x6d\x32\xa2\x20\x63\x69\xb3\
-\x37\xe9\xba\xf4\xdb\x11\x19\xf2\xc7\x98\x47\x89\x34\xe7\x57\xb0\
-\xb4\xe5\xe0\x0a\x98\xa2\x1c\x91\xc9\xe0\x20\xe1\xb7\xb3\x52\xfc\
-\x1e\x5d\xcd\x36\xe4\xf9\x95\xb2\xa0\x9c\xcf\x38\x2f\xc4\x06\xcd\
-\xbd\xd8\xd8\x7f\x5e\x9b\xfa\x5a\x2c\x95\x24\x81\x7a\xce\xb8\xf9\
-\xe4\xc0\xa0\x59\xd8\xfa\xb2\x41\x40\x37\x75\xae\xa2\x9d\x8c\xb2\
-\x26\x16\xf0\xa9\x27\x16\xf0\x69\xfd\x36\xb1\x3a\x5c\xee\xec\x35\
-\xd1\xf7\x3c\x3e\xa0\x61\x6d\x37\x6b\x37\xc6\xa1\xd3\x0a\xf7\xa1\
-\x8b\x15\xf3\x26\xa3\xbd\xd6\xe4\x95\x89\xb5\x60\xba\xc8\x66\xe2\
-\xc4\x74\xdb\x46\x4b\x20\x2a\x2c\x8b\xc0\x6c\xa8\xc2\xf6\xd9\xf0\
-\xfb\x1a\xf4\x7d\x2b\x7b\xeb\x79\x1f\xa4\x1a\xb4\xde\x5c\xdf\x0d\
-\xb7\x0b\x51\xdd\xdf\x28\xf0\x42\xad\x87\x2b\xad\x2a\xf5\x47\xba\
-\xfd\x4f\x0d\xb6\x55\x58\x2a\x5f\x6f\x17\xc6\xdf\x10\x34\x50\x00\
-\xba\x7a\x75\x2a\x76\xf4\x6e\xd6\x90\xdb\xbb\xe7\xcd\x4c\xbb\xc7\
-\xc6\x4b\x68\x01\x1b\xad\xc7\xff\xa7\x83\x2b\x42\xcf\x79\xd6\xf1\
-\x6a\xef\xd8\x93\x6b\x3a\xd0\x31\x3e\xac\x54\x85\xb6\x92\x70\x33\
-\x46\x48\xab\xe0\x5b\x21\x8d\xfb\xea\x85\x9e\x45\x29\x66\x3a\xc2\
-\x36\x55\xba\xc1\x48\xed\xe5\x93\xea\x71\x9b\xe4\x4e\x25\x65\x92\
-\x0f\xe2\xa8\x1b\x27\x9d\x62\xb1\x20\xdb\xa0\x7e\x3e\x1c\xcd\x53\
-\xdf\x45\x94\x73\xe2\x7b\x16\x09\x91\x8d\x63\xba\x7a\xa0\xcd\x3b\
-\x2e\xec\x0c\x51\xe8\x2d\x00\x2a\x55\x94\xc8\x2c\x5a\x56\x76\x09\
-\x99\xdc\x55\x5f\x6b\xc9\xec\xaf\xca\xee\x69\xa1\xac\x60\x7d\x48\
-\x41\x4d\x2b\xca\x94\x72\x56\x0c\x24\x3a\x14\x67\xc8\xae\xb2\x6c\
-\x62\xfc\x13\x70\x6c\x13\x5e\xf0\x7c\x8e\x6e\x02\x18\xe5\x27\x6d\
-\x89\xba\xdc\xd8\x1e\x89\x10\x80\xdb\xe5\x7b\x6d\xd9\x50\xe3\xba\
-\x1c\xe8\x30\xe4\x01\x8c\xe4\x5b\xb4\x98\xce\x81\x04\x99\x4c\x32\
-\x8b\x06\xd6\xa8\xe6\x12\x81\x01\x92\xea\xfd\x23\xcf\x43\x18\x74\
-\x63\xe6\x92\x20\xbd\xab\x0c\xf9\x3f\xb0\x2a\xc5\xb0\xe5\xb6\x60\
-\x62\x94\x87\x54\x1d\xfe\x5c\xd3\x91\xd0\xfa\x16\xce\xce\x29\x26\
-\x89\x27\xe9\x69\xe7\xe8\xc2\x1f\xfa\x7a\x71\xb7\x00\x50\x94\xf0\
-\x36\xe7\x0b\xd8\xb9\xd5\x56\xac\xae\x6e\x74\xdd\xc2\xf0\xd0\xb9\
-\x4c\x0c\xa9\xc3\x3e\xa3\x64\x0e\x9a\x97\x4a\xbc\xa9\x83\xb1\xc9\
-\x6c\x89\x30\x07\x64\x54\x52\xea\x9f\xda\xc1\x35\x44\xf8\x73\xa8\
-\xae\x10\x88\x1b\x6b\xf4\x91\xea\x60\x75\xe5\x6f\x9a\x3f\xd2\xcf\
-\x3b\x81\xa6\x70\x67\xb2\x35\x5b\xe9\x81\x29\x47\x33\xbd\x50\x15\
-\x4d\xec\x27\x50\x74\x96\x12\x43\x56\x6d\x1d\x07\xf5\xc3\x4d\xdf\
-\x7c\x3c\x55\x1a\x6f\xb5\xa4\x70\xa8\x56\x98\x7a\x55\x1d\x7f\x88\
-\x9f\x61\xcd\x0b\x8a\x80\x95\x26\x67\xad\xde\xc4\xe9\xa5\xf5\x46\
-\xcb\xe5\xba\x32\xd0\x28\x9c\x5c\x38\x32\x53\x31\x0c\x54\xd1\x0d\
-\x47\x7e\x35\x43\x5e\xa6\x8b\x5b\xe8\xe4\x3a\xa6\x4b\xa0\xea\xf5\
-\x7a\x9c\x6f\xc3\x30\xfa\xc7\xe4\xac\x13\x19\x5e\x33\xdc\x10\x35\
-\x14\x57\xd0\x74\x89\xb8\x28\xe9\xd1\x28\x61\x8d\x64\xdb\x3b\x70\
-\xc3\x55\x06\xb9\xda\xe0\x4f\xe8\x76\x84\xd6\x1e\x06\x46\x24\x5c\
-\x08\x63\xa9\x56\xc1\xb5\x6a\x86\x71\x5e\xab\x40\x5f\x17\x0a\x0c\
-\x25\xe7\xbf\x95\x44\x3a\x3c\x77\x3d\xd9\x7d\x6a\x3f\x66\xa8\xa9\
-\x69\x7b\x78\x08\x7a\xb3\xd2\x05\x83\x8f\x68\xc9\x3b\x8a\xd8\x78\
-\xfe\x98\x14\x77\xa4\x67\xce\xa3\xff\xe2\x49\x87\xd4\x41\xc5\x11\
-\x2e\x88\x0f\xc7\x44\x37\x95\x67\xc9\xe9\x7d\x64\xd2\x01\xd6\xdc\
-\x90\x2a\x5d\x36\xb5\x57\x1f\xad\x27\x3c\x3e\xe2\xb2\x56\x57\x27\
-\xe6\x62\x8c\xb2\x7e\x9b\xc7\xc6\xe8\xce\xde\xbc\x42\x26\xad\xa8\
-\xc0\xd8\x91\xca\xf4\x83\x69\x27\x94\xa4\xc6\x81\x55\x0c\xa5\x44\
-\x33\x5d\xe9\x25\x54\x9d\x38\x45\x26\xfc\xc6\x1b\x25\xc2\x61\xc2\
-\xf4\x4e\x83\xf3\x34\x8f\xbe\x10\x67\x16\xd4\x81\x4e\x92\x12\x27\
-\x09\xbf\x22\xe6\xaa\xc6\xf6\x91\x9b\x67\xde\x44\xd3\x23\x2d\x52\
-\x29\x08\x07\x6c\x72\x97\x46\xf3\x78\x6c\x4b\x5b\x75\x0f\x03\xfd\
-\xe6\x7a\x68\xe6\x2d\x25\x80\x24\xa4\x4b\x40\x6d\x91\x4b\x1e\xd1\
-\xbb\x44\x86\xbd\x8c\x4d\x62\x44\xcc\xad\x12\x4f\xd5\x86\x13\x0b\
-\xc3\x50\xfa\x38\x7b\x39\x8b\x04\x3e\x14\x79\x59\x13\xea\x14\x43\
-\x5e\xf2\x75\x93\xd2\xa2\xaa\x08\x45\xd3\x28\xa1\xe5\x98\xa8\xa1\
-\xd5\x7b\x81\xc5\x67\xe1\xf4\x4b\x56\xd2\x24\xd3\x0d\x95\xd9\x21\
-\x00\x83\x77\xaa\xcb\xcb\xea\x80\x6d\xf2\xa6\x03\x3d\x14\x81\x90\
-\xfe\x35\xd6\x91\xec\x42\x7b\x8e\xd0\xb7\xf3\x4f\xb6\xe1\x40\xf7\
-\x64\xfb\xd9\x00\x97\x81\xb5\xdc\x56\x3d\xf5\x6c\x6f\x3f\x00\x8c\
-\x67\xf7\x87\xb1\xfb\x54\xdd\xc0\x59\xea\xc9\x07\x21\x9f\x10\xbc\
-\xa6\xb4\xed\xc4\x65\x53\xe0\x24\x79\x14\x06\xd6\x90\x57\x8f\x46\
-\xb8\xe3\x74\xc8\x2b\x6b\xc5\xf9\x2a\xd5\x1a\xed\xb0\x72\x6d\x3a\
-\x69\xa6\x90\x85\xe7\xc0\xa5\x52\x06\x5d\x5a\x49\x3f\x68\xe2\x1f\
-\xdb\x09\x3b\x71\xe9\xd0\xfc\x51\x5d\xc5\xad\x24\x0c\xfe\x8b\x10\
-\xe0\x6f\xe0\x39\xcd\x3c\x06\x80\xe1\xf5\xb2\xee\x8f\xa1\x7d\x29\
-\x28\x37\x25\x3b\x48\x00\x10\xc2\xd0\x43\x13\x2a\x85\x11\xad\x63\
-\xb5\x06\xa7\x8a\xab\x91\xf3\xf8\x2d\xbe\xed\x17\x83\xfe\x85\x15\
-\x47\xf1\x64\xc2\xab\xb4\x59\x56\x0a\x23\xe7\xaf\x4f\x35\xf4\x7e\
-\xfd\xd4\x18\xf2\xaf\x9f\x70\xa0\x9d\x4f\x69\x35\x00\x2d\xf7\x12\
-\x57\x5b\xf3\xad\xfb\x35\xb7\xdf\xdb\x6a\x66\x4d\xf1\x9e\xe8\xfd\
-\x79\x5f\x14\xec\x7b\x3e\x35\xd3\xcb\x97\xbc\x0d\x0d\xe9\xff\x73\
-\x3f\x2c\x3c\x69\x18\xe0\x50\x70\xd0\x60\x37\xda\xde\x15\xe1\x43\
-\xdc\x86\x1b\x31\xc7\x1c\x1a\xeb\x75\x5e\xab\xa6\x45\xe2\x3c\xe8\
-\x22\xed\x92\xac\xe6\x4d\xc4\x73\x8f\xd6\xcb\x30\x5a\xb3\xb5\x97\
-\xcf\x1e\x3e\x41\x5c\x9d\x35\x56\x7e\xf4\xb0\x91\xe8\xed\x7e\x2f\
-\x20\x76\xe6\x78\x74\x32\x63\x59\xcf\x2e\xd4\xba\xb6\x9e\x1c\xa8\
-\x97\xd8\x19\x78\xed\xef\x9e\x0c\xa8\x8e\x25\xfb\x50\xea\x95\x7a\
-\xe7\x97\xe7\x1b\x32\x9d\x6c\x48\xb3\x0b\x6d\x1b\xe4\x9d\x22\xd5\
-\xbe\xaa\x29\xf9\xad\x58\x3a\x22\xda\xbb\x29\x61\xa2\xce\xcc\xdc\
-\x48\xc8\x5c\xb5\x95\x5e\x8f\x2a\xfd\x55\x82\x79\x6a\x40\xb5\x01\
-\x9d\x48\xab\x2f\xf3\x28\x95\x59\x9d\xd5\x36\x86\xee\xed\xf8\xbe\
-\x62\x23\x91\xcc\x4a\xe9\xba\x64\x6e\xec\x1f\x57\x94\x7b\xee\xc3\
-\x18\xf5\x6c\xa0\xbd\x5e\xf6\x68\x82\xb4\x1e\x93\xe8\x86\xd8\x7c\
-\x0a\xa3\x09\xd0\x24\xd4\xed\x06\xe7\xcf\x0f\xec\xe7\xa2\x1e\xe0\
-\x42\xf9\x74\x43\x14\x6c\xbc\xdb\xd7\xfe\xba\x88\x3f\x53\x6e\x80\
-\x96\x3d\x60\x5b\x6f\x73\x74\x83\x6e\xe4\x48\x5e\x3d\x05\x72\x80\
-\xbe\x3d\x00\x77\xa6\x0d\xfe\x0b\xe5\x34\xf4\x65\x30\x84\xed\x74\
-\x8d\x44\x36\xfb\xa7\x0e\x10\xac\xbf\xeb\xea\x4d\x6e\xe8\x08\x2e\
-\xeb\xa1\x29\x65\x60\x53\x87\x8d\xa6\x4c\x50\x0f\x04\x49\xf5\x52\
-\x35\xb7\xb4\xdc\x01\x3b\xf8\xf7\xc1\x40\x77\x5d\x1d\x6e\xe2\x42\
-\xbf\xfc\xaa\x44\x8a\x75\x19\x67\x5e\x85\x8e\x26\xa4\xd1\xda\xca\
-\x6a\x91\xd1\xc1\x10\x0f\xc5\x05\xa8\xb2\x31\x28\x0b\x73\xfd\x3e\
-\x56\x05\x01\x73\xf6\x3d\x8c\x34\x0b\x64\x1d\xb4\x9e\xb8\xf5\x3c\
-\xf2\xe2\x64\x9c\x6d\x3e\x7e\x4b\x07\x56\xca\x55\x2b\x53\x61\x49\
-\x7b\x26\xde\x9e\x63\x4a\xaf\x45\x34\x06\xaa\xcd\xb8\xb6\x29\xd0\
-\x4e\x50\xf9\x2e\x2f\xfb\x1a\x2d\x3e\xdd\x1e\xe2\xd3\x3a\x43\xb8\
-\x8f\xbd\xfe\xbd\x12\x4a\x06\xa6\xac\x39\x0a\xbf\x13\x9c\xef\xb9\
-\x98\xbd\xfa\x45\x56\xe0\xb5\x98\x3d\x7b\xf1\x6d\xf1\x5b\x39\x32\
-\x5a\x7f\xbb\xf0\x17\xf9\x44\x4a\xff\xe7\x7f\x1a\x23\xd9\x4f\x6c\
-\x1b\x8a\xf0\x35\xe3\x31\x59\x9e\xa3\x11\x68\x53\x86\x57\x15\x69\
-\xec\xcc\xb3\x7e\x25\xce\x9b\x8f\x36\x34\x66\xef\x34\xfa\x64\xc8\
-\xea\x64\x5d\xf2\x05\x8e\x76\x58\xdd\x59\x7e\x9b\x5e\xa9\x4b\x91\
-\x49\x5f\x8e\xf7\xf0\x8d\xc3\xd2\xab\x3c\x9e\xd8\xaf\x28\xd5\xce\
-\x3b\x9d\x0f\x48\x55\x97\xf1\xf5\x80\x9c\xc4\x75\xf6\xeb\xef\xab\
-\x17\x18\x81\x37\xf2\xb4\xe3\xb9\xb6\x80\xc7\x86\xbf\x55\xcb\xdc\
-\xd4\x9f\x9e\x5a\x0e\xae\xf1\x2d\xf8\x46\x66\xa5\xf7\x76\x10\xf6\
-\x2b\xd0\x27\x4a\x34\xd7\x58\x7e\x23\x64\xc0\xfb\x0d\xe7\x0e\xf4\
-\x51\xa4\x0d\x1a\x3b\x4d\xb8\x51\x89\x81\xa0\x3a\x42\x21\x55\x36\
-\xef\x75\xf7\x35\x8e\x10\x9a\x2d\x58\xd6\xfa\xfb\x4e\xed\x47\xf0\
-\x73\xbb\x45\x62\x63\xc0\xee\xe4\x2f\x56\xc9\xb6\x2e\x81\x5f\xb6\
-\x06\x55\x81\x90\xc7\x34\x4d\xdb\x46\xc9\x96\x2e\x91\x05\xdf\xdf\
-\x8f\xf8\xa1\x55\xfc\xd5\x06\x35\x7d\xf6\x6c\xf4\xd4\x3b\x28\x2a\
-\xe9\x35\xa8\xd7\x3c\x82\x19\xec\x72\xc3\x6d\xb3\x51\x74\xbb\xc7\
-\xb7\xa4\xc1\xf5\x1e\x6c\x2a\x9c\xd0\xfc\x4a\x37\x74\x0f\x69\xc6\
-\xe9\xf5\x82\x95\x17\x43\xa6\x3d\x1f\xcc\xaf\xaa\x12\xdd\x8e\x90\
-\x17\x99\x75\x94\x0b\x0e\x66\x58\x5d\x84\xcb\xe8\xf5\x41\x77\xbd\
-\x46\x58\x64\x8f\x3c\x09\x3d\x10\xf0\x82\xf3\x6d\x37\x5e\x28\xd6\
-\xd5\x7f\xc7\x40\xec\x9a\xa1\xa1\xb4\xe6\x72\xe8\x85\x85\x1f\x62\
-\xfb\x70\x3e\x89\x59\x76\x73\x9e\xe5\xc5\xb1\xd6\xf4\xaa\xa0\xbd\
-\xb6\x2e\x40\x5e\x9e\xe3\x9b\xa3\x2a\x6b\xb5\xd4\x5e\xec\x47\x50\
-\x2d\x85\x40\xc8\x47\x5f\x1b\x1e\x85\x95\x7a\xf6\xac\x9d\xfd\x1b\
-\x6f\x75\x6b\x1e\x9e\xd2\x4f\x8b\x51\x67\x67\x97\xef\xd9\x2e\xe4\
-\xf6\xbd\xb5\xf5\x66\x95\x89\xdf\xac\x3c\x01\xcb\x94\xae\xfb\x70\
-\x3c\x33\xc2\x08\x0f\x2d\xe3\x24\x1e\x7f\xa1\xbb\x33\x12\xf4\x3e\
-\x54\x8d\xf3\x47\x3f\x96\x59\xa2\xbe\x66\x9c\x8e\x26\xb5\xc5\xd5\
-\xbb\xb6\x0b\x7e\x39\x1b\x5d\x3f\x7e\x5a\xf1\xf1\x1f\xc9\x6e\xff\
-\xff\xa4\xd9\xef\x35\xbd\x9e\x27\xa4\x20\x41\xe9\x82\xc8\x38\xc8\
-\x90\x15\x50\x18\x17\x15\x1d\x95\x5d\x0b\xc9\x6c\x2c\xf8\xa1\x7a\
-\x5d\xed\xd2\x8e\x67\xbd\xac\xbd\x38\xed\xce\x88\x94\x20\x31\xf9\
-\x19\x64\x98\x66\x9b\x5e\xb3\x6b\xf6\x6a\xc2\x3b\x47\x77\x16\x02\
-\x29\x83\x2d\x28\x8f\xcc\xbb\xd2\xda\xfc\x89\x8f\xad\xd5\xcc\x9f\
-\x68\xe6\xac\x11\xbf\xed\xb8\xd8\x88\xc8\xf5\xcb\xaa\x36\xbe\x5f\
-\xe1\x45\xb0\x3f\x83\x25\x56\xa6\x82\x39\x51\x30\xf9\xeb\xcb\x2c\
-\x4f\x79\xae\x4f\x67\xf7\x54\x61\x9c\xec\x40\x6d\x19\xa0\x1f\x3a\
-\x55\x92\xe3\x82\x76\x92\xd9\x0f\x3d\x99\x60\xfe\xf0\xb0\x5b\x85\
-\xa8\x7f\x4c\x4b\x10\x73\xa5\x3b\x8f\xf0\x29\x8f\x0e\xd3\xcb\xbe\
-\x9e\xda\x92\xec\x5d\x82\x73\xa3\xfe\x5b\x53\xcf\x3a\x13\xa1\xde\
-\x86\x90\x13\xb6\xe5\xa6\x1b\xb0\x20\xbb\x61\x6e\x76\x81\xf7\x89\
-\xbf\x8e\x9c\xb7\xca\xc9\x71\x91\xc4\x45\x51\xb9\x6c\xfa\xe8\x6b\
-\xb5\x76\x9d\x6e\xad\x13\xcf\x1a\xad\x2b\x6f\x35\xfb\x2d\x73\xeb\
-\x64\x60\xbd\x64\xee\xc9\x99\xa4\xdf\x17\x70\x42\xe5\xd1\x8d\x5c\
-\x44\x45\x2c\xf0\xa5\xc8\x2c\xbf\x33\x79\x87\x24\xb2\x42\x5e\x14\
-\x29\x00\x53\x76\x97\x95\x55\x78\x84\x3c\xb8\x4a\x23\x62\xca\xaf\
-\x22\x3c\x90\x52\xdc\x42\xa2\xf7\x35\x15\x4d\x2f\x9b\x13\xc2\x62\
-\x40\x30\xb0\x5b\xf4\x05\x12\x77\xf3\x39\x2f\x72\x54\x1e\xd8\xb8\
-\xcc\x61\xd7\x90\x3b\xe3\x22\xcf\x26\x25\xfa\xda\x45\xea\x2d\xad\
-\x32\xc5\x97\xad\xa3\xa4\x8a\xdd\x36\xf6\xc8\x77\x79\x76\x85\x9c\
-\x8c\x49\x8c\x5c\x7f\x52\xbb\xa4\xc5\x95\xd4\x88\x10\x8f\x43\x29\
-\xce\xd6\xf3\xde\x1e\xd0\x3e\xab\x99\xc5\x79\x7e\x4c\x3d\x1e\xd1\
-\xee\x7b\x50\x6a\xa6\xf7\xbd\x47\x25\xdf\x23\xb8\x95\x69\x2d\xf8\
-\xe6\x94\x5b\x18\x7a\x49\x45\x7d\xaf\xd8\xbe\x51\x64\xee\x6a\x77\
-\x02\xe3\x0c\x7b\x70\xfb\x1f\xbd\xf2\x8f\x52\x62\x50\x1b\x8a\x79\
-\xe4\xa4\x39\x4a\xfb\xa1\x92\xc6\x30\xcd\xa3\x1e\x81\xc1\xb4\x52\
-\xc0\x79\x39\xda\x1e\x28\x9c\x2f\xca\xf4\x4b\x0b\x07\xaa\x0a\x7d\
-\x18\xd1\x23\x73\x35\x23\xf6\x89\xa4\xb7\xf7\xd5\x73\xf2\x02\x3c\
-\xc8\x79\x34\x70\xfe\xb2\xfc\xde\xab\x6f\x81\x0d\x27\xf8\xee\xcd\
-\xf1\xcb\xd3\x93\xf3\x9a\x3b\x35\x4a\x99\x51\x19\x27\xc5\x1a\x6a\
-\xce\x74\x8f\x8c\x1e\x61\x74\x1d\x0c\x3b\x4e\x51\xdc\xc1\x88\x27\
-\x46\xd9\xbe\x13\x18\x3d\x43\xa1\x4c\x12\x00\x79\xae\x55\xba\xa3\
-\x8c\xbc\x02\x55\x4f\x3a\xa7\x82\x90\xa0\xcf\xa0\xdd\xad\xb3\x57\
-\x18\x88\x75\x1b\xcd\x17\x09\xc9\x1d\xae\x65\x05\xa9\x8d\x2a\x31\
-\x16\x41\x1e\x48\x43\x5c\xc4\x12\xba\xfc\x46\x17\x46\xf2\x88\x3b\
-\xfd\x72\xa9\x1d\xbc\xa1\x5b\x98\xa9\x3b\xae\x92\xbe\xe1\x75\x35\
-\xf9\xf0\xa5\x68\x21\x47\x05\xb0\xba\x46\x51\x03\x95\xf7\x20\x72\
-\x53\xc5\xa7\x7a\xc9\x47\x0e\xa4\x94\xf4\x47\x42\x13\x3b\x13\x45\
-\x84\x2f\x20\x4d\x8c\xc3\x27\x5e\xcb\x58\xdf\x8d\x60\x44\x5f\xd7\
-\x01\xe8\x62\xf8\x04\xb1\x60\xef\xdf\x02\xcb\x80\x76\x47\x0f\x13\
-\x53\x5a\x87\xd7\xda\xb3\x9a\x9c\x77\x8d\x47\xaf\x76\x1f\x7c\xa4\
-\x9e\x71\x53\xbd\x49\xaa\x63\x88\xda\x8d\x11\xdf\x8f\xaa\xcc\x72\
-\x56\x9e\x0c\x59\x13\x4f\x1b\x0c\x37\xad\x04\xd3\xda\xa5\xf2\x66\
-\x28\x46\xb2\xa2\x73\xa6\xe5\xfb\xfb\x5e\xbd\x6b\x9c\x92\xac\x07\
-\xc4\x41\xcd\xbe\x41\x7f\xc5\x2c\x6f\xb8\xcb\x42\xdd\x54\xb9\xbe\
-\x3a\x8d\xa6\xb8\x3d\x48\x6a\x0a\x1d\xe5\x46\xcc\x91\xc6\x63\x25\
-\xd5\x25\x80\xb7\x1c\x6a\x31\x73\xfc\x47\xc7\xbf\x12\xe3\xf0\x81\
-\x86\xea\x69\x67\x43\x38\xf5\x78\x33\x70\x06\xe5\x13\x91\x64\xa8\
-\x5d\x58\x99\x89\x32\xfc\x2d\x91\x90\x53\x33\xca\x6e\x95\xf5\x5f\
-\xac\xe1\xe9\x85\x92\x6a\x88\x21\x79\x46\xfe\x88\xdc\x5e\x35\x58\
-\x03\x76\x1e\x73\x4f\xbe\x13\x59\xfc\x59\x16\xdb\x4a\xb8\x6e\xe7\
-\x4f\xaf\xa2\x9b\xd5\x5f\x91\x51\xad\xb2\x2f\xc1\x26\xd9\x17\x5f\
-\xfd\x05\x4f\xc3\x2d\xac\x60\x54\xab\x0d\xb0\x04\x2f\x82\x8d\xa8\
-\xd4\xd3\x4a\x68\x3a\xf9\x1a\x61\x61\xf0\xf0\x0d\x9a\xb0\x28\x17\
-\x0b\x38\xe9\xb0\x3b\xf5\x54\xa1\x62\x65\x5c\xb9\xd8\x34\x92\x6f\
-\x04\xaa\xfa\x56\x87\x50\xd0\xda\x27\x36\xb4\xba\x35\xc7\x33\x05\
-\xe2\x8e\x8b\xe5\xc8\x39\xe3\xc9\x22\xd8\x02\x0b\x3d\x6d\xd2\x2c\
-\xd8\x22\xcd\x3c\xf5\x49\x68\x2c\x87\xd6\x24\x16\x63\xe0\xf1\x60\
-\x23\x55\x5e\x4f\x68\x71\xce\xd5\xe3\xe8\x76\xe2\x4c\xba\x0b\x56\
-\x4b\x4a\x36\x77\x52\xa9\x34\x04\xdd\xfb\x77\xa5\x98\x55\xce\x95\
-\x95\xb0\xb2\x4b\xbc\xb9\xe7\xb6\x2c\x6f\x2f\x3b\xd1\x5e\x4b\x86\
-\x4f\xbc\xe9\x96\x78\x62\x56\xb7\x42\x4a\x76\x85\xac\xce\x40\x54\
-\x3d\xd2\x2e\x23\x35\xd0\x12\xa7\x44\x2b\x6c\x0a\xa8\xb0\x6a\x4d\
-\x14\xa5\x92\x71\x3a\xbe\x8c\xc5\x85\x82\x40\x66\x85\x4b\x5c\xec\
-\xd5\xdb\x78\xd2\x7b\xf9\x53\x55\xc9\xf6\xea\x0b\x16\xa2\xa4\x0d\
-\x6f\xec\x81\x94\x75\xad\x83\xd5\xf9\x48\xe5\x8d\x52\xc4\x64\x16\
-\xd5\x6b\x9e\xb0\x69\x8e\xd6\xd3\x0c\xdd\x14\xa5\x28\x5e\x67\x5a\
-\xcc\xd7\xc9\xd1\x49\x89\x8f\x04\xa0\x4e\x07\xf4\x18\xf8\x16\x84\
-\xb6\xf1\xdc\xe2\x55\xba\x34\x85\x97\x54\xeb\x65\x12\xb4\xad\xb5\
-\x3d\x65\xa6\xd5\x44\x7c\x85\x28\x7e\xd2\xe0\x6d\x0a\xca\x12\x1a\
-\xc2\x39\xe6\x10\xfb\xb5\x51\xab\xa9\x88\x2c\x6e\x03\x89\x7e\xa5\
-\xae\xe3\xef\xec\x93\xa4\x0d\x15\x1a\x97\xc7\xee\xde\x1b\xcd\x1a\
-\xe8\x6c\x2d\x6e\xfd\x87\x38\x57\x21\xdb\xb1\x52\x0f\xf5\xc1\x70\
-\x7b\x35\x0c\xb7\x3d\x18\x6e\x7f\x1d\x0c\x77\x56\xc3\x70\xc7\x83\
-\xe1\xce\xd7\xc1\x70\x77\x35\x0c\x77\x3d\x18\xee\x7e\x1d\x0c\xf7\
-\x56\xc3\x70\xcf\x83\xe1\xde\x92\x18\xfe\x5f\x33\xde\x13\x41\
-\x00\x00\x02\x1b\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x38\x22\x20\
-\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x3e\x0d\x0a\x20\x20\
-\x3c\x67\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x66\
-\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\
-\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x67\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x74\x72\x61\x6e\x73\x66\
-\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x2d\
-\x38\x34\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x2d\x34\x35\x2e\x30\
-\x30\x30\x30\x30\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\
-\x61\x6e\x73\x6c\x61\x74\x65\x28\x38\x34\x2e\x30\x30\x30\x30\x30\
-\x30\x2c\x20\x34\x35\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0d\
-\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\
-\x3d\x22\x4d\x32\x32\x2c\x30\x20\x4c\x37\x2c\x30\x20\x43\x36\x2e\
-\x33\x2c\x30\x20\x35\x2e\x38\x2c\x30\x2e\x33\x20\x35\x2e\x34\x2c\
-\x30\x2e\x39\x20\x4c\x30\x2c\x39\x20\x4c\x35\x2e\x34\x2c\x31\x37\
-\x2e\x31\x20\x43\x35\x2e\x38\x2c\x31\x37\x2e\x36\x20\x36\x2e\x33\
-\x2c\x31\x38\x20\x37\x2c\x31\x38\x20\x4c\x32\x32\x2c\x31\x38\x20\
-\x43\x32\x33\x2e\x31\x2c\x31\x38\x20\x32\x34\x2c\x31\x37\x2e\x31\
-\x20\x32\x34\x2c\x31\x36\x20\x4c\x32\x34\x2c\x32\x20\x43\x32\x34\
-\x2c\x30\x2e\x39\x20\x32\x33\x2e\x31\x2c\x30\x20\x32\x32\x2c\x30\
-\x20\x4c\x32\x32\x2c\x30\x20\x5a\x20\x4d\x31\x39\x2c\x31\x32\x2e\
-\x36\x20\x4c\x31\x37\x2e\x36\x2c\x31\x34\x20\x4c\x31\x34\x2c\x31\
-\x30\x2e\x34\x20\x4c\x31\x30\x2e\x34\x2c\x31\x34\x20\x4c\x39\x2c\
-\x31\x32\x2e\x36\x20\x4c\x31\x32\x2e\x36\x2c\x39\x20\x4c\x39\x2c\
-\x35\x2e\x34\x20\x4c\x31\x30\x2e\x34\x2c\x34\x20\x4c\x31\x34\x2c\
-\x37\x2e\x36\x20\x4c\x31\x37\x2e\x36\x2c\x34\x20\x4c\x31\x39\x2c\
-\x35\x2e\x34\x20\x4c\x31\x35\x2e\x34\x2c\x39\x20\x4c\x31\x39\x2c\
-\x31\x32\x2e\x36\x20\x4c\x31\x39\x2c\x31\x32\x2e\x36\x20\x5a\x22\
-\x2f\x3e\x0d\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\
-\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x00\x5c\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\
-\x66\x66\x30\x66\x31\x22\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x30\
-\x2c\x31\x38\x20\x32\x34\x2c\x31\x38\x20\x31\x32\x2c\x36\x22\x2f\
-\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x02\x11\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x31\x30\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x35\x2e\x30\x38\x32\x33\x30\
-\x32\x38\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x2d\x33\x2e\
-\x33\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\
-\x20\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\
-\x35\x34\x30\x38\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\
-\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x2d\x30\x2e\
-\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x33\x20\x2d\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\
-\x20\x2d\x33\x2e\x35\x39\x37\x33\x31\x30\x31\x37\x2c\x2d\x33\x2e\
-\x35\x39\x36\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\
-\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x31\x2c\x2d\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x31\x39\x31\x2c\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\
-\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\x38\x20\x4c\x20\x34\
-\x2e\x35\x31\x32\x35\x38\x36\x36\x2c\x30\x2e\x36\x31\x38\x32\x38\
-\x34\x33\x37\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x34\x31\x33\x34\
-\x33\x34\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x30\
-\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x30\x2e\x31\x35\x36\
-\x32\x38\x31\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x30\
-\x2e\x31\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\
-\x32\x34\x33\x20\x2d\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\
-\x37\x31\x31\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x33\x64\x61\x65\x65\x39\x22\x20\x66\x69\x6c\x6c\x2d\x6f\
-\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0d\x0a\
-\x20\x20\x3c\x2f\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-\
-\x00\x00\x00\xf4\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x35\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x33\x32\x2e\x35\x22\
-\x20\x63\x79\x3d\x22\x33\x30\x22\x20\x72\x3d\x22\x32\x35\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\
-\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\x72\
-\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x35\x22\x20\x2f\x3e\
-\x0d\x0a\x20\x20\x3c\x72\x65\x63\x74\x20\x77\x69\x64\x74\x68\x3d\
-\x22\x35\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\x22\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x78\x3d\
-\x22\x33\x30\x22\x20\x79\x3d\x22\x31\x35\x22\x2f\x3e\x0d\x0a\x20\
-\x20\x3c\x72\x65\x63\x74\x20\x77\x69\x64\x74\x68\x3d\x22\x35\x22\
-\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x30\x22\x20\x66\x69\x6c\
-\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x78\x3d\x22\x33\
-\x30\x22\x20\x79\x3d\x22\x32\x35\x22\x2f\x3e\x0d\x0a\x3c\x2f\x73\
-\x76\x67\x3e\
-\x00\x00\x01\x98\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\
-\x20\x78\x3d\x22\x32\x22\x20\x79\x3d\x22\x32\x22\x20\x77\x69\x64\
-\x74\x68\x3d\x22\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x38\
-\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x65\x66\x66\x30\x66\
-\x31\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\
-\x22\x31\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x72\x65\x63\x74\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x78\x3d\
-\x22\x32\x22\x20\x79\x3d\x22\x31\x34\x22\x20\x77\x69\x64\x74\x68\
-\x3d\x22\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x38\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\
-\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x78\x3d\x22\x31\
-\x34\x22\x20\x79\x3d\x22\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
-\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x38\x22\x20\x73\x74\
-\x72\x6f\x6b\x65\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x73\
-\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x22\x2f\
-\x3e\x0d\x0a\x20\x20\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\
-\x22\x6e\x6f\x6e\x65\x22\x20\x78\x3d\x22\x31\x34\x22\x20\x79\x3d\
-\x22\x31\x34\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x38\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x38\x22\x20\x73\x74\x72\x6f\x6b\x65\
-\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x73\x74\x72\x6f\x6b\
-\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x22\x2f\x3e\x0d\x0a\x3c\
-\x2f\x73\x76\x67\x3e\x0d\x0a\
-\x00\x00\x04\x7d\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x3e\x0d\x0a\x20\x20\x3c\
-\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\
-\x20\x78\x3d\x22\x34\x2e\x35\x22\x20\x79\x3d\x22\x32\x22\x20\x77\
-\x69\x64\x74\x68\x3d\x22\x31\x35\x22\x20\x68\x65\x69\x67\x68\x74\
-\x3d\x22\x32\x30\x22\x20\x72\x78\x3d\x22\x31\x22\x20\x72\x79\x3d\
-\x22\x31\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x65\x66\x66\
-\x30\x66\x31\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\
-\x68\x3d\x22\x31\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x67\x20\x74\x72\
-\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\x65\x28\x30\
-\x2e\x36\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x38\x2c\
-\x20\x38\x29\x22\x3e\x0d\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\
-\x64\x3d\x22\x4d\x31\x36\x2e\x33\x36\x2c\x31\x34\x43\x31\x36\x2e\
-\x34\x34\x2c\x31\x33\x2e\x33\x34\x20\x31\x36\x2e\x35\x2c\x31\x32\
-\x2e\x36\x38\x20\x31\x36\x2e\x35\x2c\x31\x32\x43\x31\x36\x2e\x35\
-\x2c\x31\x31\x2e\x33\x32\x20\x31\x36\x2e\x34\x34\x2c\x31\x30\x2e\
-\x36\x36\x20\x31\x36\x2e\x33\x36\x2c\x31\x30\x48\x31\x39\x2e\x37\
-\x34\x43\x31\x39\x2e\x39\x2c\x31\x30\x2e\x36\x34\x20\x32\x30\x2c\
-\x31\x31\x2e\x33\x31\x20\x32\x30\x2c\x31\x32\x43\x32\x30\x2c\x31\
-\x32\x2e\x36\x39\x20\x31\x39\x2e\x39\x2c\x31\x33\x2e\x33\x36\x20\
-\x31\x39\x2e\x37\x34\x2c\x31\x34\x4d\x31\x34\x2e\x35\x39\x2c\x31\
-\x39\x2e\x35\x36\x43\x31\x35\x2e\x31\x39\x2c\x31\x38\x2e\x34\x35\
-\x20\x31\x35\x2e\x36\x35\x2c\x31\x37\x2e\x32\x35\x20\x31\x35\x2e\
-\x39\x37\x2c\x31\x36\x48\x31\x38\x2e\x39\x32\x43\x31\x37\x2e\x39\
-\x36\x2c\x31\x37\x2e\x36\x35\x20\x31\x36\x2e\x34\x33\x2c\x31\x38\
-\x2e\x39\x33\x20\x31\x34\x2e\x35\x39\x2c\x31\x39\x2e\x35\x36\x4d\
-\x31\x34\x2e\x33\x34\x2c\x31\x34\x48\x39\x2e\x36\x36\x43\x39\x2e\
-\x35\x36\x2c\x31\x33\x2e\x33\x34\x20\x39\x2e\x35\x2c\x31\x32\x2e\
-\x36\x38\x20\x39\x2e\x35\x2c\x31\x32\x43\x39\x2e\x35\x2c\x31\x31\
-\x2e\x33\x32\x20\x39\x2e\x35\x36\x2c\x31\x30\x2e\x36\x35\x20\x39\
-\x2e\x36\x36\x2c\x31\x30\x48\x31\x34\x2e\x33\x34\x43\x31\x34\x2e\
-\x34\x33\x2c\x31\x30\x2e\x36\x35\x20\x31\x34\x2e\x35\x2c\x31\x31\
-\x2e\x33\x32\x20\x31\x34\x2e\x35\x2c\x31\x32\x43\x31\x34\x2e\x35\
-\x2c\x31\x32\x2e\x36\x38\x20\x31\x34\x2e\x34\x33\x2c\x31\x33\x2e\
-\x33\x34\x20\x31\x34\x2e\x33\x34\x2c\x31\x34\x4d\x31\x32\x2c\x31\
-\x39\x2e\x39\x36\x43\x31\x31\x2e\x31\x37\x2c\x31\x38\x2e\x37\x36\
-\x20\x31\x30\x2e\x35\x2c\x31\x37\x2e\x34\x33\x20\x31\x30\x2e\x30\
-\x39\x2c\x31\x36\x48\x31\x33\x2e\x39\x31\x43\x31\x33\x2e\x35\x2c\
-\x31\x37\x2e\x34\x33\x20\x31\x32\x2e\x38\x33\x2c\x31\x38\x2e\x37\
-\x36\x20\x31\x32\x2c\x31\x39\x2e\x39\x36\x4d\x38\x2c\x38\x48\x35\
-\x2e\x30\x38\x43\x36\x2e\x30\x33\x2c\x36\x2e\x33\x34\x20\x37\x2e\
-\x35\x37\x2c\x35\x2e\x30\x36\x20\x39\x2e\x34\x2c\x34\x2e\x34\x34\
-\x43\x38\x2e\x38\x2c\x35\x2e\x35\x35\x20\x38\x2e\x33\x35\x2c\x36\
-\x2e\x37\x35\x20\x38\x2c\x38\x4d\x35\x2e\x30\x38\x2c\x31\x36\x48\
-\x38\x43\x38\x2e\x33\x35\x2c\x31\x37\x2e\x32\x35\x20\x38\x2e\x38\
-\x2c\x31\x38\x2e\x34\x35\x20\x39\x2e\x34\x2c\x31\x39\x2e\x35\x36\
-\x43\x37\x2e\x35\x37\x2c\x31\x38\x2e\x39\x33\x20\x36\x2e\x30\x33\
-\x2c\x31\x37\x2e\x36\x35\x20\x35\x2e\x30\x38\x2c\x31\x36\x4d\x34\
-\x2e\x32\x36\x2c\x31\x34\x43\x34\x2e\x31\x2c\x31\x33\x2e\x33\x36\
-\x20\x34\x2c\x31\x32\x2e\x36\x39\x20\x34\x2c\x31\x32\x43\x34\x2c\
-\x31\x31\x2e\x33\x31\x20\x34\x2e\x31\x2c\x31\x30\x2e\x36\x34\x20\
-\x34\x2e\x32\x36\x2c\x31\x30\x48\x37\x2e\x36\x34\x43\x37\x2e\x35\
-\x36\x2c\x31\x30\x2e\x36\x36\x20\x37\x2e\x35\x2c\x31\x31\x2e\x33\
-\x32\x20\x37\x2e\x35\x2c\x31\x32\x43\x37\x2e\x35\x2c\x31\x32\x2e\
-\x36\x38\x20\x37\x2e\x35\x36\x2c\x31\x33\x2e\x33\x34\x20\x37\x2e\
-\x36\x34\x2c\x31\x34\x4d\x31\x32\x2c\x34\x2e\x30\x33\x43\x31\x32\
-\x2e\x38\x33\x2c\x35\x2e\x32\x33\x20\x31\x33\x2e\x35\x2c\x36\x2e\
-\x35\x37\x20\x31\x33\x2e\x39\x31\x2c\x38\x48\x31\x30\x2e\x30\x39\
-\x43\x31\x30\x2e\x35\x2c\x36\x2e\x35\x37\x20\x31\x31\x2e\x31\x37\
-\x2c\x35\x2e\x32\x33\x20\x31\x32\x2c\x34\x2e\x30\x33\x4d\x31\x38\
-\x2e\x39\x32\x2c\x38\x48\x31\x35\x2e\x39\x37\x43\x31\x35\x2e\x36\
-\x35\x2c\x36\x2e\x37\x35\x20\x31\x35\x2e\x31\x39\x2c\x35\x2e\x35\
-\x35\x20\x31\x34\x2e\x35\x39\x2c\x34\x2e\x34\x34\x43\x31\x36\x2e\
-\x34\x33\x2c\x35\x2e\x30\x37\x20\x31\x37\x2e\x39\x36\x2c\x36\x2e\
-\x33\x34\x20\x31\x38\x2e\x39\x32\x2c\x38\x4d\x31\x32\x2c\x32\x43\
-\x36\x2e\x34\x37\x2c\x32\x20\x32\x2c\x36\x2e\x35\x20\x32\x2c\x31\
-\x32\x41\x31\x30\x2c\x31\x30\x20\x30\x20\x30\x2c\x30\x20\x31\x32\
-\x2c\x32\x32\x41\x31\x30\x2c\x31\x30\x20\x30\x20\x30\x2c\x30\x20\
-\x32\x32\x2c\x31\x32\x41\x31\x30\x2c\x31\x30\x20\x30\x20\x30\x2c\
-\x30\x20\x31\x32\x2c\x32\x5a\x22\x2f\x3e\x0d\x0a\x20\x20\x3c\x2f\
-\x67\x3e\x0d\x0a\x3c\x2f\x73\x76\x67\x3e\x0d\x0a\
-"
-
-qt_resource_name = b"\
-\x00\x04\
-\x00\x06\xa8\x8b\
-\x00\x64\
-\x00\x61\x00\x72\x00\x6b\
-\x00\x05\
-\x00\x72\xfd\xf4\
-\x00\x6c\
-\x00\x69\x00\x67\x00\x68\x00\x74\
-\x00\x17\
-\x0c\xab\x5c\x87\
-\x00\x64\
-\x00\x6f\x00\x77\x00\x6e\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x5f\x00\x64\x00\x69\x00\x73\x00\x61\x00\x62\x00\x6c\
-\x00\x65\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x17\
-\x0c\x65\xc3\x87\
-\x00\x6c\
-\x00\x65\x00\x66\x00\x74\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x5f\x00\x64\x00\x69\x00\x73\x00\x61\x00\x62\x00\x6c\
-\x00\x65\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x10\
-\x00\x55\x6f\x87\
-\x00\x77\
-\x00\x69\x00\x6e\x00\x64\x00\x6f\x00\x77\x00\x5f\x00\x63\x00\x6c\x00\x6f\x00\x73\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0f\
-\x0c\x59\x5a\xe7\
-\x00\x64\
-\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x68\x00\x65\x00\x6c\x00\x70\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x09\
-\x06\x98\x8e\xa7\
-\x00\x63\
-\x00\x6c\x00\x6f\x00\x73\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x18\
-\x02\x20\x5d\xe7\
-\x00\x75\
-\x00\x6e\x00\x64\x00\x6f\x00\x63\x00\x6b\x00\x5f\x00\x68\x00\x6f\x00\x76\x00\x65\x00\x72\x00\x5f\x00\x70\x00\x72\x00\x65\x00\x73\
-\x00\x73\x00\x65\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0e\
-\x0d\x4e\x7c\x07\
-\x00\x62\
-\x00\x72\x00\x61\x00\x6e\x00\x63\x00\x68\x00\x5f\x00\x65\x00\x6e\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x1c\
-\x01\xe0\x47\x87\
-\x00\x72\
-\x00\x61\x00\x64\x00\x69\x00\x6f\x00\x5f\x00\x75\x00\x6e\x00\x63\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x65\x00\x64\x00\x5f\x00\x64\
-\x00\x69\x00\x73\x00\x61\x00\x62\x00\x6c\x00\x65\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x18\
-\x03\x8e\xd3\xe7\
-\x00\x72\
-\x00\x69\x00\x67\x00\x68\x00\x74\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x5f\x00\x64\x00\x69\x00\x73\x00\x61\x00\x62\
-\x00\x6c\x00\x65\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0f\
-\x04\x18\x9b\x87\
-\x00\x66\
-\x00\x6f\x00\x6c\x00\x64\x00\x65\x00\x72\x00\x5f\x00\x6f\x00\x70\x00\x65\x00\x6e\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x10\
-\x01\x08\xc7\x27\
-\x00\x68\
-\x00\x6d\x00\x6f\x00\x76\x00\x65\x00\x74\x00\x6f\x00\x6f\x00\x6c\x00\x62\x00\x61\x00\x72\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0c\
-\x07\x89\xd5\x47\
-\x00\x63\
-\x00\x6f\x00\x6d\x00\x70\x00\x75\x00\x74\x00\x65\x00\x72\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x1a\
-\x0e\xbc\xce\xe7\
-\x00\x72\
-\x00\x61\x00\x64\x00\x69\x00\x6f\x00\x5f\x00\x63\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x65\x00\x64\x00\x5f\x00\x64\x00\x69\x00\x73\
-\x00\x61\x00\x62\x00\x6c\x00\x65\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x10\
-\x0e\x25\xa0\x67\
-\x00\x66\
-\x00\x6c\x00\x6f\x00\x70\x00\x70\x00\x79\x00\x5f\x00\x64\x00\x72\x00\x69\x00\x76\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0f\
-\x0c\xe2\x65\xe7\
-\x00\x74\
-\x00\x72\x00\x61\x00\x6e\x00\x73\x00\x70\x00\x61\x00\x72\x00\x65\x00\x6e\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0d\
-\x06\x4b\x37\x27\
-\x00\x66\
-\x00\x69\x00\x6c\x00\x65\x00\x5f\x00\x6c\x00\x69\x00\x6e\x00\x6b\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x17\
-\x0b\x6b\x2b\xe7\
-\x00\x62\
-\x00\x72\x00\x61\x00\x6e\x00\x63\x00\x68\x00\x5f\x00\x63\x00\x6c\x00\x6f\x00\x73\x00\x65\x00\x64\x00\x5f\x00\x68\x00\x6f\x00\x76\
-\x00\x65\x00\x72\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x13\
-\x08\xc8\x9b\x67\
-\x00\x72\
-\x00\x61\x00\x64\x00\x69\x00\x6f\x00\x5f\x00\x75\x00\x6e\x00\x63\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x65\x00\x64\x00\x2e\x00\x73\
-\x00\x76\x00\x67\
-\x00\x18\
-\x04\x8f\x98\xa7\
-\x00\x66\
-\x00\x69\x00\x6c\x00\x65\x00\x5f\x00\x64\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x64\x00\x65\x00\x74\x00\x61\x00\x69\
-\x00\x6c\x00\x65\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x10\
-\x07\x98\xf6\xc7\
-\x00\x75\
-\x00\x6e\x00\x64\x00\x6f\x00\x63\x00\x6b\x00\x5f\x00\x68\x00\x6f\x00\x76\x00\x65\x00\x72\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0d\
-\x03\xae\x30\xc7\
-\x00\x64\
-\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x6f\x00\x6b\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x1f\
-\x0a\xae\x2a\xc7\
-\x00\x63\
-\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x62\x00\x6f\x00\x78\x00\x5f\x00\x75\x00\x6e\x00\x63\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x65\
-\x00\x64\x00\x5f\x00\x64\x00\x69\x00\x73\x00\x61\x00\x62\x00\x6c\x00\x65\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x09\
-\x00\x48\xa0\xa7\
-\x00\x76\
-\x00\x6c\x00\x69\x00\x6e\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x08\
-\x0c\x33\x57\x07\
-\x00\x68\
-\x00\x65\x00\x6c\x00\x70\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x08\
-\x00\x28\x57\x67\
-\x00\x66\
-\x00\x69\x00\x6c\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0c\
-\x06\x41\x4d\x07\
-\x00\x73\
-\x00\x69\x00\x7a\x00\x65\x00\x67\x00\x72\x00\x69\x00\x70\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0b\
-\x0b\xb6\xce\x87\
-\x00\x64\
-\x00\x65\x00\x73\x00\x6b\x00\x74\x00\x6f\x00\x70\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0f\
-\x06\x16\x28\x67\
-\x00\x62\
-\x00\x72\x00\x61\x00\x6e\x00\x63\x00\x68\x00\x5f\x00\x6d\x00\x6f\x00\x72\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x12\
-\x0b\x55\xc2\xe7\
-\x00\x68\
-\x00\x6f\x00\x6d\x00\x65\x00\x5f\x00\x64\x00\x69\x00\x72\x00\x65\x00\x63\x00\x74\x00\x6f\x00\x72\x00\x79\x00\x2e\x00\x73\x00\x76\
-\x00\x67\
-\x00\x14\
-\x03\xf0\xa6\x47\
-\x00\x62\
-\x00\x72\x00\x61\x00\x6e\x00\x63\x00\x68\x00\x5f\x00\x65\x00\x6e\x00\x64\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x2e\
-\x00\x73\x00\x76\x00\x67\
-\x00\x0e\
-\x04\xa2\xf1\x27\
-\x00\x64\
-\x00\x6f\x00\x77\x00\x6e\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0e\
-\x0e\xde\xf7\x47\
-\x00\x6c\
-\x00\x65\x00\x66\x00\x74\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x09\
-\x08\x9b\xad\xc7\
-\x00\x74\
-\x00\x72\x00\x61\x00\x73\x00\x68\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0a\
-\x0a\xc8\xf6\x87\
-\x00\x66\
-\x00\x6f\x00\x6c\x00\x64\x00\x65\x00\x72\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x14\
-\x07\xec\xdc\x47\
-\x00\x63\
-\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x62\x00\x6f\x00\x78\x00\x5f\x00\x63\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x65\x00\x64\x00\x2e\
-\x00\x73\x00\x76\x00\x67\
-\x00\x11\
-\x03\xbf\x8a\x87\
-\x00\x64\
-\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x63\x00\x61\x00\x6e\x00\x63\x00\x65\x00\x6c\x00\x2e\x00\x73\x00\x76\x00\x67\
-\
-\x00\x0c\
-\x0f\x79\xba\x47\
-\x00\x6d\
-\x00\x61\x00\x78\x00\x69\x00\x6d\x00\x69\x00\x7a\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x10\
-\x0f\x67\x35\x47\
-\x00\x64\
-\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x72\x00\x65\x00\x73\x00\x65\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x11\
-\x0b\xda\x3d\x27\
-\x00\x62\
-\x00\x72\x00\x61\x00\x6e\x00\x63\x00\x68\x00\x5f\x00\x63\x00\x6c\x00\x6f\x00\x73\x00\x65\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\
-\x00\x15\
-\x00\x61\x01\xc7\
-\x00\x62\
-\x00\x72\x00\x61\x00\x6e\x00\x63\x00\x68\x00\x5f\x00\x6f\x00\x70\x00\x65\x00\x6e\x00\x5f\x00\x68\x00\x6f\x00\x76\x00\x65\x00\x72\
-\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0f\
-\x01\xf2\x4c\xc7\
-\x00\x63\
-\x00\x6c\x00\x6f\x00\x73\x00\x65\x00\x5f\x00\x68\x00\x6f\x00\x76\x00\x65\x00\x72\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0f\
-\x00\x72\x98\xe7\
-\x00\x76\
-\x00\x73\x00\x65\x00\x70\x00\x74\x00\x6f\x00\x6f\x00\x6c\x00\x62\x00\x61\x00\x72\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x13\
-\x03\x4b\x35\xa7\
-\x00\x66\
-\x00\x69\x00\x6c\x00\x65\x00\x5f\x00\x64\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x65\x00\x6e\x00\x64\x00\x2e\x00\x73\
-\x00\x76\x00\x67\
-\x00\x0f\
-\x06\xeb\x5d\xe7\
-\x00\x64\
-\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x6f\x00\x70\x00\x65\x00\x6e\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0a\
-\x05\x95\xd3\xa7\
-\x00\x75\
-\x00\x6e\x00\x64\x00\x6f\x00\x63\x00\x6b\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x15\
-\x0f\xf3\xcd\x87\
-\x00\x75\
-\x00\x70\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x5f\x00\x64\x00\x69\x00\x73\x00\x61\x00\x62\x00\x6c\x00\x65\x00\x64\
-\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0c\
-\x06\xe6\xeb\xe7\
-\x00\x75\
-\x00\x70\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x14\
-\x05\x8e\xb3\xc7\
-\x00\x64\
-\x00\x6f\x00\x77\x00\x6e\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x5f\x00\x68\x00\x6f\x00\x76\x00\x65\x00\x72\x00\x2e\
-\x00\x73\x00\x76\x00\x67\
-\x00\x11\
-\x0a\xe5\x61\x87\
-\x00\x72\
-\x00\x61\x00\x64\x00\x69\x00\x6f\x00\x5f\x00\x63\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x65\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\
-\x00\x14\
-\x00\x88\x80\x07\
-\x00\x6d\
-\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x5f\x00\x63\x00\x72\x00\x69\x00\x74\x00\x69\x00\x63\x00\x61\x00\x6c\x00\x2e\
-\x00\x73\x00\x76\x00\x67\
-\x00\x0f\
-\x02\x9f\x08\x07\
-\x00\x72\
-\x00\x69\x00\x67\x00\x68\x00\x74\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0d\
-\x03\xa2\x30\xc7\
-\x00\x64\
-\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x6e\x00\x6f\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x18\
-\x03\x1b\x62\x27\
-\x00\x66\
-\x00\x69\x00\x6c\x00\x65\x00\x5f\x00\x64\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x63\x00\x6f\x00\x6e\x00\x74\x00\x65\
-\x00\x6e\x00\x74\x00\x73\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x17\
-\x0a\x80\x1e\x07\
-\x00\x6d\
-\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x5f\x00\x69\x00\x6e\x00\x66\x00\x6f\x00\x72\x00\x6d\x00\x61\x00\x74\x00\x69\
-\x00\x6f\x00\x6e\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x15\
-\x05\x5c\x0e\xa7\
-\x00\x62\
-\x00\x72\x00\x61\x00\x6e\x00\x63\x00\x68\x00\x5f\x00\x6d\x00\x6f\x00\x72\x00\x65\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\
-\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x12\
-\x01\x06\x86\x47\
-\x00\x75\
-\x00\x70\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x5f\x00\x68\x00\x6f\x00\x76\x00\x65\x00\x72\x00\x2e\x00\x73\x00\x76\
-\x00\x67\
-\x00\x12\
-\x08\x8f\x44\xa7\
-\x00\x64\
-\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x64\x00\x69\x00\x73\x00\x63\x00\x61\x00\x72\x00\x64\x00\x2e\x00\x73\x00\x76\
-\x00\x67\
-\x00\x15\
-\x09\xf5\x41\x87\
-\x00\x72\
-\x00\x69\x00\x67\x00\x68\x00\x74\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x5f\x00\x68\x00\x6f\x00\x76\x00\x65\x00\x72\
-\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0f\
-\x08\xae\x5c\x07\
-\x00\x64\
-\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x73\x00\x61\x00\x76\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0f\
-\x0d\x17\x9b\x07\
-\x00\x66\
-\x00\x6f\x00\x6c\x00\x64\x00\x65\x00\x72\x00\x5f\x00\x6c\x00\x69\x00\x6e\x00\x6b\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x1d\
-\x09\x07\x8c\x87\
-\x00\x63\
-\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x62\x00\x6f\x00\x78\x00\x5f\x00\x63\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x65\x00\x64\x00\x5f\
-\x00\x64\x00\x69\x00\x73\x00\x61\x00\x62\x00\x6c\x00\x65\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0e\
-\x01\xd4\xf6\x47\
-\x00\x68\
-\x00\x61\x00\x72\x00\x64\x00\x5f\x00\x64\x00\x72\x00\x69\x00\x76\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0b\
-\x07\x60\xe9\x07\
-\x00\x75\
-\x00\x6e\x00\x73\x00\x68\x00\x61\x00\x64\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x15\
-\x01\x26\x22\xc7\
-\x00\x63\
-\x00\x61\x00\x6c\x00\x65\x00\x6e\x00\x64\x00\x61\x00\x72\x00\x5f\x00\x70\x00\x72\x00\x65\x00\x76\x00\x69\x00\x6f\x00\x75\x00\x73\
-\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x10\
-\x01\x0f\x47\x27\
-\x00\x76\
-\x00\x6d\x00\x6f\x00\x76\x00\x65\x00\x74\x00\x6f\x00\x6f\x00\x6c\x00\x62\x00\x61\x00\x72\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x10\
-\x00\x38\x48\xa7\
-\x00\x64\
-\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x63\x00\x6c\x00\x6f\x00\x73\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x15\
-\x04\xf8\x59\x87\
-\x00\x66\
-\x00\x69\x00\x6c\x00\x65\x00\x5f\x00\x64\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x73\x00\x74\x00\x61\x00\x72\x00\x74\
-\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0f\
-\x06\x53\x28\x27\
-\x00\x62\
-\x00\x72\x00\x61\x00\x6e\x00\x63\x00\x68\x00\x5f\x00\x6f\x00\x70\x00\x65\x00\x6e\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0c\
-\x0f\x88\xfa\x47\
-\x00\x6d\
-\x00\x69\x00\x6e\x00\x69\x00\x6d\x00\x69\x00\x7a\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x11\
-\x04\x00\x5d\x47\
-\x00\x63\
-\x00\x61\x00\x6c\x00\x65\x00\x6e\x00\x64\x00\x61\x00\x72\x00\x5f\x00\x6e\x00\x65\x00\x78\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
-\
-\x00\x14\
-\x04\x13\x00\xa7\
-\x00\x6d\
-\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x5f\x00\x71\x00\x75\x00\x65\x00\x73\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x2e\
-\x00\x73\x00\x76\x00\x67\
-\x00\x0b\
-\x06\x79\xcf\xa7\
-\x00\x72\
-\x00\x65\x00\x73\x00\x74\x00\x6f\x00\x72\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x13\
-\x09\xbb\x14\xa7\
-\x00\x6d\
-\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x5f\x00\x77\x00\x61\x00\x72\x00\x6e\x00\x69\x00\x6e\x00\x67\x00\x2e\x00\x73\
-\x00\x76\x00\x67\
-\x00\x16\
-\x01\x75\xc1\x07\
-\x00\x63\
-\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x62\x00\x6f\x00\x78\x00\x5f\x00\x75\x00\x6e\x00\x63\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x65\
-\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x23\
-\x06\xf2\x17\xc7\
-\x00\x63\
-\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x62\x00\x6f\x00\x78\x00\x5f\x00\x69\x00\x6e\x00\x64\x00\x65\x00\x74\x00\x65\x00\x72\x00\x6d\
-\x00\x69\x00\x6e\x00\x61\x00\x74\x00\x65\x00\x5f\x00\x64\x00\x69\x00\x73\x00\x61\x00\x62\x00\x6c\x00\x65\x00\x64\x00\x2e\x00\x73\
-\x00\x76\x00\x67\
-\x00\x11\
-\x0e\xd0\x99\xe7\
-\x00\x63\
-\x00\x6c\x00\x6f\x00\x73\x00\x65\x00\x5f\x00\x70\x00\x72\x00\x65\x00\x73\x00\x73\x00\x65\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\
-\x00\x1a\
-\x01\x87\xa3\xe7\
-\x00\x63\
-\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x62\x00\x6f\x00\x78\x00\x5f\x00\x69\x00\x6e\x00\x64\x00\x65\x00\x74\x00\x65\x00\x72\x00\x6d\
-\x00\x69\x00\x6e\x00\x61\x00\x74\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0f\
-\x00\x72\x20\xe7\
-\x00\x68\
-\x00\x73\x00\x65\x00\x70\x00\x74\x00\x6f\x00\x6f\x00\x6c\x00\x62\x00\x61\x00\x72\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x08\
-\x0c\x58\x54\xa7\
-\x00\x6d\
-\x00\x65\x00\x6e\x00\x75\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0e\
-\x01\xf6\xf7\x27\
-\x00\x64\
-\x00\x69\x00\x73\x00\x63\x00\x5f\x00\x64\x00\x72\x00\x69\x00\x76\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0e\
-\x03\xc2\xd5\xc3\
-\x00\x73\
-\x00\x74\x00\x79\x00\x6c\x00\x65\x00\x73\x00\x68\x00\x65\x00\x65\x00\x74\x00\x2e\x00\x71\x00\x73\x00\x73\
-\x00\x0e\
-\x09\x86\x4d\x07\
-\x00\x63\
-\x00\x6c\x00\x65\x00\x61\x00\x72\x00\x5f\x00\x74\x00\x65\x00\x78\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x09\
-\x07\xa8\xa9\x07\
-\x00\x73\
-\x00\x68\x00\x61\x00\x64\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x14\
-\x01\x76\xbf\x27\
-\x00\x6c\
-\x00\x65\x00\x66\x00\x74\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x5f\x00\x68\x00\x6f\x00\x76\x00\x65\x00\x72\x00\x2e\
-\x00\x73\x00\x76\x00\x67\
-\x00\x14\
-\x04\x18\xac\x27\
-\x00\x66\
-\x00\x69\x00\x6c\x00\x65\x00\x5f\x00\x64\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x69\x00\x6e\x00\x66\x00\x6f\x00\x2e\
-\x00\x73\x00\x76\x00\x67\
-\x00\x14\
-\x00\x61\xa3\xc7\
-\x00\x66\
-\x00\x69\x00\x6c\x00\x65\x00\x5f\x00\x64\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x6c\x00\x69\x00\x73\x00\x74\x00\x2e\
-\x00\x73\x00\x76\x00\x67\
-\x00\x11\
-\x0c\x39\xc2\x67\
-\x00\x6e\
-\x00\x65\x00\x74\x00\x77\x00\x6f\x00\x72\x00\x6b\x00\x5f\x00\x64\x00\x72\x00\x69\x00\x76\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x57\x00\x00\x00\x5a\
-\x00\x00\x00\x0e\x00\x02\x00\x00\x00\x57\x00\x00\x00\x03\
-\x00\x00\x04\x0e\x00\x00\x00\x00\x00\x01\x00\x00\x20\x99\
-\x00\x00\x0a\x44\x00\x00\x00\x00\x00\x01\x00\x00\x60\xe5\
-\x00\x00\x03\xe0\x00\x00\x00\x00\x00\x01\x00\x00\x1e\xda\
-\x00\x00\x00\x86\x00\x00\x00\x00\x00\x01\x00\x00\x04\x27\
-\x00\x00\x06\x12\x00\x00\x00\x00\x00\x01\x00\x00\x32\x55\
-\x00\x00\x0d\x6e\x00\x00\x00\x00\x00\x01\x00\x00\xb1\x40\
-\x00\x00\x0c\x5a\x00\x00\x00\x00\x00\x01\x00\x00\x7c\x8e\
-\x00\x00\x06\x66\x00\x00\x00\x00\x00\x01\x00\x00\x38\x6d\
-\x00\x00\x07\x98\x00\x00\x00\x00\x00\x01\x00\x00\x44\x3b\
-\x00\x00\x08\xa4\x00\x00\x00\x00\x00\x01\x00\x00\x50\x79\
-\x00\x00\x01\xd8\x00\x00\x00\x00\x00\x01\x00\x00\x10\xf3\
-\x00\x00\x0a\x1e\x00\x00\x00\x00\x00\x01\x00\x00\x60\x3e\
-\x00\x00\x09\xee\x00\x00\x00\x00\x00\x01\x00\x00\x5e\x3c\
-\x00\x00\x0b\x7a\x00\x00\x00\x00\x00\x01\x00\x00\x74\x46\
-\x00\x00\x0d\x12\x00\x00\x00\x00\x00\x01\x00\x00\xae\x33\
-\x00\x00\x0c\x20\x00\x00\x00\x00\x00\x01\x00\x00\x7a\xc8\
-\x00\x00\x09\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x5b\x87\
-\x00\x00\x01\x40\x00\x00\x00\x00\x00\x01\x00\x00\x0d\x90\
-\x00\x00\x06\x42\x00\x00\x00\x00\x00\x01\x00\x00\x34\x86\
-\x00\x00\x0c\x94\x00\x00\x00\x00\x00\x01\x00\x00\x7d\x6e\
-\x00\x00\x00\xe8\x00\x00\x00\x00\x00\x01\x00\x00\x0b\x69\
-\x00\x00\x07\xc6\x00\x00\x00\x00\x00\x01\x00\x00\x46\xfe\
-\x00\x00\x08\x0a\x00\x00\x00\x00\x00\x01\x00\x00\x4b\x59\
-\x00\x00\x06\x8a\x00\x00\x00\x00\x00\x01\x00\x00\x38\xd5\
-\x00\x00\x01\x7e\x00\x00\x00\x00\x00\x01\x00\x00\x0e\x10\
-\x00\x00\x07\xea\x00\x00\x00\x00\x00\x01\x00\x00\x49\x10\
-\x00\x00\x03\x7c\x00\x00\x00\x00\x00\x01\x00\x00\x1c\x3f\
-\x00\x00\x05\x7e\x00\x00\x00\x00\x00\x01\x00\x00\x2b\xef\
-\x00\x00\x0c\xb6\x00\x01\x00\x00\x00\x01\x00\x00\x7e\x58\
-\x00\x00\x04\xac\x00\x00\x00\x00\x00\x01\x00\x00\x24\x7f\
-\x00\x00\x0a\xdc\x00\x00\x00\x00\x00\x01\x00\x00\x66\xfa\
-\x00\x00\x0b\x04\x00\x00\x00\x00\x00\x01\x00\x00\x68\xf9\
-\x00\x00\x01\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x10\x22\
-\x00\x00\x0d\x40\x00\x00\x00\x00\x00\x01\x00\x00\xb0\x48\
-\x00\x00\x03\x20\x00\x00\x00\x00\x00\x01\x00\x00\x18\xb1\
-\x00\x00\x04\xda\x00\x00\x00\x00\x00\x01\x00\x00\x25\x4b\
-\x00\x00\x0a\x6a\x00\x00\x00\x00\x00\x01\x00\x00\x62\x76\
-\x00\x00\x08\x74\x00\x00\x00\x00\x00\x01\x00\x00\x4f\x6d\
-\x00\x00\x07\x42\x00\x00\x00\x00\x00\x01\x00\x00\x41\x75\
-\x00\x00\x06\xda\x00\x00\x00\x00\x00\x01\x00\x00\x3c\x7a\
-\x00\x00\x04\x5e\x00\x00\x00\x00\x00\x01\x00\x00\x23\x17\
-\x00\x00\x04\x24\x00\x00\x00\x00\x00\x01\x00\x00\x21\x39\
-\x00\x00\x02\xa0\x00\x00\x00\x00\x00\x01\x00\x00\x14\x26\
-\x00\x00\x0a\x9a\x00\x00\x00\x00\x00\x01\x00\x00\x64\x72\
-\x00\x00\x0b\x32\x00\x00\x00\x00\x00\x01\x00\x00\x70\x7f\
-\x00\x00\x00\xd0\x00\x00\x00\x00\x00\x01\x00\x00\x07\x82\
-\x00\x00\x07\x24\x00\x00\x00\x00\x00\x01\x00\x00\x3f\x6b\
-\x00\x00\x06\xb6\x00\x00\x00\x00\x00\x01\x00\x00\x3a\xcf\
-\x00\x00\x0b\xac\x00\x00\x00\x00\x00\x01\x00\x00\x75\x1b\
-\x00\x00\x09\xd2\x00\x00\x00\x00\x00\x01\x00\x00\x5d\xdd\
-\x00\x00\x01\xfe\x00\x00\x00\x00\x00\x01\x00\x00\x11\x9a\
-\x00\x00\x03\x56\x00\x00\x00\x00\x00\x01\x00\x00\x1a\xe7\
-\x00\x00\x0c\xfa\x00\x00\x00\x00\x00\x01\x00\x00\xad\xd3\
-\x00\x00\x05\x50\x00\x00\x00\x00\x00\x01\x00\x00\x2a\xd1\
-\x00\x00\x08\xce\x00\x00\x00\x00\x00\x01\x00\x00\x52\x83\
-\x00\x00\x05\x1e\x00\x00\x00\x00\x00\x01\x00\x00\x29\x72\
-\x00\x00\x09\x28\x00\x00\x00\x00\x00\x01\x00\x00\x56\x54\
-\x00\x00\x02\xf4\x00\x00\x00\x00\x00\x01\x00\x00\x18\x31\
-\x00\x00\x09\x70\x00\x00\x00\x00\x00\x01\x00\x00\x5a\x69\
-\x00\x00\x0c\xd8\x00\x00\x00\x00\x00\x01\x00\x00\xab\xb4\
-\x00\x00\x0b\x4e\x00\x00\x00\x00\x00\x01\x00\x00\x71\x06\
-\x00\x00\x08\xf8\x00\x00\x00\x00\x00\x01\x00\x00\x54\x42\
-\x00\x00\x08\x40\x00\x00\x00\x00\x00\x01\x00\x00\x4c\xfe\
-\x00\x00\x03\x9c\x00\x00\x00\x00\x00\x01\x00\x00\x1e\x05\
-\x00\x00\x05\x36\x00\x00\x00\x00\x00\x01\x00\x00\x2a\x1e\
-\x00\x00\x07\x70\x00\x00\x00\x00\x00\x01\x00\x00\x43\x87\
-\x00\x00\x04\x82\x00\x00\x00\x00\x00\x01\x00\x00\x23\xe3\
-\x00\x00\x02\xc0\x00\x00\x00\x00\x00\x01\x00\x00\x16\x0c\
-\x00\x00\x04\x42\x00\x00\x00\x00\x00\x01\x00\x00\x22\x5a\
-\x00\x00\x05\xea\x00\x00\x00\x00\x00\x01\x00\x00\x30\x30\
-\x00\x00\x03\xf8\x00\x00\x00\x00\x00\x01\x00\x00\x1f\x63\
-\x00\x00\x0d\x9c\x00\x00\x00\x00\x00\x01\x00\x00\xb2\xdc\
-\x00\x00\x0c\x7e\x00\x00\x00\x00\x00\x01\x00\x00\x7c\xf6\
-\x00\x00\x00\xac\x00\x00\x00\x00\x00\x01\x00\x00\x04\xdd\
-\x00\x00\x00\x52\x00\x00\x00\x00\x00\x01\x00\x00\x02\x12\
-\x00\x00\x00\x1e\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x02\x7c\x00\x00\x00\x00\x00\x01\x00\x00\x14\x03\
-\x00\x00\x09\x4c\x00\x00\x00\x00\x00\x01\x00\x00\x58\x70\
-\x00\x00\x01\x1e\x00\x00\x00\x00\x00\x01\x00\x00\x0c\xc1\
-\x00\x00\x02\x56\x00\x00\x00\x00\x00\x01\x00\x00\x13\x10\
-\x00\x00\x02\x1c\x00\x00\x00\x00\x00\x01\x00\x00\x12\x5c\
-\x00\x00\x0b\xf8\x00\x00\x00\x00\x00\x01\x00\x00\x76\xe1\
-\x00\x00\x04\xfc\x00\x00\x00\x00\x00\x01\x00\x00\x27\x5d\
-\x00\x00\x05\xc4\x00\x00\x00\x00\x00\x01\x00\x00\x2e\x58\
-\x00\x00\x05\xa6\x00\x00\x00\x00\x00\x01\x00\x00\x2d\xf2\
-\x00\x00\x0a\xbe\x00\x00\x00\x00\x00\x01\x00\x00\x66\xa3\
-\x00\x00\x06\xf4\x00\x00\x00\x00\x00\x01\x00\x00\x3d\x61\
-\x00\x00\x04\x0e\x00\x00\x00\x00\x00\x01\x00\x00\xd7\xf6\
-\x00\x00\x0a\x44\x00\x00\x00\x00\x00\x01\x00\x01\x18\x32\
-\x00\x00\x03\xe0\x00\x00\x00\x00\x00\x01\x00\x00\xd6\x37\
-\x00\x00\x00\x86\x00\x00\x00\x00\x00\x01\x00\x00\xbb\x84\
-\x00\x00\x06\x12\x00\x00\x00\x00\x00\x01\x00\x00\xe9\xb2\
-\x00\x00\x0d\x6e\x00\x00\x00\x00\x00\x01\x00\x01\x68\x45\
-\x00\x00\x0c\x5a\x00\x00\x00\x00\x00\x01\x00\x01\x33\xdb\
-\x00\x00\x06\x66\x00\x00\x00\x00\x00\x01\x00\x00\xef\xca\
-\x00\x00\x07\x98\x00\x00\x00\x00\x00\x01\x00\x00\xfb\x98\
-\x00\x00\x08\xa4\x00\x00\x00\x00\x00\x01\x00\x01\x07\xc6\
-\x00\x00\x01\xd8\x00\x00\x00\x00\x00\x01\x00\x00\xc8\x50\
-\x00\x00\x0a\x1e\x00\x00\x00\x00\x00\x01\x00\x01\x17\x8b\
-\x00\x00\x09\xee\x00\x00\x00\x00\x00\x01\x00\x01\x15\x89\
-\x00\x00\x0b\x7a\x00\x00\x00\x00\x00\x01\x00\x01\x2b\x93\
-\x00\x00\x0d\x12\x00\x00\x00\x00\x00\x01\x00\x01\x65\x38\
-\x00\x00\x0c\x20\x00\x00\x00\x00\x00\x01\x00\x01\x32\x15\
-\x00\x00\x09\xb0\x00\x00\x00\x00\x00\x01\x00\x01\x12\xd4\
-\x00\x00\x01\x40\x00\x00\x00\x00\x00\x01\x00\x00\xc4\xed\
-\x00\x00\x06\x42\x00\x00\x00\x00\x00\x01\x00\x00\xeb\xe3\
-\x00\x00\x0c\x94\x00\x00\x00\x00\x00\x01\x00\x01\x34\xbb\
-\x00\x00\x00\xe8\x00\x00\x00\x00\x00\x01\x00\x00\xc2\xc6\
-\x00\x00\x07\xc6\x00\x00\x00\x00\x00\x01\x00\x00\xfe\x5b\
-\x00\x00\x08\x0a\x00\x00\x00\x00\x00\x01\x00\x01\x02\xb6\
-\x00\x00\x06\x8a\x00\x00\x00\x00\x00\x01\x00\x00\xf0\x32\
-\x00\x00\x01\x7e\x00\x00\x00\x00\x00\x01\x00\x00\xc5\x6d\
-\x00\x00\x07\xea\x00\x00\x00\x00\x00\x01\x00\x01\x00\x6d\
-\x00\x00\x03\x7c\x00\x00\x00\x00\x00\x01\x00\x00\xd3\x9c\
-\x00\x00\x05\x7e\x00\x00\x00\x00\x00\x01\x00\x00\xe3\x4c\
-\x00\x00\x0c\xb6\x00\x01\x00\x00\x00\x01\x00\x01\x35\xa5\
-\x00\x00\x04\xac\x00\x00\x00\x00\x00\x01\x00\x00\xdb\xdc\
-\x00\x00\x0a\xdc\x00\x00\x00\x00\x00\x01\x00\x01\x1e\x47\
-\x00\x00\x0b\x04\x00\x00\x00\x00\x00\x01\x00\x01\x20\x46\
-\x00\x00\x01\xb4\x00\x00\x00\x00\x00\x01\x00\x00\xc7\x7f\
-\x00\x00\x0d\x40\x00\x00\x00\x00\x00\x01\x00\x01\x67\x4d\
-\x00\x00\x03\x20\x00\x00\x00\x00\x00\x01\x00\x00\xd0\x0e\
-\x00\x00\x04\xda\x00\x00\x00\x00\x00\x01\x00\x00\xdc\xa8\
-\x00\x00\x0a\x6a\x00\x00\x00\x00\x00\x01\x00\x01\x19\xc3\
-\x00\x00\x08\x74\x00\x00\x00\x00\x00\x01\x00\x01\x06\xba\
-\x00\x00\x07\x42\x00\x00\x00\x00\x00\x01\x00\x00\xf8\xd2\
-\x00\x00\x06\xda\x00\x00\x00\x00\x00\x01\x00\x00\xf3\xd7\
-\x00\x00\x04\x5e\x00\x00\x00\x00\x00\x01\x00\x00\xda\x74\
-\x00\x00\x04\x24\x00\x00\x00\x00\x00\x01\x00\x00\xd8\x96\
-\x00\x00\x02\xa0\x00\x00\x00\x00\x00\x01\x00\x00\xcb\x83\
-\x00\x00\x0a\x9a\x00\x00\x00\x00\x00\x01\x00\x01\x1b\xbf\
-\x00\x00\x0b\x32\x00\x00\x00\x00\x00\x01\x00\x01\x27\xcc\
-\x00\x00\x00\xd0\x00\x00\x00\x00\x00\x01\x00\x00\xbe\xdf\
-\x00\x00\x07\x24\x00\x00\x00\x00\x00\x01\x00\x00\xf6\xc8\
-\x00\x00\x06\xb6\x00\x00\x00\x00\x00\x01\x00\x00\xf2\x2c\
-\x00\x00\x0b\xac\x00\x00\x00\x00\x00\x01\x00\x01\x2c\x68\
-\x00\x00\x09\xd2\x00\x00\x00\x00\x00\x01\x00\x01\x15\x2a\
-\x00\x00\x01\xfe\x00\x00\x00\x00\x00\x01\x00\x00\xc8\xf7\
-\x00\x00\x03\x56\x00\x00\x00\x00\x00\x01\x00\x00\xd2\x44\
-\x00\x00\x0c\xfa\x00\x00\x00\x00\x00\x01\x00\x01\x64\xd8\
-\x00\x00\x05\x50\x00\x00\x00\x00\x00\x01\x00\x00\xe2\x2e\
-\x00\x00\x08\xce\x00\x00\x00\x00\x00\x01\x00\x01\x09\xd0\
-\x00\x00\x05\x1e\x00\x00\x00\x00\x00\x01\x00\x00\xe0\xcf\
-\x00\x00\x09\x28\x00\x00\x00\x00\x00\x01\x00\x01\x0d\xa1\
-\x00\x00\x02\xf4\x00\x00\x00\x00\x00\x01\x00\x00\xcf\x8e\
-\x00\x00\x09\x70\x00\x00\x00\x00\x00\x01\x00\x01\x11\xb6\
-\x00\x00\x0c\xd8\x00\x00\x00\x00\x00\x01\x00\x01\x62\xb9\
-\x00\x00\x0b\x4e\x00\x00\x00\x00\x00\x01\x00\x01\x28\x53\
-\x00\x00\x08\xf8\x00\x00\x00\x00\x00\x01\x00\x01\x0b\x8f\
-\x00\x00\x08\x40\x00\x00\x00\x00\x00\x01\x00\x01\x04\x4b\
-\x00\x00\x03\x9c\x00\x00\x00\x00\x00\x01\x00\x00\xd5\x62\
-\x00\x00\x05\x36\x00\x00\x00\x00\x00\x01\x00\x00\xe1\x7b\
-\x00\x00\x07\x70\x00\x00\x00\x00\x00\x01\x00\x00\xfa\xe4\
-\x00\x00\x04\x82\x00\x00\x00\x00\x00\x01\x00\x00\xdb\x40\
-\x00\x00\x02\xc0\x00\x00\x00\x00\x00\x01\x00\x00\xcd\x69\
-\x00\x00\x04\x42\x00\x00\x00\x00\x00\x01\x00\x00\xd9\xb7\
-\x00\x00\x05\xea\x00\x00\x00\x00\x00\x01\x00\x00\xe7\x8d\
-\x00\x00\x03\xf8\x00\x00\x00\x00\x00\x01\x00\x00\xd6\xc0\
-\x00\x00\x0d\x9c\x00\x00\x00\x00\x00\x01\x00\x01\x69\xe1\
-\x00\x00\x0c\x7e\x00\x00\x00\x00\x00\x01\x00\x01\x34\x43\
-\x00\x00\x00\xac\x00\x00\x00\x00\x00\x01\x00\x00\xbc\x3a\
-\x00\x00\x00\x52\x00\x00\x00\x00\x00\x01\x00\x00\xb9\x6f\
-\x00\x00\x00\x1e\x00\x00\x00\x00\x00\x01\x00\x00\xb7\x5d\
-\x00\x00\x02\x7c\x00\x00\x00\x00\x00\x01\x00\x00\xcb\x60\
-\x00\x00\x09\x4c\x00\x00\x00\x00\x00\x01\x00\x01\x0f\xbd\
-\x00\x00\x01\x1e\x00\x00\x00\x00\x00\x01\x00\x00\xc4\x1e\
-\x00\x00\x02\x56\x00\x00\x00\x00\x00\x01\x00\x00\xca\x6d\
-\x00\x00\x02\x1c\x00\x00\x00\x00\x00\x01\x00\x00\xc9\xb9\
-\x00\x00\x0b\xf8\x00\x00\x00\x00\x00\x01\x00\x01\x2e\x2e\
-\x00\x00\x04\xfc\x00\x00\x00\x00\x00\x01\x00\x00\xde\xba\
-\x00\x00\x05\xc4\x00\x00\x00\x00\x00\x01\x00\x00\xe5\xb5\
-\x00\x00\x05\xa6\x00\x00\x00\x00\x00\x01\x00\x00\xe5\x4f\
-\x00\x00\x0a\xbe\x00\x00\x00\x00\x00\x01\x00\x01\x1d\xf0\
-\x00\x00\x06\xf4\x00\x00\x00\x00\x00\x01\x00\x00\xf4\xbe\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x57\x00\x00\x00\x5a\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x0e\x00\x02\x00\x00\x00\x57\x00\x00\x00\x03\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x04\x0e\x00\x00\x00\x00\x00\x01\x00\x00\x20\x99\
-\x00\x00\x01\x91\x2e\xd2\x6f\x32\
-\x00\x00\x0a\x44\x00\x00\x00\x00\x00\x01\x00\x00\x60\xe5\
-\x00\x00\x01\x91\x2e\xd2\x6f\x25\
-\x00\x00\x03\xe0\x00\x00\x00\x00\x00\x01\x00\x00\x1e\xda\
-\x00\x00\x01\x91\x2e\xd2\x6f\x60\
-\x00\x00\x00\x86\x00\x00\x00\x00\x00\x01\x00\x00\x04\x27\
-\x00\x00\x01\x91\x2e\xd2\x6f\x63\
-\x00\x00\x06\x12\x00\x00\x00\x00\x00\x01\x00\x00\x32\x55\
-\x00\x00\x01\x91\x2e\xd2\x6f\x15\
-\x00\x00\x0d\x6e\x00\x00\x00\x00\x00\x01\x00\x00\xb1\x40\
-\x00\x00\x01\x91\x2e\xd2\x6f\x37\
-\x00\x00\x0c\x5a\x00\x00\x00\x00\x00\x01\x00\x00\x7c\x8e\
-\x00\x00\x01\x91\x2e\xd2\x6f\x41\
-\x00\x00\x06\x66\x00\x00\x00\x00\x00\x01\x00\x00\x38\x6d\
-\x00\x00\x01\x91\x2e\xd2\x6f\x62\
-\x00\x00\x07\x98\x00\x00\x00\x00\x00\x01\x00\x00\x44\x3b\
-\x00\x00\x01\x91\x2e\xd2\x6f\x46\
-\x00\x00\x08\xa4\x00\x00\x00\x00\x00\x01\x00\x00\x50\x79\
-\x00\x00\x01\x91\x2e\xd2\x6f\x5e\
-\x00\x00\x01\xd8\x00\x00\x00\x00\x00\x01\x00\x00\x10\xf3\
-\x00\x00\x01\x91\x2e\xd2\x6f\x40\
-\x00\x00\x0a\x1e\x00\x00\x00\x00\x00\x01\x00\x00\x60\x3e\
-\x00\x00\x01\x91\x2e\xd2\x6f\x61\
-\x00\x00\x09\xee\x00\x00\x00\x00\x00\x01\x00\x00\x5e\x3c\
-\x00\x00\x01\x91\x2e\xd2\x6f\x16\
-\x00\x00\x0b\x7a\x00\x00\x00\x00\x00\x01\x00\x00\x74\x46\
-\x00\x00\x01\x91\x2e\xd2\x6f\x1b\
-\x00\x00\x0d\x12\x00\x00\x00\x00\x00\x01\x00\x00\xae\x33\
-\x00\x00\x01\x91\x2e\xd2\x6f\x43\
-\x00\x00\x0c\x20\x00\x00\x00\x00\x00\x01\x00\x00\x7a\xc8\
-\x00\x00\x01\x91\x2e\xd2\x6f\x19\
-\x00\x00\x09\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x5b\x87\
-\x00\x00\x01\x91\x2e\xd2\x6f\x3e\
-\x00\x00\x01\x40\x00\x00\x00\x00\x00\x01\x00\x00\x0d\x90\
-\x00\x00\x01\x91\x2e\xd2\x6f\x4f\
-\x00\x00\x06\x42\x00\x00\x00\x00\x00\x01\x00\x00\x34\x86\
-\x00\x00\x01\x91\x2e\xd2\x6f\x20\
-\x00\x00\x0c\x94\x00\x00\x00\x00\x00\x01\x00\x00\x7d\x6e\
-\x00\x00\x01\x91\x2e\xd2\x6f\x2f\
-\x00\x00\x00\xe8\x00\x00\x00\x00\x00\x01\x00\x00\x0b\x69\
-\x00\x00\x01\x91\x2e\xd2\x6f\x5b\
-\x00\x00\x07\xc6\x00\x00\x00\x00\x00\x01\x00\x00\x46\xfe\
-\x00\x00\x01\x91\x2e\xd2\x6f\x51\
-\x00\x00\x08\x0a\x00\x00\x00\x00\x00\x01\x00\x00\x4b\x59\
-\x00\x00\x01\x91\x2e\xd2\x6f\x33\
-\x00\x00\x06\x8a\x00\x00\x00\x00\x00\x01\x00\x00\x38\xd5\
-\x00\x00\x01\x91\x2e\xd2\x6f\x35\
-\x00\x00\x01\x7e\x00\x00\x00\x00\x00\x01\x00\x00\x0e\x10\
-\x00\x00\x01\x91\x2e\xd2\x6f\x53\
-\x00\x00\x07\xea\x00\x00\x00\x00\x00\x01\x00\x00\x49\x10\
-\x00\x00\x01\x91\x2e\xd2\x6f\x29\
-\x00\x00\x03\x7c\x00\x00\x00\x00\x00\x01\x00\x00\x1c\x3f\
-\x00\x00\x01\x91\x2e\xd2\x6f\x2a\
-\x00\x00\x05\x7e\x00\x00\x00\x00\x00\x01\x00\x00\x2b\xef\
-\x00\x00\x01\x91\x2e\xd2\x6f\x24\
-\x00\x00\x0c\xb6\x00\x01\x00\x00\x00\x01\x00\x00\x7e\x58\
-\x00\x00\x01\x91\x2e\xd2\x6f\x66\
-\x00\x00\x04\xac\x00\x00\x00\x00\x00\x01\x00\x00\x24\x7f\
-\x00\x00\x01\x91\x2e\xd2\x6f\x11\
-\x00\x00\x0a\xdc\x00\x00\x00\x00\x00\x01\x00\x00\x66\xfa\
-\x00\x00\x01\x91\x2e\xd2\x6f\x15\
-\x00\x00\x0b\x04\x00\x00\x00\x00\x00\x01\x00\x00\x68\xf9\
-\x00\x00\x01\x91\x2e\xd2\x6f\x48\
-\x00\x00\x01\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x10\x22\
-\x00\x00\x01\x91\x2e\xd2\x6f\x3d\
-\x00\x00\x0d\x40\x00\x00\x00\x00\x00\x01\x00\x00\xb0\x48\
-\x00\x00\x01\x91\x2e\xd2\x6f\x36\
-\x00\x00\x03\x20\x00\x00\x00\x00\x00\x01\x00\x00\x18\xb1\
-\x00\x00\x01\x91\x2e\xd2\x6f\x34\
-\x00\x00\x04\xda\x00\x00\x00\x00\x00\x01\x00\x00\x25\x4b\
-\x00\x00\x01\x91\x2e\xd2\x6f\x30\
-\x00\x00\x0a\x6a\x00\x00\x00\x00\x00\x01\x00\x00\x62\x76\
-\x00\x00\x01\x91\x2e\xd2\x6f\x37\
-\x00\x00\x08\x74\x00\x00\x00\x00\x00\x01\x00\x00\x4f\x6d\
-\x00\x00\x01\x91\x2e\xd2\x6f\x13\
-\x00\x00\x07\x42\x00\x00\x00\x00\x00\x01\x00\x00\x41\x75\
-\x00\x00\x01\x91\x2e\xd2\x6f\x31\
-\x00\x00\x06\xda\x00\x00\x00\x00\x00\x01\x00\x00\x3c\x7a\
-\x00\x00\x01\x91\x2e\xd2\x6f\x59\
-\x00\x00\x04\x5e\x00\x00\x00\x00\x00\x01\x00\x00\x23\x17\
-\x00\x00\x01\x91\x2e\xd2\x6f\x12\
-\x00\x00\x04\x24\x00\x00\x00\x00\x00\x01\x00\x00\x21\x39\
-\x00\x00\x01\x91\x2e\xd2\x6f\x55\
-\x00\x00\x02\xa0\x00\x00\x00\x00\x00\x01\x00\x00\x14\x26\
-\x00\x00\x01\x91\x2e\xd2\x6f\x38\
-\x00\x00\x0a\x9a\x00\x00\x00\x00\x00\x01\x00\x00\x64\x72\
-\x00\x00\x01\x91\x2e\xd2\x6f\x14\
-\x00\x00\x0b\x32\x00\x00\x00\x00\x00\x01\x00\x00\x70\x7f\
-\x00\x00\x01\x91\x2e\xd2\x6f\x50\
-\x00\x00\x00\xd0\x00\x00\x00\x00\x00\x01\x00\x00\x07\x82\
-\x00\x00\x01\x91\x2e\xd2\x6f\x1f\
-\x00\x00\x07\x24\x00\x00\x00\x00\x00\x01\x00\x00\x3f\x6b\
-\x00\x00\x01\x91\x2e\xd2\x6f\x5d\
-\x00\x00\x06\xb6\x00\x00\x00\x00\x00\x01\x00\x00\x3a\xcf\
-\x00\x00\x01\x91\x2e\xd2\x6f\x2b\
-\x00\x00\x0b\xac\x00\x00\x00\x00\x00\x01\x00\x00\x75\x1b\
-\x00\x00\x01\x91\x2e\xd2\x6f\x1a\
-\x00\x00\x09\xd2\x00\x00\x00\x00\x00\x01\x00\x00\x5d\xdd\
-\x00\x00\x01\x91\x2e\xd2\x6f\x5c\
-\x00\x00\x01\xfe\x00\x00\x00\x00\x00\x01\x00\x00\x11\x9a\
-\x00\x00\x01\x91\x2e\xd2\x6f\x22\
-\x00\x00\x03\x56\x00\x00\x00\x00\x00\x01\x00\x00\x1a\xe7\
-\x00\x00\x01\x91\x2e\xd2\x6f\x5a\
-\x00\x00\x0c\xfa\x00\x00\x00\x00\x00\x01\x00\x00\xad\xd3\
-\x00\x00\x01\x91\x2e\xd2\x6f\x54\
-\x00\x00\x05\x50\x00\x00\x00\x00\x00\x01\x00\x00\x2a\xd1\
-\x00\x00\x01\x91\x2e\xd2\x6f\x17\
-\x00\x00\x08\xce\x00\x00\x00\x00\x00\x01\x00\x00\x52\x83\
-\x00\x00\x01\x91\x2e\xd2\x6f\x27\
-\x00\x00\x05\x1e\x00\x00\x00\x00\x00\x01\x00\x00\x29\x72\
-\x00\x00\x01\x91\x2e\xd2\x6f\x57\
-\x00\x00\x09\x28\x00\x00\x00\x00\x00\x01\x00\x00\x56\x54\
-\x00\x00\x01\x91\x2e\xd2\x6f\x2d\
-\x00\x00\x02\xf4\x00\x00\x00\x00\x00\x01\x00\x00\x18\x31\
-\x00\x00\x01\x91\x2e\xd2\x6f\x4e\
-\x00\x00\x09\x70\x00\x00\x00\x00\x00\x01\x00\x00\x5a\x69\
-\x00\x00\x01\x91\x2e\xd2\x6f\x18\
-\x00\x00\x0c\xd8\x00\x00\x00\x00\x00\x01\x00\x00\xab\xb4\
-\x00\x00\x01\x91\x2e\xd2\x6f\x1d\
-\x00\x00\x0b\x4e\x00\x00\x00\x00\x00\x01\x00\x00\x71\x06\
-\x00\x00\x01\x91\x2e\xd2\x6f\x49\
-\x00\x00\x08\xf8\x00\x00\x00\x00\x00\x01\x00\x00\x54\x42\
-\x00\x00\x01\x91\x2e\xd2\x6f\x52\
-\x00\x00\x08\x40\x00\x00\x00\x00\x00\x01\x00\x00\x4c\xfe\
-\x00\x00\x01\x91\x2e\xd2\x6f\x47\
-\x00\x00\x03\x9c\x00\x00\x00\x00\x00\x01\x00\x00\x1e\x05\
-\x00\x00\x01\x91\x2e\xd2\x6f\x1c\
-\x00\x00\x05\x36\x00\x00\x00\x00\x00\x01\x00\x00\x2a\x1e\
-\x00\x00\x01\x91\x2e\xd2\x6f\x3b\
-\x00\x00\x07\x70\x00\x00\x00\x00\x00\x01\x00\x00\x43\x87\
-\x00\x00\x01\x91\x2e\xd2\x6f\x4c\
-\x00\x00\x04\x82\x00\x00\x00\x00\x00\x01\x00\x00\x23\xe3\
-\x00\x00\x01\x91\x2e\xd2\x6f\x41\
-\x00\x00\x02\xc0\x00\x00\x00\x00\x00\x01\x00\x00\x16\x0c\
-\x00\x00\x01\x91\x2e\xd2\x6f\x0f\
-\x00\x00\x04\x42\x00\x00\x00\x00\x00\x01\x00\x00\x22\x5a\
-\x00\x00\x01\x91\x2e\xd2\x6f\x23\
-\x00\x00\x05\xea\x00\x00\x00\x00\x00\x01\x00\x00\x30\x30\
-\x00\x00\x01\x91\x2e\xd2\x6f\x0d\
-\x00\x00\x03\xf8\x00\x00\x00\x00\x00\x01\x00\x00\x1f\x63\
-\x00\x00\x01\x91\x2e\xd2\x6f\x3f\
-\x00\x00\x0d\x9c\x00\x00\x00\x00\x00\x01\x00\x00\xb2\xdc\
-\x00\x00\x01\x91\x2e\xd2\x6f\x4b\
-\x00\x00\x0c\x7e\x00\x00\x00\x00\x00\x01\x00\x00\x7c\xf6\
-\x00\x00\x01\x91\x2e\xd2\x6f\x45\
-\x00\x00\x00\xac\x00\x00\x00\x00\x00\x01\x00\x00\x04\xdd\
-\x00\x00\x01\x91\x2e\xd2\x6f\x28\
-\x00\x00\x00\x52\x00\x00\x00\x00\x00\x01\x00\x00\x02\x12\
-\x00\x00\x01\x91\x2e\xd2\x6f\x44\
-\x00\x00\x00\x1e\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x91\x2e\xd2\x6f\x31\
-\x00\x00\x02\x7c\x00\x00\x00\x00\x00\x01\x00\x00\x14\x03\
-\x00\x00\x01\x91\x2e\xd2\x6f\x56\
-\x00\x00\x09\x4c\x00\x00\x00\x00\x00\x01\x00\x00\x58\x70\
-\x00\x00\x01\x91\x2e\xd2\x6f\x3c\
-\x00\x00\x01\x1e\x00\x00\x00\x00\x00\x01\x00\x00\x0c\xc1\
-\x00\x00\x01\x91\x2e\xd2\x6f\x10\
-\x00\x00\x02\x56\x00\x00\x00\x00\x00\x01\x00\x00\x13\x10\
-\x00\x00\x01\x91\x2e\xd2\x6f\x3a\
-\x00\x00\x02\x1c\x00\x00\x00\x00\x00\x01\x00\x00\x12\x5c\
-\x00\x00\x01\x91\x2e\xd2\x6f\x4d\
-\x00\x00\x0b\xf8\x00\x00\x00\x00\x00\x01\x00\x00\x76\xe1\
-\x00\x00\x01\x91\x2e\xd2\x6f\x21\
-\x00\x00\x04\xfc\x00\x00\x00\x00\x00\x01\x00\x00\x27\x5d\
-\x00\x00\x01\x91\x2e\xd2\x6f\x42\
-\x00\x00\x05\xc4\x00\x00\x00\x00\x00\x01\x00\x00\x2e\x58\
-\x00\x00\x01\x91\x2e\xd2\x6f\x2c\
-\x00\x00\x05\xa6\x00\x00\x00\x00\x00\x01\x00\x00\x2d\xf2\
-\x00\x00\x01\x91\x2e\xd2\x6f\x45\
-\x00\x00\x0a\xbe\x00\x00\x00\x00\x00\x01\x00\x00\x66\xa3\
-\x00\x00\x01\x91\x2e\xd2\x6f\x4a\
-\x00\x00\x06\xf4\x00\x00\x00\x00\x00\x01\x00\x00\x3d\x61\
-\x00\x00\x01\x91\x2e\xd2\x6f\x5f\
-\x00\x00\x04\x0e\x00\x00\x00\x00\x00\x01\x00\x00\xd7\xf6\
-\x00\x00\x01\x91\x2e\xd2\x6f\x8c\
-\x00\x00\x0a\x44\x00\x00\x00\x00\x00\x01\x00\x01\x18\x32\
-\x00\x00\x01\x91\x2e\xd2\x6f\x7f\
-\x00\x00\x03\xe0\x00\x00\x00\x00\x00\x01\x00\x00\xd6\x37\
-\x00\x00\x01\x91\x2e\xd2\x6f\xbb\
-\x00\x00\x00\x86\x00\x00\x00\x00\x00\x01\x00\x00\xbb\x84\
-\x00\x00\x01\x91\x2e\xd2\x6f\xbe\
-\x00\x00\x06\x12\x00\x00\x00\x00\x00\x01\x00\x00\xe9\xb2\
-\x00\x00\x01\x91\x2e\xd2\x6f\x6f\
-\x00\x00\x0d\x6e\x00\x00\x00\x00\x00\x01\x00\x01\x68\x45\
-\x00\x00\x01\x91\x2e\xd2\x6f\x90\
-\x00\x00\x0c\x5a\x00\x00\x00\x00\x00\x01\x00\x01\x33\xdb\
-\x00\x00\x01\x91\x2e\xd2\x6f\x9a\
-\x00\x00\x06\x66\x00\x00\x00\x00\x00\x01\x00\x00\xef\xca\
-\x00\x00\x01\x91\x2e\xd2\x6f\xbd\
-\x00\x00\x07\x98\x00\x00\x00\x00\x00\x01\x00\x00\xfb\x98\
-\x00\x00\x01\x91\x2e\xd2\x6f\xa1\
-\x00\x00\x08\xa4\x00\x00\x00\x00\x00\x01\x00\x01\x07\xc6\
-\x00\x00\x01\x91\x2e\xd2\x6f\xb9\
-\x00\x00\x01\xd8\x00\x00\x00\x00\x00\x01\x00\x00\xc8\x50\
-\x00\x00\x01\x91\x2e\xd2\x6f\x99\
-\x00\x00\x0a\x1e\x00\x00\x00\x00\x00\x01\x00\x01\x17\x8b\
-\x00\x00\x01\x91\x2e\xd2\x6f\xbc\
-\x00\x00\x09\xee\x00\x00\x00\x00\x00\x01\x00\x01\x15\x89\
-\x00\x00\x01\x91\x2e\xd2\x6f\x71\
-\x00\x00\x0b\x7a\x00\x00\x00\x00\x00\x01\x00\x01\x2b\x93\
-\x00\x00\x01\x91\x2e\xd2\x6f\x76\
-\x00\x00\x0d\x12\x00\x00\x00\x00\x00\x01\x00\x01\x65\x38\
-\x00\x00\x01\x91\x2e\xd2\x6f\x9d\
-\x00\x00\x0c\x20\x00\x00\x00\x00\x00\x01\x00\x01\x32\x15\
-\x00\x00\x01\x91\x2e\xd2\x6f\x74\
-\x00\x00\x09\xb0\x00\x00\x00\x00\x00\x01\x00\x01\x12\xd4\
-\x00\x00\x01\x91\x2e\xd2\x6f\x97\
-\x00\x00\x01\x40\x00\x00\x00\x00\x00\x01\x00\x00\xc4\xed\
-\x00\x00\x01\x91\x2e\xd2\x6f\xaa\
-\x00\x00\x06\x42\x00\x00\x00\x00\x00\x01\x00\x00\xeb\xe3\
-\x00\x00\x01\x91\x2e\xd2\x6f\x7a\
-\x00\x00\x0c\x94\x00\x00\x00\x00\x00\x01\x00\x01\x34\xbb\
-\x00\x00\x01\x91\x2e\xd2\x6f\x87\
-\x00\x00\x00\xe8\x00\x00\x00\x00\x00\x01\x00\x00\xc2\xc6\
-\x00\x00\x01\x91\x2e\xd2\x6f\xb5\
-\x00\x00\x07\xc6\x00\x00\x00\x00\x00\x01\x00\x00\xfe\x5b\
-\x00\x00\x01\x91\x2e\xd2\x6f\xad\
-\x00\x00\x08\x0a\x00\x00\x00\x00\x00\x01\x00\x01\x02\xb6\
-\x00\x00\x01\x91\x2e\xd2\x6f\x8d\
-\x00\x00\x06\x8a\x00\x00\x00\x00\x00\x01\x00\x00\xf0\x32\
-\x00\x00\x01\x91\x2e\xd2\x6f\x8f\
-\x00\x00\x01\x7e\x00\x00\x00\x00\x00\x01\x00\x00\xc5\x6d\
-\x00\x00\x01\x91\x2e\xd2\x6f\xaf\
-\x00\x00\x07\xea\x00\x00\x00\x00\x00\x01\x00\x01\x00\x6d\
-\x00\x00\x01\x91\x2e\xd2\x6f\x82\
-\x00\x00\x03\x7c\x00\x00\x00\x00\x00\x01\x00\x00\xd3\x9c\
-\x00\x00\x01\x91\x2e\xd2\x6f\x83\
-\x00\x00\x05\x7e\x00\x00\x00\x00\x00\x01\x00\x00\xe3\x4c\
-\x00\x00\x01\x91\x2e\xd2\x6f\x7e\
-\x00\x00\x0c\xb6\x00\x01\x00\x00\x00\x01\x00\x01\x35\xa5\
-\x00\x00\x01\x91\x2e\xd2\x6f\xc1\
-\x00\x00\x04\xac\x00\x00\x00\x00\x00\x01\x00\x00\xdb\xdc\
-\x00\x00\x01\x91\x2e\xd2\x6f\x6c\
-\x00\x00\x0a\xdc\x00\x00\x00\x00\x00\x01\x00\x01\x1e\x47\
-\x00\x00\x01\x91\x2e\xd2\x6f\x70\
-\x00\x00\x0b\x04\x00\x00\x00\x00\x00\x01\x00\x01\x20\x46\
-\x00\x00\x01\x91\x2e\xd2\x6f\xa3\
-\x00\x00\x01\xb4\x00\x00\x00\x00\x00\x01\x00\x00\xc7\x7f\
-\x00\x00\x01\x91\x2e\xd2\x6f\x96\
-\x00\x00\x0d\x40\x00\x00\x00\x00\x00\x01\x00\x01\x67\x4d\
-\x00\x00\x01\x91\x2e\xd2\x6f\x90\
-\x00\x00\x03\x20\x00\x00\x00\x00\x00\x01\x00\x00\xd0\x0e\
-\x00\x00\x01\x91\x2e\xd2\x6f\x8d\
-\x00\x00\x04\xda\x00\x00\x00\x00\x00\x01\x00\x00\xdc\xa8\
-\x00\x00\x01\x91\x2e\xd2\x6f\x88\
-\x00\x00\x0a\x6a\x00\x00\x00\x00\x00\x01\x00\x01\x19\xc3\
-\x00\x00\x01\x91\x2e\xd2\x6f\x91\
-\x00\x00\x08\x74\x00\x00\x00\x00\x00\x01\x00\x01\x06\xba\
-\x00\x00\x01\x91\x2e\xd2\x6f\x6d\
-\x00\x00\x07\x42\x00\x00\x00\x00\x00\x01\x00\x00\xf8\xd2\
-\x00\x00\x01\x91\x2e\xd2\x6f\x89\
-\x00\x00\x06\xda\x00\x00\x00\x00\x00\x01\x00\x00\xf3\xd7\
-\x00\x00\x01\x91\x2e\xd2\x6f\xb3\
-\x00\x00\x04\x5e\x00\x00\x00\x00\x00\x01\x00\x00\xda\x74\
-\x00\x00\x01\x91\x2e\xd2\x6f\x6c\
-\x00\x00\x04\x24\x00\x00\x00\x00\x00\x01\x00\x00\xd8\x96\
-\x00\x00\x01\x91\x2e\xd2\x6f\xb1\
-\x00\x00\x02\xa0\x00\x00\x00\x00\x00\x01\x00\x00\xcb\x83\
-\x00\x00\x01\x91\x2e\xd2\x6f\x92\
-\x00\x00\x0a\x9a\x00\x00\x00\x00\x00\x01\x00\x01\x1b\xbf\
-\x00\x00\x01\x91\x2e\xd2\x6f\x6e\
-\x00\x00\x0b\x32\x00\x00\x00\x00\x00\x01\x00\x01\x27\xcc\
-\x00\x00\x01\x91\x2e\xd2\x6f\xab\
-\x00\x00\x00\xd0\x00\x00\x00\x00\x00\x01\x00\x00\xbe\xdf\
-\x00\x00\x01\x91\x2e\xd2\x6f\x7a\
-\x00\x00\x07\x24\x00\x00\x00\x00\x00\x01\x00\x00\xf6\xc8\
-\x00\x00\x01\x91\x2e\xd2\x6f\xb8\
-\x00\x00\x06\xb6\x00\x00\x00\x00\x00\x01\x00\x00\xf2\x2c\
-\x00\x00\x01\x91\x2e\xd2\x6f\x84\
-\x00\x00\x0b\xac\x00\x00\x00\x00\x00\x01\x00\x01\x2c\x68\
-\x00\x00\x01\x91\x2e\xd2\x6f\x75\
-\x00\x00\x09\xd2\x00\x00\x00\x00\x00\x01\x00\x01\x15\x2a\
-\x00\x00\x01\x91\x2e\xd2\x6f\xb7\
-\x00\x00\x01\xfe\x00\x00\x00\x00\x00\x01\x00\x00\xc8\xf7\
-\x00\x00\x01\x91\x2e\xd2\x6f\x7c\
-\x00\x00\x03\x56\x00\x00\x00\x00\x00\x01\x00\x00\xd2\x44\
-\x00\x00\x01\x91\x2e\xd2\x6f\xb4\
-\x00\x00\x0c\xfa\x00\x00\x00\x00\x00\x01\x00\x01\x64\xd8\
-\x00\x00\x01\x91\x2e\xd2\x6f\xaf\
-\x00\x00\x05\x50\x00\x00\x00\x00\x00\x01\x00\x00\xe2\x2e\
-\x00\x00\x01\x91\x2e\xd2\x6f\x72\
-\x00\x00\x08\xce\x00\x00\x00\x00\x00\x01\x00\x01\x09\xd0\
-\x00\x00\x01\x91\x2e\xd2\x6f\x80\
-\x00\x00\x05\x1e\x00\x00\x00\x00\x00\x01\x00\x00\xe0\xcf\
-\x00\x00\x01\x91\x2e\xd2\x6f\xb2\
-\x00\x00\x09\x28\x00\x00\x00\x00\x00\x01\x00\x01\x0d\xa1\
-\x00\x00\x01\x91\x2e\xd2\x6f\x85\
-\x00\x00\x02\xf4\x00\x00\x00\x00\x00\x01\x00\x00\xcf\x8e\
-\x00\x00\x01\x91\x2e\xd2\x6f\xa9\
-\x00\x00\x09\x70\x00\x00\x00\x00\x00\x01\x00\x01\x11\xb6\
-\x00\x00\x01\x91\x2e\xd2\x6f\x73\
-\x00\x00\x0c\xd8\x00\x00\x00\x00\x00\x01\x00\x01\x62\xb9\
-\x00\x00\x01\x91\x2e\xd2\x6f\x79\
-\x00\x00\x0b\x4e\x00\x00\x00\x00\x00\x01\x00\x01\x28\x53\
-\x00\x00\x01\x91\x2e\xd2\x6f\xa4\
-\x00\x00\x08\xf8\x00\x00\x00\x00\x00\x01\x00\x01\x0b\x8f\
-\x00\x00\x01\x91\x2e\xd2\x6f\xad\
-\x00\x00\x08\x40\x00\x00\x00\x00\x00\x01\x00\x01\x04\x4b\
-\x00\x00\x01\x91\x2e\xd2\x6f\xa2\
-\x00\x00\x03\x9c\x00\x00\x00\x00\x00\x01\x00\x00\xd5\x62\
-\x00\x00\x01\x91\x2e\xd2\x6f\x78\
-\x00\x00\x05\x36\x00\x00\x00\x00\x00\x01\x00\x00\xe1\x7b\
-\x00\x00\x01\x91\x2e\xd2\x6f\x94\
-\x00\x00\x07\x70\x00\x00\x00\x00\x00\x01\x00\x00\xfa\xe4\
-\x00\x00\x01\x91\x2e\xd2\x6f\xa7\
-\x00\x00\x04\x82\x00\x00\x00\x00\x00\x01\x00\x00\xdb\x40\
-\x00\x00\x01\x91\x2e\xd2\x6f\x9a\
-\x00\x00\x02\xc0\x00\x00\x00\x00\x00\x01\x00\x00\xcd\x69\
-\x00\x00\x01\x91\x2e\xd2\x6f\x6a\
-\x00\x00\x04\x42\x00\x00\x00\x00\x00\x01\x00\x00\xd9\xb7\
-\x00\x00\x01\x91\x2e\xd2\x6f\x7d\
-\x00\x00\x05\xea\x00\x00\x00\x00\x00\x01\x00\x00\xe7\x8d\
-\x00\x00\x01\x91\x2e\xd2\x6f\x68\
-\x00\x00\x03\xf8\x00\x00\x00\x00\x00\x01\x00\x00\xd6\xc0\
-\x00\x00\x01\x91\x2e\xd2\x6f\x98\
-\x00\x00\x0d\x9c\x00\x00\x00\x00\x00\x01\x00\x01\x69\xe1\
-\x00\x00\x01\x91\x2e\xd2\x6f\xa6\
-\x00\x00\x0c\x7e\x00\x00\x00\x00\x00\x01\x00\x01\x34\x43\
-\x00\x00\x01\x91\x2e\xd2\x6f\xa0\
-\x00\x00\x00\xac\x00\x00\x00\x00\x00\x01\x00\x00\xbc\x3a\
-\x00\x00\x01\x91\x2e\xd2\x6f\x81\
-\x00\x00\x00\x52\x00\x00\x00\x00\x00\x01\x00\x00\xb9\x6f\
-\x00\x00\x01\x91\x2e\xd2\x6f\x9e\
-\x00\x00\x00\x1e\x00\x00\x00\x00\x00\x01\x00\x00\xb7\x5d\
-\x00\x00\x01\x91\x2e\xd2\x6f\x8a\
-\x00\x00\x02\x7c\x00\x00\x00\x00\x00\x01\x00\x00\xcb\x60\
-\x00\x00\x01\x91\x2e\xd2\x6f\xb1\
-\x00\x00\x09\x4c\x00\x00\x00\x00\x00\x01\x00\x01\x0f\xbd\
-\x00\x00\x01\x91\x2e\xd2\x6f\x95\
-\x00\x00\x01\x1e\x00\x00\x00\x00\x00\x01\x00\x00\xc4\x1e\
-\x00\x00\x01\x91\x2e\xd2\x6f\x6b\
-\x00\x00\x02\x56\x00\x00\x00\x00\x00\x01\x00\x00\xca\x6d\
-\x00\x00\x01\x91\x2e\xd2\x6f\x93\
-\x00\x00\x02\x1c\x00\x00\x00\x00\x00\x01\x00\x00\xc9\xb9\
-\x00\x00\x01\x91\x2e\xd2\x6f\xa8\
-\x00\x00\x0b\xf8\x00\x00\x00\x00\x00\x01\x00\x01\x2e\x2e\
-\x00\x00\x01\x91\x2e\xd2\x6f\x7b\
-\x00\x00\x04\xfc\x00\x00\x00\x00\x00\x01\x00\x00\xde\xba\
-\x00\x00\x01\x91\x2e\xd2\x6f\x9b\
-\x00\x00\x05\xc4\x00\x00\x00\x00\x00\x01\x00\x00\xe5\xb5\
-\x00\x00\x01\x91\x2e\xd2\x6f\x84\
-\x00\x00\x05\xa6\x00\x00\x00\x00\x00\x01\x00\x00\xe5\x4f\
-\x00\x00\x01\x91\x2e\xd2\x6f\x9f\
-\x00\x00\x0a\xbe\x00\x00\x00\x00\x00\x01\x00\x01\x1d\xf0\
-\x00\x00\x01\x91\x2e\xd2\x6f\xa5\
-\x00\x00\x06\xf4\x00\x00\x00\x00\x00\x01\x00\x00\xf4\xbe\
-\x00\x00\x01\x91\x2e\xd2\x6f\xba\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
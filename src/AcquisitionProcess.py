@@ -0,0 +1,292 @@
+from multiprocessing import shared_memory
+import multiprocessing as mp
+import numpy as np
+import logging
+import queue
+import time
+from .CaptureJournal import RECORD_DTYPE, FRAME, BRIDGE, RAW, CROSS_FRAME
+from .Calibration import load_calibration
+from .BenchConfig import Bench
+
+
+ACQUISITION_PROCESS_ENV = "ALPENFLOW_ACQUISITION_PROCESS"  # set to 1 to acquire in a child process
+RING_CAPACITY = 1 << 18  # records. ~25s of raw polling, far more than a 12s pull leaves unread
+COUNT_DTYPE = np.dtype('<u8')
+
+
+class SampleRing():
+
+    def __init__(self, capacity=RING_CAPACITY, name=None):
+        """Ring buffer of capture records in shared memory
+
+        One process writes and one process reads. The writer stores a record and
+        then bumps the total count, the reader copies everything between the
+        count it last saw and the current one. Nothing is locked, so the writer
+        never waits on the reader.
+
+        Args:
+            capacity (int, optional): records the ring holds. Defaults to RING_CAPACITY.
+            name (str, optional): attach to an existing ring instead of creating one
+        """
+        size = COUNT_DTYPE.itemsize + capacity * RECORD_DTYPE.itemsize
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+            self.owner = True
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.owner = False  # only the creating process unlinks the block
+        self.name = self.shm.name
+        self.capacity = capacity
+        self.count = np.ndarray((1,), dtype=COUNT_DTYPE, buffer=self.shm.buf)
+        self.records = np.ndarray((capacity,), dtype=RECORD_DTYPE, buffer=self.shm.buf, offset=COUNT_DTYPE.itemsize)
+        if self.owner:
+            self.count[0] = 0
+        self.read_count = int(self.count[0])
+
+    def write(self, kind: int, t: float, value: float) -> None:
+        """Adds a record. Only called by the writing process"""
+        n = int(self.count[0])
+        self.records[n % self.capacity] = (kind, t, value)
+        self.count[0] = n + 1
+
+    def read(self) -> np.array:
+        """Records written since the last read. Only called by the reading process
+
+        Returns:
+            np.array: copy of the new records in the order they were written
+        """
+        n = int(self.count[0])
+        if n - self.read_count > self.capacity:
+            logging.getLogger(__name__).warning("Acquisition ring overran. Lost %d records", n - self.read_count - self.capacity)
+            self.read_count = n - self.capacity
+        start = self.read_count % self.capacity
+        end = start + (n - self.read_count)
+        self.read_count = n
+        if end <= self.capacity:
+            return self.records[start:end].copy()
+        return np.concatenate((self.records[start:], self.records[:end - self.capacity]))
+
+    def skip_to_end(self) -> None:
+        """Discards records the reader hasn't looked at yet"""
+        self.read_count = int(self.count[0])
+
+    def close(self) -> None:
+        # views must be released before the block can be closed
+        del self.count, self.records
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def acquisition_main(ring_name: str, capacity: int, commands, capturing, capture_id, status, bench: Bench) -> None:
+    """Entry point of the acquisition process
+
+    Owns the phidget and the arduino. While capturing is set it polls them
+    exactly like the in-app capture loop and writes every distance frame, new
+    bridge sample and polled voltage ratio with its wall clock time to the ring.
+    Between captures it waits for axis switches and the quit command.
+
+    Args:
+        ring_name (str): shared memory block of the SampleRing
+        capacity (int): records the ring holds
+        commands (mp.Queue): "my", "mz", "dual", "single" or "quit"
+        capturing (mp.Event): set while a capture is running
+        capture_id (mp.Value): number of the capture, bumped before capturing is set
+        status (mp.Queue): "ready" once the devices are open, or the error that stopped the process.
+            After each capture, the counters of its polling loop and devices, tagged with its capture_id
+        bench (Bench): devices to open
+    """
+    from .LogSetup import setup_logging
+    from .PhidgetHandler import PhidgetHandler
+    from .SerialHandler import SerialHandler
+    setup_logging()  # spawned, so the app's logging setup isn't inherited
+    ring = SampleRing(capacity, name=ring_name)
+    try:
+        phidget = PhidgetHandler(bench.phidget_serial, bench.phidget_channel, bench.calibration_file)
+    except Exception as e:
+        status.put(f"Could not open the phidget: {e}")
+        ring.close()
+        return
+    try:
+        serial = SerialHandler(bench.serial_port)
+    except Exception as e:
+        status.put(f"Could not open the arduino: {e}")
+        phidget.close()
+        ring.close()
+        return
+    status.put("ready")
+
+    running = True
+    while running:
+        # wake as soon as a capture starts. Commands are only checked in between, without blocking
+        capture_requested = capturing.wait(.05)
+        while True:
+            try:
+                command = commands.get_nowait()
+            except queue.Empty:
+                break
+            if command == "my":
+                serial.set_my_state()
+            elif command == "mz":
+                serial.set_mz_state()
+            elif command in ("dual", "single"):
+                serial.set_dual_state(command == "dual")
+            elif command == "quit":
+                running = False
+        if not running or not capture_requested:
+            continue
+
+        capture = capture_id.value
+        serial.reset_buffer()
+        last_bridge_time = phidget.recent_sample[0]
+        last_raw_time = 0
+        loops = 0
+        bytes_read, callbacks, started = serial.bytes_read, phidget.callback_count, time.time()
+        while True:
+            distance_measurement = serial.get_arduino_data()
+            now = time.time()
+            bridge_time, current_torque = phidget.recent_sample
+            if bridge_time != last_bridge_time:
+                ring.write(BRIDGE, bridge_time, current_torque)
+                last_bridge_time = bridge_time
+            if distance_measurement is not None:
+                ring.write(FRAME, now, distance_measurement)
+            if serial.dual and len(serial.cross_frames) > 0:
+                for frame_time, distance in serial.take_cross_frames():
+                    ring.write(CROSS_FRAME, frame_time, distance)
+            if now - last_raw_time > .0001:
+                ring.write(RAW, now, current_torque)
+                last_raw_time = now
+            # checking the event takes a lock, so only look every so often
+            loops += 1
+            if loops % 256 == 0 and not capturing.is_set():
+                break
+        status.put({'capture': capture, 'loops': loops, 'duration': time.time() - started, 'bytes_read': serial.bytes_read - bytes_read,
+                    'bytes_waiting': serial.bytes_waiting(), 'callbacks': phidget.callback_count - callbacks})
+
+    phidget.close()
+    ring.close()
+
+
+class AcquisitionClient():
+
+    def __init__(self, bench=None, start_timeout=10):
+        """Runs the sensors in a child process and reads their samples from shared memory
+
+        Device polling and timestamping happen in their own interpreter, so
+        plotting or processing in the GUI can't delay them. The GUI side only
+        copies finished records out of the ring. Stands in for the phidget and
+        serial handlers where the app configures them (calibration, axis).
+
+        Args:
+            bench (Bench, optional): devices and calibration of the bench. Defaults to the single default bench.
+            start_timeout (int, optional): seconds to wait for the devices to open. Defaults to 10.
+
+        Raises:
+            RuntimeError: the acquisition process couldn't open the sensors
+        """
+        self.logger = logging.getLogger(__name__)
+        self.bench = bench if bench is not None else Bench()
+        cal_data = load_calibration(self.bench.calibration_file)
+        self.my_cal = cal_data['My']
+        self.mz_cal = cal_data['Mz']
+
+        ctx = mp.get_context("spawn")  # a fork would copy the Qt application into the child
+        self.ring = SampleRing()
+        self.commands = ctx.Queue()
+        self.capturing = ctx.Event()
+        self.capture_id = ctx.Value('q', 0)
+        self.status = ctx.Queue()
+        self.process = ctx.Process(target=acquisition_main, name=f"acquisition {self.bench.name}", daemon=True,
+                                   args=(self.ring.name, self.ring.capacity, self.commands, self.capturing, self.capture_id,
+                                         self.status, self.bench))
+        self.process.start()
+        try:
+            message = self.status.get(timeout=start_timeout)
+        except queue.Empty:
+            message = "Timed out waiting for the sensors"
+        if message != "ready":
+            self.close()
+            raise RuntimeError(message)
+        self.logger.info("Acquiring %s in process %d", self.bench.name, self.process.pid)
+
+    def start_capture(self) -> None:
+        """Drops stale samples and starts writing new ones to the ring"""
+        self.ring.skip_to_end()
+        with self.capture_id.get_lock():
+            self.capture_id.value += 1
+        self.capturing.set()
+
+    def stop_capture(self) -> None:
+        self.capturing.clear()
+
+    def capture_counters(self, timeout=1) -> dict:
+        """Counters of the capture that was just stopped, for its telemetry
+
+        Args:
+            timeout (int, optional): seconds to wait for the process to finish the capture. Defaults to 1.
+
+        Counters of earlier captures that arrived after their wait timed out are
+        discarded, so a late report is never taken for this capture's.
+
+        Returns:
+            dict: capture, loops, duration, bytes_read, bytes_waiting and callbacks. None if the process didn't report
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                counters = self.status.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                return None
+            if isinstance(counters, dict) and counters['capture'] == self.capture_id.value:
+                return counters
+
+    def read(self) -> np.array:
+        """Records (kind, time, value) acquired since the last read. See SampleRing.read"""
+        return self.ring.read()
+
+    def get_calibration(self, my_data: bool) -> dict:
+        if my_data:
+            return self.my_cal
+        return self.mz_cal
+
+    def reload_calibration(self) -> dict:
+        """Re-reads the bench's calibration json. See PhidgetHandler.reload_calibration"""
+        cal_data = load_calibration(self.bench.calibration_file)
+        self.my_cal = cal_data['My']
+        self.mz_cal = cal_data['Mz']
+        return {'My': self.my_cal, 'Mz': self.mz_cal}
+
+    def set_my_state(self) -> None:
+        self.commands.put("my")
+
+    def set_mz_state(self) -> None:
+        self.commands.put("mz")
+
+    def set_dual_state(self, dual: bool) -> None:
+        self.commands.put("dual" if dual else "single")
+
+    def close(self) -> None:
+        """Stops the acquisition process and frees the ring"""
+        self.capturing.clear()
+        if self.process.is_alive():
+            self.commands.put("quit")
+            self.process.join(5)
+            if self.process.is_alive():
+                self.process.terminate()
+        self.ring.close()
+
+
+if __name__ == "__main__":
+    # Prints the sample rates seen through the ring for a few seconds
+    logging.basicConfig(level=logging.INFO)
+    client = AcquisitionClient()
+    client.start_capture()
+    time.sleep(3)
+    client.stop_capture()
+    records = client.read()
+    for kind, label in ((FRAME, "distance frames"), (BRIDGE, "bridge samples"), (RAW, "polled ratios")):
+        times = records['time'][records['kind'] == kind]
+        rate = (len(times) - 1) / (times[-1] - times[0]) if len(times) > 1 else 0
+        print(f"{label}: {len(times)} ({round(rate, 1)}Hz)")
+    client.close()
@@ -25,13 +25,6 @@ def descrete_dist_to_corresponding_force(dist: np.array, force: np.array) -> tup
         between 0 and 10mm
     """
     logger = logging.getLogger(__name__)
-    logger.setLevel(logging.INFO)
-    console_handler  = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    console_handler.setFormatter(formatter)
-    
-    # logger.addHandler(console_handler)
     
     unique_dists = np.sort(np.unique(dist))
     aggregate_dist = np.zeros(len(unique_dists))
@@ -59,14 +52,14 @@ def descrete_dist_to_corresponding_force(dist: np.array, force: np.array) -> tup
             aggregate_force[i] = np.mean(force[dist_indexes[0]:second_split])
             aggregate_dist[i] = unique_dists[i]
             if np.isnan(aggregate_force[i]):
-                logger.info(f"Addressing the Runtime Error by make for sample at dist {unique_dists[i]} = np.mean(force at that dist)")
+                logger.info("Addressing the Runtime Error by make for sample at dist %s = np.mean(force at that dist)", unique_dists[i])
                 aggregate_force[i] = np.mean(force[dist_indexes])
                 aggregate_dist[i] = unique_dists[i]  
             continue
         aggregate_force[i] = np.mean(force[first_split:second_split])
         aggregate_dist[i] = unique_dists[i]
         if np.isnan(aggregate_force[i]):
-            logger.info(f"Addressing the Runtime Error by make for sample at dist {unique_dists[i]} = np.mean(force at that dist)")
+            logger.info("Addressing the Runtime Error by make for sample at dist %s = np.mean(force at that dist)", unique_dists[i])
             aggregate_force[i] = np.mean(force[dist_indexes])
             aggregate_dist[i] = unique_dists[i]  
 
@@ -0,0 +1,110 @@
+import json
+import logging
+import os
+from .Calibration import CALIBRATION_FILE
+from .LivePublisher import STREAM_ENV
+
+
+BENCHES_FILE = 'benches.json'
+DATA_DIR = "Data"
+DEFAULT_BENCH_NAME = "Bench"
+
+
+class Bench():
+
+    def __init__(self, name=DEFAULT_BENCH_NAME, phidget_serial=None, phidget_channel=0, serial_port=None,
+                 calibration_file=CALIBRATION_FILE, data_dir=DATA_DIR, acquisition_process=False, stream=None):
+        """Devices and files of one test fixture
+
+        With the defaults this is the single bench the app has always driven:
+        any phidget's channel 0, the first arduino found, the shared
+        calibration and the Data folder.
+
+        Args:
+            name (str, optional): shown on the bench's tab and window. Defaults to DEFAULT_BENCH_NAME.
+            phidget_serial (int, optional): serial number of the bench's phidget. Defaults to any.
+            phidget_channel (int, optional): bridge channel of the load cell. Defaults to 0.
+            serial_port (str, optional): port of the bench's arduino (ex: COM4). Defaults to the first one that answers.
+            calibration_file (str, optional): load cell calibration json. Defaults to CALIBRATION_FILE.
+            data_dir (str, optional): folder captures are journaled and saved to. Defaults to DATA_DIR.
+            acquisition_process (bool, optional): poll the devices in a child process. Defaults to False.
+            stream (str, optional): "tcp:HOST:PORT" or "unix:PATH" to stream live samples on. Defaults to none.
+        """
+        self.name = name
+        self.phidget_serial = phidget_serial
+        self.phidget_channel = phidget_channel
+        self.serial_port = serial_port
+        self.calibration_file = calibration_file
+        self.data_dir = data_dir
+        self.acquisition_process = acquisition_process
+        self.stream = stream
+
+    def to_dict(self) -> dict:
+        return {'name': self.name, 'phidget_serial': self.phidget_serial, 'phidget_channel': self.phidget_channel,
+                'serial_port': self.serial_port, 'calibration_file': self.calibration_file,
+                'data_dir': self.data_dir, 'acquisition_process': self.acquisition_process, 'stream': self.stream}
+
+
+def default_bench() -> Bench:
+    """The single bench driven without a bench file. Streams on STREAM_ENV when it is set"""
+    return Bench(stream=os.environ.get(STREAM_ENV))
+
+
+def load_benches(path: str = BENCHES_FILE) -> list:
+    """Loads the benches this machine drives
+
+    The file holds {"benches": [{"name": ..., "phidget_serial": ...,
+    "serial_port": ...}, ...]} with the arguments of Bench. Without the file
+    there is one default bench. With several, every bench must name its
+    phidget and arduino, so no two benches can open the same device. Each
+    then saves to its own folder under Data and polls in its own process,
+    so the benches don't compete for the interpreter. STREAM_ENV only
+    applies to a single bench. Several benches can't listen on one
+    address, so each sets its own "stream".
+
+    Args:
+        path (str, optional): bench json. Defaults to BENCHES_FILE.
+
+    Raises:
+        ValueError: benches are missing or share a name, a device or a stream address
+
+    Returns:
+        list: Bench of each configured bench
+    """
+    if not os.path.exists(path):
+        return [default_bench()]
+    with open(path) as f:
+        configs = json.load(f)['benches']
+    if len(configs) == 0:
+        raise ValueError(f"No benches configured in {path}")
+    if len(configs) == 1:
+        config = dict(configs[0])
+        config.setdefault('stream', os.environ.get(STREAM_ENV))
+        return [Bench(**config)]
+    if os.environ.get(STREAM_ENV):
+        logging.getLogger(__name__).warning("%s is ignored with several benches. Set each bench's stream in %s", STREAM_ENV, path)
+
+    benches = []
+    for i, config in enumerate(configs):
+        config = dict(config)
+        config.setdefault('name', f"Bench {i + 1}")
+        if config.get('phidget_serial') is None or config.get('serial_port') is None:
+            raise ValueError(f"Bench {config.get('name')} must set phidget_serial and serial_port when several benches are configured")
+        config.setdefault('data_dir', os.path.join(DATA_DIR, config['name']))
+        config.setdefault('acquisition_process', True)
+        benches.append(Bench(**config))
+
+    for label, key in (("name", lambda b: b.name), ("phidget channel", lambda b: (b.phidget_serial, b.phidget_channel)),
+                       ("serial port", lambda b: b.serial_port), ("data folder", lambda b: os.path.normpath(b.data_dir))):
+        keys = [key(bench) for bench in benches]
+        if len(set(keys)) != len(keys):
+            raise ValueError(f"Benches in {path} share a {label}")
+    streams = [bench.stream for bench in benches if bench.stream is not None]
+    if len(set(streams)) != len(streams):
+        raise ValueError(f"Benches in {path} share a stream address")
+    return benches
+
+
+if __name__ == "__main__":
+    for bench in load_benches():
+        print(bench.to_dict())
@@ -0,0 +1,130 @@
+import numpy as np
+import json
+
+
+CALIBRATION_FILE = 'load_cell_calibration.json'
+MAD_SCALE = 1.4826  # MAD to standard deviation of normally distributed noise
+TARE_SAMPLES = 20  # phidget samples at the start of a capture the tare is taken from. 200ms at 100Hz
+TARE_THRESHOLD = 3.0  # scaled MADs from the median beyond which a sample is left out of the tare
+TARE_MIN_INLIERS = .75  # fraction of the tare samples that must be quiet
+TARE_MAX_SHIFT = 20.0  # [Nm] largest change from the calibration's own zero that is trusted
+DRIFT_MIN_SPAN = 600  # [s] tares must span this long before a drift rate is reported
+
+
+def load_calibration(path: str = CALIBRATION_FILE) -> dict:
+    """Loads the load cell calibration for both test axes
+
+    Args:
+        path (str, optional): calibration json. Defaults to CALIBRATION_FILE.
+
+    Returns:
+        dict: {'My': {...}, 'Mz': {...}} with gain, offset and lever_arm per axis
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
+def voltage_ratio_to_torque(data: np.array, cal: dict, return_val_in_newtons=False) -> np.array:
+    """Takes voltage ratio data from phidget and converts to torque on boot in Nm
+
+    Args:
+        data (np.array): voltage ratio data from phidget array
+        cal (dict): calibration of the axis the data was collected on
+        return_val_in_newtons (bool, optional): return the load cell force
+            instead of the torque. Defaults to False.
+
+    Returns:
+        np.array: torque on boot in Nm for each sample
+    """
+    # Load cell reading calculation can be found here: https://phidgets.com/docs/Calibrating_Load_Cells
+    # The equation at that link seems to be wrong!!!!!! We had to use a + instead of a -
+    load_cell_reading = (data + cal['offset'])*cal['gain'] # [N]
+    if return_val_in_newtons:
+        return load_cell_reading
+    torque_on_boot = load_cell_reading*cal['lever_arm']    # [Nm]
+    return torque_on_boot
+
+
+def robust_mean(values: np.array, threshold=TARE_THRESHOLD) -> tuple:
+    """Mean of the samples within threshold scaled MADs of the median
+
+    Args:
+        values (np.array): samples
+        threshold (float, optional): outlier threshold in scaled MADs. Defaults to TARE_THRESHOLD.
+
+    Returns:
+        float, float: the mean and the fraction of samples it includes
+    """
+    values = np.asarray(values, dtype=float)
+    median = np.median(values)
+    deviations = np.abs(values - median)
+    mad = np.median(deviations)
+    if mad == 0:
+        return float(median), float(np.mean(deviations == 0))
+    inliers = deviations <= threshold * MAD_SCALE * mad
+    return float(np.mean(values[inliers])), float(np.mean(inliers))
+
+
+def estimate_tare(bridge_ratios: np.array, cal: dict, samples=TARE_SAMPLES) -> float:
+    """Unloaded voltage ratio of the load cell, from the quiet start of a capture
+
+    The first phidget samples are taken before the boot is loaded. Their
+    robust mean replaces the static offset of the calibration file, which
+    drifts with temperature and fixture preload.
+
+    Args:
+        bridge_ratios (np.array): phidget samples of the capture in order
+        cal (dict): calibration of the axis, for the sanity check
+        samples (int, optional): samples the tare is taken from. Defaults to TARE_SAMPLES.
+
+    Returns:
+        float: voltage ratio at zero load. None if there are too few samples,
+            they aren't quiet or the tare is implausibly far from the calibration's zero
+    """
+    if len(bridge_ratios) < samples:
+        return None
+    tare, inliers = robust_mean(bridge_ratios[:samples])
+    if inliers < TARE_MIN_INLIERS:
+        return None
+    if abs(voltage_ratio_to_torque(tare, cal)) > TARE_MAX_SHIFT:
+        return None
+    return tare
+
+
+def tared_calibration(cal: dict, tare: float) -> dict:
+    """Calibration of an axis zeroed at a tare (None keeps the calibration file's offset)"""
+    if tare is None:
+        return cal
+    return dict(cal, offset=-tare)
+
+
+class TareDrift():
+
+    def __init__(self):
+        """Tares of the captures of a session, to see how far the zero wanders"""
+        self.tares = {'My': [], 'Mz': []}  # axis -> (seconds since epoch, tare)
+
+    def add(self, axis: str, captured_at, tare: float) -> None:
+        self.tares[axis].append((captured_at.timestamp(), tare))
+
+    def summary(self, axis: str, cal: dict) -> dict:
+        """Drift of the zero of an axis over the session, in boot torque
+
+        Args:
+            axis (str): "My" or "Mz"
+            cal (dict): calibration of the axis, to express the drift in Nm
+
+        Returns:
+            dict: count, std and range [Nm] of the tares, drift rate [Nm/hour]
+                (0 until the tares span DRIFT_MIN_SPAN) and the shift [Nm] of the latest
+                tare from the calibration file's zero
+        """
+        if len(self.tares[axis]) == 0:
+            return {'count': 0}
+        times, tares = np.array(self.tares[axis]).T
+        torques = tares * cal['gain'] * cal['lever_arm']  # [Nm] per unit of voltage ratio
+        rate = 0.0
+        if np.ptp(times) >= DRIFT_MIN_SPAN:
+            rate = float(np.polyfit((times - times[0]) / 3600, torques, 1)[0])
+        return {'count': len(tares), 'std': float(np.std(torques)), 'range': float(np.ptp(torques)),
+                'rate_per_hour': rate, 'shift': float(voltage_ratio_to_torque(tares[-1], cal))}
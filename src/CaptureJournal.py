@@ -0,0 +1,251 @@
+import numpy as np
+import errno
+import json
+import logging
+import os
+import shutil
+import struct
+import sys
+import time
+from datetime import datetime
+
+
+MAGIC = b"AFJ1"
+HEADER = struct.Struct("<4sI")  # magic, length of the json metadata that follows
+RECORD = struct.Struct("<Bdd")  # kind, time [s] since capture start, value
+RECORD_DTYPE = np.dtype([('kind', '<u1'), ('time', '<f8'), ('value', '<f8')])  # same layout for reading back
+JOURNAL_SUFFIX = ".afj"
+NO_LINK_ERRORS = (errno.EPERM, errno.EXDEV, errno.ENOTSUP, errno.EOPNOTSUPP, errno.EMLINK)  # link failures that copying works around
+
+# record kinds
+FRAME = 0   # distance frame from the arduino. value is the distance [mm] relative to the first frame
+BRIDGE = 1  # new phidget sample. time is the callback time, value is the voltage ratio
+RAW = 2     # voltage ratio polled by the capture loop
+CROSS_FRAME = 3  # frame of the other axis' distance sensor when both stream. value is relative to its first frame
+
+# companion csvs saved next to the main csv of a run
+RAW_SUFFIX = "_raw_torque_div_bsl.csv"
+GRAPHED_SUFFIX = "_graphed.csv"
+CROSS_SUFFIX = "_cross_axis.csv"
+
+
+class CaptureJournal():
+
+    def __init__(self, path: str, metadata: dict, fsync_interval=.5):
+        """Append only binary journal that a capture is streamed into as it runs
+
+        Every sample is written as a fixed size record the moment it is taken,
+        so a pull is on disk before anyone clicks save and survives a crash.
+        The file is synced to disk every fsync_interval seconds and on close.
+
+        Args:
+            path (str): journal file to create
+            metadata (dict): json serializable details needed to process the
+                capture later (axis, BSL, calibration, ...)
+            fsync_interval (float, optional): max seconds between syncs. Defaults to .5.
+        """
+        self.path = path
+        self.fsync_interval = fsync_interval
+        self.record_count = 0
+        meta_bytes = json.dumps(metadata).encode()
+        self.f = open(path, "wb")
+        self.f.write(HEADER.pack(MAGIC, len(meta_bytes)))
+        self.f.write(meta_bytes)
+        self.sync()
+
+    def append(self, kind: int, t: float, value: float) -> None:
+        """Writes one record. Cheap enough to call from the capture loop
+
+        Args:
+            kind (int): FRAME, BRIDGE, RAW or CROSS_FRAME
+            t (float): seconds since the capture started
+            value (float): distance or voltage ratio
+        """
+        self.f.write(RECORD.pack(kind, t, value))
+        self.record_count += 1
+        # only check the clock every so often to keep appends cheap
+        if self.record_count % 64 == 0 and time.monotonic() - self.last_sync > self.fsync_interval:
+            self.sync()
+
+    def sync(self) -> None:
+        """Flushes python's buffer and forces the file to disk"""
+        self.f.flush()
+        os.fsync(self.f.fileno())
+        self.last_sync = time.monotonic()
+
+    def close(self) -> None:
+        if not self.f.closed:
+            self.sync()
+            self.f.close()
+
+
+def new_journal_path(journal_dir: str) -> str:
+    """Unique path for the journal of a new capture
+
+    Args:
+        journal_dir (str): folder holding uncommitted journals
+
+    Returns:
+        str: path of the journal file
+    """
+    return os.path.join(journal_dir, "capture_" + datetime.now().strftime("%Y%m%d_%H%M%S_%f") + JOURNAL_SUFFIX)
+
+
+def commit_journal(journal_path: str, dest_path: str, journal_dir: str) -> str:
+    """Saves a capture by linking its journal under the chosen name
+
+    Only directory metadata changes, so this takes the same time no matter how
+    large the capture is. Journals still in the uncommitted folder are moved
+    out of it, journals that were already committed get an extra name.
+
+    Args:
+        journal_path (str): current location of the journal
+        dest_path (str): where the saved journal should live
+        journal_dir (str): folder holding uncommitted journals
+
+    Raises:
+        FileExistsError: a different file already has the name. It is never overwritten
+
+    Returns:
+        str: dest_path
+    """
+    if os.path.exists(dest_path) and os.path.samefile(journal_path, dest_path):
+        return dest_path  # already saved under this name
+    try:
+        os.link(journal_path, dest_path)
+    except OSError as e:
+        if e.errno not in NO_LINK_ERRORS:
+            raise
+        # file systems without hard links (FAT usb sticks). Opened exclusively so nothing is overwritten
+        with open(journal_path, "rb") as src, open(dest_path, "xb") as dest:
+            shutil.copyfileobj(src, dest)
+    if os.path.dirname(os.path.abspath(journal_path)) == os.path.abspath(journal_dir):
+        os.remove(journal_path)
+    return dest_path
+
+
+def read_journal(path: str) -> tuple:
+    """Reads a journal back, ignoring a partially written last record
+
+    Args:
+        path (str): journal file
+
+    Returns:
+        tuple: metadata dict, structured array of records
+    """
+    with open(path, "rb") as f:
+        magic, meta_len = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a capture journal")
+        metadata = json.loads(f.read(meta_len))
+        body = f.read()
+    count = len(body) // RECORD_DTYPE.itemsize
+    records = np.frombuffer(body, dtype=RECORD_DTYPE, count=count)
+    return metadata, records
+
+
+def split_streams(records: np.array) -> dict:
+    """Separates the records of a journal by kind
+
+    Args:
+        records (np.array): records from read_journal
+
+    Returns:
+        dict: kind -> (times, values) arrays in capture order
+    """
+    streams = {}
+    for kind in (FRAME, BRIDGE, RAW, CROSS_FRAME):
+        mask = records['kind'] == kind
+        streams[kind] = (records['time'][mask], records['value'][mask])
+    return streams
+
+
+def recover_journal(path: str, out_dir: str) -> list:
+    """Rebuilds the csvs of a capture from its journal
+
+    Captures that streamed both distance sensors also get the other axis'
+    displacements. Without bridge samples the torque of each frame is
+    interpolated from the polled ratios instead, like the live processing
+    pairs each frame with the latest poll.
+
+    Args:
+        path (str): journal file
+        out_dir (str): folder to write the csvs to
+
+    Raises:
+        ValueError: the journal has no torque samples at all
+
+    Returns:
+        list: paths of the written csvs
+    """
+    from .AggregateRawData import descrete_dist_to_corresponding_force
+    from .Calibration import voltage_ratio_to_torque, estimate_tare, tared_calibration
+    from .ExportWriter import write_csv_atomic
+    from .PeakDetector import distinct_samples
+    from .SensorAlignment import align_torque_to_distance
+
+    metadata, records = read_journal(path)
+    streams = split_streams(records)
+    frame_times, distances = streams[FRAME]
+    bridge_times, bridge_ratios = streams[BRIDGE]
+    raw_times, raw_ratios = streams[RAW]
+    if len(bridge_times) <= 1:
+        logging.getLogger(__name__).warning("%s has no bridge samples. Interpolating torque from the polled ratios", path)
+        bridge_times, bridge_ratios = distinct_samples(raw_times, raw_ratios)
+    if len(bridge_times) == 0:
+        raise ValueError(f"{path} has no torque samples")
+    cal = metadata['calibration']['My' if metadata['testing_My'] else 'Mz']
+    if metadata.get('auto_tare', False):
+        cal = tared_calibration(cal, estimate_tare(bridge_ratios.astype(np.float32), cal))
+    BSL = metadata['bsl']
+
+    ratios = align_torque_to_distance(frame_times, bridge_times, bridge_ratios, cal.get('sensor_lag', 0.0))
+    mask = (distances < metadata['numb_mm_to_measure']) & (distances >= 0)
+    distances = distances[mask]
+    torques_div_BSL = voltage_ratio_to_torque(ratios[mask], cal) / (BSL/1000)
+    raw_torques_div_BSL = voltage_ratio_to_torque(raw_ratios, cal) / (BSL/1000)
+    aggregate_dist, aggregate_torques_div_BSL = descrete_dist_to_corresponding_force(distances, torques_div_BSL)
+
+    name = os.path.join(out_dir, os.path.splitext(os.path.basename(path))[0] + "_recovered")
+    files = [
+        (name + ".csv", (distances, torques_div_BSL), 'Distance[mm],Torque_div_BSL[N]'),
+        (name + RAW_SUFFIX, (raw_times, raw_torques_div_BSL), 'Time[s],Torque_div_BSL[N]'),
+        (name + GRAPHED_SUFFIX, (aggregate_dist, aggregate_torques_div_BSL), 'Distance[mm],Torque_div_BSL[N]'),
+    ]
+    cross_times, cross_displacements = streams[CROSS_FRAME]
+    if len(cross_times) > 0:
+        cross_axis = 'Mz' if metadata['testing_My'] else 'My'
+        files.append((name + CROSS_SUFFIX, (cross_times, cross_displacements), f'Time[s],Displacement_{cross_axis}[mm]'))
+    return write_csv_atomic(files)
+
+
+def list_journals(journal_dir: str) -> list:
+    """Journals in a folder, oldest first
+
+    Args:
+        journal_dir (str): folder to search
+
+    Returns:
+        list: journal paths
+    """
+    if not os.path.isdir(journal_dir):
+        return []
+    return sorted(os.path.join(journal_dir, name) for name in os.listdir(journal_dir) if name.endswith(JOURNAL_SUFFIX))
+
+
+if __name__ == "__main__":
+    # Recovery tool. python -m src.CaptureJournal [journal file or folder] [output folder]
+    logger = logging.getLogger(__name__)
+    logging.basicConfig(level=logging.INFO)
+    target = sys.argv[1] if len(sys.argv) > 1 else os.path.join("Data", "journal")
+    out_dir = sys.argv[2] if len(sys.argv) > 2 else "Data"
+
+    journals = list_journals(target) if os.path.isdir(target) else [target]
+    if len(journals) == 0:
+        logger.info("No journals found in %s", target)
+    for journal in journals:
+        try:
+            paths = recover_journal(journal, out_dir)
+            logger.info("Recovered %s to:\n\t%s", journal, "\n\t".join(paths))
+        except Exception as e:
+            logger.error("Could not recover %s: %s", journal, e)
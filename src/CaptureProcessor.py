@@ -0,0 +1,50 @@
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+import logging
+import time
+from .CaptureResult import CaptureResult
+from .SensorAlignment import estimate_sensor_lag
+
+
+class ProcessorSignals(QObject):
+    """Signals of CaptureProcessor. QRunnable can't define its own"""
+    processed = pyqtSignal(object, object, bool)  # capture, lag estimated from the pull (None without bridge samples), new pull
+    failed = pyqtSignal(object, str, bool)  # capture, error, new pull
+
+
+class CaptureProcessor(QRunnable):
+
+    def __init__(self, capture: CaptureResult, signals: ProcessorSignals, new_pull=True):
+        """Does the numeric work of a pull off the GUI thread
+
+        Computes every derived value of the capture (alignment, torque
+        conversion, aggregation, z values, speed, dwell table) and estimates the
+        sensor lag, then hands the capture back with everything cached so the
+        GUI thread only has to update widgets.
+
+        Args:
+            capture (CaptureResult): pull to process
+            signals (ProcessorSignals): where the result is reported. Shared by
+                every processor so connections are made once
+            new_pull (bool, optional): False when an already displayed pull is
+                reprocessed with new settings. Defaults to True.
+        """
+        super().__init__()
+        self.capture = capture
+        self.signals = signals
+        self.new_pull = new_pull
+
+    def run(self) -> None:
+        logger = logging.getLogger(__name__)
+        start = time.perf_counter()
+        try:
+            lag = None
+            if self.new_pull and len(self.capture.bridge_times) > 1:
+                lag = estimate_sensor_lag(self.capture.frame_times, self.capture.relative_distances,
+                                          self.capture.bridge_times, self.capture.bridge_ratios)
+            self.capture.compute()
+        except Exception as e:
+            logger.exception("Could not process the capture")
+            self.signals.failed.emit(self.capture, str(e), self.new_pull)
+            return
+        logger.debug("Processed capture in %.1fms", (time.perf_counter() - start) * 1000)
+        self.signals.processed.emit(self.capture, lag, self.new_pull)
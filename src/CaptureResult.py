@@ -0,0 +1,354 @@
+import numpy as np
+import functools
+import logging
+from .AggregateRawData import descrete_dist_to_corresponding_force
+from .Calibration import voltage_ratio_to_torque, estimate_tare, tared_calibration
+from .PeakDetector import detect_peak, distinct_samples, displacement_at
+from .SensorAlignment import align_torque_to_distance
+from .StandardsRegistry import z_of_peak
+from .ZUncertainty import z_confidence_intervals
+from .StageProfiler import PROFILER
+
+
+# stage -> settings and stages it is computed from. Filled in definition order by memoized
+STAGE_DEPENDENCIES = {}
+
+# name each stage is timed under by the profiler. The rest count as other processing
+PROFILED_STAGES = {
+    'frame_ratios': "pairing",
+    'torques': "torque conversion", 'raw_torques_div_BSL': "torque conversion", 'bridge_torques_div_BSL': "torque conversion",
+    'aggregated': "aggregation",
+    'peak': "peak detection",
+    'z_values': "ISO evaluation", 'z_intervals': "ISO evaluation",
+}
+
+
+def memoized(*depends):
+    """Turns a method of CaptureResult into a property computed on first access
+
+    Args:
+        depends (str): settings ('bsl', 'testing_My', 'calibrations', 'auto_tare') and other
+            stages the value is computed from. Changing any of them discards it
+    """
+    def decorator(method):
+        name = method.__name__
+        STAGE_DEPENDENCIES[name] = depends
+        label = PROFILED_STAGES.get(name, "other processing")
+
+        @functools.wraps(method)
+        def getter(self):
+            try:
+                return self._cache[name]
+            except KeyError:
+                with self.profiler.stage(label):
+                    value = self._cache[name] = method(self)
+                return value
+        return property(getter)
+    return decorator
+
+
+class CaptureResult():
+    __slots__ = ('raw_distances', 'first_distance', 'frame_times', 'paired_ratios', 'raw_times', 'raw_ratios',
+                 'bridge_times', 'bridge_ratios', '_testing_My', '_bsl', '_calibrations', '_auto_tare',
+                 'numb_mm_to_measure', 'captured_at', 'telemetry', 'cross_frame_times', 'cross_distances', 'profiler', '_cache')
+
+    def __init__(self, raw_distances, first_distance, frame_times, paired_ratios, raw_times, raw_ratios,
+                 bridge_times, bridge_ratios, testing_My, bsl, calibrations, numb_mm_to_measure, captured_at, auto_tare=False,
+                 telemetry=None, cross_frame_times=(), cross_distances=(), profiler=PROFILER):
+        """Everything collected during one pull, in a compact form
+
+        Only what was measured is stored: sensor distances as bytes, times
+        relative to the start of the capture as float32 and the bridge voltage
+        ratios. Everything shown to the user is derived from those on first
+        access and cached, so nothing that isn't looked at gets computed.
+        Changing the BSL, axis, calibration or tare afterwards only discards the
+        stages downstream of that setting.
+
+        Args:
+            raw_distances (np.array): uint8 distance [mm] reported by the arduino per frame
+            first_distance (int): distance [mm] of the first frame. Displacement is relative to it
+            frame_times (np.array): float32 time [s] each frame was received
+            paired_ratios (np.array): voltage ratio most recently reported when each frame arrived
+            raw_times (np.array): float32 time [s] of each polled voltage ratio
+            raw_ratios (np.array): polled voltage ratios
+            bridge_times (np.array): float32 time [s] of each phidget sample
+            bridge_ratios (np.array): voltage ratio of each phidget sample
+            testing_My (bool): True if the pull was on the My axis, False for Mz
+            bsl (int): boot sole length [mm]
+            calibrations (dict): load cell calibration of both axes
+            numb_mm_to_measure (int): displacement [mm] the release is evaluated over
+            captured_at (datetime): when the capture started
+            auto_tare (bool, optional): zero the load cell at the start of the pull instead
+                of using the calibration's offset. Defaults to False.
+            telemetry (CaptureTelemetry, optional): acquisition health of the pull. None
+                for pulls recovered from a journal
+            cross_frame_times (np.array, optional): float32 time [s] of each frame of the other
+                axis' distance sensor, when both sensors streamed. Defaults to none.
+            cross_distances (np.array, optional): uint8 distance [mm] of each of those frames
+            profiler (StageProfiler, optional): times the stages of the pull. Defaults to PROFILER.
+        """
+        self.raw_distances = np.array(raw_distances, dtype=np.uint8)
+        self.first_distance = int(first_distance)
+        self.frame_times = np.array(frame_times, dtype=np.float32)
+        self.paired_ratios = np.array(paired_ratios, dtype=np.float32)
+        self.raw_times = np.array(raw_times, dtype=np.float32)
+        self.raw_ratios = np.array(raw_ratios, dtype=np.float32)
+        self.bridge_times = np.array(bridge_times, dtype=np.float32)
+        self.bridge_ratios = np.array(bridge_ratios, dtype=np.float32)
+        self._testing_My = testing_My
+        self._bsl = bsl
+        self._calibrations = calibrations
+        self._auto_tare = auto_tare
+        self.numb_mm_to_measure = numb_mm_to_measure
+        self.captured_at = captured_at
+        self.telemetry = telemetry
+        self.cross_frame_times = np.array(cross_frame_times, dtype=np.float32)
+        self.cross_distances = np.array(cross_distances, dtype=np.uint8)
+        self.profiler = profiler
+        self._cache = {}
+
+    # -- Settings. Changing one discards every stage that depends on it -------
+    @property
+    def bsl(self) -> int:
+        return self._bsl
+
+    @bsl.setter
+    def bsl(self, bsl: int) -> None:
+        self._bsl = bsl
+        self._invalidate('bsl')
+
+    @property
+    def testing_My(self) -> bool:
+        return self._testing_My
+
+    @testing_My.setter
+    def testing_My(self, testing_My: bool) -> None:
+        self._testing_My = testing_My
+        self._invalidate('testing_My')
+
+    @property
+    def calibrations(self) -> dict:
+        return self._calibrations
+
+    @calibrations.setter
+    def calibrations(self, calibrations: dict) -> None:
+        self._calibrations = calibrations
+        self._invalidate('calibrations')
+
+    @property
+    def auto_tare(self) -> bool:
+        return self._auto_tare
+
+    @auto_tare.setter
+    def auto_tare(self, auto_tare: bool) -> None:
+        self._auto_tare = auto_tare
+        self._invalidate('auto_tare')
+
+    def _invalidate(self, setting: str) -> None:
+        """Discards the cached stages that depend on a setting, directly or not"""
+        stale = {setting}
+        for stage, depends in STAGE_DEPENDENCIES.items():
+            if stale.intersection(depends):
+                stale.add(stage)
+                self._cache.pop(stage, None)
+
+    def update_settings(self, bsl=None, testing_My=None, calibrations=None, auto_tare=None) -> list:
+        """Applies corrected settings to the pull, only recomputing what they affect
+
+        Args:
+            bsl (int, optional): boot sole length [mm]
+            testing_My (bool, optional): True if the pull was on the My axis, False for Mz
+            calibrations (dict, optional): load cell calibration of both axes
+            auto_tare (bool, optional): zero the load cell at the start of the pull
+
+        Returns:
+            list: names of the settings that changed
+        """
+        changed = []
+        if bsl is not None and bsl != self._bsl:
+            self.bsl = bsl
+            changed.append('bsl')
+        if testing_My is not None and testing_My != self._testing_My:
+            self.testing_My = testing_My
+            changed.append('testing_My')
+        if calibrations is not None and calibrations != self._calibrations:
+            self.calibrations = calibrations
+            changed.append('calibrations')
+        if auto_tare is not None and auto_tare != self._auto_tare:
+            self.auto_tare = auto_tare
+            changed.append('auto_tare')
+        return changed
+
+    @property
+    def has_data(self) -> bool:
+        """False when the capture was aborted or nothing was measured"""
+        return bool(np.any(self.relative_distances) and np.any(self.paired_ratios))
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the measured arrays"""
+        return sum(getattr(self, name).nbytes for name in ('raw_distances', 'frame_times', 'paired_ratios', 'raw_times',
+                                                            'raw_ratios', 'bridge_times', 'bridge_ratios'))
+
+    # -- Derived quantities. Computed on first access -------------------------
+    @memoized('testing_My', 'calibrations')
+    def tare(self) -> float:
+        """Unloaded voltage ratio from the quiet start of the pull. None if it couldn't be trusted"""
+        return estimate_tare(self.bridge_ratios, self._calibrations['My' if self._testing_My else 'Mz'])
+
+    @memoized('testing_My', 'calibrations', 'auto_tare', 'tare')
+    def calibration(self) -> dict:
+        """Calibration of the axis the pull is interpreted as, zeroed at the tare when auto_tare is on"""
+        return tared_calibration(self._calibrations['My' if self._testing_My else 'Mz'], self.tare if self._auto_tare else None)
+
+    @memoized()
+    def relative_distances(self) -> np.array:
+        return self.raw_distances.astype(np.int16) - self.first_distance
+
+    @memoized()
+    def cross_displacements(self) -> np.array:
+        """Displacement [mm] of the other axis' sensor relative to its first frame. Empty unless both sensors streamed"""
+        if len(self.cross_distances) == 0:
+            return np.zeros(0, dtype=np.int16)
+        return self.cross_distances.astype(np.int16) - int(self.cross_distances[0])
+
+    @memoized('calibration')
+    def frame_ratios(self) -> np.array:
+        """Voltage ratio at the time of each frame, interpolated from the bridge samples"""
+        if len(self.bridge_times) > 1:
+            return align_torque_to_distance(self.frame_times, self.bridge_times, self.bridge_ratios, self.calibration.get('sensor_lag', 0.0))
+        return self.paired_ratios
+
+    @memoized('relative_distances')
+    def in_range(self) -> np.array:
+        return (self.relative_distances < self.numb_mm_to_measure) & (self.relative_distances >= 0)
+
+    @memoized('relative_distances', 'in_range')
+    def distances(self) -> np.array:
+        """Displacement [mm] of each frame within the evaluated range"""
+        return self.relative_distances[self.in_range]
+
+    @memoized('frame_ratios', 'in_range', 'calibration')
+    def torques(self) -> np.array:
+        """Boot torque [Nm] of each frame within the evaluated range"""
+        return voltage_ratio_to_torque(self.frame_ratios[self.in_range], self.calibration)
+
+    @memoized('torques', 'bsl')
+    def torques_div_BSL(self) -> np.array:
+        return self.torques / (self.bsl/1000) # [N] Normalized boot torque. Note how BSL is coverted to meters
+
+    @memoized('calibration', 'bsl')
+    def raw_torques_div_BSL(self) -> np.array:
+        return voltage_ratio_to_torque(self.raw_ratios, self.calibration) / (self.bsl/1000)
+
+    @memoized('distances', 'torques_div_BSL')
+    def aggregated(self) -> tuple:
+        """Release curve. Distances and torque/BSL averaged per mm"""
+        return descrete_dist_to_corresponding_force(self.distances, self.torques_div_BSL)
+
+    @memoized('calibration', 'bsl')
+    def bridge_torques_div_BSL(self) -> np.array:
+        return voltage_ratio_to_torque(self.bridge_ratios, self.calibration) / (self.bsl/1000)
+
+    @memoized('bridge_torques_div_BSL', 'raw_torques_div_BSL')
+    def peak(self):
+        """Spike rejecting peak detector run over the pull, the same one that ran live
+
+        Runs over the phidget samples. Captures without them use the polled
+        ratios with the repeats of each sample dropped.
+        """
+        if len(self.bridge_times) > 0:
+            return detect_peak(self.bridge_times, self.bridge_torques_div_BSL)
+        return detect_peak(*distinct_samples(self.raw_times, self.raw_torques_div_BSL))
+
+    @memoized('peak')
+    def peak_torque_div_BSL(self) -> float:
+        return float(self.peak.value) if self.peak.found else 0.0
+
+    @memoized('peak', 'relative_distances')
+    def peak_displacement(self) -> int:
+        """Displacement [mm] of the boot when the peak was sampled"""
+        return displacement_at(self.peak.time, self.frame_times, self.relative_distances)
+
+    @memoized('distances', 'torques')
+    def max_force_dist(self) -> int:
+        """Displacement [mm] where the paired torque peaked. 0 if no frame was within the evaluated range"""
+        if len(self.torques) == 0:
+            return 0
+        return int(self.distances[self.torques.argmax()])
+
+    @memoized('peak_torque_div_BSL', 'testing_My')
+    def z_values(self) -> tuple:
+        """z of the peak per ISO 13992 and ISO 11088"""
+        return z_of_peak("My" if self.testing_My else "Mz", self.peak_torque_div_BSL)
+
+    @memoized('peak', 'peak_torque_div_BSL', 'bridge_torques_div_BSL', 'testing_My', 'calibration', 'bsl')
+    def z_intervals(self) -> tuple:
+        """95% confidence interval (low, high) of the z per ISO 13992 and ISO 11088
+
+        Combines the fit covariance of each standard, the calibration
+        uncertainty and a bootstrap of the bridge samples around the spike rejected peak
+        """
+        return z_confidence_intervals(self.peak_torque_div_BSL, self.testing_My, self.bsl, self.calibration,
+                                      self.bridge_times, self.bridge_torques_div_BSL, self.peak.time)
+
+    @memoized()
+    def frame_period(self) -> float:
+        """Average seconds between distance frames"""
+        return float(np.average(np.diff(self.frame_times)))
+
+    @memoized('distances', 'frame_period')
+    def dwell_table(self) -> np.array:
+        """Seconds spent at each displacement from 1mm to numb_mm_to_measure
+
+        Helps the user know if they had a fairly consistent velocity on the
+        din release. Could be considered equivalent to speed per mm of release
+        """
+        counts = np.bincount(self.distances, minlength=self.numb_mm_to_measure + 1)[1:self.numb_mm_to_measure + 1]
+        return np.round(self.frame_period * counts, 2)
+
+    @memoized('distances', 'frame_period', 'bsl')
+    def speed(self) -> tuple:
+        """Calculates the speed of the boot release based on sample rate + distance
+
+        Over the distance of 2mm to 10mm we travel .08 meters. Each sample is
+        taken at the same sample rate. Thus, we can derive speed
+
+        Returns:
+            float, float: speed in meters per second and angular speed in deg/s
+        """
+        start_dist = 2  #mm
+        end_dist = 10  #mm
+        covered_distance = end_dist - start_dist
+        numb_distances = np.sum((self.distances >= start_dist) & (self.distances < end_dist))
+        durration = numb_distances * self.frame_period  # seconds
+        if durration == 0:
+            logging.getLogger(__name__).error("Could not derive speed from distance measurements")
+            return 0, 0
+        speed = (covered_distance * .001) / durration  # meters per second
+        angular_speed = np.rad2deg(np.arcsin(covered_distance / self.bsl)) / durration
+        return round(float(speed), 2), round(float(angular_speed), 4)
+
+    def compute(self) -> None:
+        """Computes every derived value that isn't cached yet
+
+        Lets a background thread do all of the processing up front so whoever
+        displays the capture only reads cached results.
+        """
+        for stage in STAGE_DEPENDENCIES:
+            getattr(self, stage)
+
+    def summary(self) -> dict:
+        """Metadata and key results of the capture, as stored in the run catalog"""
+        z13, z11 = self.z_values
+        speed, angular_speed = self.speed
+        return {
+            'axis': "My" if self.testing_My else "Mz", 'bsl': self.bsl,
+            'gain': self.calibration['gain'], 'offset': self.calibration['offset'], 'lever_arm': self.calibration['lever_arm'],
+            'tare': self.tare if self.auto_tare else None,
+            'captured_at': self.captured_at.isoformat(timespec="seconds"),
+            'peak_torque_div_bsl': self.peak_torque_div_BSL,
+            'peak_displacement': self.peak_displacement, 'peak_spikes': self.peak.spikes,
+            'z_iso13992': float(z13), 'z_iso11088': float(z11),
+            'speed': speed, 'angular_speed': angular_speed,
+        }
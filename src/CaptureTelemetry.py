@@ -0,0 +1,188 @@
+import json
+import os
+
+
+TELEMETRY_SUFFIX = "_telemetry.json"
+INTERVAL_BIN = .001  # [s] width of each interval histogram bin
+INTERVAL_BINS = 50  # the last bin also counts every longer interval
+FRAME_PERIOD = .01  # [s] the arduino reports a distance frame every 10ms
+BRIDGE_PERIOD = .01  # [s] the phidget data interval
+LATE_FACTOR = 1.5  # an interval this many periods long counts as late
+MIN_LOOP_RATE = 2000  # [Hz] below this the capture loop can't reliably catch every frame and sample
+MAX_LATE_SHARE = .02  # share of late intervals tolerated before timing counts as degraded
+
+
+class IntervalHistogram():
+    __slots__ = ('period', 'counts', 'last', 'intervals', 'total', 'total_sq', 'longest', 'late')
+
+    def __init__(self, period: float):
+        """Histogram of the time between consecutive events, built one event at a time
+
+        Each event costs a subtraction, a division and a few additions, so it
+        can sit in the capture loop. Bins are INTERVAL_BIN wide.
+
+        Args:
+            period (float): expected seconds between events. Longer than LATE_FACTOR of it is late
+        """
+        self.period = period
+        self.counts = [0] * INTERVAL_BINS
+        self.last = None
+        self.intervals = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.longest = 0.0
+        self.late = 0
+
+    def add(self, time: float) -> None:
+        """Takes the time [s] of the next event"""
+        if self.last is not None:
+            interval = time - self.last
+            self.counts[min(int(interval / INTERVAL_BIN), INTERVAL_BINS - 1)] += 1
+            self.intervals += 1
+            self.total += interval
+            self.total_sq += interval * interval
+            if interval > self.longest:
+                self.longest = interval
+            if interval > LATE_FACTOR * self.period:
+                self.late += 1
+        self.last = time
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.intervals if self.intervals > 0 else 0.0
+
+    @property
+    def jitter(self) -> float:
+        """Standard deviation of the intervals [s]"""
+        if self.intervals < 2:
+            return 0.0
+        return max(self.total_sq / self.intervals - self.mean**2, 0.0)**.5
+
+    @property
+    def rate(self) -> float:
+        return 1 / self.mean if self.mean > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {'intervals': self.intervals, 'rate_hz': self.rate, 'mean_ms': 1000 * self.mean,
+                'jitter_ms': 1000 * self.jitter, 'longest_ms': 1000 * self.longest, 'late': self.late,
+                'bin_ms': 1000 * INTERVAL_BIN, 'histogram': list(self.counts)}
+
+
+class CaptureTelemetry():
+    __slots__ = ('source', 'loops', 'frames', 'bridge', 'raw_samples', 'bytes_read', 'bytes_arrived',
+                 'callbacks', 'bridge_overflow', 'raw_overflow', 'duration')
+
+    def __init__(self, source: str):
+        """Health of one capture: how fast the loop ran and whether every sample made it
+
+        The capture path bumps the counters and feeds the histograms as it
+        goes. Device counters (serial bytes, phidget callbacks) are read once
+        at the end by finish.
+
+        Args:
+            source (str): "thread" when the app polled the devices, "process" for the acquisition process
+        """
+        self.source = source
+        self.loops = 0  # passes of the polling loop
+        self.frames = IntervalHistogram(FRAME_PERIOD)  # distance frames
+        self.bridge = IntervalHistogram(BRIDGE_PERIOD)  # new phidget samples seen by the loop
+        self.raw_samples = 0
+        self.bytes_read = 0  # serial bytes the loop read
+        self.bytes_arrived = 0  # serial bytes the arduino sent. More than read means frames were left behind
+        self.callbacks = 0  # phidget callbacks. More than bridge samples means the loop missed samples
+        self.bridge_overflow = 0  # samples that didn't fit in the capture arrays
+        self.raw_overflow = 0
+        self.duration = 0.0
+
+    def finish(self, duration: float, bytes_read: int, bytes_waiting: int, callbacks: int, loops=None) -> None:
+        """Ends the capture with the counters of the devices
+
+        Args:
+            duration (float): seconds the capture ran
+            bytes_read (int): serial bytes read during the capture
+            bytes_waiting (int): serial bytes still unread when it ended
+            callbacks (int): phidget callbacks during the capture
+            loops (int, optional): polling loop passes, when they were counted elsewhere
+        """
+        self.duration = duration
+        self.bytes_read = bytes_read
+        self.bytes_arrived = bytes_read + bytes_waiting
+        self.callbacks = callbacks
+        if loops is not None:
+            self.loops = loops
+
+    @property
+    def loop_rate(self) -> float:
+        return self.loops / self.duration if self.duration > 0 else 0.0
+
+    @property
+    def missed_samples(self) -> int:
+        """Phidget samples that were replaced before the loop saw them"""
+        seen = self.bridge.intervals + (self.bridge.last is not None)
+        return max(self.callbacks - seen, 0)
+
+    def problems(self) -> list:
+        """What about this capture's timing looks degraded
+
+        Returns:
+            list: a short description of each problem. Empty if the capture was healthy
+        """
+        problems = []
+        if self.loops > 0 and self.duration > 0 and self.loop_rate < MIN_LOOP_RATE:
+            problems.append(f"loop ran at {self.loop_rate:.0f}Hz")
+        for name, intervals in (("frames", self.frames), ("bridge samples", self.bridge)):
+            if intervals.intervals > 0 and intervals.late > MAX_LATE_SHARE * intervals.intervals:
+                problems.append(f"{intervals.late} late {name}, longest gap {1000 * intervals.longest:.0f}ms")
+        if self.bytes_arrived > self.bytes_read + 1:
+            problems.append(f"{self.bytes_arrived - self.bytes_read} serial bytes left unread")
+        if self.missed_samples > 0:
+            problems.append(f"{self.missed_samples} phidget samples missed")
+        if self.bridge_overflow > 0 or self.raw_overflow > 0:
+            problems.append(f"{self.bridge_overflow + self.raw_overflow} samples didn't fit in the capture")
+        return problems
+
+    def status(self) -> str:
+        """One line summary for the status panel"""
+        return (f"Loop {self.loop_rate / 1000:.1f}kHz | Frames {self.frames.rate:.1f}Hz "
+                f"±{1000 * self.frames.jitter:.1f}ms, max gap {1000 * self.frames.longest:.0f}ms | "
+                f"Bridge {self.bridge.rate:.1f}Hz, {self.missed_samples} missed | "
+                f"Serial {self.bytes_read}/{self.bytes_arrived}B")
+
+    def to_dict(self) -> dict:
+        return {'source': self.source, 'duration_s': self.duration, 'loops': self.loops, 'loop_rate_hz': self.loop_rate,
+                'frames': self.frames.to_dict(), 'bridge': self.bridge.to_dict(), 'raw_samples': self.raw_samples,
+                'bytes_read': self.bytes_read, 'bytes_arrived': self.bytes_arrived,
+                'phidget_callbacks': self.callbacks, 'missed_samples': self.missed_samples,
+                'bridge_overflow': self.bridge_overflow, 'raw_overflow': self.raw_overflow,
+                'problems': self.problems()}
+
+
+def save_telemetry(telemetry: CaptureTelemetry, data_path: str) -> str:
+    """Writes a capture's telemetry next to its saved csv
+
+    Args:
+        telemetry (CaptureTelemetry): telemetry of the capture
+        data_path (str): main csv of the capture
+
+    Returns:
+        str: path of the written file
+    """
+    path = os.path.splitext(data_path)[0] + TELEMETRY_SUFFIX
+    with open(path, "w") as f:
+        json.dump(telemetry.to_dict(), f, indent=2)
+    return path
+
+
+if __name__ == "__main__":
+    # Cost of the per event bookkeeping and the summary of a steady 100Hz capture with one stall
+    import time
+    telemetry = CaptureTelemetry("thread")
+    start = time.perf_counter()
+    for i in range(1200):
+        telemetry.loops += 1
+        telemetry.frames.add(i * .01 + (.03 if i > 600 else 0))
+        telemetry.bridge.add(i * .01)
+    elapsed = (time.perf_counter() - start) / 1200 * 1e6
+    telemetry.finish(12, 1200, 0, 1200, loops=600000)
+    print(f"{elapsed:.2f}us per frame. {telemetry.status()}")
+    print(telemetry.problems())
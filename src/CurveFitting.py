@@ -0,0 +1,128 @@
+from scipy.optimize import minimize_scalar
+import numpy as np
+
+
+class FitResult():
+
+    def __init__(self, params, cov, residuals, r_squared):
+        """Parameters of a least squares fit and how well they fit
+
+        Args:
+            params (np.array): fitted parameters, in the order the model takes them
+            cov (np.array): parameter covariance, scaled by the residual variance
+                like scipy's curve_fit. inf when there are no spare degrees of freedom
+            residuals (np.array): data minus model at each point
+            r_squared (float): coefficient of determination
+        """
+        self.params = params
+        self.cov = cov
+        self.residuals = residuals
+        self.r_squared = r_squared
+
+    @property
+    def stderr(self) -> np.array:
+        """Standard error of each parameter"""
+        return np.sqrt(np.diag(self.cov))
+
+    @property
+    def rmse(self) -> float:
+        """Root mean square of the residuals"""
+        return float(np.sqrt(np.mean(self.residuals**2)))
+
+    def __repr__(self) -> str:
+        return f"FitResult(params={self.params}, stderr={self.stderr}, r_squared={self.r_squared:.6f}, rmse={self.rmse:.4g})"
+
+
+def _linear_least_squares(design: np.array, y: np.array) -> FitResult:
+    """Solves y ~ design @ params in closed form
+
+    Args:
+        design (np.array): (points x parameters) matrix of the model's basis functions
+        y (np.array): data to fit
+
+    Returns:
+        FitResult: solution with its diagnostics
+    """
+    params, _, _, _ = np.linalg.lstsq(design, y, rcond=None)
+    residuals = y - design @ params
+    return FitResult(params, _covariance(design, residuals), residuals, _r_squared(y, residuals))
+
+
+def _covariance(jacobian: np.array, residuals: np.array) -> np.array:
+    """Parameter covariance s^2 (J^T J)^-1 with s^2 the residual variance"""
+    n, p = jacobian.shape
+    if n <= p:
+        return np.full((p, p), np.inf)
+    s_squared = residuals @ residuals / (n - p)
+    return s_squared * np.linalg.pinv(jacobian.T @ jacobian)
+
+
+def _r_squared(y: np.array, residuals: np.array) -> float:
+    total = np.sum((y - np.mean(y))**2)
+    if total == 0:
+        return 1.0
+    return float(1 - residuals @ residuals / total)
+
+
+def fit_polynomial(x, y, degree: int) -> FitResult:
+    """Fits y = p0 + p1*x + ... + pn*x**n
+
+    The model is linear in its parameters so it is solved directly, with no
+    starting guess or iterations.
+
+    Args:
+        x (array like): independent variable
+        y (array like): dependent variable
+        degree (int): highest power of x
+
+    Returns:
+        FitResult: params in increasing power order (a, b, c for a + b*x + c*x**2)
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    return _linear_least_squares(np.vander(x, degree + 1, increasing=True), y)
+
+
+def fit_power_law(x, y, exponent_bounds=(.01, 4)) -> FitResult:
+    """Fits y = a + b*x**c
+
+    For a fixed exponent c the model is linear in a and b, so each candidate
+    c is solved in closed form and only c itself is searched (bounded 1-D
+    minimization of the residual sum of squares). The covariance is from the
+    model's Jacobian at the solution.
+
+    Args:
+        x (array like): independent variable. Must be positive
+        y (array like): dependent variable
+        exponent_bounds (tuple, optional): range searched for c. Defaults to (.01, 4).
+
+    Returns:
+        FitResult: params a, b, c
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    ones = np.ones_like(x)
+
+    def solve_linear_part(c):
+        design = np.column_stack((ones, x**c))
+        params, _, _, _ = np.linalg.lstsq(design, y, rcond=None)
+        return params, y - design @ params
+
+    def sum_squared_residuals(c):
+        residuals = solve_linear_part(c)[1]
+        return residuals @ residuals
+
+    c = minimize_scalar(sum_squared_residuals, bounds=exponent_bounds, method="bounded", options={'xatol': 1e-10}).x
+    (a, b), _ = solve_linear_part(c)
+    residuals = y - (a + b * x**c)
+    jacobian = np.column_stack((ones, x**c, b * x**c * np.log(x)))
+    return FitResult(np.array([a, b, c]), _covariance(jacobian, residuals), residuals, _r_squared(y, residuals))
+
+
+if __name__ == "__main__":
+    # Fits of both standards with their diagnostics
+    from .StandardsRegistry import STANDARDS
+    for standard in STANDARDS.names():
+        print(standard)
+        for name, fit in STANDARDS.model(standard).fits.items():
+            print(f"\t{name}: {fit}")
@@ -0,0 +1,260 @@
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import argparse
+import json
+import logging
+import os
+import warnings
+from .RunCatalog import is_run_csv, summarize_saved_run, GRAPHED_SUFFIX
+
+
+STORE_DIR = "curve_store"
+GRID = np.arange(0, 31, dtype=np.float32)  # [mm] every run's curve is resampled to this grid
+CURVES_FILE = "curves.f32"
+METRICS_FILE = "metrics.bin"
+META_FILE = "meta.bin"
+SCHEMA_FILE = "store.json"
+
+METRICS_DTYPE = np.dtype([('peak_torque_div_bsl', '<f4'), ('z_iso13992', '<f4'), ('z_iso11088', '<f4'),
+                          ('speed', '<f4'), ('angular_speed', '<f4')])
+META_DTYPE = np.dtype([('name', 'S96'), ('model', 'S48'), ('axis', 'S2'), ('bsl', '<u2'), ('captured_at', '<M8[s]')])
+
+
+def model_from_name(name: str) -> str:
+    """Binding model encoded in a file name such as "Alpenflow 89, My, PL=2.6, 20241228, Trial 1"
+
+    Args:
+        name (str): file name without extension
+
+    Returns:
+        str: text before the first comma. Empty for the app's default names
+    """
+    if "," not in name:
+        return ""
+    return name.split(",")[0].strip()
+
+
+def resample_curve(dist: np.array, values: np.array) -> np.array:
+    """Puts an aggregated curve on the store's fixed 0-30mm grid
+
+    Args:
+        dist (np.array): distances [mm] of the aggregated curve
+        values (np.array): torque/BSL at each distance
+
+    Returns:
+        np.array: float32 value per grid point. NaN outside the measured range
+    """
+    curve = np.full(len(GRID), np.nan, dtype=np.float32)
+    if len(dist) == 0:
+        return curve
+    inside = (GRID >= dist.min()) & (GRID <= dist.max())
+    curve[inside] = np.interp(GRID[inside], dist, values)
+    return curve
+
+
+class CurveStore():
+
+    def __init__(self, directory: str):
+        """Consolidated store of every run's aggregated curve and summary metrics
+
+        Curves, metrics and metadata each live in their own flat binary file of
+        fixed size rows, so the whole archive is memory mapped as dense arrays
+        and statistics across runs are a single vectorized slice. Runs are only
+        ever appended.
+
+        Args:
+            directory (str): folder of the store. Created if it doesn't exist
+        """
+        self.logger = logging.getLogger(__name__)
+        self.directory = directory
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        schema_path = os.path.join(directory, SCHEMA_FILE)
+        if not os.path.exists(schema_path):
+            with open(schema_path, "w") as f:
+                json.dump({"version": 1, "grid_mm": GRID.tolist(), "metrics": METRICS_DTYPE.descr, "meta": META_DTYPE.descr}, f)
+        self._truncate_partial_rows()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _truncate_partial_rows(self) -> None:
+        """Drops rows that were only partly appended when a write was interrupted"""
+        sizes = {CURVES_FILE: GRID.nbytes, METRICS_FILE: METRICS_DTYPE.itemsize, META_FILE: META_DTYPE.itemsize}
+        for name in sizes:
+            if not os.path.exists(self._path(name)):
+                open(self._path(name), "wb").close()
+        rows = min(os.path.getsize(self._path(name)) // size for name, size in sizes.items())
+        for name, size in sizes.items():
+            if os.path.getsize(self._path(name)) != rows * size:
+                self.logger.warning("Truncating %s to %d complete rows", name, rows)
+                os.truncate(self._path(name), rows * size)
+
+    def __len__(self) -> int:
+        return os.path.getsize(self._path(META_FILE)) // META_DTYPE.itemsize
+
+    def append_runs(self, runs: list) -> None:
+        """Appends runs to the store
+
+        Args:
+            runs (list): dicts with name, axis, bsl, captured_at (datetime or
+                iso string), curve_dist, curve_values and optionally model and
+                the metric fields
+        """
+        if len(runs) == 0:
+            return
+        curves = np.stack([resample_curve(np.asarray(run['curve_dist']), np.asarray(run['curve_values'])) for run in runs])
+        metrics = np.zeros(len(runs), dtype=METRICS_DTYPE)
+        meta = np.zeros(len(runs), dtype=META_DTYPE)
+        for i, run in enumerate(runs):
+            for field in METRICS_DTYPE.names:
+                metrics[field][i] = np.nan if run.get(field) is None else run[field]
+            meta['name'][i] = run['name'].encode()[:96]
+            meta['model'][i] = run.get('model', model_from_name(run['name'])).encode()[:48]
+            meta['axis'][i] = (run.get('axis') or "").encode()
+            meta['bsl'][i] = run.get('bsl') or 0
+            meta['captured_at'][i] = np.datetime64(run['captured_at'], 's')
+
+        # metadata is written last. Its row count is what makes a run visible
+        for name, array in ((CURVES_FILE, curves), (METRICS_FILE, metrics), (META_FILE, meta)):
+            with open(self._path(name), "ab") as f:
+                f.write(array.tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+
+    def append_run(self, run: dict) -> None:
+        """Appends a single run. See append_runs"""
+        self.append_runs([run])
+
+    def curves(self) -> np.array:
+        """Memory mapped (runs x grid points) float32 array of every curve"""
+        return self._map(CURVES_FILE, np.float32, (len(self), len(GRID)))
+
+    def metrics(self) -> np.array:
+        """Memory mapped structured array of each run's summary metrics"""
+        return self._map(METRICS_FILE, METRICS_DTYPE, (len(self),))
+
+    def metadata(self) -> np.array:
+        """Memory mapped structured array of each run's name, model, axis, BSL and capture time"""
+        return self._map(META_FILE, META_DTYPE, (len(self),))
+
+    def _map(self, name: str, dtype, shape: tuple) -> np.array:
+        if shape[0] == 0:
+            return np.zeros(shape, dtype=dtype)
+        return np.memmap(self._path(name), dtype=dtype, mode="r", shape=shape)
+
+    def select(self, axis=None, model=None, bsl=None) -> np.array:
+        """Boolean mask of the runs matching every filter that is given
+
+        Args:
+            axis (str, optional): "My" or "Mz"
+            model (str, optional): binding model
+            bsl (int, optional): boot sole length [mm]
+
+        Returns:
+            np.array: mask over the runs of the store
+        """
+        meta = self.metadata()
+        mask = np.ones(len(meta), dtype=bool)
+        if axis is not None:
+            mask &= meta['axis'] == axis.encode()
+        if model is not None:
+            mask &= meta['model'] == model.encode()
+        if bsl is not None:
+            mask &= meta['bsl'] == bsl
+        return mask
+
+    def curve_stats(self, mask=None) -> tuple:
+        """Mean and standard deviation curve of a set of runs
+
+        Args:
+            mask (np.array, optional): runs to include. Defaults to all of them.
+
+        Returns:
+            tuple: grid [mm], mean, sd and number of runs with data at each grid point
+        """
+        curves = self.curves() if mask is None else self.curves()[mask]
+        count = np.sum(~np.isnan(curves), axis=0)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # grid points no run reached
+            mean = np.nanmean(curves, axis=0)
+            sd = np.nanstd(curves, axis=0)
+        return GRID, mean, sd, count
+
+    def stats_by_model(self, axis=None) -> dict:
+        """Mean and sd curves of every binding model in the store
+
+        Args:
+            axis (str, optional): only include runs on this axis
+
+        Returns:
+            dict: model -> (grid, mean, sd, count)
+        """
+        mask = self.select(axis=axis)
+        models = self.metadata()['model']
+        return {model.decode(): self.curve_stats(mask & (models == model)) for model in np.unique(models[mask])}
+
+    def ingest_legacy(self, data_dir: str, z_of_peak=None, workers=None) -> int:
+        """Converts saved csv triples that aren't in the store yet
+
+        Args:
+            data_dir (str): folder the app saves to
+            z_of_peak (callable, optional): f(axis, peak) -> (z ISO 13992, z ISO 11088)
+            workers (int, optional): number of processes. Defaults to the cpu count.
+
+        Returns:
+            int: number of runs added
+        """
+        known = set(self.metadata()['name'])
+        paths = [os.path.join(data_dir, name) for name in sorted(os.listdir(data_dir))
+                 if is_run_csv(name) and name[:-len(".csv")].encode()[:96] not in known]
+        if len(paths) == 0:
+            return 0
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            runs = [run for run in pool.map(load_legacy_run, paths, chunksize=16) if run is not None]
+        if z_of_peak is not None:
+            for run in runs:
+                if run['axis'] is not None and run['peak_torque_div_bsl'] is not None:
+                    run['z_iso13992'], run['z_iso11088'] = z_of_peak(run['axis'], run['peak_torque_div_bsl'])
+        self.append_runs(runs)
+        self.logger.info("Added %d saved runs from %s to the curve store", len(runs), data_dir)
+        return len(runs)
+
+
+def load_legacy_run(path: str) -> dict:
+    """Reads a saved csv triple into a curve store row
+
+    Args:
+        path (str): main csv of the run
+
+    Returns:
+        dict: run for CurveStore.append_runs. None if the graphed csv can't be read
+    """
+    run = summarize_saved_run(path)
+    try:
+        graphed = np.loadtxt(path[:-len(".csv")] + GRAPHED_SUFFIX, delimiter=',', ndmin=2)
+    except (OSError, ValueError):
+        return None
+    run['curve_dist'] = graphed[:, 0]
+    run['curve_values'] = graphed[:, 1]
+    return run
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Consolidate saved curves and compute statistics across runs")
+    parser.add_argument("command", choices=["ingest", "stats"])
+    parser.add_argument("--data", default="Data", help="folder the app saves to")
+    parser.add_argument("--axis", choices=["My", "Mz"])
+    args = parser.parse_args()
+
+    store = CurveStore(os.path.join(args.data, STORE_DIR))
+    if args.command == "ingest":
+        from .StandardsRegistry import z_of_peak
+        store.ingest_legacy(args.data, z_of_peak)
+    else:
+        for model, (grid, mean, sd, count) in store.stats_by_model(args.axis).items():
+            print(f"{model or '(unnamed)'}: {count.max()} runs")
+            for x, m, d in zip(grid, mean, sd):
+                if not np.isnan(m):
+                    print(f"\t{x:4.0f}mm\t{m:8.2f} +/- {d:6.2f} N")
@@ -0,0 +1,34 @@
+from PyQt5.QtCore import QFile, QResource, QTextStream
+import logging
+import os
+
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESOURCE_BUNDLE = os.path.join(APP_DIR, "breeze.rcc")  # rebuild with: rcc -binary breeze.qrc -o breeze.rcc
+STYLESHEET_DIR = os.path.join(APP_DIR, "dark")
+
+
+def load_dark_stylesheet() -> str:
+    """Returns the breeze dark stylesheet, or None if it isn't available
+
+    The compiled resource bundle is registered with Qt the first time the theme
+    is needed. Qt memory maps the file, so none of the icons are loaded until a
+    widget draws them. If the bundle is missing, the stylesheet is read from the
+    dark folder with its icon urls pointed at the files on disk.
+
+    Returns:
+        str: stylesheet to hand to QApplication.setStyleSheet
+    """
+    logger = logging.getLogger(__name__)
+    if os.path.isfile(RESOURCE_BUNDLE) and QResource.registerResource(RESOURCE_BUNDLE):
+        file = QFile(":/dark/stylesheet.qss")
+        file.open(QFile.ReadOnly | QFile.Text)
+        return QTextStream(file).readAll()
+
+    qss_path = os.path.join(STYLESHEET_DIR, "stylesheet.qss")
+    if not os.path.isfile(qss_path):
+        logger.warning("Will not be using the darkmode rendering")
+        return None
+    logger.warning("%s not found. Loading the dark theme from %s", RESOURCE_BUNDLE, STYLESHEET_DIR)
+    with open(qss_path) as f:
+        return f.read().replace("url(:/dark/", "url(" + STYLESHEET_DIR.replace(os.sep, "/") + "/")
@@ -0,0 +1,127 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+import numpy as np
+import logging
+import os
+import queue
+import tempfile
+from .StageProfiler import PROFILER
+
+
+TEMP_SUFFIX = ".tmp"
+
+
+def write_csv_atomic(files: list) -> list:
+    """Writes a group of csvs so that each one either fully exists or doesn't
+
+    Every file is first written to a hidden temp file in its destination
+    directory and synced to disk. Only once all of them are written are they
+    renamed into place, so a crash mid-write never leaves a partial csv behind.
+
+    Args:
+        files (list): tuples of (path, tuple of column arrays, header)
+
+    Returns:
+        list: paths of the committed files
+    """
+    temp_paths = []
+    try:
+        for path, columns, header in files:
+            directory, name = os.path.split(path)
+            fd, temp_path = tempfile.mkstemp(prefix="." + name, suffix=TEMP_SUFFIX, dir=directory)
+            temp_paths.append(temp_path)
+            with os.fdopen(fd, "w") as f:
+                np.savetxt(f, np.column_stack(columns), delimiter=',', header=header, fmt='%.4f')
+                f.flush()
+                os.fsync(f.fileno())
+        for (path, _, _), temp_path in zip(files, temp_paths):
+            os.replace(temp_path, path)
+    except BaseException:
+        for temp_path in temp_paths:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        raise
+    return [path for path, _, _ in files]
+
+
+def remove_stale_temp_files(directory: str) -> int:
+    """Deletes temp files left behind by an export that never committed
+
+    Args:
+        directory (str): folder the exports are written to
+
+    Returns:
+        int: number of files removed
+    """
+    removed = 0
+    for name in os.listdir(directory):
+        if name.startswith(".") and name.endswith(TEMP_SUFFIX):
+            os.remove(os.path.join(directory, name))
+            removed += 1
+    return removed
+
+
+class ExportWriter(QThread):
+    saved = pyqtSignal(list)
+    failed = pyqtSignal(str)
+
+    def __init__(self, parent=None, profiler=PROFILER):
+        """QThread that writes queued exports to disk off of the GUI thread
+
+        Exports are submitted as groups of files that are committed together.
+        Whatever has queued up while the thread was busy is written in one
+        pass, so several runs' exports get batched together.
+
+        Args:
+            parent (QObject, optional): owner of the thread. Defaults to None.
+            profiler (StageProfiler, optional): times each export. Defaults to PROFILER.
+        """
+        super().__init__(parent)
+        self.profiler = profiler
+        self.exports = queue.Queue()
+        self.logger = logging.getLogger(__name__)
+
+    def submit(self, files: list, on_commit=None) -> None:
+        """Queues a group of csvs to be written
+
+        Args:
+            files (list): tuples of (path, tuple of column arrays, header)
+            on_commit (callable, optional): f(paths) run on this thread once the
+                csvs are committed, for bookkeeping that shouldn't block the GUI. Defaults to None.
+        """
+        self.exports.put((files, on_commit))
+
+    def stop(self) -> None:
+        """Finishes the queued exports and ends the thread"""
+        self.exports.put(None)
+        self.wait()
+
+    def run(self) -> None:
+        running = True
+        while running:
+            batch = [self.exports.get()]
+            while True:
+                try:
+                    batch.append(self.exports.get_nowait())
+                except queue.Empty:
+                    break
+
+            if len(batch) > 1:
+                self.logger.info("Writing %d queued exports together", len(batch))
+            for export in batch:
+                if export is None:
+                    running = False
+                    continue
+                files, on_commit = export
+                try:
+                    with self.profiler.stage("export"):
+                        paths = write_csv_atomic(files)
+                except Exception as e:
+                    self.logger.error("Export failed: %s", e)
+                    self.failed.emit(str(e))
+                    continue
+                if on_commit is not None:
+                    try:
+                        on_commit(paths)
+                    except Exception:
+                        self.logger.exception("Saved %s but couldn't finish its bookkeeping", paths[0])
+                self.saved.emit(paths)
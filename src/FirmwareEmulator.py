@@ -0,0 +1,124 @@
+import time
+from .SerialHandler import FRAME_SYNC, TAG_MY, TAG_MZ
+
+
+FRAME_PERIOD = .01  # [s] ranging period of each VL53L4CD. 10ms timing budget
+AVERAGED_SAMPLES = 2  # the firmware sends the mean of the last two readings of a sensor
+MAX_DISTANCE = 254  # [mm] readings beyond a byte are sent as this
+BUFFERED_PERIODS = 1000  # ranging periods kept when nobody reads, like the port's input buffer filling up
+
+
+class FirmwareEmulator():
+
+    def __init__(self, distance_my=None, distance_mz=None, period=FRAME_PERIOD, clock=time.time):
+        """Stands in for the serial port of an arduino running DistanceSampler.ino
+
+        Answers the same commands ("1" My, "2" Mz, "3" identify, "4" both
+        sensors) with the same confirmations and produces distance frames at
+        the sensors' rate from the clock: one byte per frame from the selected
+        sensor, or FRAME_SYNC, tag, distance frames from both sensors in dual
+        mode. Frames are generated when the port is polled, so it costs
+        nothing while nobody reads it. Has the parts of serial.Serial that
+        SerialHandler uses.
+
+        Args:
+            distance_my (callable, optional): distance [mm] of the My sensor at a time [s] since boot. Defaults to 50mm.
+            distance_mz (callable, optional): distance [mm] of the Mz sensor at a time [s] since boot. Defaults to 50mm.
+            period (float, optional): seconds between readings of each sensor. Defaults to FRAME_PERIOD.
+            clock (callable, optional): current time [s]. Defaults to time.time.
+        """
+        self.distances = {TAG_MY: distance_my or (lambda t: 50), TAG_MZ: distance_mz or (lambda t: 50)}
+        self.period = period
+        self.clock = clock
+        self.booted = clock()
+        self.readings = {TAG_MY: [0] * AVERAGED_SAMPLES, TAG_MZ: [0] * AVERAGED_SAMPLES}
+        self.indexer = {TAG_MY: 0, TAG_MZ: 0}
+        self.frames_sent = 0  # ranging periods already turned into frames
+        self.testing_my = True  # boots streaming the My sensor, like the firmware
+        self.dual = False
+        self.output = bytearray()
+        self.command = bytearray()
+
+    # -- firmware --------------------------------------------------------
+    def _reading(self, tag: int, t: float) -> int:
+        """Next averaged byte of a sensor, like loop() of the firmware"""
+        measurement = min(int(round(self.distances[tag](t))), MAX_DISTANCE)
+        readings = self.readings[tag]
+        if measurement <= 0:
+            measurement = readings[self.indexer[tag]]  # a bad reading repeats the last one
+        readings[self.indexer[tag]] = measurement
+        self.indexer[tag] = (self.indexer[tag] + 1) % AVERAGED_SAMPLES
+        return sum(readings) // AVERAGED_SAMPLES
+
+    def _range(self) -> None:
+        """Adds the frames of every ranging period that has passed"""
+        due = int((self.clock() - self.booted) / self.period)
+        for n in range(max(self.frames_sent, due - BUFFERED_PERIODS) + 1, due + 1):
+            t = n * self.period
+            if self.dual:
+                for tag in (TAG_MY, TAG_MZ):
+                    self.output += bytes((FRAME_SYNC, tag, self._reading(tag, t)))
+            else:
+                self.output.append(self._reading(TAG_MY if self.testing_my else TAG_MZ, t))
+        self.frames_sent = max(self.frames_sent, due)
+
+    def _println(self, text: str) -> None:
+        self.output += text.encode() + b"\r\n"
+
+    def _handle(self, command: int) -> None:
+        """Answers a command like set_sensor_state of the firmware"""
+        if command == 1:
+            self._println("ym" if self.testing_my and not self.dual else "my")
+            self.testing_my, self.dual = True, False
+        elif command == 2:
+            self._println("zm" if not self.testing_my and not self.dual else "mz")
+            self.testing_my, self.dual = False, False
+        elif command == 3:
+            self._println("AlpenFlow")
+        elif command == 4:
+            self._println("laud" if self.dual else "dual")
+            self.dual = True
+
+    # -- serial.Serial ----------------------------------------------------
+    @property
+    def in_waiting(self) -> int:
+        self._range()
+        return len(self.output)
+
+    def read(self, size=1) -> bytes:
+        self._range()
+        data = bytes(self.output[:size])
+        del self.output[:size]
+        return data
+
+    def write(self, data: bytes) -> int:
+        self.command += data
+        while b"\n" in self.command:
+            line, _, rest = bytes(self.command).partition(b"\n")
+            self.command = bytearray(rest)
+            if line.strip().isdigit():
+                self._handle(int(line.strip()))
+        return len(data)
+
+    def reset_input_buffer(self) -> None:
+        self._range()
+        self.output.clear()
+
+    def close(self) -> None:
+        pass
+
+
+if __name__ == "__main__":
+    # Both sensors through the host's demultiplexer: My moves away at 10mm/s, Mz holds still
+    from .SerialHandler import SerialHandler, EMULATOR_PORT
+    handler = SerialHandler(EMULATOR_PORT)
+    handler.ser.distances[TAG_MY] = lambda t: 40 + 10 * t
+    handler.set_dual_state(True)
+    my_frames = []
+    start = time.time()
+    while time.time() - start < .5:
+        distance = handler.get_arduino_data()
+        if distance is not None:
+            my_frames.append(distance)
+    mz_frames = handler.take_cross_frames()
+    print(f"My {len(my_frames)} frames {my_frames[:5]}..{my_frames[-1]}, Mz {len(mz_frames)} frames at {mz_frames[-1][1]}mm")
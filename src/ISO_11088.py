@@ -6,10 +6,13 @@ Created on Thu Jun  6 08:29:19 2024
 @author: stevenwaal
 """
 import matplotlib.pyplot as plt
-from scipy.optimize import curve_fit 
 import pandas as pd
 import numpy as np
-import math
+import os
+from .CurveFitting import fit_polynomial
+
+
+TABLE_B1_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ISO 11088_2023 - Table B1 - Expanded.csv')
 
 
 def createLinearArray(min_value, max_value, increment):
@@ -42,71 +45,38 @@ def createLinearArray(min_value, max_value, increment):
 class ISO11088():
     
     def __init__(self, z_max=15):
-        table_B1_file_path_and_name = 'src/ISO 11088_2023 - Table B1 - Expanded.csv'
-        self.df_table_B1 = pd.read_csv(table_B1_file_path_and_name) # Read CSV into a pandas dataframe
+        self.df_table_B1 = pd.read_csv(TABLE_B1_FILE) # Read CSV into a pandas dataframe
         self.z_max = z_max
+        self.fits = {}  # FitResult of each fit, with residuals, R^2 and covariance
         self.update_all_values()
 
     def calc_high_and_low_boot_moments_divided_by_BSL_from_table_B1(self):
-        df_z_table = self.df_table_B1.loc[:, '230':'351']
-        df_z_table = df_z_table.apply(pd.to_numeric, errors='coerce')
-        df_BSL = pd.DataFrame(list(self.df_table_B1.loc[:, '230':'351']))
-        df_BSL = df_BSL.apply(pd.to_numeric, errors='coerce')
-        df_BSL = df_BSL.divide(1000)
+        # z of each (skier code, BSL) cell. Blank cells are NaN. Every column headed by a BSL [mm] is used
+        df_z_table = self.df_table_B1.loc[:, [str(column).strip().isdigit() for column in self.df_table_B1.columns]]
+        z_table = df_z_table.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+        BSL = pd.to_numeric(df_z_table.columns).to_numpy(dtype=float) / 1000
+        Mz = self.df_table_B1['Mz [Nm]'].to_numpy(dtype=float)
+        My = self.df_table_B1['My [Nm]'].to_numpy(dtype=float)
 
-        z_table = df_z_table.values.tolist()
-        Mz = list(self.df_table_B1['Mz [Nm]'])
-        My = list(self.df_table_B1['My [Nm]'])
-        BSL = list(df_BSL[0])
-        z_Mz_div_BSL = []
-        z_My_div_BSL = []
-        for i in range(len(z_table)):
-            for j in range(len(z_table[0])):
-                value = float(z_table[i][j])
-                if math.isnan(value):
-                    pass
-                else:
-                    z_Mz_div_BSL.append([z_table[i][j], Mz[i]/BSL[j]])
-                    z_My_div_BSL.append([z_table[i][j], My[i]/BSL[j]])
+        # every filled cell pairs its z with the row's moment over the column's BSL
+        rows, cols = np.nonzero(~np.isnan(z_table))
+        z = z_table[rows, cols]
+        z_Mz_div_BSL = Mz[rows] / BSL[cols]
+        z_My_div_BSL = My[rows] / BSL[cols]
 
-        def _find_high_low(z_M_div_BSL):
-            
-            z = []
-            for i in range(len(z_M_div_BSL)):
-                z.append(z_M_div_BSL[i][0])
-            
-            z_unique = list(set(z))
-            z_unique.sort()
-            
-            temp = {}
-            high = {}
-            low = {}
-            for z_value in z_unique:
-                temp[str(z_value)] = []
-                high[str(z_value)] = None
-                low[str(z_value)] = None
-    
-            for key in temp:
-                key_value = float(key)
-                for arr in z_M_div_BSL:
-                    z = arr[0]
-                    mz_div_bsl = arr[1]
-                    
-                    if z==key_value:
-                        temp[key].append(mz_div_bsl)
-    
-            high = []
-            low = []
-            mid = []
-            for key in temp:
-                high.append(max(temp[key]))
-                low.append(min(temp[key]))
-                mid.append((max(temp[key]) + min(temp[key])) / 2)
-                
-            return [z_unique, high, low, mid]
+        def _find_high_low(z, M_div_BSL):
+            """Highest, lowest and mid moment/BSL of each distinct z, in increasing z"""
+            order = np.argsort(z, kind='stable')
+            z_sorted = z[order]
+            M_sorted = M_div_BSL[order]
+            starts = np.flatnonzero(np.r_[True, z_sorted[1:] != z_sorted[:-1]])
+            high = np.maximum.reduceat(M_sorted, starts)
+            low = np.minimum.reduceat(M_sorted, starts)
+            mid = (high + low) / 2
+            return [z_sorted[starts].tolist(), high.tolist(), low.tolist(), mid.tolist()]
 
-        self.table_B1_z, self.table_B1_Mz_div_BSL_high, self.table_B1_Mz_div_BSL_low, self.table_B1_Mz_div_BSL_mid = _find_high_low(z_Mz_div_BSL)
-        self.table_B1_z, self.table_B1_My_div_BSL_high, self.table_B1_My_div_BSL_low, self.table_B1_My_div_BSL_mid = _find_high_low(z_My_div_BSL)
+        self.table_B1_z, self.table_B1_Mz_div_BSL_high, self.table_B1_Mz_div_BSL_low, self.table_B1_Mz_div_BSL_mid = _find_high_low(z, z_Mz_div_BSL)
+        self.table_B1_z, self.table_B1_My_div_BSL_high, self.table_B1_My_div_BSL_low, self.table_B1_My_div_BSL_mid = _find_high_low(z, z_My_div_BSL)
         
     
     # -- Mz_div_BSL as a function of z ----------------------------------------    
@@ -123,8 +93,8 @@ class ISO11088():
         z_copy.extend(z_copy)
         Mz_div_BSL_copy = self.table_B1_Mz_div_BSL_high.copy()
         Mz_div_BSL_copy.extend(self.table_B1_Mz_div_BSL_low)
-        param, param_cov = curve_fit(self.fit_func_Mz_div_BSL_of_z, z_copy, Mz_div_BSL_copy)
-        return param
+        self.fits['Mz_div_BSL_of_z'] = fit_polynomial(z_copy, Mz_div_BSL_copy, 1)
+        return self.fits['Mz_div_BSL_of_z'].params
     
     # -- My_div_BSL as a function of z ----------------------------------------    
     def calc_My_div_BSL(self, z):
@@ -140,8 +110,8 @@ class ISO11088():
         z_copy.extend(z_copy)
         My_div_BSL_copy = self.table_B1_My_div_BSL_high.copy()
         My_div_BSL_copy.extend(self.table_B1_My_div_BSL_low)
-        param, param_cov = curve_fit(self.fit_func_My_div_BSL_of_z, z_copy, My_div_BSL_copy)
-        return param
+        self.fits['My_div_BSL_of_z'] = fit_polynomial(z_copy, My_div_BSL_copy, 1)
+        return self.fits['My_div_BSL_of_z'].params
     
     
     
@@ -165,8 +135,8 @@ class ISO11088():
         return a + b*Mz_div_BSL + c*Mz_div_BSL**2
         
     def calc_curve_fit_z_of_Mz_div_BSL(self):
-        param, param_cov = curve_fit(self.fit_func_z_of_Mz_div_BSL, self.Mz_div_BSL_mid, self.z)
-        return param
+        self.fits['z_of_Mz_div_BSL'] = fit_polynomial(self.Mz_div_BSL_mid, self.z, 2)
+        return self.fits['z_of_Mz_div_BSL'].params
     
     # -- z as a function of My/BSL curve fit ----------------------------------
     def calc_z_of_My_div_BSL(self, My_div_BSL, round_bool=True):
@@ -182,8 +152,8 @@ class ISO11088():
         return a + b*My_div_BSL + c*My_div_BSL**2
         
     def calc_curve_fit_z_of_My_div_BSL(self):
-        param, param_cov = curve_fit(self.fit_func_z_of_My_div_BSL, self.My_div_BSL_mid, self.z)
-        return param
+        self.fits['z_of_My_div_BSL'] = fit_polynomial(self.My_div_BSL_mid, self.z, 2)
+        return self.fits['z_of_My_div_BSL'].params
 
         
 
@@ -8,9 +8,13 @@ Created on Tue Jun  4 10:07:52 2024
 import pandas
 import numpy
 import matplotlib.pyplot as plt
-from scipy.optimize import curve_fit 
 import numpy as np
+import os
 from .ISO_11088 import ISO11088
+from .CurveFitting import fit_polynomial, fit_power_law
+
+
+TABLE_2_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ISO 13992 Table 2.csv')
 
 
 def createLinearArray(min_value, max_value, increment):
@@ -39,13 +43,14 @@ def createLinearArray(min_value, max_value, increment):
     return array
 
 class ISO13992():
-    def __init__(self, z_max=15):
+    def __init__(self, z_max=15, iso11088=None):
         
         self.z_max = z_max
+        self.ISO11088 = iso11088  # compared against in the plots. Built if not given
         
-        table_2_file_path_and_name = 'src/ISO 13992 Table 2.csv'
-        self.table_2 = pandas.read_csv(table_2_file_path_and_name) # Read CSV into a pandas dataframe
+        self.table_2 = pandas.read_csv(TABLE_2_FILE) # Read CSV into a pandas dataframe
         
+        self.fits = {}  # FitResult of each fit, with residuals, R^2 and covariance
         self.update_all_values()
         
     def calc_boot_moments_div_BSL(self):
@@ -101,8 +106,8 @@ class ISO13992():
         return a + b*z+ c*z**2
     
     def calc_curve_fit_My_of_z(self):
-        param, param_cov = curve_fit(self.fit_func_My_of_z, self.table_2_z, self.table_2_My)
-        return param
+        self.fits['My_of_z'] = fit_polynomial(self.table_2_z, self.table_2_My, 2)
+        return self.fits['My_of_z'].params
     
     # -- BSL as a function of Z curve fit -------------------------------------
     def calc_BSL_of_z(self, z):
@@ -115,8 +120,8 @@ class ISO13992():
         return a + b*z**c
     
     def calc_curve_fit_BSL_of_z(self):
-        param, param_cov = curve_fit(self.fit_func_BSL_of_z, self.table_2_z, self.table_2_BSL)
-        return param
+        self.fits['BSL_of_z'] = fit_power_law(self.table_2_z, self.table_2_BSL)
+        return self.fits['BSL_of_z'].params
         
     # -- z as a function of Mz/BSL curve fit ---------------------------------- 
     def calc_z_of_Mz_div_BSL(self, Mz_div_BSL, round_bool=True):
@@ -132,8 +137,8 @@ class ISO13992():
         return a + b*Mz_div_BSL + c*Mz_div_BSL**2
         
     def calc_curve_fit_z_of_Mz_div_BSL(self):
-        param, param_cov = curve_fit(self.fit_func_z_of_Mz_div_BSL, self.Mz_div_BSL, self.z)
-        return param
+        self.fits['z_of_Mz_div_BSL'] = fit_polynomial(self.Mz_div_BSL, self.z, 2)
+        return self.fits['z_of_Mz_div_BSL'].params
     
     # -- z as a function of My/BSL curve fit ----------------------------------
     def calc_z_of_My_div_BSL(self, My_div_BSL, round_bool=True):
@@ -149,8 +154,8 @@ class ISO13992():
         return a + b*My_div_BSL + c*My_div_BSL**2
         
     def calc_curve_fit_z_of_My_div_BSL(self):
-        param, param_cov = curve_fit(self.fit_func_z_of_My_div_BSL, self.My_div_BSL, self.z)
-        return param
+        self.fits['z_of_My_div_BSL'] = fit_polynomial(self.My_div_BSL, self.z, 2)
+        return self.fits['z_of_My_div_BSL'].params
 
 
 
@@ -179,7 +184,8 @@ class ISO13992():
         self.z_of_Mz_div_BSL_fit_params = self.calc_curve_fit_z_of_Mz_div_BSL()
         self.z_of_My_div_BSL_fit_params = self.calc_curve_fit_z_of_My_div_BSL()
         
-        self.ISO11088 = ISO11088()
+        if self.ISO11088 is None:
+            self.ISO11088 = ISO11088()
         
         self.z_continuous = createLinearArray(min(self.z), max(self.z), 0.1)
         self.Mz_curve_fit = []
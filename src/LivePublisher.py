@@ -0,0 +1,338 @@
+from collections import deque
+import numpy as np
+import argparse
+import json
+import logging
+import os
+import selectors
+import socket
+import stat
+import struct
+import threading
+from .CaptureJournal import RECORD_DTYPE, FRAME, BRIDGE, CROSS_FRAME
+
+
+STREAM_ENV = "ALPENFLOW_STREAM"  # "tcp:127.0.0.1:5555" or "unix:/tmp/alpenflow.sock"
+FLUSH_INTERVAL = .02  # [s] samples are batched into one message this often
+CLIENT_QUEUE = 256  # messages held per client. A slow client loses the oldest first
+PENDING_SAMPLES = 1 << 16  # samples held for the publishing thread if it falls behind
+SEND_BUFFER = 1 << 16  # [B] kernel buffer per client. Keeps a stalled client's backlog in its queue, where the oldest can be dropped
+CLOSE_TIMEOUT = .5  # [s] given to each client to take what is still queued on close
+
+# every message is HEADER then its payload
+HEADER = struct.Struct("<2sBIQ")  # magic, message type, payload length, sequence number
+MAGIC = b"AS"
+
+# message types
+CAPTURE_START = 1  # json metadata of the pull, as journaled
+SAMPLES = 2  # RECORD_DTYPE records (kind, time [s] since the capture started, value)
+METRICS = 3  # json of the live metrics that changed: peak, verdict, speed
+CAPTURE_END = 4  # json summary of the processed pull, as stored in the run catalog, or its error. 'started' matches its CAPTURE_START
+
+# sample kinds besides the journal's FRAME, BRIDGE and CROSS_FRAME
+TORQUE = 4  # torque/BSL [N] of each bridge sample, converted with the live tare
+
+
+def parse_address(address: str) -> tuple:
+    """Socket family and address of "tcp:HOST:PORT" or "unix:PATH"
+
+    Args:
+        address (str): address of the stream
+
+    Raises:
+        ValueError: the address isn't in either form
+
+    Returns:
+        int, tuple or str: socket family and the address to bind or connect to
+    """
+    scheme, _, rest = address.partition(":")
+    if scheme == "tcp":
+        host, _, port = rest.rpartition(":")
+        if host != "" and port.isdigit():
+            return socket.AF_INET, (host, int(port))
+    elif scheme == "unix" and rest != "":
+        return socket.AF_UNIX, rest
+    raise ValueError(f"Stream address must be tcp:HOST:PORT or unix:PATH, not {address}")
+
+
+class StreamClient():
+    __slots__ = ('sock', 'queue', 'sending', 'dropped')
+
+    def __init__(self, sock: socket.socket, queue_length=CLIENT_QUEUE):
+        """A connected consumer and the messages waiting to be sent to it"""
+        self.sock = sock
+        self.queue = deque(maxlen=queue_length)
+        self.sending = memoryview(b"")  # rest of the message being sent
+        self.dropped = 0
+
+
+class LivePublisher():
+
+    def __init__(self, address: str, client_queue=CLIENT_QUEUE):
+        """Streams the samples and metrics of each pull to local consumers as they are captured
+
+        The capture loop only appends to a queue. A background thread batches
+        the queued samples every FLUSH_INTERVAL into one SAMPLES message and
+        sends it to every connected client without blocking. Each client has
+        its own queue of client_queue messages. When a client reads slower
+        than the pull is captured the oldest messages are dropped, so a slow
+        consumer only loses data itself and can never stall acquisition.
+        Consumers spot drops as gaps in the sequence numbers.
+
+        Args:
+            address (str): "tcp:HOST:PORT" or "unix:PATH" to listen on. Use a localhost HOST
+            client_queue (int, optional): messages held per client. Defaults to CLIENT_QUEUE.
+
+        Raises:
+            OSError: the address can't be listened on or another app is streaming on it
+        """
+        self.logger = logging.getLogger(__name__)
+        self.client_queue = client_queue
+        family, self.address = parse_address(address)
+        if family == socket.AF_UNIX and os.path.exists(self.address) and stat.S_ISSOCK(os.stat(self.address).st_mode):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.address)
+            except ConnectionRefusedError:
+                os.remove(self.address)  # left behind by a previous run
+            else:
+                raise OSError(f"Another app is already streaming on {self.address}")
+            finally:
+                probe.close()
+        self.server = socket.socket(family, socket.SOCK_STREAM)
+        if family == socket.AF_INET:
+            self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind(self.address)
+        self.server.listen()
+        self.server.setblocking(False)
+        if family == socket.AF_INET:
+            self.address = self.server.getsockname()  # the actual port when 0 was asked for
+
+        self.samples = deque(maxlen=PENDING_SAMPLES)  # (kind, time, value) from the capture loop
+        self.messages = deque()  # (type, payload) from the GUI thread
+        self.metrics = {}
+        self.metrics_changed = False
+        self.sequence = 0
+        self.capture_start = None  # latest CAPTURE_START, so late clients know what they're watching
+        self.clients = {}
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.server, selectors.EVENT_READ)
+        self.running = True
+        self.thread = threading.Thread(target=self.run, name="live publisher", daemon=True)
+        self.thread.start()
+        self.logger.info("Streaming live samples on %s", self.address)
+
+    # -- producer side. Safe to call from any thread ---------------------
+    def add(self, kind: int, t: float, value: float) -> None:
+        """Queues one sample. Cheap enough to call from the capture loop"""
+        self.samples.append((kind, t, value))
+
+    def update_metrics(self, **metrics) -> None:
+        """Sets live metrics (peak, verdict, speed). Only the latest value of each is sent"""
+        self.metrics.update(metrics)
+        self.metrics_changed = True
+
+    def start_capture(self, metadata: dict) -> None:
+        self.samples.clear()
+        self.metrics = {}
+        self.messages.append((CAPTURE_START, json.dumps(metadata).encode()))
+
+    def end_capture(self, summary: dict) -> None:
+        self.messages.append((CAPTURE_END, json.dumps(summary, default=float).encode()))
+
+    def close(self) -> None:
+        """Sends what is queued, disconnects every client and stops listening"""
+        self.running = False
+        self.thread.join()
+
+    # -- publishing thread -------------------------------------------------
+    def _frame(self, message_type: int, payload: bytes) -> bytes:
+        self.sequence += 1
+        return HEADER.pack(MAGIC, message_type, len(payload), self.sequence) + payload
+
+    def _broadcast(self, message: bytes) -> None:
+        for client in self.clients.values():
+            if len(client.queue) == client.queue.maxlen:
+                client.dropped += 1
+            client.queue.append(message)
+
+    def _collect(self) -> None:
+        """Turns everything the producers queued into messages for the clients"""
+        while len(self.messages) > 0:
+            message_type, payload = self.messages.popleft()
+            message = self._frame(message_type, payload)
+            if message_type == CAPTURE_START:
+                self.capture_start = message
+            self._broadcast(message)
+        samples = []
+        for _ in range(len(self.samples)):  # only what is queued now. The capture loop keeps appending
+            try:
+                samples.append(self.samples.popleft())
+            except IndexError:
+                break  # start_capture cleared the queue meanwhile
+        if len(samples) > 0:
+            records = np.array(samples, dtype=RECORD_DTYPE)
+            self._broadcast(self._frame(SAMPLES, records.tobytes()))
+        if self.metrics_changed:
+            self.metrics_changed = False
+            self._broadcast(self._frame(METRICS, json.dumps(dict(self.metrics), default=float).encode()))
+
+    def _accept(self) -> None:
+        sock, _ = self.server.accept()
+        sock.setblocking(False)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER)
+        client = self.clients[sock] = StreamClient(sock, self.client_queue)
+        if self.capture_start is not None:
+            client.queue.append(self.capture_start)
+        self.selector.register(sock, selectors.EVENT_READ)  # sends are retried every flush, not on writability
+        self.logger.info("Live stream client connected. %d connected", len(self.clients))
+
+    def _disconnect(self, client: StreamClient) -> None:
+        self.selector.unregister(client.sock)
+        client.sock.close()
+        del self.clients[client.sock]
+        self.logger.info("Live stream client disconnected after %d dropped messages", client.dropped)
+
+    def _send(self, client: StreamClient) -> None:
+        """Sends as much of the client's queue as its socket takes without blocking"""
+        while True:
+            if len(client.sending) == 0:
+                if len(client.queue) == 0:
+                    return
+                client.sending = memoryview(client.queue.popleft())
+            sent = client.sock.send(client.sending)
+            client.sending = client.sending[sent:]
+            if len(client.sending) > 0:
+                return  # the socket buffer is full
+
+    def run(self) -> None:
+        while self.running:
+            for key, events in self.selector.select(FLUSH_INTERVAL):
+                if key.fileobj is self.server:
+                    self._accept()
+                    continue
+                client = self.clients[key.fileobj]
+                if events & selectors.EVENT_READ:
+                    try:
+                        data = client.sock.recv(4096)
+                    except OSError:
+                        data = b""
+                    if data == b"":
+                        self._disconnect(client)  # clients only listen, so a read means it hung up
+                        continue
+            self._collect()
+            for client in list(self.clients.values()):
+                try:
+                    self._send(client)
+                except (BlockingIOError, InterruptedError):
+                    pass
+                except OSError:
+                    self._disconnect(client)
+
+        self._collect()
+        for client in list(self.clients.values()):
+            client.sock.settimeout(CLOSE_TIMEOUT)
+            try:
+                while len(client.sending) > 0 or len(client.queue) > 0:
+                    self._send(client)
+            except OSError:
+                pass  # timed out on a stalled client
+            self._disconnect(client)
+        self.selector.close()
+        self.server.close()
+        if isinstance(self.address, str):
+            os.remove(self.address)
+
+
+def read_messages(sock: socket.socket):
+    """Decodes the messages of a live stream as they arrive
+
+    Args:
+        sock (socket.socket): connected socket
+
+    Yields:
+        int, int, object: message type, sequence number and the payload,
+            decoded (records array for SAMPLES, dict otherwise)
+    """
+    buffer = bytearray()
+    while True:
+        data = sock.recv(65536)
+        if data == b"":
+            return
+        buffer += data
+        while len(buffer) >= HEADER.size:
+            magic, message_type, length, sequence = HEADER.unpack_from(buffer)
+            if magic != MAGIC:
+                raise ValueError("Not an AlpenFlow live stream")
+            if len(buffer) < HEADER.size + length:
+                break
+            payload = bytes(buffer[HEADER.size:HEADER.size + length])
+            del buffer[:HEADER.size + length]
+            if message_type == SAMPLES:
+                yield message_type, sequence, np.frombuffer(payload, dtype=RECORD_DTYPE)
+            else:
+                yield message_type, sequence, json.loads(payload)
+
+
+def connect(address: str) -> socket.socket:
+    """Connects to a live stream. See parse_address"""
+    family, target = parse_address(address)
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.connect(target)
+    return sock
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Watch the live stream of the app, or run a localhost demo without an address")
+    parser.add_argument("address", nargs="?", help="tcp:HOST:PORT or unix:PATH the app streams on")
+    args = parser.parse_args()
+    kind_names = {FRAME: "displacement", BRIDGE: "voltage ratio", CROSS_FRAME: "cross displacement", TORQUE: "torque/BSL"}
+
+    if args.address is not None:
+        last = 0
+        for message_type, sequence, payload in read_messages(connect(args.address)):
+            if sequence != last + 1 and last != 0:
+                print(f"-- dropped {sequence - last - 1} messages")
+            last = sequence
+            if message_type == SAMPLES:
+                for kind in np.unique(payload['kind']):
+                    latest = payload[payload['kind'] == kind][-1]
+                    print(f"{latest['time']:8.3f}s {kind_names.get(int(kind), kind)}: {latest['value']:.6g}")
+            else:
+                print(payload)
+    else:
+        # A fast and a stalled consumer of a simulated 100Hz pull on localhost
+        import time
+        publisher = LivePublisher("tcp:127.0.0.1:0", client_queue=16)
+        address = f"tcp:{publisher.address[0]}:{publisher.address[1]}"
+        received = {}
+
+        def watch(sock):
+            for message_type, sequence, payload in read_messages(sock):
+                received[message_type] = received.get(message_type, 0) + 1
+        watcher = threading.Thread(target=watch, args=(connect(address),))
+        watcher.start()
+        stalled = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        stalled.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)  # never read, so it backs up quickly
+        stalled.connect(publisher.address)
+        time.sleep(.1)
+        publisher.start_capture({'bsl': 300, 'testing_My': True})
+        elapsed = 0
+        for i in range(300):
+            start = time.perf_counter()
+            t = i * .01
+            publisher.add(FRAME, t, i // 10)
+            publisher.add(TORQUE, t, 120 * np.exp(-((t - 1.5) / .4)**2))
+            for _ in range(200):
+                publisher.add(BRIDGE, t, 2.8555e-5)  # far more than a pull, to fill the stalled client's queue
+            if i % 10 == 0:
+                publisher.update_metrics(peak=120 * np.exp(-((min(t, 1.5) - 1.5) / .4)**2))
+            elapsed += time.perf_counter() - start
+            time.sleep(.001)
+        elapsed = elapsed / (300 * 202) * 1e6
+        publisher.end_capture({'peak_torque_div_bsl': 120.0})
+        time.sleep(.2)
+        dropped = {id(client.sock): client.dropped for client in publisher.clients.values()}
+        publisher.close()
+        watcher.join()
+        print(f"{elapsed:.2f}us per queued sample. Fast client got {received}, drops per client {sorted(dropped.values())}")
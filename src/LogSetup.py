@@ -0,0 +1,135 @@
+from logging.handlers import QueueHandler, QueueListener
+import numpy as np
+import atexit
+import logging
+import os
+import queue
+import threading
+
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_LEVELS_ENV = "ALPENFLOW_LOG_LEVELS"  # e.g. "INFO,src.SerialHandler=DEBUG,src.StandardsRegistry=WARNING"
+
+# level of each subsystem unless LOG_LEVELS_ENV says otherwise. Unlisted loggers follow the root
+SUBSYSTEM_LEVELS = {
+    "": logging.INFO,
+    "AlpenFlowDinApp": logging.INFO,
+    "src.SerialHandler": logging.INFO,
+    "src.PhidgetHandler": logging.INFO,
+    "src.AcquisitionProcess": logging.INFO,
+    "src.CaptureProcessor": logging.INFO,
+    "src.AggregateRawData": logging.INFO,
+}
+
+_IMMUTABLE = (str, int, float, bool, type(None))
+_listener = None
+_lock = threading.Lock()
+
+
+class DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves merging the message to the listener thread when it safely can
+
+    A record whose arguments are all immutable (numbers, strings) is queued as
+    is and its message is built by the listener. Anything else, like an array
+    that may be refilled by the next capture, is merged on the logging thread
+    as QueueHandler does.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args.values() if isinstance(record.args, dict) else (record.args or ())
+        if record.exc_info or not all(isinstance(arg, _IMMUTABLE) for arg in args):
+            return super().prepare(record)
+        return record
+
+
+class ArraySummary():
+    __slots__ = ('array',)
+
+    def __init__(self, array):
+        """Log argument that prints the size and range of an array instead of every element
+
+        Nothing is computed unless the record is actually emitted.
+
+        Args:
+            array (array like): values to summarize
+        """
+        self.array = array
+
+    def __str__(self) -> str:
+        values = np.asarray(self.array)
+        if values.size == 0:
+            return "[] (empty)"
+        if not np.issubdtype(values.dtype, np.number):
+            return f"[{values.size} {values.dtype}]"
+        return (f"[{values.size} {values.dtype}: min {values.min():.6g}, max {values.max():.6g}, "
+                f"mean {values.mean():.6g}]")
+
+
+def parse_levels(spec: str) -> dict:
+    """Levels from a spec like "INFO,src.SerialHandler=DEBUG". A bare level sets the root
+
+    Args:
+        spec (str): comma separated [logger=]LEVEL entries
+
+    Returns:
+        dict: logger name ("" for the root) -> level
+    """
+    levels = {}
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if entry == "":
+            continue
+        name, _, level = entry.rpartition("=")
+        level = logging.getLevelName(level.strip().upper())
+        if isinstance(level, int):
+            levels[name.strip()] = level
+    return levels
+
+
+def setup_logging(levels=None) -> QueueListener:
+    """Sends every log record through a queue to one thread that formats and writes them
+
+    Logging from the capture and processing threads then only costs a level
+    check and a queue put. Safe to call more than once, only the first call
+    installs the handlers. Levels are SUBSYSTEM_LEVELS, overridden by the
+    ALPENFLOW_LOG_LEVELS environment variable and then by levels.
+
+    Args:
+        levels (dict, optional): logger name ("" for the root) -> level
+
+    Returns:
+        QueueListener: the running listener. Stopped at exit
+    """
+    global _listener
+    with _lock:
+        if _listener is not None:
+            return _listener
+        configured = dict(SUBSYSTEM_LEVELS)
+        configured.update(parse_levels(os.environ.get(LOG_LEVELS_ENV, "")))
+        configured.update(levels or {})
+        for name, level in configured.items():
+            logging.getLogger(name or None).setLevel(level)
+
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        records = queue.SimpleQueue()
+        root = logging.getLogger()
+        root.addHandler(DeferredQueueHandler(records))
+        _listener = QueueListener(records, console_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+        return _listener
+
+
+if __name__ == "__main__":
+    # Cost of a log call on the hot path, enabled (queued) and filtered out
+    import time
+    setup_logging({"bench": logging.INFO})
+    logger = logging.getLogger("bench")
+    array = np.arange(50000, dtype=np.float32)
+    logger.info("Summary of a capture array %s", ArraySummary(array))
+    for label, log in (("debug (filtered)", logger.debug), ("info (queued)", logger.info)):
+        start = time.perf_counter()
+        for i in range(10000):
+            log("sample %d at %f", i, .5)
+        print(f"{label}: {(time.perf_counter() - start) / 10000 * 1e6:.2f}us per call")
@@ -0,0 +1,251 @@
+import numpy as np
+from collections import deque
+from .Calibration import voltage_ratio_to_torque, MAD_SCALE
+
+
+HAMPEL_HALF_WINDOW = 3  # samples either side. 70ms of bridge samples at 100Hz
+HAMPEL_THRESHOLD = 3.0  # scaled MADs from the window median before a sample counts as a spike
+BASELINE_SAMPLES = 20  # samples at the start of a capture the unloaded level is taken from. 200ms at 100Hz
+RELEASE_MIN_RISE = 5.0  # [N] torque/BSL the peak must rise above the baseline before a release can end
+RELEASE_DECAY_FRACTION = .1  # the release is over once torque is back within this fraction of the rise
+RELEASE_HOLD_TIME = .3  # [s] torque must stay decayed this long
+
+
+class PeakDetector():
+    __slots__ = ('half_window', 'threshold', 'values', 'times', 'count', 'evaluated',
+                 'value', 'time', 'spikes')
+
+    def __init__(self, half_window=HAMPEL_HALF_WINDOW, threshold=HAMPEL_THRESHOLD):
+        """Streaming peak of a noisy signal, with spikes rejected by a Hampel filter
+
+        Every sample is compared to the median of the 2*half_window + 1 samples
+        around it. One further than threshold scaled MADs from that median is
+        a spike and counts as the median instead. The peak is the largest
+        cleaned sample, so one electrical spike can't set it. Each sample costs
+        a median of a fixed size window, and the filter lags half_window samples
+        behind the stream. Call finish after the last sample to evaluate those.
+
+        Args:
+            half_window (int, optional): samples either side of the one evaluated. Defaults to HAMPEL_HALF_WINDOW.
+            threshold (float, optional): spike threshold in scaled MADs. Defaults to HAMPEL_THRESHOLD.
+        """
+        self.half_window = half_window
+        self.threshold = threshold
+        self.values = deque(maxlen=2 * half_window + 1)
+        self.times = deque(maxlen=2 * half_window + 1)
+        self.count = 0  # samples taken
+        self.evaluated = 0  # samples judged so far. The rest are waiting for their window to fill
+        self.value = -np.inf  # peak so far
+        self.time = np.nan  # time of the peak
+        self.spikes = 0  # samples rejected
+
+    def _evaluate(self, positions) -> bool:
+        """Judges samples of the current window against its median
+
+        Args:
+            positions (range): indices into the window of the samples to judge
+
+        Returns:
+            bool: True if the peak moved
+        """
+        ordered = sorted(self.values)
+        middle = len(ordered) // 2
+        median = ordered[middle] if len(ordered) % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+        deviations = sorted(abs(v - median) for v in ordered)
+        mad = deviations[middle] if len(deviations) % 2 else (deviations[middle - 1] + deviations[middle]) / 2
+        limit = self.threshold * MAD_SCALE * mad
+
+        moved = False
+        for position in positions:
+            value = self.values[position]
+            if mad > 0 and abs(value - median) > limit:
+                self.spikes += 1
+                value = median
+            if value > self.value:
+                self.value = value
+                self.time = self.times[position]
+                moved = True
+        self.evaluated += len(positions)
+        return moved
+
+    def update(self, time: float, value: float) -> bool:
+        """Takes the next sample
+
+        Args:
+            time (float): time of the sample [s]
+            value (float): the sample
+
+        Returns:
+            bool: True if the peak moved
+        """
+        self.values.append(value)
+        self.times.append(time)
+        self.count += 1
+        full = 2 * self.half_window + 1
+        if self.count < full:
+            return False
+        if self.count == full:
+            # the first samples never sit in the middle of a window. Judge them by the first one
+            return self._evaluate(range(self.half_window + 1))
+        return self._evaluate(range(self.half_window, self.half_window + 1))
+
+    def finish(self) -> bool:
+        """Judges the samples still waiting for the rest of their window
+
+        Returns:
+            bool: True if the peak moved
+        """
+        waiting = self.count - self.evaluated
+        if waiting == 0:
+            return False
+        if self.count < 3:
+            # too few samples for a median to mean anything. Take them as they are
+            self.evaluated = self.count
+            moved = False
+            for time, value in zip(self.times, self.values):
+                if value > self.value:
+                    self.value, self.time, moved = value, time, True
+            return moved
+        return self._evaluate(range(len(self.values) - waiting, len(self.values)))
+
+    @property
+    def found(self) -> bool:
+        return np.isfinite(self.value)
+
+
+class ReleaseCompletion():
+    __slots__ = ('hold_time', 'min_rise', 'decay_fraction', 'baseline_samples', 'early', 'baseline',
+                 'decayed_since', 'complete', 'completed_at')
+
+    def __init__(self, hold_time=RELEASE_HOLD_TIME, min_rise=RELEASE_MIN_RISE, decay_fraction=RELEASE_DECAY_FRACTION,
+                 baseline_samples=BASELINE_SAMPLES):
+        """Notices when a release is over so the capture can stop
+
+        The baseline is the median of the first samples of the capture. Once
+        the peak has risen min_rise above it, the release is complete when
+        torque has stayed within decay_fraction of the rise from the baseline
+        for hold_time. Each sample costs a few comparisons.
+
+        Args:
+            hold_time (float, optional): seconds torque must stay decayed. Defaults to RELEASE_HOLD_TIME.
+            min_rise (float, optional): rise of the peak [N] that counts as a release. Defaults to RELEASE_MIN_RISE.
+            decay_fraction (float, optional): fraction of the rise that counts as decayed. Defaults to RELEASE_DECAY_FRACTION.
+            baseline_samples (int, optional): samples the baseline is taken from. Defaults to BASELINE_SAMPLES.
+        """
+        self.hold_time = hold_time
+        self.min_rise = min_rise
+        self.decay_fraction = decay_fraction
+        self.baseline_samples = baseline_samples
+        self.early = []
+        self.baseline = None
+        self.decayed_since = None
+        self.complete = False
+        self.completed_at = None
+
+    def update(self, time: float, value: float, peak: float) -> bool:
+        """Takes the next sample
+
+        Args:
+            time (float): time of the sample [s]
+            value (float): the sample, torque/BSL [N]
+            peak (float): running peak of the pull (PeakDetector.value)
+
+        Returns:
+            bool: True if the release completed with this sample
+        """
+        if self.complete:
+            return False
+        if self.baseline is None:
+            self.early.append(value)
+            if len(self.early) == self.baseline_samples:
+                self.baseline = float(np.median(self.early))
+            return False
+
+        rise = peak - self.baseline
+        if rise < self.min_rise:
+            return False
+        if value - self.baseline > self.decay_fraction * rise:
+            self.decayed_since = None
+            return False
+        if self.decayed_since is None:
+            self.decayed_since = time
+        if time - self.decayed_since < self.hold_time:
+            return False
+        self.complete = True
+        self.completed_at = time
+        return True
+
+
+def detect_peak(times: np.array, values: np.array, half_window=HAMPEL_HALF_WINDOW, threshold=HAMPEL_THRESHOLD) -> PeakDetector:
+    """Runs the streaming detector over a recorded signal
+
+    Same code as during a capture, so saved captures get the peak that was seen live.
+
+    Args:
+        times (np.array): time of each sample [s]
+        values (np.array): samples
+        half_window (int, optional): see PeakDetector. Defaults to HAMPEL_HALF_WINDOW.
+        threshold (float, optional): see PeakDetector. Defaults to HAMPEL_THRESHOLD.
+
+    Returns:
+        PeakDetector: finished detector with the peak, its time and the spike count
+    """
+    detector = PeakDetector(half_window, threshold)
+    for time, value in zip(times.tolist(), values.tolist()):
+        detector.update(time, value)
+    detector.finish()
+    return detector
+
+
+def distinct_samples(times: np.array, values: np.array) -> tuple:
+    """Drops consecutive repeats from the polled ratios, which hold each phidget sample until the next
+
+    Args:
+        times (np.array): time of each polled value [s]
+        values (np.array): polled values
+
+    Returns:
+        np.array, np.array: times and values of the first poll of each sample
+    """
+    keep = np.ones(len(values), dtype=bool)
+    keep[1:] = values[1:] != values[:-1]
+    return times[keep], values[keep]
+
+
+def displacement_at(time: float, frame_times: np.array, displacements: np.array) -> int:
+    """Displacement [mm] of the last frame received at or before a time. 0 before the first frame"""
+    index = int(np.searchsorted(frame_times, time, side='right')) - 1
+    if index < 0:
+        return 0
+    return int(displacements[index])
+
+
+def sample_torque_div_BSL(voltage_ratios: np.array, index: int, calibration: dict, bsl: int) -> float:
+    """One stored voltage ratio as boot torque/BSL [N]
+
+    Converts a one sample slice of the capture array, so the value is bit for
+    bit what CaptureResult computes from the whole array afterwards.
+
+    Args:
+        voltage_ratios (np.array): bridge samples of the capture
+        index (int): sample to convert
+        calibration (dict): calibration of the axis
+        bsl (int): boot sole length [mm]
+
+    Returns:
+        float: torque/BSL [N]
+    """
+    return float((voltage_ratio_to_torque(voltage_ratios[index:index + 1], calibration) / (bsl/1000))[0])
+
+
+if __name__ == "__main__":
+    # A 100Hz release peaking at 120 N with one 400 N spike on the way up
+    import time
+    rng = np.random.default_rng(1)
+    times = np.arange(0, 2, .01)
+    torque_div_BSL = 120 * np.exp(-((times - 1) / .3)**2) + rng.normal(0, .5, len(times))
+    torque_div_BSL[80] = 400
+    start = time.perf_counter()
+    detector = detect_peak(times, torque_div_BSL)
+    elapsed = (time.perf_counter() - start) / len(times) * 1e6
+    print(f"raw max {torque_div_BSL.max():.1f}N, peak {detector.value:.1f}N at {detector.time:.2f}s, {detector.spikes} spikes, {elapsed:.1f}us/sample")
@@ -2,36 +2,42 @@ from Phidget22.Phidget import *
 from Phidget22.Devices.VoltageRatioInput import *
 import numpy as np
 import logging
-import json
+import time
+from .Calibration import CALIBRATION_FILE, load_calibration, voltage_ratio_to_torque
 
 class PhidgetHandler():
 
-    def __init__(self):
+    def __init__(self, serial_number=None, channel=0, calibration_file=CALIBRATION_FILE):
         """Class to control the phidget 1046_1 Wheatstone bridge data device
+
+        Args:
+            serial_number (int, optional): serial number of the phidget to open. Defaults to
+                whichever attaches first, which is only safe with one phidget connected
+            channel (int, optional): bridge channel the load cell is wired to. Defaults to 0.
+            calibration_file (str, optional): load cell calibration json. Defaults to CALIBRATION_FILE.
         """
         # Setup the internal logger
         self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.INFO)
-        console_handler  = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        console_handler.setFormatter(formatter)
-        # self.logger.addHandler(console_handler)
         
         # load the calibration data
-        with open('load_cell_calibration.json') as f:
-            cal_data = json.load(f)
-            self.my_cal = cal_data['My']
-            self.mz_cal = cal_data['Mz']
-            self.logger.info("Loaded calibration data: My = " + str(self.my_cal) + " Mz = " + str(self.mz_cal))
+        self.calibration_file = calibration_file
+        cal_data = load_calibration(calibration_file)
+        self.my_cal = cal_data['My']
+        self.mz_cal = cal_data['Mz']
+        self.logger.info("Loaded calibration data: My = " + str(self.my_cal) + " Mz = " + str(self.mz_cal))
         
         # variables to track internal data
         self.recent_samples = np.array([0.0, 0.0])
         self.sample_index = 0
         self.recent_measurement = 0
+        self.recent_sample = (0.0, 0)  # (time.time() of callback, measurement) assigned together
+        self.callback_count = 0  # callbacks so far. Capture telemetry compares it to the samples the loop saw
         
-        # setup an object referencing channel 0 of bridge
+        # setup an object referencing the bridge channel of the load cell
         self.ch = VoltageRatioInput()
+        if serial_number is not None:
+            self.ch.setDeviceSerialNumber(serial_number)
+        self.ch.setChannel(channel)
 
         # set callback function to handle new data
         self.ch.setOnVoltageRatioChangeHandler(self.onVoltageRatioChange)
@@ -65,6 +71,8 @@ class PhidgetHandler():
         self.recent_samples[self.sample_index] = voltageRatio
         self.sample_index ^= 1
         self.recent_measurement = np.mean(self.recent_samples)
+        self.recent_sample = (time.time(), self.recent_measurement)
+        self.callback_count += 1
         # print(self.interpret_voltage_data(np.array(self.recent_measurement), True))
         
     def interpret_voltage_data(self, data: np.array, my_data: bool, return_val_in_newtons=False) -> np.array:
@@ -76,23 +84,32 @@ class PhidgetHandler():
         Returns:
             np.array: torque on boot in Nm for each sample
         """
+        return voltage_ratio_to_torque(data, self.get_calibration(my_data), return_val_in_newtons)
+
+    def get_calibration(self, my_data: bool) -> dict:
+        """Calibration of the selected axis
+
+        Args:
+            my_data (bool): True if data is from My sensor, False if data is from Mz
+        Returns:
+            dict: gain, offset and lever_arm of the axis
+        """
         if my_data:
-            offset = self.my_cal['offset']
-            gain = self.my_cal['gain']
-            lever_arm = self.my_cal['lever_arm']
-        else:
-            offset = self.mz_cal['offset']
-            gain = self.mz_cal['gain']
-            lever_arm = self.mz_cal['lever_arm']
-            
-        # Load cell reading calculation can be found here: https://phidgets.com/docs/Calibrating_Load_Cells
-        # The equation at that link seems to be wrong!!!!!! We had to use a + instead of a -
-        load_cell_reading = (data + offset)*gain # [N]
-        if return_val_in_newtons:
-            return load_cell_reading
-        torque_on_boot = load_cell_reading*lever_arm    # [Nm]
-        return torque_on_boot
+            return self.my_cal
+        return self.mz_cal
         
+    def reload_calibration(self) -> dict:
+        """Re-reads load_cell_calibration.json so edits apply without restarting
+
+        Returns:
+            dict: calibration of both axes, keyed by "My" and "Mz"
+        """
+        cal_data = load_calibration(self.calibration_file)
+        self.my_cal = cal_data['My']
+        self.mz_cal = cal_data['Mz']
+        self.logger.info("Reloaded calibration data: My = " + str(self.my_cal) + " Mz = " + str(self.mz_cal))
+        return {'My': self.my_cal, 'Mz': self.mz_cal}
+
     def close(self) -> None:
         self.ch.close()
     
@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+
+
+BSL_RANGE = np.arange(200, 401)  # [mm] every BSL the app accepts
+Z_GRID = np.arange(.5, 12.01, .25)  # target z values. Table B1 steps z in quarters
+Z_TOLERANCE = .25  # a pull passes when its torque reads within this much z of the target
+
+# verdicts
+NO_TARGET = "no target"
+IN_PROGRESS = "in progress"
+PASS = "pass"
+FAIL_LOW = "fail (low)"
+FAIL_HIGH = "fail (high)"
+
+
+class ReleaseWindows():
+
+    def __init__(self, df_table_B1: pd.DataFrame, z_tolerance=Z_TOLERANCE):
+        """Acceptable release torque for every target z and BSL, precomputed from ISO 11088 Table B1
+
+        Each BSL falls in one BSL column of Table B1. Along that column the
+        reference torque (My or Mz of the row) is interpolated at the target z
+        plus and minus the tolerance, which bounds the window. Targets the
+        column doesn't cover have no window (NaN).
+
+        Args:
+            df_table_B1 (pd.DataFrame): Table B1 as loaded by ISO11088
+            z_tolerance (float, optional): half width of the window in z. Defaults to Z_TOLERANCE.
+        """
+        bsl_columns = [column for column in df_table_B1.columns if str(column).strip().isdigit()]
+        z_table = df_table_B1[bsl_columns].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+        column_bsl = np.array([int(column) for column in bsl_columns])
+        moments = {True: df_table_B1['My [Nm]'].to_numpy(dtype=float), False: df_table_B1['Mz [Nm]'].to_numpy(dtype=float)}
+
+        # column of each BSL: the last column starting at or below it. Shorter boots use the first
+        column_of_bsl = np.clip(np.searchsorted(column_bsl, BSL_RANGE, side='right') - 1, 0, len(column_bsl) - 1)
+
+        # (axis, BSL, z, low/high) [Nm]. Axis 0 is Mz, 1 is My
+        self.table = np.full((2, len(BSL_RANGE), len(Z_GRID), 2), np.nan)
+        for testing_My, moment in moments.items():
+            per_column = np.full((len(column_bsl), len(Z_GRID), 2), np.nan)
+            for c in range(len(column_bsl)):
+                filled = ~np.isnan(z_table[:, c])
+                for side, z_edge in enumerate((Z_GRID - z_tolerance, Z_GRID + z_tolerance)):
+                    per_column[c, :, side] = np.interp(z_edge, z_table[filled, c], moment[filled], left=np.nan, right=np.nan)
+            self.table[int(testing_My)] = per_column[column_of_bsl]
+
+    def window(self, z: float, bsl: int, testing_My: bool) -> tuple:
+        """Release torque window [Nm] of a target
+
+        Args:
+            z (float): target z. Snapped to the nearest quarter
+            bsl (int): boot sole length [mm], 200 to 400
+            testing_My (bool): True for the My axis, False for Mz
+
+        Returns:
+            tuple: low, high torque [Nm]. NaN if Table B1 doesn't cover the target
+        """
+        z_index = int(round((z - Z_GRID[0]) / (Z_GRID[1] - Z_GRID[0])))
+        bsl_index = int(bsl) - BSL_RANGE[0]
+        if not (0 <= z_index < len(Z_GRID) and 0 <= bsl_index < len(BSL_RANGE)):
+            return np.nan, np.nan
+        low, high = self.table[int(testing_My), bsl_index, z_index]
+        return float(low), float(high)
+
+    def window_div_BSL(self, z: float, bsl: int, testing_My: bool) -> tuple:
+        """Window of a target in boot torque/BSL [N], the unit the results are shown in"""
+        low, high = self.window(z, bsl, testing_My)
+        return low / (bsl/1000), high / (bsl/1000)
+
+
+def judge_peak(peak: float, window: tuple) -> str:
+    """Verdict of a finished pull
+
+    Args:
+        peak (float): peak of the pull, in the units of the window
+        window (tuple): low, high
+
+    Returns:
+        str: PASS, FAIL_LOW, FAIL_HIGH or NO_TARGET if the window is undefined
+    """
+    low, high = window
+    if np.isnan(low) or np.isnan(high):
+        return NO_TARGET
+    if peak > high:
+        return FAIL_HIGH
+    if peak < low:
+        return FAIL_LOW
+    return PASS
+
+
+class LiveJudge():
+    __slots__ = ('low', 'high', 'verdict')
+
+    def __init__(self, window: tuple):
+        """Judges a pull against its window while it is being captured
+
+        Fed the running peak of the pull, which only ever rises, so each
+        update is two comparisons and a fail high is final.
+
+        Args:
+            window (tuple): low, high torque/BSL [N] from ReleaseWindows.window_div_BSL
+        """
+        self.low, self.high = window
+        self.verdict = NO_TARGET if np.isnan(self.low) or np.isnan(self.high) else IN_PROGRESS
+
+    def update(self, peak: float) -> bool:
+        """Takes the new running peak of the pull
+
+        Args:
+            peak (float): peak torque/BSL [N] so far
+
+        Returns:
+            bool: True if the verdict changed
+        """
+        if self.verdict == NO_TARGET:
+            return False
+        verdict = FAIL_HIGH if peak > self.high else PASS if peak >= self.low else IN_PROGRESS
+        if verdict == self.verdict:
+            return False
+        self.verdict = verdict
+        return True
+
+    def finish(self) -> bool:
+        """Ends the pull. One that never reached the window failed low
+
+        Returns:
+            bool: True if the verdict changed
+        """
+        if self.verdict == IN_PROGRESS:
+            self.verdict = FAIL_LOW
+            return True
+        return False
+
+
+if __name__ == "__main__":
+    # Windows of a few targets per BSL column
+    from .StandardsRegistry import STANDARDS
+    windows = ReleaseWindows(STANDARDS.model("iso11088").df_table_B1)
+    for bsl in (240, 300, 345):
+        for z in (3, 6, 8):
+            low, high = windows.window(z, bsl, True)
+            print(f"BSL {bsl}mm z {z}: My {low:.0f} to {high:.0f}Nm")
@@ -0,0 +1,231 @@
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+import multiprocessing as mp
+import numpy as np
+import argparse
+import logging
+import os
+import re
+import sqlite3
+import threading
+from .CaptureJournal import RAW_SUFFIX, GRAPHED_SUFFIX, CROSS_SUFFIX
+from .PeakDetector import detect_peak, distinct_samples
+
+
+CATALOG_FILE = "catalog.sqlite"
+
+# name the app suggests for new files: Din_data_{BSL}_My_{bool}YYYYmmdd_HHMM
+DEFAULT_NAME_PATTERN = re.compile(r"Din_data_(\d+)_My_(True|False)(\d{8}_\d{4})")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    path TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    axis TEXT,
+    bsl INTEGER,
+    gain REAL,
+    offset REAL,
+    lever_arm REAL,
+    captured_at TEXT,
+    saved_at TEXT,
+    peak_torque_div_bsl REAL,
+    z_iso13992 REAL,
+    z_iso11088 REAL,
+    speed REAL,
+    angular_speed REAL
+);
+CREATE INDEX IF NOT EXISTS runs_axis_bsl_time ON runs (axis, bsl, captured_at);
+CREATE INDEX IF NOT EXISTS runs_time ON runs (captured_at);
+CREATE INDEX IF NOT EXISTS runs_z13 ON runs (z_iso13992);
+"""
+COLUMNS = ("path", "name", "axis", "bsl", "gain", "offset", "lever_arm", "captured_at", "saved_at",
+           "peak_torque_div_bsl", "z_iso13992", "z_iso11088", "speed", "angular_speed")
+
+
+class RunCatalog():
+
+    def __init__(self, path: str):
+        """Local sqlite index of every saved capture in the Data folder
+
+        Args:
+            path (str): database file. Created if it doesn't exist
+        """
+        self.logger = logging.getLogger(__name__)
+        self.lock = threading.Lock()  # the connection is shared by the GUI, export and backfill threads
+        self.closing = threading.Event()  # stops a running backfill
+        self.backfill_thread = None
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.lock, self.conn:
+            self.conn.executescript(SCHEMA)
+
+    def record_runs(self, runs: list) -> None:
+        """Adds or updates runs in one transaction
+
+        Args:
+            runs (list): dicts keyed by the catalog columns. path and name are required
+        """
+        rows = [tuple(run.get(column) for column in COLUMNS) for run in runs]
+        with self.lock, self.conn:
+            self.conn.executemany(f"INSERT OR REPLACE INTO runs ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})", rows)
+
+    def record_run(self, run: dict) -> None:
+        """Adds or updates a single run. See record_runs"""
+        self.record_runs([run])
+
+    def known_paths(self) -> set:
+        with self.lock:
+            return {row[0] for row in self.conn.execute("SELECT path FROM runs")}
+
+    def query(self, axis=None, bsl=None, since=None, until=None, min_z=None, max_z=None, standard="iso13992") -> list:
+        """Finds runs matching every filter that is given
+
+        Args:
+            axis (str, optional): "My" or "Mz"
+            bsl (int, optional): boot sole length [mm]
+            since (str, optional): iso timestamp of the earliest capture
+            until (str, optional): iso timestamp of the latest capture. A date alone includes that whole day
+            min_z (float, optional): smallest z value
+            max_z (float, optional): largest z value
+            standard (str, optional): "iso13992" or "iso11088" z to filter on. Defaults to "iso13992".
+
+        Returns:
+            list: dict per matching run, newest first
+        """
+        if standard not in ("iso13992", "iso11088"):
+            raise ValueError(f"Unknown standard {standard}")
+        z_column = "z_" + standard
+        if until is not None and "T" not in until:
+            until += "T23:59:59"  # timestamps are compared as text, so a bare date would end at its midnight
+        filters = [("axis = ?", axis), ("bsl = ?", bsl), ("captured_at >= ?", since), ("captured_at <= ?", until),
+                   (f"{z_column} >= ?", min_z), (f"{z_column} <= ?", max_z)]
+        clauses = [clause for clause, value in filters if value is not None]
+        values = [value for _, value in filters if value is not None]
+        sql = "SELECT * FROM runs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY captured_at DESC"
+        with self.lock:
+            return [dict(row) for row in self.conn.execute(sql, values)]
+
+    def backfill(self, data_dir: str, z_of_peak=None, workers=None) -> int:
+        """Catalogs csvs saved before the catalog existed
+
+        The csvs are parsed in parallel worker processes and inserted in one
+        transaction. Runs already in the catalog are skipped, so this is cheap
+        to call at every startup.
+
+        Args:
+            data_dir (str): folder the app saves to
+            z_of_peak (callable, optional): f(axis, peak) -> (z ISO 13992, z ISO 11088).
+                z values are left empty without it
+            workers (int, optional): number of processes. Defaults to the cpu count.
+
+        Returns:
+            int: number of runs added
+        """
+        known = self.known_paths()
+        paths = [os.path.join(data_dir, name) for name in sorted(os.listdir(data_dir)) if is_run_csv(name)]
+        paths = [path for path in paths if path not in known]
+        if len(paths) == 0:
+            return 0
+
+        # spawned, since a fork would copy the Qt application into the workers
+        runs = []
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("spawn")) as pool:
+            for run in pool.map(summarize_saved_run, paths, chunksize=16):
+                if self.closing.is_set():
+                    pool.shutdown(cancel_futures=True)
+                    return 0
+                if run is not None:
+                    runs.append(run)
+        if z_of_peak is not None:
+            for run in runs:
+                if run["axis"] is not None and run["peak_torque_div_bsl"] is not None:
+                    run["z_iso13992"], run["z_iso11088"] = z_of_peak(run["axis"], run["peak_torque_div_bsl"])
+        self.record_runs(runs)
+        self.logger.info("Added %d saved runs from %s to the catalog", len(runs), data_dir)
+        return len(runs)
+
+    def start_backfill(self, data_dir: str, z_of_peak=None) -> None:
+        """Runs backfill on a background thread. close waits for it"""
+        self.backfill_thread = threading.Thread(target=self.backfill, args=(data_dir, z_of_peak), name="catalog backfill", daemon=True)
+        self.backfill_thread.start()
+
+    def close(self) -> None:
+        """Cancels a running backfill and closes the database once nothing is using it"""
+        self.closing.set()
+        if self.backfill_thread is not None:
+            self.backfill_thread.join()
+        with self.lock:
+            self.conn.close()
+
+
+def is_run_csv(name: str) -> bool:
+    """True for the main csv of a saved run (not its raw, graphed or cross axis companions)"""
+    return name.endswith(".csv") and not name.endswith((RAW_SUFFIX, GRAPHED_SUFFIX, CROSS_SUFFIX))
+
+
+def summarize_saved_run(path: str) -> dict:
+    """Rebuilds the catalog entry of a run from its files
+
+    Metadata comes from the default file name when it was kept, otherwise the
+    axis is guessed from the name and the capture time is the file's
+    modification time. The peak is found in the raw torque/BSL csv by the
+    same spike rejecting detector the app uses.
+
+    Args:
+        path (str): main csv of the run
+
+    Returns:
+        dict: catalog entry. None if the files can't be read
+    """
+    name = os.path.basename(path)[:-len(".csv")]
+    run = {"path": path, "name": name, "axis": None, "bsl": None,
+           "captured_at": datetime.fromtimestamp(os.path.getmtime(path)).isoformat(timespec="seconds"),
+           "peak_torque_div_bsl": None}
+
+    match = DEFAULT_NAME_PATTERN.search(name)
+    if match:
+        run["bsl"] = int(match.group(1))
+        run["axis"] = "My" if match.group(2) == "True" else "Mz"
+        run["captured_at"] = datetime.strptime(match.group(3), "%Y%m%d_%H%M").isoformat(timespec="seconds")
+    elif re.search(r"\bMy\b", name):
+        run["axis"] = "My"
+    elif re.search(r"\bMz\b", name):
+        run["axis"] = "Mz"
+
+    raw_path = path[:-len(".csv")] + RAW_SUFFIX
+    try:
+        raw = np.loadtxt(raw_path, delimiter=',', ndmin=2)
+    except (OSError, ValueError):
+        return run
+    if raw.shape[0] > 0:
+        detector = detect_peak(*distinct_samples(raw[:, 0], raw[:, 1]))
+        run["peak_torque_div_bsl"] = float(detector.value)
+    return run
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Index and search the runs saved in the Data folder")
+    parser.add_argument("command", choices=["backfill", "query"])
+    parser.add_argument("--data", default="Data", help="folder the app saves to")
+    parser.add_argument("--axis", choices=["My", "Mz"])
+    parser.add_argument("--bsl", type=int)
+    parser.add_argument("--since", help="iso date or timestamp")
+    parser.add_argument("--until", help="iso date (inclusive) or timestamp")
+    parser.add_argument("--min-z", type=float)
+    parser.add_argument("--max-z", type=float)
+    args = parser.parse_args()
+
+    catalog = RunCatalog(os.path.join(args.data, CATALOG_FILE))
+    if args.command == "backfill":
+        from .StandardsRegistry import z_of_peak
+        catalog.backfill(args.data, z_of_peak)
+    else:
+        for run in catalog.query(args.axis, args.bsl, args.since, args.until, args.min_z, args.max_z):
+            print(f"{run['captured_at']}\t{run['axis']}\tBSL {run['bsl']}\tz {run['z_iso13992']}\t{run['path']}")
+    catalog.close()
@@ -0,0 +1,97 @@
+import numpy as np
+
+
+def align_torque_to_distance(dist_times: np.array, torque_times: np.array, torques: np.array, lag: float = 0.0) -> np.array:
+    """Interpolates the torque stream at the timestamp of every distance frame
+
+    The phidget and the arduino sample on their own clocks. Rather than pairing
+    each distance frame with whatever torque was most recently reported (which
+    can be a full bridge interval stale), the torque stream is kept with its
+    own timestamps and interpolated at the corrected time of each distance
+    frame in a single vectorized pass.
+
+    Args:
+        dist_times (np.array): times [s] the distance frames were received
+        torque_times (np.array): times [s] of each bridge sample. Must be increasing
+        torques (np.array): bridge samples (voltage ratio or torque)
+        lag (float, optional): seconds the distance frames arrive after the
+            torque samples of the same instant. Defaults to 0.0.
+
+    Returns:
+        np.array: torque sample for each distance frame
+    """
+    if len(torque_times) == 0:
+        return np.zeros(len(dist_times))
+    return np.interp(dist_times - lag, torque_times, torques)
+
+
+def estimate_sensor_lag(dist_times: np.array, distances: np.array, torque_times: np.array, torques: np.array, max_lag: float = .05, resolution: float = .001) -> float:
+    """Estimates the lag between the distance and torque streams by cross correlation
+
+    Both streams are resampled onto a common grid and differentiated so that
+    only the changes line up. The torque stream is then shifted by every
+    candidate lag at once and the lag with the strongest normalized correlation
+    is returned. Intended for calibration pulls where torque and displacement
+    change together.
+
+    Args:
+        dist_times (np.array): times [s] of each distance frame
+        distances (np.array): distances [mm] of each frame
+        torque_times (np.array): times [s] of each bridge sample
+        torques (np.array): bridge samples
+        max_lag (float, optional): largest lag [s] searched in either direction. Defaults to .05.
+        resolution (float, optional): step [s] of the grid and the lag search. Defaults to .001.
+
+    Returns:
+        float: lag [s] to hand to align_torque_to_distance. 0 if it can't be estimated
+    """
+    start = max(dist_times[0], torque_times[0]) + max_lag
+    end = min(dist_times[-1], torque_times[-1]) - max_lag
+    if end - start < 10 * resolution:
+        return 0.0
+
+    grid = np.arange(start, end, resolution)
+    lags = np.arange(-max_lag, max_lag + resolution / 2, resolution)
+    dist_slope = np.gradient(np.interp(grid, dist_times, distances))
+    shifted = np.interp((grid[None, :] - lags[:, None]).ravel(), torque_times, torques).reshape(len(lags), len(grid))
+    torque_slope = np.gradient(shifted, axis=1)
+
+    dist_slope = dist_slope - dist_slope.mean()
+    torque_slope = torque_slope - torque_slope.mean(axis=1, keepdims=True)
+    norm = np.linalg.norm(dist_slope) * np.linalg.norm(torque_slope, axis=1)
+    if not np.all(norm > 0):
+        return 0.0
+    # a release unloads the binding as the boot moves so only the magnitude matters
+    correlation = np.abs(torque_slope @ dist_slope) / norm
+    return float(lags[correlation.argmax()])
+
+
+def estimate_sensor_lag_from_pulls(pulls: list, max_lag: float = .05, resolution: float = .001) -> float:
+    """Combines the lag estimates of several calibration pulls
+
+    Args:
+        pulls (list): tuples of (dist_times, distances, torque_times, torques)
+        max_lag (float, optional): largest lag [s] searched. Defaults to .05.
+        resolution (float, optional): step [s] of the lag search. Defaults to .001.
+
+    Returns:
+        float: median lag [s] across the pulls
+    """
+    lags = [estimate_sensor_lag(*pull, max_lag=max_lag, resolution=resolution) for pull in pulls]
+    if len(lags) == 0:
+        return 0.0
+    return float(np.median(lags))
+
+
+if __name__ == "__main__":
+    # spot check the estimator against a synthetic pull with a known 23ms lag
+    true_lag = .023
+    torque_times = np.arange(0, 3, .01)
+    dist_times = np.arange(.004, 3, .01)
+    torques = np.clip(torque_times - 1, 0, None)**2
+    distances = np.clip(dist_times - true_lag - 1, 0, None)**2
+
+    lag = estimate_sensor_lag(dist_times, distances, torque_times, torques)
+    print(f"Estimated lag {lag}s, expected {true_lag}s")
+    aligned = align_torque_to_distance(dist_times, torque_times, torques, lag)
+    print("Max pairing error after alignment", np.abs(aligned - distances).max())
@@ -1,36 +1,91 @@
 import serial
 import serial.tools.list_ports
+from collections import deque
 import logging
 import time
 
 
-class SerialHandler():
+EMULATOR_PORT = "emulator"  # port name that runs src.FirmwareEmulator instead of opening a board
+
+# dual stream frames are FRAME_SYNC, the tag of the sensor, then its distance. Distances never exceed 254
+FRAME_SYNC = 0xFF
+TAG_MY = 0
+TAG_MZ = 1
+
+
+class TaggedFrameParser():
+    __slots__ = ('sync', 'tag')
+
     def __init__(self):
+        """Splits the dual stream back into (tag, distance) frames
+
+        Bytes are taken as they arrive, so a frame may be split across reads.
+        Anything that isn't a well formed frame, like the text the firmware
+        prints to confirm a command, is skipped until the next FRAME_SYNC.
+        """
+        self.sync = False  # FRAME_SYNC seen, waiting for the tag
+        self.tag = None  # tag seen, waiting for the distance
+
+    def feed(self, data: bytes) -> list:
+        """Takes the next bytes read from the port
+
+        Args:
+            data (bytes): bytes in the order they arrived
+
+        Returns:
+            list: (tag, distance) of every frame completed by these bytes
+        """
+        frames = []
+        for byte in data:
+            if byte == FRAME_SYNC:
+                self.sync, self.tag = True, None
+            elif self.tag is not None:
+                frames.append((self.tag, byte))
+                self.tag = None
+            elif self.sync and byte in (TAG_MY, TAG_MZ):
+                self.sync, self.tag = False, byte
+            else:
+                self.sync = False
+        return frames
+
+
+class SerialHandler():
+    def __init__(self, comport=None):
         """Initalizes the serial port on the computer to talk to the arduino
 
         Args:
-            comport (str): Name of the serial port (ex: COM4)
-            baudrate (int): Speed of the serial port. Default is 115200
+            comport (str, optional): Name of the serial port (ex: COM4). Defaults to
+                the first arduino that answers, which is only safe with one connected.
+                EMULATOR_PORT runs the firmware emulator instead
         """
         # Setup the internal logger
         self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.INFO)
-        console_handler  = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        console_handler.setFormatter(formatter)
-        
-        # self.logger.addHandler(console_handler)
         
         # Setup the serial port
         self.timeout_duration = 2  # seconds
         baudrate = 115200
-        comport = self.find_arduino_com_port()
-        self.ser = serial.Serial(comport, baudrate, timeout=0.1)         # 1/timeout is the frequency at which the port is read
+        if comport is None:
+            comport = self.find_arduino_com_port()
+        if comport == EMULATOR_PORT:
+            from .FirmwareEmulator import FirmwareEmulator
+            self.ser = FirmwareEmulator()
+        else:
+            self.ser = serial.Serial(comport, baudrate, timeout=0.1)         # 1/timeout is the frequency at which the port is read
+        self.bytes_read = 0  # distance bytes read so far. Capture telemetry compares it to what arrived
+        
+        # the firmware boots streaming the My sensor alone
+        self.testing_my = True
+        self.dual = False  # both sensors streaming tagged frames
+        self.parser = TaggedFrameParser()
+        self.pending_frames = deque()  # distances of the tested axis already read in dual mode
+        self.cross_frames = []  # (time.time(), distance) of the other axis' sensor in dual mode
         self.reset_buffer() # Clear the input buffer
         
     def reset_buffer(self) -> None:
         self.ser.reset_input_buffer()
+        self.parser = TaggedFrameParser()
+        self.pending_frames.clear()
+        self.cross_frames = []
         
     def find_arduino_com_port(self) -> str:
         """Searches all com ports to find arduino and returns name of port
@@ -56,14 +111,14 @@ class SerialHandler():
             for port in possible_ports:
                 buffer = bytearray()  # Buffer to store incoming bytes
                 start_time = time.time()
-                self.logger.info("Arduino found at: " + port)
+                self.logger.info("Arduino found at: %s", port)
                 test_ser = serial.Serial(port, 115200, timeout=0.5)
                 test_ser.reset_input_buffer()  # Clear the input buffer
                 test_ser.write("3\n".encode())
             
                 while True:
                     if time.time() - start_time > self.timeout_duration:
-                        print("Did not get confirmation from port: " + port)
+                        self.logger.warning("Did not get confirmation from port: %s", port)
                         break
                     
                     # Read bytes from the serial port
@@ -73,36 +128,81 @@ class SerialHandler():
                         buffer.extend(data)
                         
                         if b"AlpenFlow" in buffer:
-                            self.logger.info("Got Confirmation from port: " + port)
+                            self.logger.info("Got Confirmation from port: %s", port)
                             return port
                 
-            self.logger.warning("Didn't explicitly find Arduino. Attempting port " + possible_ports[0])
+            self.logger.warning("Didn't explicitly find Arduino. Attempting port %s", possible_ports[0])
             test_ser.close()
             return possible_ports[0]
 
     def get_arduino_data(self) -> int:
         """Get the serial data transmitted by the arduino
 
+        In dual mode only frames of the tested axis' sensor are returned. The
+        other sensor's frames are timestamped and collected in cross_frames.
+
         Returns:
             int: distance measurement broadcasted by the arduino
         """
+        if self.dual:
+            return self.get_tagged_data()
         if self.ser.in_waiting > 0:
             byte_data = self.ser.read(1)  # Read one byte
+            self.bytes_read += 1
             data = int.from_bytes(byte_data, byteorder='big')  # Convert byte to integer
             return data
         else:
             return None
             
+    def get_tagged_data(self) -> int:
+        """Reads whatever dual stream frames have arrived and returns the next one of the tested axis
+
+        Returns:
+            int: distance [mm] of the tested axis' sensor. None if no frame of it is waiting
+        """
+        if len(self.pending_frames) == 0 and self.ser.in_waiting > 0:
+            data = self.ser.read(self.ser.in_waiting)
+            self.bytes_read += len(data)
+            now = time.time()
+            tested_tag = TAG_MY if self.testing_my else TAG_MZ
+            for tag, distance in self.parser.feed(data):
+                if tag == tested_tag:
+                    self.pending_frames.append(distance)
+                else:
+                    self.cross_frames.append((now, distance))
+        if len(self.pending_frames) > 0:
+            return self.pending_frames.popleft()
+        return None
+
+    def take_cross_frames(self) -> list:
+        """Hands over the other axis' frames collected since the last call
+
+        Returns:
+            list: (time.time(), distance) of each frame
+        """
+        frames, self.cross_frames = self.cross_frames, []
+        return frames
+
+    def bytes_waiting(self) -> int:
+        """Bytes that arrived but haven't been read yet"""
+        return self.ser.in_waiting
+
     def set_my_state(self) -> None:
         """Tell the Arduino to use the Mz distance sensor
+
+        In dual mode both sensors are already streaming, so only the axis the
+        frames are returned for changes.
         """
+        self.testing_my = True
+        if self.dual:
+            return None
         start_time = time.time()
         buffer = bytearray()  # Buffer to store incoming bytes
 
         # self.ser.reset_input_buffer()
         while True:
             if time.time() - start_time > self.timeout_duration:
-                print("Did not get confirmation for switch to My testing")
+                self.logger.warning("Did not get confirmation for switch to My testing")
                 break
             
             # Read bytes from the serial port
@@ -127,14 +227,20 @@ class SerialHandler():
         
     def set_mz_state(self) -> None:
         """Set the Arduino to use the My distance sensor
+
+        In dual mode both sensors are already streaming, so only the axis the
+        frames are returned for changes.
         """
+        self.testing_my = False
+        if self.dual:
+            return None
         start_time = time.time()
         buffer = bytearray()  # Buffer to store incoming bytes
         self.ser.write("2\n".encode())
         
         while True:
             if time.time() - start_time > self.timeout_duration:
-                print("Did not get confirmation for switch to Mz testing")
+                self.logger.warning("Did not get confirmation for switch to Mz testing")
                 break
             
             # Read bytes from the serial port
@@ -155,6 +261,38 @@ class SerialHandler():
         # except:
         #     self.logger.info(f"msg from arduino: {self.ser.readline().decode()}")
         return None
+
+    def set_dual_state(self, dual: bool) -> None:
+        """Streams both distance sensors at once, or goes back to the tested axis' sensor alone
+
+        The firmware gives the sensors distinct I2C addresses at boot, so
+        switching doesn't reinitialize either of them.
+
+        Args:
+            dual (bool): True to stream both sensors as tagged frames
+        """
+        if dual == self.dual:
+            return None
+        if dual:
+            command, replies = "4\n", (b"dual", b"laud")
+        elif self.testing_my:
+            command, replies = "1\n", (b"my", b"ym")
+        else:
+            command, replies = "2\n", (b"mz", b"zm")
+        start_time = time.time()
+        buffer = bytearray()
+        self.ser.write(command.encode())
+        while time.time() - start_time < self.timeout_duration:
+            if self.ser.in_waiting > 0:
+                buffer.extend(self.ser.read(self.ser.in_waiting))
+                if any(reply in buffer for reply in replies):
+                    self.logger.info("Arduino confirmed %s", "streaming both sensors" if dual else "streaming one sensor")
+                    break
+        else:
+            self.logger.warning("Did not get confirmation for %s", "streaming both sensors" if dual else "streaming one sensor")
+        self.dual = dual
+        self.reset_buffer()
+        return None
         
 
 
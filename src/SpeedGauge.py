@@ -0,0 +1,112 @@
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtGui import QPainter, QColor
+from PyQt5.QtCore import Qt, QRectF
+import numpy as np
+
+
+SPEED_ALPHA = .2  # share of each displacement residual taken into the position estimate
+SPEED_BETA = .02  # share taken into the velocity estimate. Smaller is smoother but slower to follow
+
+
+class SpeedTracker():
+    __slots__ = ('alpha', 'beta', 'time', 'position', 'velocity')
+
+    def __init__(self, alpha=SPEED_ALPHA, beta=SPEED_BETA):
+        """Smoothed boot displacement speed from the distance frames as they arrive
+
+        An alpha-beta filter: each frame the position is predicted from the
+        current velocity and both are corrected by a share of the difference to
+        the measured displacement. The whole state is three floats, so a frame
+        costs a handful of operations, and the whole millimetre steps of the
+        TOF sensor average out into a steady velocity.
+
+        Args:
+            alpha (float, optional): position gain. Defaults to SPEED_ALPHA.
+            beta (float, optional): velocity gain. Defaults to SPEED_BETA.
+        """
+        self.alpha = alpha
+        self.beta = beta
+        self.time = None
+        self.position = 0.0
+        self.velocity = 0.0  # [mm/s]
+
+    def update(self, time: float, displacement: float) -> None:
+        """Takes the next distance frame
+
+        Args:
+            time (float): time of the frame [s]
+            displacement (float): displacement relative to the first frame [mm]
+        """
+        if self.time is None:
+            self.time = time
+            self.position = displacement
+            return
+        dt = time - self.time
+        if dt <= 0:
+            return
+        self.time = time
+        predicted = self.position + self.velocity * dt
+        residual = displacement - predicted
+        self.position = predicted + self.alpha * residual
+        self.velocity += self.beta * residual / dt
+
+    @property
+    def speed(self) -> float:
+        """Current speed [m/s]"""
+        return self.velocity / 1000
+
+
+class SpeedGauge(QWidget):
+
+    def __init__(self, band: tuple, full_scale=None, parent=None):
+        """Horizontal bar showing the release speed against its target band
+
+        The band is shaded and the needle is green inside it, yellow below and
+        red above. Only repaints when set_speed is called, so its cost is set by
+        whoever drives it (a display rate timer during capture).
+
+        Args:
+            band (tuple): low, high target speed [m/s]
+            full_scale (float, optional): speed [m/s] at the right end. Defaults to twice the band's top.
+            parent (QWidget, optional): parent widget
+        """
+        super().__init__(parent)
+        self.band = band
+        self.full_scale = full_scale if full_scale is not None else 2 * band[1]
+        self.speed = 0.0
+        self.setMinimumSize(150, 28)
+
+    def set_speed(self, speed: float) -> None:
+        if speed != self.speed:
+            self.speed = speed
+            self.update()
+
+    def color(self) -> QColor:
+        low, high = self.band
+        if self.speed < low:
+            return QColor("yellow")
+        if self.speed > high:
+            return QColor("red")
+        return QColor("green")
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        width, height = self.width(), self.height()
+        scale = width / self.full_scale
+        painter.fillRect(0, 0, width, height, QColor(60, 60, 60))
+        low, high = self.band
+        painter.fillRect(QRectF(low * scale, 0, (high - low) * scale, height), QColor(40, 110, 40))
+        needle = float(np.clip(self.speed, 0, self.full_scale)) * scale
+        painter.fillRect(QRectF(needle - 2, 0, 4, height), self.color())
+        painter.setPen(Qt.white)
+        painter.drawText(QRectF(0, 0, width, height), Qt.AlignCenter, f"{self.speed:.3f} m/s")
+        painter.end()
+
+
+if __name__ == "__main__":
+    # A 40mm/s pull measured in whole mm at 100Hz
+    rng = np.random.default_rng(0)
+    tracker = SpeedTracker()
+    for t in np.arange(0, 1, .01):
+        tracker.update(t, np.round(40 * t + rng.normal(0, .3)))
+    print(f"tracked {tracker.speed:.4f} m/s, actual 0.0400 m/s")
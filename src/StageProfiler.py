@@ -0,0 +1,222 @@
+from collections import Counter, deque
+import numpy as np
+import contextlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+
+PROFILE_ENV = "ALPENFLOW_PROFILE"  # "1" times the stages, "sample" also runs the sampling profiler
+RECENT_RUNS = 20  # runs kept for the rolling summary
+SAMPLE_INTERVAL = .001  # [s] between stack samples of the sampling profiler
+TIMING_SUFFIX = "_timing.json"
+PROFILE_SUFFIX = "_profile.txt"
+
+
+class SamplingProfiler():
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        """Counts where every thread of the process is, every interval seconds
+
+        Stacks are kept in the collapsed format flame graph tools read
+        ("thread;file:function;file:function count"), so no profiler has to be
+        installed. Only runs between start and stop.
+
+        Args:
+            interval (float, optional): seconds between samples. Defaults to SAMPLE_INTERVAL.
+        """
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self.running = threading.Event()
+        self.thread = None
+
+    def start(self) -> None:
+        if self.thread is not None:
+            return
+        self.stacks = Counter()
+        self.samples = 0
+        self.running.set()
+        self.thread = threading.Thread(target=self._sample, name="sampling profiler", daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        if self.thread is None:
+            return
+        self.running.clear()
+        self.thread.join()
+        self.thread = None
+
+    def _sample(self) -> None:
+        me = threading.get_ident()
+        while self.running.is_set():
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_code.co_name}")
+                    frame = frame.f_back
+                stack.append(names.get(ident, str(ident)))
+                self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+            time.sleep(self.interval)
+
+    def write(self, path: str, stacks=None) -> None:
+        """Writes the collapsed stacks, most sampled first
+
+        Args:
+            path (str): file to write
+            stacks (Counter, optional): stacks copied earlier. Defaults to the current ones.
+        """
+        stacks = self.stacks if stacks is None else stacks
+        with open(path, "w") as f:
+            for stack, count in stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class StageProfiler():
+
+    def __init__(self, enabled=False, sampling=False):
+        """Opt-in wall clock timing of each stage of a pull, from reading the devices to exporting
+
+        Timings are grouped into runs, one per pull. Each stage may be timed
+        several times in a run (a reprocess, several draws) and all of them are
+        kept. When disabled, stage returns a shared no-op context, so leaving
+        the instrumentation in costs next to nothing.
+
+        Args:
+            enabled (bool, optional): time the stages. Defaults to False.
+            sampling (bool, optional): also run the sampling profiler during each run. Defaults to False.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.lock = threading.Lock()  # stages are timed from the capture, processing, export and GUI threads
+        self.enabled = enabled
+        self.sampling = sampling
+        self.sampler = SamplingProfiler()
+        self.run = {}  # stage -> [seconds] of the current run
+        self.recent = deque(maxlen=RECENT_RUNS)  # stage -> total seconds, per finished run
+
+    def set_enabled(self, enabled: bool) -> None:
+        with self.lock:
+            self.enabled = enabled
+        if not enabled:
+            self.sampler.stop()
+
+    def stage(self, name: str):
+        """Context manager timing one stage of the current run"""
+        if not self.enabled:
+            return contextlib.nullcontext()
+        return self._timed(name)
+
+    @contextlib.contextmanager
+    def _timed(self, name: str):
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter_ns() - start) / 1e9)
+
+    def timed(self, function, name: str):
+        """Wraps a callable so every call is timed as a stage"""
+        def wrapper(*args, **kwargs):
+            with self.stage(name):
+                return function(*args, **kwargs)
+        return wrapper
+
+    def record(self, name: str, seconds: float) -> None:
+        with self.lock:
+            self.run.setdefault(name, []).append(seconds)
+
+    def start_run(self) -> None:
+        """Closes the current run into the rolling summary and starts the next"""
+        if not self.enabled:
+            return
+        self.sampler.stop()
+        with self.lock:
+            if len(self.run) > 0:
+                self.recent.append({name: sum(times) for name, times in self.run.items()})
+            self.run = {}
+        if self.sampling:
+            self.sampler.start()
+
+    def snapshot(self) -> dict:
+        """Copy of the current run's timings and stack samples, to report once its pull is saved
+
+        Saving is the last stage of a run, so the sampling profiler is stopped.
+
+        Returns:
+            dict: 'timings' stage -> per call stats and 'stacks' sampled stacks. None when disabled
+        """
+        if not self.enabled:
+            return None
+        self.sampler.stop()
+        with self.lock:
+            timings = {name: {'calls': len(times), 'total_ms': 1000 * sum(times), 'max_ms': 1000 * max(times)}
+                       for name, times in self.run.items()}
+        return {'timings': timings, 'stacks': Counter(self.sampler.stacks)}
+
+    def write_report(self, snapshot: dict, data_path: str) -> list:
+        """Writes a run's timings (and its stack samples) next to its saved csv
+
+        Args:
+            snapshot (dict): the run's timings as taken by snapshot. Nothing is written if None
+            data_path (str): main csv of the run
+
+        Returns:
+            list: written files
+        """
+        if snapshot is None:
+            return []
+        base = os.path.splitext(data_path)[0]
+        paths = [base + TIMING_SUFFIX]
+        with open(paths[0], "w") as f:
+            json.dump(snapshot['timings'], f, indent=2)
+        if len(snapshot['stacks']) > 0:
+            paths.append(base + PROFILE_SUFFIX)
+            self.sampler.write(paths[1], snapshot['stacks'])
+        return paths
+
+    def summary(self) -> dict:
+        """Latency budget over the recent runs, current one included
+
+        Returns:
+            dict: stage -> {'runs', 'last_ms', 'median_ms', 'p95_ms'} of the
+                per run total time of the stage
+        """
+        with self.lock:
+            runs = list(self.recent)
+            if len(self.run) > 0:
+                runs.append({name: sum(times) for name, times in self.run.items()})
+        summary = {}
+        for name in dict.fromkeys(name for run in runs for name in run):
+            totals = np.array([run[name] for run in runs if name in run]) * 1000
+            summary[name] = {'runs': len(totals), 'last_ms': float(totals[-1]),
+                             'median_ms': float(np.median(totals)), 'p95_ms': float(np.percentile(totals, 95))}
+        return summary
+
+
+def profiler_from_env() -> StageProfiler:
+    """StageProfiler enabled as PROFILE_ENV asks. Each bench gets its own, so their runs don't mix"""
+    setting = os.environ.get(PROFILE_ENV, "")
+    return StageProfiler(enabled=setting in ("1", "sample"), sampling=setting == "sample")
+
+
+PROFILER = profiler_from_env()  # for captures processed outside a bench's window
+
+
+if __name__ == "__main__":
+    # Cost of an instrumented stage when profiling is off and on
+    profiler = StageProfiler()
+    for label, enabled in (("disabled", False), ("enabled", True)):
+        profiler.set_enabled(enabled)
+        start = time.perf_counter()
+        for _ in range(100000):
+            with profiler.stage("noop"):
+                pass
+        print(f"{label}: {(time.perf_counter() - start) / 100000 * 1e6:.2f}us per stage")
+    print(profiler.summary())
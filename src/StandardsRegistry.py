@@ -0,0 +1,160 @@
+import numpy as np
+import logging
+import threading
+from .ISO_11088 import ISO11088
+from .ISO_13992 import ISO13992
+
+
+class StandardFit():
+    __slots__ = ('name', 'My_params', 'Mz_params', 'My_cov', 'Mz_cov')
+
+    def __init__(self, name: str, My_params, Mz_params, My_cov=None, Mz_cov=None):
+        """Immutable z of boot torque/BSL fit of one standard
+
+        Holds only the fitted coefficients, so it can be shared by every thread
+        without locking. Both standards fit z = a + b*M/BSL + c*(M/BSL)**2.
+
+        Args:
+            name (str): name of the standard in the registry
+            My_params (tuple): a, b, c of z as a function of My/BSL
+            Mz_params (tuple): a, b, c of z as a function of Mz/BSL
+            My_cov (np.array, optional): 3x3 covariance of My_params. None if unknown
+            Mz_cov (np.array, optional): 3x3 covariance of Mz_params. None if unknown
+        """
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'My_params', tuple(float(p) for p in My_params))
+        object.__setattr__(self, 'Mz_params', tuple(float(p) for p in Mz_params))
+        object.__setattr__(self, 'My_cov', self._frozen(My_cov))
+        object.__setattr__(self, 'Mz_cov', self._frozen(Mz_cov))
+
+    @staticmethod
+    def _frozen(array):
+        if array is None:
+            return None
+        array = np.array(array, dtype=float)
+        array.flags.writeable = False
+        return array
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def z_of_My_div_BSL(self, My_div_BSL):
+        a, b, c = self.My_params
+        return a + b*My_div_BSL + c*My_div_BSL**2
+
+    def z_of_Mz_div_BSL(self, Mz_div_BSL):
+        a, b, c = self.Mz_params
+        return a + b*Mz_div_BSL + c*Mz_div_BSL**2
+
+    def z_of_torque_div_BSL(self, torque_div_BSL, testing_My: bool):
+        """z of a boot torque/BSL [N] (float or np.array) on the given axis"""
+        if testing_My:
+            return self.z_of_My_div_BSL(torque_div_BSL)
+        return self.z_of_Mz_div_BSL(torque_div_BSL)
+
+    def params_and_cov(self, testing_My: bool) -> tuple:
+        """Coefficients of the axis and their covariance (None if unknown)"""
+        if testing_My:
+            return np.array(self.My_params), self.My_cov
+        return np.array(self.Mz_params), self.Mz_cov
+
+    def __repr__(self) -> str:
+        return f"StandardFit({self.name!r}, My={self.My_params}, Mz={self.Mz_params})"
+
+
+class StandardsRegistry():
+
+    def __init__(self):
+        """Process wide set of standards, each loaded and fitted once
+
+        Standards are registered by name with a loader and only built the first
+        time they are asked for, so adding a table doesn't rebuild the others.
+        Lookups are safe from any thread.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.lock = threading.RLock()  # reentrant: a loader may use other standards
+        self.loaders = {}
+        self.models = {}
+        self.fits = {}
+
+    def register(self, name: str, loader) -> None:
+        """Adds a standard
+
+        Args:
+            name (str): key the standard is looked up by
+            loader (callable): f(registry) -> object with z_of_My_div_BSL_fit_params
+                and z_of_Mz_div_BSL_fit_params (like ISO11088 and ISO13992)
+        """
+        with self.lock:
+            self.loaders[name] = loader
+            self.models.pop(name, None)
+            self.fits.pop(name, None)
+
+    def names(self) -> list:
+        return list(self.loaders)
+
+    def model(self, name: str):
+        """Full standard object, for its tables and plots. Treat it as read only
+
+        Args:
+            name (str): registered name
+
+        Returns:
+            object: what the standard's loader built
+        """
+        model = self.models.get(name)
+        if model is not None:
+            return model
+        with self.lock:
+            if name not in self.models:
+                if name not in self.loaders:
+                    raise KeyError(f"Unknown standard {name}. Registered: {self.names()}")
+                self.models[name] = self.loaders[name](self)
+                self.logger.debug("Loaded standard %s", name)
+            return self.models[name]
+
+    def get(self, name: str) -> StandardFit:
+        """Frozen fit of a standard, loading it if needed
+
+        Args:
+            name (str): registered name
+
+        Returns:
+            StandardFit: z of boot torque/BSL coefficients
+        """
+        fit = self.fits.get(name)
+        if fit is not None:
+            return fit
+        model = self.model(name)
+        with self.lock:
+            if name not in self.fits:
+                fit_results = getattr(model, 'fits', {})
+                My_cov = fit_results['z_of_My_div_BSL'].cov if 'z_of_My_div_BSL' in fit_results else None
+                Mz_cov = fit_results['z_of_Mz_div_BSL'].cov if 'z_of_Mz_div_BSL' in fit_results else None
+                self.fits[name] = StandardFit(name, model.z_of_My_div_BSL_fit_params, model.z_of_Mz_div_BSL_fit_params, My_cov, Mz_cov)
+            return self.fits[name]
+
+
+STANDARDS = StandardsRegistry()
+STANDARDS.register("iso11088", lambda registry: ISO11088())
+STANDARDS.register("iso13992", lambda registry: ISO13992(iso11088=registry.model("iso11088")))
+
+
+def z_of_peak(axis: str, peak_torque_div_BSL) -> tuple:
+    """z of a peak boot torque/BSL under ISO 13992 and ISO 11088
+
+    Args:
+        axis (str): "My" or "Mz"
+        peak_torque_div_BSL (float): peak boot torque/BSL [N]
+
+    Returns:
+        tuple: z per ISO 13992, z per ISO 11088
+    """
+    testing_My = axis == "My"
+    return (STANDARDS.get("iso13992").z_of_torque_div_BSL(peak_torque_div_BSL, testing_My),
+            STANDARDS.get("iso11088").z_of_torque_div_BSL(peak_torque_div_BSL, testing_My))
+
+
+if __name__ == "__main__":
+    for name in STANDARDS.names():
+        print(STANDARDS.get(name))
@@ -0,0 +1,75 @@
+from src.FirmwareEmulator import FirmwareEmulator
+from src.SerialHandler import SerialHandler, TaggedFrameParser, EMULATOR_PORT, FRAME_SYNC, TAG_MY, TAG_MZ
+
+
+class FakeClock():
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def emulated_handler(clock: FakeClock) -> SerialHandler:
+    """SerialHandler talking to an emulator whose My sensor reads 40mm and Mz 70mm"""
+    handler = SerialHandler(EMULATOR_PORT)
+    handler.ser = FirmwareEmulator(distance_my=lambda t: 40, distance_mz=lambda t: 70, clock=clock)
+    handler.reset_buffer()
+    return handler
+
+
+def read_frames(handler: SerialHandler) -> list:
+    frames = []
+    while True:
+        distance = handler.get_arduino_data()
+        if distance is None:
+            return frames
+        frames.append(distance)
+
+
+def test_parser_skips_text_and_resyncs():
+    parser = TaggedFrameParser()
+    assert parser.feed(b"dual\r\n" + bytes((FRAME_SYNC, TAG_MY))) == []
+    assert parser.feed(bytes((42, FRAME_SYNC))) == [(TAG_MY, 42)]  # frame split across reads
+    assert parser.feed(bytes((TAG_MZ, 43))) == [(TAG_MZ, 43)]
+    assert parser.feed(bytes((7, TAG_MY, 9))) == []  # no sync, no frame
+    assert parser.feed(bytes((FRAME_SYNC, 5, TAG_MY, 9))) == []  # bad tag drops the sync
+    assert parser.feed(bytes((FRAME_SYNC, TAG_MZ, FRAME_SYNC, TAG_MY, 11))) == [(TAG_MY, 11)]  # interrupted frame
+
+
+def test_single_sensor_stream():
+    clock = FakeClock()
+    handler = emulated_handler(clock)
+    clock.now += .1
+    frames = read_frames(handler)
+    assert len(frames) == 10 and frames[-1] == 40
+    assert handler.take_cross_frames() == []
+
+
+def test_dual_stream_and_axis_switches():
+    clock = FakeClock()
+    handler = emulated_handler(clock)
+    handler.set_dual_state(True)
+    assert handler.dual and handler.ser.dual
+
+    clock.now += .1
+    frames = read_frames(handler)
+    cross = [distance for _, distance in handler.take_cross_frames()]
+    assert len(frames) == len(cross) == 10
+    assert frames[-1] == 40 and cross[-1] == 70
+
+    # both sensors keep streaming. Only which one drives the pull changes
+    handler.set_mz_state()
+    clock.now += .1
+    frames = read_frames(handler)
+    cross = [distance for _, distance in handler.take_cross_frames()]
+    assert len(frames) == len(cross) == 10
+    assert set(frames) == {70} and set(cross) == {40}
+
+    # back to one sensor, the one of the tested axis
+    handler.set_dual_state(False)
+    assert not handler.ser.dual and not handler.ser.testing_my
+    clock.now += .1
+    frames = read_frames(handler)
+    assert len(frames) == 10 and set(frames) == {70}
+    assert handler.take_cross_frames() == []
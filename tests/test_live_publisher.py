@@ -0,0 +1,127 @@
+import numpy as np
+import socket
+import threading
+import time
+import pytest
+from src.LivePublisher import (LivePublisher, read_messages, connect, HEADER, MAGIC, PENDING_SAMPLES,
+                               CAPTURE_START, SAMPLES, METRICS, CAPTURE_END, TORQUE)
+from src.CaptureJournal import FRAME, BRIDGE
+
+
+def wait_for_clients(publisher: LivePublisher, count: int, timeout=2) -> None:
+    deadline = time.monotonic() + timeout
+    while len(publisher.clients) < count:
+        assert time.monotonic() < deadline, "client never connected"
+        time.sleep(.005)
+
+
+def read_until_end(sock: socket.socket) -> list:
+    """(type, sequence, payload) of every message up to and including CAPTURE_END"""
+    sock.settimeout(5)
+    messages = []
+    for message in read_messages(sock):
+        messages.append(message)
+        if message[0] == CAPTURE_END:
+            break
+    return messages
+
+
+@pytest.fixture
+def publisher():
+    publisher = LivePublisher("tcp:127.0.0.1:0", client_queue=8)
+    yield publisher
+    publisher.close()
+
+
+def address_of(publisher: LivePublisher) -> str:
+    return f"tcp:{publisher.address[0]}:{publisher.address[1]}"
+
+
+def test_messages_are_framed_in_order(publisher):
+    sock = connect(address_of(publisher))
+    wait_for_clients(publisher, 1)
+    publisher.start_capture({'bsl': 300, 'testing_My': True})
+    publisher.add(FRAME, .01, 3)
+    publisher.add(TORQUE, .01, 120.5)
+    publisher.update_metrics(peak=120.5)
+    time.sleep(.1)
+    publisher.end_capture({'peak_torque_div_bsl': 120.5})
+    messages = read_until_end(sock)
+    sock.close()
+
+    types = [message_type for message_type, _, _ in messages]
+    assert types[0] == CAPTURE_START and types[-1] == CAPTURE_END
+    assert SAMPLES in types and METRICS in types
+    sequences = [sequence for _, sequence, _ in messages]
+    assert sequences == list(range(1, len(messages) + 1))
+
+    payloads = dict((message_type, payload) for message_type, _, payload in messages)
+    assert payloads[CAPTURE_START] == {'bsl': 300, 'testing_My': True}
+    assert payloads[METRICS] == {'peak': 120.5}
+    assert payloads[CAPTURE_END] == {'peak_torque_div_bsl': 120.5}
+    samples = payloads[SAMPLES]
+    assert samples['kind'].tolist() == [FRAME, TORQUE]
+    assert np.allclose(samples['value'], [3, 120.5])
+
+
+def test_header_layout(publisher):
+    sock = connect(address_of(publisher))
+    wait_for_clients(publisher, 1)
+    publisher.start_capture({'bsl': 300})
+    sock.settimeout(5)
+    header = b""
+    while len(header) < HEADER.size:
+        header += sock.recv(HEADER.size - len(header))
+    sock.close()
+    magic, message_type, length, sequence = HEADER.unpack(header)
+    assert (magic, message_type, length, sequence) == (MAGIC, CAPTURE_START, len(b'{"bsl": 300}'), 1)
+
+
+def test_stalled_client_loses_its_oldest_messages(publisher):
+    fast = connect(address_of(publisher))
+    stalled = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    stalled.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    stalled.connect(publisher.address)
+    wait_for_clients(publisher, 2)
+    fast_messages = []
+    reader = threading.Thread(target=lambda: fast_messages.extend(read_until_end(fast)))
+    reader.start()
+
+    publisher.start_capture({'bsl': 300})
+    for i in range(60):  # 60 flushes of 2000 samples, far more than the stalled socket buffers
+        for _ in range(2000):
+            publisher.add(BRIDGE, i * .01, 2.8555e-5)
+        time.sleep(.025)
+    publisher.end_capture({'peak_torque_div_bsl': 0.0})
+    reader.join()
+    time.sleep(.1)
+    dropped = sorted(client.dropped for client in publisher.clients.values())
+
+    stalled_messages = read_until_end(stalled)  # drains once it reads again
+    fast.close()
+    stalled.close()
+
+    assert dropped[0] == 0 and dropped[1] > 0
+    fast_sequences = [sequence for _, sequence, _ in fast_messages]
+    assert fast_sequences == list(range(1, len(fast_messages) + 1))
+    stalled_sequences = [sequence for _, sequence, _ in stalled_messages]
+    assert np.all(np.diff(stalled_sequences) > 0)
+    assert np.any(np.diff(stalled_sequences) > 1)  # the gap of the dropped messages
+    assert stalled_sequences[-1] == fast_sequences[-1]  # the newest messages were kept
+
+
+def test_add_never_blocks(publisher):
+    stalled = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    stalled.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    stalled.connect(publisher.address)
+    wait_for_clients(publisher, 1)
+    publisher.start_capture({'bsl': 300})
+
+    slowest = 0
+    for i in range(4 * PENDING_SAMPLES):
+        start = time.perf_counter()
+        publisher.add(BRIDGE, i * 1e-4, 2.8555e-5)
+        slowest = max(slowest, time.perf_counter() - start)
+    stalled.close()
+    assert len(publisher.samples) <= PENDING_SAMPLES
+    assert slowest < .05  # only a thread switch, never a wait on a client